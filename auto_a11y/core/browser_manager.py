@@ -45,7 +45,7 @@ class BrowserManager:
     - Script injection scenarios
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], install_touchpoints: bool = False):
         """
         Initialize browser manager
 
@@ -58,8 +58,11 @@ class BrowserManager:
                 - user_agent: User agent string
                 - stealth_mode: Apply anti-detection measures (default: False)
                 - max_concurrent_pages: Max concurrent pages (default: 5)
+            install_touchpoints: Install the touchpoint engine bundle on every
+                context (testing browsers only; discovery crawls do not run it)
         """
         self.config = config
+        self.install_touchpoints = install_touchpoints
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._default_context: Optional[BrowserContext] = None
@@ -173,7 +176,7 @@ class BrowserManager:
 
     async def create_context(
         self,
-        storage_state: Optional[str] = None,
+        storage_state: Optional[Union[str, Dict[str, Any]]] = None,
         viewport: Optional[Dict[str, int]] = None,
         user_agent: Optional[str] = None
     ) -> BrowserContext:
@@ -189,7 +192,8 @@ class BrowserManager:
         for multi-state and multi-user testing.
 
         Args:
-            storage_state: Path to saved storage state (for auth persistence)
+            storage_state: Path to saved storage state (for auth persistence),
+                or a storage state dictionary to clone
             viewport: Custom viewport {width, height}
             user_agent: Custom user agent string
 
@@ -208,8 +212,11 @@ class BrowserManager:
                 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
 
-        # Load saved authentication state if provided
-        if storage_state and Path(storage_state).exists():
+        # Load saved authentication state if provided (a storage_state() dict
+        # is cloned directly, a string is a path to a saved state file)
+        if isinstance(storage_state, dict):
+            context_options['storage_state'] = storage_state
+        elif storage_state and Path(storage_state).exists():
             context_options['storage_state'] = storage_state
             logger.debug(f"Loading storage state from: {storage_state}")
 
@@ -224,6 +231,11 @@ class BrowserManager:
         if self.config.get('stealth_mode', False):
             await self._apply_stealth(context)
 
+        # Install the touchpoint engines once per testing context
+        if self.install_touchpoints:
+            from auto_a11y.testing.touchpoint_bundle import install_bundle
+            await install_bundle(context)
+
         self._contexts.append(context)
         logger.debug(f"Created browser context (total: {len(self._contexts)})")
         return context
@@ -333,6 +345,8 @@ class BrowserManager:
                 yield page
 
             finally:
+                if page:
+                    self._forget_page_state(page)
                 if page and not page.is_closed():
                     try:
                         await page.close()
@@ -371,6 +385,7 @@ class BrowserManager:
         Args:
             page: Page instance to close
         """
+        self._forget_page_state(page)
         try:
             if not page.is_closed():
                 await page.close()
@@ -379,6 +394,16 @@ class BrowserManager:
         except Exception as e:
             logger.warning(f"Error closing page: {e}")
 
+    @staticmethod
+    def _forget_page_state(page: Page) -> None:
+        """Drop CSS focus rules, event listeners and the accessibility tree cached for a page (all keyed by id(page))"""
+        from auto_a11y.testing.ax_snapshot import clear_ax_snapshot
+        from auto_a11y.testing.css_focus_capture import clear_css_capture_for_page
+        from auto_a11y.testing.event_listener_inventory import clear_listener_inventory
+        clear_css_capture_for_page(page)
+        clear_listener_inventory(page)
+        clear_ax_snapshot(page)
+
     async def goto(
         self,
         page: Page,
@@ -2,8 +2,9 @@
 Database connection and repository management
 """
 
-from typing import List, Optional, Dict, Any
-from pymongo import MongoClient
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 from pymongo.database import Database as MongoDatabase
 from pymongo.collection import Collection
 from bson import ObjectId
@@ -12,7 +13,7 @@ import logging
 import re
 
 from auto_a11y.models import (
-    Project, Website, Page, TestResult,
+    Project, Website, Page, PageRef, TestResult,
     ProjectStatus, ProjectType, PageStatus,
     Recording, RecordingIssue, RecordingType,
     DocumentReference, DiscoveryRun,
@@ -25,6 +26,9 @@ from auto_a11y.models import (
 
 logger = logging.getLogger(__name__)
 
+# Documents fetched per round trip when streaming pages
+PAGE_BATCH_SIZE = 500
+
 
 class Database:
     """MongoDB database connection and operations"""
@@ -62,6 +66,10 @@ class Database:
         self.test_schedules: Collection = self.db.test_schedules  # Scheduled test configurations
         self.share_tokens: Collection = self.db.share_tokens  # Public share tokens
         self.groups: Collection = self.db['groups']  # Permission groups
+        self.report_artifacts: Collection = self.db.report_artifacts  # Cached generated report files
+        self.drupal_sync_state: Collection = self.db.drupal_sync_state  # Delta sync high-water marks for Drupal imports
+        self.drupal_term_cache: Collection = self.db.drupal_term_cache  # Drupal taxonomy terms and WCAG chapters shared by workers
+        self.document_language_cache: Collection = self.db.document_language_cache  # Detected languages of linked documents by URL
 
         # Create indexes
         self._create_indexes()
@@ -69,143 +77,9 @@ class Database:
         logger.info(f"Connected to MongoDB database: {database_name}")
     
     def _create_indexes(self):
-        """Create database indexes for performance"""
-        # Projects
-        self.projects.create_index("name")
-        self.projects.create_index("status")
-        self.projects.create_index("project_type")
-        self.projects.create_index([("project_type", 1), ("status", 1)])
-        self.projects.create_index([("members.user_id", 1)])
-
-        # Websites
-        self.websites.create_index("project_id")
-        self.websites.create_index([("members.user_id", 1)])
-        self.websites.create_index("url")
-        
-        # Pages
-        self.pages.create_index("website_id")
-        self.pages.create_index("url")
-        self.pages.create_index("status")
-        self.pages.create_index([("website_id", 1), ("url", 1)], unique=True)
-        
-        # Test results
-        self.test_results.create_index("page_id")
-        self.test_results.create_index("test_date")
-        # Multi-state testing indexes
-        self.test_results.create_index("session_id")
-        self.test_results.create_index([("page_id", 1), ("session_id", 1), ("state_sequence", 1)])
-        self.test_results.create_index([("session_id", 1), ("state_sequence", 1)])
-
-        # Test result items (NEW: detailed violations/warnings)
-        self.test_result_items.create_index("test_result_id")
-        self.test_result_items.create_index([("page_id", 1), ("test_date", -1)])
-        self.test_result_items.create_index([("item_type", 1), ("test_result_id", 1)])
-        self.test_result_items.create_index([("issue_id", 1), ("test_result_id", 1)])
-        self.test_result_items.create_index([("touchpoint", 1), ("test_result_id", 1)])
-        # Compound index for common queries
-        self.test_result_items.create_index([
-            ("test_result_id", 1),
-            ("item_type", 1),
-            ("issue_id", 1)
-        ])
-
-        # Document references
-        self.document_references.create_index("website_id")
-        self.document_references.create_index("document_url")
-        self.document_references.create_index([("website_id", 1), ("document_url", 1)])
-        
-        # Discovery runs
-        self.discovery_runs.create_index("website_id")
-        self.discovery_runs.create_index("started_at")
-        self.discovery_runs.create_index("is_latest")
-
-        # Issue documentation status
-        self.issue_documentation_status.create_index("issue_code", unique=True)
-        self.discovery_runs.create_index([("website_id", 1), ("is_latest", 1)])
-
-        # Update pages index for discovery run
-        self.pages.create_index("discovery_run_id")
-        self.pages.create_index("is_in_latest_discovery")
-
-        # Page setup scripts
-        self.page_setup_scripts.create_index("page_id")
-        self.page_setup_scripts.create_index("website_id")  # NEW: For website-level scripts
-        self.page_setup_scripts.create_index([("website_id", 1), ("scope", 1), ("enabled", 1)])
-        self.page_setup_scripts.create_index([("page_id", 1), ("enabled", 1)])
-        self.page_setup_scripts.create_index("created_date")
-
-        # Script execution sessions
-        self.script_execution_sessions.create_index("session_id", unique=True)
-        self.script_execution_sessions.create_index("website_id")
-        self.script_execution_sessions.create_index([("website_id", 1), ("started_at", -1)])
-
-        # Test state matrices
-        self.test_state_matrices.create_index("page_id", unique=True)
-        self.test_state_matrices.create_index("website_id")
-        self.test_state_matrices.create_index([("website_id", 1), ("created_date", -1)])
-
-        # Website users (test users for authenticated testing)
-        self.website_users.create_index("website_id")
-        self.website_users.create_index([("website_id", 1), ("username", 1)], unique=True)
-        self.website_users.create_index([("website_id", 1), ("enabled", 1)])
-        self.website_users.create_index("roles")
-
-        # Project users (test users at project level)
-        self.project_users.create_index("project_id")
-        self.project_users.create_index([("project_id", 1), ("username", 1)], unique=True)
-        self.project_users.create_index([("project_id", 1), ("enabled", 1)])
-        self.project_users.create_index("roles")
-
-        # Recordings (manual audit recordings)
-        self.recordings.create_index("recording_id", unique=True)
-        self.recordings.create_index("project_id")
-        self.recordings.create_index("recorded_date")
-        self.recordings.create_index("recording_type")
-        self.recordings.create_index("component_names")  # For component-specific queries
-        self.recordings.create_index([("project_id", 1), ("recorded_date", -1)])
-        self.recordings.create_index("drupal_video_uuid")  # For Drupal sync
-        self.recordings.create_index("drupal_sync_status")
-
-        # Discovered pages (for Drupal export)
-        self.discovered_pages.create_index("project_id")
-        self.discovered_pages.create_index("url")
-        self.discovered_pages.create_index([("project_id", 1), ("url", 1)], unique=True)
-        self.discovered_pages.create_index("source_type")
-        self.discovered_pages.create_index("drupal_uuid")  # For Drupal sync
-        self.discovered_pages.create_index("drupal_sync_status")
-
-        # Recording issues
-        self.recording_issues.create_index("recording_id")
-        self.recording_issues.create_index("project_id")
-        self.recording_issues.create_index("impact")
-        self.recording_issues.create_index("status")
-        self.recording_issues.create_index("component_names")  # For component-specific queries
-        self.recording_issues.create_index([("recording_id", 1), ("impact", 1)])
-        self.recording_issues.create_index([("project_id", 1), ("status", 1)])
-
-        # Drupal issues (track issue uploads by unique_id)
-        self.drupal_issues.create_index("unique_id")
-        self.drupal_issues.create_index("violation_id")  # Keep for reference
-        self.drupal_issues.create_index("project_id")
-        self.drupal_issues.create_index([("unique_id", 1), ("project_id", 1)], unique=True)
-        self.drupal_issues.create_index("drupal_uuid")
-        self.drupal_issues.create_index("discovered_page_id")
-
-        # App users (application authentication)
-        self.app_users.create_index("email", unique=True)
-        self.app_users.create_index("role")
-        self.app_users.create_index("is_active")
-
-        # Test schedules (scheduled testing configuration)
-        self.test_schedules.create_index("website_id")
-        self.test_schedules.create_index("enabled")
-        self.test_schedules.create_index([("website_id", 1), ("enabled", 1)])
-        self.test_schedules.create_index("next_run_at")
-        self.test_schedules.create_index("apscheduler_job_id", unique=True, sparse=True)
-
-        # Share tokens (public share links)
-        self.share_tokens.create_index("token_hash", unique=True)
-        self.share_tokens.create_index([("scope", 1), ("scope_id", 1)])
+        """Bring indexes up to date by applying pending index migrations"""
+        from auto_a11y.core.index_migrations import apply_index_migrations
+        apply_index_migrations(self)
 
     def test_connection(self) -> bool:
         """Test database connection"""
@@ -217,9 +91,15 @@ class Database:
             logger.error(f"Database connection test failed: {e}")
             return False
     
-    def create_indexes(self):
-        """Public method to create indexes"""
-        self._create_indexes()
+    def create_indexes(self, force: bool = False):
+        """
+        Public method to create indexes
+
+        Args:
+            force: Re-apply every index migration, not only pending ones
+        """
+        from auto_a11y.core.index_migrations import apply_index_migrations
+        apply_index_migrations(self, force=force)
     
     def close(self):
         """Close database connection"""
@@ -356,9 +236,9 @@ class Database:
             return False
         
         # Delete related pages and test results
-        pages = self.get_pages(website_id)
-        for page in pages:
-            self.delete_page(page.id)
+        page_ids = [ref.id for ref in self.iter_page_refs(website_id, latest_only=False)]
+        for page_id in page_ids:
+            self.delete_page(page_id)
         
         # Remove from project's website list
         self.projects.update_one(
@@ -413,29 +293,171 @@ class Database:
         self,
         website_id: str,
         status: Optional[PageStatus] = None,
-        limit: int = 1000,
+        limit: Optional[int] = None,
         skip: int = 0,
         latest_only: bool = True
     ) -> List[Page]:
-        """Get pages for a website"""
+        """
+        Get pages for a website
+
+        Loads every matching page unless a limit is given; use iter_pages or
+        iter_page_refs to walk large websites in bounded memory.
+        """
+        query = self._page_query(website_id, status, latest_only)
+        docs = self.pages.find(query).sort("_id", 1).skip(skip)
+        if limit:
+            docs = docs.limit(limit)
+        return [Page.from_dict(doc) for doc in docs]
+
+    def iter_pages(
+        self,
+        website_id: str,
+        status: Optional[PageStatus] = None,
+        latest_only: bool = True,
+        batch_size: int = PAGE_BATCH_SIZE
+    ) -> Iterator[Page]:
+        """
+        Stream pages for a website in _id order
+
+        Args:
+            website_id: Website ID
+            status: Only pages with this status
+            latest_only: Only pages from the latest discovery
+            batch_size: Documents fetched per query
+
+        Yields:
+            Page objects
+        """
+        query = self._page_query(website_id, status, latest_only)
+        for doc in self._iter_page_docs(query, None, batch_size):
+            yield Page.from_dict(doc)
+
+    def iter_page_refs(
+        self,
+        website_id: str,
+        status: Optional[PageStatus] = None,
+        latest_only: bool = True,
+        batch_size: int = PAGE_BATCH_SIZE
+    ) -> Iterator[PageRef]:
+        """
+        Stream lightweight page references (id, url, status, counts) for a website
+
+        Args:
+            website_id: Website ID
+            status: Only pages with this status
+            latest_only: Only pages from the latest discovery
+            batch_size: Documents fetched per query
+
+        Yields:
+            PageRef objects
+        """
+        query = self._page_query(website_id, status, latest_only)
+        for doc in self._iter_page_docs(query, PageRef.PROJECTION, batch_size):
+            yield PageRef.from_dict(doc)
+
+    def get_page_refs(self, page_ids: List[str], batch_size: int = PAGE_BATCH_SIZE) -> List[PageRef]:
+        """
+        Get lightweight page references by ID, in the order given
+
+        Args:
+            page_ids: Page IDs; unknown IDs are dropped
+            batch_size: IDs looked up per query
+
+        Returns:
+            List of PageRef objects
+        """
+        refs = {}
+        for start in range(0, len(page_ids), batch_size):
+            chunk = [ObjectId(page_id) for page_id in page_ids[start:start + batch_size]]
+            for doc in self.pages.find({"_id": {"$in": chunk}}, PageRef.PROJECTION):
+                refs[str(doc["_id"])] = PageRef.from_dict(doc)
+        return [refs[page_id] for page_id in page_ids if page_id in refs]
+
+    def count_pages(
+        self,
+        website_id: str,
+        status: Optional[PageStatus] = None,
+        latest_only: bool = True
+    ) -> int:
+        """Count pages for a website without loading them"""
+        return self.pages.count_documents(self._page_query(website_id, status, latest_only))
+
+    def _page_query(
+        self,
+        website_id: str,
+        status: Optional[PageStatus] = None,
+        latest_only: bool = True
+    ) -> Dict[str, Any]:
+        """Build the pages query shared by the page listing methods"""
         query = {"website_id": website_id}
         if status:
             query["status"] = status.value
-        
+
         # By default, only return pages from latest discovery for testing
         if latest_only:
             query["is_in_latest_discovery"] = True
-        
-        docs = self.pages.find(query).limit(limit).skip(skip)
-        return [Page.from_dict(doc) for doc in docs]
-    
+        return query
+
+    def _iter_page_docs(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, int]],
+        batch_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Keyset-paginate page documents on _id
+
+        Each batch is a separate query starting after the last _id seen, so
+        no cursor is held open between batches and pages inserted or updated
+        meanwhile are neither skipped nor repeated.
+        """
+        last_id = None
+        while True:
+            batch_query = dict(query)
+            if last_id is not None:
+                batch_query["_id"] = {"$gt": last_id}
+            docs = list(self.pages.find(batch_query, projection).sort("_id", 1).limit(batch_size))
+            if not docs:
+                return
+            yield from docs
+            if len(docs) < batch_size:
+                return
+            last_id = docs[-1]["_id"]
+
     def update_page(self, page: Page) -> bool:
-        """Update existing page"""
-        result = self.pages.replace_one(
+        """
+        Update existing page
+
+        The latest test result pointer is left out: it is only moved by
+        create_test_result, and a page loaded before a test would otherwise
+        put the previous result's pointer back.
+        """
+        data = page.to_dict()
+        data.pop('_id', None)
+        data.pop('latest_test_result_id', None)
+        result = self.pages.update_one(
             {"_id": page._id},
-            page.to_dict()
+            {"$set": data}
         )
         return result.modified_count > 0
+
+    def _point_to_test_result(self, page_id: str, test_result_id: Any, test_date: Optional[datetime]) -> None:
+        """
+        Point a page at a test result unless it already points at a newer one
+
+        One conditional update, so results saved out of order (the states of
+        a multi-state run, overlapping re-tests) cannot move the pointer back.
+        """
+        query = {"_id": ObjectId(page_id)}
+        if test_date:
+            query["$or"] = [
+                {"latest_test_result_date": None},
+                {"latest_test_result_date": {"$lte": test_date}}
+            ]
+        self.pages.update_one(query, {"$set": {
+            "latest_test_result_id": str(test_result_id),
+            "latest_test_result_date": test_date
+        }})
     
     def delete_page(self, page_id: str) -> bool:
         """Delete page and related test results"""
@@ -705,6 +727,7 @@ class Database:
             page.pass_count = test_result.pass_count
             page.test_duration_ms = test_result.duration_ms
             self.update_page(page)
+            self._point_to_test_result(test_result.page_id, test_result._id, test_result.test_date)
 
         logger.info(f"Created test result for page: {test_result.page_id}")
         return test_result.id
@@ -727,6 +750,73 @@ class Database:
         items = list(self.test_result_items.find(query))
         return items
 
+    def iter_latest_result_items(
+        self,
+        website_id: str,
+        item_query: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, int]] = None,
+        batch_size: int = PAGE_BATCH_SIZE
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream the items of every page's latest test result for a website
+
+        Pages are read in keyset batches; each batch keeps only a small map of
+        result ID to page URL and streams its items from one cursor, so memory
+        stays bounded by the batch size however many items the website has.
+        Results stored before the split items schema have no items and are
+        not included.
+
+        Args:
+            website_id: Website ID
+            item_query: Extra test_result_items filter (item type, impact, ...)
+            projection: test_result_items projection; test_result_id is always included
+            batch_size: Pages per batch
+
+        Yields:
+            (page URL, item document) tuples
+        """
+        if projection is not None:
+            projection = {**projection, 'test_result_id': 1}
+
+        page_query = self._page_query(website_id, latest_only=True)
+        page_projection = {'url': 1, 'status': 1, 'latest_test_result_id': 1}
+        batch = []
+        for page_doc in self._iter_page_docs(page_query, page_projection, batch_size):
+            batch.append(page_doc)
+            if len(batch) == batch_size:
+                yield from self._latest_items_for_pages(batch, item_query, projection)
+                batch = []
+        if batch:
+            yield from self._latest_items_for_pages(batch, item_query, projection)
+
+    def _latest_items_for_pages(
+        self,
+        page_docs: List[Dict[str, Any]],
+        item_query: Optional[Dict[str, Any]],
+        projection: Optional[Dict[str, int]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream the latest result items of one batch of page documents"""
+        urls_by_result = {}
+        for page_doc in page_docs:
+            pointer = page_doc.get('latest_test_result_id')
+            if pointer and ObjectId.is_valid(pointer):
+                urls_by_result[ObjectId(pointer)] = page_doc['url']
+            elif page_doc.get('status') == PageStatus.TESTED.value:
+                # Tested before the latest result pointer existed
+                latest = self.test_results.find_one(
+                    {'page_id': str(page_doc['_id'])}, {'_id': 1}, sort=[('test_date', -1)]
+                )
+                if latest:
+                    urls_by_result[latest['_id']] = page_doc['url']
+
+        if not urls_by_result:
+            return
+
+        query = dict(item_query or {})
+        query['test_result_id'] = {'$in': list(urls_by_result)}
+        for item in self.test_result_items.find(query, projection):
+            yield urls_by_result.get(item['test_result_id'], ''), item
+
     def get_test_result(self, result_id: str) -> Optional[TestResult]:
         """
         Get test result by ID
@@ -736,73 +826,74 @@ class Database:
         doc = self.test_results.find_one({"_id": ObjectId(result_id)})
         if not doc:
             return None
+        return self._test_result_from_doc(doc)
+    
+    def get_latest_test_result(self, page_id: str) -> Optional[TestResult]:
+        """
+        Get most recent test result for a page
 
-        # Check if this uses the new schema (split items)
-        if doc.get('_has_detailed_items'):
-            # Load items from test_result_items collection
-            test_result_id = doc['_id']
-            items = self._get_test_result_items(test_result_id)
+        Follows the page's latest_test_result_id pointer when it is set, and
+        falls back to the newest result by test_date (repairing the pointer)
+        for pages tested before the pointer existed.
 
-            # Group items by type
-            violations = []
-            warnings = []
-            info = []
-            discovery = []
-            passes = []
+        Supports both old schema (with arrays) and new schema (with separate items)
+        """
+        doc = None
+        page_doc = None
+        if ObjectId.is_valid(page_id):
+            page_doc = self.pages.find_one({"_id": ObjectId(page_id)}, {"latest_test_result_id": 1})
+            pointer = page_doc.get("latest_test_result_id") if page_doc else None
+            if pointer and ObjectId.is_valid(pointer):
+                doc = self.test_results.find_one({"_id": ObjectId(pointer), "page_id": page_id})
 
-            for item in items:
-                item_data = {
-                    'id': item.get('issue_id'),
-                    'impact': item.get('impact'),
-                    'touchpoint': item.get('touchpoint'),
-                    'xpath': item.get('xpath'),
-                    'element': item.get('element'),
-                    'html': item.get('html'),
-                    'description': item.get('description'),
-                    'metadata': item.get('metadata', {})
-                }
+        if not doc:
+            doc = self.test_results.find_one(
+                {"page_id": page_id},
+                sort=[("test_date", -1)]
+            )
+            if not doc:
+                return None
+            if page_doc:
+                self._point_to_test_result(page_id, doc["_id"], doc.get("test_date"))
 
-                item_type = item.get('item_type')
-                if item_type == 'violation':
-                    item_data['failure_summary'] = item.get('failure_summary')
-                    item_data['wcag_criteria'] = item.get('wcag_criteria', [])
-                    item_data['help_url'] = item.get('help_url')
-                    violations.append(item_data)
-                elif item_type == 'warning':
-                    item_data['failure_summary'] = item.get('failure_summary')
-                    item_data['wcag_criteria'] = item.get('wcag_criteria', [])
-                    item_data['help_url'] = item.get('help_url')
-                    warnings.append(item_data)
-                elif item_type == 'info':
-                    info.append(item_data)
-                elif item_type == 'discovery':
-                    discovery.append(item_data)
-                elif item_type == 'pass':
-                    passes.append(item_data)
+        return self._test_result_from_doc(doc)
 
-            # Add arrays back to doc for TestResult.from_dict()
-            doc['violations'] = violations
-            doc['warnings'] = warnings
-            doc['info'] = info
-            doc['discovery'] = discovery
-            doc['passes'] = passes
+    def get_template_sampling_roles(self, pages: List[Page]) -> Dict[str, str]:
+        """
+        Template sampling role of the latest test result of each page
 
-        # Old schema already has arrays, just use as-is
-        return TestResult.from_dict(doc)
-    
-    def get_latest_test_result(self, page_id: str) -> Optional[TestResult]:
+        Args:
+            pages: Pages to look up, e.g. one page of a website's page list
+
+        Returns:
+            Mapping of page ID -> 'representative' or 'sampled', for pages
+            whose latest result was part of a sampled template cluster
         """
-        Get most recent test result for a page
+        page_ids_by_result = {
+            ObjectId(page.latest_test_result_id): page.id
+            for page in pages
+            if page.latest_test_result_id and ObjectId.is_valid(page.latest_test_result_id)
+        }
+        if not page_ids_by_result:
+            return {}
+        roles = {}
+        for doc in self.test_results.find(
+            {'_id': {'$in': list(page_ids_by_result)}, 'metadata.template_sampling.role': {'$exists': True}},
+            {'metadata.template_sampling.role': 1}
+        ):
+            roles[page_ids_by_result[doc['_id']]] = doc['metadata']['template_sampling']['role']
+        return roles
 
-        Supports both old schema (with arrays) and new schema (with separate items)
+    def _test_result_from_doc(self, doc: Dict[str, Any]) -> TestResult:
         """
-        doc = self.test_results.find_one(
-            {"page_id": page_id},
-            sort=[("test_date", -1)]
-        )
-        if not doc:
-            return None
+        Build a TestResult from a summary document, loading split-schema items
 
+        Args:
+            doc: test_results document
+
+        Returns:
+            TestResult with violations/warnings/info/discovery/passes populated
+        """
         # Check if this uses the new schema (split items)
         if doc.get('_has_detailed_items'):
             # Load items from test_result_items collection
@@ -1209,10 +1300,8 @@ class Database:
         total_warnings = 0
         
         for website in websites:
-            pages = self.get_pages(website.id)
-            total_pages += len(pages)
-            
-            for page in pages:
+            for page in self.iter_page_refs(website.id):
+                total_pages += 1
                 if page.status == PageStatus.TESTED:
                     tested_pages += 1
                     total_violations += page.violation_count
@@ -1260,6 +1349,64 @@ class Database:
             result = self.document_references.insert_one(doc_data)
             return str(result.inserted_id)
     
+    def bulk_upsert_document_references(self, entries: List[Any],
+                                        batch_size: int = 500) -> int:
+        """
+        Add or update document references merged by a DocumentRegistry
+
+        Each document is one upsert; referring pages and link texts are
+        added to its sets and its seen count grows by the merged references.
+
+        Args:
+            entries: PendingDocumentReference entries, one per (website_id, document_url)
+            batch_size: Upserts sent per bulk write
+
+        Returns:
+            Number of documents inserted or updated
+        """
+        operations = []
+        for entry in entries:
+            ref = entry.reference
+            insert_only = {
+                'referring_page_url': ref.referring_page_url,
+                'mime_type': ref.mime_type,
+                'is_internal': ref.is_internal,
+                'link_text': ref.link_text,
+                'file_extension': ref.file_extension,
+                'discovered_at': ref.discovered_at
+            }
+            detected = {}
+            if ref.language:
+                detected = {'language': ref.language, 'language_confidence': ref.language_confidence}
+            else:
+                insert_only.update({'language': None, 'language_confidence': None})
+
+            operations.append(UpdateOne(
+                {'website_id': ref.website_id, 'document_url': ref.document_url},
+                {
+                    '$setOnInsert': insert_only,
+                    '$set': {'last_seen': entry.last_seen, **detected},
+                    '$max': {'via_redirect': entry.via_redirect},
+                    '$inc': {'seen_count': entry.seen_count},
+                    '$addToSet': {
+                        'referring_pages': {'$each': entry.referring_pages},
+                        'link_texts': {'$each': entry.link_texts}
+                    }
+                },
+                upsert=True
+            ))
+
+        written = 0
+        for start in range(0, len(operations), batch_size):
+            try:
+                result = self.document_references.bulk_write(operations[start:start + batch_size], ordered=False)
+                written += result.upserted_count + result.matched_count
+            except BulkWriteError as e:
+                details = e.details
+                written += details.get('nUpserted', 0) + details.get('nMatched', 0)
+                logger.error(f"Failed to write {len(details.get('writeErrors', []))} document references")
+        return written
+
     def get_document_references(self, website_id: str, internal_only: bool = None) -> List['DocumentReference']:
         """Get document references for a website"""
         from auto_a11y.models import DocumentReference
@@ -1375,7 +1522,8 @@ class Database:
                         'title': page.title,
                         'depth': page.depth,
                         'status': page.status.value if hasattr(page.status, 'value') else page.status,
-                        'error_reason': page.error_reason
+                        'error_reason': page.error_reason,
+                        'template_signature': page.template_signature
                     }}
                 )
                 updated_count += 1
@@ -2917,3 +3065,41 @@ class Database:
             {"token_hash": token_hash},
             {"$set": {"last_used": datetime.now()}, "$inc": {"use_count": 1}}
         )
+
+    # ==========================================
+    # Drupal Sync State Methods
+    # ==========================================
+
+    def get_drupal_sync_mark(self, project_id: str, resource: str, audit_uuid: str) -> Optional[int]:
+        """
+        Get the high-water mark of the last Drupal import
+
+        Args:
+            project_id: Project ID
+            resource: Imported resource ('discovered_pages' or 'issues')
+            audit_uuid: Drupal audit the project imports from
+
+        Returns:
+            Newest Drupal changed timestamp already imported, None if the
+            resource has never been imported from this audit
+        """
+        doc = self.drupal_sync_state.find_one({"project_id": project_id, "resource": resource})
+        if not doc or doc.get("audit_uuid") != audit_uuid:
+            return None
+        return doc.get("changed")
+
+    def set_drupal_sync_mark(self, project_id: str, resource: str, audit_uuid: str, changed: Optional[int]) -> None:
+        """
+        Record the high-water mark of a completed Drupal import
+
+        Args:
+            project_id: Project ID
+            resource: Imported resource ('discovered_pages' or 'issues')
+            audit_uuid: Drupal audit the project imports from
+            changed: Newest Drupal changed timestamp imported
+        """
+        self.drupal_sync_state.update_one(
+            {"project_id": project_id, "resource": resource},
+            {"$set": {"audit_uuid": audit_uuid, "changed": changed, "synced_at": datetime.now()}},
+            upsert=True
+        )
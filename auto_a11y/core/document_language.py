@@ -0,0 +1,475 @@
+"""
+Document language detection
+
+Detects the language of documents (PDF, DOCX, text) linked from crawled
+pages. The same documents are usually linked from many pages, so detection
+is shared and bounded:
+
+- one pooled HTTP session per service instead of one per document
+- an HTTP Range request for the head of PDF and text files, which holds the
+  catalog of most PDFs and their first page of text; the whole file is only
+  fetched when the head is not enough and the file is small
+- a persistent cache (MongoDB) keyed by URL and validated against the
+  document's ETag and Content-Length
+- PDF/DOCX parsing and text scoring in a thread pool, off the event loop
+"""
+
+import asyncio
+import logging
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes requested from the start of a document
+HEAD_BYTES = 256 * 1024
+# Documents up to this size are fetched whole when their head is not enough
+FULL_FETCH_LIMIT = 5 * 1024 * 1024
+MAX_CONNECTIONS = 8
+PARSER_THREADS = 2
+
+HEAD_TIMEOUT_SECONDS = 10
+GET_TIMEOUT_SECONDS = 15
+
+# Formats that can be read from their first bytes (DOCX needs the ZIP
+# directory at the end of the file)
+RANGE_EXTENSIONS = frozenset(['pdf', 'txt', 'csv', 'rtf'])
+TEXT_EXTENSIONS = frozenset(['txt', 'csv', 'rtf'])
+
+# Catalog /Lang entry, e.g. /Lang (en-US); most writers leave the catalog
+# uncompressed near the start of the file
+_PDF_LANG_PATTERN = re.compile(rb'/Lang\s*\(([A-Za-z]{2,3}(?:[-_][A-Za-z0-9]+)*)\)')
+
+
+def _language_code(value: str) -> str:
+    """Primary language subtag of a language tag ("en-US" -> "en")"""
+    return value.replace('_', '-').split('-')[0].lower()
+
+
+def analyze_text_language(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Analyze text to detect language using pattern matching
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Dictionary with language info or None
+    """
+    if not text or len(text) < 50:
+        return None
+
+    # Clean text
+    text = text.lower().strip()
+
+    # Language-specific patterns and common words
+    language_patterns = {
+        'en': {
+            'words': ['the', 'and', 'of', 'to', 'in', 'is', 'for', 'with', 'that', 'this',
+                      'are', 'was', 'will', 'have', 'been', 'from', 'can', 'which', 'their', 'would'],
+            'patterns': [r'\b(the|and|of|to|in)\b', r'\b(is|are|was|were)\b', r'\b(have|has|had)\b'],
+            'weight': 1.0
+        },
+        'fr': {
+            'words': ['le', 'la', 'les', 'de', 'et', 'est', 'pour', 'dans', 'avec', 'sur',
+                      'une', 'des', 'que', 'qui', 'par', 'plus', 'sont', 'être', 'avoir', 'faire'],
+            'patterns': [r'\b(le|la|les|un|une|des)\b', r'\b(de|du|des)\b', r'\b(est|sont|être)\b',
+                         r'[àâäéèêëïîôùûü]'],  # French accented characters
+            'weight': 1.2  # Slight boost for French since it's a priority
+        },
+        'es': {
+            'words': ['el', 'la', 'de', 'y', 'en', 'que', 'es', 'por', 'con', 'para',
+                      'los', 'las', 'una', 'se', 'del', 'al', 'más', 'pero', 'su', 'lo'],
+            'patterns': [r'\b(el|la|los|las)\b', r'\b(de|del)\b', r'\b(es|son|está|están)\b',
+                         r'[áéíóúñü]'],  # Spanish accented characters
+            'weight': 1.0
+        },
+        'de': {
+            'words': ['der', 'die', 'das', 'und', 'in', 'ist', 'mit', 'auf', 'für', 'von',
+                      'den', 'des', 'ein', 'eine', 'sich', 'zu', 'werden', 'haben', 'sein', 'ihr'],
+            'patterns': [r'\b(der|die|das|den|dem)\b', r'\b(ein|eine|einen)\b', r'\b(ist|sind|war|waren)\b',
+                         r'[äöüß]'],  # German special characters
+            'weight': 1.0
+        }
+    }
+
+    scores = {}
+
+    for lang, config in language_patterns.items():
+        score = 0
+
+        # Count occurrences of common words
+        for word in config['words']:
+            count = text.count(f' {word} ') + text.count(f' {word}.') + text.count(f' {word},')
+            if count > 0:
+                score += count * config['weight']
+
+        # Check patterns
+        for pattern in config['patterns']:
+            matches = len(re.findall(pattern, text))
+            if matches > 0:
+                score += matches * 0.5 * config['weight']
+
+        # Normalize score by text length
+        scores[lang] = score / (len(text) / 100)
+
+    # Get the language with highest score
+    if scores:
+        best_lang = max(scores, key=scores.get)
+        best_score = scores[best_lang]
+
+        # Calculate confidence based on score differential
+        sorted_scores = sorted(scores.values(), reverse=True)
+        if len(sorted_scores) > 1:
+            confidence = min(0.85, 0.5 + (sorted_scores[0] - sorted_scores[1]) / 10)
+        else:
+            confidence = 0.7
+
+        # Only return if score is significant
+        if best_score > 0.5:
+            logger.debug(f"Detected language from text analysis: {best_lang} (confidence: {confidence:.2f})")
+            return {'language': best_lang, 'confidence': confidence}
+
+    return None
+
+
+def detect_pdf_language(content: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Detect language from PDF metadata and content
+
+    Works on the head of a file as well as on a whole one: the catalog's
+    /Lang is read from the raw bytes before the file is parsed.
+
+    Args:
+        content: PDF file content (or its first bytes)
+
+    Returns:
+        Dictionary with language info or None
+    """
+    match = _PDF_LANG_PATTERN.search(content)
+    if match:
+        lang_code = _language_code(match.group(1).decode('ascii'))
+        logger.debug(f"Detected language from PDF catalog: {lang_code}")
+        return {'language': lang_code, 'confidence': 0.9}
+
+    try:
+        from pypdf import PdfReader
+
+        pdf_reader = PdfReader(BytesIO(content), strict=False)
+
+        # Check the catalog and document info for a language
+        for source in (pdf_reader.root_object, pdf_reader.metadata):
+            lang_code = source.get('/Lang') if source else None
+            if isinstance(lang_code, str) and lang_code:
+                lang_code = _language_code(lang_code)
+                logger.debug(f"Detected language from PDF metadata: {lang_code}")
+                return {'language': lang_code, 'confidence': 0.9}
+
+        # Extract text from first few pages for analysis
+        text_sample = ""
+        max_pages = min(3, len(pdf_reader.pages))
+        for i in range(max_pages):
+            try:
+                text_sample += pdf_reader.pages[i].extract_text()
+                if len(text_sample) > 1000:  # Enough text for analysis
+                    break
+            except Exception:
+                continue
+
+        if text_sample:
+            return analyze_text_language(text_sample)
+
+    except Exception as e:
+        logger.debug(f"Error detecting PDF language: {e}")
+
+    return None
+
+
+def detect_docx_language(content: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Detect language from Word document metadata and content
+
+    Args:
+        content: DOCX file content as bytes
+
+    Returns:
+        Dictionary with language info or None
+    """
+    try:
+        # DOCX files are ZIP archives
+        with zipfile.ZipFile(BytesIO(content)) as docx:
+            # Check core properties for language
+            if 'docProps/core.xml' in docx.namelist():
+                root = ET.fromstring(docx.read('docProps/core.xml'))
+
+                # Look for dc:language element
+                for elem in root.iter():
+                    if 'language' in elem.tag.lower() and elem.text:
+                        lang_code = _language_code(elem.text)
+                        logger.debug(f"Detected language from DOCX metadata: {lang_code}")
+                        return {'language': lang_code, 'confidence': 0.9}
+
+            # Extract text for analysis
+            if 'word/document.xml' in docx.namelist():
+                root = ET.fromstring(docx.read('word/document.xml'))
+
+                text_sample = ""
+                for elem in root.iter():
+                    if elem.text:
+                        text_sample += elem.text + " "
+                        if len(text_sample) > 1000:
+                            break
+
+                if text_sample:
+                    return analyze_text_language(text_sample)
+
+    except Exception as e:
+        logger.debug(f"Error detecting DOCX language: {e}")
+
+    return None
+
+
+def detect_text_language(content: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Detect language of a plain text document
+
+    Args:
+        content: Document content (or its first bytes)
+
+    Returns:
+        Dictionary with language info or None
+    """
+    # Try different encodings; a ranged read may cut a UTF-8 sequence
+    for encoding in ['utf-8', 'latin-1', 'cp1252']:
+        try:
+            text = content.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        return None
+    return analyze_text_language(text[:5000])  # Analyze first 5000 chars
+
+
+def detect_language_from_patterns(url: str, link_text: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Detect language from URL patterns and link text as fallback
+
+    Args:
+        url: Document URL
+        link_text: Link text
+
+    Returns:
+        Dictionary with language info or None
+    """
+    # URL patterns that indicate language
+    url_patterns = {
+        'fr': ['/fr/', '_fr', '-fr', 'french', 'francais', 'français'],
+        'en': ['/en/', '_en', '-en', 'english', 'anglais'],
+        'es': ['/es/', '_es', '-es', 'spanish', 'espanol', 'español'],
+        'de': ['/de/', '_de', '-de', 'german', 'deutsch', 'allemand']
+    }
+
+    url_lower = url.lower()
+
+    for lang, patterns in url_patterns.items():
+        for pattern in patterns:
+            if pattern in url_lower:
+                logger.debug(f"Detected language from URL pattern: {lang}")
+                return {'language': lang, 'confidence': 0.6}
+
+    # Check link text for language indicators
+    if link_text:
+        link_lower = link_text.lower()
+
+        # French indicators
+        if any(word in link_lower for word in ['français', 'francais', 'french', 'version française']):
+            return {'language': 'fr', 'confidence': 0.7}
+
+        # English indicators
+        if any(word in link_lower for word in ['english', 'anglais', 'version anglaise']):
+            return {'language': 'en', 'confidence': 0.7}
+
+        # Analyze link text itself
+        lang_result = analyze_text_language(link_text)
+        if lang_result:
+            lang_result['confidence'] *= 0.7  # Lower confidence for short text
+            return lang_result
+
+    return None
+
+
+def detect_content_language(content: bytes, extension: str) -> Optional[Dict[str, Any]]:
+    """Detect the language of document content by its file extension"""
+    if extension == 'pdf':
+        return detect_pdf_language(content)
+    if extension == 'docx':
+        return detect_docx_language(content)
+    if extension in TEXT_EXTENSIONS:
+        return detect_text_language(content)
+    return None
+
+
+class DocumentLanguageService:
+    """Detects document languages over a shared connection pool, with a persistent cache"""
+
+    def __init__(self, cache_collection=None):
+        """
+        Initialize the service
+
+        Args:
+            cache_collection: MongoDB collection holding detected languages
+                (None keeps them in memory for the service's lifetime)
+        """
+        self.cache_collection = cache_collection
+        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self._session = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def detect(self, doc_url: str, link_text: str = None,
+                     file_extension: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Detect the language of a document
+
+        Args:
+            doc_url: URL of the document
+            link_text: Text of the link to the document
+            file_extension: File extension of the document
+
+        Returns:
+            Dictionary with 'language' code and 'confidence' score, or None
+        """
+        extension = (file_extension or '').lower().lstrip('.')
+
+        try:
+            import aiohttp
+
+            session = await self._get_session()
+            async with session.head(doc_url, timeout=aiohttp.ClientTimeout(total=HEAD_TIMEOUT_SECONDS),
+                                    allow_redirects=True) as response:
+                headers = response.headers
+
+            # 1. Check Content-Language header
+            content_language = headers.get('Content-Language')
+            if content_language:
+                lang_code = _language_code(content_language)
+                logger.debug(f"Detected language from Content-Language header: {lang_code} for {doc_url}")
+                return {'language': lang_code, 'confidence': 0.95}
+
+            # 2. Reuse a detection of the same document version
+            validator = {'etag': headers.get('ETag'), 'length': headers.get('Content-Length')}
+            cached = self._cache_get(doc_url, validator)
+            if cached is not None:
+                logger.debug(f"Using cached language for {doc_url}")
+                return cached.get('result') or detect_language_from_patterns(doc_url, link_text)
+
+            # 3. Analyze the document head, or the whole document when needed
+            result = await self._detect_from_content(session, doc_url, extension, headers)
+            self._cache_put(doc_url, validator, result)
+            if result:
+                return result
+
+        except Exception as e:
+            logger.debug(f"Error fetching document for language detection: {e}")
+
+        # 4. Fallback: Analyze URL and link text patterns
+        return detect_language_from_patterns(doc_url, link_text)
+
+    async def _detect_from_content(self, session, doc_url: str, extension: str,
+                                   headers) -> Optional[Dict[str, Any]]:
+        """Fetch as little of a document as needed and analyze it in the thread pool"""
+        if extension not in RANGE_EXTENSIONS and extension != 'docx':
+            return None
+        length = int(headers['Content-Length']) if headers.get('Content-Length', '').isdigit() else None
+
+        complete = False
+        if extension in RANGE_EXTENSIONS:
+            content, complete = await self._fetch(session, doc_url, HEAD_BYTES)
+            result = await self._analyze(content, extension)
+            if result or complete:
+                return result
+
+        if length is None or length >= FULL_FETCH_LIMIT:
+            return None
+        content, _ = await self._fetch(session, doc_url, None)
+        return await self._analyze(content, extension)
+
+    @staticmethod
+    async def _fetch(session, doc_url: str, limit: Optional[int]) -> Tuple[bytes, bool]:
+        """
+        Download a document, or its first bytes
+
+        Returns:
+            Tuple of (content, whether content is the whole document)
+        """
+        import aiohttp
+
+        request_headers = {'Range': f'bytes=0-{limit - 1}'} if limit else {}
+        async with session.get(doc_url, headers=request_headers,
+                               timeout=aiohttp.ClientTimeout(total=GET_TIMEOUT_SECONDS)) as response:
+            if limit is None:
+                return await response.read(), True
+            # Servers that ignore Range answer 200 with the whole body; stop reading at the limit
+            content = await response.content.read(limit)
+            complete = response.status == 200 and len(content) < limit
+            if response.status == 206:
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                complete = total.isdigit() and int(total) <= len(content)
+            return content, complete
+
+    async def _analyze(self, content: bytes, extension: str) -> Optional[Dict[str, Any]]:
+        """Run the CPU-bound parsing in the thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=PARSER_THREADS, thread_name_prefix='doc-language')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, detect_content_language, content, extension)
+
+    async def _get_session(self):
+        """Shared HTTP session, created in the running event loop"""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS))
+        return self._session
+
+    def _cache_get(self, doc_url: str, validator: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached detection of a document, if its ETag and length still match"""
+        if not validator['etag'] and not validator['length']:
+            return None  # Nothing to tell document versions apart
+
+        entry = self._memory_cache.get(doc_url)
+        if entry is None and self.cache_collection is not None:
+            try:
+                entry = self.cache_collection.find_one({'_id': doc_url})
+            except Exception as e:
+                logger.warning(f"Could not read document language cache: {e}")
+        if not entry or entry.get('validator') != validator:
+            return None
+        return entry
+
+    def _cache_put(self, doc_url: str, validator: Dict[str, Any], result: Optional[Dict[str, Any]]):
+        """Store a detection (including "nothing found") for the document version"""
+        if not validator['etag'] and not validator['length']:
+            return
+
+        entry = {'_id': doc_url, 'validator': validator, 'result': result, 'checked_at': datetime.now()}
+        self._memory_cache[doc_url] = entry
+        if self.cache_collection is not None:
+            try:
+                self.cache_collection.replace_one({'_id': doc_url}, entry, upsert=True)
+            except Exception as e:
+                logger.warning(f"Could not write document language cache: {e}")
+
+    async def close(self):
+        """Close the connection pool and the parser threads"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
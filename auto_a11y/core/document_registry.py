@@ -0,0 +1,91 @@
+"""
+Crawl-scoped document reference registry
+
+Documents linked from a site's header or footer are found on every page of
+a crawl. Instead of reading and writing the document reference once per
+referring page, the registry merges references per (website, document URL)
+in memory and writes them with batched upserts.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+
+from auto_a11y.models import DocumentReference
+
+logger = logging.getLogger(__name__)
+
+# Unique documents held before they are written
+FLUSH_THRESHOLD = 500
+
+
+@dataclass
+class PendingDocumentReference:
+    """References to one document merged since the last flush"""
+    reference: DocumentReference  # First reference seen
+    referring_pages: List[str] = field(default_factory=list)
+    link_texts: List[str] = field(default_factory=list)
+    seen_count: int = 0
+    last_seen: datetime = field(default_factory=datetime.now)
+    via_redirect: bool = False
+
+
+class DocumentRegistry:
+    """Deduplicates the document references of a crawl and writes them in bulk"""
+
+    def __init__(self, database, flush_threshold: int = FLUSH_THRESHOLD):
+        """
+        Initialize the registry
+
+        Args:
+            database: Database connection
+            flush_threshold: Unique pending documents that trigger a write
+        """
+        self.db = database
+        self.flush_threshold = flush_threshold
+        self.pending: Dict[Tuple[str, str], PendingDocumentReference] = {}
+        self.seen: Set[Tuple[str, str]] = set()
+
+    def add(self, doc_ref: DocumentReference):
+        """
+        Record a reference to a document
+
+        Args:
+            doc_ref: Reference found on a page
+        """
+        key = (doc_ref.website_id, doc_ref.document_url)
+        entry = self.pending.get(key)
+        if entry is None:
+            entry = self.pending[key] = PendingDocumentReference(reference=doc_ref)
+            self.seen.add(key)
+
+        entry.seen_count += 1
+        entry.last_seen = doc_ref.last_seen
+        entry.via_redirect = entry.via_redirect or doc_ref.via_redirect
+        if doc_ref.referring_page_url not in entry.referring_pages:
+            entry.referring_pages.append(doc_ref.referring_page_url)
+        if doc_ref.link_text and doc_ref.link_text not in entry.link_texts:
+            entry.link_texts.append(doc_ref.link_text)
+
+        if len(self.pending) >= self.flush_threshold:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write the pending references
+
+        Returns:
+            Number of documents written
+        """
+        if not self.pending:
+            return 0
+        entries = list(self.pending.values())
+        self.pending = {}
+        written = self.db.bulk_upsert_document_references(entries)
+        logger.debug(f"Flushed {written} document references")
+        return written
+
+    def documents_found(self, website_id: str) -> int:
+        """Number of unique documents referenced from a website in this crawl"""
+        return sum(1 for key in self.seen if key[0] == website_id)
@@ -0,0 +1,119 @@
+"""
+Index audit using MongoDB query plans
+
+Runs explain() on the application's main query shapes and reports the ones
+that fall back to a collection scan or an in-memory sort. Run it with
+``python run.py --audit-indexes`` after adding a query or an index migration.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from bson import ObjectId
+
+logger = logging.getLogger(__name__)
+
+# Placeholder values - the planner chooses plans by query shape, not by value
+_ID = '000000000000000000000000'
+
+# (collection, description, filter, sort) for the queries the app relies on
+AUDIT_QUERIES: List[Tuple[str, str, Dict[str, Any], Optional[List[Tuple[str, int]]]]] = [
+    ('pages', 'Database.iter_pages / iter_page_refs',
+     {'website_id': _ID, 'is_in_latest_discovery': True}, [('_id', 1)]),
+    ('pages', 'Pages of a website by status',
+     {'website_id': _ID, 'status': 'tested'}, None),
+    ('pages', 'Database.get_page_by_url',
+     {'website_id': _ID, 'url': 'https://example.com/'}, None),
+    ('test_results', 'Database.get_latest_test_result (fallback)',
+     {'page_id': _ID}, [('test_date', -1)]),
+    ('test_results', 'Database.get_test_results_by_session',
+     {'session_id': 'session'}, [('state_sequence', 1)]),
+    ('test_result_items', 'Database._get_test_result_items',
+     {'test_result_id': ObjectId(_ID)}, None),
+    ('test_result_items', 'Database.iter_latest_result_items',
+     {'item_type': {'$in': ['violation', 'warning']}, 'test_result_id': {'$in': [ObjectId(_ID)]}}, None),
+    ('test_result_items', 'Items of a page, newest first',
+     {'page_id': _ID}, [('test_date', -1)]),
+    ('websites', 'Database.get_websites',
+     {'project_id': _ID}, None),
+    ('document_references', 'Database.add_document_reference',
+     {'website_id': _ID, 'document_url': 'https://example.com/a.pdf'}, None),
+    ('discovery_runs', 'Latest discovery run of a website',
+     {'website_id': _ID, 'is_latest': True}, None),
+    ('jobs', 'JobManager.get_job',
+     {'job_id': 'job'}, None),
+    ('jobs', 'WorkQueue.claim',
+     {'queue.task': {'$in': ['testing']}, 'status': 'pending'}, [('queue.priority', -1), ('created_at', 1)]),
+    ('jobs', 'Shard children of a job',
+     {'parent_job_id': 'job'}, None),
+    ('issues', 'Drupal issue import existing UUIDs',
+     {'project_id': _ID, 'drupal_uuid': {'$in': ['uuid']}}, None),
+    ('drupal_sync_state', 'Database.get_drupal_sync_mark',
+     {'project_id': _ID, 'resource': 'issues'}, None),
+]
+
+
+def _collect_stages(plan: Dict[str, Any], stages: List[Dict[str, Any]]):
+    """Flatten a winning plan tree into a list of stages"""
+    if not isinstance(plan, dict):
+        return
+    if 'stage' in plan:
+        stages.append(plan)
+    for key in ('inputStage', 'queryPlan', 'outerStage', 'innerStage'):
+        if key in plan:
+            _collect_stages(plan[key], stages)
+    for child in plan.get('inputStages', []):
+        _collect_stages(child, stages)
+
+
+def explain_query(collection, query: Dict[str, Any], sort: Optional[List[Tuple[str, int]]] = None) -> Dict[str, Any]:
+    """
+    Summarize the winning plan of a find query
+
+    Args:
+        collection: PyMongo collection
+        query: Find filter
+        sort: Optional sort specification
+
+    Returns:
+        Dictionary with the plan's stages, the indexes used and whether it
+        scans the collection or sorts in memory
+    """
+    cursor = collection.find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    explanation = cursor.limit(1).explain()
+
+    stages: List[Dict[str, Any]] = []
+    _collect_stages(explanation.get('queryPlanner', {}).get('winningPlan', {}), stages)
+    stage_names = [stage['stage'] for stage in stages]
+
+    return {
+        'stages': stage_names,
+        'indexes': [stage['indexName'] for stage in stages if stage.get('indexName')],
+        'collection_scan': 'COLLSCAN' in stage_names,
+        'in_memory_sort': 'SORT' in stage_names
+    }
+
+
+def audit_indexes(database) -> List[Dict[str, Any]]:
+    """
+    Explain every audited query against a database
+
+    Args:
+        database: Database instance
+
+    Returns:
+        One result per audited query with collection, description and plan summary
+    """
+    results = []
+    for collection_name, description, query, sort in AUDIT_QUERIES:
+        result = {'collection': collection_name, 'description': description}
+        try:
+            result.update(explain_query(database.db[collection_name], query, sort))
+        except Exception as e:
+            logger.warning(f"Could not explain query '{description}': {e}")
+            result.update({'stages': [], 'indexes': [], 'collection_scan': False,
+                           'in_memory_sort': False, 'error': str(e)})
+        results.append(result)
+    return results
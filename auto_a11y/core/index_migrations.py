@@ -0,0 +1,248 @@
+"""
+Versioned index migrations
+
+Indexes used to be created unconditionally every time a Database was
+constructed. Each migration below now runs once per database; the applied
+version is stored in the ``schema_migrations`` collection. To change indexes,
+append a new migration rather than editing an applied one.
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_COLLECTION = 'schema_migrations'
+INDEX_MIGRATION_DOC_ID = 'indexes'
+
+
+def _baseline_indexes(db):
+    """Indexes that existed before migrations were versioned"""
+    # Projects
+    db.projects.create_index("name")
+    db.projects.create_index("status")
+    db.projects.create_index("project_type")
+    db.projects.create_index([("project_type", 1), ("status", 1)])
+    db.projects.create_index([("members.user_id", 1)])
+
+    # Websites
+    db.websites.create_index("project_id")
+    db.websites.create_index([("members.user_id", 1)])
+    db.websites.create_index("url")
+
+    # Pages
+    db.pages.create_index("website_id")
+    db.pages.create_index("url")
+    db.pages.create_index("status")
+    db.pages.create_index([("website_id", 1), ("url", 1)], unique=True)
+
+    # Test results
+    db.test_results.create_index("page_id")
+    db.test_results.create_index("test_date")
+    # Multi-state testing indexes
+    db.test_results.create_index("session_id")
+    db.test_results.create_index([("page_id", 1), ("session_id", 1), ("state_sequence", 1)])
+    db.test_results.create_index([("session_id", 1), ("state_sequence", 1)])
+
+    # Test result items (NEW: detailed violations/warnings)
+    db.test_result_items.create_index("test_result_id")
+    db.test_result_items.create_index([("page_id", 1), ("test_date", -1)])
+    db.test_result_items.create_index([("item_type", 1), ("test_result_id", 1)])
+    db.test_result_items.create_index([("issue_id", 1), ("test_result_id", 1)])
+    db.test_result_items.create_index([("touchpoint", 1), ("test_result_id", 1)])
+    # Compound index for common queries
+    db.test_result_items.create_index([
+        ("test_result_id", 1),
+        ("item_type", 1),
+        ("issue_id", 1)
+    ])
+
+    # Document references
+    db.document_references.create_index("website_id")
+    db.document_references.create_index("document_url")
+    db.document_references.create_index([("website_id", 1), ("document_url", 1)])
+
+    # Discovery runs
+    db.discovery_runs.create_index("website_id")
+    db.discovery_runs.create_index("started_at")
+    db.discovery_runs.create_index("is_latest")
+
+    # Issue documentation status
+    db.issue_documentation_status.create_index("issue_code", unique=True)
+    db.discovery_runs.create_index([("website_id", 1), ("is_latest", 1)])
+
+    # Update pages index for discovery run
+    db.pages.create_index("discovery_run_id")
+    db.pages.create_index("is_in_latest_discovery")
+
+    # Page setup scripts
+    db.page_setup_scripts.create_index("page_id")
+    db.page_setup_scripts.create_index("website_id")  # NEW: For website-level scripts
+    db.page_setup_scripts.create_index([("website_id", 1), ("scope", 1), ("enabled", 1)])
+    db.page_setup_scripts.create_index([("page_id", 1), ("enabled", 1)])
+    db.page_setup_scripts.create_index("created_date")
+
+    # Script execution sessions
+    db.script_execution_sessions.create_index("session_id", unique=True)
+    db.script_execution_sessions.create_index("website_id")
+    db.script_execution_sessions.create_index([("website_id", 1), ("started_at", -1)])
+
+    # Test state matrices
+    db.test_state_matrices.create_index("page_id", unique=True)
+    db.test_state_matrices.create_index("website_id")
+    db.test_state_matrices.create_index([("website_id", 1), ("created_date", -1)])
+
+    # Website users (test users for authenticated testing)
+    db.website_users.create_index("website_id")
+    db.website_users.create_index([("website_id", 1), ("username", 1)], unique=True)
+    db.website_users.create_index([("website_id", 1), ("enabled", 1)])
+    db.website_users.create_index("roles")
+
+    # Project users (test users at project level)
+    db.project_users.create_index("project_id")
+    db.project_users.create_index([("project_id", 1), ("username", 1)], unique=True)
+    db.project_users.create_index([("project_id", 1), ("enabled", 1)])
+    db.project_users.create_index("roles")
+
+    # Recordings (manual audit recordings)
+    db.recordings.create_index("recording_id", unique=True)
+    db.recordings.create_index("project_id")
+    db.recordings.create_index("recorded_date")
+    db.recordings.create_index("recording_type")
+    db.recordings.create_index("component_names")  # For component-specific queries
+    db.recordings.create_index([("project_id", 1), ("recorded_date", -1)])
+    db.recordings.create_index("drupal_video_uuid")  # For Drupal sync
+    db.recordings.create_index("drupal_sync_status")
+
+    # Discovered pages (for Drupal export)
+    db.discovered_pages.create_index("project_id")
+    db.discovered_pages.create_index("url")
+    db.discovered_pages.create_index([("project_id", 1), ("url", 1)], unique=True)
+    db.discovered_pages.create_index("source_type")
+    db.discovered_pages.create_index("drupal_uuid")  # For Drupal sync
+    db.discovered_pages.create_index("drupal_sync_status")
+
+    # Recording issues
+    db.recording_issues.create_index("recording_id")
+    db.recording_issues.create_index("project_id")
+    db.recording_issues.create_index("impact")
+    db.recording_issues.create_index("status")
+    db.recording_issues.create_index("component_names")  # For component-specific queries
+    db.recording_issues.create_index([("recording_id", 1), ("impact", 1)])
+    db.recording_issues.create_index([("project_id", 1), ("status", 1)])
+
+    # Drupal issues (track issue uploads by unique_id)
+    db.drupal_issues.create_index("unique_id")
+    db.drupal_issues.create_index("violation_id")  # Keep for reference
+    db.drupal_issues.create_index("project_id")
+    db.drupal_issues.create_index([("unique_id", 1), ("project_id", 1)], unique=True)
+    db.drupal_issues.create_index("drupal_uuid")
+    db.drupal_issues.create_index("discovered_page_id")
+
+    # App users (application authentication)
+    db.app_users.create_index("email", unique=True)
+    db.app_users.create_index("role")
+    db.app_users.create_index("is_active")
+
+    # Test schedules (scheduled testing configuration)
+    db.test_schedules.create_index("website_id")
+    db.test_schedules.create_index("enabled")
+    db.test_schedules.create_index([("website_id", 1), ("enabled", 1)])
+    db.test_schedules.create_index("next_run_at")
+    db.test_schedules.create_index("apscheduler_job_id", unique=True, sparse=True)
+
+    # Share tokens (public share links)
+    db.share_tokens.create_index("token_hash", unique=True)
+    db.share_tokens.create_index([("scope", 1), ("scope_id", 1)])
+
+
+def _latest_result_and_page_keyset_indexes(db):
+    """Compound indexes for latest-result lookups and page streaming"""
+    # get_latest_test_result fallback and per-page history: filter on page_id, sort test_date desc
+    db.test_results.create_index([("page_id", 1), ("test_date", -1)])
+    # The compound index above serves every page_id-only query
+    _drop_index_if_exists(db.test_results, "page_id_1")
+
+    # Database.iter_pages / iter_page_refs: website + latest discovery, keyset on _id
+    db.pages.create_index([("website_id", 1), ("is_in_latest_discovery", 1), ("_id", 1)])
+    # Status filters within a website (tested pages for reports, untested pages)
+    db.pages.create_index([("website_id", 1), ("status", 1)])
+
+
+def _report_artifact_indexes(db):
+    """Indexes for the report artifact cache"""
+    db.report_artifacts.create_index("created_at")
+    db.report_artifacts.create_index([("spec.scope", 1), ("spec.scope_id", 1)])
+
+
+def _drupal_delta_sync_indexes(db):
+    """Indexes for Drupal delta imports"""
+    db.drupal_sync_state.create_index([("project_id", 1), ("resource", 1)], unique=True)
+    db.issues.create_index("drupal_uuid")
+    db.issues.create_index("project_id")
+
+
+def _drop_index_if_exists(collection, name: str):
+    """Drop an index, ignoring it if it does not exist"""
+    try:
+        collection.drop_index(name)
+    except OperationFailure:
+        pass
+
+
+# (version, description, migration) in the order they must be applied
+INDEX_MIGRATIONS: List[Tuple[int, str, Callable]] = [
+    (1, 'baseline indexes', _baseline_indexes),
+    (2, 'latest test result and page keyset indexes', _latest_result_and_page_keyset_indexes),
+    (3, 'report artifact cache indexes', _report_artifact_indexes),
+    (4, 'drupal delta sync indexes', _drupal_delta_sync_indexes),
+]
+
+
+def get_index_version(db) -> int:
+    """
+    Get the index migration version applied to a database
+
+    Args:
+        db: Database instance
+
+    Returns:
+        Applied version, 0 if none
+    """
+    doc = db.db[MIGRATIONS_COLLECTION].find_one({'_id': INDEX_MIGRATION_DOC_ID})
+    return doc.get('version', 0) if doc else 0
+
+
+def apply_index_migrations(db, force: bool = False) -> int:
+    """
+    Apply index migrations newer than the recorded version
+
+    Args:
+        db: Database instance
+        force: Re-apply every migration regardless of the recorded version
+
+    Returns:
+        Number of migrations applied
+    """
+    current = 0 if force else get_index_version(db)
+    applied = 0
+
+    for version, description, migration in INDEX_MIGRATIONS:
+        if version <= current:
+            continue
+
+        logger.info(f"Applying index migration {version}: {description}")
+        migration(db)
+        db.db[MIGRATIONS_COLLECTION].update_one(
+            {'_id': INDEX_MIGRATION_DOC_ID},
+            {'$set': {'version': version, 'description': description, 'applied_at': datetime.now()}},
+            upsert=True
+        )
+        applied += 1
+
+    if applied:
+        logger.info(f"Index migrations up to date at version {INDEX_MIGRATIONS[-1][0]}")
+    return applied
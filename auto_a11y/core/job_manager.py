@@ -12,6 +12,8 @@ from pymongo import MongoClient, UpdateOne
 from pymongo.errors import DuplicateKeyError
 import json
 
+from auto_a11y.core.progress_aggregator import ProgressAggregator
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,7 @@ class JobType(Enum):
     """Types of jobs in the system"""
     DISCOVERY = "discovery"
     TESTING = "testing"
+    TESTING_SHARD = "testing_shard"
     REPORT_GENERATION = "report_generation"
     BULK_TEST = "bulk_test"
 
@@ -65,6 +68,9 @@ class JobManager:
         self._indexes_created = False
         self._cleanup_task = None
         
+        # Coalesces progress writes and caches cancellation checks per job
+        self.progress = ProgressAggregator(self.collection)
+        
         # Try to create indexes but don't fail if it doesn't work
         try:
             self._ensure_indexes()
@@ -108,6 +114,23 @@ class JobManager:
                 ('updated_at', 1)
             ])
             
+            # Index for work queue claims (only queued jobs carry a queue document)
+            self.collection.create_index(
+                [
+                    ('queue.task', 1),
+                    ('status', 1),
+                    ('queue.priority', -1),
+                    ('created_at', 1)
+                ],
+                partialFilterExpression={'queue': {'$exists': True}}
+            )
+            
+            # Index for aggregating shard jobs into their parent
+            self.collection.create_index('parent_job_id', sparse=True)
+            
+            # Index for finding a report job already building the same artifact
+            self.collection.create_index('metadata.cache_key', sparse=True)
+            
             # TTL index to auto-delete old completed jobs after 7 days
             self.collection.create_index(
                 'completed_at',
@@ -128,7 +151,9 @@ class JobManager:
         project_id: Optional[str] = None,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        queue: Optional[Dict[str, Any]] = None,
+        parent_job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create a new job in the database
@@ -141,6 +166,8 @@ class JobManager:
             user_id: User who initiated the job
             session_id: Session ID for tracking
             metadata: Additional job metadata
+            queue: Work queue document if the job should be run by a worker
+            parent_job_id: Parent job if this job is one shard of a larger job
             
         Returns:
             Created job document
@@ -173,6 +200,11 @@ class JobManager:
             'lock_acquired_at': None
         }
         
+        if queue is not None:
+            job_doc['queue'] = queue
+        if parent_job_id:
+            job_doc['parent_job_id'] = parent_job_id
+        
         # Ensure indexes are created before first insert
         if not self._indexes_created:
             try:
@@ -212,6 +244,9 @@ class JobManager:
         Returns:
             True if updated successfully
         """
+        # Buffered progress must not land after the status change
+        self.progress.discard(job_id)
+        
         update_doc = {
             '$set': {
                 'status': status.value,
@@ -248,6 +283,8 @@ class JobManager:
             update_doc
         )
         
+        self.progress.record_status(job_id, status.value, progress)
+        
         if result.modified_count > 0:
             logger.info(f"Updated job {job_id} status to {status.value}")
             return True
@@ -282,28 +319,20 @@ class JobManager:
             'percentage': (current / total * 100) if total > 0 else 0
         }
         
-        logger.debug(f"Updating job {job_id} progress in database")
+        # Writes are coalesced per job and flushed at most once per interval
+        return self.progress.submit(job_id, progress)
+    
+    def flush_job_progress(self, job_id: Optional[str] = None):
+        """
+        Write buffered progress immediately
         
-        try:
-            result = self.collection.update_one(
-                {'job_id': job_id},
-                {
-                    '$set': {
-                        'progress': progress,
-                        'updated_at': datetime.now()
-                    }
-                }
-            )
-            
-            if result.modified_count > 0:
-                logger.debug(f"Successfully updated progress for job {job_id}")
-            else:
-                logger.warning(f"No document modified for job {job_id} - job may not exist")
-            
-            return result.modified_count > 0
-        except Exception as e:
-            logger.error(f"Failed to update progress for job {job_id}: {e}")
-            return False
+        Args:
+            job_id: Job to flush, or None to flush every job
+        """
+        if job_id:
+            self.progress.flush(job_id)
+        else:
+            self.progress.flush_all()
     
     def request_cancellation(
         self,
@@ -348,7 +377,27 @@ class JobManager:
         )
         
         if result.modified_count > 0:
+            self.progress.mark_cancellation_requested(job_id)
             logger.info(f"Cancellation requested for job {job_id} by {requested_by}")
+            
+            # Propagate to shard jobs so every worker stops its part
+            shards = self.collection.update_many(
+                {
+                    'parent_job_id': job_id,
+                    'status': {'$in': [JobStatus.PENDING.value, JobStatus.RUNNING.value]}
+                },
+                {
+                    '$set': {
+                        'cancellation_requested': True,
+                        'cancellation_requested_at': datetime.now(),
+                        'cancellation_requested_by': requested_by,
+                        'status': JobStatus.CANCELLING.value,
+                        'updated_at': datetime.now()
+                    }
+                }
+            )
+            if shards.modified_count > 0:
+                logger.info(f"Cancellation propagated to {shards.modified_count} shards of job {job_id}")
             return True
         else:
             logger.error(f"Failed to update job {job_id} for cancellation")
@@ -358,12 +407,19 @@ class JobManager:
         """
         Check if cancellation has been requested for a job
         
+        The result is cached for a short TTL so job loops can call this
+        on every iteration without querying the database each time.
+        
         Args:
             job_id: Job identifier
             
         Returns:
             True if cancellation requested
         """
+        return self.progress.is_cancellation_requested(job_id, self._load_cancellation_flag)
+    
+    def _load_cancellation_flag(self, job_id: str) -> bool:
+        """Read the cancellation flag directly from the database"""
         job = self.collection.find_one(
             {'job_id': job_id},
             {'cancellation_requested': 1, 'status': 1}
@@ -386,6 +442,42 @@ class JobManager:
         """
         return self.collection.find_one({'job_id': job_id})
     
+    def get_job_snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a lightweight view of job status and progress
+        
+        Active jobs running in this process are served from memory; anything
+        else falls back to a projected database read.
+        
+        Args:
+            job_id: Job identifier
+            
+        Returns:
+            Dictionary with job_id, status, progress and error, or None
+        """
+        snapshot = self.progress.get_snapshot(job_id)
+        if snapshot and snapshot['status'] in ('pending', 'running', 'cancelling'):
+            return {
+                'job_id': job_id,
+                'status': snapshot['status'],
+                'progress': snapshot['progress'],
+                'error': None
+            }
+        
+        job = self.collection.find_one(
+            {'job_id': job_id},
+            {'status': 1, 'progress': 1, 'error': 1}
+        )
+        if not job:
+            return None
+        
+        return {
+            'job_id': job_id,
+            'status': job.get('status'),
+            'progress': job.get('progress', {}),
+            'error': job.get('error')
+        }
+    
     def get_active_jobs(
         self,
         job_type: Optional[JobType] = None,
@@ -0,0 +1,323 @@
+"""
+Sharding of large website test jobs across queue workers
+
+A sharded test is a parent testing job that is never run itself, plus one
+queued child job per chunk of pages. Any free worker can claim a child.
+Child progress is summed into the parent's progress, and the parent is
+completed through ``TestingJob.set_completed`` once the queue has recorded
+the outcome of every child (completed, cancelled, or failed with no retry
+left). Cancelling the parent cancels all of its children (see
+``JobManager.request_cancellation``).
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+from auto_a11y.core.job_manager import JobManager, JobType, JobStatus
+from auto_a11y.core.template_sampling import get_sampling_settings, plan_template_sampling
+from auto_a11y.core.work_queue import WorkQueue, PRIORITY_NORMAL, DEFAULT_MAX_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = [JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value]
+
+# Detail counters summed from children into the parent
+SHARD_COUNTERS = ['pages_tested', 'pages_passed', 'pages_failed', 'pages_skipped']
+
+
+def chunk_page_ids(page_ids: List[str], shard_size: int) -> List[List[str]]:
+    """
+    Split page IDs into consecutive chunks
+
+    Args:
+        page_ids: Page IDs to split
+        shard_size: Maximum pages per chunk
+
+    Returns:
+        List of page ID chunks
+    """
+    shard_size = max(shard_size, 1)
+    return [page_ids[i:i + shard_size] for i in range(0, len(page_ids), shard_size)]
+
+
+def enqueue_sharded_test(
+    work_queue: WorkQueue,
+    parent_job_id: str,
+    website_id: str,
+    project_id: Optional[str],
+    page_ids: List[str],
+    shard_size: int,
+    website_user_ids: Optional[List[str]] = None,
+    take_screenshot: bool = True,
+    run_ai_analysis: Optional[bool] = None,
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    priority: int = PRIORITY_NORMAL,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+) -> Dict[str, Any]:
+    """
+    Create a parent testing job and enqueue one child job per page chunk
+
+    Template sampling is planned here over all the pages, so each template
+    cluster gets one set of representatives however its pages are split.
+    Representatives are put in the first shards, and each child's payload
+    carries the part of the plan covering its own pages.
+
+    Args:
+        work_queue: WorkQueue instance
+        parent_job_id: Job ID shown to the user
+        website_id: Website being tested
+        project_id: Project owning the website
+        page_ids: All page IDs to test
+        shard_size: Maximum pages per child job
+        website_user_ids: Project users to test as (empty string for guest)
+        take_screenshot: Whether to take screenshots
+        run_ai_analysis: Whether to run AI analysis
+        user_id: User who initiated the job
+        session_id: Session ID for tracking
+        priority: Priority for the child jobs
+        max_attempts: Attempts per child job
+
+    Returns:
+        Parent job document
+    """
+    job_manager = work_queue.job_manager
+    sampling_plan = None
+    project = job_manager.db.get_project(project_id) if project_id else None
+    sampling = get_sampling_settings(project.config if project else None)
+    if sampling:
+        sampling_plan = plan_template_sampling(
+            job_manager.db.get_page_refs(page_ids), sampling['representatives'], sampling['light_touchpoints']
+        )
+        page_ids = sorted(page_ids, key=sampling_plan.is_light)
+
+    chunks = chunk_page_ids(page_ids, shard_size)
+    user_ids = website_user_ids or ['']
+    # Children test their pages once per tester, so progress counts every
+    # page once per tester
+    total_pages = len(page_ids) * len(user_ids)
+
+    parent = job_manager.create_job(
+        job_id=parent_job_id,
+        job_type=JobType.TESTING,
+        website_id=website_id,
+        project_id=project_id,
+        user_id=user_id,
+        session_id=session_id,
+        metadata={
+            'page_ids': page_ids,
+            'total_pages': total_pages,
+            'website_user_ids': user_ids,
+            'shard_count': len(chunks),
+            'shard_size': shard_size
+        }
+    )
+    job_manager.update_job_status(
+        job_id=parent_job_id,
+        status=JobStatus.RUNNING,
+        progress={
+            'current': 0,
+            'total': total_pages,
+            'message': f'Testing started in {len(chunks)} shards',
+            'details': dict(
+                {counter: 0 for counter in SHARD_COUNTERS},
+                total_pages=total_pages,
+                shards_total=len(chunks),
+                shards_completed=0
+            )
+        }
+    )
+
+    for index, chunk in enumerate(chunks):
+        work_queue.enqueue(
+            job_id=f"{parent_job_id}_shard_{index:04d}",
+            job_type=JobType.TESTING_SHARD,
+            payload={
+                'parent_job_id': parent_job_id,
+                'shard_index': index,
+                'website_id': website_id,
+                'page_ids': chunk,
+                'website_user_ids': user_ids,
+                'take_screenshot': take_screenshot,
+                'run_ai_analysis': run_ai_analysis,
+                'template_sampling': sampling_plan.to_dict(chunk) if sampling_plan else None
+            },
+            priority=priority,
+            max_attempts=max_attempts,
+            website_id=website_id,
+            project_id=project_id,
+            user_id=user_id,
+            session_id=session_id,
+            metadata={'parent_job_id': parent_job_id, 'shard_index': index},
+            parent_job_id=parent_job_id
+        )
+
+    logger.info(f"Sharded testing job {parent_job_id}: {len(page_ids)} pages in {len(chunks)} shards")
+    return parent
+
+
+def record_shard_progress(job_manager: JobManager, shard_job_id: str, counters: Dict[str, int]):
+    """
+    Store the cumulative progress of a child over all of its testers
+
+    A child tests its pages once per tester with the same job ID, and every
+    pass restarts the job's progress details from zero. The counters stored
+    here carry the finished passes, so the parent's summed progress never
+    goes backwards between passes.
+
+    Args:
+        job_manager: JobManager instance
+        shard_job_id: Child job identifier
+        counters: Counters of the finished passes plus the running one
+    """
+    job_manager.collection.update_one(
+        {'job_id': shard_job_id},
+        {'$set': {'shard_progress': {counter: counters.get(counter, 0) for counter in SHARD_COUNTERS}}}
+    )
+
+
+def shard_counters(child: Dict[str, Any]) -> Dict[str, int]:
+    """Counters of a child job's current pass, read from its progress details"""
+    details = child.get('progress', {}).get('details', {})
+    return {counter: details.get(counter, 0) or 0 for counter in SHARD_COUNTERS}
+
+
+def refresh_parent(job_manager: JobManager, parent_job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Recompute a parent's progress from its children and finish it when they are done
+
+    Safe to call concurrently from several workers: the counters are
+    recomputed from scratch and only one caller wins finalization. A child
+    counts as finished once its status is terminal and no worker holds it,
+    so a failed attempt that the queue is about to retry does not finish
+    the parent.
+
+    Args:
+        job_manager: JobManager instance
+        parent_job_id: Parent job identifier
+
+    Returns:
+        Aggregated progress details, or None if the parent has no children
+    """
+    collection = job_manager.collection
+    children = list(collection.find(
+        {'parent_job_id': parent_job_id},
+        {'status': 1, 'progress.details': 1, 'shard_progress': 1, 'lock_holder': 1,
+         'metadata.shard_index': 1, 'error': 1}
+    ))
+    if not children:
+        return None
+
+    parent = collection.find_one({'job_id': parent_job_id}, {'metadata': 1, 'status': 1, 'website_id': 1})
+    if not parent or parent.get('status') in TERMINAL_STATUSES:
+        return None
+
+    totals = {counter: 0 for counter in SHARD_COUNTERS}
+    statuses = {}
+    current_pages = []
+    finished = 0
+    for child in children:
+        details = child.get('progress', {}).get('details', {})
+        counters = child.get('shard_progress') or shard_counters(child)
+        for counter in SHARD_COUNTERS:
+            totals[counter] += counters.get(counter, 0) or 0
+        status = child.get('status')
+        statuses[status] = statuses.get(status, 0) + 1
+        if status in TERMINAL_STATUSES and not child.get('lock_holder'):
+            finished += 1
+        if status == JobStatus.RUNNING.value and details.get('current_page'):
+            current_pages.append(details['current_page'])
+
+    total_pages = parent.get('metadata', {}).get('total_pages', 0)
+    details = dict(
+        totals,
+        total_pages=total_pages,
+        shards_total=len(children),
+        shards_completed=finished,
+        shards_running=statuses.get(JobStatus.RUNNING.value, 0),
+        current_page=current_pages[0] if current_pages else None
+    )
+
+    if finished < len(children):
+        job_manager.update_job_progress(
+            job_id=parent_job_id,
+            current=totals['pages_tested'],
+            total=total_pages,
+            message=(
+                f"Tested {totals['pages_tested']}/{total_pages} pages "
+                f"({finished}/{len(children)} shards done, {details['shards_running']} running)"
+            ),
+            details=details
+        )
+        return details
+
+    # Every child is finished - make sure only one caller finalizes the parent
+    claimed = collection.find_one_and_update(
+        {'job_id': parent_job_id, 'shards_finalized': {'$ne': True}},
+        {'$set': {'shards_finalized': True, 'updated_at': datetime.now()}}
+    )
+    if not claimed:
+        return details
+
+    _finalize_parent(job_manager, parent_job_id, parent, totals, statuses, children)
+    return details
+
+
+def _finalize_parent(
+    job_manager: JobManager,
+    parent_job_id: str,
+    parent: Dict[str, Any],
+    totals: Dict[str, int],
+    statuses: Dict[str, int],
+    children: List[Dict[str, Any]]
+):
+    """Write the parent's terminal status from its children's outcome"""
+    from auto_a11y.core.testing_job import TestingJob
+
+    testing_job = TestingJob(
+        job_manager=job_manager,
+        website_id=parent.get('website_id'),
+        job_id=parent_job_id
+    )
+
+    failed = statuses.get(JobStatus.FAILED.value, 0)
+    if statuses.get(JobStatus.CANCELLED.value, 0) or job_manager.is_cancellation_requested(parent_job_id):
+        testing_job.set_cancelled()
+    elif failed:
+        errors = [c.get('error') for c in children if c.get('status') == JobStatus.FAILED.value and c.get('error')]
+        testing_job.set_failed(f"{failed} of {len(children)} shards failed: {errors[0] if errors else 'unknown error'}")
+    else:
+        testing_job.set_completed(
+            totals['pages_tested'],
+            totals['pages_passed'],
+            totals['pages_failed'],
+            totals['pages_skipped']
+        )
+
+
+def refresh_open_parents(job_manager: JobManager) -> int:
+    """
+    Refresh every sharded parent that is still running
+
+    Catches parents whose last children were finalized without a worker
+    (e.g. cancelled before being claimed).
+
+    Args:
+        job_manager: JobManager instance
+
+    Returns:
+        Number of parents refreshed
+    """
+    parents = job_manager.collection.find(
+        {
+            'metadata.shard_count': {'$gt': 0},
+            'status': {'$in': [JobStatus.RUNNING.value, JobStatus.CANCELLING.value]}
+        },
+        {'job_id': 1}
+    )
+    count = 0
+    for parent in parents:
+        refresh_parent(job_manager, parent['job_id'])
+        count += 1
+    return count
@@ -0,0 +1,243 @@
+"""
+In-process progress aggregation for database-backed jobs
+
+Testing and discovery jobs report progress on every page. Writing each tick
+straight to the jobs collection multiplies writes by the number of workers,
+so progress is coalesced per job here and flushed at most once per interval.
+The cancellation flag is cached with a short TTL for the same reason.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between progress writes for a single job
+PROGRESS_FLUSH_INTERVAL_MS = int(os.getenv('JOB_PROGRESS_FLUSH_MS', 1000))
+
+# How long a cancellation check result is trusted before re-querying MongoDB
+CANCELLATION_CACHE_TTL_MS = int(os.getenv('JOB_CANCEL_CHECK_TTL_MS', 2000))
+
+# Progress is only written while a job is still active, so a delayed flush
+# can never overwrite the final progress of a completed/failed/cancelled job
+ACTIVE_JOB_STATUSES = ['pending', 'running', 'cancelling']
+
+
+class ProgressAggregator:
+    """
+    Coalesces job progress updates and caches cancellation checks
+
+    The latest progress for every job is also kept in memory with a
+    monotonically increasing version so that server-sent-event streams in the
+    same process can push changes without querying MongoDB.
+    """
+
+    def __init__(
+        self,
+        collection,
+        flush_interval_ms: int = PROGRESS_FLUSH_INTERVAL_MS,
+        cancellation_ttl_ms: int = CANCELLATION_CACHE_TTL_MS
+    ):
+        """
+        Initialize aggregator
+
+        Args:
+            collection: MongoDB jobs collection
+            flush_interval_ms: Minimum milliseconds between writes per job
+            cancellation_ttl_ms: Milliseconds a cached cancellation flag stays valid
+        """
+        self.collection = collection
+        self.flush_interval = max(flush_interval_ms, 0) / 1000.0
+        self.cancellation_ttl = max(cancellation_ttl_ms, 0) / 1000.0
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._last_flush: Dict[str, float] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._cancellation: Dict[str, Tuple[bool, float]] = {}
+        self._version = 0
+
+    def submit(self, job_id: str, progress: Dict[str, Any]) -> bool:
+        """
+        Record a progress update, writing it now or within the flush interval
+
+        Args:
+            job_id: Job identifier
+            progress: Full progress document
+
+        Returns:
+            True if the update was written or buffered successfully
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._store_snapshot(job_id, progress=progress)
+
+            elapsed = now - self._last_flush.get(job_id, 0.0)
+            if elapsed >= self.flush_interval:
+                self._pending.pop(job_id, None)
+                self._cancel_timer(job_id)
+                self._last_flush[job_id] = now
+                write_now = True
+            else:
+                self._pending[job_id] = progress
+                if job_id not in self._timers:
+                    timer = threading.Timer(self.flush_interval - elapsed, self.flush, args=(job_id,))
+                    timer.daemon = True
+                    self._timers[job_id] = timer
+                    timer.start()
+                write_now = False
+
+        if write_now:
+            return self._write(job_id, progress)
+        return True
+
+    def flush(self, job_id: str) -> bool:
+        """
+        Write any buffered progress for a job immediately
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if nothing was pending or the write succeeded
+        """
+        with self._lock:
+            self._cancel_timer(job_id)
+            progress = self._pending.pop(job_id, None)
+            if progress is None:
+                return True
+            self._last_flush[job_id] = time.monotonic()
+
+        return self._write(job_id, progress)
+
+    def flush_all(self):
+        """Write buffered progress for every job"""
+        with self._lock:
+            job_ids = list(self._pending.keys())
+        for job_id in job_ids:
+            self.flush(job_id)
+
+    def discard(self, job_id: str):
+        """
+        Drop buffered progress for a job whose status is being finalized
+
+        Args:
+            job_id: Job identifier
+        """
+        with self._lock:
+            self._cancel_timer(job_id)
+            self._pending.pop(job_id, None)
+            self._last_flush.pop(job_id, None)
+
+    def record_status(self, job_id: str, status: str, progress: Optional[Dict[str, Any]] = None):
+        """
+        Update the in-memory snapshot after a status change written elsewhere
+
+        Args:
+            job_id: Job identifier
+            status: New job status value
+            progress: Progress written along with the status, if any
+        """
+        with self._lock:
+            if status not in ACTIVE_JOB_STATUSES:
+                # Finished jobs are read from the database from now on
+                self._snapshots.pop(job_id, None)
+                self._cancellation.pop(job_id, None)
+                return
+            self._store_snapshot(job_id, status=status, progress=progress)
+            if status == 'cancelling':
+                self._cancellation[job_id] = (True, time.monotonic())
+
+    def get_snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest status and progress known to this process
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Dictionary with version, status and progress, or None if this
+            process never saw the job
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(job_id)
+            return dict(snapshot) if snapshot else None
+
+    def is_cancellation_requested(self, job_id: str, loader: Callable[[str], bool]) -> bool:
+        """
+        Check the cancellation flag, re-querying at most once per TTL
+
+        A positive result is sticky since jobs cannot be un-cancelled.
+
+        Args:
+            job_id: Job identifier
+            loader: Callable that reads the authoritative flag from MongoDB
+
+        Returns:
+            True if cancellation requested
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cancellation.get(job_id)
+        if cached and (cached[0] or now - cached[1] < self.cancellation_ttl):
+            return cached[0]
+
+        requested = loader(job_id)
+        with self._lock:
+            self._cancellation[job_id] = (requested, now)
+            if requested and job_id in self._snapshots:
+                self._store_snapshot(job_id, status='cancelling')
+        return requested
+
+    def mark_cancellation_requested(self, job_id: str):
+        """
+        Set the cached cancellation flag without waiting for the TTL
+
+        Args:
+            job_id: Job identifier
+        """
+        with self._lock:
+            self._cancellation[job_id] = (True, time.monotonic())
+
+    def _store_snapshot(
+        self,
+        job_id: str,
+        status: Optional[str] = None,
+        progress: Optional[Dict[str, Any]] = None
+    ):
+        """Replace the in-memory snapshot for a job (caller must hold the lock)"""
+        previous = self._snapshots.get(job_id, {})
+        self._version += 1
+        self._snapshots[job_id] = {
+            'version': self._version,
+            'status': status or previous.get('status', 'running'),
+            'progress': progress if progress is not None else previous.get('progress', {})
+        }
+
+    def _cancel_timer(self, job_id: str):
+        """Cancel a scheduled flush (caller must hold the lock)"""
+        timer = self._timers.pop(job_id, None)
+        if timer:
+            timer.cancel()
+
+    def _write(self, job_id: str, progress: Dict[str, Any]) -> bool:
+        """Persist progress for a still-active job"""
+        try:
+            self.collection.update_one(
+                {'job_id': job_id, 'status': {'$in': ACTIVE_JOB_STATUSES}},
+                {
+                    '$set': {
+                        'progress': progress,
+                        'updated_at': datetime.now()
+                    }
+                }
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush progress for job {job_id}: {e}")
+            return False
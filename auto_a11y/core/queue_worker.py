@@ -0,0 +1,361 @@
+"""
+Standalone worker process for the durable work queue
+
+Started with ``python run.py worker``. Each worker claims jobs from the
+jobs collection, runs them on its own event loop and keeps their leases
+alive, so discovery and testing can be scaled across processes and machines
+independently of the Flask app.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+from auto_a11y.core.database import Database
+from auto_a11y.core.job_manager import JobManager, JobType
+from auto_a11y.core.job_sharding import (
+    record_shard_progress, refresh_parent, refresh_open_parents, shard_counters, SHARD_COUNTERS
+)
+from auto_a11y.core.template_sampling import SamplingPlan
+from auto_a11y.core.work_queue import WorkQueue, DEFAULT_LEASE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds between roll-ups of shard progress into the parent job
+SHARD_PROGRESS_INTERVAL = 5
+
+TaskHandler = Callable[['QueueWorker', Dict[str, Any]], Awaitable[None]]
+
+# Registered task handlers keyed by task name (JobType value)
+TASK_HANDLERS: Dict[str, TaskHandler] = {}
+
+
+def register_task(name: str):
+    """
+    Decorator registering an async task handler
+
+    Args:
+        name: Task name, normally a JobType value
+    """
+    def decorator(func: TaskHandler) -> TaskHandler:
+        TASK_HANDLERS[name] = func
+        return func
+    return decorator
+
+
+def build_browser_config(config, project=None) -> Dict[str, Any]:
+    """
+    Build browser configuration for a job, applying project overrides
+
+    Args:
+        config: Application configuration object
+        project: Optional project whose stealth/headless settings apply
+
+    Returns:
+        Browser configuration dictionary
+    """
+    browser_config = config.__dict__.copy()
+    if project and project.config:
+        browser_config['stealth_mode'] = project.config.get('stealth_mode', False)
+        headless_setting = project.config.get('headless_browser', 'true')
+        browser_config['BROWSER_HEADLESS'] = (headless_setting == 'true')
+    else:
+        browser_config['stealth_mode'] = False
+    return browser_config
+
+
+class QueueWorker:
+    """
+    Claims and executes queued jobs with bounded concurrency
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        config,
+        concurrency: int = 1,
+        task_types: Optional[List[str]] = None,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS
+    ):
+        """
+        Initialize worker
+
+        Args:
+            database: Database instance
+            config: Application configuration object
+            concurrency: Maximum jobs run at the same time by this process
+            task_types: Task names to accept, or None for all registered tasks
+            worker_id: Unique worker identifier (defaults to host:pid:random)
+            poll_interval: Seconds to wait when the queue is empty
+            lease_seconds: Lease duration, renewed every third of it
+        """
+        self.database = database
+        self.config = config
+        self.concurrency = max(concurrency, 1)
+        self.task_types = task_types or list(TASK_HANDLERS.keys())
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+
+        self.job_manager = JobManager(database)
+        self.queue = WorkQueue(self.job_manager)
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+
+    def run(self):
+        """Run the worker until interrupted"""
+        asyncio.run(self._run())
+
+    def stop(self):
+        """Stop claiming new jobs and release running ones"""
+        if not self._stopping:
+            logger.info(f"Worker {self.worker_id} stopping")
+        self._stopping = True
+
+    async def _run(self):
+        """Main claim loop"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except NotImplementedError:
+                pass
+
+        logger.info(
+            f"Worker {self.worker_id} started: concurrency={self.concurrency}, "
+            f"tasks={', '.join(self.task_types)}"
+        )
+
+        reap_every = max(int(self.lease_seconds / self.poll_interval), 1)
+        iteration = 0
+
+        while not self._stopping:
+            if iteration % reap_every == 0:
+                self.queue.reap()
+                refresh_open_parents(self.job_manager)
+            iteration += 1
+
+            job = None
+            if len(self._running) < self.concurrency:
+                job = self.queue.claim(self.worker_id, self.task_types, self.lease_seconds)
+
+            if job:
+                job_id = job['job_id']
+                task = asyncio.create_task(self._execute(job))
+                self._running[job_id] = task
+                task.add_done_callback(lambda _t, j=job_id: self._running.pop(j, None))
+                continue
+
+            await asyncio.sleep(self.poll_interval)
+
+        # Shutting down - hand unfinished jobs back to the queue
+        for job_id, task in list(self._running.items()):
+            task.cancel()
+        if self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+        self.job_manager.flush_job_progress()
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _execute(self, job: Dict[str, Any]):
+        """Run a claimed job while keeping its lease alive"""
+        job_id = job['job_id']
+        task_name = job['queue']['task']
+        handler = TASK_HANDLERS.get(task_name)
+        heartbeat = None
+
+        try:
+            if not handler:
+                raise ValueError(f"No handler registered for task '{task_name}'")
+            work = asyncio.create_task(handler(self, job))
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, work))
+            await work
+            self.job_manager.flush_job_progress(job_id)
+            self.queue.complete(job_id, self.worker_id)
+        except asyncio.CancelledError:
+            if heartbeat and heartbeat.done() and not heartbeat.cancelled():
+                # The heartbeat stopped the handler: the job may already be
+                # reclaimed, so its outcome belongs to the new holder
+                self.job_manager.flush_job_progress(job_id)
+                return
+            self.queue.release(job_id, self.worker_id)
+            raise
+        except Exception as e:
+            logger.error(f"Job {job_id} raised in worker {self.worker_id}: {e}", exc_info=True)
+            self.job_manager.flush_job_progress(job_id)
+            self.queue.fail(job_id, self.worker_id, str(e))
+        finally:
+            if heartbeat:
+                heartbeat.cancel()
+
+        # Roll a shard up only once the queue has recorded its outcome, so a
+        # failed attempt that will be retried does not finish the parent
+        if job.get('parent_job_id'):
+            refresh_parent(self.job_manager, job['parent_job_id'])
+
+    async def _heartbeat(self, job_id: str, work: asyncio.Task):
+        """Renew the lease until cancelled, stopping the job's handler if the lease is lost"""
+        interval = max(self.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            if not self.queue.heartbeat(job_id, self.worker_id, self.lease_seconds):
+                logger.warning(f"Worker {self.worker_id} lost the lease on job {job_id}, stopping it")
+                work.cancel()
+                return
+
+    def browser_config_for(self, website_id: str) -> Dict[str, Any]:
+        """Browser configuration for the project owning a website"""
+        website = self.database.get_website(website_id)
+        project = self.database.get_project(website.project_id) if website else None
+        return build_browser_config(self.config, project)
+
+
+@register_task(JobType.TESTING.value)
+async def run_testing_task(worker: QueueWorker, job: Dict[str, Any]):
+    """Test pages of a website, once per selected project user"""
+    from auto_a11y.core.website_manager import WebsiteManager
+
+    payload = job['queue']['payload']
+    website_id = payload['website_id']
+    user_ids = payload.get('website_user_ids') or ['']
+    website_manager = WebsiteManager(worker.database, worker.browser_config_for(website_id))
+
+    try:
+        for idx, website_user_id in enumerate(user_ids):
+            if worker.job_manager.is_cancellation_requested(job['job_id']):
+                break
+            await website_manager.test_website(
+                website_id=website_id,
+                page_ids=payload.get('page_ids'),
+                job_id=job['job_id'],
+                user_id=job.get('user_id'),
+                session_id=job.get('session_id'),
+                test_all=payload.get('test_all', False),
+                take_screenshot=payload.get('take_screenshot', True),
+                run_ai_analysis=payload.get('run_ai_analysis'),
+                ai_api_key=getattr(worker.config, 'CLAUDE_API_KEY', None),
+                website_user_id=website_user_id or None,
+                skip_completion=(idx < len(user_ids) - 1)
+            )
+    except Exception:
+        _update_schedule_status(worker, payload, job['job_id'], succeeded=False)
+        raise
+    _update_schedule_status(worker, payload, job['job_id'], succeeded=True)
+
+
+@register_task(JobType.TESTING_SHARD.value)
+async def run_testing_shard_task(worker: QueueWorker, job: Dict[str, Any]):
+    """Test one chunk of a sharded website test and roll progress up to the parent"""
+    from auto_a11y.core.website_manager import WebsiteManager
+
+    payload = job['queue']['payload']
+    parent_job_id = payload['parent_job_id']
+    website_id = payload['website_id']
+    user_ids = payload.get('website_user_ids') or ['']
+    website_manager = WebsiteManager(worker.database, worker.browser_config_for(website_id))
+    # Sampling was planned over the whole website when the test was sharded;
+    # planning again over this chunk would pick other representatives
+    sampling_plan = SamplingPlan.from_dict(payload.get('template_sampling') or {})
+
+    # Counters of the testers already done; every pass restarts the job's
+    # own progress details from zero
+    finished_passes = {counter: 0 for counter in SHARD_COUNTERS}
+
+    def record_progress(pass_finished: bool = False):
+        worker.job_manager.flush_job_progress(job['job_id'])
+        child = worker.job_manager.collection.find_one({'job_id': job['job_id']}, {'progress.details': 1}) or {}
+        current = shard_counters(child)
+        cumulative = {counter: finished_passes[counter] + current[counter] for counter in SHARD_COUNTERS}
+        record_shard_progress(worker.job_manager, job['job_id'], cumulative)
+        if pass_finished:
+            finished_passes.update(cumulative)
+
+    async def report_to_parent():
+        while True:
+            await asyncio.sleep(SHARD_PROGRESS_INTERVAL)
+            record_progress()
+            refresh_parent(worker.job_manager, parent_job_id)
+
+    # A retried attempt starts its progress over
+    record_shard_progress(worker.job_manager, job['job_id'], finished_passes)
+    reporter = asyncio.create_task(report_to_parent())
+    try:
+        for idx, website_user_id in enumerate(user_ids):
+            if worker.job_manager.is_cancellation_requested(job['job_id']):
+                break
+            await website_manager.test_website(
+                website_id=website_id,
+                page_ids=payload['page_ids'],
+                job_id=job['job_id'],
+                user_id=job.get('user_id'),
+                session_id=job.get('session_id'),
+                take_screenshot=payload.get('take_screenshot', True),
+                run_ai_analysis=payload.get('run_ai_analysis'),
+                ai_api_key=getattr(worker.config, 'CLAUDE_API_KEY', None),
+                website_user_id=website_user_id or None,
+                skip_completion=(idx < len(user_ids) - 1),
+                sampling_plan=sampling_plan
+            )
+            record_progress(pass_finished=True)
+    finally:
+        reporter.cancel()
+
+
+@register_task(JobType.DISCOVERY.value)
+async def run_discovery_task(worker: QueueWorker, job: Dict[str, Any]):
+    """Discover pages of a website, once per selected project user"""
+    from auto_a11y.core.website_manager import WebsiteManager
+
+    payload = job['queue']['payload']
+    website_id = payload['website_id']
+    website_manager = WebsiteManager(worker.database, worker.browser_config_for(website_id))
+
+    await website_manager.discover_pages(
+        website_id,
+        max_pages=payload.get('max_pages'),
+        job_id=job['job_id'],
+        user_id=job.get('user_id'),
+        session_id=job.get('session_id'),
+        website_user_ids=payload.get('website_user_ids') or ['']
+    )
+
+
+@register_task(JobType.REPORT_GENERATION.value)
+async def run_report_task(worker: QueueWorker, job: Dict[str, Any]):
+    """Generate a report and record it in the artifact cache"""
+    from auto_a11y.reporting.report_jobs import run_report_job
+
+    payload = job['queue']['payload']
+    # Report generators are synchronous - keep the worker's event loop free
+    await asyncio.to_thread(
+        run_report_job,
+        worker.database,
+        worker.config.__dict__,
+        job['job_id'],
+        payload['spec'],
+        payload['cache_key'],
+        payload['data_version']
+    )
+
+
+def _update_schedule_status(worker: QueueWorker, payload: Dict[str, Any], job_id: str, succeeded: bool):
+    """Record the outcome of a scheduled test run"""
+    schedule_id = payload.get('schedule_id')
+    if not schedule_id:
+        return
+
+    from auto_a11y.models import ScheduleRunStatus
+    try:
+        worker.database.update_test_schedule_run_status(
+            schedule_id=schedule_id,
+            job_id=job_id,
+            status=ScheduleRunStatus.SUCCESS if succeeded else ScheduleRunStatus.FAILED
+        )
+    except Exception as e:
+        logger.error(f"Could not update schedule {schedule_id} run status: {e}")
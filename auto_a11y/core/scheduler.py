@@ -524,8 +524,7 @@ def execute_scheduled_test(schedule_id: str) -> Optional[str]:
             return None
 
         # Get pages to test
-        pages = database.get_pages(schedule.website_id)
-        page_ids = [p.id for p in pages]
+        page_ids = [ref.id for ref in database.iter_page_refs(schedule.website_id)]
 
         if not page_ids:
             logger.warning(f"No pages found for website {schedule.website_id}")
@@ -557,11 +556,36 @@ def execute_scheduled_test(schedule_id: str) -> Optional[str]:
         }
 
         # Get job manager
-        job_manager = JobManager.get_instance(database)
+        job_manager = JobManager(database)
 
         # Process users to test with
         user_ids_to_test = schedule.project_user_ids or ['']  # Empty string = guest
 
+        # Hand the run to a standalone worker instead of blocking this thread
+        if getattr(config, 'JOB_EXECUTION_MODE', 'inline') == 'queue':
+            from auto_a11y.core.job_manager import JobType
+            from auto_a11y.core.work_queue import WorkQueue, PRIORITY_LOW
+
+            WorkQueue(job_manager).enqueue(
+                job_id=job_id,
+                job_type=JobType.TESTING,
+                payload={
+                    'website_id': schedule.website_id,
+                    'page_ids': page_ids,
+                    'website_user_ids': user_ids_to_test,
+                    'test_all': True,
+                    'take_screenshot': test_config.take_screenshots,
+                    'run_ai_analysis': test_config.run_ai_tests and len(ai_page_ids) > 0,
+                    'schedule_id': schedule_id
+                },
+                priority=PRIORITY_LOW,
+                max_attempts=getattr(config, 'JOB_MAX_ATTEMPTS', 3),
+                website_id=schedule.website_id,
+                metadata={'trigger_source': 'scheduled', 'schedule_id': schedule_id}
+            )
+            logger.info(f"Scheduled test for schedule {schedule_id} queued as job {job_id}")
+            return job_id
+
         # Run tests for each user
         async def run_tests():
             for i, user_id in enumerate(user_ids_to_test):
@@ -9,8 +9,6 @@ from urllib.parse import urlparse, urljoin, urlunparse
 from urllib.robotparser import RobotFileParser
 from pathlib import Path
 from datetime import datetime
-import re
-from io import BytesIO
 
 from bs4 import BeautifulSoup
 from playwright.async_api import TimeoutError as PlaywrightTimeout
@@ -20,6 +18,9 @@ from auto_a11y.models.website import Website
 from auto_a11y.models.discovery_run import DiscoveryRun, DiscoveryStatus
 from auto_a11y.core.database import Database
 from auto_a11y.core.browser_manager import BrowserManager
+from auto_a11y.core.document_language import DocumentLanguageService
+from auto_a11y.core.document_registry import DocumentRegistry
+from auto_a11y.core.template_sampling import page_skeleton_signature
 # Note: ScrapingJob class has been moved to scraping_job.py for database-backed implementation
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,9 @@ class ScrapingEngine:
         self.discovered_urls: Set[str] = set()
         self.queued_urls: Set[str] = set()
         self.robots_cache: Dict[str, RobotFileParser] = {}
+        self.document_language = DocumentLanguageService(database.document_language_cache)
+        self.document_languages: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.document_registry = DocumentRegistry(database)
         
     async def discover_website(
         self,
@@ -89,6 +93,7 @@ class ScrapingEngine:
         # Reset discovery state
         self.discovered_urls.clear()
         self.queued_urls.clear()
+        self.document_registry = DocumentRegistry(self.db)
         
         # Parse base URL
         base_url = self._normalize_url(website.url)
@@ -440,7 +445,8 @@ class ScrapingEngine:
                 {'url': p.url, 'error_reason': p.error_reason or 'Unknown error'}
                 for p in failed_pages
             ]
-            discovery_run.documents_found = self.db.document_references.count_documents({'website_id': website.id})
+            self.document_registry.flush()
+            discovery_run.documents_found = self.document_registry.documents_found(website.id)
             discovery_run.duration_seconds = int((discovery_run.completed_at - discovery_run.started_at).total_seconds())
             self.db.update_discovery_run(discovery_run)
             
@@ -455,6 +461,10 @@ class ScrapingEngine:
             if discovered_pages:
                 saved_count = self.db.bulk_create_pages_with_discovery(discovered_pages, discovery_run_id)
                 logger.info(f"Saved {saved_count} pages before error")
+            try:
+                self.document_registry.flush()
+            except Exception as flush_error:
+                logger.error(f"Error saving document references: {flush_error}")
             
             # Update discovery run with error
             discovery_run.completed_at = datetime.now()
@@ -726,6 +736,9 @@ class ScrapingEngine:
                     logger.warning(f"Failed to extract links from {url}: {e}")
                     # Continue without links rather than failing the whole page
 
+            # Fingerprint the page layout so testing can sample pages per template
+            template_signature = await page_skeleton_signature(page)
+
             # Take screenshot during discovery for page preview
             screenshot_path = None
             try:
@@ -761,7 +774,8 @@ class ScrapingEngine:
                 discovered_from=website.url if depth == 0 else None,
                 depth=depth,
                 status=PageStatus.DISCOVERED,
-                screenshot_path=screenshot_path  # Add screenshot from discovery
+                screenshot_path=screenshot_path,  # Add screenshot from discovery
+                template_signature=template_signature
             )
             
             logger.debug(f"Discovered page: {url} - {title}")
@@ -950,7 +964,7 @@ class ScrapingEngine:
     
     async def _save_document_references(self, document_refs: list, website_id: str, referring_page_url: str):
         """
-        Save document references to database with language detection
+        Record document references for the crawl's bulk write, with language detection
         
         Args:
             document_refs: List of document reference data
@@ -981,329 +995,31 @@ class ScrapingEngine:
                     via_redirect=False  # Direct link, not via redirect
                 )
                 
-                self.db.add_document_reference(doc_ref)
+                self.document_registry.add(doc_ref)
                 lang_info = f" ({language['language']})" if language else ""
-                logger.debug(f"Saved document reference: {doc_data['url']} ({'internal' if doc_data['is_internal'] else 'external'}){lang_info}")
+                logger.debug(f"Recorded document reference: {doc_data['url']} ({'internal' if doc_data['is_internal'] else 'external'}){lang_info}")
             except Exception as e:
                 logger.error(f"Error saving document reference {doc_data['url']}: {e}")
     
     async def _detect_document_language(self, doc_url: str, link_text: str = None, file_extension: str = None) -> Optional[Dict[str, Any]]:
         """
-        Detect the language of a document using multiple methods
-        
+        Detect the language of a document, once per crawl
+
         Args:
             doc_url: URL of the document
             link_text: Text of the link to the document
             file_extension: File extension of the document
-            
+
         Returns:
             Dictionary with 'language' code and 'confidence' score, or None
         """
-        import aiohttp
-        
-        try:
-            # Try to fetch document headers and content
-            async with aiohttp.ClientSession() as session:
-                async with session.head(doc_url, timeout=aiohttp.ClientTimeout(total=10), allow_redirects=True) as response:
-                    # 1. Check Content-Language header
-                    content_language = response.headers.get('Content-Language')
-                    if content_language:
-                        # Parse language code (e.g., "en-US" -> "en", "fr-CA" -> "fr")
-                        lang_code = content_language.split('-')[0].lower()
-                        logger.debug(f"Detected language from Content-Language header: {lang_code} for {doc_url}")
-                        return {'language': lang_code, 'confidence': 0.95}
-                    
-                    # For small documents, download and analyze content
-                    content_length = response.headers.get('Content-Length')
-                    if content_length and int(content_length) < 5 * 1024 * 1024:  # Less than 5MB
-                        # Download the document
-                        async with session.get(doc_url, timeout=aiohttp.ClientTimeout(total=15)) as content_response:
-                            content = await content_response.read()
-                            
-                            # 2. Extract metadata based on file type
-                            if file_extension in ['.pdf', 'pdf']:
-                                lang = await self._detect_pdf_language(content)
-                                if lang:
-                                    return lang
-                            elif file_extension in ['.docx', 'docx']:
-                                lang = await self._detect_docx_language(content)
-                                if lang:
-                                    return lang
-                            
-                            # 3. Analyze text content for language patterns
-                            lang = await self._detect_language_from_content(content, file_extension)
-                            if lang:
-                                return lang
-        
-        except Exception as e:
-            logger.debug(f"Error fetching document for language detection: {e}")
-        
-        # 4. Fallback: Analyze URL and link text patterns
-        return self._detect_language_from_patterns(doc_url, link_text)
-    
-    async def _detect_pdf_language(self, content: bytes) -> Optional[Dict[str, Any]]:
-        """
-        Detect language from PDF metadata and content
-        
-        Args:
-            content: PDF file content as bytes
-            
-        Returns:
-            Dictionary with language info or None
-        """
-        try:
-            import PyPDF2
-            
-            pdf_file = BytesIO(content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            # Check PDF metadata
-            if pdf_reader.metadata:
-                # Check for language in metadata
-                if '/Lang' in pdf_reader.metadata:
-                    lang_code = pdf_reader.metadata['/Lang']
-                    if isinstance(lang_code, str):
-                        # Parse language code (e.g., "en-US" -> "en")
-                        lang_code = lang_code.split('-')[0].lower()
-                        logger.debug(f"Detected language from PDF metadata: {lang_code}")
-                        return {'language': lang_code, 'confidence': 0.9}
-            
-            # Extract text from first few pages for analysis
-            text_sample = ""
-            max_pages = min(3, len(pdf_reader.pages))
-            for i in range(max_pages):
-                try:
-                    text_sample += pdf_reader.pages[i].extract_text()
-                    if len(text_sample) > 1000:  # Enough text for analysis
-                        break
-                except:
-                    continue
-            
-            if text_sample:
-                return self._analyze_text_language(text_sample)
-                
-        except Exception as e:
-            logger.debug(f"Error detecting PDF language: {e}")
-        
-        return None
-    
-    async def _detect_docx_language(self, content: bytes) -> Optional[Dict[str, Any]]:
-        """
-        Detect language from Word document metadata and content
-        
-        Args:
-            content: DOCX file content as bytes
-            
-        Returns:
-            Dictionary with language info or None
-        """
-        try:
-            import zipfile
-            import xml.etree.ElementTree as ET
-            
-            # DOCX files are ZIP archives
-            with zipfile.ZipFile(BytesIO(content)) as docx:
-                # Check core properties for language
-                if 'docProps/core.xml' in docx.namelist():
-                    core_xml = docx.read('docProps/core.xml')
-                    root = ET.fromstring(core_xml)
-                    
-                    # Look for dc:language element
-                    for elem in root.iter():
-                        if 'language' in elem.tag.lower():
-                            lang_code = elem.text
-                            if lang_code:
-                                lang_code = lang_code.split('-')[0].lower()
-                                logger.debug(f"Detected language from DOCX metadata: {lang_code}")
-                                return {'language': lang_code, 'confidence': 0.9}
-                
-                # Extract text for analysis
-                if 'word/document.xml' in docx.namelist():
-                    doc_xml = docx.read('word/document.xml')
-                    root = ET.fromstring(doc_xml)
-                    
-                    # Extract text from document
-                    text_sample = ""
-                    for elem in root.iter():
-                        if elem.text:
-                            text_sample += elem.text + " "
-                            if len(text_sample) > 1000:
-                                break
-                    
-                    if text_sample:
-                        return self._analyze_text_language(text_sample)
-                        
-        except Exception as e:
-            logger.debug(f"Error detecting DOCX language: {e}")
-        
-        return None
-    
-    async def _detect_language_from_content(self, content: bytes, file_extension: str = None) -> Optional[Dict[str, Any]]:
-        """
-        Detect language from document content
-        
-        Args:
-            content: Document content as bytes
-            file_extension: File extension for text extraction
-            
-        Returns:
-            Dictionary with language info or None
-        """
-        try:
-            # For text-based files, decode and analyze
-            if file_extension in ['.txt', '.csv', '.rtf', 'txt', 'csv', 'rtf']:
-                # Try different encodings
-                text = None
-                for encoding in ['utf-8', 'latin-1', 'cp1252']:
-                    try:
-                        text = content.decode(encoding)
-                        break
-                    except:
-                        continue
-                
-                if text:
-                    return self._analyze_text_language(text[:5000])  # Analyze first 5000 chars
-                    
-        except Exception as e:
-            logger.debug(f"Error detecting language from content: {e}")
-        
-        return None
-    
-    def _analyze_text_language(self, text: str) -> Optional[Dict[str, Any]]:
-        """
-        Analyze text to detect language using pattern matching
-        
-        Args:
-            text: Text to analyze
-            
-        Returns:
-            Dictionary with language info or None
-        """
-        if not text or len(text) < 50:
-            return None
-        
-        # Clean text
-        text = text.lower().strip()
-        
-        # Language-specific patterns and common words
-        language_patterns = {
-            'en': {
-                'words': ['the', 'and', 'of', 'to', 'in', 'is', 'for', 'with', 'that', 'this', 
-                         'are', 'was', 'will', 'have', 'been', 'from', 'can', 'which', 'their', 'would'],
-                'patterns': [r'\b(the|and|of|to|in)\b', r'\b(is|are|was|were)\b', r'\b(have|has|had)\b'],
-                'weight': 1.0
-            },
-            'fr': {
-                'words': ['le', 'la', 'les', 'de', 'et', 'est', 'pour', 'dans', 'avec', 'sur',
-                         'une', 'des', 'que', 'qui', 'par', 'plus', 'sont', 'être', 'avoir', 'faire'],
-                'patterns': [r'\b(le|la|les|un|une|des)\b', r'\b(de|du|des)\b', r'\b(est|sont|être)\b',
-                           r'[àâäéèêëïîôùûü]'],  # French accented characters
-                'weight': 1.2  # Slight boost for French since it's a priority
-            },
-            'es': {
-                'words': ['el', 'la', 'de', 'y', 'en', 'que', 'es', 'por', 'con', 'para',
-                         'los', 'las', 'una', 'se', 'del', 'al', 'más', 'pero', 'su', 'lo'],
-                'patterns': [r'\b(el|la|los|las)\b', r'\b(de|del)\b', r'\b(es|son|está|están)\b',
-                           r'[áéíóúñü]'],  # Spanish accented characters
-                'weight': 1.0
-            },
-            'de': {
-                'words': ['der', 'die', 'das', 'und', 'in', 'ist', 'mit', 'auf', 'für', 'von',
-                         'den', 'des', 'ein', 'eine', 'sich', 'zu', 'werden', 'haben', 'sein', 'ihr'],
-                'patterns': [r'\b(der|die|das|den|dem)\b', r'\b(ein|eine|einen)\b', r'\b(ist|sind|war|waren)\b',
-                           r'[äöüß]'],  # German special characters
-                'weight': 1.0
-            }
-        }
-        
-        scores = {}
-        
-        for lang, config in language_patterns.items():
-            score = 0
-            word_count = 0
-            
-            # Count occurrences of common words
-            for word in config['words']:
-                count = text.count(f' {word} ') + text.count(f' {word}.') + text.count(f' {word},')
-                if count > 0:
-                    word_count += count
-                    score += count * config['weight']
-            
-            # Check patterns
-            for pattern in config['patterns']:
-                matches = len(re.findall(pattern, text))
-                if matches > 0:
-                    score += matches * 0.5 * config['weight']
-            
-            # Normalize score by text length
-            scores[lang] = score / (len(text) / 100)
-        
-        # Get the language with highest score
-        if scores:
-            best_lang = max(scores, key=scores.get)
-            best_score = scores[best_lang]
-            
-            # Calculate confidence based on score differential
-            sorted_scores = sorted(scores.values(), reverse=True)
-            if len(sorted_scores) > 1:
-                confidence = min(0.85, 0.5 + (sorted_scores[0] - sorted_scores[1]) / 10)
-            else:
-                confidence = 0.7
-            
-            # Only return if score is significant
-            if best_score > 0.5:
-                logger.debug(f"Detected language from text analysis: {best_lang} (confidence: {confidence:.2f})")
-                return {'language': best_lang, 'confidence': confidence}
-        
-        return None
-    
-    def _detect_language_from_patterns(self, url: str, link_text: str = None) -> Optional[Dict[str, Any]]:
-        """
-        Detect language from URL patterns and link text as fallback
-        
-        Args:
-            url: Document URL
-            link_text: Link text
-            
-        Returns:
-            Dictionary with language info or None
-        """
-        # URL patterns that indicate language
-        url_patterns = {
-            'fr': ['/fr/', '_fr', '-fr', 'french', 'francais', 'français'],
-            'en': ['/en/', '_en', '-en', 'english', 'anglais'],
-            'es': ['/es/', '_es', '-es', 'spanish', 'espanol', 'español'],
-            'de': ['/de/', '_de', '-de', 'german', 'deutsch', 'allemand']
-        }
-        
-        url_lower = url.lower()
-        
-        for lang, patterns in url_patterns.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    logger.debug(f"Detected language from URL pattern: {lang}")
-                    return {'language': lang, 'confidence': 0.6}
-        
-        # Check link text for language indicators
-        if link_text:
-            link_lower = link_text.lower()
-            
-            # French indicators
-            if any(word in link_lower for word in ['français', 'francais', 'french', 'version française']):
-                return {'language': 'fr', 'confidence': 0.7}
-            
-            # English indicators
-            if any(word in link_lower for word in ['english', 'anglais', 'version anglaise']):
-                return {'language': 'en', 'confidence': 0.7}
-            
-            # Analyze link text itself
-            lang_result = self._analyze_text_language(link_text)
-            if lang_result:
-                lang_result['confidence'] *= 0.7  # Lower confidence for short text
-                return lang_result
-        
-        return None
-    
+        # Documents linked from many pages are only analyzed the first time
+        if doc_url not in self.document_languages:
+            self.document_languages[doc_url] = await self.document_language.detect(
+                doc_url, link_text, file_extension
+            )
+        return self.document_languages[doc_url]
+
     def _normalize_url(self, url: str, base_url: Optional[str] = None) -> Optional[str]:
         """
         Normalize and validate URL
@@ -1423,7 +1139,8 @@ class ScrapingEngine:
             return None
 
     async def cleanup(self):
-        """Clean up browser resources"""
+        """Clean up browser and document language resources"""
+        await self.document_language.close()
         if self.browser_manager:
             await self.browser_manager.stop()
 
@@ -46,9 +46,14 @@ class ScrapingJob:
         self.session_id = session_id
         self.website_user_ids = website_user_ids or ['']  # Default to guest only
 
-        # Create job in database
+        # Create job in database, or reuse it if it was enqueued for a worker
         logger.info(f"Creating job {job_id} in database for {len(self.website_user_ids)} users...")
         try:
+            existing_job = job_manager.get_job(job_id)
+            if existing_job:
+                logger.info(f"Job {job_id} already exists, reusing it")
+                self.job_doc = existing_job
+                return
             self.job_doc = job_manager.create_job(
                 job_id=job_id,
                 job_type=JobType.DISCOVERY,
@@ -68,7 +73,7 @@ class ScrapingJob:
     
     def is_cancelled(self) -> bool:
         """
-        Check if job is cancelled by querying database
+        Check if job is cancelled (cached briefly by the job manager)
         
         Returns:
             True if cancellation requested
@@ -181,6 +186,8 @@ class ScrapingJob:
     
     def set_cancelled(self):
         """Mark job as cancelled"""
+        # Make sure the last buffered progress is in the database before reading it
+        self.job_manager.flush_job_progress(self.job_id)
         job = self.job_manager.get_job(self.job_id)
         if job:
             pages_found = job.get('progress', {}).get('details', {}).get('pages_found', 0)
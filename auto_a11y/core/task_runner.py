@@ -1,6 +1,7 @@
 """
 Simple async task runner for background jobs
-In production, this would be replaced with Celery or similar
+Runs jobs inside the web process; set JOB_EXECUTION_MODE=queue to hand
+discovery and testing to durable workers (see core.work_queue) instead
 """
 
 import asyncio
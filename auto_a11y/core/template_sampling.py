@@ -0,0 +1,387 @@
+"""
+Template-aware sampling of large websites
+
+CMS-driven sites render most of their pages from a handful of templates, so
+the same template-level findings are reported on thousands of pages. During
+discovery each page gets a template signature: a hash of its DOM skeleton
+(tags and roles, without text, classes or repeated siblings). When sampling
+is enabled for a project, a testing job runs the full suite (multi-state,
+AI, every touchpoint) on a few representatives per template cluster and a
+lightweight touchpoint subset on the other pages of the cluster. Reports
+attribute the representatives' remaining findings to the cluster, labelled
+as extrapolated.
+"""
+
+import hashlib
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pages tested with the full suite in each template cluster
+DEFAULT_REPRESENTATIVES = 2
+
+# Touchpoints run on the other pages of a cluster. Content-dependent checks
+# stay per page; layout, contrast, focus and interaction checks are taken
+# from the representatives. The IDs are shared by the touchpoint tests and
+# the issues they report.
+DEFAULT_LIGHT_TOUCHPOINTS = [
+    'page', 'language', 'headings', 'images', 'links',
+    'buttons', 'forms', 'accessible_names', 'landmarks'
+]
+
+ROLE_REPRESENTATIVE = 'representative'
+ROLE_SAMPLED = 'sampled'
+
+# Finding lists of a test result that are extrapolated from representatives
+EXTRAPOLATED_KINDS = ('violations', 'warnings', 'ai_findings')
+
+# DOM skeleton of the page body. Text, attributes other than role, and
+# consecutive repeated siblings are dropped so that pages rendered from the
+# same template produce the same skeleton whatever their content. Inside
+# main content regions only the first levels are kept, since article bodies
+# vary from page to page.
+SKELETON_SCRIPT = '''
+() => {
+    const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'LINK', 'META', 'BR', 'WBR']);
+    const OPAQUE = new Set(['SVG', 'IFRAME', 'VIDEO', 'AUDIO', 'CANVAS', 'PICTURE', 'SELECT']);
+    const MAX_DEPTH = 10;
+    const CONTENT_DEPTH = 2;
+
+    const isContent = el => el.tagName === 'MAIN' || el.tagName === 'ARTICLE' ||
+        el.getAttribute('role') === 'main';
+
+    const skeleton = (el, depth, contentDepth) => {
+        const role = el.getAttribute('role');
+        let label = el.tagName.toLowerCase() + (role ? '[' + role + ']' : '');
+        if (depth >= MAX_DEPTH || contentDepth === 0 || OPAQUE.has(el.tagName)) {
+            return label;
+        }
+        const nextContent = contentDepth !== null ? contentDepth - 1 : (isContent(el) ? CONTENT_DEPTH : null);
+        const children = [];
+        for (const child of el.children) {
+            if (SKIP.has(child.tagName)) continue;
+            const part = skeleton(child, depth + 1, nextContent);
+            if (children[children.length - 1] !== part) children.push(part);
+        }
+        return children.length ? label + '(' + children.join(',') + ')' : label;
+    };
+
+    return document.body ? skeleton(document.body, 0, null) : '';
+}
+'''
+
+
+async def page_skeleton_signature(page) -> Optional[str]:
+    """
+    Compute the template signature of a loaded page
+
+    Args:
+        page: Playwright page
+
+    Returns:
+        Short hash of the page's DOM skeleton, or None if it could not be read
+    """
+    try:
+        skeleton = await page.evaluate(SKELETON_SCRIPT)
+    except Exception as e:
+        logger.debug(f"Could not read DOM skeleton: {e}")
+        return None
+    if not skeleton:
+        return None
+    return hashlib.sha1(skeleton.encode('utf-8')).hexdigest()[:16]
+
+
+def get_sampling_settings(project_config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Read the template sampling settings of a project
+
+    Args:
+        project_config: Project configuration dictionary
+
+    Returns:
+        Settings with 'representatives' and 'light_touchpoints', or None if
+        sampling is disabled for the project
+    """
+    settings = (project_config or {}).get('template_sampling') or {}
+    if not settings.get('enabled'):
+        return None
+    try:
+        representatives = max(1, int(settings.get('representatives', DEFAULT_REPRESENTATIVES)))
+    except (TypeError, ValueError):
+        representatives = DEFAULT_REPRESENTATIVES
+    return {
+        'representatives': representatives,
+        'light_touchpoints': list(settings.get('light_touchpoints') or DEFAULT_LIGHT_TOUCHPOINTS)
+    }
+
+
+def parse_light_touchpoints(values: Iterable[str]) -> List[str]:
+    """
+    Light touchpoint subset chosen in the project form
+
+    Args:
+        values: Submitted touchpoint IDs
+
+    Returns:
+        The known touchpoint IDs among the values, or the default subset if none
+    """
+    from auto_a11y.testing.touchpoint_tests import TOUCHPOINT_TESTS
+
+    touchpoints = [value for value in dict.fromkeys(values) if value in TOUCHPOINT_TESTS]
+    return touchpoints or list(DEFAULT_LIGHT_TOUCHPOINTS)
+
+
+def light_touchpoint_choices() -> List[str]:
+    """Touchpoint IDs that can be part of the light subset"""
+    from auto_a11y.testing.touchpoint_tests import TOUCHPOINT_TESTS
+
+    return sorted(TOUCHPOINT_TESTS)
+
+
+@dataclass
+class TemplateCluster:
+    """Pages sharing a template signature"""
+    signature: str
+    size: int = 0
+    representative_ids: List[str] = field(default_factory=list)
+    representative_urls: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SamplingPlan:
+    """Which pages of a testing job get the full suite and which the light subset"""
+    clusters: Dict[str, TemplateCluster]
+    light_touchpoints: List[str]
+    page_clusters: Dict[str, str] = field(default_factory=dict)  # page ID -> signature
+
+    def is_light(self, page_id: str) -> bool:
+        """Whether a page is tested with the light touchpoint subset only"""
+        cluster = self.cluster_for(page_id)
+        return cluster is not None and page_id not in cluster.representative_ids
+
+    def cluster_for(self, page_id: str) -> Optional[TemplateCluster]:
+        """Sampled cluster of a page, or None if the page is tested in full on its own"""
+        signature = self.page_clusters.get(page_id)
+        return self.clusters.get(signature) if signature else None
+
+    @property
+    def light_page_count(self) -> int:
+        return sum(cluster.size - len(cluster.representative_ids) for cluster in self.clusters.values())
+
+    def result_metadata(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Test result metadata describing how a page was sampled
+
+        Args:
+            page_id: Page ID
+
+        Returns:
+            Metadata for result.metadata['template_sampling'], or None for pages
+            outside any sampled cluster
+        """
+        cluster = self.cluster_for(page_id)
+        if cluster is None:
+            return None
+        return {
+            'role': ROLE_SAMPLED if self.is_light(page_id) else ROLE_REPRESENTATIVE,
+            'template_signature': cluster.signature,
+            'cluster_size': cluster.size,
+            'representatives': cluster.representative_urls,
+            'light_touchpoints': list(self.light_touchpoints)
+        }
+
+    def to_dict(self, page_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        JSON-serializable form of the plan
+
+        Args:
+            page_ids: Keep only the part of the plan covering these pages,
+                e.g. the pages of one shard of a sharded test
+
+        Returns:
+            Dictionary accepted by from_dict
+        """
+        if page_ids is None:
+            page_clusters = dict(self.page_clusters)
+        else:
+            page_clusters = {
+                page_id: self.page_clusters[page_id] for page_id in page_ids if page_id in self.page_clusters
+            }
+        return {
+            'light_touchpoints': list(self.light_touchpoints),
+            'page_clusters': page_clusters,
+            'clusters': {
+                signature: asdict(self.clusters[signature]) for signature in set(page_clusters.values())
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SamplingPlan':
+        """Rebuild a plan from to_dict; an empty dictionary gives a plan sampling nothing"""
+        return cls(
+            clusters={
+                signature: TemplateCluster(**cluster) for signature, cluster in (data.get('clusters') or {}).items()
+            },
+            light_touchpoints=list(data.get('light_touchpoints') or DEFAULT_LIGHT_TOUCHPOINTS),
+            page_clusters=dict(data.get('page_clusters') or {})
+        )
+
+
+def plan_template_sampling(
+    page_refs: Iterable[Any],
+    representatives: int = DEFAULT_REPRESENTATIVES,
+    light_touchpoints: Optional[List[str]] = None
+) -> SamplingPlan:
+    """
+    Group pages by template signature and pick the representatives of each cluster
+
+    Pages without a signature, and clusters no larger than the number of
+    representatives, are tested in full and left out of the plan. The first
+    pages of a cluster in the given order (discovery order for a website)
+    are its representatives, so repeated runs pick the same pages.
+
+    Args:
+        page_refs: Page references with id, url and template_signature
+        representatives: Pages tested with the full suite per cluster
+        light_touchpoints: Touchpoints run on the other pages
+
+    Returns:
+        Sampling plan
+    """
+    grouped: Dict[str, TemplateCluster] = {}
+    members: Dict[str, List[str]] = {}
+    for ref in page_refs:
+        signature = getattr(ref, 'template_signature', None)
+        if not signature:
+            continue
+        cluster = grouped.setdefault(signature, TemplateCluster(signature=signature))
+        cluster.size += 1
+        members.setdefault(signature, []).append(ref.id)
+        if len(cluster.representative_ids) < representatives:
+            cluster.representative_ids.append(ref.id)
+            cluster.representative_urls.append(ref.url)
+
+    plan = SamplingPlan(clusters={}, light_touchpoints=list(light_touchpoints or DEFAULT_LIGHT_TOUCHPOINTS))
+    for signature, cluster in grouped.items():
+        if cluster.size <= representatives:
+            continue
+        plan.clusters[signature] = cluster
+        for page_id in members[signature]:
+            plan.page_clusters[page_id] = signature
+
+    logger.info(
+        f"Template sampling: {len(plan.clusters)} clusters, "
+        f"{plan.light_page_count} pages get the light subset"
+    )
+    return plan
+
+
+def restrict_touchpoints(test_config, touchpoints: List[str]):
+    """
+    Disable every touchpoint outside a subset in a test configuration
+
+    Args:
+        test_config: TestConfiguration to update in place
+        touchpoints: Touchpoint IDs to keep
+    """
+    from auto_a11y.testing.touchpoint_tests import TOUCHPOINT_TESTS
+
+    # Copied, since the touchpoint settings may be the project's own dictionary
+    configured = dict(test_config.config.get('touchpoints') or {})
+    keep = set(touchpoints)
+    for touchpoint_id in set(TOUCHPOINT_TESTS) | set(configured):
+        if touchpoint_id not in keep:
+            configured[touchpoint_id] = dict(configured.get(touchpoint_id) or {}, enabled=False)
+    test_config.config['touchpoints'] = configured
+
+
+def sampling_metadata(test_result) -> Dict[str, Any]:
+    """Template sampling metadata of a test result, empty if the page was not sampled"""
+    metadata = test_result.get('metadata') if isinstance(test_result, dict) else getattr(test_result, 'metadata', None)
+    return (metadata or {}).get('template_sampling') or {}
+
+
+def representative_findings(test_result, light_touchpoints: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Findings of a representative that were not looked for on the light-tested pages
+
+    Violations and warnings from touchpoints outside the light subset, and
+    AI findings, are only tested on the representatives of a cluster.
+
+    Args:
+        test_result: Test result of a template representative
+        light_touchpoints: Touchpoints run on the other pages of the cluster
+
+    Yields:
+        (kind, finding dictionary) where kind is one of EXTRAPOLATED_KINDS
+    """
+    light = set(light_touchpoints)
+    for kind in EXTRAPOLATED_KINDS:
+        for item in getattr(test_result, kind, None) or []:
+            if hasattr(item, 'to_dict'):
+                item = item.to_dict()
+            elif not isinstance(item, dict):
+                continue
+            if kind != 'ai_findings' and item.get('touchpoint', item.get('category', '')) in light:
+                continue
+            yield kind, item
+
+
+class TemplateExtrapolation:
+    """
+    Attributes template representatives' findings to the light-tested pages of their cluster
+
+    Representative results are read once and shared by every page of the
+    template, so one instance should be used for a whole report.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._results: Dict[Tuple[str, str], Any] = {}
+
+    def _representative_result(self, website_id: str, url: str):
+        key = (website_id, url)
+        if key not in self._results:
+            page = self.db.get_page_by_url(website_id, url)
+            self._results[key] = self.db.get_latest_test_result(page.id) if page else None
+        return self._results[key]
+
+    def findings_for(self, website_id: str, test_result) -> Optional[Dict[str, Any]]:
+        """
+        Template sampling details of a page for reports
+
+        Args:
+            website_id: ID of the page's website
+            test_result: Latest test result of the page
+
+        Returns:
+            The page's sampling metadata, or None for pages outside any sampled
+            cluster. For light-tested pages, 'violations', 'warnings' and
+            'ai_findings' list the representatives' findings, each labelled
+            with 'extrapolated_from' (the representative URL).
+        """
+        sampling = sampling_metadata(test_result)
+        if not sampling:
+            return None
+        details = dict(sampling, **{kind: [] for kind in EXTRAPOLATED_KINDS})
+        if sampling.get('role') != ROLE_SAMPLED:
+            return details
+
+        seen = set()
+        for url in sampling.get('representatives') or []:
+            result = self._representative_result(website_id, url)
+            if result is None:
+                continue
+            for kind, finding in representative_findings(result, sampling.get('light_touchpoints') or []):
+                # Representatives of one template mostly report the same findings
+                if kind == 'ai_findings':
+                    key = (kind, finding.get('type'), finding.get('description'))
+                else:
+                    key = (kind, finding.get('id'), finding.get('xpath'))
+                if key in seen:
+                    continue
+                seen.add(key)
+                details[kind].append(dict(finding, extrapolated_from=url))
+        return details
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 from auto_a11y.core.job_manager import JobManager, JobType, JobStatus
 from auto_a11y.core.database import Database
+from auto_a11y.core.template_sampling import SamplingPlan, get_sampling_settings, plan_template_sampling
 from auto_a11y.models import Page, PageStatus
 
 logger = logging.getLogger(__name__)
@@ -88,7 +89,7 @@ class TestingJob:
     
     def is_cancelled(self) -> bool:
         """
-        Check if job is cancelled by querying database
+        Check if job is cancelled (cached briefly by the job manager)
         
         Returns:
             True if cancellation requested
@@ -244,6 +245,8 @@ class TestingJob:
     
     def set_cancelled(self):
         """Mark job as cancelled"""
+        # Make sure the last buffered progress is in the database before reading it
+        self.job_manager.flush_job_progress(self.job_id)
         job = self.job_manager.get_job(self.job_id)
         if job:
             details = job.get('progress', {}).get('details', {})
@@ -277,7 +280,8 @@ class TestingJob:
         take_screenshot: bool = True,
         run_ai_analysis: Optional[bool] = None,
         ai_api_key: Optional[str] = None,
-        skip_completion: bool = False
+        skip_completion: bool = False,
+        sampling_plan: Optional[SamplingPlan] = None
     ):
         """
         Run the testing job
@@ -289,6 +293,9 @@ class TestingJob:
             run_ai_analysis: Whether to run AI analysis
             ai_api_key: API key for AI analysis
             skip_completion: If True, don't mark job as completed (for multi-user testing)
+            sampling_plan: Template sampling planned by the caller over more
+                pages than this job tests (one shard of a sharded test); when
+                None it is planned here from the project settings
         """
         from auto_a11y.testing import TestRunner
 
@@ -314,25 +321,36 @@ class TestingJob:
             else:
                 self.set_user_label("Guest")
             
-            # Get pages to test
+            # Get pages to test as lightweight references; each full page is
+            # loaded only when its turn comes so large sites stay in bounded memory
             if self.test_all:
-                pages = database.get_pages(self.website_id)
-                # Filter out pages that are currently being tested
-                testable_pages = [p for p in pages if p.status != PageStatus.TESTING]
+                page_refs = database.iter_page_refs(self.website_id)
             elif self.page_ids:
-                testable_pages = []
-                for page_id in self.page_ids:
-                    page = database.get_page(page_id)
-                    if page and page.status != PageStatus.TESTING:
-                        testable_pages.append(page)
+                page_refs = database.get_page_refs(self.page_ids)
             else:
                 raise ValueError("No pages specified for testing")
+
+            # Filter out pages that are currently being tested
+            testable_pages = [ref for ref in page_refs if ref.status != PageStatus.TESTING]
             
             if not testable_pages:
                 logger.warning(f"No testable pages found for job {self.job_id}")
                 self.set_completed(0, 0, 0, 0)
                 return
             
+            # Template sampling: full suite on each cluster's representatives,
+            # light touchpoint subset on the rest. Representatives go first so
+            # their findings exist even if the job is cancelled part way.
+            if sampling_plan is None:
+                project = database.get_project(website.project_id)
+                sampling = get_sampling_settings(project.config if project else None)
+                if sampling:
+                    sampling_plan = plan_template_sampling(
+                        testable_pages, sampling['representatives'], sampling['light_touchpoints']
+                    )
+            if sampling_plan:
+                testable_pages.sort(key=lambda ref: sampling_plan.is_light(ref.id))
+            
             # Mark as running
             self.set_running(len(testable_pages))
             logger.info(f"Job {self.job_id} marked as running with {len(testable_pages)} pages to test")
@@ -347,12 +365,18 @@ class TestingJob:
             pages_skipped = 0
             
             # Test each page
-            for i, page in enumerate(testable_pages):
+            for i, page_ref in enumerate(testable_pages):
                 # Check for cancellation
                 if self.is_cancelled():
                     logger.info(f"Testing job {self.job_id} was cancelled")
                     self.set_cancelled()
                     return
+
+                page = database.get_page(page_ref.id)
+                if not page:
+                    logger.warning(f"Page {page_ref.id} was deleted before it could be tested")
+                    pages_skipped += 1
+                    continue
                 
                 # Update progress BEFORE testing to show current page
                 user_label = self._get_user_label()
@@ -372,16 +396,34 @@ class TestingJob:
                 database.update_page(page)
                 
                 try:
-                    # Test the page with multi-state support
-                    logger.info(f"Testing page {i+1}/{len(testable_pages)}: {page.url}")
-                    test_results_list = await test_runner.test_page_multi_state(
-                        page=page,
-                        enable_multi_state=True,
-                        take_screenshot=take_screenshot,
-                        run_ai_analysis=run_ai_analysis,
-                        ai_api_key=ai_api_key,
-                        website_user_id=self.website_user_id
-                    )
+                    sampling_metadata = sampling_plan.result_metadata(page.id) if sampling_plan else None
+                    result_metadata = {'template_sampling': sampling_metadata} if sampling_metadata else None
+
+                    if sampling_plan and sampling_plan.is_light(page.id):
+                        # Same template as already tested representatives: light subset only
+                        logger.info(f"Testing page {i+1}/{len(testable_pages)} with the template subset: {page.url}")
+                        test_result = await test_runner.test_page(
+                            page=page,
+                            take_screenshot=take_screenshot,
+                            run_ai_analysis=False,
+                            ai_api_key=ai_api_key,
+                            website_user_id=self.website_user_id,
+                            touchpoints=sampling_plan.light_touchpoints,
+                            result_metadata=result_metadata
+                        )
+                        test_results_list = [test_result]
+                    else:
+                        # Test the page with multi-state support
+                        logger.info(f"Testing page {i+1}/{len(testable_pages)}: {page.url}")
+                        test_results_list = await test_runner.test_page_multi_state(
+                            page=page,
+                            enable_multi_state=True,
+                            take_screenshot=take_screenshot,
+                            run_ai_analysis=run_ai_analysis,
+                            ai_api_key=ai_api_key,
+                            website_user_id=self.website_user_id,
+                            result_metadata=result_metadata
+                        )
 
                     # test_page_multi_state returns List[TestResult]
                     # Use the last result (final state) for page status
@@ -12,6 +12,7 @@ from auto_a11y.core.database import Database
 from auto_a11y.core.scraper import ScrapingEngine
 from auto_a11y.core.scraping_job import ScrapingJob
 from auto_a11y.core.testing_job import TestingJob
+from auto_a11y.core.template_sampling import SamplingPlan
 from auto_a11y.core.job_manager import JobManager, JobType
 
 logger = logging.getLogger(__name__)
@@ -311,7 +312,8 @@ class WebsiteManager:
         run_ai_analysis: Optional[bool] = None,
         ai_api_key: Optional[str] = None,
         website_user_id: Optional[str] = None,
-        skip_completion: bool = False
+        skip_completion: bool = False,
+        sampling_plan: Optional[SamplingPlan] = None
     ) -> TestingJob:
         """
         Start testing for website pages
@@ -328,6 +330,8 @@ class WebsiteManager:
             ai_api_key: API key for AI analysis
             website_user_id: Optional WebsiteUser ID for authenticated testing
             skip_completion: If True, don't mark job as completed (for multi-user testing)
+            sampling_plan: Template sampling planned for a whole sharded test
+                (see TestingJob.run)
 
         Returns:
             Testing job
@@ -367,7 +371,8 @@ class WebsiteManager:
             take_screenshot=take_screenshot,
             run_ai_analysis=run_ai_analysis,
             ai_api_key=ai_api_key,
-            skip_completion=skip_completion
+            skip_completion=skip_completion,
+            sampling_plan=sampling_plan
         )
         logger.info(f"Testing job.run completed for {job_id}")
         
@@ -423,16 +428,14 @@ class WebsiteManager:
                 
                 # Get pages to test
                 if test_all:
-                    pages = self.db.get_pages(website.id)
+                    page_ids = [ref.id for ref in self.db.iter_page_refs(website.id)]
                 else:
-                    pages = self.db.get_untested_pages(website.id)
+                    page_ids = [p.id for p in self.db.get_untested_pages(website.id)]
                 
-                if not pages:
+                if not page_ids:
                     logger.info(f"No pages to test for website {website.id}")
                     continue
                 
-                page_ids = [p.id for p in pages]
-                
                 # Start async test for this website
                 job = await self.test_website(
                     website_id=website.id,
@@ -0,0 +1,360 @@
+"""
+Durable work queue backed by the jobs collection
+
+Queued jobs are ordinary job documents with an extra ``queue`` sub-document
+describing the task to run. Workers claim them with an atomic
+find-and-modify that sets the same ``lock_holder``/``lock_expiry`` fields used
+by ``JobManager.acquire_job_lock``, keep the lease alive with heartbeats, and
+either release, retry or fail the job when they finish. A job whose worker
+dies is picked up again once its lease expires.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List
+
+from pymongo import ReturnDocument
+
+from auto_a11y.core.job_manager import JobManager, JobType, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+# Priorities - higher values are claimed first
+PRIORITY_HIGH = 10
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 0
+
+DEFAULT_LEASE_SECONDS = 120
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 30
+
+
+class WorkQueue:
+    """
+    Priority work queue with leases, heartbeats and retries
+    """
+
+    def __init__(self, job_manager: JobManager):
+        """
+        Initialize work queue
+
+        Args:
+            job_manager: JobManager instance owning the jobs collection
+        """
+        self.job_manager = job_manager
+        self.collection = job_manager.collection
+
+    def enqueue(
+        self,
+        job_id: str,
+        job_type: JobType,
+        payload: Dict[str, Any],
+        priority: int = PRIORITY_NORMAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        website_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        parent_job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a job and make it available to workers
+
+        Args:
+            job_id: Unique job identifier
+            job_type: Type of job, also used as the task name
+            payload: JSON-serializable arguments for the task handler
+            priority: Claim priority (higher first)
+            max_attempts: Attempts before the job is marked failed
+            website_id: Associated website ID
+            project_id: Associated project ID
+            user_id: User who initiated the job
+            session_id: Session ID for tracking
+            metadata: Additional job metadata
+            parent_job_id: Parent job if this job is one shard of a larger job
+
+        Returns:
+            Created job document
+        """
+        job_doc = self.job_manager.create_job(
+            job_id=job_id,
+            job_type=job_type,
+            website_id=website_id,
+            project_id=project_id,
+            user_id=user_id,
+            session_id=session_id,
+            metadata=metadata,
+            queue={
+                'task': job_type.value,
+                'payload': payload,
+                'priority': priority,
+                'attempts': 0,
+                'max_attempts': max_attempts,
+                'available_at': datetime.now(),
+                'heartbeat_at': None,
+                'last_error': None
+            },
+            parent_job_id=parent_job_id
+        )
+        logger.info(f"Enqueued {job_type.value} job {job_id} with priority {priority}")
+        return job_doc
+
+    def claim(
+        self,
+        worker_id: str,
+        task_types: Optional[List[str]] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Atomically claim the next available job
+
+        Pending jobs and running jobs whose lease has expired (crashed worker)
+        are both eligible, highest priority and oldest first.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            task_types: Restrict to these task names, or None for all
+            lease_seconds: Lease duration
+
+        Returns:
+            Claimed job document or None if the queue is empty
+        """
+        now = datetime.now()
+        query = {
+            'queue.task': {'$in': task_types} if task_types else {'$exists': True},
+            'cancellation_requested': {'$ne': True},
+            'queue.available_at': {'$lte': now},
+            '$expr': {'$lt': ['$queue.attempts', '$queue.max_attempts']},
+            '$or': [
+                {'status': JobStatus.PENDING.value, 'lock_holder': None},
+                {
+                    'status': {'$in': [JobStatus.PENDING.value, JobStatus.RUNNING.value]},
+                    'lock_expiry': {'$lt': now}
+                }
+            ]
+        }
+
+        job = self.collection.find_one_and_update(
+            query,
+            {
+                '$set': {
+                    'lock_holder': worker_id,
+                    'lock_acquired_at': now,
+                    'lock_expiry': now + timedelta(seconds=lease_seconds),
+                    'queue.heartbeat_at': now,
+                    'updated_at': now
+                },
+                '$inc': {'queue.attempts': 1}
+            },
+            sort=[('queue.priority', -1), ('created_at', 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+        if job:
+            logger.info(
+                f"Worker {worker_id} claimed job {job['job_id']} "
+                f"(attempt {job['queue']['attempts']}/{job['queue']['max_attempts']})"
+            )
+        return job
+
+    def heartbeat(
+        self,
+        job_id: str,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS
+    ) -> bool:
+        """
+        Extend the lease on a claimed job
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+            lease_seconds: New lease duration from now
+
+        Returns:
+            False if the lease was lost to another worker
+        """
+        now = datetime.now()
+        result = self.collection.update_one(
+            {'job_id': job_id, 'lock_holder': worker_id},
+            {
+                '$set': {
+                    'lock_expiry': now + timedelta(seconds=lease_seconds),
+                    'queue.heartbeat_at': now
+                }
+            }
+        )
+        return result.matched_count > 0
+
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        """
+        Release the lease after the task handler returned
+
+        The handler is responsible for the job's final status.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+
+        Returns:
+            True if the lease was released
+        """
+        return self.job_manager.release_job_lock(job_id, worker_id)
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """
+        Give a job back to the queue without counting the attempt
+
+        Used when a worker shuts down before finishing.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+
+        Returns:
+            True if the job was returned to the queue
+        """
+        result = self.collection.update_one(
+            {'job_id': job_id, 'lock_holder': worker_id},
+            {
+                '$set': {
+                    'status': JobStatus.PENDING.value,
+                    'lock_holder': None,
+                    'lock_acquired_at': None,
+                    'lock_expiry': None,
+                    'queue.available_at': datetime.now(),
+                    'updated_at': datetime.now()
+                },
+                '$inc': {'queue.attempts': -1}
+            }
+        )
+        if result.modified_count > 0:
+            logger.info(f"Worker {worker_id} released job {job_id} back to the queue")
+            return True
+        return False
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Record a failed attempt, scheduling a retry if attempts remain
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+            error: Error message
+
+        Returns:
+            True if the job will be retried
+        """
+        job = self.collection.find_one({'job_id': job_id, 'lock_holder': worker_id}, {'queue': 1})
+        if not job:
+            logger.warning(f"Worker {worker_id} no longer holds job {job_id}, not recording failure")
+            return False
+
+        queue = job.get('queue', {})
+        attempts = queue.get('attempts', 1)
+        now = datetime.now()
+        unlock = {
+            'lock_holder': None,
+            'lock_acquired_at': None,
+            'lock_expiry': None,
+            'queue.last_error': error,
+            'updated_at': now
+        }
+
+        if attempts < queue.get('max_attempts', DEFAULT_MAX_ATTEMPTS):
+            # Exponential backoff between attempts
+            delay = RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1))
+            unlock.update({
+                'status': JobStatus.PENDING.value,
+                'completed_at': None,
+                'queue.available_at': now + timedelta(seconds=delay)
+            })
+            self.collection.update_one({'job_id': job_id}, {'$set': unlock})
+            logger.warning(f"Job {job_id} failed on attempt {attempts}, retrying in {delay}s: {error}")
+            return True
+
+        unlock.update({
+            'status': JobStatus.FAILED.value,
+            'error': error,
+            'completed_at': now
+        })
+        self.collection.update_one({'job_id': job_id}, {'$set': unlock})
+        logger.error(f"Job {job_id} failed after {attempts} attempts: {error}")
+        return False
+
+    def reap(self) -> int:
+        """
+        Finalize queued jobs that can no longer make progress
+
+        Jobs whose lease expired after their last attempt are marked failed,
+        and unclaimed jobs that were cancelled while waiting are marked
+        cancelled.
+
+        Returns:
+            Number of jobs finalized
+        """
+        now = datetime.now()
+        exhausted = self.collection.update_many(
+            {
+                'queue': {'$exists': True},
+                'status': {'$in': [JobStatus.PENDING.value, JobStatus.RUNNING.value]},
+                'lock_expiry': {'$lt': now},
+                '$expr': {'$gte': ['$queue.attempts', '$queue.max_attempts']}
+            },
+            {
+                '$set': {
+                    'status': JobStatus.FAILED.value,
+                    'error': 'Worker lease expired on final attempt',
+                    'lock_holder': None,
+                    'lock_expiry': None,
+                    'completed_at': now,
+                    'updated_at': now
+                }
+            }
+        )
+        cancelled = self.collection.update_many(
+            {
+                'queue': {'$exists': True},
+                'status': JobStatus.CANCELLING.value,
+                '$or': [
+                    {'lock_holder': None},
+                    {'lock_expiry': {'$lt': now}}
+                ]
+            },
+            {
+                '$set': {
+                    'status': JobStatus.CANCELLED.value,
+                    'lock_holder': None,
+                    'lock_expiry': None,
+                    'completed_at': now,
+                    'updated_at': now
+                }
+            }
+        )
+
+        total = exhausted.modified_count + cancelled.modified_count
+        if total:
+            logger.info(f"Reaped {exhausted.modified_count} exhausted and {cancelled.modified_count} cancelled queued jobs")
+        return total
+
+    def get_queue_depth(self, task_types: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Count waiting jobs per task
+
+        Args:
+            task_types: Restrict to these task names, or None for all
+
+        Returns:
+            Mapping of task name to number of pending jobs
+        """
+        match = {'queue': {'$exists': True}, 'status': JobStatus.PENDING.value}
+        if task_types:
+            match['queue.task'] = {'$in': task_types}
+
+        results = self.collection.aggregate([
+            {'$match': match},
+            {'$group': {'_id': '$queue.task', 'count': {'$sum': 1}}}
+        ])
+        return {r['_id']: r['count'] for r in results}
@@ -7,12 +7,19 @@ enabling export of accessibility test results and recording issues.
 
 from .client import DrupalJSONAPIClient
 from .formatters import format_recording_body, format_issue_body
-from .taxonomy import TaxonomyCache, DiscoveredPageTaxonomies, WCAGChapterCache
+from .taxonomy import (
+    TaxonomyCache,
+    DiscoveredPageTaxonomies,
+    WCAGChapterCache,
+    SharedTermCache,
+    configure_shared_term_cache
+)
 from .discovered_page_exporter import DiscoveredPageExporter
 from .discovered_page_importer import DiscoveredPageImporter
 from .recording_exporter import RecordingExporter
 from .issue_importer import IssueImporter
 from .issue_exporter import IssueExporter
+from .export_engine import DrupalExportEngine, ExportJob
 
 __all__ = [
     'DrupalJSONAPIClient',
@@ -21,9 +28,13 @@ __all__ = [
     'TaxonomyCache',
     'DiscoveredPageTaxonomies',
     'WCAGChapterCache',
+    'SharedTermCache',
+    'configure_shared_term_cache',
     'DiscoveredPageExporter',
     'DiscoveredPageImporter',
     'RecordingExporter',
     'IssueImporter',
-    'IssueExporter'
+    'IssueExporter',
+    'DrupalExportEngine',
+    'ExportJob'
 ]
@@ -34,6 +34,35 @@ class DrupalValidationError(DrupalJSONAPIError):
     pass
 
 
+def parse_jsonapi_errors(error_data: Dict[str, Any]) -> str:
+    """
+    Parse JSON:API errors into a readable message.
+
+    Args:
+        error_data: The error response from Drupal
+
+    Returns:
+        Human-readable error message
+    """
+    errors = error_data.get('errors', [])
+    if not errors:
+        return "Unknown validation error"
+
+    messages = []
+    for error in errors:
+        title = error.get('title', 'Validation error')
+        detail = error.get('detail', '')
+        source = error.get('source', {})
+        pointer = source.get('pointer', '')
+
+        if pointer:
+            messages.append(f"{pointer}: {title} - {detail}")
+        else:
+            messages.append(f"{title}: {detail}")
+
+    return "; ".join(messages)
+
+
 class DrupalJSONAPIClient:
     """
     Client for interacting with Drupal's JSON:API.
@@ -280,23 +309,7 @@ class DrupalJSONAPIClient:
         Returns:
             Human-readable error message
         """
-        errors = error_data.get('errors', [])
-        if not errors:
-            return "Unknown validation error"
-
-        messages = []
-        for error in errors:
-            title = error.get('title', 'Validation error')
-            detail = error.get('detail', '')
-            source = error.get('source', {})
-            pointer = source.get('pointer', '')
-
-            if pointer:
-                messages.append(f"{pointer}: {title} - {detail}")
-            else:
-                messages.append(f"{title}: {detail}")
-
-        return "; ".join(messages)
+        return parse_jsonapi_errors(error_data)
 
     def close(self):
         """Close the session and clean up resources."""
@@ -20,6 +20,7 @@ class DrupalConfig:
     username: str
     password: str
     enabled: bool = True
+    export_concurrency: int = 8
 
     @classmethod
     def from_env(cls) -> 'DrupalConfig':
@@ -31,6 +32,7 @@ class DrupalConfig:
             DRUPAL_USERNAME: Username for authentication
             DRUPAL_PASSWORD: Password for authentication
             DRUPAL_EXPORT_ENABLED: Whether export is enabled (default: true)
+            DRUPAL_EXPORT_CONCURRENCY: Requests sent to Drupal at once during export (default: 8)
 
         Returns:
             DrupalConfig instance
@@ -42,6 +44,7 @@ class DrupalConfig:
         username = os.getenv('DRUPAL_USERNAME')
         password = os.getenv('DRUPAL_PASSWORD')
         enabled = os.getenv('DRUPAL_EXPORT_ENABLED', 'true').lower() == 'true'
+        export_concurrency = int(os.getenv('DRUPAL_EXPORT_CONCURRENCY', '8'))
 
         if not all([base_url, username, password]):
             raise ValueError(
@@ -53,7 +56,8 @@ class DrupalConfig:
             base_url=base_url,
             username=username,
             password=password,
-            enabled=enabled
+            enabled=enabled,
+            export_concurrency=export_concurrency
         )
 
     @classmethod
@@ -98,6 +102,7 @@ class DrupalConfig:
         username = config.get('username')
         password = config.get('password')
         enabled = config.get('enabled', 'true').lower() == 'true'
+        export_concurrency = int(config.get('export_concurrency', '8'))
 
         if not all([base_url, username, password]):
             raise ValueError(
@@ -111,7 +116,8 @@ class DrupalConfig:
             base_url=base_url,
             username=username,
             password=password,
-            enabled=enabled
+            enabled=enabled,
+            export_concurrency=export_concurrency
         )
 
     @classmethod
@@ -155,6 +161,9 @@ class DrupalConfig:
         if not self.password:
             raise ValueError("password is required")
 
+        if self.export_concurrency < 1:
+            raise ValueError("export_concurrency must be at least 1")
+
         return True
 
 
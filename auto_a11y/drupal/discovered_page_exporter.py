@@ -8,6 +8,8 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from .export_engine import DrupalExportEngine, ExportJob, export_batch
+
 logger = logging.getLogger(__name__)
 
 
@@ -170,7 +172,81 @@ class DiscoveredPageExporter:
         Returns:
             Dict with 'success', 'uuid', and optional 'error' keys
         """
-        return self.export_discovered_page(
+        return self.export_discovered_page(**self._discovered_page_fields(discovered_page, audit_uuid))
+
+    def prepare_discovered_page(
+        self,
+        title: str,
+        url: str,
+        audit_uuid: str,
+        interested_because: List[str] = None,
+        page_elements: List[str] = None,
+        private_notes: Optional[str] = None,
+        public_notes: Optional[str] = None,
+        include_in_report: bool = True,
+        manual_audit: bool = True,
+        document_links: List[Dict[str, str]] = None,
+        existing_uuid: Optional[str] = None,
+        key: str = '',
+        previous_hash: Optional[str] = None,
+        context: Any = None
+    ) -> ExportJob:
+        """
+        Prepare a discovered page for concurrent export with DrupalExportEngine.
+
+        Takes the same arguments as export_discovered_page, plus:
+            key: Stable identifier of the source record
+            previous_hash: Payload hash stored at the previous export, so an
+                unchanged page is skipped
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/discovered_page
+        """
+        payload = self._build_payload(
+            title=title,
+            url=url,
+            audit_uuid=audit_uuid,
+            interested_because=interested_because or [],
+            page_elements=page_elements or [],
+            private_notes=private_notes,
+            public_notes=public_notes,
+            include_in_report=include_in_report,
+            manual_audit=manual_audit,
+            document_links=document_links or []
+        )
+        return ExportJob(
+            endpoint='node/discovered_page',
+            payload=payload,
+            key=key,
+            label=title,
+            existing_uuid=existing_uuid,
+            previous_hash=previous_hash,
+            context=context
+        )
+
+    def prepare_from_discovered_page_model(self, discovered_page, audit_uuid: str, context: Any = None) -> ExportJob:
+        """
+        Prepare a DiscoveredPage model instance for concurrent export.
+
+        Args:
+            discovered_page: DiscoveredPage model instance
+            audit_uuid: Drupal audit UUID to link to
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/discovered_page
+        """
+        return self.prepare_discovered_page(
+            key=f'discovered_page:{discovered_page.id}',
+            previous_hash=discovered_page.drupal_content_hash,
+            context=context,
+            **self._discovered_page_fields(discovered_page, audit_uuid)
+        )
+
+    def _discovered_page_fields(self, discovered_page, audit_uuid: str) -> Dict[str, Any]:
+        """Map a DiscoveredPage model instance to export_discovered_page arguments"""
+        return dict(
             title=discovered_page.title,
             url=discovered_page.url,
             audit_uuid=audit_uuid,
@@ -188,61 +264,49 @@ class DiscoveredPageExporter:
         pages: List[Any],
         audit_uuid: str,
         batch_size: int = 10,
-        continue_on_error: bool = True
+        continue_on_error: bool = True,
+        engine: Optional[DrupalExportEngine] = None
     ) -> Dict[str, Any]:
         """
-        Export multiple discovered pages in batches.
+        Export multiple discovered pages concurrently.
 
         Args:
             pages: List of Page or DiscoveredPage model instances
             audit_uuid: Drupal audit UUID to link to
-            batch_size: Number of pages to export per batch
+            batch_size: Unused, kept for compatibility (concurrency is set on the engine)
             continue_on_error: Whether to continue if individual exports fail
+            engine: DrupalExportEngine to use (defaults to one for this client)
 
         Returns:
-            Dict with 'total', 'success_count', 'failure_count', 'results' keys
+            Dict with 'total', 'success_count', 'failure_count', 'results' keys;
+            results are in the order of pages
         """
-        results = []
-        success_count = 0
-        failure_count = 0
-
-        for i, page in enumerate(pages):
-            logger.info(f"Exporting page {i+1}/{len(pages)}")
-
-            try:
-                # Detect page type and export
-                if hasattr(page, 'discovery_reasons'):
-                    # Page model
-                    result = self.export_from_page_model(page, '', audit_uuid)
-                else:
-                    # DiscoveredPage model
-                    result = self.export_from_discovered_page_model(page, audit_uuid)
-
-                results.append(result)
-
-                if result.get('success'):
-                    success_count += 1
-                else:
-                    failure_count += 1
-
-            except Exception as e:
-                logger.error(f"Unexpected error exporting page: {e}")
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'page_url': getattr(page, 'url', 'unknown')
-                })
-                failure_count += 1
-
-                if not continue_on_error:
-                    break
-
-        return {
-            'total': len(pages),
-            'success_count': success_count,
-            'failure_count': failure_count,
-            'results': results
-        }
+        def prepare(page):
+            # Detect page type
+            if hasattr(page, 'discovery_reasons'):
+                # Page model
+                return self.prepare_discovered_page(
+                    title=page.title or page.url,
+                    url=page.url,
+                    audit_uuid=audit_uuid,
+                    interested_because=page.discovery_reasons,
+                    page_elements=page.discovery_areas,
+                    private_notes=page.discovery_notes_private,
+                    public_notes=page.discovery_notes_public,
+                    include_in_report=True,
+                    existing_uuid=page.drupal_discovered_page_uuid,
+                    key=f'page:{page.id}'
+                )
+            # DiscoveredPage model
+            return self.prepare_from_discovered_page_model(page, audit_uuid)
+
+        logger.info(f"Exporting {len(pages)} discovered pages")
+        return export_batch(
+            engine or DrupalExportEngine.from_client(self.client),
+            pages,
+            prepare,
+            continue_on_error=continue_on_error
+        )
 
     def _build_payload(
         self,
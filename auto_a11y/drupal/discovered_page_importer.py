@@ -9,9 +9,18 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from auto_a11y.models.page import DrupalSyncStatus
+from .delta_sync import changed_since_filter, included_names, iter_nodes
 
 logger = logging.getLogger(__name__)
 
+# Attributes and relationships read by _convert_drupal_page
+PAGE_FIELDS = [
+    'title', 'drupal_internal__nid', 'field_page_url', 'field_include_in_report', 'field_audited',
+    'field_manual_audit', 'field_notes_in_discovery', 'field_public_note_on_page',
+    'field_document_links_on_page', 'field_interested_because', 'field_relevant_page_elements',
+    'created', 'changed'
+]
+
 
 class DiscoveredPageImporter:
     """
@@ -35,55 +44,45 @@ class DiscoveredPageImporter:
     def fetch_discovered_pages_for_audit(
         self,
         audit_uuid: str,
-        include_relationships: bool = True
+        include_relationships: bool = True,
+        changed_since: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Fetch all discovered pages for an audit.
+        Fetch the discovered pages of an audit.
+
+        Only the fields the importer reads are requested, and related terms
+        are included so their names come back with each page of results.
 
         Args:
             audit_uuid: Drupal audit UUID
             include_relationships: Whether to include relationship data
+            changed_since: Only fetch pages changed at or after this Unix
+                timestamp (None fetches all pages)
 
         Returns:
             List of discovered page dicts with converted data
         """
         try:
-            logger.info(f"Fetching discovered pages for audit {audit_uuid}")
+            logger.info(f"Fetching discovered pages for audit {audit_uuid}"
+                        + (f" changed since {changed_since}" if changed_since is not None else ""))
 
             # Build query params
             params = {
                 'filter[field_parent_audit_discovery.id]': audit_uuid,
-                'sort': 'created'
+                'sort': 'created',
+                'fields[node--discovered_page]': ','.join(PAGE_FIELDS),
+                **changed_since_filter(changed_since)
             }
 
             if include_relationships:
-                params['include'] = 'field_interested_because,field_relevant_page_elements,field_parent_audit_discovery'
-
-            # Fetch pages (may need pagination)
-            all_pages = []
-            page_limit = 50
-            offset = 0
-
-            while True:
-                params['page[limit]'] = page_limit
-                params['page[offset]'] = offset
-
-                response = self.client.get('node/discovered_page', params=params)
-                pages = response.get('data', [])
+                params['include'] = 'field_interested_because,field_relevant_page_elements'
+                params[f'fields[taxonomy_term--{self.taxonomies.INTERESTED_BECAUSE}]'] = 'name'
+                params[f'fields[taxonomy_term--{self.taxonomies.PAGE_ELEMENTS}]'] = 'name'
 
-                if not pages:
-                    break
-
-                # Convert each page
-                for page_data in pages:
-                    converted = self._convert_drupal_page(page_data, response.get('included', []))
-                    all_pages.append(converted)
-
-                offset += page_limit
-
-                # If we got fewer than page_limit, we're done
-                if len(pages) < page_limit:
-                    break
+            all_pages = [
+                self._convert_drupal_page(page_data, included)
+                for page_data, included in iter_nodes(self.client, 'node/discovered_page', params)
+            ]
 
             logger.info(f"Fetched {len(all_pages)} discovered pages")
             return all_pages
@@ -256,21 +255,29 @@ class DiscoveredPageImporter:
             for link in doc_links_raw
         ] if doc_links_raw else []
 
-        # Extract taxonomy terms from relationships
+        # Extract taxonomy terms from relationships, naming them from the
+        # included terms and falling back to the taxonomy cache
         interested_because_terms = []
         page_elements_terms = []
+        term_names = included_names(included)
 
         # Get interested_because term UUIDs from relationship
         interested_rel = relationships.get('field_interested_because', {}).get('data', [])
         if interested_rel:
             interested_uuids = [term.get('id') for term in interested_rel if term.get('id')]
-            interested_because_terms = self.taxonomies.lookup_interested_because_names(interested_uuids)
+            if all(term_uuid in term_names for term_uuid in interested_uuids):
+                interested_because_terms = [term_names[term_uuid] for term_uuid in interested_uuids]
+            else:
+                interested_because_terms = self.taxonomies.lookup_interested_because_names(interested_uuids)
 
         # Get page_elements term UUIDs from relationship
         elements_rel = relationships.get('field_relevant_page_elements', {}).get('data', [])
         if elements_rel:
             element_uuids = [term.get('id') for term in elements_rel if term.get('id')]
-            page_elements_terms = self.taxonomies.lookup_page_elements_names(element_uuids)
+            if all(term_uuid in term_names for term_uuid in element_uuids):
+                page_elements_terms = [term_names[term_uuid] for term_uuid in element_uuids]
+            else:
+                page_elements_terms = self.taxonomies.lookup_page_elements_names(element_uuids)
 
         # Build converted dict
         return {
@@ -0,0 +1,407 @@
+"""
+Drupal Export Engine
+
+Sends prepared JSON:API payloads to Drupal concurrently over a pooled
+keep-alive session. Every payload is hashed: a node whose payload matches the
+hash recorded at its last export is skipped, an existing node is PATCHed and
+only new nodes are POSTed. Rate limiting (429) is retried with exponential
+backoff. PATCH requests are idempotent and are also retried on server
+errors (5xx), timeouts and dropped connections; a POST is not, since Drupal
+may already have created the node and ignores idempotency keys, so a retry
+could create it twice. A POST is only retried when it never reached Drupal.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import queue
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urljoin
+
+import aiohttp
+
+from .client import (
+    DrupalAuthenticationError,
+    DrupalConnectionError,
+    DrupalJSONAPIError,
+    DrupalValidationError,
+    parse_jsonapi_errors
+)
+
+logger = logging.getLogger(__name__)
+
+# Requests in flight at once (and pooled connections kept open)
+DEFAULT_CONCURRENCY = 8
+
+# Retries of a rate limited, failed or timed out request
+MAX_RETRIES = 5
+
+# First retry delay in seconds, doubled on every attempt up to BACKOFF_MAX
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses meaning the request was rejected before Drupal processed it
+NOT_PROCESSED_STATUSES = {429}
+
+REQUEST_TIMEOUT = 30
+
+
+def payload_hash(payload: Dict[str, Any]) -> str:
+    """
+    Hash the content of a JSON:API payload
+
+    The node id is left out, so the POST that created a node and the PATCH
+    that would update it with the same content hash alike.
+    """
+    data = dict(payload.get('data', {}))
+    data.pop('id', None)
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class ExportJob:
+    """
+    One node to create or update in Drupal
+
+    Attributes:
+        endpoint: JSON:API resource (e.g., 'node/issue')
+        payload: JSON:API document for the node
+        key: Stable identifier of the source record (e.g., 'issue:<id>')
+        label: Name used in logs and progress messages
+        existing_uuid: UUID of the node from a previous export
+        previous_hash: Payload hash recorded at the previous export
+        context: Caller data handed back with the result
+    """
+
+    endpoint: str
+    payload: Dict[str, Any]
+    key: str = ''
+    label: str = ''
+    existing_uuid: Optional[str] = None
+    previous_hash: Optional[str] = None
+    context: Any = None
+    content_hash: str = field(init=False)
+
+    def __post_init__(self):
+        self.content_hash = payload_hash(self.payload)
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the node exists and its last export had the same content"""
+        return bool(self.existing_uuid) and self.previous_hash == self.content_hash
+
+
+class DrupalExportEngine:
+    """
+    Export many nodes to Drupal concurrently.
+
+    Usage:
+        engine = DrupalExportEngine.from_client(client)
+        for job, result in engine.export(jobs):
+            ...
+
+    Results are dicts with 'success', 'action' ('created', 'updated' or
+    'unchanged'), 'uuid', 'nid', 'content_hash' and, on failure, 'error'.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        timeout: float = REQUEST_TIMEOUT
+    ):
+        """
+        Initialize the export engine.
+
+        Args:
+            base_url: Base URL of the Drupal site
+            username: Drupal username for Basic Auth
+            password: Drupal password for Basic Auth
+            concurrency: Maximum requests in flight
+            max_retries: Retries of a request on 429, 5xx or connection errors (POST: 429 and
+                failed connects only)
+            backoff_base: First retry delay in seconds
+            backoff_max: Longest retry delay in seconds
+            timeout: Timeout of a single request in seconds
+        """
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+    @classmethod
+    def from_client(cls, client, **kwargs) -> 'DrupalExportEngine':
+        """Create an engine for the site and credentials of a DrupalJSONAPIClient"""
+        return cls(client.base_url, client.username, client.password, **kwargs)
+
+    def export(
+        self,
+        jobs: Iterable[ExportJob],
+        stop_on_error: bool = False,
+        force: bool = False
+    ) -> Iterator[Tuple[ExportJob, Dict[str, Any]]]:
+        """
+        Export jobs and yield their results as they complete.
+
+        The requests run on an event loop in a background thread, so this can
+        be consumed from synchronous code such as a streaming Flask response.
+        Closing the iterator early stops starting new requests.
+
+        Args:
+            jobs: Jobs to export
+            stop_on_error: Stop starting new requests after the first failure
+            force: Send unchanged nodes too
+
+        Yields:
+            (job, result) tuples in completion order
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+
+        results = queue.Queue()
+        cancelled = threading.Event()
+        done = object()
+
+        def run():
+            try:
+                asyncio.run(self._run(jobs, results.put, stop_on_error, force, cancelled))
+            except BaseException as e:
+                results.put(e)
+            finally:
+                results.put(done)
+
+        thread = threading.Thread(target=run, name='drupal-export', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+            thread.join()
+
+    async def _run(self, jobs, emit, stop_on_error: bool, force: bool, cancelled: threading.Event):
+        """Export jobs with a fixed number of workers sharing one session"""
+        pending = iter(jobs)
+        failed = False
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+        headers = {
+            'Accept': 'application/vnd.api+json',
+            'Content-Type': 'application/vnd.api+json',
+            'Authorization': f'Basic {credentials}'
+        }
+        async with aiohttp.ClientSession(
+            headers=headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+
+            async def worker():
+                nonlocal failed
+                for job in pending:
+                    if cancelled.is_set() or (stop_on_error and failed):
+                        return
+                    result = await self._export_job(session, job, force)
+                    if not result['success']:
+                        failed = True
+                    emit((job, result))
+
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(jobs)))))
+
+    async def _export_job(self, session: aiohttp.ClientSession, job: ExportJob, force: bool) -> Dict[str, Any]:
+        """Create, update or skip one node"""
+        if job.unchanged and not force:
+            logger.debug(f"Skipping unchanged {job.endpoint} '{job.label}' (UUID: {job.existing_uuid})")
+            return self._result(job, 'unchanged', job.existing_uuid, None)
+
+        try:
+            if job.existing_uuid:
+                payload = {**job.payload, 'data': {**job.payload['data'], 'id': job.existing_uuid}}
+                status, body = await self._request(session, 'PATCH', f'{job.endpoint}/{job.existing_uuid}', payload)
+                if status != 404:
+                    return self._result(job, 'updated', *self._node_ids(body))
+                logger.warning(f"{job.endpoint} UUID {job.existing_uuid} not found in Drupal, creating new")
+
+            payload = {**job.payload, 'data': {k: v for k, v in job.payload['data'].items() if k != 'id'}}
+            status, body = await self._request(session, 'POST', job.endpoint, payload)
+            if status == 404:
+                raise DrupalJSONAPIError(f"Resource {job.endpoint} not found")
+            return self._result(job, 'created', *self._node_ids(body))
+
+        except DrupalJSONAPIError as e:
+            logger.error(f"Failed to export {job.endpoint} '{job.label}': {e}")
+            return {
+                'success': False,
+                'action': None,
+                'uuid': job.existing_uuid,
+                'nid': None,
+                'content_hash': job.content_hash,
+                'error': str(e)
+            }
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Send a request, retrying rate limited and failed attempts.
+
+        A POST is retried only when Drupal cannot have processed it (rate
+        limited, or the connection could not be opened). After a timeout,
+        a dropped connection or a 5xx it may already have created the node,
+        so the error is reported instead of risking a duplicate.
+
+        Returns:
+            (status, parsed body); 404 is returned rather than raised
+
+        Raises:
+            DrupalAuthenticationError: On 401/403
+            DrupalValidationError: On 422
+            DrupalConnectionError: If the site cannot be reached after all retries
+            DrupalJSONAPIError: On any other error status
+        """
+        url = urljoin(self.base_url, f'/jsonapi/{endpoint}')
+        body = json.dumps(payload, default=str)
+        idempotent = method != 'POST'
+        retry_statuses = RETRY_STATUSES if idempotent else NOT_PROCESSED_STATUSES
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with session.request(method, url, data=body) as response:
+                    status = response.status
+                    text = await response.text()
+                    retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                never_sent = isinstance(e, aiohttp.ClientConnectorError)
+                if attempt == self.max_retries or not (idempotent or never_sent):
+                    raise DrupalConnectionError(f"{method} {url} failed: {e}")
+                delay = self._backoff(attempt, None)
+                logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if status in retry_statuses and attempt < self.max_retries:
+                delay = self._backoff(attempt, retry_after)
+                logger.warning(f"{method} {url} returned {status}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                data = json.loads(text) if text else {}
+            except ValueError:
+                data = {}
+
+            if status == 401:
+                raise DrupalAuthenticationError("Authentication failed")
+            if status == 403:
+                raise DrupalAuthenticationError("Access forbidden")
+            if status == 422:
+                raise DrupalValidationError(f"Validation failed: {parse_jsonapi_errors(data)}")
+            if status >= 400 and status != 404:
+                detail = parse_jsonapi_errors(data) if data.get('errors') else text[:200]
+                raise DrupalJSONAPIError(f"{method} request failed with HTTP {status}: {detail}")
+            return status, data
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Delay before the next attempt, honouring a Retry-After in seconds"""
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.backoff_max)
+            except ValueError:
+                pass
+        delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+        # Jitter keeps concurrent workers from retrying in lockstep
+        return delay * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _node_ids(body: Dict[str, Any]) -> Tuple[Optional[str], Optional[int]]:
+        data = body.get('data', {})
+        return data.get('id'), data.get('attributes', {}).get('drupal_internal__nid')
+
+    @staticmethod
+    def _result(job: ExportJob, action: str, uuid: Optional[str], nid: Optional[int]) -> Dict[str, Any]:
+        if action != 'unchanged':
+            logger.info(f"{action.capitalize()} {job.endpoint} '{job.label}': UUID={uuid}, NID={nid}")
+        return {
+            'success': True,
+            'action': action,
+            'uuid': uuid,
+            'nid': nid,
+            'content_hash': job.content_hash
+        }
+
+
+def export_batch(
+    engine: DrupalExportEngine,
+    items: list,
+    prepare,
+    continue_on_error: bool = True
+) -> Dict[str, Any]:
+    """
+    Prepare model instances as jobs and export them concurrently.
+
+    Args:
+        engine: DrupalExportEngine to send with
+        items: Model instances to export
+        prepare: Callable turning an item into an ExportJob
+        continue_on_error: Whether to keep exporting after a failure
+
+    Returns:
+        Dict with 'total', 'success_count', 'failure_count', 'results' keys.
+        Results are in the order of items; items not attempted after a
+        failure (when continue_on_error is False) have None.
+    """
+    results = [None] * len(items)
+    jobs = []
+    for index, item in enumerate(items):
+        try:
+            job = prepare(item)
+        except Exception as e:
+            logger.error(f"Unexpected error preparing export of '{getattr(item, 'title', index)}': {e}")
+            results[index] = {'success': False, 'error': str(e), 'title': getattr(item, 'title', None)}
+            if not continue_on_error:
+                jobs = []
+                break
+            continue
+        job.context = index
+        jobs.append(job)
+
+    for job, result in engine.export(jobs, stop_on_error=not continue_on_error):
+        results[job.context] = result
+
+    attempted = [result for result in results if result is not None]
+    success_count = sum(1 for result in attempted if result.get('success'))
+    return {
+        'total': len(items),
+        'success_count': success_count,
+        'failure_count': len(attempted) - success_count,
+        'results': results
+    }
@@ -8,6 +8,8 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from .export_engine import DrupalExportEngine, ExportJob, export_batch
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,6 +162,64 @@ class IssueExporter:
                 'error': error_detail
             }
 
+    def prepare_issue(
+        self,
+        title: str,
+        description: str,
+        audit_uuid: str,
+        impact: str = "med",
+        issue_type: Optional[str] = None,
+        location_on_page: Optional[str] = None,
+        wcag_criteria: Optional[List[str]] = None,
+        xpath: Optional[str] = None,
+        url: Optional[str] = None,
+        video_timecode: Optional[str] = None,
+        issue_id: Optional[int] = None,
+        existing_uuid: Optional[str] = None,
+        video_uuid: Optional[str] = None,
+        discovered_page_uuid: Optional[str] = None,
+        key: str = '',
+        previous_hash: Optional[str] = None,
+        context: Any = None
+    ) -> ExportJob:
+        """
+        Prepare an issue for concurrent export with DrupalExportEngine.
+
+        Takes the same arguments as export_issue, plus:
+            key: Stable identifier of the source record
+            previous_hash: Payload hash stored at the previous export, so an
+                unchanged issue is skipped
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/issue
+        """
+        payload = self._build_payload(
+            title=title,
+            description=description,
+            audit_uuid=audit_uuid,
+            impact=impact,
+            issue_type=issue_type,
+            location_on_page=location_on_page,
+            wcag_criteria=wcag_criteria or [],
+            xpath=xpath,
+            url=url,
+            video_timecode=video_timecode,
+            issue_id=issue_id,
+            existing_uuid=existing_uuid,
+            video_uuid=video_uuid,
+            discovered_page_uuid=discovered_page_uuid
+        )
+        return ExportJob(
+            endpoint='node/issue',
+            payload=payload,
+            key=key,
+            label=title,
+            existing_uuid=existing_uuid,
+            previous_hash=previous_hash,
+            context=context
+        )
+
     def export_from_issue_model(self, issue, audit_uuid: str) -> Dict[str, Any]:
         """
         Export an issue from an Issue model instance.
@@ -171,6 +231,38 @@ class IssueExporter:
         Returns:
             Dict with 'success', 'uuid', and optional 'error' keys
         """
+        return self.export_issue(**self._issue_model_fields(issue, audit_uuid))
+
+    def prepare_from_issue_model(self, issue, audit_uuid: str, context: Any = None) -> ExportJob:
+        """
+        Prepare an Issue model instance for concurrent export.
+
+        Args:
+            issue: Issue model instance
+            audit_uuid: Drupal audit UUID to link to
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/issue
+        """
+        return self.prepare_issue(
+            key=f'issue:{issue.id}',
+            previous_hash=issue.drupal_content_hash,
+            context=context,
+            **self._issue_model_fields(issue, audit_uuid)
+        )
+
+    def _issue_model_fields(self, issue, audit_uuid: str) -> Dict[str, Any]:
+        """
+        Map an Issue model instance to export_issue arguments.
+
+        Args:
+            issue: Issue model instance
+            audit_uuid: Drupal audit UUID to link to
+
+        Returns:
+            Keyword arguments for export_issue / prepare_issue
+        """
         import html
 
         # Map impact enum to Drupal format
@@ -221,7 +313,7 @@ class IssueExporter:
             except Exception as e:
                 logger.warning(f"Failed to get enhanced description for {issue.issue_code}: {e}")
 
-        return self.export_issue(
+        return dict(
             title=issue.title,
             description=description,
             audit_uuid=audit_uuid,
@@ -248,6 +340,46 @@ class IssueExporter:
         Returns:
             Dict with 'success', 'uuid', and optional 'error' keys
         """
+        return self.export_issue(**self._recording_issue_fields(recording_issue, audit_uuid, video_uuid))
+
+    def prepare_from_recording_issue(
+        self,
+        recording_issue,
+        audit_uuid: str,
+        video_uuid: Optional[str] = None,
+        context: Any = None
+    ) -> ExportJob:
+        """
+        Prepare a RecordingIssue model instance for concurrent export.
+
+        Args:
+            recording_issue: RecordingIssue model instance
+            audit_uuid: Drupal audit UUID to link to
+            video_uuid: Optional Drupal audit_video UUID to link to
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/issue
+        """
+        return self.prepare_issue(
+            key=f'recording_issue:{recording_issue.id}',
+            previous_hash=recording_issue.drupal_content_hash,
+            context=context,
+            **self._recording_issue_fields(recording_issue, audit_uuid, video_uuid)
+        )
+
+    def _recording_issue_fields(self, recording_issue, audit_uuid: str, video_uuid: Optional[str]) -> Dict[str, Any]:
+        """
+        Map a RecordingIssue model instance to export_issue arguments.
+
+        Args:
+            recording_issue: RecordingIssue model instance
+            audit_uuid: Drupal audit UUID to link to
+            video_uuid: Optional Drupal audit_video UUID to link to
+
+        Returns:
+            Keyword arguments for export_issue / prepare_issue
+        """
         import html
 
         # Map impact enum to Drupal format
@@ -304,7 +436,7 @@ class IssueExporter:
         logger.warning(f"   description parameter length: {len(description)} chars")
         logger.warning(f"   description parameter preview (first 200 chars): {description[:200]}")
 
-        return self.export_issue(
+        return dict(
             title=recording_issue.title,
             description=description,
             audit_uuid=audit_uuid,
@@ -642,53 +774,33 @@ class IssueExporter:
         self,
         issues: List[Any],
         audit_uuid: str,
-        continue_on_error: bool = True
+        continue_on_error: bool = True,
+        engine: Optional[DrupalExportEngine] = None
     ) -> Dict[str, Any]:
         """
-        Export multiple issues in batch.
+        Export multiple issues concurrently.
+
+        Issues whose payload matches their drupal_content_hash are skipped,
+        issues with a drupal_uuid are updated and the rest are created.
 
         Args:
             issues: List of Issue model instances
             audit_uuid: Drupal audit UUID to link to
             continue_on_error: Whether to continue if individual exports fail
+            engine: DrupalExportEngine to use (defaults to one for this client)
 
         Returns:
-            Dict with 'total', 'success_count', 'failure_count', 'results' keys
+            Dict with 'total', 'success_count', 'failure_count', 'results' keys;
+            results are in the order of issues and include the 'content_hash'
+            to store with each exported issue
         """
-        results = []
-        success_count = 0
-        failure_count = 0
-
-        for i, issue in enumerate(issues):
-            logger.info(f"Exporting issue {i+1}/{len(issues)}: {issue.title}")
-
-            try:
-                result = self.export_from_issue_model(issue, audit_uuid)
-                results.append(result)
-
-                if result.get('success'):
-                    success_count += 1
-                else:
-                    failure_count += 1
-
-            except Exception as e:
-                logger.error(f"Unexpected error exporting issue: {e}")
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'issue_title': issue.title
-                })
-                failure_count += 1
-
-                if not continue_on_error:
-                    break
-
-        return {
-            'total': len(issues),
-            'success_count': success_count,
-            'failure_count': failure_count,
-            'results': results
-        }
+        logger.info(f"Exporting {len(issues)} issues")
+        return export_batch(
+            engine or DrupalExportEngine.from_client(self.client),
+            issues,
+            lambda issue: self.prepare_from_issue_model(issue, audit_uuid),
+            continue_on_error=continue_on_error
+        )
 
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters"""
@@ -10,9 +10,17 @@ from datetime import datetime
 
 from auto_a11y.models import Issue, ImpactLevel
 from auto_a11y.models.page import DrupalSyncStatus
+from .delta_sync import changed_since_filter, iter_nodes, to_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Attributes and relationships read by _parse_issue_node
+ISSUE_FIELDS = [
+    'title', 'body', 'field_impact', 'field_issue_type', 'field_location_on_page', 'field_wcag_chapter',
+    'field_xpath', 'field_url', 'field_video_timecode', 'field_id', 'drupal_internal__nid',
+    'created', 'changed'
+]
+
 
 class IssueImporter:
     """
@@ -31,52 +39,38 @@ class IssueImporter:
         """
         self.client = client
 
-    def fetch_issues_for_audit(self, audit_uuid: str) -> List[Dict[str, Any]]:
+    def fetch_issues_for_audit(self, audit_uuid: str, changed_since: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch all issues for a given audit from Drupal.
 
         Args:
             audit_uuid: Drupal audit UUID
+            changed_since: Only fetch issues changed at or after this Unix
+                timestamp (None fetches all issues)
 
         Returns:
             List of issue dictionaries with parsed data
         """
-        logger.info(f"Fetching issues for audit {audit_uuid}")
+        logger.info(f"Fetching issues for audit {audit_uuid}"
+                    + (f" changed since {changed_since}" if changed_since is not None else ""))
+
+        params = {
+            'filter[field_parent_audit.id]': audit_uuid,
+            'sort': 'created',
+            'include': 'field_issue_type,field_location_on_page,field_wcag_chapter',
+            'fields[node--issue]': ','.join(ISSUE_FIELDS),
+            'fields[taxonomy_term--issue_type]': 'name',
+            'fields[node--wcag_chapter]': 'title',
+            **changed_since_filter(changed_since)
+        }
 
         all_issues = []
-        page_limit = 50
-        offset = 0
-
-        while True:
-            # Fetch issues with parent_audit filter
-            response = self.client.get(
-                'node/issue',
-                params={
-                    'filter[field_parent_audit.id]': audit_uuid,
-                    'page[limit]': page_limit,
-                    'page[offset]': offset,
-                    'include': 'field_issue_type,field_location_on_page,field_wcag_chapter'
-                }
-            )
-
-            issues = response.get('data', [])
-            if not issues:
-                break
-
-            # Parse each issue
-            for issue_node in issues:
-                try:
-                    parsed_issue = self._parse_issue_node(issue_node, response.get('included', []))
-                    all_issues.append(parsed_issue)
-                except Exception as e:
-                    logger.error(f"Error parsing issue node: {e}")
-                    continue
-
-            offset += page_limit
-
-            # If we got fewer than page_limit, we're done
-            if len(issues) < page_limit:
-                break
+        for issue_node, included in iter_nodes(self.client, 'node/issue', params):
+            try:
+                all_issues.append(self._parse_issue_node(issue_node, included))
+            except Exception as e:
+                logger.error(f"Error parsing issue node: {e}")
+                continue
 
         logger.info(f"Fetched {len(all_issues)} issues for audit {audit_uuid}")
         return all_issues
@@ -269,8 +263,10 @@ class IssueImporter:
             Issue model instance
         """
         # Convert timestamp to datetime
-        created_at = datetime.fromtimestamp(drupal_issue['created_timestamp']) if drupal_issue.get('created_timestamp') else datetime.now()
-        updated_at = datetime.fromtimestamp(drupal_issue['changed_timestamp']) if drupal_issue.get('changed_timestamp') else datetime.now()
+        created = to_timestamp(drupal_issue.get('created_timestamp'))
+        changed = to_timestamp(drupal_issue.get('changed_timestamp'))
+        created_at = datetime.fromtimestamp(created) if created is not None else datetime.now()
+        updated_at = datetime.fromtimestamp(changed) if changed is not None else datetime.now()
 
         # Map impact
         impact_str = drupal_issue['impact']
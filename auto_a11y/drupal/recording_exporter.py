@@ -8,6 +8,8 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from .export_engine import DrupalExportEngine, ExportJob, export_batch
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,6 +141,107 @@ class RecordingExporter:
         Returns:
             Dict with 'success', 'uuid', and optional 'error' keys
         """
+        return self.export_recording(
+            **self._recording_model_fields(recording, audit_uuid, discovered_page_uuids, include_french)
+        )
+
+    def prepare_recording(
+        self,
+        title: str,
+        description: Optional[str],
+        audit_uuid: str,
+        media_url: Optional[str] = None,
+        duration: Optional[str] = None,
+        auditor_name: Optional[str] = None,
+        auditor_role: Optional[str] = None,
+        recording_date: Optional[datetime] = None,
+        existing_uuid: Optional[str] = None,
+        discovered_page_uuids: Optional[List[str]] = None,
+        key: str = '',
+        previous_hash: Optional[str] = None,
+        context: Any = None
+    ) -> ExportJob:
+        """
+        Prepare a recording for concurrent export with DrupalExportEngine.
+
+        Takes the same arguments as export_recording, plus:
+            key: Stable identifier of the source record
+            previous_hash: Payload hash stored at the previous export, so an
+                unchanged recording is skipped
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/audit_video
+        """
+        payload = self._build_payload(
+            title=title,
+            description=description,
+            audit_uuid=audit_uuid,
+            media_url=media_url,
+            duration=duration,
+            auditor_name=auditor_name,
+            auditor_role=auditor_role,
+            recording_date=recording_date,
+            existing_uuid=existing_uuid,
+            discovered_page_uuids=discovered_page_uuids
+        )
+        return ExportJob(
+            endpoint='node/audit_video',
+            payload=payload,
+            key=key,
+            label=title,
+            existing_uuid=existing_uuid,
+            previous_hash=previous_hash,
+            context=context
+        )
+
+    def prepare_from_recording_model(
+        self,
+        recording,
+        audit_uuid: str,
+        discovered_page_uuids: Optional[List[str]] = None,
+        include_french: bool = False,
+        context: Any = None
+    ) -> ExportJob:
+        """
+        Prepare a Recording model instance for concurrent export.
+
+        Args:
+            recording: Recording model instance
+            audit_uuid: Drupal audit UUID to link to
+            discovered_page_uuids: Optional list of discovered page Drupal UUIDs to link
+            include_french: Whether to include French content if available
+            context: Caller data handed back with the result
+
+        Returns:
+            ExportJob for node/audit_video
+        """
+        return self.prepare_recording(
+            key=f'recording:{recording.id}',
+            previous_hash=recording.drupal_content_hash,
+            context=context,
+            **self._recording_model_fields(recording, audit_uuid, discovered_page_uuids, include_french)
+        )
+
+    def _recording_model_fields(
+        self,
+        recording,
+        audit_uuid: str,
+        discovered_page_uuids: Optional[List[str]],
+        include_french: bool
+    ) -> Dict[str, Any]:
+        """
+        Map a Recording model instance to export_recording arguments.
+
+        Args:
+            recording: Recording model instance
+            audit_uuid: Drupal audit UUID to link to
+            discovered_page_uuids: Optional list of discovered page Drupal UUIDs to link
+            include_french: Whether to include French content if available
+
+        Returns:
+            Keyword arguments for export_recording / prepare_recording
+        """
         # Build description HTML from recording details
         html_parts = []
 
@@ -231,7 +334,7 @@ class RecordingExporter:
 
         description = "\n".join(html_parts) if html_parts else None
 
-        return self.export_recording(
+        return dict(
             title=recording.title,
             description=description,
             audit_uuid=audit_uuid,
@@ -248,54 +351,35 @@ class RecordingExporter:
         recordings: List[Any],
         audit_uuid: str,
         continue_on_error: bool = True,
-        include_french: bool = False
+        include_french: bool = False,
+        engine: Optional[DrupalExportEngine] = None
     ) -> Dict[str, Any]:
         """
-        Export multiple recordings in batch.
+        Export multiple recordings concurrently.
+
+        Recordings whose payload matches their drupal_content_hash are
+        skipped, those with a drupal_video_uuid are updated and the rest are
+        created.
 
         Args:
             recordings: List of Recording model instances
             audit_uuid: Drupal audit UUID to link to
             continue_on_error: Whether to continue if individual exports fail
             include_french: Whether to include French content if available (defaults to False)
+            engine: DrupalExportEngine to use (defaults to one for this client)
 
         Returns:
-            Dict with 'total', 'success_count', 'failure_count', 'results' keys
+            Dict with 'total', 'success_count', 'failure_count', 'results' keys;
+            results are in the order of recordings and include the
+            'content_hash' to store with each exported recording
         """
-        results = []
-        success_count = 0
-        failure_count = 0
-
-        for i, recording in enumerate(recordings):
-            logger.info(f"Exporting recording {i+1}/{len(recordings)}: {recording.title}")
-
-            try:
-                result = self.export_from_recording_model(recording, audit_uuid, include_french=include_french)
-                results.append(result)
-
-                if result.get('success'):
-                    success_count += 1
-                else:
-                    failure_count += 1
-
-            except Exception as e:
-                logger.error(f"Unexpected error exporting recording: {e}")
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'recording_title': recording.title
-                })
-                failure_count += 1
-
-                if not continue_on_error:
-                    break
-
-        return {
-            'total': len(recordings),
-            'success_count': success_count,
-            'failure_count': failure_count,
-            'results': results
-        }
+        logger.info(f"Exporting {len(recordings)} recordings")
+        return export_batch(
+            engine or DrupalExportEngine.from_client(self.client),
+            recordings,
+            lambda recording: self.prepare_from_recording_model(recording, audit_uuid, include_french=include_french),
+            continue_on_error=continue_on_error
+        )
 
     def _build_payload(
         self,
@@ -4,36 +4,311 @@ Drupal Taxonomy Management
 Handles caching and lookup of Drupal taxonomy terms, particularly:
 - "interested_in_because" - Why pages are interesting (75 terms)
 - "page_elements" - Areas of display (16 terms)
+
+Term lists are shared by every worker and background job through
+SharedTermCache, so a vocabulary is only paged through once and then
+revalidated with a single request when it may have changed.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Entries kept in the process-local LRU
+LOCAL_MAX_ENTRIES = 32
+
+# Local entries are read from MongoDB again after this many seconds, so
+# refreshes made by other workers are picked up
+LOCAL_TTL_SECONDS = 60
+
+# Shared entries are revalidated against Drupal after this many seconds
+REVALIDATE_SECONDS = 600
+
+
+class SharedTermCache:
+    """
+    Term lists shared by every worker and background job.
+
+    Entries are stored in MongoDB (once configured) with a process-local LRU
+    in front. A stored entry is revalidated against Drupal every
+    REVALIDATE_SECONDS by asking for the newest `changed` value of the
+    collection, and is only fetched again when that value differs.
+    """
+
+    def __init__(
+        self,
+        collection=None,
+        max_entries: int = LOCAL_MAX_ENTRIES,
+        local_ttl_seconds: int = LOCAL_TTL_SECONDS,
+        revalidate_seconds: int = REVALIDATE_SECONDS
+    ):
+        """
+        Initialize shared term cache.
+
+        Args:
+            collection: MongoDB collection for entries (None = this process only)
+            max_entries: Entries kept in the process-local LRU
+            local_ttl_seconds: How long local entries are used without reading MongoDB
+            revalidate_seconds: How long entries are used without checking Drupal
+        """
+        self.collection = collection
+        self.max_entries = max_entries
+        self.local_ttl = timedelta(seconds=local_ttl_seconds)
+        self.revalidate_after = timedelta(seconds=revalidate_seconds)
+
+        # {key: {'items': [...], 'fingerprint': str, 'refreshed_at': datetime, 'checked_at': datetime, 'loaded_at': datetime}}
+        self._local: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def get(
+        self,
+        key: str,
+        fetch: Callable[[], List[Dict]],
+        probe: Callable[[], Optional[str]],
+        max_age: timedelta,
+        force_refresh: bool = False,
+        revalidate: bool = False
+    ) -> List[Dict]:
+        """
+        Get the items cached under a key.
+
+        Args:
+            key: Cache key (Drupal site and collection)
+            fetch: Returns every item of the collection from Drupal
+            probe: Returns the newest `changed` value of the collection
+            max_age: Entries fetched longer ago than this are fetched again
+            force_refresh: Fetch from Drupal even if cached
+            revalidate: Check Drupal for changes even if recently checked
+
+        Returns:
+            List of cached items
+        """
+        if not (force_refresh or revalidate):
+            local = self._local_get(key)
+            if local and datetime.now() - local['loaded_at'] < self.local_ttl:
+                return local['items']
+
+        with self._key_lock(key):
+            now = datetime.now()
+            entry = None if force_refresh else self._load(key)
+            stale = entry
+
+            if entry and now - entry['refreshed_at'] > max_age:
+                entry = None
+            if entry and (revalidate or now - entry['checked_at'] > self.revalidate_after):
+                entry = self._revalidate(key, entry, probe)
+
+            if entry is None:
+                try:
+                    entry = self._refresh(key, fetch, probe)
+                except Exception as e:
+                    if not stale:
+                        raise
+                    logger.warning(f"Could not refresh '{key}', using cached terms: {e}")
+                    entry = stale
+
+            entry['loaded_at'] = datetime.now()
+            self._local_put(key, entry)
+            return entry['items']
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached entries in this process and in MongoDB.
+
+        Args:
+            key: Entry to drop (None = every entry)
+        """
+        with self._lock:
+            if key is None:
+                self._local.clear()
+            else:
+                self._local.pop(key, None)
+
+        if self.collection is not None:
+            try:
+                self.collection.delete_many({} if key is None else {'_id': key})
+            except Exception as e:
+                logger.warning(f"Could not invalidate shared term cache: {e}")
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Lock held while an entry is loaded, so threads fetch it once"""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _local_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry:
+                self._local.move_to_end(key)
+            return entry
+
+    def _local_put(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry from MongoDB, or from the local LRU without MongoDB"""
+        if self.collection is None:
+            entry = self._local_get(key)
+            return dict(entry) if entry else None
+
+        try:
+            doc = self.collection.find_one({'_id': key})
+        except Exception as e:
+            logger.warning(f"Could not read shared term cache: {e}")
+            entry = self._local_get(key)
+            return dict(entry) if entry else None
+
+        if not doc:
+            return None
+        return {
+            'items': doc.get('items', []),
+            'fingerprint': doc.get('fingerprint'),
+            'refreshed_at': doc['refreshed_at'],
+            'checked_at': doc.get('checked_at', doc['refreshed_at'])
+        }
+
+    def _revalidate(self, key: str, entry: Dict[str, Any], probe) -> Optional[Dict[str, Any]]:
+        """Keep an entry Drupal reports unchanged; None if it must be fetched again"""
+        try:
+            fingerprint = probe()
+        except Exception as e:
+            logger.warning(f"Could not revalidate '{key}', using cached terms: {e}")
+            return entry
+
+        if fingerprint is None or fingerprint != entry['fingerprint']:
+            logger.info(f"'{key}' changed in Drupal")
+            return None
+
+        entry['checked_at'] = datetime.now()
+        if self.collection is not None:
+            try:
+                self.collection.update_one({'_id': key}, {'$set': {'checked_at': entry['checked_at']}})
+            except Exception as e:
+                logger.warning(f"Could not update shared term cache: {e}")
+        return entry
+
+    def _refresh(self, key: str, fetch, probe) -> Dict[str, Any]:
+        """Fetch an entry from Drupal and store it"""
+        # Probe before fetching: a change made in between is fetched again
+        # at the next revalidation rather than missed
+        try:
+            fingerprint = probe()
+        except Exception as e:
+            logger.warning(f"Could not read newest change of '{key}': {e}")
+            fingerprint = None
+
+        now = datetime.now()
+        entry = {'items': fetch(), 'fingerprint': fingerprint, 'refreshed_at': now, 'checked_at': now}
+
+        if self.collection is not None:
+            try:
+                self.collection.replace_one({'_id': key}, {'_id': key, **entry}, upsert=True)
+            except Exception as e:
+                logger.warning(f"Could not write shared term cache: {e}")
+        return entry
+
+
+# Cache used by every TaxonomyCache and WCAGChapterCache in this process
+_shared_term_cache = SharedTermCache()
+
+
+def configure_shared_term_cache(collection):
+    """
+    Store shared term lists in a MongoDB collection.
+
+    Args:
+        collection: MongoDB collection shared by every worker
+    """
+    _shared_term_cache.collection = collection
+
+
+def get_shared_term_cache() -> SharedTermCache:
+    """Get the process-wide shared term cache"""
+    return _shared_term_cache
+
+
+def _newest_changed(client, endpoint: str, resource_type: str) -> Optional[str]:
+    """Newest `changed` value of a JSON:API collection"""
+    response = client.get(endpoint, params={
+        'sort': '-changed',
+        'page[limit]': 1,
+        f'fields[{resource_type}]': 'changed'
+    })
+    data = response.get('data', [])
+    if not data:
+        return None
+    changed = data[0].get('attributes', {}).get('changed')
+    return str(changed) if changed is not None else None
+
+
+def _fetch_all(client, endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    """Page through every resource of a JSON:API collection"""
+    all_resources = []
+    page_limit = 50
+    offset = 0
+
+    while True:
+        # Use client.get() which now properly handles bracket encoding
+        response = client.get(
+            endpoint,
+            params={
+                **(params or {}),
+                'page[limit]': page_limit,
+                'page[offset]': offset
+            }
+        )
+
+        resources = response.get('data', [])
+        if not resources:
+            break
+
+        all_resources.extend(resources)
+        offset += page_limit
+
+        # If we got fewer than page_limit, we're done
+        if len(resources) < page_limit:
+            break
+
+    return all_resources
+
 
 class TaxonomyCache:
     """
     Cache for Drupal taxonomy terms with automatic refresh.
 
     Caches taxonomy terms by vocabulary and provides efficient lookup by name or UUID.
+    Term lists come from the shared term cache, so instances are cheap to create.
     """
 
-    def __init__(self, client, cache_duration_hours: int = 24):
+    def __init__(self, client, cache_duration_hours: int = 24, shared_cache: Optional[SharedTermCache] = None):
         """
         Initialize taxonomy cache.
 
         Args:
             client: DrupalJSONAPIClient instance
             cache_duration_hours: How long to cache terms before refresh (default: 24 hours)
+            shared_cache: Cache shared between instances (default: the process-wide cache)
         """
         self.client = client
         self.cache_duration = timedelta(hours=cache_duration_hours)
+        self.shared_cache = shared_cache or _shared_term_cache
 
-        # Cache structure: {vocabulary_name: {'terms': [...], 'last_updated': datetime, 'by_name': {}, 'by_uuid': {}}}
+        # Lookup maps built from the shared term lists:
+        # {vocabulary_name: {'terms': [...], 'by_name': {}, 'by_uuid': {}}}
         self._cache: Dict[str, dict] = {}
 
+        # Vocabularies already revalidated after a failed lookup
+        self._revalidated: set = set()
+
     def get_terms(self, vocabulary: str, force_refresh: bool = False) -> List[Dict]:
         """
         Get all terms for a vocabulary.
@@ -45,11 +320,7 @@ class TaxonomyCache:
         Returns:
             List of term dictionaries with 'uuid', 'name', 'tid', 'weight', etc.
         """
-        # Check if we need to refresh
-        if force_refresh or vocabulary not in self._cache or self._is_cache_expired(vocabulary):
-            self._refresh_vocabulary(vocabulary)
-
-        return self._cache.get(vocabulary, {}).get('terms', [])
+        return self._vocabulary(vocabulary, force_refresh=force_refresh)['terms']
 
     def get_uuid_by_name(self, vocabulary: str, term_name: str) -> Optional[str]:
         """
@@ -62,12 +333,10 @@ class TaxonomyCache:
         Returns:
             Term UUID or None if not found
         """
-        # Ensure vocabulary is cached
-        if vocabulary not in self._cache:
-            self._refresh_vocabulary(vocabulary)
-
-        by_name = self._cache.get(vocabulary, {}).get('by_name', {})
-        return by_name.get(term_name.lower())
+        uuid = self._vocabulary(vocabulary)['by_name'].get(term_name.lower())
+        if uuid is None and self._revalidate_after_miss(vocabulary):
+            uuid = self._vocabulary(vocabulary)['by_name'].get(term_name.lower())
+        return uuid
 
     def get_name_by_uuid(self, vocabulary: str, term_uuid: str) -> Optional[str]:
         """
@@ -80,12 +349,10 @@ class TaxonomyCache:
         Returns:
             Term name or None if not found
         """
-        # Ensure vocabulary is cached
-        if vocabulary not in self._cache:
-            self._refresh_vocabulary(vocabulary)
-
-        by_uuid = self._cache.get(vocabulary, {}).get('by_uuid', {})
-        return by_uuid.get(term_uuid)
+        name = self._vocabulary(vocabulary)['by_uuid'].get(term_uuid)
+        if name is None and self._revalidate_after_miss(vocabulary):
+            name = self._vocabulary(vocabulary)['by_uuid'].get(term_uuid)
+        return name
 
     def get_term_details(self, vocabulary: str, term_name: str) -> Optional[Dict]:
         """
@@ -98,11 +365,7 @@ class TaxonomyCache:
         Returns:
             Full term dictionary or None if not found
         """
-        # Ensure vocabulary is cached
-        if vocabulary not in self._cache:
-            self._refresh_vocabulary(vocabulary)
-
-        terms = self._cache.get(vocabulary, {}).get('terms', [])
+        terms = self._vocabulary(vocabulary)['terms']
         term_name_lower = term_name.lower()
 
         for term in terms:
@@ -155,6 +418,11 @@ class TaxonomyCache:
 
         return names
 
+    def warm(self, vocabularies: List[str]):
+        """Load vocabularies into the shared cache ahead of lookups."""
+        for vocab in vocabularies:
+            self._vocabulary(vocab)
+
     def refresh_all(self):
         """Refresh all cached vocabularies."""
         vocabularies = list(self._cache.keys())
@@ -162,20 +430,49 @@ class TaxonomyCache:
             self._refresh_vocabulary(vocab)
 
     def clear_cache(self):
-        """Clear all cached taxonomy data."""
+        """Clear all cached taxonomy data, including the shared term lists."""
+        for vocab in self._cache:
+            self.shared_cache.invalidate(self._key(vocab))
         self._cache.clear()
         logger.info("Taxonomy cache cleared")
 
-    def _is_cache_expired(self, vocabulary: str) -> bool:
-        """Check if cached vocabulary has expired."""
-        if vocabulary not in self._cache:
-            return True
+    def _key(self, vocabulary: str) -> str:
+        return f"{self.client.base_url}|taxonomy_term/{vocabulary}"
+
+    def _vocabulary(self, vocabulary: str, force_refresh: bool = False, revalidate: bool = False) -> dict:
+        """Get a vocabulary's terms and lookup maps, refreshing them when needed."""
+        terms = self.shared_cache.get(
+            self._key(vocabulary),
+            fetch=lambda: self._fetch_vocabulary(vocabulary),
+            probe=lambda: _newest_changed(self.client, f'taxonomy_term/{vocabulary}', f'taxonomy_term--{vocabulary}'),
+            max_age=self.cache_duration,
+            force_refresh=force_refresh,
+            revalidate=revalidate
+        )
+
+        cached = self._cache.get(vocabulary)
+        if cached is None or cached['terms'] is not terms:
+            cached = {
+                'terms': terms,
+                # Lookup maps (case-insensitive for names)
+                'by_name': {term['name'].lower(): term['uuid'] for term in terms},
+                'by_uuid': {term['uuid']: term['name'] for term in terms}
+            }
+            self._cache[vocabulary] = cached
+        return cached
 
-        last_updated = self._cache[vocabulary].get('last_updated')
-        if not last_updated:
-            return True
+    def _revalidate_after_miss(self, vocabulary: str) -> bool:
+        """
+        Check Drupal for changes after a failed lookup, once per vocabulary.
 
-        return datetime.now() - last_updated > self.cache_duration
+        Returns:
+            True if the vocabulary was revalidated
+        """
+        if vocabulary in self._revalidated:
+            return False
+        self._revalidated.add(vocabulary)
+        self._vocabulary(vocabulary, revalidate=True)
+        return True
 
     def _refresh_vocabulary(self, vocabulary: str):
         """
@@ -184,40 +481,24 @@ class TaxonomyCache:
         Args:
             vocabulary: Vocabulary machine name
         """
+        self._vocabulary(vocabulary, force_refresh=True)
+
+    def _fetch_vocabulary(self, vocabulary: str) -> List[Dict]:
+        """
+        Fetch every term of a vocabulary from Drupal.
+
+        Args:
+            vocabulary: Vocabulary machine name
+
+        Returns:
+            List of term dictionaries
+        """
         logger.info(f"Refreshing taxonomy vocabulary: {vocabulary}")
 
         try:
-            # Fetch all terms for this vocabulary
             # Use pagination to get all terms (some vocabularies have 75+ terms)
-            all_terms = []
-            page_limit = 50
-            offset = 0
-
-            while True:
-                # Use client.get() which now properly handles bracket encoding
-                response = self.client.get(
-                    f'taxonomy_term/{vocabulary}',
-                    params={
-                        'page[limit]': page_limit,
-                        'page[offset]': offset,
-                        'sort': 'weight,name'
-                    }
-                )
-
-                terms = response.get('data', [])
-                if not terms:
-                    break
-
-                all_terms.extend(terms)
-                offset += page_limit
-
-                # If we got fewer than page_limit, we're done
-                if len(terms) < page_limit:
-                    break
-
-            # Process terms into cache structure
-            by_name = {}
-            by_uuid = {}
+            all_terms = _fetch_all(self.client, f'taxonomy_term/{vocabulary}', {'sort': 'weight,name'})
+
             processed_terms = []
 
             for term in all_terms:
@@ -233,10 +514,6 @@ class TaxonomyCache:
                     logger.warning(f"Skipping invalid term in {vocabulary}: {term}")
                     continue
 
-                # Store in lookup maps (case-insensitive for names)
-                by_name[name.lower()] = uuid
-                by_uuid[uuid] = name
-
                 # Store full term details
                 processed_terms.append({
                     'uuid': uuid,
@@ -246,15 +523,8 @@ class TaxonomyCache:
                     'description': description
                 })
 
-            # Update cache
-            self._cache[vocabulary] = {
-                'terms': processed_terms,
-                'by_name': by_name,
-                'by_uuid': by_uuid,
-                'last_updated': datetime.now()
-            }
-
             logger.info(f"Cached {len(processed_terms)} terms for vocabulary '{vocabulary}'")
+            return processed_terms
 
         except Exception as e:
             logger.error(f"Failed to refresh vocabulary '{vocabulary}': {e}")
@@ -414,19 +684,23 @@ class WCAGChapterCache:
     that matches WCAG success criteria format (e.g., "1.3.1", "2.4.6").
     """
 
-    def __init__(self, client, cache_duration_hours: int = 24):
+    def __init__(self, client, cache_duration_hours: int = 24, shared_cache: Optional[SharedTermCache] = None):
         """
         Initialize WCAG chapter cache.
 
         Args:
             client: DrupalJSONAPIClient instance
             cache_duration_hours: How long to cache chapters before refresh (default: 24 hours)
+            shared_cache: Cache shared between instances (default: the process-wide cache)
         """
         self.client = client
         self.cache_duration = timedelta(hours=cache_duration_hours)
+        self.shared_cache = shared_cache or _shared_term_cache
 
-        # Cache structure: {'chapters': [...], 'by_number': {number: uuid}, 'by_uuid': {uuid: number}, 'last_updated': datetime}
+        # Lookup maps built from the shared chapter list:
+        # {'chapters': [...], 'by_number': {number: uuid}, 'by_uuid': {uuid: number}}
         self._cache: Optional[dict] = None
+        self._revalidated = False
 
     def get_chapters(self, force_refresh: bool = False) -> List[Dict]:
         """
@@ -438,10 +712,7 @@ class WCAGChapterCache:
         Returns:
             List of chapter dictionaries with 'uuid', 'number', 'title', etc.
         """
-        if force_refresh or not self._cache or self._is_cache_expired():
-            self._refresh_chapters()
-
-        return self._cache.get('chapters', [])
+        return self._chapters(force_refresh=force_refresh)['chapters']
 
     def get_uuid_by_number(self, chapter_number: str) -> Optional[str]:
         """
@@ -453,11 +724,10 @@ class WCAGChapterCache:
         Returns:
             Chapter UUID or None if not found
         """
-        if not self._cache:
-            self._refresh_chapters()
-
-        by_number = self._cache.get('by_number', {})
-        return by_number.get(chapter_number)
+        uuid = self._chapters()['by_number'].get(chapter_number)
+        if uuid is None and self._revalidate_after_miss():
+            uuid = self._chapters()['by_number'].get(chapter_number)
+        return uuid
 
     def get_number_by_uuid(self, chapter_uuid: str) -> Optional[str]:
         """
@@ -469,11 +739,10 @@ class WCAGChapterCache:
         Returns:
             Chapter number or None if not found
         """
-        if not self._cache:
-            self._refresh_chapters()
-
-        by_uuid = self._cache.get('by_uuid', {})
-        return by_uuid.get(chapter_uuid)
+        number = self._chapters()['by_uuid'].get(chapter_uuid)
+        if number is None and self._revalidate_after_miss():
+            number = self._chapters()['by_uuid'].get(chapter_uuid)
+        return number
 
     def lookup_uuids(self, chapter_numbers: List[str]) -> List[str]:
         """
@@ -501,55 +770,53 @@ class WCAGChapterCache:
         self._refresh_chapters()
 
     def clear_cache(self):
-        """Clear cached WCAG chapter data."""
+        """Clear cached WCAG chapter data, including the shared chapter list."""
+        self.shared_cache.invalidate(self._key())
         self._cache = None
         logger.info("WCAG chapter cache cleared")
 
-    def _is_cache_expired(self) -> bool:
-        """Check if cached chapters have expired."""
-        if not self._cache:
-            return True
-
-        last_updated = self._cache.get('last_updated')
-        if not last_updated:
-            return True
+    def _key(self) -> str:
+        return f"{self.client.base_url}|node/wcag_chapter"
+
+    def _chapters(self, force_refresh: bool = False, revalidate: bool = False) -> dict:
+        """Get the chapters and lookup maps, refreshing them when needed."""
+        chapters = self.shared_cache.get(
+            self._key(),
+            fetch=self._fetch_chapters,
+            probe=lambda: _newest_changed(self.client, 'node/wcag_chapter', 'node--wcag_chapter'),
+            max_age=self.cache_duration,
+            force_refresh=force_refresh,
+            revalidate=revalidate
+        )
+
+        if self._cache is None or self._cache['chapters'] is not chapters:
+            self._cache = {
+                'chapters': chapters,
+                'by_number': {chapter['number']: chapter['uuid'] for chapter in chapters},
+                'by_uuid': {chapter['uuid']: chapter['number'] for chapter in chapters}
+            }
+        return self._cache
 
-        return datetime.now() - last_updated > self.cache_duration
+    def _revalidate_after_miss(self) -> bool:
+        """Check Drupal for changes after a failed lookup, once per instance."""
+        if self._revalidated:
+            return False
+        self._revalidated = True
+        self._chapters(revalidate=True)
+        return True
 
     def _refresh_chapters(self):
         """Refresh WCAG chapters from Drupal."""
+        self._chapters(force_refresh=True)
+
+    def _fetch_chapters(self) -> List[Dict]:
+        """Fetch every WCAG chapter from Drupal."""
         logger.info("Refreshing WCAG chapters from Drupal")
 
         try:
             # Fetch all WCAG chapter nodes with pagination
-            all_chapters = []
-            page_limit = 50
-            offset = 0
-
-            while True:
-                # Use client.get() which now properly handles bracket encoding
-                response = self.client.get(
-                    'node/wcag_chapter',
-                    params={
-                        'page[limit]': page_limit,
-                        'page[offset]': offset
-                    }
-                )
-
-                chapters = response.get('data', [])
-                if not chapters:
-                    break
-
-                all_chapters.extend(chapters)
-                offset += page_limit
-
-                # If we got fewer than page_limit, we're done
-                if len(chapters) < page_limit:
-                    break
-
-            # Process chapters into cache structure
-            by_number = {}
-            by_uuid = {}
+            all_chapters = _fetch_all(self.client, 'node/wcag_chapter')
+
             processed_chapters = []
 
             for chapter in all_chapters:
@@ -563,10 +830,6 @@ class WCAGChapterCache:
                     logger.warning(f"Skipping invalid WCAG chapter: {chapter}")
                     continue
 
-                # Store in lookup maps
-                by_number[chapter_number] = uuid
-                by_uuid[uuid] = chapter_number
-
                 # Store full chapter details
                 processed_chapters.append({
                     'uuid': uuid,
@@ -575,15 +838,8 @@ class WCAGChapterCache:
                     'nid': nid
                 })
 
-            # Update cache
-            self._cache = {
-                'chapters': processed_chapters,
-                'by_number': by_number,
-                'by_uuid': by_uuid,
-                'last_updated': datetime.now()
-            }
-
             logger.info(f"Cached {len(processed_chapters)} WCAG chapters")
+            return processed_chapters
 
         except Exception as e:
             logger.error(f"Failed to refresh WCAG chapters: {e}")
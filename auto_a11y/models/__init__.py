@@ -4,7 +4,7 @@ Database models for Auto A11y Python
 
 from .project import Project, ProjectStatus, ProjectType, LivedExperienceTester, TestSupervisor
 from .website import Website, ScrapingConfig
-from .page import Page, PageStatus, DrupalSyncStatus
+from .page import Page, PageRef, PageStatus, DrupalSyncStatus
 from .test_result import TestResult, Violation, AIFinding, ImpactLevel
 from .document_reference import DocumentReference, DocumentType
 from .discovery_run import DiscoveryRun, DiscoveryStatus
@@ -35,7 +35,7 @@ from .permission_group import PermissionGroup
 __all__ = [
     'Project', 'ProjectStatus', 'ProjectType', 'LivedExperienceTester', 'TestSupervisor',
     'Website', 'ScrapingConfig',
-    'Page', 'PageStatus', 'DrupalSyncStatus',
+    'Page', 'PageRef', 'PageStatus', 'DrupalSyncStatus',
     'TestResult', 'Violation', 'AIFinding', 'ImpactLevel',
     'DocumentReference', 'DocumentType',
     'DiscoveryRun', 'DiscoveryStatus',
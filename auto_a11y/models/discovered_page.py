@@ -55,6 +55,7 @@ class DiscoveredPage:
     drupal_sync_status: DrupalSyncStatus = DrupalSyncStatus.NOT_SYNCED
     drupal_last_synced: Optional[datetime] = None
     drupal_error_message: Optional[str] = None
+    drupal_content_hash: Optional[str] = None  # Hash of the last exported payload
 
     # Metadata
     created_at: datetime = field(default_factory=datetime.now)
@@ -102,6 +103,7 @@ class DiscoveredPage:
             'drupal_sync_status': self.drupal_sync_status.value,
             'drupal_last_synced': self.drupal_last_synced,
             'drupal_error_message': self.drupal_error_message,
+            'drupal_content_hash': self.drupal_content_hash,
             'created_at': self.created_at,
             'updated_at': self.updated_at,
             'created_by': self.created_by
@@ -135,6 +137,7 @@ class DiscoveredPage:
             drupal_sync_status=DrupalSyncStatus(data.get('drupal_sync_status', 'not_synced')),
             drupal_last_synced=data.get('drupal_last_synced'),
             drupal_error_message=data.get('drupal_error_message'),
+            drupal_content_hash=data.get('drupal_content_hash'),
             created_at=data.get('created_at', datetime.now()),
             updated_at=data.get('updated_at', datetime.now()),
             created_by=data.get('created_by'),
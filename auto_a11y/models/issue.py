@@ -79,6 +79,7 @@ class Issue:
     drupal_sync_status: DrupalSyncStatus = DrupalSyncStatus.NOT_SYNCED
     drupal_last_synced: Optional[datetime] = None
     drupal_error_message: Optional[str] = None
+    drupal_content_hash: Optional[str] = None  # Hash of the last exported payload
 
     _id: Optional[ObjectId] = None
 
@@ -133,7 +134,8 @@ class Issue:
             'drupal_nid': self.drupal_nid,
             'drupal_sync_status': self.drupal_sync_status.value,
             'drupal_last_synced': self.drupal_last_synced,
-            'drupal_error_message': self.drupal_error_message
+            'drupal_error_message': self.drupal_error_message,
+            'drupal_content_hash': self.drupal_content_hash
         }
         if self._id:
             data['_id'] = self._id
@@ -193,6 +195,7 @@ class Issue:
             drupal_sync_status=DrupalSyncStatus(data.get('drupal_sync_status', 'not_synced')),
             drupal_last_synced=data.get('drupal_last_synced'),
             drupal_error_message=data.get('drupal_error_message'),
+            drupal_content_hash=data.get('drupal_content_hash'),
             _id=obj_id
         )
 
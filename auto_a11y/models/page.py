@@ -4,7 +4,7 @@ Page model for individual web pages
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, ClassVar, Dict
 from enum import Enum
 from bson import ObjectId
 
@@ -51,8 +51,10 @@ class Page:
     error_reason: Optional[str] = None  # Reason for discovery/test failure
     is_in_latest_discovery: bool = True  # Is this page in the most recent discovery?
     screenshot_path: Optional[str] = None  # Path to page screenshot
+    template_signature: Optional[str] = None  # Hash of the DOM skeleton, groups pages rendered from one template
     setup_script_id: Optional[str] = None  # Reference to page_setup_scripts._id
     visible_to_users: List[str] = field(default_factory=list)  # List of user IDs who can access this page (empty string for guest, user_id for authenticated)
+    latest_test_result_id: Optional[str] = None  # Most recent test_results._id, maintained by Database.create_test_result
 
     # Discovered Page (Drupal) Integration Fields
     is_flagged_for_discovery: bool = False  # Flag this page as "discovered page" for export to Drupal
@@ -104,8 +106,10 @@ class Page:
             'error_reason': self.error_reason,
             'is_in_latest_discovery': self.is_in_latest_discovery,
             'screenshot_path': self.screenshot_path,
+            'template_signature': self.template_signature,
             'setup_script_id': self.setup_script_id,
             'visible_to_users': self.visible_to_users,
+            'latest_test_result_id': self.latest_test_result_id,
             'is_flagged_for_discovery': self.is_flagged_for_discovery,
             'discovery_reasons': self.discovery_reasons,
             'discovery_areas': self.discovery_areas,
@@ -143,8 +147,10 @@ class Page:
             error_reason=data.get('error_reason'),
             is_in_latest_discovery=data.get('is_in_latest_discovery', True),
             screenshot_path=data.get('screenshot_path'),
+            template_signature=data.get('template_signature'),
             setup_script_id=data.get('setup_script_id'),
             visible_to_users=data.get('visible_to_users', []),
+            latest_test_result_id=data.get('latest_test_result_id'),
             is_flagged_for_discovery=data.get('is_flagged_for_discovery', False),
             discovery_reasons=data.get('discovery_reasons', []),
             discovery_areas=data.get('discovery_areas', []),
@@ -155,4 +161,42 @@ class Page:
             drupal_last_synced=data.get('drupal_last_synced'),
             drupal_error_message=data.get('drupal_error_message'),
             _id=data.get('_id')
-        )
\ No newline at end of file
+        )
+
+@dataclass
+class PageRef:
+    """Lightweight page projection used when iterating large websites"""
+
+    id: str
+    url: str
+    status: PageStatus = PageStatus.DISCOVERED
+    violation_count: int = 0
+    warning_count: int = 0
+    info_count: int = 0
+    discovery_count: int = 0
+    template_signature: Optional[str] = None
+
+    # MongoDB projection with only the fields above
+    PROJECTION: ClassVar[Dict[str, int]] = {
+        'url': 1,
+        'status': 1,
+        'violation_count': 1,
+        'warning_count': 1,
+        'info_count': 1,
+        'discovery_count': 1,
+        'template_signature': 1
+    }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PageRef':
+        """Create from a projected MongoDB document"""
+        return cls(
+            id=str(data['_id']),
+            url=data['url'],
+            status=PageStatus(data.get('status', 'discovered')),
+            violation_count=data.get('violation_count', 0),
+            warning_count=data.get('warning_count', 0),
+            info_count=data.get('info_count', 0),
+            discovery_count=data.get('discovery_count', 0),
+            template_signature=data.get('template_signature')
+        )
@@ -76,6 +76,7 @@ class RecordingIssue:
     drupal_sync_status: DrupalSyncStatus = DrupalSyncStatus.NOT_SYNCED
     drupal_last_synced: Optional[datetime] = None
     drupal_error_message: Optional[str] = None
+    drupal_content_hash: Optional[str] = None  # Hash of the last exported payload
 
     _id: Optional[ObjectId] = None
 
@@ -125,7 +126,8 @@ class RecordingIssue:
             'drupal_nid': self.drupal_nid,
             'drupal_sync_status': self.drupal_sync_status.value,
             'drupal_last_synced': self.drupal_last_synced,
-            'drupal_error_message': self.drupal_error_message
+            'drupal_error_message': self.drupal_error_message,
+            'drupal_content_hash': self.drupal_content_hash
         }
         if self._id:
             data['_id'] = self._id
@@ -195,6 +197,7 @@ class RecordingIssue:
             drupal_sync_status=DrupalSyncStatus(data.get('drupal_sync_status', 'not_synced')),
             drupal_last_synced=data.get('drupal_last_synced'),
             drupal_error_message=data.get('drupal_error_message'),
+            drupal_content_hash=data.get('drupal_content_hash'),
             _id=obj_id
         )
 
@@ -0,0 +1,51 @@
+"""
+Flask-Babel context for reports rendered outside a request
+
+Report generators translate with flask_babel (gettext, force_locale), which
+only works inside a Flask application context: without one, force_locale is
+a no-op and every string comes out in English. Report jobs run in task
+runner threads, queue workers and render pool processes that have no
+application, so they render inside report_locale, which pushes the context
+of a minimal application carrying the web app's translation catalogs.
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+from flask import Flask, has_app_context
+from flask_babel import Babel, force_locale
+
+# Translation catalogs of the web application
+TRANSLATIONS_DIR = Path(__file__).parent.parent / 'web' / 'translations'
+
+
+@lru_cache(maxsize=1)
+def translation_app() -> Flask:
+    """Minimal application providing the report translations"""
+    app = Flask('auto_a11y.reporting')
+    app.config['BABEL_DEFAULT_LOCALE'] = 'en'
+    app.config['BABEL_SUPPORTED_LOCALES'] = ['en', 'fr']
+    app.config['BABEL_TRANSLATION_DIRECTORIES'] = str(TRANSLATIONS_DIR)
+    Babel(app)
+    return app
+
+
+@contextmanager
+def report_locale(language: str = 'en'):
+    """
+    Translate into a report language, with or without a Flask application
+
+    Inside a request the current application is used; elsewhere the
+    translation application's context is pushed for the duration.
+
+    Args:
+        language: Locale code, e.g. 'en' or 'fr'
+    """
+    if has_app_context():
+        with force_locale(language):
+            yield
+        return
+
+    with translation_app().app_context(), force_locale(language):
+        yield
@@ -0,0 +1,121 @@
+"""
+XPath prefix index for matching issues to common components
+
+Reports and the Drupal deduplication service all need to know which common
+component (if any) contains an issue on a given page. Checking each issue
+against every component is O(issues x components); this index stores the
+component XPaths of each page in a trie keyed by path step, so a lookup only
+walks the issue's own XPath.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+
+
+def _xpath_steps(xpath: str) -> List[str]:
+    """Split an XPath into steps, ignoring trailing slashes"""
+    return xpath.rstrip('/').split('/')
+
+
+class _TrieNode:
+    """One XPath step; holds the components whose XPath ends here"""
+
+    __slots__ = ('children', 'components')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.components: List[Tuple[int, str]] = []
+
+
+class ComponentIndex:
+    """
+    Per-page prefix index over common component XPaths
+
+    An issue is within a component when its XPath equals the component's
+    XPath or continues it after a '/' step boundary, e.g. /html/body/nav/a is
+    within /html/body/nav but /html/body/nav2 is not. When several components
+    contain an issue they are returned in the order the components were given.
+    """
+
+    def __init__(self, common_components: Dict[str, Dict[str, Any]]):
+        """
+        Build the index
+
+        Args:
+            common_components: Mapping of component key -> component info with
+                an 'xpaths_by_page' dict (page_url -> xpath), as returned by
+                the _extract_common_components helpers
+        """
+        self.components = common_components
+        self._pages: Dict[str, _TrieNode] = {}
+
+        for rank, (key, comp_data) in enumerate(common_components.items()):
+            for page_url, xpath in comp_data.get('xpaths_by_page', {}).items():
+                if not xpath:
+                    continue
+                node = self._pages.setdefault(page_url, _TrieNode())
+                for step in _xpath_steps(xpath):
+                    child = node.children.get(step)
+                    if child is None:
+                        child = node.children[step] = _TrieNode()
+                    node = child
+                node.components.append((rank, key))
+
+    def find_all(self, page_url: str, issue_xpath: Optional[str]) -> List[str]:
+        """
+        Get every component containing an issue
+
+        Args:
+            page_url: URL of the page the issue was found on
+            issue_xpath: XPath of the issue element
+
+        Returns:
+            Component keys, in component order
+        """
+        node = self._pages.get(page_url)
+        if node is None or not issue_xpath:
+            return []
+
+        matches = []
+        for step in _xpath_steps(issue_xpath):
+            node = node.children.get(step)
+            if node is None:
+                break
+            matches.extend(node.components)
+
+        matches.sort()
+        return [key for _, key in matches]
+
+    def find(
+        self,
+        page_url: str,
+        issue_xpath: Optional[str],
+        user_context: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the first component containing an issue
+
+        Args:
+            page_url: URL of the page the issue was found on
+            issue_xpath: XPath of the issue element
+            user_context: If given, only components seen by this user match
+
+        Returns:
+            Component key, or None if the issue is not in a component
+        """
+        for key in self.find_all(page_url, issue_xpath):
+            if user_context is None or self.components[key].get('user_context', 'Guest') == user_context:
+                return key
+        return None
+
+    def contains(self, page_url: str, issue_xpath: Optional[str]) -> bool:
+        """
+        Check whether an issue is inside any component
+
+        Args:
+            page_url: URL of the page the issue was found on
+            issue_xpath: XPath of the issue element
+
+        Returns:
+            True if some component contains the issue
+        """
+        return bool(self.find_all(page_url, issue_xpath))
@@ -9,6 +9,7 @@ import json
 import logging
 from flask_babel import force_locale
 
+from auto_a11y.core.template_sampling import ROLE_SAMPLED
 from auto_a11y.reporting.ai_executive_summary import AIExecutiveSummaryGenerator
 from auto_a11y.ai.claude_client import ClaudeClient, ClaudeConfig
 from auto_a11y.reporting.issue_descriptions_translated import get_detailed_issue_description
@@ -324,7 +325,13 @@ class ComprehensiveReportGenerator:
                 'high_priority': 'High Priority',
                 'medium_priority': 'Medium Priority',
                 'low_priority': 'Low Priority',
-                'roadmap_note': 'Priority is determined by combining issue impact with frequency of occurrence.'
+                'roadmap_note': 'Priority is determined by combining issue impact with frequency of occurrence.',
+                'template_sampling': 'Template Sampling',
+                'template_sampling_note': 'These pages were tested with the light touchpoint subset only. The findings listed for their template were found on its representatives and are extrapolated to them.',
+                'sampled': 'Sampled',
+                'sampled_pages': 'Sampled pages',
+                'light_touchpoints': 'Light touchpoints',
+                'extrapolated_from': 'Extrapolated from'
             },
             'fr': {
                 'comprehensive_report': 'Rapport d\'accessibilité complet',
@@ -401,7 +408,13 @@ class ComprehensiveReportGenerator:
                 'high_priority': 'Priorité élevée',
                 'medium_priority': 'Priorité moyenne',
                 'low_priority': 'Priorité faible',
-                'roadmap_note': 'La priorité est déterminée en combinant l\'impact du problème avec la fréquence d\'occurrence.'
+                'roadmap_note': 'La priorité est déterminée en combinant l\'impact du problème avec la fréquence d\'occurrence.',
+                'template_sampling': 'Échantillonnage par gabarit',
+                'template_sampling_note': 'Ces pages ont été testées uniquement avec le sous-ensemble léger de points de contrôle. Les résultats indiqués pour leur gabarit ont été trouvés sur ses pages représentatives et leur sont extrapolés.',
+                'sampled': 'Échantillonnée',
+                'sampled_pages': 'Pages échantillonnées',
+                'light_touchpoints': 'Points de contrôle légers',
+                'extrapolated_from': 'Extrapolé depuis'
             }
         }
 
@@ -419,17 +432,38 @@ class ComprehensiveReportGenerator:
             'top_issues': [],
             'pages_with_most_issues': [],
             'wcag_compliance': {},
-            'historical_data': []
+            'historical_data': [],
+            'template_clusters': []
         }
         
         # Process all test results
         all_issues = []
         page_issue_counts = defaultdict(lambda: defaultdict(int))
+        template_clusters = {}
         
         for website_data in data.get('websites', []):
             for page_data in website_data.get('pages', []):
                 test_result = page_data.get('test_result')
                 page_url = page_data.get('page', {}).get('url', 'Unknown')
+
+                # Light-tested pages share their template's extrapolated findings
+                sampling = page_data.get('template_sampling') or {}
+                if sampling.get('role') == ROLE_SAMPLED:
+                    cluster = template_clusters.setdefault(
+                        (website_data.get('website', {}).get('url', ''), sampling.get('template_signature', '')),
+                        {
+                            'template_signature': sampling.get('template_signature', ''),
+                            'representatives': sampling.get('representatives', []),
+                            'light_touchpoints': sampling.get('light_touchpoints', []),
+                            'findings': [
+                                dict(item, kind=kind)
+                                for kind in ('violations', 'warnings', 'ai_findings')
+                                for item in sampling.get(kind, [])
+                            ],
+                            'pages': []
+                        }
+                    )
+                    cluster['pages'].append(page_url)
                 
                 if test_result:
                     # Count by type
@@ -538,16 +572,19 @@ class ComprehensiveReportGenerator:
         ]
         
         # Get pages with most issues
+        sampled_urls = {url for cluster in template_clusters.values() for url in cluster['pages']}
         page_totals = [
             {
                 'url': page,
                 'total': sum(counts.values()),
-                'breakdown': dict(counts)
+                'breakdown': dict(counts),
+                'sampled': page in sampled_urls
             }
             for page, counts in page_issue_counts.items()
         ]
         page_totals.sort(key=lambda x: x['total'], reverse=True)
         analytics['pages_with_most_issues'] = page_totals[:10]
+        analytics['template_clusters'] = list(template_clusters.values())
         
         # Calculate WCAG compliance percentage
         total_wcag_issues = sum(analytics['by_wcag'].values())
@@ -979,7 +1016,9 @@ class ComprehensiveReportGenerator:
             <h2>Page-by-Page Analysis</h2>
         """
         
-        for website_data in data.get('websites', []):
+        # Website reports carry their pages at the top level
+        website_sections = data.get('websites') or [{'website': data.get('website', {}), 'pages': data.get('pages', [])}]
+        for website_data in website_sections:
             website = website_data.get('website', {})
             html += f"""
             <div class="website-section">
@@ -1002,6 +1041,7 @@ class ComprehensiveReportGenerator:
                             <span class="metric">Info: {len(test_result.info)}</span>
                             <span class="metric">Discovery: {len(test_result.discovery)}</span>
                         </div>
+                        {self._generate_extrapolated_findings(page_data.get('template_sampling'))}
                     </div>
                     """
             
@@ -1996,13 +2036,34 @@ class ComprehensiveReportGenerator:
         else:
             return 'Review accessibility'
     
+    def _generate_extrapolated_findings(self, sampling: Optional[Dict[str, Any]]) -> str:
+        """Generate the sampled-page notice and the findings extrapolated from the template representatives"""
+        if not sampling or sampling.get('role') != ROLE_SAMPLED:
+            return ""
+        items = ""
+        for kind, label in (('violations', 'Error'), ('warnings', 'Warning'), ('ai_findings', 'AI Finding')):
+            for item in sampling.get(kind, []):
+                title = item.get('type', '') if kind == 'ai_findings' else item.get('id', '')
+                description = item.get('description_full', item.get('description', ''))
+                items += f"""
+                <li><strong>{label}: {title}</strong> {description}
+                    <span class="extrapolated-source">(extrapolated from {item['extrapolated_from']})</span></li>
+                """
+        return f"""
+                        <div class="template-sampling">
+                            <span class="priority-badge medium">Sampled</span>
+                            Tested with the light touchpoint subset ({', '.join(sampling.get('light_touchpoints', []))}).
+                            {f'<ul class="extrapolated-findings">{items}</ul>' if items else ''}
+                        </div>
+        """
+    
     def _generate_page_issues_rows(self, pages: list) -> str:
         """Generate page issues table rows"""
         html = ""
         for page in pages[:10]:
             html += f"""
             <tr>
-                <td>{page['url'][:50]}...</td>
+                <td>{page['url'][:50]}...{' <span class="priority-badge medium">Sampled</span>' if page.get('sampled') else ''}</td>
                 <td>{page['total']}</td>
                 <td>{page['breakdown'].get('error', 0)}</td>
                 <td>{page['breakdown'].get('warning', 0)}</td>
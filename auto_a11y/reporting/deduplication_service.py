@@ -18,6 +18,7 @@ from datetime import datetime
 
 from auto_a11y.models import DiscoveredPage
 from auto_a11y.core.database import Database
+from auto_a11y.reporting.component_index import ComponentIndex
 
 logger = logging.getLogger(__name__)
 
@@ -141,24 +142,6 @@ class AutomatedTestDeduplicationService:
         logger.info(f"Extracted {len(filtered_components)} common components (appearing on {min_pages}+ pages)")
         return filtered_components
 
-    def _xpath_is_within(self, issue_xpath: str, component_xpath: str) -> bool:
-        """
-        Check if an issue's XPath is within a component's XPath.
-
-        Args:
-            issue_xpath: XPath of the issue element
-            component_xpath: XPath of the component container
-
-        Returns:
-            True if issue is within component, False otherwise
-        """
-        if not issue_xpath or not component_xpath:
-            return False
-
-        # Simple check: issue xpath starts with component xpath
-        # This works for most cases since child elements have longer xpaths
-        return issue_xpath.startswith(component_xpath)
-
     def collect_pages_with_issues(
         self,
         project_data: Dict[str, Any]
@@ -458,6 +441,8 @@ class AutomatedTestDeduplicationService:
         for url_page in url_pages:
             url_to_page_id[url_page.url] = url_page.id
 
+        component_index = ComponentIndex(common_components)
+
         # Iterate through test results and link violations
         for website_data in project_data.get('websites', []):
             for page_result in website_data.get('pages', []):
@@ -485,16 +470,10 @@ class AutomatedTestDeduplicationService:
                         # Check if violation is in a common component
                         violation_xpath = getattr(violation, 'xpath', None) or getattr(violation, 'metadata', {}).get('xpath')
 
-                        if violation_xpath:
-                            # Try to match to a component by checking if xpath is within component
-                            for signature, comp_data in common_components.items():
-                                # Check if this page has this component
-                                if page_url in comp_data.get('pages', set()):
-                                    comp_xpath = comp_data['xpaths_by_page'].get(page_url, '')
-                                    if comp_xpath and self._xpath_is_within(violation_xpath, comp_xpath):
-                                        # This violation is in this component
-                                        discovered_page_id = component_signature_to_page_id.get(signature)
-                                        break
+                        signature = component_index.find(page_url, violation_xpath)
+                        if signature:
+                            # This violation is in this component
+                            discovered_page_id = component_signature_to_page_id.get(signature)
 
                         # If not in a component, link to page URL discovered page
                         if not discovered_page_id:
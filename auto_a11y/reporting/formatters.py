@@ -6,12 +6,15 @@ import json
 import csv
 import tempfile
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator, Iterable, Tuple, Callable
 from datetime import datetime
 from pathlib import Path
 import logging
+from auto_a11y.core.template_sampling import ROLE_REPRESENTATIVE, ROLE_SAMPLED, representative_findings, sampling_metadata
 from auto_a11y.reporting.comprehensive_report import ComprehensiveReportGenerator
+from auto_a11y.reporting.component_index import ComponentIndex
 from auto_a11y.reporting.issue_catalog import IssueCatalog
+from auto_a11y.reporting.pdf_renderer import PDFRenderer
 from io import StringIO
 
 logger = logging.getLogger(__name__)
@@ -167,6 +170,16 @@ class HTMLFormatter(BaseFormatter):
                 <p><strong>Session ID:</strong> {test_result.get('session_id', '')}</p>
                 """
 
+        # Pages tested with the light touchpoint subset of a template cluster
+        sampling = data.get('template_sampling') or {}
+        sampling_info = ""
+        if sampling.get('role') == ROLE_SAMPLED:
+            sampling_info = f"""
+                <p><strong>Template Sampling:</strong> Tested with the light touchpoint subset
+                    ({', '.join(sampling.get('light_touchpoints', []))}); other findings are extrapolated
+                    from the template representatives</p>
+                """
+
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -185,6 +198,7 @@ class HTMLFormatter(BaseFormatter):
                 <p><strong>Project:</strong> {data['project']['name']}</p>
                 <p><strong>Generated:</strong> {data['generated_at']}</p>
                 {page_state_info}
+                {sampling_info}
             </div>
         </header>
 
@@ -200,6 +214,8 @@ class HTMLFormatter(BaseFormatter):
 
         {self._format_ai_findings_section(data.get('ai_findings', []))}
 
+        {self._format_extrapolated_section(sampling)}
+
         {self._format_passes_section(data.get('passes', []))}
 
         <footer>
@@ -597,6 +613,33 @@ class HTMLFormatter(BaseFormatter):
         html += "</section>"
         return html
     
+    def _format_extrapolated_section(self, sampling: Dict[str, Any]) -> str:
+        """Format the findings extrapolated from the template representatives of a sampled page"""
+        if sampling.get('role') != ROLE_SAMPLED:
+            return ""
+        findings = sampling.get('violations', []) + sampling.get('warnings', []) + sampling.get('ai_findings', [])
+        if not findings:
+            return ""
+
+        html = "<section class='extrapolated'><h2>Extrapolated Findings</h2>"
+        html += "<p>Found on the template representatives and attributed to this page without being tested on it.</p>"
+        for kind, css_class in (('violations', 'violation'), ('warnings', 'warning'), ('ai_findings', 'ai-finding')):
+            for item in sampling.get(kind, []):
+                if kind == 'ai_findings':
+                    title, impact = item.get('type', 'AI Finding'), item.get('severity', 'moderate')
+                else:
+                    title, impact = item.get('id', 'Unknown'), item.get('impact', 'moderate')
+                html += f"""
+            <div class="{css_class}">
+                <h4>{title}
+                    <span class="impact {str(impact).lower()}">{str(impact).upper()}</span>
+                </h4>
+                <p><strong>Description:</strong> {item.get('description_full', item.get('description', 'No description'))}</p>
+                <p><strong>Extrapolated from:</strong> <a href="{item['extrapolated_from']}">{item['extrapolated_from']}</a></p>
+            </div>"""
+        html += "</section>"
+        return html
+    
     def _format_passes_section(self, passes: List[Dict]) -> str:
         """Format passes section"""
         if not passes:
@@ -804,7 +847,7 @@ class CSVFormatter(BaseFormatter):
         writer = csv.writer(output)
         
         # Write header
-        writer.writerow(['Type', 'Rule ID', 'Description', 'Impact', 'WCAG', 'Elements', 'Fix'])
+        writer.writerow(['Type', 'Rule ID', 'Description', 'Impact', 'WCAG', 'Elements', 'Fix', 'Basis'])
         
         # Write violations
         for v in data['violations']:
@@ -815,7 +858,8 @@ class CSVFormatter(BaseFormatter):
                 v.get('impact', ''),
                 ', '.join(v.get('wcag_criteria', [])),
                 v.get('node_count', 0),
-                v.get('suggested_fix', '')
+                v.get('suggested_fix', ''),
+                'Tested'
             ])
         
         # Write warnings
@@ -827,8 +871,25 @@ class CSVFormatter(BaseFormatter):
                 '',
                 '',
                 w.get('node_count', 0),
-                ''
+                '',
+                'Tested'
             ])
+
+        # Write findings extrapolated from the template representatives
+        sampling = data.get('template_sampling') or {}
+        if sampling.get('role') == ROLE_SAMPLED:
+            for kind, type_label in (('violations', 'Violation'), ('warnings', 'Warning'), ('ai_findings', 'AI Finding')):
+                for item in sampling.get(kind, []):
+                    writer.writerow([
+                        type_label,
+                        item.get('type', '') if kind == 'ai_findings' else item.get('id', ''),
+                        item.get('description_full', item.get('description', '')),
+                        item.get('severity', '') if kind == 'ai_findings' else item.get('impact', ''),
+                        ', '.join(item.get('wcag_criteria', [])),
+                        '',
+                        item.get('suggested_fix', ''),
+                        f"Extrapolated from {item['extrapolated_from']}"
+                    ])
         
         return output.getvalue()
     
@@ -838,18 +899,23 @@ class CSVFormatter(BaseFormatter):
         writer = csv.writer(output)
         
         # Write header
-        writer.writerow(['Page URL', 'Violations', 'Warnings', 'Passes', 'Last Tested'])
+        writer.writerow(['Page URL', 'Violations', 'Warnings', 'Passes', 'Last Tested',
+                         'Template Sampling', 'Extrapolated Violations', 'Extrapolated Warnings'])
         
         # Write page data
         for pr in data['pages']:
             page = pr['page']
             test = pr['test_result']
+            sampling = pr.get('template_sampling') or {}
             writer.writerow([
-                page.url,
+                page['url'] if isinstance(page, dict) else page.url,
                 test.violation_count,
                 test.warning_count,
                 test.pass_count,
-                test.test_date
+                test.test_date,
+                sampling.get('role', ''),
+                len(sampling.get('violations', [])),
+                len(sampling.get('warnings', []))
             ])
         
         return output.getvalue()
@@ -860,7 +926,8 @@ class CSVFormatter(BaseFormatter):
         writer = csv.writer(output)
         
         # Write header
-        writer.writerow(['Website', 'URL', 'Pages', 'Total Violations', 'Total Warnings'])
+        writer.writerow(['Website', 'URL', 'Pages', 'Total Violations', 'Total Warnings',
+                         'Sampled Pages', 'Extrapolated Violations', 'Extrapolated Warnings'])
         
         # Write website data
         for wd in data['websites']:
@@ -869,13 +936,18 @@ class CSVFormatter(BaseFormatter):
             
             total_violations = sum(p['test_result'].violation_count for p in pages)
             total_warnings = sum(p['test_result'].warning_count for p in pages)
+            sampled = [p['template_sampling'] for p in pages
+                       if (p.get('template_sampling') or {}).get('role') == ROLE_SAMPLED]
             
             writer.writerow([
-                website.name,
-                website.url,
+                website['name'] if isinstance(website, dict) else website.name,
+                website['url'] if isinstance(website, dict) else website.url,
                 len(pages),
                 total_violations,
-                total_warnings
+                total_warnings,
+                len(sampled),
+                sum(len(sampling['violations']) for sampling in sampled),
+                sum(len(sampling['warnings']) for sampling in sampled)
             ])
         
         return output.getvalue()
@@ -981,6 +1053,14 @@ class ExcelFormatter(BaseFormatter):
             'pseudoclasses': 'Pseudoclasses',
             'page_states': 'Page States',
             'test_users': 'Test Users',
+            'template_sampling': 'Extrapolated Findings',
+            'finding_basis': 'Basis',
+            'extrapolated_from_representative': 'Extrapolated from template representative',
+            'representative_page': 'Representative Page',
+            'template_signature': 'Template Signature',
+            'cluster_size': 'Pages in Template',
+            'extrapolated_page_count': 'Extrapolated Page Count',
+            'extrapolated_pages': 'Extrapolated To Pages',
         },
         'fr': {
             'summary': 'Résumé',
@@ -1059,6 +1139,14 @@ class ExcelFormatter(BaseFormatter):
             'pseudoclasses': 'Pseudoclasses',
             'page_states': 'États de page',
             'test_users': 'Utilisateurs de test',
+            'template_sampling': 'Résultats extrapolés',
+            'finding_basis': 'Fondement',
+            'extrapolated_from_representative': 'Extrapolé depuis la page représentative du gabarit',
+            'representative_page': 'Page représentative',
+            'template_signature': 'Signature du gabarit',
+            'cluster_size': 'Pages du gabarit',
+            'extrapolated_page_count': 'Nombre de pages extrapolées',
+            'extrapolated_pages': 'Pages extrapolées',
         }
     }
     
@@ -1067,9 +1155,12 @@ class ExcelFormatter(BaseFormatter):
         self.extension = 'xlsx'
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, Fill, PatternFill, Alignment, Border, Side
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, Fill, PatternFill, Alignment, Border, Side, NamedStyle
             from openpyxl.utils import get_column_letter
             self.Workbook = Workbook
+            self.WriteOnlyCell = WriteOnlyCell
+            self.NamedStyle = NamedStyle
             self.Font = Font
             self.Fill = Fill
             self.PatternFill = PatternFill
@@ -1257,6 +1348,14 @@ class ExcelFormatter(BaseFormatter):
         ws_common_components = wb.create_sheet(self._t('common_components'))
         self._create_common_components_sheet(ws_common_components, data, styles)
 
+        # Extrapolated Findings Sheet - only when pages were tested with template sampling
+        sampled_pages = {}
+        for website_name, page_url, test_result in self._iter_project_pages(data):
+            self._add_sampled_page(sampled_pages, website_name, page_url, test_result)
+        if sampled_pages:
+            ws_sampling = wb.create_sheet(self._t('template_sampling'))
+            self._create_template_sampling_sheet(ws_sampling, data, sampled_pages, styles)
+
         # Save to bytes
         from io import BytesIO
         output = BytesIO()
@@ -1264,6 +1363,184 @@ class ExcelFormatter(BaseFormatter):
         output.seek(0)
         return output.getvalue()
     
+    # Fixed column widths of streamed sheets - write-only worksheets cannot be
+    # measured after writing, so widths are set before the first row
+    STREAMING_COLUMN_WIDTHS = {
+        'project_summary': [28, 20],
+        'websites': [30, 50, 10, 16, 16],
+        'all_issues': [12, 12, 30, 20, 50, 50, 40, 50, 30, 50, 50, 50, 25, 15, 15, 25, 20, 20],
+        'all_issues_deduplicated': [12, 12, 30, 20, 50, 50, 40, 50, 30, 50, 50, 40, 50, 12, 15, 15, 25, 20, 20],
+        'common_components': [15, 30, 30, 12, 50, 50],
+        'template_sampling': [40, 12, 12, 30, 20, 50, 40, 50, 30, 20, 12, 12, 60],
+    }
+
+    def _register_named_styles(self, wb) -> Dict[str, str]:
+        """
+        Register the named styles used by streamed sheets
+
+        Named styles are stored once in the workbook and referenced by each
+        cell, instead of copying font/fill objects onto every cell.
+
+        Returns:
+            Mapping of style key -> named style name
+        """
+        styles = self._get_styles()
+        wrap = self.Alignment(wrap_text=True, vertical='top')
+
+        definitions = {
+            'header': styles['header'],
+            'title': {'font': self.Font(bold=True, size=14)},
+            'label': {'font': self.Font(bold=True)},
+            'note': {'font': self.Font(italic=True, color="666666"), 'alignment': self.Alignment(horizontal='center')},
+        }
+        for key in ('violation', 'warning', 'info', 'discovery'):
+            definitions[key] = {'fill': styles[key]['fill']}
+            definitions[f'{key}_wrap'] = {'fill': styles[key]['fill'], 'alignment': wrap}
+        for color in set(self.COMPONENT_FILLS.values()) | {self.DEFAULT_COMPONENT_FILL}:
+            fill = self.PatternFill(start_color=color, end_color=color, fill_type="solid")
+            definitions[f'component_{color}'] = {'fill': fill}
+            definitions[f'component_{color}_wrap'] = {'fill': fill, 'alignment': wrap}
+
+        names = {}
+        for key, attrs in definitions.items():
+            name = f'a11y_{key}'
+            wb.add_named_style(self.NamedStyle(name=name, **attrs))
+            names[key] = name
+        return names
+
+    def _create_streaming_sheet(self, wb, sheet_key: str, headers: List[str] = None, header_style: str = None):
+        """Create a write-only sheet with fixed column widths and an optional header row"""
+        ws = wb.create_sheet(self._t(sheet_key))
+        for col, width in enumerate(self.STREAMING_COLUMN_WIDTHS[sheet_key], 1):
+            ws.column_dimensions[self.get_column_letter(col)].width = width
+        if headers:
+            ws.append(self._styled_row(ws, headers, header_style))
+        return ws
+
+    def _styled_row(self, ws, values: List[Any], style: str = None, wrap_columns: Tuple[int, ...] = (), wrap_style: str = None) -> List[Any]:
+        """Build a row of write-only cells sharing a named style"""
+        row = []
+        for col, value in enumerate(values, 1):
+            cell = self.WriteOnlyCell(ws, value=value)
+            cell_style = wrap_style if col in wrap_columns else style
+            if cell_style:
+                cell.style = cell_style
+            row.append(cell)
+        return row
+
+    def write_project_report_streaming(
+        self,
+        project: Dict[str, Any],
+        websites: List[Dict[str, Any]],
+        iter_pages: Callable[[Dict[str, Any]], Iterable[Tuple[str, Any]]],
+        output_path: Path
+    ):
+        """
+        Write a project Excel report without holding the project's results in memory
+
+        Produces the same sheets as format_project_report using write-only
+        worksheets. Test results are pulled from iter_pages one page at a time
+        in two passes: the first writes 'All Issues' and collects common
+        components, the second deduplicates issues against the complete
+        component list and writes the 'Extrapolated Findings' of template
+        representatives. Only the deduplicated issue map and the URLs of
+        template-sampled pages are kept in memory.
+
+        Args:
+            project: Project dictionary
+            websites: Website dictionaries with 'name' and 'url'
+            iter_pages: Called with a website dictionary; returns a fresh iterable
+                of (page URL, test result) for its tested pages
+            output_path: File to write the workbook to
+        """
+        wb = self.Workbook(write_only=True)
+        style_names = self._register_named_styles(wb)
+        header = style_names['header']
+
+        ws_summary = self._create_streaming_sheet(wb, 'project_summary')
+        ws_websites = self._create_streaming_sheet(
+            wb, 'websites',
+            [self._t('website_name'), self._t('url'), self._t('pages'), self._t('total_violations'), self._t('total_warnings')],
+            header
+        )
+        ws_all_issues = self._create_streaming_sheet(wb, 'all_issues', self._project_all_issues_headers(), header)
+        ws_deduped = self._create_streaming_sheet(wb, 'all_issues_deduplicated', self._project_deduped_issues_headers(), header)
+        ws_components = self._create_streaming_sheet(wb, 'common_components', self._common_components_headers(), header)
+
+        # Pass 1: All Issues rows, common components, per-website totals and template-sampled pages
+        common_components = {}
+        sampled_pages = {}
+        website_totals = []
+        for website in websites:
+            totals = {'pages': 0, 'violations': 0, 'warnings': 0}
+            for page_url, test_result in iter_pages(website):
+                totals['pages'] += 1
+                totals['violations'] += getattr(test_result, 'violation_count', 0)
+                totals['warnings'] += getattr(test_result, 'warning_count', 0)
+                for style_key, values in self._project_issue_rows(website.get('name', ''), page_url, test_result):
+                    ws_all_issues.append(self._styled_row(ws_all_issues, values, style_names[style_key]))
+                self._add_page_components(common_components, page_url, test_result)
+                self._add_sampled_page(sampled_pages, website.get('name', ''), page_url, test_result)
+            website_totals.append((website, totals))
+
+        # Pass 2: deduplicate against the complete component list, and
+        # extrapolate template representatives' findings when sampling was used
+        ws_sampling = None
+        if sampled_pages:
+            ws_sampling = self._create_streaming_sheet(wb, 'template_sampling', self._template_sampling_headers(), header)
+
+        component_index = ComponentIndex(common_components)
+        unique_issues = {}
+        for website in websites:
+            for page_url, test_result in iter_pages(website):
+                self._add_page_deduped_issues(unique_issues, common_components, component_index, page_url, test_result)
+                if ws_sampling:
+                    for style_key, values in self._template_sampling_rows(website.get('name', ''), page_url, test_result, sampled_pages):
+                        ws_sampling.append(self._styled_row(ws_sampling, values, style_names[style_key]))
+
+        for style_key, values in self._deduped_issue_rows(unique_issues):
+            ws_deduped.append(self._styled_row(
+                ws_deduped, values, style_names[style_key],
+                wrap_columns=self.DEDUPED_WRAP_COLUMNS, wrap_style=style_names[f'{style_key}_wrap']
+            ))
+        del unique_issues
+
+        # Summary and websites sheets from the totals gathered in pass 1
+        total_pages = sum(totals['pages'] for _, totals in website_totals)
+        total_violations = sum(totals['violations'] for _, totals in website_totals)
+        ws_summary.append(self._styled_row(ws_summary, [f"Project Report - {project.get('name', 'Unknown')}"], style_names['title']))
+        ws_summary.append([])
+        for label, value, style in [
+            ("Total Websites:", len(websites), None),
+            ("Total Pages:", total_pages, None),
+            ("Total Violations:", total_violations, style_names['violation']),
+            ("Average Violations/Page:", f"{(total_violations / total_pages if total_pages else 0):.1f}", None),
+        ]:
+            ws_summary.append(self._styled_row(ws_summary, [label], style_names['label']) + self._styled_row(ws_summary, [value], style))
+
+        for website, totals in website_totals:
+            ws_websites.append(
+                self._styled_row(ws_websites, [website.get('name', ''), website.get('url', ''), totals['pages']])
+                + self._styled_row(ws_websites, [totals['violations']], style_names['violation'] if totals['violations'] else None)
+                + self._styled_row(ws_websites, [totals['warnings']], style_names['warning'] if totals['warnings'] else None)
+            )
+
+        component_rows = self._common_component_rows(common_components)
+        if component_rows:
+            ws_components.append(self._styled_row(
+                ws_components,
+                [f'Found {len(component_rows)} common components across {len(websites)} websites'],
+                style_names['note']
+            ))
+        for component_type, values in component_rows:
+            color = self.COMPONENT_FILLS.get(component_type, self.DEFAULT_COMPONENT_FILL)
+            ws_components.append(self._styled_row(
+                ws_components, values, style_names[f'component_{color}'],
+                wrap_columns=(5,), wrap_style=style_names[f'component_{color}_wrap']
+            ))
+
+        wb.save(output_path)
+
     def format_all_projects_report(self, data: Dict[str, Any]) -> bytes:
         """Generate Excel report for all projects"""
         if not self.has_openpyxl:
@@ -1770,17 +2047,23 @@ class ExcelFormatter(BaseFormatter):
 
         self._auto_adjust_columns(ws)
 
-    def _create_project_all_issues_sheet(self, ws, data, styles):
-        """Create a combined sheet with all issues from all pages across all websites"""
-        headers = [self._t('type'), self._t('impact'), self._t('rule_id'), self._t('touchpoint'), self._t('what'), self._t('why_important'), self._t('who_affected'), self._t('how_to_remediate'), self._t('wcag_criteria'), self._t('location_xpath'), self._t('element'), self._t('page_url'), self._t('website'), self._t('breakpoint_px'), self._t('pseudoclass'), self._t('page_state'), self._t('test_user'), self._t('user_roles')]
+    def _project_all_issues_headers(self) -> List[str]:
+        """Column headers of the project 'All Issues' sheet"""
+        return [self._t('type'), self._t('impact'), self._t('rule_id'), self._t('touchpoint'), self._t('what'), self._t('why_important'), self._t('who_affected'), self._t('how_to_remediate'), self._t('wcag_criteria'), self._t('location_xpath'), self._t('element'), self._t('page_url'), self._t('website'), self._t('breakpoint_px'), self._t('pseudoclass'), self._t('page_state'), self._t('test_user'), self._t('user_roles')]
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            self._apply_style(cell, styles['header'])
+    def _project_deduped_issues_headers(self) -> List[str]:
+        """Column headers of the project 'All Issues (Deduplicated)' sheet"""
+        return [self._t('type'), self._t('impact'), self._t('rule_id'), self._t('touchpoint'), self._t('what'), self._t('why_important'), self._t('who_affected'),
+                self._t('how_to_remediate'), self._t('wcag_criteria'), self._t('location_xpath'), self._t('element'),
+                self._t('common_component_s'), self._t('pages_with_issue'), self._t('page_count'), self._t('breakpoints'), self._t('pseudoclasses'), self._t('page_states'), self._t('test_users'), self._t('user_roles')]
 
-        row = 2
+    def _common_components_headers(self) -> List[str]:
+        """Column headers of the 'Common Components' sheet"""
+        return [self._t('component_type'), self._t('signature'), self._t('label'), self._t('page_count'), self._t('pages_found'), self._t('example_xpath')]
 
-        # Iterate through all websites and their pages
+    @staticmethod
+    def _iter_project_pages(data: Dict[str, Any]) -> Iterator[Tuple[str, str, Any]]:
+        """Yield (website name, page URL, test result) for every tested page in project report data"""
         for website_data in data.get('websites', []):
             website = website_data.get('website', {})
             website_name = website.get('name', '') if isinstance(website, dict) else getattr(website, 'name', '')
@@ -1790,250 +2073,284 @@ class ExcelFormatter(BaseFormatter):
                 page_url = page.get('url', '') if isinstance(page, dict) else getattr(page, 'url', '')
 
                 test_result = page_result.get('test_result')
-                if not test_result:
-                    continue
-
-                # Get page state description from test result if available
-                page_state_desc = ''
                 if test_result:
-                    page_state = getattr(test_result, 'page_state', None) if hasattr(test_result, 'page_state') else test_result.get('page_state')
-                    if page_state:
-                        if isinstance(page_state, dict):
-                            page_state_desc = page_state.get('description', '')
-                        elif hasattr(page_state, 'description'):
-                            page_state_desc = page_state.description
-
-                # Add violations (from list attributes) - enrich with catalog data
-                violations = getattr(test_result, 'violations', []) if hasattr(test_result, 'violations') else []
-                for v in violations:
-                    # Handle both Violation objects and dicts
-                    if hasattr(v, 'to_dict'):
-                        v_dict = v.to_dict()
-                    else:
-                        v_dict = v if isinstance(v, dict) else {}
-
-                    # Enrich with catalog information
-                    v_dict = IssueCatalog.enrich_issue(v_dict)
-
-                    ws.cell(row=row, column=1, value='Violation')
-                    ws.cell(row=row, column=2, value=str(v_dict.get('impact', 'Unknown')).upper())
-                    ws.cell(row=row, column=3, value=v_dict.get('id', ''))
-                    ws.cell(row=row, column=4, value=v_dict.get('touchpoint', v_dict.get('category', '')))
-                    ws.cell(row=row, column=5, value=v_dict.get('description_full', v_dict.get('what', v_dict.get('description', ''))))
-                    ws.cell(row=row, column=6, value=v_dict.get('why_it_matters', ''))
-                    ws.cell(row=row, column=7, value=v_dict.get('who_it_affects', ''))
-                    ws.cell(row=row, column=8, value=v_dict.get('how_to_fix', v_dict.get('remediation', v_dict.get('suggested_fix', ''))))
-                    ws.cell(row=row, column=9, value=v_dict.get('wcag_full', ', '.join(v_dict.get('wcag_criteria', [])) if isinstance(v_dict.get('wcag_criteria'), list) else v_dict.get('wcag_criteria', '')))
-                    ws.cell(row=row, column=10, value=v_dict.get('xpath', ''))
-                    ws.cell(row=row, column=11, value=v_dict.get('element', ''))
-                    ws.cell(row=row, column=12, value=page_url)
-                    ws.cell(row=row, column=13, value=website_name)
-
-                    # Add metadata columns
-                    metadata = v_dict.get('metadata', {})
-                    ws.cell(row=row, column=14, value=metadata.get('breakpoint', ''))
-                    ws.cell(row=row, column=15, value=metadata.get('pseudoclass', ''))
-                    ws.cell(row=row, column=16, value=page_state_desc)
-
-                    # Add authenticated user info
-                    auth_user = metadata.get('authenticated_user', {})
-                    if auth_user:
-                        ws.cell(row=row, column=17, value=auth_user.get('display_name', ''))
-                        ws.cell(row=row, column=18, value=', '.join(auth_user.get('roles', [])))
-                    else:
-                        ws.cell(row=row, column=17, value='Guest')
-                        ws.cell(row=row, column=18, value='no login')
-
-                    for col in range(1, 19):
-                        ws.cell(row=row, column=col).fill = styles['violation']['fill']
-                    row += 1
-
-                # Add warnings - enrich with catalog data
-                warnings = getattr(test_result, 'warnings', []) if hasattr(test_result, 'warnings') else []
-                for w in warnings:
-                    if hasattr(w, 'to_dict'):
-                        w_dict = w.to_dict()
-                    else:
-                        w_dict = w if isinstance(w, dict) else {}
-
-                    # Enrich with catalog information
-                    w_dict = IssueCatalog.enrich_issue(w_dict)
-
-                    ws.cell(row=row, column=1, value='Warning')
-                    ws.cell(row=row, column=2, value=str(w_dict.get('impact', 'Moderate')).upper())
-                    ws.cell(row=row, column=3, value=w_dict.get('id', ''))
-                    ws.cell(row=row, column=4, value=w_dict.get('touchpoint', w_dict.get('category', '')))
-                    ws.cell(row=row, column=5, value=w_dict.get('description_full', w_dict.get('what', w_dict.get('description', ''))))
-                    ws.cell(row=row, column=6, value=w_dict.get('why_it_matters', ''))
-                    ws.cell(row=row, column=7, value=w_dict.get('who_it_affects', ''))
-                    ws.cell(row=row, column=8, value=w_dict.get('how_to_fix', w_dict.get('remediation', w_dict.get('suggested_fix', ''))))
-                    ws.cell(row=row, column=9, value=w_dict.get('wcag_full', ', '.join(w_dict.get('wcag_criteria', [])) if isinstance(w_dict.get('wcag_criteria'), list) else w_dict.get('wcag_criteria', '')))
-                    ws.cell(row=row, column=10, value=w_dict.get('xpath', ''))
-                    ws.cell(row=row, column=11, value=w_dict.get('element', ''))
-                    ws.cell(row=row, column=12, value=page_url)
-                    ws.cell(row=row, column=13, value=website_name)
-
-                    # Add metadata columns
-                    metadata = w_dict.get('metadata', {})
-                    ws.cell(row=row, column=14, value=metadata.get('breakpoint', ''))
-                    ws.cell(row=row, column=15, value=metadata.get('pseudoclass', ''))
-                    ws.cell(row=row, column=16, value=page_state_desc)
-
-                    # Add authenticated user info
-                    auth_user = metadata.get('authenticated_user', {})
-                    if auth_user:
-                        ws.cell(row=row, column=17, value=auth_user.get('display_name', ''))
-                        ws.cell(row=row, column=18, value=', '.join(auth_user.get('roles', [])))
-                    else:
-                        ws.cell(row=row, column=17, value='Guest')
-                        ws.cell(row=row, column=18, value='no login')
-
-                    for col in range(1, 19):
-                        ws.cell(row=row, column=col).fill = styles['warning']['fill']
-                    row += 1
-
-                # Add info items - enrich with catalog data
-                info_items = getattr(test_result, 'info', []) if hasattr(test_result, 'info') else []
-                for i in info_items:
-                    if hasattr(i, 'to_dict'):
-                        i_dict = i.to_dict()
-                    else:
-                        i_dict = i if isinstance(i, dict) else {}
-
-                    # Enrich with catalog information
-                    i_dict = IssueCatalog.enrich_issue(i_dict)
-
-                    ws.cell(row=row, column=1, value='Info')
-                    ws.cell(row=row, column=2, value='INFO')
-                    ws.cell(row=row, column=3, value=i_dict.get('id', ''))
-                    ws.cell(row=row, column=4, value=i_dict.get('touchpoint', i_dict.get('category', '')))
-                    ws.cell(row=row, column=5, value=i_dict.get('description_full', i_dict.get('what', i_dict.get('description', ''))))
-                    ws.cell(row=row, column=6, value=i_dict.get('why_it_matters', ''))
-                    ws.cell(row=row, column=7, value=i_dict.get('who_it_affects', ''))
-                    ws.cell(row=row, column=8, value=i_dict.get('how_to_fix', i_dict.get('remediation', '')))
-                    ws.cell(row=row, column=9, value=i_dict.get('wcag_full', ', '.join(i_dict.get('wcag_criteria', [])) if isinstance(i_dict.get('wcag_criteria'), list) else i_dict.get('wcag_criteria', '')))
-                    ws.cell(row=row, column=10, value=i_dict.get('xpath', ''))
-                    ws.cell(row=row, column=11, value=i_dict.get('element', ''))
-                    ws.cell(row=row, column=12, value=page_url)
-                    ws.cell(row=row, column=13, value=website_name)
-
-                    # Add metadata columns
-                    metadata = i_dict.get('metadata', {})
-                    ws.cell(row=row, column=14, value=metadata.get('breakpoint', ''))
-                    ws.cell(row=row, column=15, value=metadata.get('pseudoclass', ''))
-                    ws.cell(row=row, column=16, value=page_state_desc)
-
-                    # Add authenticated user info
-                    auth_user = metadata.get('authenticated_user', {})
-                    if auth_user:
-                        ws.cell(row=row, column=17, value=auth_user.get('display_name', ''))
-                        ws.cell(row=row, column=18, value=', '.join(auth_user.get('roles', [])))
-                    else:
-                        ws.cell(row=row, column=17, value='Guest')
-                        ws.cell(row=row, column=18, value='no login')
-
-                    for col in range(1, 19):
-                        ws.cell(row=row, column=col).fill = styles['info']['fill']
-                    row += 1
-
-                # Add discovery items - enrich with catalog data
-                discovery_items = getattr(test_result, 'discovery', []) if hasattr(test_result, 'discovery') else []
-                for d in discovery_items:
-                    if hasattr(d, 'to_dict'):
-                        d_dict = d.to_dict()
-                    else:
-                        d_dict = d if isinstance(d, dict) else {}
-
-                    # Enrich with catalog information
-                    d_dict = IssueCatalog.enrich_issue(d_dict)
-
-                    ws.cell(row=row, column=1, value='Discovery')
-                    ws.cell(row=row, column=2, value='DISCOVERY')
-                    ws.cell(row=row, column=3, value=d_dict.get('id', ''))
-                    ws.cell(row=row, column=4, value=d_dict.get('touchpoint', d_dict.get('category', '')))
-                    ws.cell(row=row, column=5, value=d_dict.get('description_full', d_dict.get('what', d_dict.get('description', ''))))
-                    ws.cell(row=row, column=6, value=d_dict.get('why_it_matters', ''))
-                    ws.cell(row=row, column=7, value=d_dict.get('who_it_affects', ''))
-                    ws.cell(row=row, column=8, value=d_dict.get('how_to_fix', d_dict.get('remediation', '')))
-                    ws.cell(row=row, column=9, value=d_dict.get('wcag_full', ', '.join(d_dict.get('wcag_criteria', [])) if isinstance(d_dict.get('wcag_criteria'), list) else d_dict.get('wcag_criteria', '')))
-                    ws.cell(row=row, column=10, value=d_dict.get('xpath', ''))
-                    ws.cell(row=row, column=11, value=d_dict.get('element', ''))
-                    ws.cell(row=row, column=12, value=page_url)
-                    ws.cell(row=row, column=13, value=website_name)
-
-                    # Add metadata columns
-                    metadata = d_dict.get('metadata', {})
-                    ws.cell(row=row, column=14, value=metadata.get('breakpoint', ''))
-                    ws.cell(row=row, column=15, value=metadata.get('pseudoclass', ''))
-                    ws.cell(row=row, column=16, value=page_state_desc)
-
-                    # Add authenticated user info
-                    auth_user = metadata.get('authenticated_user', {})
-                    if auth_user:
-                        ws.cell(row=row, column=17, value=auth_user.get('display_name', ''))
-                        ws.cell(row=row, column=18, value=', '.join(auth_user.get('roles', [])))
-                    else:
-                        ws.cell(row=row, column=17, value='Guest')
-                        ws.cell(row=row, column=18, value='no login')
-
-                    for col in range(1, 19):
-                        ws.cell(row=row, column=col).fill = styles['discovery']['fill']
-                    row += 1
-
-                # Add AI findings if available
-                ai_findings = getattr(test_result, 'ai_findings', []) if hasattr(test_result, 'ai_findings') else []
-                for f in ai_findings:
-                    if hasattr(f, 'to_dict'):
-                        f_dict = f.to_dict()
-                    else:
-                        f_dict = f if isinstance(f, dict) else {}
-
-                    ws.cell(row=row, column=1, value='AI Finding')
-                    ws.cell(row=row, column=2, value=str(f_dict.get('severity', 'Unknown')).upper())
-                    ws.cell(row=row, column=3, value=f_dict.get('type', ''))
-                    ws.cell(row=row, column=4, value='')  # AI findings don't have touchpoint
-                    ws.cell(row=row, column=5, value=f_dict.get('description', ''))
-                    ws.cell(row=row, column=6, value='')
-                    ws.cell(row=row, column=7, value='')
-                    ws.cell(row=row, column=8, value=f_dict.get('suggested_fix', ''))
-                    ws.cell(row=row, column=9, value='')
-                    ws.cell(row=row, column=10, value='')
-                    ws.cell(row=row, column=11, value='')
-                    ws.cell(row=row, column=12, value=page_url)
-                    ws.cell(row=row, column=13, value=website_name)
-                    ws.cell(row=row, column=14, value='')  # AI findings don't have breakpoint
-                    ws.cell(row=row, column=15, value='')  # AI findings don't have pseudoclass
-                    ws.cell(row=row, column=16, value=page_state_desc)
-                    ws.cell(row=row, column=17, value='')  # AI findings don't have test user
-                    ws.cell(row=row, column=18, value='')  # AI findings don't have user roles
-
-                    for col in range(1, 19):
-                        ws.cell(row=row, column=col).fill = styles['info']['fill']
-                    row += 1
+                    yield website_name, page_url, test_result
+
+    @staticmethod
+    def _page_state_description(test_result) -> str:
+        """Description of the page state a test result was taken in"""
+        page_state = getattr(test_result, 'page_state', None) if hasattr(test_result, 'page_state') else test_result.get('page_state')
+        if isinstance(page_state, dict):
+            return page_state.get('description', '')
+        if page_state and hasattr(page_state, 'description'):
+            return page_state.description
+        return ''
+
+    @staticmethod
+    def _issue_items(test_result, attr: str) -> Iterator[Dict[str, Any]]:
+        """Yield the issues of one type from a test result as dictionaries"""
+        items = getattr(test_result, attr, []) if hasattr(test_result, attr) else []
+        for item in items:
+            if hasattr(item, 'to_dict'):
+                yield item.to_dict()
+            else:
+                yield item if isinstance(item, dict) else {}
+
+    def _project_issue_rows(self, website_name: str, page_url: str, test_result) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        Build the 'All Issues' rows of one page
+
+        Args:
+            website_name: Name of the page's website
+            page_url: Page URL
+            test_result: Latest test result of the page
+
+        Yields:
+            (style key, row values) in sheet order
+        """
+        page_state_desc = self._page_state_description(test_result)
+
+        # (list attribute, type label, style, impact override, impact default, suggested_fix fallback)
+        issue_types = [
+            ('violations', 'Violation', 'violation', None, 'Unknown', True),
+            ('warnings', 'Warning', 'warning', None, 'Moderate', True),
+            ('info', 'Info', 'info', 'INFO', None, False),
+            ('discovery', 'Discovery', 'discovery', 'DISCOVERY', None, False),
+        ]
+
+        for attr, type_label, style_key, impact_label, impact_default, use_suggested_fix in issue_types:
+            for issue_dict in self._issue_items(test_result, attr):
+                # Enrich with catalog information
+                issue_dict = IssueCatalog.enrich_issue(issue_dict)
+
+                remediation = issue_dict.get('remediation', issue_dict.get('suggested_fix', '')) if use_suggested_fix else issue_dict.get('remediation', '')
+                wcag = issue_dict.get('wcag_criteria', [])
+                metadata = issue_dict.get('metadata', {})
+
+                # Add authenticated user info
+                auth_user = metadata.get('authenticated_user', {})
+                if auth_user:
+                    test_user = auth_user.get('display_name', '')
+                    user_roles = ', '.join(auth_user.get('roles', []))
+                else:
+                    test_user, user_roles = 'Guest', 'no login'
+
+                yield style_key, [
+                    type_label,
+                    impact_label or str(issue_dict.get('impact', impact_default)).upper(),
+                    issue_dict.get('id', ''),
+                    issue_dict.get('touchpoint', issue_dict.get('category', '')),
+                    issue_dict.get('description_full', issue_dict.get('what', issue_dict.get('description', ''))),
+                    issue_dict.get('why_it_matters', ''),
+                    issue_dict.get('who_it_affects', ''),
+                    issue_dict.get('how_to_fix', remediation),
+                    issue_dict.get('wcag_full', ', '.join(wcag) if isinstance(wcag, list) else wcag),
+                    issue_dict.get('xpath', ''),
+                    issue_dict.get('element', ''),
+                    page_url,
+                    website_name,
+                    metadata.get('breakpoint', ''),
+                    metadata.get('pseudoclass', ''),
+                    page_state_desc,
+                    test_user,
+                    user_roles
+                ]
+
+        # AI findings have no touchpoint, WCAG mapping, location or test user
+        for f_dict in self._issue_items(test_result, 'ai_findings'):
+            yield 'info', [
+                'AI Finding',
+                str(f_dict.get('severity', 'Unknown')).upper(),
+                f_dict.get('type', ''),
+                '',
+                f_dict.get('description', ''),
+                '',
+                '',
+                f_dict.get('suggested_fix', ''),
+                '', '', '',
+                page_url,
+                website_name,
+                '', '',
+                page_state_desc,
+                '', ''
+            ]
+
+    def _create_project_all_issues_sheet(self, ws, data, styles):
+        """Create a combined sheet with all issues from all pages across all websites"""
+        for col, header in enumerate(self._project_all_issues_headers(), 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            self._apply_style(cell, styles['header'])
+
+        row = 2
+        for website_name, page_url, test_result in self._iter_project_pages(data):
+            for style_key, values in self._project_issue_rows(website_name, page_url, test_result):
+                fill = styles[style_key]['fill']
+                for col, value in enumerate(values, 1):
+                    ws.cell(row=row, column=col, value=value).fill = fill
+                row += 1
 
         self._auto_adjust_columns(ws)
 
-    def _xpath_is_within(self, issue_xpath: str, component_xpath: str) -> bool:
+    def _template_sampling_headers(self) -> List[str]:
+        """Column headers of the 'Extrapolated Findings' sheet"""
+        return [self._t('finding_basis'), self._t('type'), self._t('impact'), self._t('rule_id'), self._t('touchpoint'), self._t('what'),
+                self._t('location_xpath'), self._t('representative_page'), self._t('website'), self._t('template_signature'),
+                self._t('cluster_size'), self._t('extrapolated_page_count'), self._t('extrapolated_pages')]
+
+    def _add_sampled_page(self, sampled_pages: Dict[Tuple[str, str], List[str]], website_name: str, page_url: str, test_result):
+        """
+        Record a page tested with the light touchpoint subset under its template
+
+        Args:
+            sampled_pages: Mapping of (website name, template signature) -> page URLs, updated in place
+            website_name: Name of the page's website
+            page_url: Page URL
+            test_result: Latest test result of the page
+        """
+        sampling = sampling_metadata(test_result)
+        if sampling.get('role') == ROLE_SAMPLED:
+            sampled_pages.setdefault((website_name, sampling.get('template_signature', '')), []).append(page_url)
+
+    @staticmethod
+    def _join_urls(urls: List[str], max_length: int = 32000) -> str:
+        """Newline-separated URLs, shortened to fit in one Excel cell"""
+        joined = []
+        length = 0
+        for index, url in enumerate(urls):
+            length += len(url) + 1
+            if length > max_length:
+                joined.append(f'... (+{len(urls) - index})')
+                break
+            joined.append(url)
+        return '\n'.join(joined)
+
+    def _template_sampling_rows(self, website_name: str, page_url: str, test_result,
+                                sampled_pages: Dict[Tuple[str, str], List[str]]) -> Iterator[Tuple[str, List[Any]]]:
         """
-        Check if an issue's XPath is within a component's XPath.
+        Build the 'Extrapolated Findings' rows of one template representative
+
+        Findings from touchpoints outside the light subset, and AI findings,
+        were only looked for on the representatives; they are attributed to
+        the template's other pages and labelled as extrapolated.
 
         Args:
-            issue_xpath: XPath of the issue
-            component_xpath: XPath of the component
+            website_name: Name of the page's website
+            page_url: Page URL
+            test_result: Latest test result of the page
+            sampled_pages: Mapping of (website name, template signature) -> light-tested page URLs
 
-        Returns:
-            True if issue_xpath is within or equal to component_xpath
+        Yields:
+            (style key, row values) in sheet order; nothing for other pages
         """
-        if not issue_xpath or not component_xpath:
-            return False
+        sampling = sampling_metadata(test_result)
+        if sampling.get('role') != ROLE_REPRESENTATIVE:
+            return
+
+        signature = sampling.get('template_signature', '')
+        pages = sampled_pages.get((website_name, signature), [])
+        if not pages:
+            return
+        basis = self._t('extrapolated_from_representative')
+        cluster = [page_url, website_name, signature, sampling.get('cluster_size', ''), len(pages), self._join_urls(pages)]
+
+        for kind, finding in representative_findings(test_result, sampling.get('light_touchpoints', [])):
+            style_key, values = self._extrapolated_finding_cells(kind, finding)
+            yield style_key, [basis] + values + cluster
+
+    @staticmethod
+    def _extrapolated_finding_cells(kind: str, finding: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Style key and (type, impact, rule, touchpoint, what, xpath) cells of an extrapolated finding"""
+        if kind == 'ai_findings':
+            return 'info', [
+                'AI Finding',
+                str(finding.get('severity', 'Unknown')).upper(),
+                finding.get('type', ''),
+                '',
+                finding.get('description', ''),
+                '',
+            ]
+        style_key, type_label, impact_default = (
+            ('violation', 'Violation', 'Unknown') if kind == 'violations' else ('warning', 'Warning', 'Moderate')
+        )
+        issue_dict = IssueCatalog.enrich_issue(finding)
+        return style_key, [
+            type_label,
+            str(issue_dict.get('impact', impact_default)).upper(),
+            issue_dict.get('id', ''),
+            issue_dict.get('touchpoint', issue_dict.get('category', '')),
+            issue_dict.get('description_full', issue_dict.get('what', issue_dict.get('description', ''))),
+            issue_dict.get('xpath', ''),
+        ]
+
+    def _create_template_sampling_sheet(self, ws, data, sampled_pages: Dict[Tuple[str, str], List[str]], styles):
+        """Create a sheet attributing template representatives' findings to the template's light-tested pages"""
+        for col, header in enumerate(self._template_sampling_headers(), 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            self._apply_style(cell, styles['header'])
+
+        row = 2
+        for website_name, page_url, test_result in self._iter_project_pages(data):
+            for style_key, values in self._template_sampling_rows(website_name, page_url, test_result, sampled_pages):
+                fill = styles[style_key]['fill']
+                for col, value in enumerate(values, 1):
+                    ws.cell(row=row, column=col, value=value).fill = fill
+                row += 1
 
-        # Normalize xpaths by removing trailing slashes
-        issue_xpath = issue_xpath.rstrip('/')
-        component_xpath = component_xpath.rstrip('/')
+        self._auto_adjust_columns(ws)
+
+    def _add_page_components(self, common_components: Dict[str, Dict], page_url: str, test_result):
+        """
+        Record the common components (forms, navs, asides, sections, headers) found on one page
 
-        # Check if issue xpath starts with component xpath
-        # e.g., /html/body/nav/a is within /html/body/nav
-        return issue_xpath == component_xpath or issue_xpath.startswith(component_xpath + '/')
+        Args:
+            common_components: Mapping of signature -> component info, updated in place
+            page_url: Page URL
+            test_result: Latest test result of the page
+        """
+        for d_dict in self._issue_items(test_result, 'discovery'):
+            issue_id = d_dict.get('id', '')
+            metadata = d_dict.get('metadata', {})
+
+            # Extract signature and xpath for different component types
+            signature = None
+            component_type = None
+            label = None
+
+            if issue_id in ['DiscoFormOnPage', 'forms_DiscoFormOnPage']:
+                signature = metadata.get('formSignature')
+                component_type = 'Form'
+                field_count = metadata.get('fieldCount', 0)
+                label = f"Form ({field_count} fields)"
+            elif issue_id in ['DiscoNavFound', 'landmarks_DiscoNavFound']:
+                signature = metadata.get('navSignature')
+                component_type = 'Navigation'
+                label = metadata.get('navLabel', 'Navigation')
+            elif issue_id in ['DiscoAsideFound', 'landmarks_DiscoAsideFound']:
+                signature = metadata.get('asideSignature')
+                component_type = 'Aside'
+                label = metadata.get('asideLabel', 'Aside')
+            elif issue_id in ['DiscoSectionFound', 'landmarks_DiscoSectionFound']:
+                signature = metadata.get('sectionSignature')
+                component_type = 'Section'
+                label = metadata.get('sectionLabel', 'Section')
+            elif issue_id in ['DiscoHeaderFound', 'landmarks_DiscoHeaderFound']:
+                signature = metadata.get('headerSignature')
+                component_type = 'Header'
+                label = metadata.get('headerLabel', 'Header')
+
+            if signature and signature != 'unknown':
+                if signature not in common_components:
+                    common_components[signature] = {
+                        'type': component_type,
+                        'label': label,
+                        'signature': signature,  # Store signature for display
+                        'xpaths_by_page': {},  # page_url -> xpath
+                        'pages': set()
+                    }
+
+                xpath = d_dict.get('xpath', '') or metadata.get('xpath', '')
+                common_components[signature]['xpaths_by_page'][page_url] = xpath
+                common_components[signature]['pages'].add(page_url)
 
     def _extract_common_components(self, data: Dict[str, Any]) -> Dict[str, Dict]:
         """
@@ -2046,331 +2363,224 @@ class ExcelFormatter(BaseFormatter):
             Dictionary mapping signature -> component info with xpaths per page
         """
         common_components = {}
-
-        # Iterate through all websites and pages
-        for website_data in data.get('websites', []):
-            website = website_data.get('website', {})
-            website_name = website.get('name', '') if isinstance(website, dict) else getattr(website, 'name', '')
-
-            for page_result in website_data.get('pages', []):
-                page = page_result.get('page', {})
-                page_url = page.get('url', '') if isinstance(page, dict) else getattr(page, 'url', '')
-
-                test_result = page_result.get('test_result')
-                if not test_result:
-                    continue
-
-                # Get discovery items
-                discovery_items = getattr(test_result, 'discovery', []) if hasattr(test_result, 'discovery') else []
-
-                for d in discovery_items:
-                    if hasattr(d, 'to_dict'):
-                        d_dict = d.to_dict()
-                    else:
-                        d_dict = d if isinstance(d, dict) else {}
-
-                    issue_id = d_dict.get('id', '')
-                    metadata = d_dict.get('metadata', {})
-
-                    # Extract signature and xpath for different component types
-                    signature = None
-                    component_type = None
-                    label = None
-
-                    if issue_id in ['DiscoFormOnPage', 'forms_DiscoFormOnPage']:
-                        signature = metadata.get('formSignature')
-                        component_type = 'Form'
-                        field_count = metadata.get('fieldCount', 0)
-                        label = f"Form ({field_count} fields)"
-                    elif issue_id in ['DiscoNavFound', 'landmarks_DiscoNavFound']:
-                        signature = metadata.get('navSignature')
-                        component_type = 'Navigation'
-                        label = metadata.get('navLabel', 'Navigation')
-                    elif issue_id in ['DiscoAsideFound', 'landmarks_DiscoAsideFound']:
-                        signature = metadata.get('asideSignature')
-                        component_type = 'Aside'
-                        label = metadata.get('asideLabel', 'Aside')
-                    elif issue_id in ['DiscoSectionFound', 'landmarks_DiscoSectionFound']:
-                        signature = metadata.get('sectionSignature')
-                        component_type = 'Section'
-                        label = metadata.get('sectionLabel', 'Section')
-                    elif issue_id in ['DiscoHeaderFound', 'landmarks_DiscoHeaderFound']:
-                        signature = metadata.get('headerSignature')
-                        component_type = 'Header'
-                        label = metadata.get('headerLabel', 'Header')
-
-                    if signature and signature != 'unknown':
-                        if signature not in common_components:
-                            common_components[signature] = {
-                                'type': component_type,
-                                'label': label,
-                                'signature': signature,  # Store signature for display
-                                'xpaths_by_page': {},  # page_url -> xpath
-                                'pages': set()
-                            }
-
-                        xpath = d_dict.get('xpath', '') or metadata.get('xpath', '')
-                        common_components[signature]['xpaths_by_page'][page_url] = xpath
-                        common_components[signature]['pages'].add(page_url)
-
+        for _, page_url, test_result in self._iter_project_pages(data):
+            self._add_page_components(common_components, page_url, test_result)
         return common_components
 
-    def _create_project_deduped_issues_sheet(self, ws, data, styles):
-        """Create a deduplicated issues sheet that groups issues by common components"""
-        headers = [self._t('type'), self._t('impact'), self._t('rule_id'), self._t('touchpoint'), self._t('what'), self._t('why_important'), self._t('who_affected'),
-                   self._t('how_to_remediate'), self._t('wcag_criteria'), self._t('location_xpath'), self._t('element'),
-                   self._t('common_component_s'), self._t('pages_with_issue'), self._t('page_count'), self._t('breakpoints'), self._t('pseudoclasses'), self._t('page_states'), self._t('test_users'), self._t('user_roles')]
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            self._apply_style(cell, styles['header'])
-
-        row = 2
+    def _add_page_deduped_issues(
+        self,
+        unique_issues: Dict[tuple, Dict[str, Any]],
+        common_components: Dict[str, Dict],
+        component_index: ComponentIndex,
+        page_url: str,
+        test_result
+    ):
+        """
+        Merge the issues of one page into the deduplicated issue map
 
-        # Extract common components from discovery issues
-        common_components = self._extract_common_components(data)
+        Args:
+            unique_issues: (rule_id, component(s) or xpath) -> issue data, updated in place
+            common_components: Common components of the project
+            component_index: Index over common_components
+            page_url: Page URL
+            test_result: Latest test result of the page
+        """
+        page_state_desc = self._page_state_description(test_result)
+
+        # Process all issue types
+        for issue_type, issue_list_attr in [('violation', 'violations'), ('warning', 'warnings'),
+                                              ('info', 'info'), ('discovery', 'discovery')]:
+            for issue_dict in self._issue_items(test_result, issue_list_attr):
+                # Enrich with catalog information
+                issue_dict = IssueCatalog.enrich_issue(issue_dict)
+
+                rule_id = issue_dict.get('id', '')
+                issue_xpath = issue_dict.get('xpath', '')
+
+                # Get metadata (breakpoint, pseudoclass)
+                metadata = issue_dict.get('metadata', {})
+                breakpoint = metadata.get('breakpoint', '')
+                pseudoclass = metadata.get('pseudoclass', '')
+
+                # Find which common components contain this issue
+                # Format like Discovery Report: "Type signature"
+                containing_components = [
+                    f"{common_components[signature]['type']} {common_components[signature]['signature']}"
+                    for signature in component_index.find_all(page_url, issue_xpath)
+                ]
+
+                # Create deduplication key
+                if containing_components:
+                    # Dedupe by rule_id + component(s)
+                    dedup_key = (rule_id, tuple(sorted(containing_components)))
+                else:
+                    # Dedupe by rule_id + exact xpath for non-component issues
+                    dedup_key = (rule_id, issue_xpath)
+
+                if dedup_key not in unique_issues:
+                    unique_issues[dedup_key] = {
+                        'type': issue_type,
+                        'data': issue_dict,
+                        'component': ', '.join(containing_components) if containing_components else '',
+                        'pages': set(),
+                        'page_xpaths': {},  # page -> xpath mapping
+                        'breakpoints': set(),  # Track all breakpoints where this issue appears
+                        'pseudoclasses': set(),  # Track all pseudoclasses
+                        'page_states': set(),  # Track all page states
+                        'test_users': set(),  # Track all test users who encountered this
+                        'user_roles': set()  # Track all unique user roles
+                    }
 
-        # Track unique issues: (rule_id, xpath_or_component) -> issue data
-        unique_issues = {}
+                issue_data = unique_issues[dedup_key]
+                issue_data['pages'].add(page_url)
+                issue_data['page_xpaths'][page_url] = issue_xpath
+
+                # Add metadata to tracking sets
+                if breakpoint:
+                    issue_data['breakpoints'].add(breakpoint)
+                if pseudoclass:
+                    issue_data['pseudoclasses'].add(pseudoclass)
+                if page_state_desc:
+                    issue_data['page_states'].add(page_state_desc)
+
+                # Track authenticated user info
+                auth_user = metadata.get('authenticated_user', {})
+                if auth_user:
+                    user_name = auth_user.get('display_name', '')
+                    if user_name:
+                        issue_data['test_users'].add(user_name)
+                    issue_data['user_roles'].update(auth_user.get('roles', []) or [])
+                else:
+                    issue_data['test_users'].add('Guest')
+                    issue_data['user_roles'].add('no login')
 
-        # Iterate through all websites and their pages
-        for website_data in data.get('websites', []):
-            website = website_data.get('website', {})
-            website_name = website.get('name', '') if isinstance(website, dict) else getattr(website, 'name', '')
+    # Columns of the deduplicated sheet holding multi-line values
+    DEDUPED_WRAP_COLUMNS = (13, 17)
 
-            for page_result in website_data.get('pages', []):
-                page = page_result.get('page', {})
-                page_url = page.get('url', '') if isinstance(page, dict) else getattr(page, 'url', '')
-
-                test_result = page_result.get('test_result')
-                if not test_result:
-                    continue
+    def _deduped_issue_rows(self, unique_issues: Dict[tuple, Dict[str, Any]]) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        Build the deduplicated sheet rows, sorted by issue type and rule
 
-                # Get page state description from test result if available
-                page_state_desc = ''
-                if test_result:
-                    page_state = getattr(test_result, 'page_state', None) if hasattr(test_result, 'page_state') else test_result.get('page_state')
-                    if page_state:
-                        if isinstance(page_state, dict):
-                            page_state_desc = page_state.get('description', '')
-                        elif hasattr(page_state, 'description'):
-                            page_state_desc = page_state.description
-
-                # Process all issue types
-                for issue_type, issue_list_attr in [('violation', 'violations'), ('warning', 'warnings'),
-                                                      ('info', 'info'), ('discovery', 'discovery')]:
-                    issues = getattr(test_result, issue_list_attr, []) if hasattr(test_result, issue_list_attr) else []
-
-                    for issue in issues:
-                        if hasattr(issue, 'to_dict'):
-                            issue_dict = issue.to_dict()
-                        else:
-                            issue_dict = issue if isinstance(issue, dict) else {}
-
-                        # Enrich with catalog information
-                        issue_dict = IssueCatalog.enrich_issue(issue_dict)
-
-                        rule_id = issue_dict.get('id', '')
-                        issue_xpath = issue_dict.get('xpath', '')
-
-                        # Get metadata (breakpoint, pseudoclass)
-                        metadata = issue_dict.get('metadata', {})
-                        breakpoint = metadata.get('breakpoint', '')
-                        pseudoclass = metadata.get('pseudoclass', '')
-
-                        # Find which common components contain this issue
-                        containing_components = []
-                        for signature, comp_data in common_components.items():
-                            # Check if this issue is within this component on this page
-                            comp_xpath = comp_data['xpaths_by_page'].get(page_url)
-                            if comp_xpath and self._xpath_is_within(issue_xpath, comp_xpath):
-                                # Format like Discovery Report: "Type signature"
-                                containing_components.append(f"{comp_data['type']} {comp_data['signature']}")
-
-                        # Create deduplication key
-                        if containing_components:
-                            # Dedupe by rule_id + component(s)
-                            dedup_key = (rule_id, tuple(sorted(containing_components)))
-                        else:
-                            # Dedupe by rule_id + exact xpath for non-component issues
-                            dedup_key = (rule_id, issue_xpath)
-
-                        if dedup_key not in unique_issues:
-                            unique_issues[dedup_key] = {
-                                'type': issue_type,
-                                'data': issue_dict,
-                                'component': ', '.join(containing_components) if containing_components else '',
-                                'pages': set(),
-                                'page_xpaths': {},  # page -> xpath mapping
-                                'breakpoints': set(),  # Track all breakpoints where this issue appears
-                                'pseudoclasses': set(),  # Track all pseudoclasses
-                                'page_states': set(),  # Track all page states
-                                'test_users': set(),  # Track all test users who encountered this
-                                'user_roles': set()  # Track all unique user roles
-                            }
-
-                        unique_issues[dedup_key]['pages'].add(page_url)
-                        unique_issues[dedup_key]['page_xpaths'][page_url] = issue_xpath
-
-                        # Add metadata to tracking sets
-                        if breakpoint:
-                            unique_issues[dedup_key]['breakpoints'].add(breakpoint)
-                        if pseudoclass:
-                            unique_issues[dedup_key]['pseudoclasses'].add(pseudoclass)
-                        if page_state_desc:
-                            unique_issues[dedup_key]['page_states'].add(page_state_desc)
-
-                        # Track authenticated user info
-                        auth_user = metadata.get('authenticated_user', {})
-                        if auth_user:
-                            user_name = auth_user.get('display_name', '')
-                            user_roles = auth_user.get('roles', [])
-
-                            if user_name:
-                                unique_issues[dedup_key]['test_users'].add(user_name)
-
-                            if user_roles:
-                                for role in user_roles:
-                                    unique_issues[dedup_key]['user_roles'].add(role)
-                        else:
-                            unique_issues[dedup_key]['test_users'].add('Guest')
-                            unique_issues[dedup_key]['user_roles'].add('no login')
+        Yields:
+            (style key, row values)
+        """
+        type_labels = {'violation': 'Violation', 'warning': 'Warning', 'info': 'Info', 'discovery': 'Discovery'}
 
-        # Write deduplicated issues to sheet
         for (rule_id, dedup_value), issue_data in sorted(unique_issues.items(),
                                                           key=lambda x: (x[1]['type'], x[0][0])):
             v_dict = issue_data['data']
             issue_type = issue_data['type']
-
-            # Determine fill color based on type
-            if issue_type == 'violation':
-                fill_color = styles['violation']['fill']
-                type_label = 'Violation'
-            elif issue_type == 'warning':
-                fill_color = styles['warning']['fill']
-                type_label = 'Warning'
-            elif issue_type == 'info':
-                fill_color = styles['info']['fill']
-                type_label = 'Info'
-            else:  # discovery
-                fill_color = styles.get('discovery', {}).get('fill', styles['info']['fill'])
-                type_label = 'Discovery'
-
-            ws.cell(row=row, column=1, value=type_label)
-            ws.cell(row=row, column=2, value=str(v_dict.get('impact', 'Unknown')).upper())
-            ws.cell(row=row, column=3, value=rule_id)
-            ws.cell(row=row, column=4, value=v_dict.get('touchpoint', v_dict.get('category', '')))
-            ws.cell(row=row, column=5, value=v_dict.get('description_full', v_dict.get('what', v_dict.get('description', ''))))
-            ws.cell(row=row, column=6, value=v_dict.get('why_it_matters', ''))
-            ws.cell(row=row, column=7, value=v_dict.get('who_it_affects', ''))
-            ws.cell(row=row, column=8, value=v_dict.get('how_to_fix', v_dict.get('remediation', v_dict.get('suggested_fix', ''))))
-            ws.cell(row=row, column=9, value=v_dict.get('wcag_full', ', '.join(v_dict.get('wcag_criteria', [])) if isinstance(v_dict.get('wcag_criteria'), list) else v_dict.get('wcag_criteria', '')))
+            wcag = v_dict.get('wcag_criteria', [])
 
             # For location, show one representative xpath
-            representative_xpath = list(issue_data['page_xpaths'].values())[0] if issue_data['page_xpaths'] else ''
-            ws.cell(row=row, column=10, value=representative_xpath)
-
-            ws.cell(row=row, column=11, value=v_dict.get('element', ''))
-            ws.cell(row=row, column=12, value=issue_data['component'])
+            representative_xpath = next(iter(issue_data['page_xpaths'].values()), '')
+
+            yield issue_type, [
+                type_labels.get(issue_type, 'Discovery'),
+                str(v_dict.get('impact', 'Unknown')).upper(),
+                rule_id,
+                v_dict.get('touchpoint', v_dict.get('category', '')),
+                v_dict.get('description_full', v_dict.get('what', v_dict.get('description', ''))),
+                v_dict.get('why_it_matters', ''),
+                v_dict.get('who_it_affects', ''),
+                v_dict.get('how_to_fix', v_dict.get('remediation', v_dict.get('suggested_fix', ''))),
+                v_dict.get('wcag_full', ', '.join(wcag) if isinstance(wcag, list) else wcag),
+                representative_xpath,
+                v_dict.get('element', ''),
+                issue_data['component'],
+                # List all pages where this issue appears
+                '\n'.join(sorted(issue_data['pages'])),
+                len(issue_data['pages']),
+                # Show all unique values across all instances of this issue
+                ', '.join(sorted(str(bp) for bp in issue_data['breakpoints'])),
+                ', '.join(sorted(str(pc) for pc in issue_data['pseudoclasses'])),
+                ', '.join(sorted(str(ps) for ps in issue_data['page_states'])),
+                ', '.join(sorted(issue_data['test_users'])),
+                ', '.join(sorted(issue_data['user_roles']))
+            ]
 
-            # List all pages where this issue appears
-            pages_list = '\n'.join(sorted(issue_data['pages']))
-            ws.cell(row=row, column=13, value=pages_list)
-            ws.cell(row=row, column=13).alignment = self.Alignment(wrap_text=True, vertical='top')
-
-            ws.cell(row=row, column=14, value=len(issue_data['pages']))
-
-            # Add metadata columns - show all unique values across all instances of this issue
-            breakpoints_list = ', '.join(sorted([str(bp) for bp in issue_data['breakpoints']])) if issue_data['breakpoints'] else ''
-            ws.cell(row=row, column=15, value=breakpoints_list)
+    def _create_project_deduped_issues_sheet(self, ws, data, styles):
+        """Create a deduplicated issues sheet that groups issues by common components"""
+        for col, header in enumerate(self._project_deduped_issues_headers(), 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            self._apply_style(cell, styles['header'])
 
-            pseudoclasses_list = ', '.join(sorted([str(pc) for pc in issue_data['pseudoclasses']])) if issue_data['pseudoclasses'] else ''
-            ws.cell(row=row, column=16, value=pseudoclasses_list)
+        # Extract common components from discovery issues
+        common_components = self._extract_common_components(data)
+        component_index = ComponentIndex(common_components)
 
-            page_states_list = ', '.join(sorted([str(ps) for ps in issue_data['page_states']])) if issue_data['page_states'] else ''
-            ws.cell(row=row, column=17, value=page_states_list)
-            ws.cell(row=row, column=17).alignment = self.Alignment(wrap_text=True, vertical='top')
+        # Track unique issues: (rule_id, xpath_or_component) -> issue data
+        unique_issues = {}
+        for _, page_url, test_result in self._iter_project_pages(data):
+            self._add_page_deduped_issues(unique_issues, common_components, component_index, page_url, test_result)
 
-            # Add test user columns
-            test_users_list = ', '.join(sorted(issue_data['test_users'])) if issue_data['test_users'] else ''
-            ws.cell(row=row, column=18, value=test_users_list)
+        # Write deduplicated issues to sheet
+        row = 2
+        for style_key, values in self._deduped_issue_rows(unique_issues):
+            fill = styles[style_key]['fill']
+            for col, value in enumerate(values, 1):
+                cell = ws.cell(row=row, column=col, value=value)
+                cell.fill = fill
+                if col in self.DEDUPED_WRAP_COLUMNS:
+                    cell.alignment = self.Alignment(wrap_text=True, vertical='top')
+            row += 1
 
-            user_roles_list = ', '.join(sorted(issue_data['user_roles'])) if issue_data['user_roles'] else ''
-            ws.cell(row=row, column=19, value=user_roles_list)
+        self._auto_adjust_columns(ws)
 
-            # Apply fill color
-            for col in range(1, 20):
-                ws.cell(row=row, column=col).fill = fill_color
+    # Row colours of the common components sheet by component type
+    COMPONENT_FILLS = {'Navigation': 'E3F2FD', 'Header': 'F3E5F5', 'Footer': 'E8F5E9'}
+    DEFAULT_COMPONENT_FILL = 'FFF9C4'
 
-            row += 1
+    def _common_component_rows(self, common_components: Dict[str, Dict]) -> List[Tuple[str, List[Any]]]:
+        """
+        Build the common components sheet rows, by type then page count (descending)
 
-        self._auto_adjust_columns(ws)
+        Returns:
+            List of (component type, row values)
+        """
+        sorted_components = sorted(
+            common_components.values(),
+            key=lambda comp: (comp['type'], -len(comp['pages']))
+        )
+        return [
+            (comp_data['type'], [
+                comp_data['type'],  # Component type (Navigation, Header, Footer)
+                comp_data['signature'],  # Signature (the unique identifier)
+                comp_data['label'],  # Label (display name)
+                len(comp_data['pages']),
+                '\n'.join(sorted(comp_data['pages'])),
+                # Example XPath (show one representative xpath)
+                next(iter(comp_data['xpaths_by_page'].values()), '')
+            ])
+            for comp_data in sorted_components
+        ]
 
     def _create_common_components_sheet(self, ws, data, styles):
         """Create a sheet listing all common components identified during deduplication"""
-        headers = [self._t('component_type'), self._t('signature'), self._t('label'), self._t('page_count'), self._t('pages_found'), self._t('example_xpath')]
-
-        for col, header in enumerate(headers, 1):
+        for col, header in enumerate(self._common_components_headers(), 1):
             cell = ws.cell(row=1, column=col, value=header)
             self._apply_style(cell, styles['header'])
 
-        row = 2
-
         # Extract common components from discovery issues
-        common_components = self._extract_common_components(data)
-
-        # Sort components by type and then by page count (descending)
-        sorted_components = sorted(
-            common_components.items(),
-            key=lambda x: (x[1]['type'], -len(x[1]['pages']))
-        )
-
-        for signature, comp_data in sorted_components:
-            # Component type (Navigation, Header, Footer)
-            ws.cell(row=row, column=1, value=comp_data['type'])
-
-            # Signature (the unique identifier)
-            ws.cell(row=row, column=2, value=comp_data['signature'])
-
-            # Label (display name)
-            ws.cell(row=row, column=3, value=comp_data['label'])
-
-            # Page count (moved before Pages Found for better readability)
-            ws.cell(row=row, column=4, value=len(comp_data['pages']))
-
-            # Pages found (sorted list)
-            pages_list = '\n'.join(sorted(comp_data['pages']))
-            ws.cell(row=row, column=5, value=pages_list)
-            ws.cell(row=row, column=5).alignment = self.Alignment(wrap_text=True, vertical='top')
-
-            # Example XPath (show one representative xpath)
-            example_xpath = list(comp_data['xpaths_by_page'].values())[0] if comp_data['xpaths_by_page'] else ''
-            ws.cell(row=row, column=6, value=example_xpath)
-
-            # Apply styling based on component type
-            if comp_data['type'] == 'Navigation':
-                fill_color = self.PatternFill(start_color="E3F2FD", end_color="E3F2FD", fill_type="solid")
-            elif comp_data['type'] == 'Header':
-                fill_color = self.PatternFill(start_color="F3E5F5", end_color="F3E5F5", fill_type="solid")
-            elif comp_data['type'] == 'Footer':
-                fill_color = self.PatternFill(start_color="E8F5E9", end_color="E8F5E9", fill_type="solid")
-            else:
-                fill_color = self.PatternFill(start_color="FFF9C4", end_color="FFF9C4", fill_type="solid")
+        rows = self._common_component_rows(self._extract_common_components(data))
 
-            for col in range(1, 7):
-                ws.cell(row=row, column=col).fill = fill_color
-
-            row += 1
-
-        # Add summary row at the top (after data)
-        if sorted_components:
-            # Insert a blank row after headers
-            ws.insert_rows(2)
+        row = 2
+        if rows:
+            # Summary row between the headers and the components
             ws.merge_cells('A2:F2')
             summary_cell = ws['A2']
-            summary_cell.value = f'Found {len(sorted_components)} common components across {len(data.get("websites", []))} websites'
+            summary_cell.value = f'Found {len(rows)} common components across {len(data.get("websites", []))} websites'
             summary_cell.font = self.Font(italic=True, color="666666")
             summary_cell.alignment = self.Alignment(horizontal='center')
+            row = 3
+
+        for component_type, values in rows:
+            color = self.COMPONENT_FILLS.get(component_type, self.DEFAULT_COMPONENT_FILL)
+            fill_color = self.PatternFill(start_color=color, end_color=color, fill_type="solid")
+            for col, value in enumerate(values, 1):
+                ws.cell(row=row, column=col, value=value).fill = fill_color
+            ws.cell(row=row, column=5).alignment = self.Alignment(wrap_text=True, vertical='top')
+            row += 1
 
         self._auto_adjust_columns(ws)
 
@@ -2738,16 +2948,13 @@ class PDFFormatter(BaseFormatter):
         super().__init__(config, language)
         self.extension = 'pdf'
         self.html_formatter = HTMLFormatter(config, language)
-        
-        # Try to import weasyprint
-        try:
-            from weasyprint import HTML, CSS
-            self.HTML = HTML
-            self.CSS = CSS
-            self.has_weasyprint = True
-        except ImportError:
-            logger.warning("weasyprint not installed - PDF generation will fall back to HTML")
-            self.has_weasyprint = False
+
+        # Rendered sections are cached next to the reports they belong to
+        reports_dir = config.get('REPORTS_DIR')
+        self.pdf_renderer = PDFRenderer(
+            cache_dir=Path(reports_dir) / '.pdf_cache' if reports_dir else None,
+            max_workers=config.get('REPORT_RENDER_WORKERS', 0)
+        )
     
     def format_page_report(self, data: Dict[str, Any]) -> bytes:
         """Generate PDF for page report"""
@@ -2775,43 +2982,13 @@ class PDFFormatter(BaseFormatter):
         return self._convert_to_pdf(html_content)
     
     def _convert_to_pdf(self, html_content: str) -> bytes:
-        """Convert HTML content to PDF bytes"""
-        if self.has_weasyprint:
-            try:
-                # Add some PDF-specific CSS for better rendering
-                pdf_css = self.CSS(string='''
-                    @page {
-                        size: A4;
-                        margin: 1cm;
-                    }
-                    body {
-                        font-size: 10pt;
-                    }
-                    .container {
-                        max-width: 100%;
-                        box-shadow: none;
-                    }
-                    table {
-                        page-break-inside: avoid;
-                    }
-                    .violation, .warning, .pass, .ai-finding {
-                        page-break-inside: avoid;
-                    }
-                ''')
-                
-                # Create PDF from HTML
-                pdf_document = self.HTML(string=html_content).render(stylesheets=[pdf_css])
-                pdf_bytes = pdf_document.write_pdf()
-                
-                return pdf_bytes
-            except Exception as e:
-                logger.error(f"Failed to generate PDF with weasyprint: {e}")
-                # Fall back to returning HTML as bytes
-                return html_content.encode('utf-8')
-        else:
-            # If weasyprint is not available, return HTML as bytes
-            logger.warning("PDF generation not available - returning HTML content")
-            return html_content.encode('utf-8')
+        """
+        Convert HTML content to PDF bytes
+
+        Raises:
+            PDFRenderError: If the PDF cannot be rendered
+        """
+        return self.pdf_renderer.render(html_content)
     
     def save_pdf(self, html_content: str, filepath: Path):
         """
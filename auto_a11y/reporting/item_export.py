@@ -0,0 +1,185 @@
+"""
+Streaming export of test result items
+
+Exports the findings of the latest test results of a website or project as
+NDJSON or CSV without building a report in memory: items are read from a
+cursor on test_result_items, joined with their page URL and serialized in
+small chunks that can be sent to the client (optionally gzipped) as they
+are produced.
+"""
+
+import csv
+import io
+import json
+import re
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+ITEM_TYPES = ('violation', 'warning', 'info', 'discovery', 'pass')
+
+# Passes are only exported when asked for explicitly
+DEFAULT_ITEM_TYPES = ('violation', 'warning', 'info', 'discovery')
+
+# Columns of an exported row, in CSV order
+EXPORT_FIELDS = [
+    'website', 'page_url', 'page_id', 'test_date', 'item_type', 'issue_id', 'impact',
+    'touchpoint', 'wcag_criteria', 'xpath', 'element', 'html', 'description',
+    'failure_summary', 'help_url'
+]
+
+ITEM_PROJECTION = {
+    'page_id': 1, 'test_date': 1, 'item_type': 1, 'issue_id': 1, 'impact': 1,
+    'touchpoint': 1, 'wcag_criteria': 1, 'xpath': 1, 'element': 1, 'html': 1,
+    'description': 1, 'failure_summary': 1, 'help_url': 1
+}
+
+# Serialized output is flushed to the client in chunks of about this size
+CHUNK_SIZE = 64 * 1024
+
+
+def build_item_filter(
+    touchpoints: Optional[List[str]] = None,
+    impacts: Optional[List[str]] = None,
+    item_types: Optional[List[str]] = None,
+    wcag_criteria: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Build the test_result_items query for export filters
+
+    Args:
+        touchpoints: Keep items of these touchpoints
+        impacts: Keep items with these impacts
+        item_types: Keep these item types (defaults to everything but passes)
+        wcag_criteria: Keep items mapped to any of these criteria; "1.4.3"
+            also matches criteria stored with their name, such as
+            "1.4.3 Contrast (Minimum) (Level AA)"
+
+    Returns:
+        MongoDB filter
+
+    Raises:
+        ValueError: If an unknown item type is requested
+    """
+    item_types = list(item_types or DEFAULT_ITEM_TYPES)
+    unknown = set(item_types) - set(ITEM_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown item type(s): {', '.join(sorted(unknown))}")
+
+    query: Dict[str, Any] = {'item_type': {'$in': item_types}}
+    if touchpoints:
+        query['touchpoint'] = {'$in': list(touchpoints)}
+    if impacts:
+        query['impact'] = {'$in': list(impacts)}
+    if wcag_criteria:
+        query['wcag_criteria'] = {
+            '$in': [re.compile(rf'^{re.escape(criterion)}(\s|$)') for criterion in wcag_criteria]
+        }
+    return query
+
+
+def iter_export_rows(db, websites: Iterable[Any], item_filter: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream export rows for the latest test results of websites
+
+    Args:
+        db: Database instance
+        websites: Website objects to export
+        item_filter: test_result_items filter from build_item_filter
+
+    Yields:
+        One dictionary per item with the EXPORT_FIELDS keys
+    """
+    for website in websites:
+        website_name = website.name or website.url
+        for page_url, item in db.iter_latest_result_items(website.id, item_filter, ITEM_PROJECTION):
+            test_date = item.get('test_date')
+            yield {
+                'website': website_name,
+                'page_url': page_url,
+                'page_id': item.get('page_id', ''),
+                'test_date': test_date.isoformat() if isinstance(test_date, datetime) else test_date,
+                'item_type': item.get('item_type', ''),
+                'issue_id': item.get('issue_id', ''),
+                'impact': item.get('impact', ''),
+                'touchpoint': item.get('touchpoint', ''),
+                'wcag_criteria': item.get('wcag_criteria') or [],
+                'xpath': item.get('xpath', ''),
+                'element': item.get('element', ''),
+                'html': item.get('html', ''),
+                'description': item.get('description', ''),
+                'failure_summary': item.get('failure_summary', ''),
+                'help_url': item.get('help_url', '')
+            }
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize rows as newline-delimited JSON, in chunks"""
+    buffer = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row, default=str) + '\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize rows as CSV with a header row, in chunks"""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, 'wcag_criteria': '; '.join(str(c) for c in row['wcag_criteria'])})
+        if output.tell() >= CHUNK_SIZE:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    if output.tell():
+        yield output.getvalue()
+
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip a stream of text chunks incrementally"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_items(db, websites: Iterable[Any], item_filter: Dict[str, Any],
+                 format: str = 'ndjson', gzip: bool = False) -> Iterator[Any]:
+    """
+    Stream an item export in the requested format
+
+    Args:
+        db: Database instance
+        websites: Website objects to export
+        item_filter: test_result_items filter from build_item_filter
+        format: 'ndjson' or 'csv'
+        gzip: Whether to gzip the output
+
+    Returns:
+        Iterator of text chunks, or of bytes when gzipped
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    rows = iter_export_rows(db, websites, item_filter)
+    chunks = iter_csv(rows) if format == 'csv' else iter_ndjson(rows)
+    return gzip_chunks(chunks) if gzip else chunks
@@ -0,0 +1,311 @@
+"""
+Chunked PDF rendering for HTML reports
+
+Large reports are split into sections (summary blocks, websites, pages) that
+are rendered to PDF separately in a process pool and merged into a single
+document. Rendered sections are cached by a hash of their HTML, so exporting
+a report again only renders the sections whose content changed.
+"""
+
+import copy
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+from auto_a11y.reporting.render_pool import resolve_worker_count
+
+logger = logging.getLogger(__name__)
+
+# Print styles applied to every rendered section
+PDF_CSS = '''
+    @page {
+        size: A4;
+        margin: 1cm;
+    }
+    body {
+        font-size: 10pt;
+    }
+    .container {
+        max-width: 100%;
+        box-shadow: none;
+    }
+    table {
+        page-break-inside: avoid;
+    }
+    .violation, .warning, .pass, .ai-finding {
+        page-break-inside: avoid;
+    }
+'''
+
+# Sections are packed up to about this many characters of HTML; larger
+# elements are split along their children
+CHUNK_TARGET_CHARS = 150_000
+
+# Elements that are never split across sections
+ATOMIC_TAGS = {'table', 'ul', 'ol', 'dl', 'figure', 'pre', 'svg', 'header', 'footer'}
+
+# Cached sections not used for this long are removed
+CACHE_MAX_AGE_DAYS = 30
+
+
+class PDFRenderError(RuntimeError):
+    """Raised when a report cannot be rendered to PDF"""
+
+
+def _shell(element: Tag) -> tuple:
+    """Opening and closing tags of an element, without its children"""
+    empty = copy.copy(element)
+    empty.clear()
+    markup = str(empty)
+    closing = f'</{element.name}>'
+    return markup[:-len(closing)], closing
+
+
+def _pack(pieces: List[str], target_chars: int) -> List[str]:
+    """Join consecutive pieces into groups of about target_chars"""
+    groups = []
+    current = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) > target_chars:
+            groups.append(''.join(current))
+            current = []
+            size = 0
+        current.append(piece)
+        size += len(piece)
+    if current:
+        groups.append(''.join(current))
+    return groups
+
+
+def _split_element(element: Tag, target_chars: int) -> List[str]:
+    """
+    Split an element into pieces of about target_chars
+
+    Each piece is wrapped in a copy of the element's tag, so class-based
+    styles still apply to every section.
+    """
+    markup = str(element)
+    if len(markup) <= target_chars or element.name in ATOMIC_TAGS:
+        return [markup]
+
+    children = [
+        child for child in element.children
+        if not isinstance(child, Comment) and not (isinstance(child, NavigableString) and not child.strip())
+    ]
+    if not any(isinstance(child, Tag) for child in children):
+        return [markup]
+
+    pieces = []
+    for child in children:
+        if isinstance(child, Tag):
+            pieces.extend(_split_element(child, target_chars))
+        else:
+            pieces.append(str(child))
+
+    opening, closing = _shell(element)
+    return [opening + group + closing for group in _pack(pieces, target_chars)]
+
+
+def split_report_html(html: str, target_chars: int = CHUNK_TARGET_CHARS) -> List[str]:
+    """
+    Split a report into standalone HTML documents of about target_chars
+
+    Every section keeps the report's <head> (and so its styles) and the
+    chain of wrapper elements around its content. Scripts are dropped, as
+    they do not run when rendering to PDF.
+
+    Args:
+        html: Complete report HTML
+        target_chars: Approximate size of each section
+
+    Returns:
+        List of HTML documents, in report order
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for script in soup.find_all('script'):
+        script.decompose()
+
+    if not soup.body or len(html) <= target_chars:
+        return [str(soup)]
+
+    head = str(soup.head) if soup.head else ''
+    html_open = _shell(soup.html)[0] if soup.html else '<html>'
+    return [
+        f'<!DOCTYPE html>\n{html_open}{head}{body}</html>'
+        for body in _split_element(soup.body, target_chars)
+    ]
+
+
+def _render_section(html: str) -> bytes:
+    """Render one HTML document to PDF (runs in a worker process)"""
+    from weasyprint import CSS, HTML
+
+    return HTML(string=html).write_pdf(stylesheets=[CSS(string=PDF_CSS)])
+
+
+def merge_pdfs(parts: List[bytes]) -> bytes:
+    """Concatenate PDF documents"""
+    if len(parts) == 1:
+        return parts[0]
+
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(PdfReader(io.BytesIO(part)))
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _can_merge() -> bool:
+    try:
+        import pypdf  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class PDFRenderer:
+    """
+    Renders report HTML to PDF in cached, parallel sections
+
+    Usage:
+        renderer = PDFRenderer(cache_dir=reports_dir / '.pdf_cache')
+        pdf_bytes = renderer.render(html)
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_workers: int = 0,
+                 target_chars: int = CHUNK_TARGET_CHARS):
+        """
+        Args:
+            cache_dir: Directory for rendered sections (None = no cache)
+            max_workers: Worker processes (0 = one per CPU up to 4, 1 = render serially)
+            target_chars: Approximate HTML size of each section
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.target_chars = target_chars
+
+    def render(self, html: str) -> bytes:
+        """
+        Render report HTML to PDF bytes
+
+        Args:
+            html: Complete report HTML
+
+        Returns:
+            PDF document
+
+        Raises:
+            PDFRenderError: If WeasyPrint is unavailable or a section fails to render
+        """
+        try:
+            import weasyprint  # noqa: F401
+        except (ImportError, OSError) as e:
+            # WeasyPrint raises OSError when its system libraries are missing
+            raise PDFRenderError(f"PDF export requires WeasyPrint and its system libraries: {e}") from e
+
+        if _can_merge():
+            sections = split_report_html(html, self.target_chars)
+        else:
+            logger.warning("pypdf not installed - rendering the PDF as a single section")
+            sections = split_report_html(html, len(html) + 1)
+
+        keys = [hashlib.sha256((PDF_CSS + section).encode('utf-8')).hexdigest() for section in sections]
+        parts: Dict[int, bytes] = {}
+        for index, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                parts[index] = cached
+
+        missing = [index for index in range(len(sections)) if index not in parts]
+        if missing:
+            rendered = self._render_sections([sections[index] for index in missing], missing, len(sections))
+            for index, pdf_bytes in zip(missing, rendered):
+                parts[index] = pdf_bytes
+                self._cache_put(keys[index], pdf_bytes)
+
+        logger.info(f"Rendered PDF in {len(sections)} sections "
+                    f"({len(missing)} rendered, {len(sections) - len(missing)} from cache)")
+        self._prune_cache()
+
+        try:
+            return merge_pdfs([parts[index] for index in range(len(sections))])
+        except Exception as e:
+            raise PDFRenderError(f"Failed to merge PDF sections: {e}") from e
+
+    def _render_sections(self, sections: List[str], indexes: List[int], total: int) -> List[bytes]:
+        """Render sections in a process pool, or serially for a single section"""
+        workers = resolve_worker_count(self.max_workers, len(sections), min_files=2)
+        executor = None
+        if workers > 1:
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not start PDF render pool, rendering serially: {e}")
+
+        try:
+            if executor:
+                futures = [executor.submit(_render_section, section) for section in sections]
+                results = []
+                for index, future in zip(indexes, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        raise PDFRenderError(f"Failed to render PDF section {index + 1} of {total}: {e}") from e
+                return results
+
+            results = []
+            for index, section in zip(indexes, sections):
+                try:
+                    results.append(_render_section(section))
+                except Exception as e:
+                    raise PDFRenderError(f"Failed to render PDF section {index + 1} of {total}: {e}") from e
+            return results
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _cache_get(self, key: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        path = self.cache_dir / f'{key}.pdf'
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def _cache_put(self, key: str, pdf_bytes: bytes):
+        if not self.cache_dir:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_dir / f'{key}.{os.getpid()}.tmp'
+            temp_path.write_bytes(pdf_bytes)
+            os.replace(temp_path, self.cache_dir / f'{key}.pdf')
+        except OSError as e:
+            logger.warning(f"Could not cache PDF section {key}: {e}")
+
+    def _prune_cache(self):
+        """Remove sections that no export has used recently"""
+        if not self.cache_dir or not self.cache_dir.exists():
+            return
+        cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+        for path in self.cache_dir.glob('*.pdf'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
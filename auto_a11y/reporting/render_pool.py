@@ -0,0 +1,376 @@
+"""
+Parallel, incremental rendering for static HTML reports
+
+Report files are rendered in a process pool and streamed into the ZIP archive
+as they complete, so no temporary report tree is built on disk. Every rendered
+file is also kept in a per-scope render cache together with a fingerprint of
+its template context: the next export of the same scope only re-renders the
+files whose data changed and reuses the others from the previous output.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+import zipfile
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from auto_a11y.reporting.babel_context import report_locale
+
+logger = logging.getLogger(__name__)
+
+# Below this many files to render the pool start-up costs more than it saves
+PARALLEL_RENDER_MIN_FILES = 20
+
+# Maximum number of worker processes when the worker count is automatic
+MAX_AUTO_WORKERS = 4
+
+# Render cache locks older than this are left over from a crashed export
+CACHE_LOCK_TIMEOUT = 3600
+
+# Already-compressed files are stored instead of deflated again
+STORED_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2', '.zip'}
+
+# Per-process state of the render workers, set by _init_worker
+_worker_env = None
+_worker_language = 'en'
+_worker_context: Dict[str, Any] = {}
+
+
+def resolve_worker_count(configured: int, file_count: int, min_files: int = PARALLEL_RENDER_MIN_FILES) -> int:
+    """
+    Decide how many worker processes to render a report with
+
+    Args:
+        configured: Configured worker count (0 = automatic)
+        file_count: Number of files the report will render
+        min_files: Fewest files worth starting a pool for
+
+    Returns:
+        Worker count, 1 meaning render serially in the calling process
+    """
+    if file_count < min_files:
+        return 1
+    workers = configured if configured > 0 else min(MAX_AUTO_WORKERS, os.cpu_count() or 1)
+    return max(1, min(workers, file_count))
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values json does not know for fingerprinting"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(item) for item in value)
+    if hasattr(value, '__dict__'):
+        return vars(value)
+    return str(value)
+
+
+def context_fingerprint(template_name: str, context: Dict[str, Any], salt: str = '') -> str:
+    """
+    Fingerprint a template render
+
+    Args:
+        template_name: Template path relative to the template directory
+        context: Template context, without values that change on every export
+        salt: Fingerprint of everything shared by the renders of one export
+
+    Returns:
+        Hex digest that changes whenever the rendered output could change
+    """
+    payload = json.dumps([salt, template_name, context], sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def template_tree_version(template_dir: Path) -> str:
+    """Fingerprint the templates of a directory by file name, size and modification time"""
+    entries = []
+    for path in sorted(template_dir.rglob('*')):
+        if path.is_file():
+            stat = path.stat()
+            entries.append((str(path.relative_to(template_dir)), stat.st_size, stat.st_mtime_ns))
+    return hashlib.sha256(json.dumps(entries).encode('utf-8')).hexdigest()
+
+
+def render_template(env, language: str, template_name: str, context: Dict[str, Any]) -> str:
+    """
+    Render a template in the report language
+
+    Render workers are spawned without a Flask application, so the locale is
+    set through report_locale, which provides one when needed.
+    """
+    template = env.get_template(template_name)
+    with report_locale(language):
+        return template.render(**context)
+
+
+def _init_worker(language: str, base_context: Dict[str, Any]):
+    """Build the template environment of a render worker once"""
+    global _worker_env, _worker_language, _worker_context
+    from auto_a11y.reporting.static_html_generator import create_template_env
+
+    _worker_env = create_template_env()
+    _worker_language = language
+    _worker_context = base_context
+
+
+def _render_in_worker(template_name: str, context: Dict[str, Any]) -> bytes:
+    """Render one report file in a worker process"""
+    html = render_template(_worker_env, _worker_language, template_name, {**_worker_context, **context})
+    return html.encode('utf-8')
+
+
+class RenderCache:
+    """
+    Rendered files of the previous export of a report scope
+
+    The manifest mapping archive names to fingerprints is removed while an
+    export runs and only written back once it succeeds, so an interrupted
+    export never leaves fingerprints pointing at files it overwrote.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.files_dir = cache_dir / 'files'
+        self.manifest_path = cache_dir / 'manifest.json'
+        self.lock_path = cache_dir / '.lock'
+        self.previous: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        self.enabled = False
+
+    def open(self) -> bool:
+        """Lock the cache for this export and load the previous manifest"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            if self.lock_path.exists() and time.time() - self.lock_path.stat().st_mtime > CACHE_LOCK_TIMEOUT:
+                self.lock_path.unlink()
+            os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            logger.info(f"Render cache {self.cache_dir.name} is in use, rendering without it")
+            return False
+        except OSError as e:
+            logger.warning(f"Could not lock render cache {self.cache_dir}: {e}")
+            return False
+
+        if self.manifest_path.exists():
+            try:
+                self.previous = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable render cache manifest {self.manifest_path}: {e}")
+            self.manifest_path.unlink()
+
+        self.enabled = True
+        return True
+
+    def get(self, arcname: str, fingerprint: str) -> Optional[bytes]:
+        """Return the previously rendered file if its fingerprint is unchanged"""
+        if not self.enabled or self.previous.get(arcname) != fingerprint:
+            return None
+        try:
+            data = (self.files_dir / arcname).read_bytes()
+        except OSError:
+            return None
+        self.current[arcname] = fingerprint
+        return data
+
+    def put(self, arcname: str, fingerprint: str, data: bytes):
+        """Keep a freshly rendered file for the next export"""
+        if not self.enabled:
+            return
+        path = self.files_dir / arcname
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.current[arcname] = fingerprint
+
+    def commit(self):
+        """Write the new manifest and drop files the export no longer contains"""
+        if not self.enabled:
+            return
+        for arcname in set(self.previous) - set(self.current):
+            (self.files_dir / arcname).unlink(missing_ok=True)
+        self.manifest_path.write_text(json.dumps(self.current), encoding='utf-8')
+        self.close()
+
+    def close(self):
+        """Release the cache lock"""
+        if self.enabled:
+            self.lock_path.unlink(missing_ok=True)
+            self.enabled = False
+
+
+class StreamingReportWriter:
+    """
+    Renders report files and streams them into a ZIP archive
+
+    Files are rendered in a process pool when more than one worker is
+    requested and written to the archive in completion order. Values in
+    ``volatile_context`` (such as the generation date) are passed to every
+    render but left out of the fingerprints, so they do not invalidate the
+    render cache on their own.
+
+    Usage:
+        with StreamingReportWriter(zip_path, env, 'en', cache_dir=cache_dir) as writer:
+            writer.add_file(screenshot, 'assets/images/screenshots/home.png')
+            writer.render('index.html', 'static_report/index.html', context)
+    """
+
+    def __init__(
+        self,
+        zip_path: Path,
+        template_env,
+        language: str,
+        shared_context: Optional[Dict[str, Any]] = None,
+        volatile_context: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 1,
+        fingerprint_salt: str = ''
+    ):
+        """
+        Args:
+            zip_path: Archive to create
+            template_env: Jinja2 environment used when rendering in this process
+            language: Report language
+            shared_context: Context shared by every render, sent to each worker once
+            volatile_context: Shared context excluded from fingerprints
+            cache_dir: Render cache directory of the report scope (None = no cache)
+            max_workers: Worker processes to render with (1 = render serially)
+            fingerprint_salt: Extra value folded into every fingerprint, such as the template version
+        """
+        self.zip_path = zip_path
+        self.template_env = template_env
+        self.language = language
+        self.shared_context = shared_context or {}
+        self.volatile_context = volatile_context or {}
+        self.cache = RenderCache(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self.salt = context_fingerprint(language, self.shared_context, fingerprint_salt)
+        self.stats = {'rendered': 0, 'reused': 0}
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[Any, tuple] = {}
+
+    def __enter__(self):
+        self._zip = zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED)
+        if self.cache:
+            self.cache.open()
+        if self.max_workers > 1:
+            self._start_pool()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        else:
+            self._abort()
+        return False
+
+    def _start_pool(self):
+        """Start the worker processes, falling back to serial rendering"""
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.language, {**self.shared_context, **self.volatile_context})
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not start report render pool, rendering serially: {e}")
+            self._executor = None
+
+    def add_file(self, source: Path, arcname: str):
+        """Copy an existing file into the archive"""
+        compress_type = zipfile.ZIP_STORED if source.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+        self._zip.write(source, arcname, compress_type=compress_type)
+
+    def add_text(self, arcname: str, text: str):
+        """Write generated text, such as a manifest, into the archive"""
+        self._zip.writestr(arcname, text)
+
+    def render(self, arcname: str, template_name: str, context: Dict[str, Any]):
+        """
+        Render a template into the archive, reusing the cached file when unchanged
+
+        Args:
+            arcname: Path of the file inside the archive
+            template_name: Template path relative to the template directory
+            context: Template context specific to this file
+        """
+        fingerprint = context_fingerprint(template_name, context, self.salt)
+        if self.cache:
+            cached = self.cache.get(arcname, fingerprint)
+            if cached is not None:
+                self._zip.writestr(arcname, cached)
+                self.stats['reused'] += 1
+                return
+
+        if self._executor is None:
+            self._store(arcname, fingerprint, self._render_here(template_name, context))
+            return
+
+        future = self._executor.submit(_render_in_worker, template_name, context)
+        self._pending[future] = (arcname, fingerprint, template_name, context)
+        # Bound the rendered output held in memory
+        if len(self._pending) >= self.max_workers * 4:
+            self._drain(FIRST_COMPLETED)
+
+    def _render_here(self, template_name: str, context: Dict[str, Any]) -> bytes:
+        """Render a template in the calling process"""
+        full_context = {**self.shared_context, **self.volatile_context, **context}
+        return render_template(self.template_env, self.language, template_name, full_context).encode('utf-8')
+
+    def _store(self, arcname: str, fingerprint: str, data: bytes):
+        """Write a rendered file to the archive and the render cache"""
+        self._zip.writestr(arcname, data)
+        if self.cache:
+            self.cache.put(arcname, fingerprint, data)
+        self.stats['rendered'] += 1
+
+    def _drain(self, return_when):
+        """Collect finished renders and write them out"""
+        done, _ = wait(list(self._pending), return_when=return_when)
+        for future in done:
+            arcname, fingerprint, template_name, context = self._pending.pop(future)
+            try:
+                data = future.result()
+            except Exception as e:
+                # Contexts that cannot be pickled and broken pools are rendered
+                # here instead; genuine template errors surface again below
+                logger.warning(f"Render worker failed for {arcname}, rendering in process: {e}")
+                data = self._render_here(template_name, context)
+            self._store(arcname, fingerprint, data)
+
+    def finish(self) -> Dict[str, int]:
+        """Wait for outstanding renders, close the archive and save the render cache"""
+        try:
+            if self._pending:
+                self._drain(ALL_COMPLETED)
+        except BaseException:
+            self._abort()
+            raise
+        self._shutdown_pool()
+        self._zip.close()
+        if self.cache:
+            self.cache.commit()
+        logger.info(f"Wrote {self.zip_path.name}: {self.stats['rendered']} files rendered, "
+                    f"{self.stats['reused']} reused from the previous export")
+        return self.stats
+
+    def _abort(self):
+        """Discard the partial archive and leave the render cache unsaved"""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._shutdown_pool()
+        if self._zip:
+            self._zip.close()
+        self.zip_path.unlink(missing_ok=True)
+        if self.cache:
+            self.cache.close()
+
+    def _shutdown_pool(self):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
@@ -3,7 +3,7 @@ Main report generator for accessibility test results
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Tuple
 from datetime import datetime
 from pathlib import Path
 import json
@@ -11,6 +11,7 @@ import re
 
 from auto_a11y.models import TestResult, Page, Website, Project, ImpactLevel
 from auto_a11y.core.database import Database
+from auto_a11y.core.template_sampling import TemplateExtrapolation
 from auto_a11y.reporting.formatters import (
     HTMLFormatter,
     JSONFormatter,
@@ -211,13 +212,15 @@ class ReportGenerator:
         pages = self.db.get_pages(website_id)
         
         # Get test results for all pages
+        extrapolation = TemplateExtrapolation(self.db)
         page_results = []
         for page in pages:
             test_result = self.db.get_latest_test_result(page.id)
             if test_result:
                 page_results.append({
                     'page': page.__dict__ if hasattr(page, '__dict__') else page,
-                    'test_result': test_result
+                    'test_result': test_result,
+                    'template_sampling': self._template_sampling_details(extrapolation, website_id, test_result)
                 })
         
         # Prepare report data
@@ -400,8 +403,21 @@ class ReportGenerator:
             raise ValueError(f"Project {project_id} not found")
         
         websites = self.db.get_websites(project_id)
+
+        if format in ['xlsx', 'excel'] and self._should_stream_excel(websites):
+            # Large project: write the workbook page by page instead of in memory
+            filepath = self._project_report_path(project, self.formatters['xlsx'].extension)
+            self.formatters['xlsx'].write_project_report_streaming(
+                project.__dict__,
+                [{'id': w.id, 'name': w.name, 'url': w.url} for w in websites],
+                self._iter_tested_pages,
+                filepath
+            )
+            logger.info(f"Generated streamed {format} report: {filepath}")
+            return str(filepath)
         
         # Collect data for all websites
+        extrapolation = TemplateExtrapolation(self.db)
         website_data = []
         for website in websites:
             pages = self.db.get_pages(website.id)
@@ -412,7 +428,8 @@ class ReportGenerator:
                 if test_result:
                     page_results.append({
                         'page': page.__dict__ if hasattr(page, '__dict__') else page,
-                        'test_result': test_result
+                        'test_result': test_result,
+                        'template_sampling': self._template_sampling_details(extrapolation, website.id, test_result)
                     })
             
             website_data.append({
@@ -428,13 +445,7 @@ class ReportGenerator:
         if not formatter:
             raise ValueError(f"Unsupported format: {format}")
         
-        # Create filename with translated prefix and project name
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        # Create a safe filename from the project name
-        project_prefix = self._sanitize_filename(self._t('project'))
-        project_name = self._sanitize_filename(project.name)
-        filename = f"{project_prefix}_{project_name}_{timestamp}.{formatter.extension}"
-        filepath = self.report_dir / filename
+        filepath = self._project_report_path(project, formatter.extension)
         
         # Generate content
         content = formatter.format_project_report(report_data)
@@ -455,6 +466,49 @@ class ReportGenerator:
         logger.info(f"Generated {format} report: {filepath}")
         return str(filepath)
     
+    def _project_report_path(self, project: Project, extension: str) -> Path:
+        """Path of a new project report, named with the translated prefix and project name"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Create a safe filename from the project name
+        project_prefix = self._sanitize_filename(self._t('project'))
+        project_name = self._sanitize_filename(project.name)
+        return self.report_dir / f"{project_prefix}_{project_name}_{timestamp}.{extension}"
+
+    def _should_stream_excel(self, websites: List[Website]) -> bool:
+        """
+        Whether a project Excel report should be streamed
+
+        Projects with at least EXCEL_STREAMING_MIN_PAGES pages (0 = always)
+        are written with write-only worksheets to keep memory flat.
+        """
+        if not getattr(self.formatters['xlsx'], 'has_openpyxl', False):
+            return False
+
+        threshold = int(self.config.get('EXCEL_STREAMING_MIN_PAGES', 500))
+        if threshold <= 0:
+            return True
+
+        total_pages = 0
+        for website in websites:
+            total_pages += self.db.count_pages(website.id)
+            if total_pages >= threshold:
+                return True
+        return False
+
+    def _iter_tested_pages(self, website: Dict[str, Any]) -> Iterator[Tuple[str, TestResult]]:
+        """
+        Stream (page URL, latest test result) for the pages of a website
+
+        Only one test result is loaded at a time.
+
+        Args:
+            website: Website dictionary with an 'id'
+        """
+        for ref in self.db.iter_page_refs(website['id']):
+            test_result = self.db.get_latest_test_result(ref.id)
+            if test_result:
+                yield ref.url, test_result
+
     def _enrich_issues_with_catalog(self, issues: List[Dict]) -> List[Dict]:
         """Enrich issues with detailed information from the catalog"""
         enriched_issues = []
@@ -489,6 +543,9 @@ class ReportGenerator:
         warnings = self._enrich_issues_with_catalog(test_result.warnings)
         info = self._enrich_issues_with_catalog(test_result.info)
         discovery = self._enrich_issues_with_catalog(test_result.discovery)
+        template_sampling = self._template_sampling_details(TemplateExtrapolation(self.db), website.id, test_result)
+        if template_sampling and not include_ai:
+            template_sampling['ai_findings'] = []
         
         return {
             'page': page.__dict__,
@@ -503,8 +560,22 @@ class ReportGenerator:
             'ai_findings': [f.to_dict() for f in test_result.ai_findings] if include_ai else [],
             'statistics': stats,
             'generated_at': datetime.now().isoformat(),
-            'wcag_levels': self._group_by_wcag_level(violations)
+            'wcag_levels': self._group_by_wcag_level(violations),
+            'template_sampling': template_sampling
         }
+
+    def _template_sampling_details(
+        self,
+        extrapolation: TemplateExtrapolation,
+        website_id: str,
+        test_result: TestResult
+    ) -> Optional[Dict[str, Any]]:
+        """Sampling details of a page, with the representatives' findings enriched from the catalog"""
+        details = extrapolation.findings_for(website_id, test_result)
+        if details:
+            details['violations'] = self._enrich_issues_with_catalog(details['violations'])
+            details['warnings'] = self._enrich_issues_with_catalog(details['warnings'])
+        return details
     
     def _prepare_website_report_data(
         self,
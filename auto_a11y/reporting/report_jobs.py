@@ -0,0 +1,444 @@
+"""
+Background report generation with an artifact cache
+
+Report generation used to run inside the Flask request, which timed out the
+web worker on large projects. Reports are now built by tracked
+``REPORT_GENERATION`` jobs (inline through the task runner, or by queue
+workers when JOB_EXECUTION_MODE=queue).
+
+Every generated file is recorded in the ``report_artifacts`` collection under
+a key built from the report request (kind, scope, format, language, options)
+and the data version of the pages it covers. The data version changes
+whenever a page in scope is tested, discovered or removed, so an identical
+request against unchanged data is answered from the cache without a job.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from auto_a11y.core.job_manager import JobManager, JobType, JobStatus
+from auto_a11y.models import PageStatus
+from auto_a11y.reporting.babel_context import report_locale
+
+logger = logging.getLogger(__name__)
+
+ARTIFACTS_COLLECTION = 'report_artifacts'
+
+# Report kinds and the scopes they accept
+REPORT_KINDS = {
+    'accessibility': ('all', 'project', 'website'),
+    'static_html': ('all', 'project', 'website'),
+    'deduplicated': ('all', 'project', 'website'),
+    'discovery': ('project', 'website'),
+}
+
+ACTIVE_STATUSES = [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+
+
+def build_report_spec(
+    kind: str,
+    scope: str,
+    scope_id: Optional[str] = None,
+    format: Optional[str] = None,
+    language: str = 'en',
+    options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the JSON-serializable description of a report request
+
+    Args:
+        kind: Report kind (see REPORT_KINDS)
+        scope: 'all', 'project' or 'website'
+        scope_id: Project or website ID for project/website scopes
+        format: Output format, e.g. 'xlsx', 'pdf', 'html' or 'zip'
+        language: Report language code
+        options: Generator options that change the output
+
+    Returns:
+        Report specification dictionary
+    """
+    if kind not in REPORT_KINDS:
+        raise ValueError(f"Unknown report kind '{kind}'")
+    if scope not in REPORT_KINDS[kind]:
+        raise ValueError(f"Report kind '{kind}' does not support scope '{scope}'")
+
+    return {
+        'kind': kind,
+        'scope': scope,
+        'scope_id': scope_id if scope != 'all' else None,
+        'format': format,
+        'language': language or 'en',
+        'options': options or {}
+    }
+
+
+def _scope_website_ids(db, scope: str, scope_id: Optional[str]) -> Optional[List[str]]:
+    """Website IDs covered by a scope, or None for every website"""
+    if scope == 'website':
+        return [scope_id]
+    if scope == 'project':
+        return [website.id for website in db.get_websites(scope_id)]
+    return None
+
+
+def get_data_version(db, scope: str, scope_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Summarize the state of the pages a report covers
+
+    Args:
+        db: Database instance
+        scope: 'all', 'project' or 'website'
+        scope_id: Project or website ID
+
+    Returns:
+        Dictionary with page count, tested page count and the latest
+        test and discovery dates
+    """
+    website_ids = _scope_website_ids(db, scope, scope_id)
+    match = {} if website_ids is None else {'website_id': {'$in': website_ids}}
+
+    summary = next(db.pages.aggregate([
+        {'$match': match},
+        {'$group': {
+            '_id': None,
+            'pages': {'$sum': 1},
+            'tested_pages': {'$sum': {'$cond': [{'$eq': ['$status', PageStatus.TESTED.value]}, 1, 0]}},
+            'last_tested': {'$max': '$last_tested'},
+            'last_discovered': {'$max': '$discovered_at'}
+        }}
+    ]), None) or {}
+
+    return {
+        'pages': summary.get('pages', 0),
+        'tested_pages': summary.get('tested_pages', 0),
+        'last_tested': summary.get('last_tested'),
+        'last_discovered': summary.get('last_discovered')
+    }
+
+
+def report_cache_key(spec: Dict[str, Any], data_version: Dict[str, Any]) -> str:
+    """
+    Build the artifact cache key of a report request
+
+    Args:
+        spec: Report specification from build_report_spec
+        data_version: Data version from get_data_version
+
+    Returns:
+        Hex digest identifying the report output
+    """
+    material = json.dumps(
+        {'spec': spec, 'data_version': data_version},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+def get_cached_artifact(db, cache_key: str, reports_dir: Path) -> Optional[str]:
+    """
+    Look up a previously generated report file
+
+    Args:
+        db: Database instance
+        cache_key: Key from report_cache_key
+        reports_dir: Directory reports are written to
+
+    Returns:
+        Filename in reports_dir, or None if there is no usable artifact
+    """
+    collection = db.db[ARTIFACTS_COLLECTION]
+    artifact = collection.find_one({'_id': cache_key}, {'filename': 1})
+    if not artifact:
+        return None
+
+    if not (Path(reports_dir) / artifact['filename']).exists():
+        # File was deleted from the reports directory - forget it
+        collection.delete_one({'_id': cache_key})
+        return None
+
+    collection.update_one({'_id': cache_key}, {'$set': {'last_served_at': datetime.now()}})
+    return artifact['filename']
+
+
+def store_artifact(db, cache_key: str, spec: Dict[str, Any], data_version: Dict[str, Any],
+                   filename: str, job_id: Optional[str] = None):
+    """
+    Record a generated report file in the artifact cache
+
+    Args:
+        db: Database instance
+        cache_key: Key from report_cache_key
+        spec: Report specification
+        data_version: Data version the report was built from
+        filename: Generated file name in the reports directory
+        job_id: Job that generated the file
+    """
+    db.db[ARTIFACTS_COLLECTION].replace_one(
+        {'_id': cache_key},
+        {
+            '_id': cache_key,
+            'filename': filename,
+            'spec': spec,
+            'data_version': data_version,
+            'job_id': job_id,
+            'created_at': datetime.now(),
+            'last_served_at': None
+        },
+        upsert=True
+    )
+
+
+def find_active_report_job(job_manager: JobManager, cache_key: str) -> Optional[str]:
+    """
+    Find a pending or running job already building the same report
+
+    Args:
+        job_manager: JobManager instance
+        cache_key: Key from report_cache_key
+
+    Returns:
+        Job ID, or None
+    """
+    job = job_manager.collection.find_one(
+        {
+            'job_type': JobType.REPORT_GENERATION.value,
+            'metadata.cache_key': cache_key,
+            'status': {'$in': ACTIVE_STATUSES}
+        },
+        {'job_id': 1}
+    )
+    return job['job_id'] if job else None
+
+
+def _scope_name_and_url(db, scope: str, scope_id: Optional[str]):
+    """Report title and base URL for a static HTML report scope"""
+    if scope == 'project':
+        project = db.get_project(scope_id)
+        websites = db.get_websites(scope_id)
+        website_url = next((w.url for w in websites if w.url), None)
+        return (project.name if project else "Accessibility Report"), website_url
+
+    if scope == 'website':
+        website = db.get_website(scope_id)
+        if not website:
+            raise ValueError(f"Website {scope_id} not found")
+        project = db.get_project(website.project_id) if website.project_id else None
+        name = f"{project.name} - {website.name}" if project else website.name
+        return name, website.url
+
+    return "All Projects Accessibility Report", None
+
+
+def _generate_static_html(db, config: Dict[str, Any], spec: Dict[str, Any]) -> Path:
+    """Build a multi-page static HTML report for the tested pages in scope"""
+    from auto_a11y.reporting.static_html_generator import StaticHTMLReportGenerator
+
+    scope, scope_id = spec['scope'], spec['scope_id']
+    website_ids = _scope_website_ids(db, scope, scope_id)
+    if website_ids is None:
+        website_ids = [website.id for project in db.get_projects() for website in db.get_websites(project.id)]
+
+    page_ids = []
+    for website_id in website_ids:
+        page_ids.extend(ref.id for ref in db.iter_page_refs(website_id, status=PageStatus.TESTED))
+    if not page_ids:
+        raise ValueError("No tested pages found to generate report")
+
+    # Touchpoints come from the first page's test result
+    touchpoints_tested = None
+    first_result = db.get_latest_test_result(page_ids[0])
+    if first_result and first_result.violations:
+        touchpoints_tested = sorted({v.touchpoint for v in first_result.violations if v.touchpoint})
+
+    project_name, website_url = _scope_name_and_url(db, scope, scope_id)
+    options = spec['options']
+    generator = StaticHTMLReportGenerator(db, output_dir=config['REPORTS_DIR'], language=spec['language'])
+    return generator.generate_report(
+        page_ids=page_ids,
+        project_name=project_name,
+        website_url=website_url,
+        wcag_level=options.get('wcag_level', 'AA'),
+        touchpoints_tested=touchpoints_tested,
+        include_screenshots=options.get('include_screenshots', True),
+        include_discovery=options.get('include_discovery', True),
+        ai_tests_enabled=True
+    )
+
+
+def generate_report_file(db, config: Dict[str, Any], spec: Dict[str, Any]) -> Path:
+    """
+    Run the generator for a report specification
+
+    Args:
+        db: Database instance
+        config: Application configuration dictionary
+        spec: Report specification
+
+    Returns:
+        Path to the generated file
+    """
+    kind, scope, scope_id = spec['kind'], spec['scope'], spec['scope_id']
+    language = spec['language']
+
+    if kind == 'accessibility':
+        from auto_a11y.reporting.report_generator import ReportGenerator
+        generator = ReportGenerator(db, config, language=language)
+        if scope == 'all':
+            return generator.generate_all_projects_report(format=spec['format'])
+        if scope == 'project':
+            return generator.generate_project_report(project_id=scope_id, format=spec['format'])
+        return generator.generate_website_report(website_id=scope_id, format=spec['format'])
+
+    if kind == 'static_html':
+        return _generate_static_html(db, config, spec)
+
+    if kind == 'deduplicated':
+        from auto_a11y.reporting.static_html_generator import StaticHTMLReportGenerator
+        generator = StaticHTMLReportGenerator(db, output_dir=config['REPORTS_DIR'], language=language)
+        if scope == 'website':
+            website = db.get_website(scope_id)
+            return generator.generate_project_deduplicated_report(
+                project_id=website.project_id if website else None,
+                website_id=scope_id
+            )
+        return generator.generate_project_deduplicated_report(project_id=scope_id)
+
+    from auto_a11y.reporting.discovery_report import DiscoveryReportGenerator
+    generator = DiscoveryReportGenerator(db, config, language=language)
+    if scope == 'project':
+        return generator.generate_project_discovery_report(project_id=scope_id, format=spec['format'])
+    return generator.generate_website_discovery_report(website_id=scope_id, format=spec['format'])
+
+
+def run_report_job(db, config: Dict[str, Any], job_id: str, spec: Dict[str, Any],
+                   cache_key: str, data_version: Dict[str, Any]) -> str:
+    """
+    Generate a report as a tracked job and cache the result
+
+    Args:
+        db: Database instance
+        config: Application configuration dictionary
+        job_id: Report job identifier
+        spec: Report specification
+        cache_key: Artifact cache key
+        data_version: Data version the key was built from
+
+    Returns:
+        Generated filename in the reports directory
+    """
+    job_manager = JobManager(db)
+    job_manager.update_job_status(
+        job_id=job_id,
+        status=JobStatus.RUNNING,
+        progress={'current': 0, 'total': 2, 'message': 'Collecting report data', 'details': {}}
+    )
+
+    try:
+        job_manager.update_job_progress(
+            job_id=job_id,
+            current=1,
+            total=2,
+            message=f"Generating {spec['kind'].replace('_', ' ')} report"
+        )
+        # Jobs run outside any request; without an application context
+        # Flask-Babel would silently render every report in English
+        with report_locale(spec['language']):
+            report_path = Path(generate_report_file(db, config, spec))
+    except Exception as e:
+        logger.error(f"Report job {job_id} failed: {e}", exc_info=True)
+        job_manager.update_job_status(job_id=job_id, status=JobStatus.FAILED, error=str(e))
+        raise
+
+    store_artifact(db, cache_key, spec, data_version, report_path.name, job_id=job_id)
+    job_manager.update_job_status(
+        job_id=job_id,
+        status=JobStatus.COMPLETED,
+        progress={'current': 2, 'total': 2, 'message': 'Report generated', 'details': {}, 'percentage': 100},
+        result={'filename': report_path.name}
+    )
+    logger.info(f"Report job {job_id} generated {report_path.name}")
+    return report_path.name
+
+
+def submit_report(
+    db,
+    config: Dict[str, Any],
+    spec: Dict[str, Any],
+    use_queue: bool = False,
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Serve a report from the cache or start a job to generate it
+
+    Args:
+        db: Database instance
+        config: Application configuration dictionary
+        spec: Report specification from build_report_spec
+        use_queue: Hand the job to queue workers instead of the task runner
+        user_id: User who requested the report
+        session_id: Session ID for tracking
+        force: Regenerate even if a cached artifact exists
+
+    Returns:
+        Dictionary with 'cached' and either 'filename' (cache hit) or 'job_id'
+    """
+    import uuid
+
+    data_version = get_data_version(db, spec['scope'], spec['scope_id'])
+    cache_key = report_cache_key(spec, data_version)
+
+    if not force:
+        filename = get_cached_artifact(db, cache_key, config['REPORTS_DIR'])
+        if filename:
+            logger.info(f"Serving {spec['kind']} report from cache: {filename}")
+            return {'cached': True, 'filename': filename, 'job_id': None}
+
+    job_manager = JobManager(db)
+    active_job_id = find_active_report_job(job_manager, cache_key)
+    if active_job_id:
+        return {'cached': False, 'filename': None, 'job_id': active_job_id}
+
+    job_id = f"report_{spec['kind']}_{uuid.uuid4().hex[:8]}"
+    website_id = spec['scope_id'] if spec['scope'] == 'website' else None
+    project_id = spec['scope_id'] if spec['scope'] == 'project' else None
+    metadata = {'spec': spec, 'cache_key': cache_key}
+
+    if use_queue:
+        from auto_a11y.core.work_queue import WorkQueue
+        WorkQueue(job_manager).enqueue(
+            job_id=job_id,
+            job_type=JobType.REPORT_GENERATION,
+            payload={'spec': spec, 'cache_key': cache_key, 'data_version': data_version},
+            max_attempts=config.get('JOB_MAX_ATTEMPTS', 3),
+            website_id=website_id,
+            project_id=project_id,
+            user_id=user_id,
+            session_id=session_id,
+            metadata=metadata
+        )
+    else:
+        from auto_a11y.core.task_runner import task_runner
+        job_manager.create_job(
+            job_id=job_id,
+            job_type=JobType.REPORT_GENERATION,
+            website_id=website_id,
+            project_id=project_id,
+            user_id=user_id,
+            session_id=session_id,
+            metadata=metadata
+        )
+        task_runner.submit_task(
+            func=run_report_job,
+            args=(db, config, job_id, spec, cache_key, data_version),
+            task_id=job_id
+        )
+
+    logger.info(f"Submitted report job {job_id} ({spec['kind']}, {spec['scope']})")
+    return {'cached': False, 'filename': None, 'job_id': job_id}
@@ -6,20 +6,27 @@ Includes index, summary, and individual page detail HTML files.
 Packages everything into a downloadable ZIP file.
 """
 
+import hashlib
 import json
-import shutil
-import zipfile
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import jinja2
-from flask_babel import force_locale, lazy_gettext, pgettext
+from flask_babel import force_locale, gettext, lazy_gettext, ngettext, pgettext
 
 from auto_a11y.core.database import Database
+from auto_a11y.core.template_sampling import ROLE_SAMPLED, TemplateExtrapolation
+from auto_a11y.reporting.component_index import ComponentIndex
 from auto_a11y.reporting.issue_catalog import IssueCatalog
 from auto_a11y.reporting.issue_translations_inline import ISSUE_DESCRIPTION_TRANSLATIONS_FR
+from auto_a11y.reporting.render_pool import StreamingReportWriter, resolve_worker_count, template_tree_version
 from config import config
 
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent.parent / 'web' / 'templates'
+
 
 # WCAG 2.2 French translations
 WCAG_FR_TRANSLATIONS = {
@@ -264,6 +271,77 @@ def translate_wcag_criterion(criterion_text: str, language: str = 'en') -> str:
     return criterion_text
 
 
+def _register_template_filters(env: jinja2.Environment):
+    """Setup custom Jinja2 filters"""
+
+    def error_code_only(code: str) -> str:
+        """Extract error code from full violation ID"""
+        if ':' in code:
+            return code.split(':')[1]
+        return code
+
+    def wcag_name(criterion: str) -> str:
+        """Extract WCAG criterion name from full string"""
+        parts = criterion.split()
+        return parts[0] if parts else criterion
+
+    def wcag_understanding_url(criterion_code: str) -> str:
+        """Generate WCAG Understanding URL with correct slug
+
+        Note: Both English and French link to English Understanding pages as the
+        official French WCAG translation does (marked as 'en anglais')
+        """
+        slug = WCAG_URL_SLUGS.get(criterion_code, criterion_code)
+        return f"https://www.w3.org/WAI/WCAG22/Understanding/{slug}"
+
+    def wcag_quickref_url(criterion_code: str) -> str:
+        """Generate WCAG Quick Reference URL with correct slug
+
+        Note: Both English and French link to English Quick Reference pages as the
+        official French WCAG translation does (marked as 'en anglais')
+        """
+        slug = WCAG_URL_SLUGS.get(criterion_code, criterion_code)
+        return f"https://www.w3.org/WAI/WCAG22/quickref/#{slug}"
+
+    def translate_wcag(criterion_text: str, language: str = 'en') -> str:
+        """Translate WCAG criterion text"""
+        return translate_wcag_criterion(criterion_text, language)
+
+    # Register filters
+    env.filters['error_code_only'] = error_code_only
+    env.filters['wcag_name'] = wcag_name
+    env.filters['wcag_understanding_url'] = wcag_understanding_url
+    env.filters['wcag_quickref_url'] = wcag_quickref_url
+    env.filters['translate_wcag'] = translate_wcag
+
+
+def create_template_env() -> jinja2.Environment:
+    """
+    Create the Jinja2 environment used to render static reports
+
+    Also used by the report render workers, so every process renders with the
+    same loader, extensions and filters.
+    """
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=jinja2.select_autoescape(['html', 'xml']),
+        extensions=['jinja2.ext.i18n']
+    )
+
+    # Configure Jinja2 for Flask-Babel translations. The callables look up the
+    # locale at render time, so they follow force_locale/report_locale and
+    # return the source strings when no locale is set
+    env.install_gettext_callables(
+        gettext=gettext,
+        ngettext=ngettext,
+        newstyle=True
+    )
+
+    # Add custom filters
+    _register_template_filters(env)
+    return env
+
+
 class StaticHTMLReportGenerator:
     """Generates self-contained multi-page static HTML accessibility reports"""
 
@@ -282,23 +360,7 @@ class StaticHTMLReportGenerator:
         self.language = language
 
         # Setup Jinja2 template environment - set to templates directory so relative paths work
-        template_dir = Path(__file__).parent.parent / 'web' / 'templates'
-        self.template_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(template_dir)),
-            autoescape=jinja2.select_autoescape(['html', 'xml']),
-            extensions=['jinja2.ext.i18n']
-        )
-
-        # Configure Jinja2 for Flask-Babel translations
-        # These callables will be replaced by force_locale context manager
-        self.template_env.install_gettext_callables(
-            gettext=lambda x: x,
-            ngettext=lambda s, p, n: s if n == 1 else p,
-            newstyle=True
-        )
-
-        # Add custom filters
-        self._setup_template_filters()
+        self.template_env = create_template_env()
 
     def _get_translations(self) -> Dict[str, Dict[str, str]]:
         """Get translations for both EN and FR languages"""
@@ -475,6 +537,12 @@ class StaticHTMLReportGenerator:
                 'view_details': 'View Details',
                 'no_pages_found': 'No Pages Found',
                 'try_adjusting_search': 'Try adjusting your search or filter criteria.',
+                # Template sampling
+                'sampled': 'Sampled',
+                'extrapolated_findings': 'Extrapolated Findings',
+                'extrapolated_findings_note': 'This page was tested with the light touchpoint subset only. These findings were found on its template representatives and are extrapolated to it.',
+                'light_touchpoints': 'Light touchpoints',
+                'extrapolated_from': 'Extrapolated from',
             },
             'fr': {
                 # Index page
@@ -650,6 +718,12 @@ class StaticHTMLReportGenerator:
                 'view_details': 'Voir les détails',
                 'no_pages_found': 'Aucune page trouvée',
                 'try_adjusting_search': 'Essayez d\'ajuster vos critères de recherche ou de filtre.',
+                # Template sampling
+                'sampled': 'Échantillonnée',
+                'extrapolated_findings': 'Résultats extrapolés',
+                'extrapolated_findings_note': 'Cette page a été testée uniquement avec le sous-ensemble léger de points de contrôle. Ces résultats ont été trouvés sur les pages représentatives de son gabarit et lui sont extrapolés.',
+                'light_touchpoints': 'Points de contrôle légers',
+                'extrapolated_from': 'Extrapolé depuis',
             }
         }
         return translations
@@ -658,49 +732,6 @@ class StaticHTMLReportGenerator:
         """Get inline translations for issue descriptions (EN -> FR mapping)"""
         return ISSUE_DESCRIPTION_TRANSLATIONS_FR
 
-    def _setup_template_filters(self):
-        """Setup custom Jinja2 filters"""
-
-        def error_code_only(code: str) -> str:
-            """Extract error code from full violation ID"""
-            if ':' in code:
-                return code.split(':')[1]
-            return code
-
-        def wcag_name(criterion: str) -> str:
-            """Extract WCAG criterion name from full string"""
-            parts = criterion.split()
-            return parts[0] if parts else criterion
-
-        def wcag_understanding_url(criterion_code: str) -> str:
-            """Generate WCAG Understanding URL with correct slug
-
-            Note: Both English and French link to English Understanding pages as the
-            official French WCAG translation does (marked as 'en anglais')
-            """
-            slug = WCAG_URL_SLUGS.get(criterion_code, criterion_code)
-            return f"https://www.w3.org/WAI/WCAG22/Understanding/{slug}"
-
-        def wcag_quickref_url(criterion_code: str) -> str:
-            """Generate WCAG Quick Reference URL with correct slug
-
-            Note: Both English and French link to English Quick Reference pages as the
-            official French WCAG translation does (marked as 'en anglais')
-            """
-            slug = WCAG_URL_SLUGS.get(criterion_code, criterion_code)
-            return f"https://www.w3.org/WAI/WCAG22/quickref/#{slug}"
-
-        def translate_wcag(criterion_text: str, language: str = 'en') -> str:
-            """Translate WCAG criterion text"""
-            return translate_wcag_criterion(criterion_text, language)
-
-        # Register filters
-        self.template_env.filters['error_code_only'] = error_code_only
-        self.template_env.filters['wcag_name'] = wcag_name
-        self.template_env.filters['wcag_understanding_url'] = wcag_understanding_url
-        self.template_env.filters['wcag_quickref_url'] = wcag_quickref_url
-        self.template_env.filters['translate_wcag'] = translate_wcag
-
     def _read_embedded_assets(self) -> dict:
         """Read Bootstrap CSS and JS files for embedding inline"""
         import re
@@ -788,47 +819,86 @@ class StaticHTMLReportGenerator:
         Returns:
             Path to generated ZIP file
         """
-        # Create temporary directory for report
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_dir = self.output_dir / f'static_report_{timestamp}'
-        report_dir.mkdir(parents=True, exist_ok=True)
 
-        try:
-            # Collect data for all pages
-            pages_data = self._collect_pages_data(page_ids, include_discovery)
+        # Collect data for all pages
+        pages_data = self._collect_pages_data(page_ids, include_discovery)
 
-            # Sort pages alphabetically by title for consistent ordering across all reports
-            pages_data = sorted(pages_data, key=lambda p: p['title'].lower())
+        # Sort pages alphabetically by title for consistent ordering across all reports
+        pages_data = sorted(pages_data, key=lambda p: p['title'].lower())
 
-            # Generate summary statistics
-            summary = self._generate_summary_stats(pages_data)
+        # Generate summary statistics
+        summary = self._generate_summary_stats(pages_data)
 
-            # Create directory structure
-            self._create_directory_structure(report_dir)
+        # Render every file straight into the ZIP, reusing unchanged pages
+        # from the previous export of the same project and website
+        all_translations = self._get_translations()
+        inline_assets = self._read_inline_page_assets()
+        shared_context = {
+            'project_name': project_name,
+            'wcag_level': wcag_level,
+            'touchpoints_tested': touchpoints_tested or [],
+            # Language support
+            'language': self.language,
+            'translations_en': all_translations['en'],
+            'translations_fr': all_translations['fr'],
+            'translations_json': json.dumps({'en': all_translations['en'], 'fr': all_translations['fr']}),
+            't': all_translations[self.language],
+            # Inlined CSS and JS
+            **inline_assets,
+            'inline_mode': True,
+            'show_error_codes': config.SHOW_ERROR_CODES
+        }
+        volatile_context = {'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
+        writer = self._open_report_writer(
+            self._report_zip_path(timestamp), ['static', project_name, website_url],
+            len(pages_data) + 1, shared_context, volatile_context
+        )
+        with writer:
             # Copy static assets
-            self._copy_assets(report_dir, include_screenshots, pages_data if include_screenshots else None)
+            self._add_assets(writer, include_screenshots, pages_data if include_screenshots else None)
 
             # Generate HTML files
-            self._generate_index_html(report_dir, pages_data, summary, project_name,
-                                     website_url, wcag_level, touchpoints_tested)
-
-            self._generate_page_detail_htmls(report_dir, pages_data, project_name,
-                                            wcag_level, touchpoints_tested)
+            self._generate_index_html(writer, pages_data, summary, website_url)
+            self._generate_page_detail_htmls(writer, pages_data)
 
             # Create manifest
-            self._create_manifest(report_dir, pages_data, summary, project_name,
-                                website_url, wcag_level, touchpoints_tested, ai_tests_enabled)
+            self._create_manifest(writer, pages_data, summary, project_name,
+                                  website_url, wcag_level, touchpoints_tested, ai_tests_enabled)
 
-            # Package as ZIP
-            zip_path = self._package_as_zip(report_dir, timestamp)
+        return writer.zip_path
 
-            return zip_path
+    def _open_report_writer(self, zip_path: Path, scope: List[Any], file_count: int,
+                            shared_context: Dict[str, Any],
+                            volatile_context: Dict[str, Any]) -> StreamingReportWriter:
+        """
+        Create the writer that renders a report into its ZIP file
 
-        finally:
-            # Clean up temporary directory
-            if report_dir.exists():
-                shutil.rmtree(report_dir)
+        Args:
+            zip_path: Archive to create
+            scope: Values identifying the report scope; exports of one scope share a render cache
+            file_count: Number of files the report renders, used to size the render pool
+            shared_context: Template context shared by every file of the report
+            volatile_context: Shared context that changes on every export, such as the generation date
+
+        Returns:
+            StreamingReportWriter to use as a context manager
+        """
+        scope_key = hashlib.sha256(
+            json.dumps([self.language] + scope, default=str).encode('utf-8')
+        ).hexdigest()[:16]
+
+        return StreamingReportWriter(
+            zip_path,
+            self.template_env,
+            self.language,
+            shared_context=shared_context,
+            volatile_context=volatile_context,
+            cache_dir=self.output_dir / '.render_cache' / scope_key,
+            max_workers=resolve_worker_count(config.REPORT_RENDER_WORKERS, file_count),
+            fingerprint_salt=template_tree_version(TEMPLATE_DIR / 'static_report')
+        )
 
     def _collect_pages_data(self, page_ids: List[str], include_discovery: bool) -> List[Dict[str, Any]]:
         """
@@ -842,6 +912,7 @@ class StaticHTMLReportGenerator:
             List of page data dictionaries
         """
         pages_data = []
+        extrapolation = TemplateExtrapolation(self.db)
 
         for page_id in page_ids:
             # Get page from database
@@ -1427,11 +1498,55 @@ class StaticHTMLReportGenerator:
                     'info': len(informational),
                     'discovery': len(discovery)
                 },
-                'states': state_results  # Add multi-state results
+                'states': state_results,  # Add multi-state results
+                'template_sampling': self._template_sampling_data(
+                    extrapolation.findings_for(page.website_id, latest_result)
+                )
             })
 
         return pages_data
 
+    def _template_sampling_data(self, sampling: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Template sampling details of a page for the report templates
+
+        Args:
+            sampling: Result of TemplateExtrapolation.findings_for
+
+        Returns:
+            The sampling details with 'sampled' and a bilingual 'findings' list
+            of the representatives' findings, or None if the page was not sampled
+        """
+        if not sampling:
+            return None
+        findings = []
+        for kind in ('violations', 'warnings', 'ai_findings'):
+            for item in sampling.get(kind, []):
+                if kind == 'ai_findings':
+                    title = item.get('type', '')
+                    description_en = description_fr = item.get('description', '')
+                else:
+                    title = item.get('id', '')
+                    with force_locale('en'):
+                        description_en = IssueCatalog.enrich_issue(dict(item)).get('description_full') or item.get('description', title)
+                    with force_locale('fr'):
+                        description_fr = IssueCatalog.enrich_issue(dict(item)).get('description_full') or item.get('description', title)
+                findings.append({
+                    'kind': kind,
+                    'id': title,
+                    'touchpoint': item.get('touchpoint', ''),
+                    'description_en': description_en,
+                    'description_fr': description_fr,
+                    'extrapolated_from': item['extrapolated_from']
+                })
+        return {
+            'sampled': sampling.get('role') == ROLE_SAMPLED,
+            'template_signature': sampling.get('template_signature', ''),
+            'representatives': sampling.get('representatives', []),
+            'light_touchpoints': sampling.get('light_touchpoints', []),
+            'findings': findings
+        }
+
     def _calculate_page_score(self, test_result) -> float:
         """Calculate accessibility score for a page using result_processor's scoring logic"""
         from auto_a11y.testing.result_processor import ResultProcessor
@@ -1597,17 +1712,9 @@ class StaticHTMLReportGenerator:
 
         return recommendations
 
-    def _create_directory_structure(self, report_dir: Path):
-        """Create directory structure for static report"""
-        (report_dir / 'pages').mkdir(exist_ok=True)
-        (report_dir / 'assets' / 'css').mkdir(parents=True, exist_ok=True)
-        (report_dir / 'assets' / 'js').mkdir(parents=True, exist_ok=True)
-        (report_dir / 'assets' / 'images' / 'screenshots').mkdir(parents=True, exist_ok=True)
-        (report_dir / 'assets' / 'fonts').mkdir(parents=True, exist_ok=True)
-        (report_dir / 'data').mkdir(exist_ok=True)
-
-    def _copy_assets(self, report_dir: Path, include_screenshots: bool, pages_data: Optional[List[Dict[str, Any]]]):
-        """Copy CSS, JS, fonts, and images to report directory"""
+    def _add_assets(self, writer: StreamingReportWriter, include_screenshots: bool,
+                    pages_data: Optional[List[Dict[str, Any]]]):
+        """Add CSS, JS, fonts, and images to the report archive"""
         static_dir = Path(__file__).parent.parent / 'web' / 'static'
 
         # Copy CSS files
@@ -1615,104 +1722,70 @@ class StaticHTMLReportGenerator:
         for css_file in css_files:
             src = static_dir / 'css' / css_file
             if src.exists():
-                shutil.copy(src, report_dir / 'assets' / 'css' / css_file)
+                writer.add_file(src, f'assets/css/{css_file}')
 
         # Copy tokens.css from public static directory
         tokens_src = static_dir / 'public' / 'css' / 'tokens.css'
         if tokens_src.exists():
-            shutil.copy(tokens_src, report_dir / 'assets' / 'css' / 'tokens.css')
+            writer.add_file(tokens_src, 'assets/css/tokens.css')
 
         # Copy JS files
         js_files = ['bootstrap.bundle.min.js', 'filters.js', 'navigation.js', 'search.js']
         for js_file in js_files:
             src = static_dir / 'js' / js_file
             if src.exists():
-                shutil.copy(src, report_dir / 'assets' / 'js' / js_file)
+                writer.add_file(src, f'assets/js/{js_file}')
 
         # Copy fonts (Bootstrap Icons)
         fonts_dir = static_dir / 'fonts'
         if fonts_dir.exists():
             for font_file in fonts_dir.glob('*'):
-                shutil.copy(font_file, report_dir / 'assets' / 'fonts' / font_file.name)
+                if font_file.is_file():
+                    writer.add_file(font_file, f'assets/fonts/{font_file.name}')
 
-        # Copy screenshots
+        # Screenshots are streamed from the screenshots directory, each one once
         if include_screenshots and pages_data:
             screenshots_dir = Path(__file__).parent.parent.parent / 'screenshots'
+            added = set()
             for page in pages_data:
                 if page.get('screenshot_path'):
                     screenshot_file = screenshots_dir / page['screenshot_path']
-                    if screenshot_file.exists():
-                        shutil.copy(
-                            screenshot_file,
-                            report_dir / 'assets' / 'images' / 'screenshots' / screenshot_file.name
-                        )
-
-    def _generate_index_html(self, report_dir: Path, pages_data: List[Dict[str, Any]],
-                            summary: Dict[str, Any], project_name: str, website_url: Optional[str],
-                            wcag_level: str, touchpoints_tested: Optional[List[str]]):
-        """Generate index.html file"""
-        template = self.template_env.get_template('static_report/index.html')
+                    if screenshot_file.name not in added and screenshot_file.exists():
+                        writer.add_file(screenshot_file, f'assets/images/screenshots/{screenshot_file.name}')
+                        added.add(screenshot_file.name)
 
-        # Get translations for both languages
-        all_translations = self._get_translations()
-        translations_en = all_translations['en']
-        translations_fr = all_translations['fr']
-        t = all_translations[self.language]  # Current language translations
-
-        with force_locale(self.language):
-            html = template.render(
-                pages=pages_data,
-                summary=summary,
-                project_name=project_name,
-                website_url=website_url,
-                wcag_level=wcag_level,
-                touchpoints_tested=touchpoints_tested or [],
-                generation_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                current_page='index',
-                asset_path='assets/',
-                index_path='',
-                # Language support
-                language=self.language,
-                translations_en=translations_en,
-                translations_fr=translations_fr,
-                translations_json=json.dumps({'en': translations_en, 'fr': translations_fr}),
-                t=t
-            )
-
-        (report_dir / 'index.html').write_text(html, encoding='utf-8')
-
-    def _generate_summary_html(self, report_dir: Path, pages_data: List[Dict[str, Any]],
-                               summary: Dict[str, Any], project_name: str, website_url: Optional[str],
-                               wcag_level: str, touchpoints_tested: Optional[List[str]],
+    def _generate_index_html(self, writer: StreamingReportWriter, pages_data: List[Dict[str, Any]],
+                             summary: Dict[str, Any], website_url: Optional[str]):
+        """Generate index.html file"""
+        writer.render('index.html', 'static_report/index.html', {
+            'pages': pages_data,
+            'summary': summary,
+            'website_url': website_url,
+            'current_page': 'index',
+            'asset_path': 'assets/',
+            'index_path': ''
+        })
+
+    def _generate_summary_html(self, writer: StreamingReportWriter, pages_data: List[Dict[str, Any]],
+                               summary: Dict[str, Any], website_url: Optional[str],
                                ai_tests_enabled: bool):
         """Generate summary.html file"""
-        template = self.template_env.get_template('static_report/summary.html')
-
-        with force_locale(self.language):
-            html = template.render(
-                pages=pages_data,
-                summary=summary,
-                project_name=project_name,
-                website_url=website_url,
-                wcag_level=wcag_level,
-                touchpoints_tested=touchpoints_tested or [],
-                ai_tests_enabled=ai_tests_enabled,
-                generation_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                current_page='summary',
-                asset_path='assets/',
-                index_path='',
-                report_version='1.0.0'
-            )
-
-        (report_dir / 'summary.html').write_text(html, encoding='utf-8')
-
-    def _generate_page_detail_htmls(self, report_dir: Path, pages_data: List[Dict[str, Any]],
-                                    project_name: str, wcag_level: str,
-                                    touchpoints_tested: Optional[List[str]]):
-        """Generate individual page detail HTML files with inlined CSS/JS"""
-        template = self.template_env.get_template('static_report/page_detail.html')
+        writer.render('summary.html', 'static_report/summary.html', {
+            'pages': pages_data,
+            'summary': summary,
+            'website_url': website_url,
+            'ai_tests_enabled': ai_tests_enabled,
+            'current_page': 'summary',
+            'asset_path': 'assets/',
+            'index_path': '',
+            'report_version': '1.0.0'
+        })
+
+    def _read_inline_page_assets(self) -> Dict[str, str]:
+        """Read the CSS and JS inlined into page detail files"""
+        static_dir = Path(__file__).parent.parent / 'web' / 'static'
+        import urllib.request
 
-        # Read CSS and JS files to inline them
         static_dir = Path(__file__).parent.parent / 'web' / 'static'
         import urllib.request
 
@@ -1761,11 +1834,16 @@ class StaticHTMLReportGenerator:
         if filters_js_path.exists():
             filters_js = filters_js_path.read_text(encoding='utf-8')
 
-        # Get translations for both languages
-        all_translations = self._get_translations()
-        translations_en = all_translations['en']
-        translations_fr = all_translations['fr']
-        t = all_translations[self.language]  # Current language translations
+        return {
+            'bootstrap_css': bootstrap_css,
+            'bootstrap_icons_css': bootstrap_icons_css,
+            'bootstrap_js': bootstrap_js,
+            'filters_js': filters_js
+        }
+
+    def _generate_page_detail_htmls(self, writer: StreamingReportWriter, pages_data: List[Dict[str, Any]]):
+        """Generate individual page detail HTML files with inlined CSS/JS"""
+        page_list = [{'number': i + 1, 'title': p['title']} for i, p in enumerate(pages_data)]
 
         for index, page in enumerate(pages_data, start=1):
             # Collect all unique touchpoints for filters
@@ -1774,58 +1852,36 @@ class StaticHTMLReportGenerator:
                 for issue in issue_list:
                     all_touchpoints.add(issue.get('touchpoint', 'general'))
 
-            # Create navigation context
+            # Create navigation context; neighbours only carry what the
+            # templates show, so a page is re-rendered when its neighbours
+            # change title rather than whenever their results change
+            previous_page = page_list[index - 2] if index > 1 else None
+            next_page = page_list[index] if index < len(pages_data) else None
             navigation = {
-                'previous': pages_data[index - 2] if index > 1 else None,
-                'next': pages_data[index] if index < len(pages_data) else None,
-                'pages': [{'number': i + 1, 'title': p['title'], 'current': i + 1 == index}
-                         for i, p in enumerate(pages_data)]
+                'previous': dict(previous_page) if previous_page else None,
+                'next': dict(next_page) if next_page else None,
+                'pages': [{**p, 'current': p['number'] == index} for p in page_list]
             }
 
-            if navigation['previous']:
-                navigation['previous']['number'] = index - 1
-            if navigation['next']:
-                navigation['next']['number'] = index + 1
-
-            with force_locale(self.language):
-                html = template.render(
-                    page=page,
-                    violations=page['violations'],
-                    warnings=page['warnings'],
-                    informational=page['informational'],
-                    discovery=page['discovery'],
-                    errors_count=page['issues']['errors'],
-                    warnings_count=page['issues']['warnings'],
-                    info_count=page['issues']['info'],
-                    discovery_count=page['issues']['discovery'],
-                    compliance_score=page.get('compliance_score'),
-                    all_touchpoints=sorted(all_touchpoints),
-                    navigation=navigation,
-                    project_name=project_name,
-                    wcag_level=wcag_level,
-                    touchpoints_tested=touchpoints_tested or [],
-                    generation_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    asset_path='../assets/',
-                    index_path='../',
-                    # Language support
-                    language=self.language,
-                    translations_en=translations_en,
-                    translations_fr=translations_fr,
-                    translations_json=json.dumps({'en': translations_en, 'fr': translations_fr}),
-                    t=t,
-                    # Inlined CSS and JS
-                    bootstrap_css=bootstrap_css,
-                    bootstrap_icons_css=bootstrap_icons_css,
-                    bootstrap_js=bootstrap_js,
-                    filters_js=filters_js,
-                    inline_mode=True,
-                    show_error_codes=config.SHOW_ERROR_CODES
-                )
-
             filename = f'page_{str(index).zfill(3)}.html'
-            (report_dir / 'pages' / filename).write_text(html, encoding='utf-8')
+            writer.render(f'pages/{filename}', 'static_report/page_detail.html', {
+                'page': page,
+                'violations': page['violations'],
+                'warnings': page['warnings'],
+                'informational': page['informational'],
+                'discovery': page['discovery'],
+                'errors_count': page['issues']['errors'],
+                'warnings_count': page['issues']['warnings'],
+                'info_count': page['issues']['info'],
+                'discovery_count': page['issues']['discovery'],
+                'compliance_score': page.get('compliance_score'),
+                'all_touchpoints': sorted(all_touchpoints),
+                'navigation': navigation,
+                'asset_path': '../assets/',
+                'index_path': '../'
+            })
 
-    def _create_manifest(self, report_dir: Path, pages_data: List[Dict[str, Any]],
+    def _create_manifest(self, writer: StreamingReportWriter, pages_data: List[Dict[str, Any]],
                         summary: Dict[str, Any], project_name: str, website_url: Optional[str],
                         wcag_level: str, touchpoints_tested: Optional[List[str]], ai_tests_enabled: bool):
         """Create manifest.json with report metadata"""
@@ -1865,26 +1921,14 @@ class StaticHTMLReportGenerator:
             ]
         }
 
-        (report_dir / 'data' / 'manifest.json').write_text(
-            json.dumps(manifest, indent=2),
-            encoding='utf-8'
-        )
+        writer.add_text('data/manifest.json', json.dumps(manifest, indent=2))
 
-    def _package_as_zip(self, source_dir: Path, timestamp: str) -> Path:
-        """Package report directory as ZIP file"""
+    def _report_zip_path(self, timestamp: str) -> Path:
+        """Path of the ZIP file for a static report"""
         all_translations = self._get_translations()
         t = all_translations[self.language]
         report_name = t.get('accessibility_report', 'Accessibility_Report').replace(' ', '_')
-        zip_filename = f'{report_name}_{timestamp}.zip'
-        zip_path = self.output_dir / zip_filename
-
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in source_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
-
-        return zip_path
+        return self.output_dir / f'{report_name}_{timestamp}.zip'
 
     def generate_project_deduplicated_report(
         self,
@@ -1947,10 +1991,8 @@ class StaticHTMLReportGenerator:
                 'pages': []
             }
 
-            # Get all pages for this website
-            pages = self.db.get_pages(website.id)
-
-            for page in pages:
+            # Stream all pages for this website
+            for page in self.db.iter_pages(website.id):
                 # Get latest test result for this page
                 test_result = self.db.get_latest_test_result(page.id)
                 if test_result:
@@ -2002,58 +2044,78 @@ class StaticHTMLReportGenerator:
         overall_accessibility_score = sum(all_page_scores) / len(all_page_scores) if all_page_scores else 0
         overall_compliance_score = sum(all_compliance_scores) / len(all_compliance_scores) if all_compliance_scores else 0
 
-        # Create temporary directory for report
-        import tempfile
-        import shutil
-
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         generation_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        temp_dir = Path(tempfile.mkdtemp(prefix='dedup_report_'))
 
-        try:
-            # Create directory structure
-            (temp_dir / 'components').mkdir(exist_ok=True)
-            (temp_dir / 'pages').mkdir(exist_ok=True)
-            (temp_dir / 'assets' / 'css').mkdir(parents=True, exist_ok=True)
-            (temp_dir / 'assets' / 'js').mkdir(parents=True, exist_ok=True)
+        # Group unassigned issues by page
+        pages_with_unassigned = self._group_unassigned_by_page(
+            project_data, issues_by_component.get('unassigned', []), common_components
+        )
 
-            # Copy assets
-            self._copy_dedup_assets(temp_dir)
+        # Calculate statistics based on actual deduplicated issues that will be displayed
+        # Count issues in components
+        total_violations = 0
+        total_warnings = 0
+        total_info = 0
+        total_discovery = 0
+
+        for component_signature, component_issues in issues_by_component.items():
+            if component_signature != 'unassigned':
+                for issue in component_issues:
+                    if issue['type'] == 'violation':
+                        total_violations += 1
+                    elif issue['type'] == 'warning':
+                        total_warnings += 1
+                    elif issue['type'] == 'info':
+                        total_info += 1
+                    elif issue['type'] == 'discovery':
+                        total_discovery += 1
+
+        # Count issues in unassigned (non-component) pages
+        for page_data in pages_with_unassigned:
+            total_violations += len(page_data['issues']['violations'])
+            total_warnings += len(page_data['issues']['warnings'])
+            total_info += len(page_data['issues']['info'])
+            total_discovery += len(page_data['issues'].get('discovery', []))
 
-            # Group unassigned issues by page
-            pages_with_unassigned = self._group_unassigned_by_page(
-                project_data, issues_by_component.get('unassigned', []), common_components
-            )
+        # Render every file straight into the ZIP, reusing unchanged component
+        # and page files from the previous export of the same scope
+        all_translations = self._get_translations()
+        t = all_translations[self.language]
+        embedded_assets = self._read_embedded_assets()
+        shared_context = {
+            # Translation support
+            'language': self.language,
+            'translations_en': all_translations['en'],
+            'translations_fr': all_translations['fr'],
+            'translations_json': json.dumps({'en': all_translations['en'], 'fr': all_translations['fr']}),
+            't': t,
+            # Embedded assets for standalone HTML
+            'bootstrap_css': embedded_assets['bootstrap_css'],
+            'bootstrap_icons_css': embedded_assets['bootstrap_icons_css'],
+            'bootstrap_js': embedded_assets['bootstrap_js'],
+            'tokens_css': embedded_assets.get('tokens_css', ''),
+            'style_css': embedded_assets.get('style_css', ''),
+            'show_error_codes': config.SHOW_ERROR_CODES
+        }
+        volatile_context = {'report_date': datetime.now(), 'generation_date': generation_date}
 
-            # Calculate statistics based on actual deduplicated issues that will be displayed
-            # Count issues in components
-            total_violations = 0
-            total_warnings = 0
-            total_info = 0
-            total_discovery = 0
-
-            for component_signature, component_issues in issues_by_component.items():
-                if component_signature != 'unassigned':
-                    for issue in component_issues:
-                        if issue['type'] == 'violation':
-                            total_violations += 1
-                        elif issue['type'] == 'warning':
-                            total_warnings += 1
-                        elif issue['type'] == 'info':
-                            total_info += 1
-                        elif issue['type'] == 'discovery':
-                            total_discovery += 1
-
-            # Count issues in unassigned (non-component) pages
-            for page_data in pages_with_unassigned:
-                total_violations += len(page_data['issues']['violations'])
-                total_warnings += len(page_data['issues']['warnings'])
-                total_info += len(page_data['issues']['info'])
-                total_discovery += len(page_data['issues'].get('discovery', []))
+        safe_project_name = project_name.replace(' ', '_')
+        deduplicated_word = t.get('deduplicated', 'Deduplicated').replace(' ', '_')
+        zip_path = self.output_dir / f'{safe_project_name}_{deduplicated_word}_{timestamp}.zip'
+
+        writer = self._open_report_writer(
+            zip_path, ['deduplicated', project_id, website_id],
+            1 + len(common_components) + len(pages_with_unassigned),
+            shared_context, volatile_context
+        )
+        with writer:
+            # Copy assets
+            self._copy_dedup_assets(writer)
 
             # Generate index page
             self._generate_dedup_index(
-                temp_dir, project, project_name, common_components,
+                writer, project, project_name, common_components,
                 issues_by_component, pages_with_unassigned,
                 total_violations, total_warnings, total_info, total_discovery, total_pages,
                 overall_accessibility_score, overall_compliance_score
@@ -2061,32 +2123,15 @@ class StaticHTMLReportGenerator:
 
             # Generate component detail pages
             self._generate_component_pages(
-                temp_dir, common_components, issues_by_component
+                writer, common_components, issues_by_component
             )
 
             # Generate page detail pages for unassigned issues
             self._generate_page_detail_pages(
-                temp_dir, pages_with_unassigned, project, project_name, generation_date
+                writer, pages_with_unassigned, project, project_name
             )
 
-            # Package as ZIP
-            safe_project_name = project_name.replace(' ', '_')
-            all_translations = self._get_translations()
-            t = all_translations[self.language]
-            deduplicated_word = t.get('deduplicated', 'Deduplicated').replace(' ', '_')
-            zip_filename = f'{safe_project_name}_{deduplicated_word}_{timestamp}.zip'
-            zip_path = self.output_dir / zip_filename
-
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in temp_dir.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(temp_dir)
-                        zipf.write(file_path, arcname)
-
-            return zip_path
-        finally:
-            # Clean up temp directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        return zip_path
 
     def _extract_common_components(self, data: Dict[str, Any]) -> Dict[str, Dict]:
         """
@@ -2207,6 +2252,7 @@ class StaticHTMLReportGenerator:
 
         # Track unique issues: (rule_id, component_signature_or_xpath) -> issue data
         unique_issues = {}
+        component_index = ComponentIndex(common_components)
 
         # Iterate through all websites and their pages
         for website_data in data.get('websites', []):
@@ -2248,15 +2294,12 @@ class StaticHTMLReportGenerator:
                         # Get issue's user context for matching
                         issue_user_context = auth_user.get('display_name', 'Guest') if auth_user else 'Guest'
 
-                        for signature, comp_data in common_components.items():
-                            comp_xpath = comp_data['xpaths_by_page'].get(page_url)
-                            comp_user_context = comp_data.get('user_context', 'Guest')
-                            # Match both xpath AND user context
-                            if comp_xpath and self._xpath_is_within(issue_xpath, comp_xpath) and comp_user_context == issue_user_context:
-                                component_signature = signature
-                                component_type = comp_data['type']
-                                component_label = comp_data['label']
-                                break
+                        signature = component_index.find(page_url, issue_xpath, issue_user_context)
+                        if signature:
+                            comp_data = common_components[signature]
+                            component_signature = signature
+                            component_type = comp_data['type']
+                            component_label = comp_data['label']
 
                         # Create deduplication key
                         if component_signature:
@@ -2353,27 +2396,6 @@ class StaticHTMLReportGenerator:
 
         return result
 
-    def _xpath_is_within(self, issue_xpath: str, component_xpath: str) -> bool:
-        """
-        Check if an issue's XPath is within a component's XPath.
-
-        Args:
-            issue_xpath: XPath of the issue
-            component_xpath: XPath of the component
-
-        Returns:
-            True if issue_xpath is within or equal to component_xpath
-        """
-        if not issue_xpath or not component_xpath:
-            return False
-
-        # Normalize xpaths by removing trailing slashes
-        issue_xpath = issue_xpath.rstrip('/')
-        component_xpath = component_xpath.rstrip('/')
-
-        # Check if issue xpath starts with component xpath
-        return issue_xpath == component_xpath or issue_xpath.startswith(component_xpath + '/')
-
     def _group_issues_by_component(
         self,
         deduplicated_issues: List[Dict[str, Any]],
@@ -2405,8 +2427,8 @@ class StaticHTMLReportGenerator:
 
         return grouped
 
-    def _copy_dedup_assets(self, report_dir: Path):
-        """Copy CSS and JS assets to report directory"""
+    def _copy_dedup_assets(self, writer: StreamingReportWriter):
+        """Add CSS and JS assets to the report archive"""
         static_dir = Path(__file__).parent.parent / 'web' / 'static'
 
         # Copy CSS files
@@ -2414,23 +2436,23 @@ class StaticHTMLReportGenerator:
         for css_file in css_files:
             src = static_dir / 'css' / css_file
             if src.exists():
-                shutil.copy(src, report_dir / 'assets' / 'css' / css_file)
+                writer.add_file(src, f'assets/css/{css_file}')
 
         # Copy custom CSS (if exists)
         custom_css = static_dir / 'css' / 'custom.css'
         if custom_css.exists():
-            shutil.copy(custom_css, report_dir / 'assets' / 'css' / 'custom.css')
+            writer.add_file(custom_css, 'assets/css/custom.css')
 
         # Copy JS files
         js_files = ['bootstrap.bundle.min.js']
         for js_file in js_files:
             src = static_dir / 'js' / js_file
             if src.exists():
-                shutil.copy(src, report_dir / 'assets' / 'js' / js_file)
+                writer.add_file(src, f'assets/js/{js_file}')
 
     def _generate_dedup_index(
         self,
-        report_dir: Path,
+        writer: StreamingReportWriter,
         project: Any,
         project_name: str,
         common_components: Dict[str, Dict],
@@ -2485,72 +2507,31 @@ class StaticHTMLReportGenerator:
             key=lambda x: (type_order.get(x['type'], 99), -x['violations'], -x['total_issues'])
         )
 
-        # Get translations
-        all_translations = self._get_translations()
-        translations_en = all_translations['en']
-        translations_fr = all_translations['fr']
-        t = all_translations[self.language]  # Current language translations
-
-        # Read embedded assets for standalone HTML
-        embedded_assets = self._read_embedded_assets()
-
-        # Render template
-        template = self.template_env.get_template('static_report/dedup_index.html')
-
-        with force_locale(self.language):
-            html = template.render(
-                asset_path='assets/',
-                project=project,
-                project_name=project_name,
-                components_with_issues=components_with_issues,
-                pages_with_unassigned=pages_with_unassigned,
-                total_violations=total_violations,
-                total_warnings=total_warnings,
-                total_info=total_info,
-                total_discovery=total_discovery,
-                total_components=len(common_components),
-                total_pages=total_pages,
-                overall_accessibility_score=overall_accessibility_score,
-                overall_compliance_score=overall_compliance_score,
-                report_date=datetime.now(),
-                # Translation support
-                language=self.language,
-                translations_en=translations_en,
-                translations_fr=translations_fr,
-                translations_json=json.dumps({'en': translations_en, 'fr': translations_fr}),
-                t=t,
-                # Embedded assets for standalone HTML
-                bootstrap_css=embedded_assets['bootstrap_css'],
-                bootstrap_icons_css=embedded_assets['bootstrap_icons_css'],
-                bootstrap_js=embedded_assets['bootstrap_js'],
-                tokens_css=embedded_assets.get('tokens_css', ''),
-                style_css=embedded_assets.get('style_css', ''),
-                show_error_codes=config.SHOW_ERROR_CODES
-            )
-
-        # Write to file
-        (report_dir / 'index.html').write_text(html, encoding='utf-8')
+        writer.render('index.html', 'static_report/dedup_index.html', {
+            'asset_path': 'assets/',
+            'project': project,
+            'project_name': project_name,
+            'components_with_issues': components_with_issues,
+            'pages_with_unassigned': pages_with_unassigned,
+            'total_violations': total_violations,
+            'total_warnings': total_warnings,
+            'total_info': total_info,
+            'total_discovery': total_discovery,
+            'total_components': len(common_components),
+            'total_pages': total_pages,
+            'overall_accessibility_score': overall_accessibility_score,
+            'overall_compliance_score': overall_compliance_score
+        })
 
     def _generate_component_pages(
         self,
-        report_dir: Path,
+        writer: StreamingReportWriter,
         common_components: Dict[str, Dict],
         issues_by_component: Dict[str, List[Dict[str, Any]]]
     ):
         """Generate individual component detail pages"""
-        template = self.template_env.get_template('static_report/dedup_component.html')
-
         import re
 
-        # Get translations
-        all_translations = self._get_translations()
-        translations_en = all_translations['en']
-        translations_fr = all_translations['fr']
-        t = all_translations[self.language]
-
-        # Read embedded assets for standalone HTML
-        embedded_assets = self._read_embedded_assets()
-
         # Generate page for each component
         for signature, comp_data in common_components.items():
             issues = issues_by_component.get(signature, [])
@@ -2561,33 +2542,17 @@ class StaticHTMLReportGenerator:
             # Create safe filename
             safe_sig = re.sub(r'[^a-zA-Z0-9_-]', '_', signature)
 
-            with force_locale(self.language):
-                html = template.render(
-                    asset_path='../assets/',
-                    component_type=comp_data['type'],
-                    component_label=comp_data['label'],
-                    component_signature=comp_data['signature'],  # Original signature without user context
-                    page_count=len(comp_data['pages']),
-                    pages=sorted(list(comp_data['pages'])),
-                    issues=issues,
-                    total_issues=len(issues),
-                    component_score=component_score,
-                    report_date=datetime.now(),
-                    # Translation support
-                    language=self.language,
-                    translations_en=translations_en,
-                    translations_fr=translations_fr,
-                    translations_json=json.dumps({'en': translations_en, 'fr': translations_fr}),
-                    t=t,
-                    # Embedded assets for standalone HTML
-                    bootstrap_css=embedded_assets['bootstrap_css'],
-                    bootstrap_icons_css=embedded_assets['bootstrap_icons_css'],
-                    bootstrap_js=embedded_assets['bootstrap_js'],
-                    show_error_codes=config.SHOW_ERROR_CODES
-                )
-
-            # Write to file
-            (report_dir / 'components' / f'{safe_sig}.html').write_text(html, encoding='utf-8')
+            writer.render(f'components/{safe_sig}.html', 'static_report/dedup_component.html', {
+                'asset_path': '../assets/',
+                'component_type': comp_data['type'],
+                'component_label': comp_data['label'],
+                'component_signature': comp_data['signature'],  # Original signature without user context
+                'page_count': len(comp_data['pages']),
+                'pages': sorted(list(comp_data['pages'])),
+                'issues': issues,
+                'total_issues': len(issues),
+                'component_score': component_score
+            })
 
         # Note: Unassigned issues are now handled by _generate_page_detail_pages()
         # which creates individual page files in the pages/ directory
@@ -2700,6 +2665,8 @@ class StaticHTMLReportGenerator:
         """
         import hashlib
 
+        component_index = ComponentIndex(common_components)
+
         # Group issues by page URL
         issues_by_page = {}
         for issue in unassigned_issues:
@@ -2767,17 +2734,9 @@ class StaticHTMLReportGenerator:
                             # Match the logic from _extract_common_components to identify which issues
                             # are NOT part of common components
                             for issue in violations_list:
-                                # Check if this issue's xpath matches any common component
-                                is_component_issue = False
+                                # Check if this issue's xpath is inside any common component on this page
                                 issue_xpath = issue.xpath if hasattr(issue, 'xpath') else ''
-
-                                # Check against all common components for this page
-                                if issue_xpath:
-                                    for signature, comp_data in common_components.items():
-                                        comp_xpath = comp_data['xpaths_by_page'].get(page_url)
-                                        if comp_xpath and self._xpath_is_within(issue_xpath, comp_xpath):
-                                            is_component_issue = True
-                                            break
+                                is_component_issue = component_index.contains(page_url, issue_xpath)
 
                                 # Only include non-component issues
                                 if not is_component_issue:
@@ -2785,43 +2744,22 @@ class StaticHTMLReportGenerator:
 
                             # For warnings, info, and discovery, also filter to non-component only
                             for issue in warnings_list:
-                                is_component_issue = False
                                 issue_xpath = issue.xpath if hasattr(issue, 'xpath') else ''
-
-                                if issue_xpath:
-                                    for signature, comp_data in common_components.items():
-                                        comp_xpath = comp_data['xpaths_by_page'].get(page_url)
-                                        if comp_xpath and self._xpath_is_within(issue_xpath, comp_xpath):
-                                            is_component_issue = True
-                                            break
+                                is_component_issue = component_index.contains(page_url, issue_xpath)
 
                                 if not is_component_issue:
                                     page_warnings.append(issue)
 
                             for issue in info_list:
-                                is_component_issue = False
                                 issue_xpath = issue.xpath if hasattr(issue, 'xpath') else ''
-
-                                if issue_xpath:
-                                    for signature, comp_data in common_components.items():
-                                        comp_xpath = comp_data['xpaths_by_page'].get(page_url)
-                                        if comp_xpath and self._xpath_is_within(issue_xpath, comp_xpath):
-                                            is_component_issue = True
-                                            break
+                                is_component_issue = component_index.contains(page_url, issue_xpath)
 
                                 if not is_component_issue:
                                     page_info.append(issue)
 
                             for issue in discovery_list:
-                                is_component_issue = False
                                 issue_xpath = issue.xpath if hasattr(issue, 'xpath') else ''
-
-                                if issue_xpath:
-                                    for signature, comp_data in common_components.items():
-                                        comp_xpath = comp_data['xpaths_by_page'].get(page_url)
-                                        if comp_xpath and self._xpath_is_within(issue_xpath, comp_xpath):
-                                            is_component_issue = True
-                                            break
+                                is_component_issue = component_index.contains(page_url, issue_xpath)
 
                                 if not is_component_issue:
                                     page_discovery.append(issue)
@@ -2917,26 +2855,14 @@ class StaticHTMLReportGenerator:
 
     def _generate_page_detail_pages(
         self,
-        report_dir: Path,
+        writer: StreamingReportWriter,
         pages_with_unassigned: List[Dict[str, Any]],
         project: Any,
-        project_name: str,
-        generation_date: str
+        project_name: str
     ):
         """Generate individual page detail pages for unassigned issues"""
-        template = self.template_env.get_template('static_report/dedup_unassigned.html')
-
         wcag_level = project.wcag_level if project and hasattr(project, 'wcag_level') else 'AA'
 
-        # Get translations
-        all_translations = self._get_translations()
-        translations_en = all_translations['en']
-        translations_fr = all_translations['fr']
-        t = all_translations[self.language]
-
-        # Read embedded assets for standalone HTML
-        embedded_assets = self._read_embedded_assets()
-
         for page_data in pages_with_unassigned:
             # Create page object for template
             from types import SimpleNamespace
@@ -3025,39 +2951,21 @@ class StaticHTMLReportGenerator:
             info_enriched = [enrich_issue_bilingual(i) for i in page_data['issues']['info']]
             discovery_enriched = [enrich_issue_bilingual(d) for d in page_data['issues']['discovery']]
 
-            html = template.render(
-                page=page,
-                page_url=page_data['url'],
-                page_title=page_data.get('title'),
-                violations=violations_enriched,
-                warnings=warnings_enriched,
-                info=info_enriched,
-                discovery=discovery_enriched,
-                total_issues=page_data['total_issues'],
-                errors_count=page_data.get('errors_count', 0),
-                warnings_count=page_data.get('warnings_count', 0),
-                info_count=page_data.get('info_count', 0),
-                discovery_count=page_data.get('discovery_count', 0),
-                compliance_score=page_data.get('compliance_score'),
-                dedup_score=page_data.get('dedup_score', 0),  # Score for non-component issues
-                report_date=datetime.now(),
-                generation_date=generation_date,
-                project_name=project_name,
-                wcag_level=wcag_level,
-                # Translation support
-                language=self.language,
-                translations_en=translations_en,
-                translations_fr=translations_fr,
-                translations_json=json.dumps({'en': translations_en, 'fr': translations_fr}),
-                t=t,
-                # Embedded assets for standalone HTML
-                bootstrap_css=embedded_assets['bootstrap_css'],
-                bootstrap_icons_css=embedded_assets['bootstrap_icons_css'],
-                bootstrap_js=embedded_assets['bootstrap_js'],
-                tokens_css=embedded_assets.get('tokens_css', ''),
-                style_css=embedded_assets.get('style_css', ''),
-                show_error_codes=config.SHOW_ERROR_CODES
-            )
-
-            # Write to file
-            (report_dir / 'pages' / f"{page_data['safe_url']}.html").write_text(html, encoding='utf-8')
+            writer.render(f"pages/{page_data['safe_url']}.html", 'static_report/dedup_unassigned.html', {
+                'page': page,
+                'page_url': page_data['url'],
+                'page_title': page_data.get('title'),
+                'violations': violations_enriched,
+                'warnings': warnings_enriched,
+                'info': info_enriched,
+                'discovery': discovery_enriched,
+                'total_issues': page_data['total_issues'],
+                'errors_count': page_data.get('errors_count', 0),
+                'warnings_count': page_data.get('warnings_count', 0),
+                'info_count': page_data.get('info_count', 0),
+                'discovery_count': page_data.get('discovery_count', 0),
+                'compliance_score': page_data.get('compliance_score'),
+                'dedup_score': page_data.get('dedup_score', 0),  # Score for non-component issues
+                'project_name': project_name,
+                'wcag_level': wcag_level
+            })
@@ -0,0 +1,283 @@
+(axNames) => {
+    // axNames maps XPath to the accessible name the browser computed (from
+    // the accessibility tree snapshot), when one is available.
+    // Simple XPath generator
+    function getXPath(element) {
+        if (element.id) {
+            return `//*[@id="${element.id}"]`;
+        }
+        if (element === document.body) {
+            return '/html/body';
+        }
+        let ix = 0;
+        const siblings = element.parentNode ? element.parentNode.childNodes : [];
+        for (let i = 0; i < siblings.length; i++) {
+            const sibling = siblings[i];
+            if (sibling === element) {
+                return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+            }
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
+                ix++;
+            }
+        }
+    }
+
+    // Accessible name the browser computed for an element (from the
+    // accessibility tree snapshot, keyed by its /tag[n] XPath), or null
+    // when no snapshot is available
+    function getAXName(element) {
+        if (!axNames) return null;
+        let path = '';
+        for (let el = element; el && el.nodeType === 1; el = el.parentNode) {
+            let idx = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) idx++;
+            }
+            path = `/${el.tagName.toLowerCase()}[${idx}]${path}`;
+        }
+        return Object.prototype.hasOwnProperty.call(axNames, path) ? axNames[path].trim() : null;
+    }
+
+    // Reusable function to get effective background color by walking up the DOM tree
+    // Stops at z-index boundaries (stacking contexts) and returns result object
+    // Returns: { backgroundColor, stoppedAtZIndex, hasZIndex }
+    function getEffectiveBackgroundColor(element) {
+        let currentElement = element;
+        let backgroundColor = 'rgba(0, 0, 0, 0)';
+        let stoppedAtZIndex = false;
+
+        // Walk up the DOM tree until we find a non-transparent background
+        while (currentElement && backgroundColor === 'rgba(0, 0, 0, 0)') {
+            const style = window.getComputedStyle(currentElement);
+            backgroundColor = style.backgroundColor;
+
+            // Check if this element has z-index (creates stacking context)
+            // z-index only matters if position is not static
+            const zIndex = style.zIndex;
+            const position = style.position;
+            if (zIndex !== 'auto' && position !== 'static') {
+                stoppedAtZIndex = true;
+                break; // Stop here - element may float over other content
+            }
+
+            currentElement = currentElement.parentElement;
+        }
+
+        // Default to white if we couldn't find a background (reached root)
+        if (backgroundColor === 'rgba(0, 0, 0, 0)') {
+            backgroundColor = 'rgb(255, 255, 255)';
+        }
+
+        return {
+            backgroundColor,
+            stoppedAtZIndex
+        };
+    }
+
+    // Get all buttons (button element and elements with role="button")
+    const allButtons = Array.from(document.querySelectorAll('button, [role="button"]')).filter(btn => {
+        const style = window.getComputedStyle(btn);
+        return style.display !== 'none' && style.visibility !== 'hidden';
+    });
+
+    return allButtons.map(button => {
+        const normalStyle = window.getComputedStyle(button);
+
+        // Get font size for em/rem calculations
+        const fontSize = parseFloat(normalStyle.fontSize) || 16;
+        const rootFontSize = parseFloat(window.getComputedStyle(document.documentElement).fontSize) || 16;
+
+        // Get clip-path for non-rectangular button detection
+        const clipPath = normalStyle.clipPath;
+
+        // Check if button itself has z-index
+        const buttonZIndex = normalStyle.zIndex;
+        const buttonPosition = normalStyle.position;
+        const buttonHasZIndex = (buttonZIndex !== 'auto' && buttonPosition !== 'static');
+
+        // Get button's own background color (for the button itself)
+        const buttonBgResult = getEffectiveBackgroundColor(button);
+        const backgroundColor = buttonBgResult.backgroundColor;
+        const buttonBgStoppedAtZIndex = buttonBgResult.stoppedAtZIndex;
+        const backgroundImage = normalStyle.backgroundImage; // For gradient/image detection
+        const fullBackground = normalStyle.background; // For gradient/image detection
+
+        // Get parent's background information (for outline that sits outside the button)
+        // This is what we should compare the outline against when outline-offset > 0
+        const parentBgResult = button.parentElement
+            ? getEffectiveBackgroundColor(button.parentElement)
+            : buttonBgResult;
+        const parentBackgroundColor = parentBgResult.backgroundColor;
+        const parentBgStoppedAtZIndex = parentBgResult.stoppedAtZIndex;
+
+        // Also get parent's background image/gradient info
+        const parentBackgroundImage = button.parentElement
+            ? window.getComputedStyle(button.parentElement).backgroundImage
+            : 'none';
+        const parentFullBackground = button.parentElement
+            ? window.getComputedStyle(button.parentElement).background
+            : 'none';
+
+        // Calculate button and parent boundaries to check if outline extends beyond parent
+        const buttonRect = button.getBoundingClientRect();
+        const parentRect = button.parentElement ? button.parentElement.getBoundingClientRect() : null;
+
+        // Store boundary information for later outline extent checking
+        const buttonBounds = {
+            top: buttonRect.top,
+            right: buttonRect.right,
+            bottom: buttonRect.bottom,
+            left: buttonRect.left,
+            width: buttonRect.width,
+            height: buttonRect.height
+        };
+
+        const parentBounds = parentRect ? {
+            top: parentRect.top,
+            right: parentRect.right,
+            bottom: parentRect.bottom,
+            left: parentRect.left,
+            width: parentRect.width,
+            height: parentRect.height
+        } : null;
+
+        // Try to get focus styles by checking stylesheets
+        let focusOutlineStyle = null;
+        let focusOutlineWidth = null;
+        let focusOutlineColor = null;
+        let focusOutlineOffset = null;
+        let focusBackgroundColor = null;
+        let focusBorderColor = null;
+        let focusBoxShadow = null;
+
+        // Function to resolve CSS variables like var(--some-var)
+        function resolveCSSVariable(value, element) {
+            if (!value || typeof value !== 'string') return value;
+
+            // Check if value contains var()
+            const varMatch = value.match(/var\((--[^,)]+)(?:,\s*([^)]+))?\)/);
+            if (!varMatch) return value;
+
+            const varName = varMatch[1];
+            const fallback = varMatch[2];
+
+            // Get computed style to resolve the variable - this doesn't manipulate the page
+            const computedStyle = window.getComputedStyle(element);
+            const resolvedValue = computedStyle.getPropertyValue(varName).trim();
+
+            if (resolvedValue) {
+                // Replace the var() with the resolved value
+                return value.replace(varMatch[0], resolvedValue);
+            }
+
+            // If no resolved value, use fallback or return original
+            return fallback || value;
+        }
+
+        // Check all stylesheets for :focus rules
+        const sheets = Array.from(document.styleSheets);
+        for (const sheet of sheets) {
+            try {
+                const rules = Array.from(sheet.cssRules || sheet.rules || []);
+                for (const rule of rules) {
+                    if (rule.selectorText && (rule.selectorText.includes(':focus-visible') || rule.selectorText.includes(':focus'))) {
+                        // Handle multiple selectors separated by commas
+                        const selectors = rule.selectorText.split(',').map(s => s.trim());
+
+                        for (const fullSelector of selectors) {
+                            if (!fullSelector.includes(':focus')) continue;
+
+                            // Remove :focus, :focus-visible, :focus-within and any other pseudo-classes after them
+                            const selector = fullSelector.replace(/:focus(-visible|-within)?([:\s\[>+~,.]|$)/g, '$2');
+
+                            try {
+                                if (button.matches(selector)) {
+                                if (rule.style.outlineStyle !== undefined && rule.style.outlineStyle !== '') {
+                                    focusOutlineStyle = resolveCSSVariable(rule.style.outlineStyle, button);
+                                }
+                                if (rule.style.outlineWidth !== undefined && rule.style.outlineWidth !== '') {
+                                    focusOutlineWidth = resolveCSSVariable(rule.style.outlineWidth, button);
+                                }
+                                if (rule.style.outlineColor !== undefined && rule.style.outlineColor !== '') {
+                                    focusOutlineColor = resolveCSSVariable(rule.style.outlineColor, button);
+                                }
+                                if (rule.style.outlineOffset !== undefined && rule.style.outlineOffset !== '') {
+                                    focusOutlineOffset = resolveCSSVariable(rule.style.outlineOffset, button);
+                                }
+                                if (rule.style.outline !== undefined && rule.style.outline !== '') {
+                                    const outlineValue = resolveCSSVariable(rule.style.outline, button);
+                                    if (outlineValue === 'none' || outlineValue === '0') {
+                                        focusOutlineStyle = 'none';
+                                        focusOutlineWidth = '0px';
+                                    } else {
+                                        // Parse shorthand outline property: "width style color"
+                                        // Handle colors that might contain spaces like rgb(255, 255, 255)
+                                        // Match width (digits with unit)
+                                        const widthMatch = outlineValue.match(/(\d+(?:\.\d+)?(?:px|em|rem))/);
+                                        if (widthMatch) focusOutlineWidth = widthMatch[0];
+
+                                        // Match style (solid, dashed, etc)
+                                        const styleMatch = outlineValue.match(/\b(solid|dashed|dotted|double|groove|ridge|inset|outset)\b/);
+                                        if (styleMatch) focusOutlineStyle = styleMatch[0];
+
+                                        // Match color (everything after style, or hex/rgb/rgba/hsl)
+                                        const colorMatch = outlineValue.match(/(?:rgb|rgba|hsl|hsla)\([^)]+\)|#[0-9a-fA-F]{3,8}|\b(?:white|black|red|blue|green|yellow|purple|orange|pink|brown|gray|grey)\b/);
+                                        if (colorMatch) focusOutlineColor = colorMatch[0];
+                                    }
+                                }
+                                if (rule.style.backgroundColor !== undefined && rule.style.backgroundColor !== '') {
+                                    focusBackgroundColor = resolveCSSVariable(rule.style.backgroundColor, button);
+                                }
+                                if (rule.style.borderColor !== undefined && rule.style.borderColor !== '') {
+                                    focusBorderColor = resolveCSSVariable(rule.style.borderColor, button);
+                                }
+                                if (rule.style.boxShadow !== undefined && rule.style.boxShadow !== '') {
+                                    focusBoxShadow = resolveCSSVariable(rule.style.boxShadow, button);
+                                }
+                                }
+                            } catch (e) {
+                                // Selector might not be valid or might not match
+                            }
+                        }
+                    }
+                }
+            } catch (e) {
+                // Cross-origin stylesheet or other access issue
+            }
+        }
+
+        return {
+            tagName: button.tagName,
+            text: button.textContent.trim().substring(0, 50),
+            accessibleName: getAXName(button),
+            xpath: getXPath(button),
+            html: button.outerHTML.substring(0, 200),
+            className: button.className,
+            fontSize: fontSize,
+            rootFontSize: rootFontSize,
+            clipPath: clipPath,
+            normalOutlineStyle: normalStyle.outlineStyle,
+            normalOutlineWidth: normalStyle.outlineWidth,
+            normalOutlineColor: normalStyle.outlineColor,
+            focusOutlineStyle: focusOutlineStyle,
+            focusOutlineWidth: focusOutlineWidth,
+            focusOutlineColor: focusOutlineColor,
+            focusOutlineOffset: focusOutlineOffset,
+            focusBackgroundColor: focusBackgroundColor,
+            focusBorderColor: focusBorderColor,
+            focusBoxShadow: focusBoxShadow,
+            backgroundColor: backgroundColor,
+            normalBackgroundColor: normalStyle.backgroundColor,
+            buttonHasZIndex: buttonHasZIndex,
+            buttonBgStoppedAtZIndex: buttonBgStoppedAtZIndex,
+            parentBackgroundColor: parentBackgroundColor,
+            parentBgStoppedAtZIndex: parentBgStoppedAtZIndex,
+            parentBackgroundImage: parentBackgroundImage,
+            parentFullBackground: parentFullBackground,
+            backgroundImage: backgroundImage,
+            fullBackground: fullBackground,
+            buttonBounds: buttonBounds,
+            parentBounds: parentBounds
+        };
+    });
+}
@@ -0,0 +1,130 @@
+(widths) => {
+    // Group candidate viewport widths into classes that apply the same
+    // contrast-relevant media rules to text. Testing one width per class
+    // yields the same contrast results as testing all of them.
+
+    // Declarations that change what the text contrast engine measures
+    const CONTRAST_PROPERTIES = [
+        'color', 'background', 'background-color', 'background-image', 'opacity',
+        'font', 'font-size', 'font-weight', 'display', 'visibility', 'filter',
+        'mix-blend-mode', 'position', 'z-index', 'overflow', 'overflow-x',
+        'overflow-y', 'animation', 'animation-name', 'text-shadow'
+    ];
+    // Matched against the element itself so rules for interactive states still count
+    const STATE_PSEUDOS = /::?(hover|focus|focus-visible|focus-within|active|visited|link|before|after|first-line|first-letter|placeholder|selection)\b/g;
+    const ROOT_FONT_SIZE = 16;
+
+    const selectorCache = new Map();
+    const relevantMedia = new Set();
+
+    function setsContrastProperty(style) {
+        for (let i = 0; i < style.length; i++) {
+            const property = style[i];
+            // Custom properties may feed colors through var()
+            if (property.startsWith('--') || CONTRAST_PROPERTIES.includes(property) ||
+                property.startsWith('background-') || property.startsWith('font-')) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    function matchesText(selectorText) {
+        if (selectorCache.has(selectorText)) {
+            return selectorCache.get(selectorText);
+        }
+        let matches = true;
+        try {
+            const selector = selectorText.replace(STATE_PSEUDOS, '') || '*';
+            matches = Array.from(document.querySelectorAll(selector))
+                .some(element => element.textContent.trim().length > 0);
+        } catch (e) {
+            // Selectors the browser cannot query are kept
+        }
+        selectorCache.set(selectorText, matches);
+        return matches;
+    }
+
+    function visit(rules, mediaStack) {
+        for (const rule of rules) {
+            if (rule instanceof CSSMediaRule) {
+                visit(rule.cssRules, mediaStack.concat(rule.media.mediaText));
+            } else if (rule.cssRules && !rule.selectorText) {
+                // @supports, @layer and other grouping rules
+                visit(rule.cssRules, mediaStack);
+            } else if (rule.selectorText && mediaStack.length && setsContrastProperty(rule.style)) {
+                if (mediaStack.some(media => !relevantMedia.has(media)) && matchesText(rule.selectorText)) {
+                    mediaStack.forEach(media => relevantMedia.add(media));
+                }
+            }
+        }
+    }
+
+    for (const sheet of document.styleSheets) {
+        try {
+            visit(sheet.cssRules || [], []);
+        } catch (e) {
+            // Skip stylesheets we can't access (CORS)
+        }
+    }
+
+    function toPixels(value, unit) {
+        return unit === 'px' ? value : value * ROOT_FONT_SIZE;
+    }
+
+    // Returns a function of width for media queries built only from media
+    // types and min-/max-width features, or null for anything else
+    function parseQuery(query) {
+        const tests = [];
+        const parts = query.trim().toLowerCase().split(/\s+and\s+/);
+        for (const part of parts) {
+            if (/^(only\s+)?(screen|all)$/.test(part)) {
+                continue;
+            }
+            if (/^(only\s+)?print$/.test(part)) {
+                return () => false;
+            }
+            const feature = part.match(/^\(\s*(min|max)-width\s*:\s*([\d.]+)(px|em|rem)\s*\)$/);
+            if (!feature) {
+                return null;
+            }
+            const limit = toPixels(parseFloat(feature[2]), feature[3]);
+            tests.push(feature[1] === 'min' ? width => width >= limit : width => width <= limit);
+        }
+        return width => tests.every(test => test(width));
+    }
+
+    // Unparsed queries can only change outcome at the widths they mention,
+    // so their component is the position of the width among those values
+    function thresholdPosition(mediaText, width) {
+        const values = [];
+        const pattern = /([\d.]+)(px|em|rem)\b/g;
+        let match;
+        while ((match = pattern.exec(mediaText)) !== null) {
+            values.push(toPixels(parseFloat(match[1]), match[2]));
+        }
+        return values.map(value => width < value ? 0 : width === value ? 1 : 2).join('');
+    }
+
+    const evaluators = Array.from(relevantMedia).map(mediaText => {
+        const queries = mediaText.split(',').map(parseQuery);
+        if (queries.some(query => query === null)) {
+            return width => thresholdPosition(mediaText, width);
+        }
+        return width => queries.some(query => query(width)) ? '1' : '0';
+    });
+
+    const classes = new Map();
+    for (const width of widths.slice().sort((a, b) => a - b)) {
+        const signature = evaluators.map(evaluate => evaluate(width)).join('|');
+        if (!classes.has(signature)) {
+            classes.set(signature, { width: width, widths: [] });
+        }
+        classes.get(signature).widths.push(width);
+    }
+
+    return {
+        classes: Array.from(classes.values()),
+        relevantMediaQueries: relevantMedia.size
+    };
+}
@@ -0,0 +1,384 @@
+(inventoryMarked) => {
+    // Event types of listeners found over CDP (event_listener_inventory.py),
+    // read and removed before anything reports the elements' HTML
+    const LISTENER_ATTRIBUTE = 'data-auto-a11y-listeners';
+    const listenerTypes = new Map();
+    document.querySelectorAll(`[${LISTENER_ATTRIBUTE}]`).forEach(element => {
+        listenerTypes.set(element, element.getAttribute(LISTENER_ATTRIBUTE).split(' '));
+        element.removeAttribute(LISTENER_ATTRIBUTE);
+    });
+    const mouseEventTypes = ['click', 'mousedown', 'mouseup', 'mouseover', 'mouseout', 'dblclick', 'contextmenu'];
+    const keyEventTypes = ['keydown', 'keyup', 'keypress'];
+
+    const results = {
+        applicable: true,
+        errors: [],
+        warnings: [],
+        discovery: [],
+        passes: [],
+        elements_tested: 0,
+        elements_passed: 0,
+        elements_failed: 0,
+        test_name: 'event_handlers',
+        checks: []
+    };
+
+    // Function to generate XPath for elements
+    function getFullXPath(element) {
+        if (!element) return '';
+
+        function getElementIdx(el) {
+            let count = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) {
+                    count++;
+                }
+            }
+            return count;
+        }
+
+        let path = '';
+        while (element && element.nodeType === 1) {
+            const idx = getElementIdx(element);
+            const tagName = element.tagName.toLowerCase();
+            path = `/${tagName}[${idx}]${path}`;
+            element = element.parentNode;
+        }
+        return path;
+    }
+
+    // Check if element is intrinsically interactive
+    function isIntrinsicInteractive(element) {
+        const interactiveTags = ['a', 'button', 'input', 'select', 'textarea', 'details', 'summary'];
+        const interactiveRoles = ['button', 'link', 'menuitem', 'tab', 'checkbox', 'radio', 'switch'];
+
+        return interactiveTags.includes(element.tagName.toLowerCase()) ||
+               (element.getAttribute('role') && 
+                interactiveRoles.includes(element.getAttribute('role')));
+    }
+
+    // Find all focusable elements
+    const focusableElements = Array.from(document.querySelectorAll(
+        'a, button, input, select, textarea, [tabindex], [contentEditable=true], audio[controls], video[controls]'
+    )).filter(el => {
+        const style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden';
+    });
+
+    results.elements_tested = focusableElements.length;
+
+    // Check tab order (only if there are focusable elements)
+    let tabOrderViolations = 0;
+    let previousRect = null;
+
+    focusableElements.forEach((element, index) => {
+        const rect = element.getBoundingClientRect();
+        const tabindex = element.getAttribute('tabindex');
+        const tabindexValue = tabindex ? parseInt(tabindex) : 0;
+
+        // Check for negative tabindex
+        if (tabindexValue < 0) {
+            results.warnings.push({
+                err: 'WarnNegativeTabindex',
+                type: 'warn',
+                cat: 'event_handling',
+                element: element.tagName,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: 'Element has negative tabindex, removing it from tab order',
+                tabindex: tabindexValue
+            });
+        }
+
+        // Check for high tabindex values
+        if (tabindexValue > 10) {
+            results.warnings.push({
+                err: 'WarnHighTabindex',
+                type: 'warn',
+                cat: 'event_handling',
+                element: element.tagName,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: `Element has unusually high tabindex (${tabindexValue}), which may cause navigation issues`,
+                tabindex: tabindexValue
+            });
+        }
+
+        // Check visual tab order
+        if (previousRect && index > 0) {
+            const previousElement = focusableElements[index - 1];
+            const previousElementRect = previousElement.getBoundingClientRect();
+
+            // Calculate vertical alignment
+            const verticalDiff = Math.abs(rect.top - previousElementRect.top);
+            const clearlyDifferentRows = verticalDiff > 10;
+            const definitelySameRow = verticalDiff <= 5;
+            const ambiguousOverlap = verticalDiff > 5 && verticalDiff <= 10;
+
+            // Only check left/right position if there's potential for same-row issue
+            if (!clearlyDifferentRows && rect.left < previousElementRect.left - 50) {
+                // Get readable descriptions of both elements
+                const currentDesc = element.tagName.toLowerCase() +
+                    (element.id ? `#${element.id}` : '') +
+                    (element.textContent ? ` ("${element.textContent.trim().substring(0, 30)}")` : '');
+                const previousDesc = previousElement.tagName.toLowerCase() +
+                    (previousElement.id ? `#${previousElement.id}` : '') +
+                    (previousElement.textContent ? ` ("${previousElement.textContent.trim().substring(0, 30)}")` : '');
+
+                const sharedData = {
+                    cat: 'event_handling',
+                    element: element.tagName.toLowerCase(),
+                    xpath: getFullXPath(element),
+                    html: element.outerHTML.substring(0, 200),
+                    currentElement: {
+                        tag: element.tagName.toLowerCase(),
+                        id: element.id || null,
+                        text: element.textContent.trim().substring(0, 50),
+                        position: { x: Math.round(rect.left), y: Math.round(rect.top) },
+                        tabIndex: index + 1
+                    },
+                    previousElement: {
+                        tag: previousElement.tagName.toLowerCase(),
+                        id: previousElement.id || null,
+                        text: previousElement.textContent.trim().substring(0, 50),
+                        html: previousElement.outerHTML.substring(0, 200),
+                        xpath: getFullXPath(previousElement),
+                        position: { x: Math.round(previousElementRect.left), y: Math.round(previousElementRect.top) },
+                        tabIndex: index
+                    },
+                    verticalDiff: Math.round(verticalDiff)
+                };
+
+                if (definitelySameRow) {
+                    // Clear same-row violation - this is an ERROR
+                    tabOrderViolations++;
+                    results.errors.push({
+                        err: 'ErrTabOrderViolation',
+                        type: 'err',
+                        description: `Tab order diverges from visual layout: ${currentDesc} appears visually left of ${previousDesc} but comes after it in tab order`,
+                        ...sharedData
+                    });
+                    results.elements_failed++;
+                } else if (ambiguousOverlap) {
+                    // Ambiguous overlap - this is a WARNING
+                    results.warnings.push({
+                        err: 'WarnAmbiguousTabOrder',
+                        type: 'warn',
+                        description: `Possible tab order issue: ${currentDesc} appears left of ${previousDesc} but comes after it. Elements overlap vertically (${Math.round(verticalDiff)}px difference) - verify visual layout matches intended tab order`,
+                        ...sharedData
+                    });
+                }
+            } else {
+                results.elements_passed++;
+            }
+        }
+
+        previousRect = rect;
+    });
+
+    // Without the CDP inventory, parse JavaScript to find programmatic event listeners
+    const elementEventMap = new Map(); // element id/selector -> {mouseEvents: Set, keyEvents: Set}
+
+    const scripts = inventoryMarked ? [] : Array.from(document.querySelectorAll('script'));
+    scripts.forEach(script => {
+        if (!script.src && script.textContent) {
+            const code = script.textContent;
+            // Match patterns like: element.addEventListener('eventType', ...)
+            const addEventListenerPattern = /(\w+)\.addEventListener\(['"](\w+)['"]/g;
+            let match;
+            while ((match = addEventListenerPattern.exec(code)) !== null) {
+                const varName = match[1];
+                const eventType = match[2].toLowerCase();
+
+                if (!elementEventMap.has(varName)) {
+                    elementEventMap.set(varName, {mouseEvents: new Set(), keyEvents: new Set()});
+                }
+
+                const events = elementEventMap.get(varName);
+                if (mouseEventTypes.includes(eventType)) {
+                    events.mouseEvents.add(eventType);
+                } else if (keyEventTypes.includes(eventType)) {
+                    events.keyEvents.add(eventType);
+                }
+            }
+        }
+    });
+
+    // Check for elements with event handlers but no tabindex
+    const allElements = Array.from(document.querySelectorAll('*'));
+    allElements.forEach(element => {
+        let hasMouseHandler = false;
+        let hasKeyboardHandler = false;
+
+        // Check for inline event handlers
+        Array.from(element.attributes).forEach(attr => {
+            if (attr.name.startsWith('on')) {
+                const eventType = attr.name.slice(2).toLowerCase();
+                if (keyEventTypes.includes(eventType)) {
+                    hasKeyboardHandler = true;
+                }
+                if (mouseEventTypes.includes(eventType)) {
+                    hasMouseHandler = true;
+                }
+            }
+        });
+
+        // Check for listeners found over CDP (addEventListener, on* properties)
+        (listenerTypes.get(element) || []).forEach(eventType => {
+            if (keyEventTypes.includes(eventType)) hasKeyboardHandler = true;
+            if (mouseEventTypes.includes(eventType)) hasMouseHandler = true;
+        });
+
+        // Check if element has programmatic handlers based on parsed JavaScript
+        if (element.id && elementEventMap.has(element.id)) {
+            const events = elementEventMap.get(element.id);
+            if (events.mouseEvents.size > 0) hasMouseHandler = true;
+            if (events.keyEvents.size > 0) hasKeyboardHandler = true;
+        }
+
+        // Check for ErrMissingTabindex
+        if ((hasMouseHandler || hasKeyboardHandler) && !isIntrinsicInteractive(element) && !element.hasAttribute('tabindex')) {
+            const tagName = element.tagName.toLowerCase();
+            const hasOnclick = element.hasAttribute('onclick');
+            const hasOtherHandlers = element.hasAttribute('onmousedown') ||
+                                     element.hasAttribute('onmouseup') ||
+                                     element.hasAttribute('ondblclick');
+
+            results.errors.push({
+                err: 'ErrMissingTabindex',
+                type: 'err',
+                cat: 'event_handling',
+                element: tagName,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: `<${tagName}> with event handler is not keyboard accessible - missing tabindex`,
+                elementTag: tagName,
+                hasOnclick: hasOnclick,
+                hasOtherHandlers: hasOtherHandlers
+            });
+            results.elements_failed++;
+        }
+
+        // Check for mouse-only handlers
+        if (hasMouseHandler && !hasKeyboardHandler && !isIntrinsicInteractive(element) && !element.hasAttribute('tabindex')) {
+            results.errors.push({
+                err: 'ErrMouseOnlyHandler',
+                type: 'err',
+                cat: 'event_handling',
+                element: element.tagName,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: 'Element has mouse handler but no keyboard handler'
+            });
+            results.elements_failed++;
+        }
+    });
+
+    // Check for modals without escape handlers
+    // Collect inline JS and external script URLs for analysis
+    let inlineJsCode = '';
+    const externalScriptUrls = [];
+    const allScripts = Array.from(document.querySelectorAll('script'));
+    allScripts.forEach(script => {
+        if (script.src) {
+            externalScriptUrls.push(script.src);
+        } else if (script.textContent) {
+            inlineJsCode += script.textContent + '\n';
+        }
+    });
+
+    // Store for Python to fetch external scripts and complete the check
+    results._inlineJsCode = inlineJsCode;
+    results._externalScriptUrls = externalScriptUrls;
+
+    // Placeholder - will be recalculated in Python after fetching external scripts
+    let pageHasEscapeHandler = false;
+
+    // Collect modal info for Python to check after fetching external scripts
+    const modals = Array.from(document.querySelectorAll('dialog, [role="dialog"], [class*="modal"]'))
+        .filter(modal => {
+            // Exclude nested modal content containers - only check outermost modal
+            const hasModalAncestor = Array.from(document.querySelectorAll('dialog, [role="dialog"], [class*="modal"]'))
+                .some(otherModal => otherModal !== modal && otherModal.contains(modal));
+            return !hasModalAncestor;
+        });
+
+    results._modals = modals.map(modal => {
+        const onkeydown = modal.getAttribute('onkeydown');
+        const hasInlineEscapeHandler = onkeydown &&
+                               (onkeydown.includes('Escape') ||
+                                onkeydown.includes('Esc') ||
+                                onkeydown.includes('27'));
+        return {
+            tagName: modal.tagName,
+            xpath: getFullXPath(modal),
+            html: modal.outerHTML.substring(0, 200),
+            hasInlineEscapeHandler: hasInlineEscapeHandler
+        };
+    });
+
+    // Add check information for reporting
+    results.checks.push({
+        description: 'Interactive elements accessibility',
+        wcag: ['2.1.1', '2.1.3'],
+        total: focusableElements.length,
+        passed: results.elements_passed,
+        failed: results.elements_failed
+    });
+
+    if (tabOrderViolations > 0) {
+        results.checks.push({
+            description: 'Tab order violations',
+            wcag: ['2.4.3'],
+            total: focusableElements.length,
+            passed: focusableElements.length - tabOrderViolations,
+            failed: tabOrderViolations
+        });
+    }
+
+    // DISCOVERY: Report each script element and inline event handler individually
+    const scriptElements = Array.from(document.querySelectorAll('script[src], script:not([src])'));
+    scriptElements.forEach(script => {
+        const src = script.getAttribute('src');
+        const isInline = !src;
+        const scriptContent = isInline ? script.textContent.substring(0, 100) : '';
+
+        results.warnings.push({
+            err: 'DiscoFoundJS',
+            type: 'disco',
+            cat: 'event_handling',
+            element: 'script',
+            xpath: getFullXPath(script),
+            html: script.outerHTML.substring(0, 200),
+            description: isInline
+                ? `Inline <script> tag detected - ensure progressive enhancement and that functionality works without JavaScript`
+                : `External script "${src}" detected - ensure progressive enhancement and that functionality works without JavaScript`,
+            scriptType: isInline ? 'inline' : 'external',
+            src: src || null
+        });
+    });
+
+    // DISCOVERY: Report elements with inline event handler attributes
+    const elementsWithHandlers = Array.from(document.querySelectorAll('*'))
+        .filter(el => Array.from(el.attributes).some(attr => attr.name.startsWith('on')));
+
+    elementsWithHandlers.forEach(element => {
+        const handlers = Array.from(element.attributes)
+            .filter(attr => attr.name.startsWith('on'))
+            .map(attr => attr.name)
+            .join(', ');
+
+        results.warnings.push({
+            err: 'DiscoFoundJS',
+            type: 'disco',
+            cat: 'event_handling',
+            element: element.tagName.toLowerCase(),
+            xpath: getFullXPath(element),
+            html: element.outerHTML.substring(0, 200),
+            description: `Element has inline event handler attributes (${handlers}) - ensure keyboard accessibility and progressive enhancement`,
+            eventHandlers: handlers
+        });
+    });
+
+    return results;
+}
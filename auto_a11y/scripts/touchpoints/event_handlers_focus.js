@@ -0,0 +1,185 @@
+() => {
+    const elements = [];
+
+    // Elements with listeners found over CDP (event_listener_inventory.py)
+    const LISTENER_ATTRIBUTE = 'data-auto-a11y-listeners';
+    const elementsWithListeners = new Set();
+    document.querySelectorAll(`[${LISTENER_ATTRIBUTE}]`).forEach(element => {
+        elementsWithListeners.add(element);
+        element.removeAttribute(LISTENER_ATTRIBUTE);
+    });
+
+    // Function to generate XPath for elements
+    function getFullXPath(element) {
+        if (!element) return '';
+
+        function getElementIdx(el) {
+            let count = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) {
+                    count++;
+                }
+            }
+            return count;
+        }
+
+        let path = '';
+        while (element && element.nodeType === 1) {
+            const idx = getElementIdx(element);
+            const tagName = element.tagName.toLowerCase();
+            path = `/${tagName}[${idx}]${path}`;
+            element = element.parentNode;
+        }
+        return path;
+    }
+
+    // Interactive tags to exclude (already natively interactive)
+    const interactiveTags = ['a', 'button', 'input', 'select', 'textarea', 'summary', 'details'];
+    const interactiveRoles = [
+        'button', 'link', 'checkbox', 'radio', 'tab', 'menuitem',
+        'menuitemcheckbox', 'menuitemradio', 'option', 'switch',
+        'textbox', 'searchbox', 'slider', 'spinbutton', 'combobox',
+        'scrollbar', 'gridcell', 'treeitem'
+    ];
+
+    // Find all elements with tabindex >= -1
+    const allElements = document.querySelectorAll('[tabindex]');
+    allElements.forEach((element) => {
+        const tabindex = parseInt(element.getAttribute('tabindex'));
+        if (tabindex < -1) return; // Skip non-focusable
+
+        const tagName = element.tagName.toLowerCase();
+        const role = element.getAttribute('role');
+
+        // Skip semantic interactive elements
+        if (interactiveTags.includes(tagName)) return;
+        if (role && interactiveRoles.includes(role)) return;
+
+        // Extract styles
+        const computed = window.getComputedStyle(element);
+
+        // Extract :focus styles from stylesheets
+        let focusOutlineStyle = null;
+        let focusOutlineWidth = null;
+        let focusOutlineColor = null;
+        let focusBoxShadow = null;
+        let focusBorderWidth = null;
+        let focusBackgroundColor = null;
+
+        try {
+            for (let sheet of document.styleSheets) {
+                try {
+                    const rules = sheet.cssRules || sheet.rules;
+                    if (!rules) continue;
+
+                    for (let rule of rules) {
+                        if (!rule.selectorText || !rule.selectorText.includes(':focus')) continue;
+
+                        const testSelector = rule.selectorText.replace(/:focus.*?(?=[,\s]|$)/g, '').trim();
+                        if (!testSelector) continue;
+
+                        try {
+                            if (element.matches(testSelector)) {
+                                if (rule.style.outlineStyle !== undefined && rule.style.outlineStyle !== '') {
+                                    focusOutlineStyle = rule.style.outlineStyle;
+                                }
+                                if (rule.style.outlineWidth !== undefined && rule.style.outlineWidth !== '') {
+                                    focusOutlineWidth = rule.style.outlineWidth;
+                                }
+                                if (rule.style.outlineColor !== undefined && rule.style.outlineColor !== '') {
+                                    focusOutlineColor = rule.style.outlineColor;
+                                }
+                                if (rule.style.outline !== undefined && rule.style.outline !== '') {
+                                    const outlineValue = rule.style.outline;
+                                    if (outlineValue === 'none' || outlineValue === '0') {
+                                        focusOutlineStyle = 'none';
+                                        focusOutlineWidth = '0px';
+                                    } else {
+                                        const parts = outlineValue.split(' ');
+                                        for (let part of parts) {
+                                            if (part.includes('px') || part.includes('em') || part.includes('rem')) {
+                                                focusOutlineWidth = part;
+                                            } else if (['solid', 'dotted', 'dashed', 'double'].includes(part)) {
+                                                focusOutlineStyle = part;
+                                            }
+                                        }
+                                        const colorParts = parts.filter(p =>
+                                            !p.match(/^\d+(\.\d+)?(px|em|rem)$/) &&
+                                            !['solid', 'dotted', 'dashed', 'double'].includes(p)
+                                        );
+                                        if (colorParts.length > 0) {
+                                            focusOutlineColor = colorParts.join(' ');
+                                        }
+                                    }
+                                }
+                                if (rule.style.boxShadow !== undefined && rule.style.boxShadow !== '') {
+                                    focusBoxShadow = rule.style.boxShadow;
+                                }
+                                if (rule.style.borderWidth !== undefined && rule.style.borderWidth !== '') {
+                                    focusBorderWidth = rule.style.borderWidth;
+                                }
+                                if (rule.style.backgroundColor !== undefined && rule.style.backgroundColor !== '') {
+                                    focusBackgroundColor = rule.style.backgroundColor;
+                                }
+                            }
+                        } catch (e) {
+                            // Invalid selector
+                        }
+                    }
+                } catch (e) {
+                    // Cross-origin stylesheet
+                }
+            }
+        } catch (e) {
+            // Error accessing stylesheets
+        }
+
+        // Check for inline event handlers
+        const eventAttrs = ['onclick', 'onkeydown', 'onkeyup', 'onkeypress', 'onmousedown', 'onmouseup'];
+        const hasInlineHandler = eventAttrs.some(attr => element.hasAttribute(attr));
+        const hasEventListener = elementsWithListeners.has(element);
+
+        // Check if parent is an interactive element (for detecting redundant focusable children)
+        let parentIsInteractive = false;
+        let parentTag = '';
+        if (element.parentElement) {
+            const parent = element.parentElement;
+            parentTag = parent.tagName.toLowerCase();
+            const parentTabindex = parseInt(parent.getAttribute('tabindex') || '-1');
+            const interactiveTags = ['button', 'a', 'summary'];
+            parentIsInteractive = interactiveTags.includes(parentTag) || parentTabindex >= 0;
+        }
+
+        // Check for aria-hidden
+        const ariaHidden = element.getAttribute('aria-hidden');
+
+        elements.push({
+            tag: tagName,
+            id: element.id || '',
+            className: element.className || '',
+            tabindex: tabindex,
+            role: role || '',
+            xpath: getFullXPath(element),
+            html: element.outerHTML.substring(0, 300),  // Capture HTML snippet for display
+            hasInlineHandler: hasInlineHandler,
+            hasEventListener: hasEventListener,
+            parentTag: parentTag,
+            parentIsInteractive: parentIsInteractive,
+            ariaHidden: ariaHidden,
+            normalOutlineStyle: computed.outlineStyle,
+            normalOutlineWidth: computed.outlineWidth,
+            normalBorderWidth: computed.borderWidth,
+            normalBoxShadow: computed.boxShadow,
+            backgroundColor: computed.backgroundColor,
+            backgroundImage: computed.backgroundImage,
+            focusOutlineStyle,
+            focusOutlineWidth,
+            focusOutlineColor,
+            focusBoxShadow,
+            focusBorderWidth,
+            focusBackgroundColor
+        });
+    });
+
+    return elements;
+}
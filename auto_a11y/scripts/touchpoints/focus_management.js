@@ -0,0 +1,221 @@
+(indicatorSelectors) => {
+    // Elements whose focus styles cannot be resolved from the captured
+    // :focus rules are marked with this attribute and confirmed by the
+    // Python test with forced pseudo-states
+    const PROBE_ATTRIBUTE = 'data-auto-a11y-focus-probe';
+
+    const results = {
+        applicable: true,
+        errors: [],
+        warnings: [],
+        passes: [],
+        elements_tested: 0,
+        elements_passed: 0,
+        elements_failed: 0,
+        test_name: 'focus_management',
+        checks: []
+    };
+
+    // Function to generate XPath for elements
+    function getFullXPath(element) {
+        if (!element) return '';
+
+        function getElementIdx(el) {
+            let count = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) {
+                    count++;
+                }
+            }
+            return count;
+        }
+
+        let path = '';
+        while (element && element.nodeType === 1) {
+            const idx = getElementIdx(element);
+            const tagName = element.tagName.toLowerCase();
+            path = `/${tagName}[${idx}]${path}`;
+            element = element.parentNode;
+        }
+        return path;
+    }
+
+    // Computed styles compared between the normal and the focused state
+    function focusStyleSnapshot(element) {
+        const style = window.getComputedStyle(element);
+        return {
+            outlineWidth: style.outlineWidth,
+            outlineStyle: style.outlineStyle,
+            outlineColor: style.outlineColor,
+            backgroundColor: style.backgroundColor,
+            borderColor: style.borderColor,
+            boxShadow: style.boxShadow
+        };
+    }
+
+    // Captured :focus/:focus-visible selectors that set a visible indicator,
+    // combined into one selector list (invalid selectors are dropped)
+    let indicatorSelector = null;
+    if (Array.isArray(indicatorSelectors)) {
+        const valid = indicatorSelectors.filter(selector => {
+            try {
+                document.createDocumentFragment().querySelector(selector);
+                return true;
+            } catch (e) {
+                return false;
+            }
+        });
+        indicatorSelector = valid.length ? valid.join(', ') : null;
+    }
+
+    function hasCapturedFocusStyles(element) {
+        try {
+            return indicatorSelector !== null && element.matches(indicatorSelector);
+        } catch (e) {
+            return false;
+        }
+    }
+
+    // Get all interactive elements
+    const interactiveElements = Array.from(document.querySelectorAll(
+        'a, button, input, select, textarea, [role="button"], [role="link"], [tabindex="0"], [contenteditable="true"]'
+    )).filter(el => {
+        const style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden' && !el.disabled;
+    });
+
+    if (interactiveElements.length === 0) {
+        results.applicable = false;
+        results.not_applicable_reason = 'No interactive elements found on the page';
+        return results;
+    }
+
+    results.elements_tested = interactiveElements.length;
+    // Unresolved elements, in document order, with the error reported if
+    // forcing :focus does not change their appearance
+    results.pendingFocus = [];
+    document.querySelectorAll(`[${PROBE_ATTRIBUTE}]`).forEach(el => el.removeAttribute(PROBE_ATTRIBUTE));
+
+    // Test each interactive element
+    interactiveElements.forEach(element => {
+        const tag = element.tagName.toLowerCase();
+        const text = element.textContent.trim().substring(0, 50);
+
+        // Check for focus indicators
+        if (hasCapturedFocusStyles(element)) {
+            results.elements_passed++;
+        } else {
+            // Capture HTML, with fallback for edge cases
+            let htmlSnippet = '';
+            let htmlSource = 'unknown';
+            try {
+                if (element.outerHTML) {
+                    htmlSnippet = element.outerHTML.substring(0, 200);
+                    htmlSource = 'outerHTML';
+                } else {
+                    htmlSnippet = `<${tag}${element.id ? ' id="' + element.id + '"' : ''}${element.className ? ' class="' + element.className + '"' : ''}>${text}</${tag}>`;
+                    htmlSource = 'fallback-empty';
+                }
+            } catch (e) {
+                htmlSnippet = `<${tag}${element.id ? ' id="' + element.id + '"' : ''}${element.className ? ' class="' + element.className + '"' : ''}>${text}</${tag}>`;
+                htmlSource = 'fallback-error';
+            }
+
+            element.setAttribute(PROBE_ATTRIBUTE, String(results.pendingFocus.length));
+            results.pendingFocus.push({
+                baseline: focusStyleSnapshot(element),
+                error: {
+                    err: 'ErrNoFocusIndicator',
+                    type: 'err',
+                    cat: 'focus_management',
+                    element: tag,
+                    xpath: getFullXPath(element),
+                    html: htmlSnippet,
+                    htmlSource: htmlSource,
+                    description: 'Interactive element has no visible focus indicator',
+                    text: text
+                }
+            });
+        }
+
+        // Check hover styles
+        const style = window.getComputedStyle(element);
+        if (['a', 'button'].includes(tag) && style.cursor !== 'pointer') {
+            results.warnings.push({
+                err: 'WarnNoCursorPointer',
+                type: 'warn',
+                cat: 'focus_management',
+                element: tag,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: 'Interactive element does not have pointer cursor on hover',
+                text: text
+            });
+        }
+    });
+
+    // Check in-page link targets
+    const anchorLinks = Array.from(document.querySelectorAll('a[href^="#"]:not([href="#"])'));
+    const processedTargets = new Set();
+
+    anchorLinks.forEach(link => {
+        const targetId = link.getAttribute('href').substring(1);
+        const target = document.getElementById(targetId);
+
+        if (target && !processedTargets.has(targetId)) {
+            const tabindex = target.getAttribute('tabindex');
+            const isInteractive = ['a', 'button', 'input', 'select', 'textarea'].includes(target.tagName.toLowerCase());
+
+            if (!isInteractive && tabindex !== '-1') {
+                // Find all anchor links pointing to this target
+                const linksToTarget = anchorLinks.filter(l =>
+                    l.getAttribute('href').substring(1) === targetId
+                ).map((l, idx) => ({
+                    index: idx + 1,
+                    html: l.outerHTML.substring(0, 200),
+                    xpath: getFullXPath(l),
+                    text: l.textContent.trim()
+                }));
+
+                results.errors.push({
+                    err: 'ErrAnchorTargetTabindex',
+                    type: 'err',
+                    cat: 'links',
+                    element: target.tagName.toLowerCase(),
+                    xpath: getFullXPath(target),
+                    html: target.outerHTML.substring(0, 200),
+                    description: 'In-page link target needs tabindex="-1" for keyboard accessibility - non-interactive element must be programmatically focusable',
+                    metadata: {
+                        targetId: targetId,
+                        currentTabindex: tabindex || 'not set',
+                        anchorLinks: linksToTarget,
+                        anchorLinksCount: linksToTarget.length
+                    }
+                });
+
+                processedTargets.add(targetId);
+            }
+        }
+    });
+
+    // Add check information for reporting
+    results.checks.push({
+        description: 'Focus indicators',
+        wcag: ['2.4.7'],
+        total: interactiveElements.length,
+        passed: results.elements_passed,
+        failed: results.elements_failed
+    });
+
+    if (anchorLinks.length > 0) {
+        results.checks.push({
+            description: 'In-page link targets',
+            wcag: ['2.4.3'],
+            total: anchorLinks.length,
+            passed: anchorLinks.length,
+            failed: 0
+        });
+    }
+
+    return results;
+}
@@ -0,0 +1,48 @@
+({ mode }) => {
+    // Reads the focus styles of the elements focus_management marked for
+    // confirmation, indexed by their probe number.
+    //   'read':    computed styles as they are (with :focus forced over CDP)
+    //   'focus':   focus each element in turn (when CDP is not available)
+    //   'cleanup': remove the probe markers
+    const PROBE_ATTRIBUTE = 'data-auto-a11y-focus-probe';
+    const probes = Array.from(document.querySelectorAll(`[${PROBE_ATTRIBUTE}]`));
+
+    if (mode === 'cleanup') {
+        probes.forEach(element => element.removeAttribute(PROBE_ATTRIBUTE));
+        return [];
+    }
+
+    function focusStyleSnapshot(element) {
+        const style = window.getComputedStyle(element);
+        return {
+            outlineWidth: style.outlineWidth,
+            outlineStyle: style.outlineStyle,
+            outlineColor: style.outlineColor,
+            backgroundColor: style.backgroundColor,
+            borderColor: style.borderColor,
+            boxShadow: style.boxShadow
+        };
+    }
+
+    const snapshots = [];
+    const previouslyFocused = document.activeElement;
+    for (const element of probes) {
+        const index = parseInt(element.getAttribute(PROBE_ATTRIBUTE), 10);
+        if (mode === 'focus') {
+            try {
+                element.focus({ preventScroll: true });
+            } catch (e) {
+                // Element cannot take focus
+            }
+        }
+        snapshots[index] = focusStyleSnapshot(element);
+    }
+    if (mode === 'focus') {
+        if (previouslyFocused && previouslyFocused !== document.body && previouslyFocused.focus) {
+            previouslyFocused.focus({ preventScroll: true });
+        } else if (document.activeElement && document.activeElement.blur) {
+            document.activeElement.blur();
+        }
+    }
+    return snapshots;
+}
@@ -0,0 +1,363 @@
+(args) => {
+    const inaccessibleFontsList = args.fonts;
+    const fontCategoriesData = args.categories;
+    const results = {
+        applicable: true,
+        errors: [],
+        warnings: [],
+        discovery: [],
+        passes: [],
+        elements_tested: 0,
+        elements_passed: 0,
+        elements_failed: 0,
+        test_name: 'fonts',
+        checks: []
+    };
+
+    // Function to generate XPath for elements
+    function getFullXPath(element) {
+        if (!element) return '';
+
+        function getElementIdx(el) {
+            let count = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) {
+                    count++;
+                }
+            }
+            return count;
+        }
+
+        let path = '';
+        while (element && element.nodeType === 1) {
+            const idx = getElementIdx(element);
+            const tagName = element.tagName.toLowerCase();
+            path = `/${tagName}[${idx}]${path}`;
+            element = element.parentNode;
+        }
+        return path;
+    }
+
+    // Get all text elements
+    const textElements = [];
+    const walker = document.createTreeWalker(
+        document.body,
+        NodeFilter.SHOW_TEXT,
+        {
+            acceptNode: function(node) {
+                if (!node.textContent.trim() || 
+                    ['SCRIPT', 'STYLE'].includes(node.parentElement.tagName)) {
+                    return NodeFilter.FILTER_REJECT;
+                }
+                return NodeFilter.FILTER_ACCEPT;
+            }
+        }
+    );
+
+    while (walker.nextNode()) {
+        const textNode = walker.currentNode;
+        const element = textNode.parentElement;
+        if (element && element.offsetHeight > 0 && element.offsetWidth > 0) {
+            textElements.push(element);
+        }
+    }
+
+    if (textElements.length === 0) {
+        results.applicable = false;
+        results.not_applicable_reason = 'No text elements found on the page';
+        return results;
+    }
+
+    results.elements_tested = textElements.length;
+
+    // Get smallest heading size for comparison
+    const headingSizes = [];
+    document.querySelectorAll('h1, h2, h3, h4, h5, h6').forEach(heading => {
+        const size = parseFloat(window.getComputedStyle(heading).fontSize);
+        headingSizes.push(size);
+    });
+    const smallestHeading = headingSizes.length > 0 ? Math.min(...headingSizes) : null;
+
+    // Test each text element - collect small text instances for grouping
+    let smallTextViolations = 0;
+    let lineHeightViolations = 0;
+    let italicTextCount = 0;
+    let alignmentViolations = 0;
+    let hierarchyViolations = 0;
+
+    // Collect small text instances by element type for grouping
+    const smallTextInstances = [];
+
+    textElements.forEach(element => {
+        const style = window.getComputedStyle(element);
+        const fontSize = parseFloat(style.fontSize);
+        const lineHeight = parseFloat(style.lineHeight);
+        const fontStyle = style.fontStyle;
+        const fontWeight = parseInt(style.fontWeight) || 400;
+        const textAlign = style.textAlign;
+        const text = element.textContent.trim().substring(0, 50);
+        const tag = element.tagName.toLowerCase();
+
+        let hasViolation = false;
+
+        // Check for small text - collect instances
+        if (fontSize < 16) {
+            smallTextViolations++;
+            smallTextInstances.push({
+                element: tag,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                fontSize: fontSize,
+                text: text
+            });
+            hasViolation = true;
+        }
+
+        // Check line height
+        if (lineHeight && lineHeight > 0 && (lineHeight / fontSize) < 1.5) {
+            lineHeightViolations++;
+            results.warnings.push({
+                err: 'WarnSmallLineHeight',
+                type: 'warn',
+                cat: 'fonts',
+                element: tag,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: `Line height ratio is ${(lineHeight / fontSize).toFixed(2)} (should be at least 1.5)`,
+                ratio: (lineHeight / fontSize).toFixed(2),
+                lineHeight: lineHeight.toFixed(2),
+                fontSize: fontSize.toFixed(2),
+                text: text
+            });
+            hasViolation = true;
+        }
+
+        // Check for italic text (only flag if substantial length, not brief emphasis)
+        // Short italic text (<50 chars) is acceptable for emphasis (em, i tags)
+        // Extensive italic text is harder to read for users with dyslexia
+        const fullText = element.textContent.trim();
+        if (fontStyle === 'italic' && fullText.length >= 50) {
+            italicTextCount++;
+            results.warnings.push({
+                err: 'WarnItalicText',
+                type: 'warn',
+                cat: 'fonts',
+                element: tag,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: `Text uses italic styling for ${fullText.length} characters which may be difficult to read`,
+                text: text,
+                textLength: fullText.length
+            });
+            hasViolation = true;
+        }
+
+        // Check text alignment
+        if (textAlign === 'justify') {
+            alignmentViolations++;
+            results.warnings.push({
+                err: 'WarnJustifiedText',
+                type: 'warn',
+                cat: 'fonts',
+                element: tag,
+                xpath: getFullXPath(element),
+                html: element.outerHTML.substring(0, 200),
+                description: 'Text uses justify alignment which can create uneven spacing',
+                text: text
+            });
+            hasViolation = true;
+        }
+
+        // Only flag actual right-aligned text, not center or left
+        // Body text that is right-aligned is difficult to read (WCAG 1.4.8 AAA)
+        if (textAlign === 'right' && text.length > 20) {
+            // Additional check: ensure this is body text, not headings or short labels
+            // Exclude inline emphasis elements (strong, em, b, i) - they inherit alignment
+            const isBodyText = ['p', 'div', 'span', 'li', 'td', 'th', 'blockquote', 'article', 'section'].includes(tag);
+            const isInlineEmphasis = ['strong', 'em', 'b', 'i', 'mark', 'code', 'kbd', 'samp', 'var', 'cite', 'abbr'].includes(tag);
+
+            if (isBodyText && !isInlineEmphasis) {
+                alignmentViolations++;
+                results.warnings.push({
+                    err: 'WarnRightAlignedText',
+                    type: 'warn',
+                    cat: 'fonts',
+                    element: tag,
+                    xpath: getFullXPath(element),
+                    html: element.outerHTML.substring(0, 200),
+                    description: 'Body text uses right alignment which can be difficult to read',
+                    text: text,
+                    textAlign: textAlign
+                });
+                hasViolation = true;
+            }
+        }
+
+        // Check visual hierarchy
+        if (fontWeight >= 700 && !['h1', 'h2', 'h3', 'h4', 'h5', 'h6'].includes(tag)) {
+            if (smallestHeading && fontSize > smallestHeading) {
+                hierarchyViolations++;
+                results.warnings.push({
+                    err: 'WarnVisualHierarchy',
+                    type: 'warn',
+                    cat: 'fonts',
+                    element: tag,
+                    xpath: getFullXPath(element),
+                    html: element.outerHTML.substring(0, 200),
+                    fontSize: fontSize,
+                    smallestHeading: smallestHeading,
+                    text: text
+                });
+                hasViolation = true;
+            }
+        }
+
+        if (!hasViolation) {
+            results.elements_passed++;
+        } else {
+            results.elements_failed++;
+        }
+    });
+
+    // Create single grouped error for all small text instances
+    if (smallTextInstances.length > 0) {
+        // Find smallest font size for the summary
+        const smallestSize = Math.min(...smallTextInstances.map(i => parseFloat(i.fontSize)));
+        results.errors.push({
+            err: 'ErrSmallText',
+            type: 'err',
+            cat: 'fonts',
+            element: 'text',
+            metadata: {
+                fontSize: smallestSize,
+                instanceCount: smallTextInstances.length,
+                allInstances: smallTextInstances.map((inst, idx) => ({
+                    index: idx + 1,
+                    element: inst.element,
+                    xpath: inst.xpath,
+                    html: inst.html,
+                    fontSize: inst.fontSize,
+                    text: inst.text
+                }))
+            }
+        });
+    }
+
+    // Add check information for reporting
+    results.checks.push({
+        description: 'Text size accessibility',
+        wcag: ['1.4.4'],
+        total: textElements.length,
+        passed: textElements.length - smallTextViolations,
+        failed: smallTextViolations
+    });
+
+    if (lineHeightViolations > 0) {
+        results.checks.push({
+            description: 'Line height adequacy (best practice)',
+            wcag: [],
+            total: textElements.length,
+            passed: textElements.length - lineHeightViolations,
+            failed: lineHeightViolations
+        });
+    }
+
+    if (italicTextCount > 0) {
+        results.checks.push({
+            description: 'Italic text usage',
+            wcag: ['1.4.8'],
+            total: italicTextCount,
+            passed: 0,
+            failed: italicTextCount
+        });
+    }
+
+    // Load inaccessible fonts from config (passed from Python)
+    // This list is maintained in auto_a11y/config/inaccessible_fonts_defaults.json
+    const inaccessibleFonts = new Set(inaccessibleFontsList);
+
+    // Font category descriptions loaded from config
+    const fontCategories = fontCategoriesData;
+
+    // Helper function to get category for a font
+    function getFontCategory(fontName) {
+        const normalized = fontName.toLowerCase();
+        for (const [category, data] of Object.entries(fontCategories)) {
+            if (data.fonts.includes(normalized)) {
+                return { category, description: data.description };
+            }
+        }
+        return { category: 'unknown', description: 'difficult to read' };
+    }
+
+    // DISCOVERY: Report each unique font with the sizes it's used at
+    const allElements = Array.from(document.querySelectorAll('*'));
+    const fontData = new Map(); // Map of font name -> Set of sizes
+
+    allElements.forEach(el => {
+        const computedStyle = window.getComputedStyle(el);
+        const fontFamily = computedStyle.fontFamily;
+        const fontSize = computedStyle.fontSize;
+
+        if (fontFamily && fontFamily !== 'inherit' && fontSize) {
+            // Clean up font family string - take the first font in the stack
+            const fonts = fontFamily.split(',').map(f => f.trim().replace(/['"]/g, ''));
+            const primaryFont = fonts[0]; // Use the first (primary) font
+
+            if (!fontData.has(primaryFont)) {
+                fontData.set(primaryFont, new Set());
+            }
+            fontData.get(primaryFont).add(fontSize);
+        }
+    });
+
+    // Check each font and report issues
+    fontData.forEach((sizes, fontName) => {
+        const sortedSizes = Array.from(sizes).sort((a, b) => {
+            // Sort by numeric value (converting px to numbers)
+            const aNum = parseFloat(a);
+            const bNum = parseFloat(b);
+            return aNum - bNum;
+        });
+
+        // Discovery: Report that this font was found
+        results.warnings.push({
+            err: 'DiscoFontFound',
+            type: 'disco',
+            cat: 'fonts',
+            element: 'document',
+            xpath: '/html[1]',
+            html: `<meta>Font: ${fontName}</meta>`,
+            description: sortedSizes.length === 1
+                ? `Font is used at 1 size on this page`
+                : `Font is used at ${sortedSizes.length} different sizes on this page`,
+            fontName: fontName,
+            fontSizes: sortedSizes,
+            sizeCount: sortedSizes.length
+        });
+
+        // ERROR: Check if this is an inaccessible font
+        const normalizedFont = fontName.toLowerCase();
+        if (inaccessibleFonts.has(normalizedFont)) {
+            const categoryInfo = getFontCategory(fontName);
+            results.errors.push({
+                err: 'ErrInaccessibleFont',
+                type: 'error',
+                cat: 'fonts',
+                element: 'document',
+                xpath: '/html[1]',
+                html: `<meta>Font: ${fontName}</meta>`,
+                description: `Font '${fontName}' is difficult to read. ${categoryInfo.description}. Research shows these fonts are harder to read, especially for users with dyslexia or low vision.`,
+                fontName: fontName,
+                category: categoryInfo.category,
+                reason: categoryInfo.description,
+                fontSizes: sortedSizes,
+                sizeCount: sortedSizes.length
+            });
+            results.elements_failed++;
+            hasViolation = true;
+        }
+    });
+
+    return results;
+}
@@ -0,0 +1,269 @@
+() => {
+    const inputs = [];
+    const fields = document.querySelectorAll('input[type="text"], input[type="email"], input[type="password"], input[type="search"], input[type="tel"], input[type="url"], input[type="number"], textarea, input:not([type])');
+
+    function getFullXPath(element) {
+        if (!element) return '';
+        function getElementIdx(el) {
+            let count = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) count++;
+            }
+            return count;
+        }
+        let path = '';
+        while (element && element.nodeType === 1) {
+            const idx = getElementIdx(element);
+            const tagName = element.tagName.toLowerCase();
+            path = `/${tagName}[${idx}]${path}`;
+            element = element.parentNode;
+        }
+        return path;
+    }
+
+    function getComputedStyleValue(element, property) {
+        try {
+            return window.getComputedStyle(element).getPropertyValue(property);
+        } catch (e) {
+            return '';
+        }
+    }
+
+    function getEffectiveBackgroundColor(element) {
+        let currentElement = element;
+        let backgroundColor = 'rgba(0, 0, 0, 0)';
+        let stoppedAtZIndex = false;
+
+        while (currentElement) {
+            const style = window.getComputedStyle(currentElement);
+            const currentBg = style.backgroundColor;
+
+            // Check if this element has z-index
+            const zIndex = style.zIndex;
+            const position = style.position;
+            const hasZIndex = (zIndex !== 'auto' && position !== 'static');
+
+            // If we found a solid background, use it
+            if (currentBg !== 'rgba(0, 0, 0, 0)') {
+                backgroundColor = currentBg;
+                // Only mark as stopped at z-index if this element with solid bg also has z-index
+                if (hasZIndex) {
+                    // Check if background is transparent or semi-transparent
+                    const rgba = currentBg.match(/rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([\d.]+))?\)/);
+                    if (rgba) {
+                        const alpha = rgba[4] !== undefined ? parseFloat(rgba[4]) : 1.0;
+                        if (alpha < 1.0) {
+                            stoppedAtZIndex = true;
+                        }
+                    }
+                }
+                break;
+            }
+
+            // If we hit z-index without finding background, that's a problem
+            if (hasZIndex) {
+                stoppedAtZIndex = true;
+                break;
+            }
+
+            currentElement = currentElement.parentElement;
+        }
+
+        // Default to white if no background found
+        if (backgroundColor === 'rgba(0, 0, 0, 0)') {
+            backgroundColor = 'rgb(255, 255, 255)';
+        }
+
+        return {
+            backgroundColor: backgroundColor,
+            stoppedAtZIndex: stoppedAtZIndex
+        };
+    }
+
+    fields.forEach((field, index) => {
+        const normalStyle = window.getComputedStyle(field);
+
+        // Extract focus styles from stylesheets (don't actually focus!)
+        let focusOutlineStyle = null;
+        let focusOutlineWidth = null;
+        let focusOutlineColor = null;
+        let focusOutlineOffset = null;
+        let focusBorderWidth = null;
+        let focusBorderTopWidth = null;
+        let focusBorderRightWidth = null;
+        let focusBorderBottomWidth = null;
+        let focusBorderLeftWidth = null;
+        let focusBorderColor = null;
+        let focusBorderTopColor = null;
+        let focusBoxShadow = null;
+
+        // Check all stylesheets for :focus rules
+        const sheets = Array.from(document.styleSheets);
+        for (const sheet of sheets) {
+            try {
+                const rules = Array.from(sheet.cssRules || sheet.rules || []);
+                for (const rule of rules) {
+                    if (rule.selectorText && rule.selectorText.includes(':focus')) {
+                        const selector = rule.selectorText.replace(':focus', '');
+                        try {
+                            if (field.matches(selector)) {
+                                if (rule.style.outlineStyle !== undefined && rule.style.outlineStyle !== '') {
+                                    focusOutlineStyle = rule.style.outlineStyle;
+                                }
+                                if (rule.style.outlineWidth !== undefined && rule.style.outlineWidth !== '') {
+                                    focusOutlineWidth = rule.style.outlineWidth;
+                                }
+                                if (rule.style.outlineColor !== undefined && rule.style.outlineColor !== '') {
+                                    focusOutlineColor = rule.style.outlineColor;
+                                }
+                                if (rule.style.outlineOffset !== undefined && rule.style.outlineOffset !== '') {
+                                    focusOutlineOffset = rule.style.outlineOffset;
+                                }
+                                if (rule.style.outline !== undefined && rule.style.outline !== '') {
+                                    const outlineValue = rule.style.outline;
+                                    if (outlineValue === 'none' || outlineValue === '0') {
+                                        focusOutlineStyle = 'none';
+                                        focusOutlineWidth = '0px';
+                                    } else {
+                                        // Parse outline shorthand: "2px solid #0066cc" or "3px solid rgba(0, 102, 204, 0.3)"
+                                        // Note: Browser may return it in different orders like "rgba(...) solid 3px"
+                                        const parts = outlineValue.split(' ');
+
+                                        // Try to find width, style, and color from any position
+                                        for (let part of parts) {
+                                            if (part.includes('px') || part.includes('em') || part.includes('rem')) {
+                                                focusOutlineWidth = part;
+                                            } else if (['solid', 'dotted', 'dashed', 'double'].includes(part)) {
+                                                focusOutlineStyle = part;
+                                            }
+                                        }
+
+                                        // Everything that's not width or style is probably color (may have commas/spaces)
+                                        // Get the full color by filtering out width and style
+                                        const colorParts = parts.filter(p =>
+                                            !p.match(/^\d+(\.\d+)?(px|em|rem)$/) &&
+                                            !['solid', 'dotted', 'dashed', 'double'].includes(p)
+                                        );
+                                        if (colorParts.length > 0) {
+                                            focusOutlineColor = colorParts.join(' ');
+                                        }
+                                    }
+                                }
+                                if (rule.style.borderWidth !== undefined && rule.style.borderWidth !== '') {
+                                    focusBorderWidth = rule.style.borderWidth;
+                                }
+                                if (rule.style.borderTopWidth !== undefined && rule.style.borderTopWidth !== '') {
+                                    focusBorderTopWidth = rule.style.borderTopWidth;
+                                }
+                                if (rule.style.borderRightWidth !== undefined && rule.style.borderRightWidth !== '') {
+                                    focusBorderRightWidth = rule.style.borderRightWidth;
+                                }
+                                if (rule.style.borderBottomWidth !== undefined && rule.style.borderBottomWidth !== '') {
+                                    focusBorderBottomWidth = rule.style.borderBottomWidth;
+                                }
+                                if (rule.style.borderLeftWidth !== undefined && rule.style.borderLeftWidth !== '') {
+                                    focusBorderLeftWidth = rule.style.borderLeftWidth;
+                                }
+                                if (rule.style.borderColor !== undefined && rule.style.borderColor !== '') {
+                                    focusBorderColor = rule.style.borderColor;
+                                }
+                                if (rule.style.borderTopColor !== undefined && rule.style.borderTopColor !== '') {
+                                    focusBorderTopColor = rule.style.borderTopColor;
+                                }
+                                if (rule.style.boxShadow !== undefined && rule.style.boxShadow !== '') {
+                                    focusBoxShadow = rule.style.boxShadow;
+                                }
+                                if (rule.style.border !== undefined && rule.style.border !== '') {
+                                    const borderValue = rule.style.border;
+                                    const parts = borderValue.split(' ');
+                                    if (parts.length >= 1) focusBorderWidth = parts[0];
+                                    if (parts.length >= 3) focusBorderColor = parts[2];
+                                }
+                            }
+                        } catch (e) {
+                            // Selector might not be valid
+                        }
+                    }
+                }
+            } catch (e) {
+                // Cross-origin stylesheet
+            }
+        }
+
+        // Get parent information for outline contrast checking
+        const parentElement = field.parentElement;
+        const parentBgInfo = parentElement ? getEffectiveBackgroundColor(parentElement) : {backgroundColor: 'rgb(255, 255, 255)', stoppedAtZIndex: false};
+        const parentStyle = parentElement ? window.getComputedStyle(parentElement) : null;
+
+        // Get bounds for outline extent checking
+        const fieldBounds = field.getBoundingClientRect();
+        const parentBounds = parentElement ? parentElement.getBoundingClientRect() : null;
+
+        // Check if input has z-index
+        const inputHasZIndex = (normalStyle.zIndex !== 'auto' && normalStyle.position !== 'static');
+
+        inputs.push({
+            index,
+            tag: field.tagName.toLowerCase(),
+            type: field.type || 'text',
+            id: field.id || '',
+            className: field.className || '',
+            name: field.name || '',
+            xpath: getFullXPath(field),
+            html: field.outerHTML.substring(0, 200),
+            normalOutlineStyle: normalStyle.outlineStyle,
+            normalOutlineWidth: normalStyle.outlineWidth,
+            normalOutlineColor: normalStyle.outlineColor,
+            normalBorderWidth: normalStyle.borderWidth,
+            normalBorderTopWidth: normalStyle.borderTopWidth,
+            normalBorderRightWidth: normalStyle.borderRightWidth,
+            normalBorderBottomWidth: normalStyle.borderBottomWidth,
+            normalBorderLeftWidth: normalStyle.borderLeftWidth,
+            normalBorderColor: normalStyle.borderColor,
+            normalBorderTopColor: normalStyle.borderTopColor,
+            normalBoxShadow: normalStyle.boxShadow,
+            backgroundColor: normalStyle.backgroundColor,
+            backgroundImage: normalStyle.backgroundImage,
+            fullBackground: normalStyle.background,
+            fontSize: normalStyle.fontSize,
+            focusOutlineStyle,
+            focusOutlineWidth,
+            focusOutlineColor,
+            focusOutlineOffset,
+            focusBorderWidth,
+            focusBorderTopWidth,
+            focusBorderRightWidth,
+            focusBorderBottomWidth,
+            focusBorderLeftWidth,
+            focusBorderColor,
+            focusBorderTopColor,
+            focusBoxShadow,
+            // Parent information for outline contrast checking
+            parentBackgroundColor: parentBgInfo.backgroundColor,
+            parentBgStoppedAtZIndex: parentBgInfo.stoppedAtZIndex,
+            parentBackgroundImage: parentStyle ? parentStyle.backgroundImage : 'none',
+            parentFullBackground: parentStyle ? parentStyle.background : 'none',
+            // Bounds for outline extent checking
+            inputBounds: {
+                top: fieldBounds.top,
+                right: fieldBounds.right,
+                bottom: fieldBounds.bottom,
+                left: fieldBounds.left,
+                width: fieldBounds.width,
+                height: fieldBounds.height
+            },
+            parentBounds: parentBounds ? {
+                top: parentBounds.top,
+                right: parentBounds.right,
+                bottom: parentBounds.bottom,
+                left: parentBounds.left,
+                width: parentBounds.width,
+                height: parentBounds.height
+            } : null,
+            // Z-index detection
+            inputHasZIndex: inputHasZIndex
+        });
+    });
+
+    return inputs;
+}
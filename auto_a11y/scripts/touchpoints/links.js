@@ -0,0 +1,180 @@
+(args) => {
+    // cssRules holds the :focus rules captured over CDP; axNames maps XPath
+    // to the accessible name the browser computed (from the accessibility
+    // tree snapshot). Either may be missing.
+    const { cssRules, axNames } = args || {};
+
+    function getXPath(element) {
+        if (element.id !== '') {
+            return '//' + element.tagName.toLowerCase() + '[@id="' + element.id + '"]';
+        }
+        if (element === document.body) {
+            return '//' + element.tagName.toLowerCase();
+        }
+
+        let ix = 0;
+        const siblings = element.parentNode ? element.parentNode.childNodes : [];
+        for (let i = 0; i < siblings.length; i++) {
+            const sibling = siblings[i];
+            if (sibling === element) {
+                const parentPath = element.parentNode ? getXPath(element.parentNode) : '';
+                return parentPath + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+            }
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
+                ix++;
+            }
+        }
+        return '';
+    }
+
+    // Accessible name the browser computed for an element (from the
+    // accessibility tree snapshot, keyed by its /tag[n] XPath), or null
+    // when no snapshot is available
+    function getAXName(element) {
+        if (!axNames) return null;
+        let path = '';
+        for (let el = element; el && el.nodeType === 1; el = el.parentNode) {
+            let idx = 1;
+            for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
+                if (sib.nodeType === 1 && sib.tagName === el.tagName) idx++;
+            }
+            path = `/${el.tagName.toLowerCase()}[${idx}]${path}`;
+        }
+        return Object.prototype.hasOwnProperty.call(axNames, path) ? axNames[path].trim() : null;
+    }
+
+    const allLinks = Array.from(document.querySelectorAll('a[href]'));
+
+    const visibleLinks = allLinks.filter(link => {
+        const style = window.getComputedStyle(link);
+        return style.display !== 'none' && style.visibility !== 'hidden';
+    });
+
+    return visibleLinks.map(link => {
+        const normalStyle = window.getComputedStyle(link);
+
+        const fontSize = parseFloat(normalStyle.fontSize) || 16;
+        const rootFontSize = parseFloat(window.getComputedStyle(document.documentElement).fontSize) || 16;
+
+        const hasImage = link.querySelector('img') !== null;
+        const hasOnlyImage = hasImage && link.textContent.trim() === '';
+
+        let bgElement = link.parentElement;
+        let backgroundColor = normalStyle.backgroundColor;
+        let backgroundImage = normalStyle.backgroundImage;
+
+        while (bgElement && backgroundColor === 'rgba(0, 0, 0, 0)') {
+            backgroundColor = window.getComputedStyle(bgElement).backgroundColor;
+            bgElement = bgElement.parentElement;
+        }
+
+        if (backgroundColor === 'rgba(0, 0, 0, 0)') {
+            backgroundColor = 'rgb(255, 255, 255)';
+        }
+
+        const fullBackground = normalStyle.background;
+
+        // Focus styles will be populated from pre-captured CSS (in Python)
+        // Only do minimal stylesheet check if no pre-captured rules available
+        let focusOutlineStyle = null;
+        let focusOutlineWidth = null;
+        let focusOutlineColor = null;
+        let focusOutlineOffset = null;
+        let focusTextDecoration = null;
+        let focusTextDecorationLine = null;
+        let focusColor = null;
+        let focusBackgroundColor = null;
+        let focusBorderColor = null;
+        let focusBorderWidth = null;
+        let focusBoxShadow = null;
+
+        // If no pre-captured CSS rules, do a quick check (limited)
+        if (!cssRules || !cssRules.rules) {
+            const sheets = Array.from(document.styleSheets).slice(0, 5);
+            let rulesChecked = 0;
+            sheetLoop:
+            for (const sheet of sheets) {
+                if (rulesChecked >= 100) break;
+                try {
+                    const rules = Array.from(sheet.cssRules || sheet.rules || []).slice(0, 50);
+                    for (const rule of rules) {
+                        rulesChecked++;
+                        if (rulesChecked >= 100) break sheetLoop;
+                        if (rule.selectorText && rule.selectorText.includes(':focus')) {
+                            const selector = rule.selectorText.replace(/:focus(-visible|-within)?/g, '');
+                            try {
+                                if (link.matches(selector)) {
+                                    if (rule.style.outlineStyle) focusOutlineStyle = rule.style.outlineStyle;
+                                    if (rule.style.outlineWidth) focusOutlineWidth = rule.style.outlineWidth;
+                                    if (rule.style.outlineColor) focusOutlineColor = rule.style.outlineColor;
+                                    if (rule.style.outlineOffset) focusOutlineOffset = rule.style.outlineOffset;
+                                    if (rule.style.outline === 'none' || rule.style.outline === '0') {
+                                        focusOutlineStyle = 'none';
+                                        focusOutlineWidth = '0px';
+                                    }
+                                    if (rule.style.textDecoration) focusTextDecoration = rule.style.textDecoration;
+                                    if (rule.style.textDecorationLine) focusTextDecorationLine = rule.style.textDecorationLine;
+                                    if (rule.style.color) focusColor = rule.style.color;
+                                    if (rule.style.backgroundColor) focusBackgroundColor = rule.style.backgroundColor;
+                                    if (rule.style.borderColor) focusBorderColor = rule.style.borderColor;
+                                    if (rule.style.borderWidth) focusBorderWidth = rule.style.borderWidth;
+                                    if (rule.style.boxShadow) focusBoxShadow = rule.style.boxShadow;
+                                }
+                            } catch (e) {}
+                        }
+                    }
+                } catch (e) {}
+            }
+        }
+
+        return {
+            tagName: link.tagName,
+            text: link.textContent.trim().substring(0, 50),
+            accessibleName: getAXName(link),
+            xpath: getXPath(link),
+            html: link.outerHTML.substring(0, 200),
+            hasImage: hasImage,
+            hasOnlyImage: hasOnlyImage,
+            fontSize: fontSize,
+            rootFontSize: rootFontSize,
+            normalTextDecoration: normalStyle.textDecoration,
+            normalTextDecorationLine: normalStyle.textDecorationLine,
+            normalColor: normalStyle.color,
+            normalOutlineStyle: normalStyle.outlineStyle,
+            normalOutlineWidth: normalStyle.outlineWidth,
+            normalOutlineColor: normalStyle.outlineColor,
+            focusOutlineStyle: focusOutlineStyle,
+            focusOutlineWidth: focusOutlineWidth,
+            focusOutlineColor: focusOutlineColor,
+            focusOutlineOffset: focusOutlineOffset,
+            focusTextDecoration: focusTextDecoration,
+            focusTextDecorationLine: focusTextDecorationLine,
+            focusColor: focusColor,
+            focusBackgroundColor: focusBackgroundColor,
+            focusBorderColor: focusBorderColor,
+            focusBorderWidth: focusBorderWidth,
+            focusBoxShadow: focusBoxShadow,
+            backgroundColor: backgroundColor,
+            normalBackgroundColor: normalStyle.backgroundColor,
+            backgroundImage: backgroundImage,
+            fullBackground: fullBackground,
+            target: link.getAttribute('target') || '',
+            ariaLabel: link.getAttribute('aria-label') || '',
+            title: link.getAttribute('title') || '',
+            padding: normalStyle.padding,
+            border: normalStyle.border,
+            borderRadius: normalStyle.borderRadius,
+            borderStyle: normalStyle.borderStyle,
+            display: normalStyle.display,
+            cursor: normalStyle.cursor,
+            hasOnKeyDown: !!link.onkeydown || link.hasAttribute('onkeydown'),
+            hasOnKeyPress: !!link.onkeypress || link.hasAttribute('onkeypress'),
+            hasOnKeyUp: !!link.onkeyup || link.hasAttribute('onkeyup'),
+            onKeyDownAttr: link.getAttribute('onkeydown') || '',
+            onKeyPressAttr: link.getAttribute('onkeypress') || '',
+            onKeyUpAttr: link.getAttribute('onkeyup') || '',
+            elementId: link.id || '',
+            className: link.className || ''
+        };
+    });
+}
@@ -0,0 +1,13 @@
+() => {
+    const scripts = [];
+    const scriptElements = document.querySelectorAll('script');
+    const maxScripts = 30;
+    let count = 0;
+    scriptElements.forEach(script => {
+        if (count < maxScripts && script.textContent && script.textContent.length < 30000) {
+            scripts.push(script.textContent);
+            count++;
+        }
+    });
+    return scripts.join('\n');
+}
@@ -0,0 +1,34 @@
+() => {
+    const breakpoints = new Set();
+
+    // Parse all stylesheets for media queries
+    for (const sheet of document.styleSheets) {
+        try {
+            if (sheet.cssRules) {
+                for (const rule of sheet.cssRules) {
+                    if (rule instanceof CSSMediaRule) {
+                        // Extract width values from media query
+                        const media = rule.media.mediaText;
+                        const widthMatches = media.match(/(?:min-width|max-width):\s*(\d+)px/g);
+                        if (widthMatches) {
+                            widthMatches.forEach(match => {
+                                const value = parseInt(match.match(/(\d+)px/)[1]);
+                                breakpoints.add(value);
+                            });
+                        }
+                    }
+                }
+            }
+        } catch (e) {
+            // Skip stylesheets we can't access (CORS)
+        }
+    }
+
+    // If no breakpoints found in CSS, test at current viewport only
+    if (breakpoints.size === 0) {
+        return [window.innerWidth];
+    }
+
+    // Return only the breakpoints declared in the page's CSS
+    return Array.from(breakpoints).sort((a, b) => a - b);
+}
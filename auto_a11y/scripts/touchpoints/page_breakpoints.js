@@ -0,0 +1,27 @@
+() => {
+    const breakpoints = new Set();
+
+    for (const sheet of document.styleSheets) {
+        try {
+            if (sheet.cssRules) {
+                for (const rule of sheet.cssRules) {
+                    if (rule instanceof CSSMediaRule) {
+                        const media = rule.media.mediaText;
+                        const widthMatches = media.match(/(?:min-width|max-width):\s*(\d+)px/g);
+
+                        if (widthMatches) {
+                            widthMatches.forEach(match => {
+                                const value = parseInt(match.match(/(\d+)px/)[1]);
+                                breakpoints.add(value);
+                            });
+                        }
+                    }
+                }
+            }
+        } catch (e) {
+            // Skip stylesheets we can't access (CORS)
+        }
+    }
+
+    return Array.from(breakpoints).sort((a, b) => a - b);
+}
@@ -0,0 +1,10 @@
+() => {
+    const titleElement = document.querySelector('title');
+    const allTitles = document.querySelectorAll('head > title');
+
+    return {
+        hasTitleElement: !!titleElement,
+        titleText: titleElement ? titleElement.textContent.trim() : '',
+        titleCount: allTitles.length
+    };
+}
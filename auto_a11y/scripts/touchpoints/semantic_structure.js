@@ -0,0 +1,64 @@
+() => {
+    const results = {
+        applicable: true,
+        errors: [],
+        warnings: [],
+        discovery: [],
+        passes: [],
+        elements_tested: 1,
+        elements_passed: 0,
+        elements_failed: 0,
+        test_name: 'semantic_structure',
+        checks: []
+    };
+
+    // Check for DOCTYPE declaration
+    const doctype = document.doctype;
+
+    if (!doctype) {
+        // No DOCTYPE at all
+        results.errors.push({
+            err: 'ErrMissingDocumentType',
+            type: 'err',
+            cat: 'page',
+            element: 'HTML',
+            xpath: '/html',
+            html: '<html>',
+            description: 'HTML document is missing DOCTYPE declaration - browsers will render in quirks mode',
+            compatMode: document.compatMode || 'unknown',
+            recommendation: 'Add <!DOCTYPE html> as the very first line of the HTML document'
+        });
+        results.elements_failed++;
+    } else if (doctype.name !== 'html' || doctype.publicId || doctype.systemId) {
+        // DOCTYPE exists but is not HTML5
+        results.errors.push({
+            err: 'ErrMissingDocumentType',
+            type: 'err',
+            cat: 'page',
+            element: 'HTML',
+            xpath: '/html',
+            html: '<!DOCTYPE ' + doctype.name + '>',
+            description: 'HTML document has incorrect DOCTYPE - should be <!DOCTYPE html> for HTML5',
+            doctypeName: doctype.name,
+            doctypePublicId: doctype.publicId || '',
+            doctypeSystemId: doctype.systemId || '',
+            compatMode: document.compatMode || 'unknown',
+            recommendation: 'Replace with <!DOCTYPE html> for HTML5 standards mode'
+        });
+        results.elements_failed++;
+    } else {
+        // Correct DOCTYPE
+        results.passes.push({
+            test: 'doctype',
+            element: 'HTML',
+            description: 'Document has correct HTML5 DOCTYPE declaration',
+            compatMode: document.compatMode || 'unknown'
+        });
+        results.elements_passed++;
+    }
+
+    // Add compat mode to results for debugging
+    results.compatMode = document.compatMode;
+
+    return results;
+}
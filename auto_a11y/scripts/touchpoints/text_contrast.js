@@ -0,0 +1,563 @@
+(breakpointWidth) => {
+    // Get WCAG level from project config (set by test runner)
+    const wcagLevel = window.WCAG_LEVEL || 'AA';
+
+    // XPath generator
+    function getXPath(element) {
+        if (element.id) {
+            return `//*[@id="${element.id}"]`;
+        }
+        if (element === document.body) {
+            return '/html/body';
+        }
+        let ix = 0;
+        const siblings = element.parentNode ? element.parentNode.childNodes : [];
+        for (let i = 0; i < siblings.length; i++) {
+            const sibling = siblings[i];
+            if (sibling === element) {
+                return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+            }
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
+                ix++;
+            }
+        }
+    }
+
+    // Parsed colors, keyed by computed color. Pages reuse a handful of
+    // colors across thousands of text nodes.
+    const parsedColors = new Map();
+
+    // Parse color to RGBA (memoized; callers never mutate the result)
+    function parseColor(colorStr) {
+        let color = parsedColors.get(colorStr);
+        if (color === undefined) {
+            color = parseColorUncached(colorStr);
+            parsedColors.set(colorStr, color);
+        }
+        return color;
+    }
+
+    // Declared (not computed) values the canvas cannot resolve
+    const UNRESOLVED_COLOR = /var\(|currentcolor|inherit|initial|unset|revert/i;
+
+    // Serialize a color as rgba() so the Python side never has to parse
+    // CSS Color 4 forms (oklch(), lab(), color(display-p3 ...)) itself.
+    // Returns null for colors that cannot be resolved here.
+    function toRgba(colorStr) {
+        if (!colorStr || UNRESOLVED_COLOR.test(colorStr) || !CSS.supports('color', colorStr)) return null;
+        const c = parseColor(colorStr);
+        return `rgba(${c.r}, ${c.g}, ${c.b}, ${c.a})`;
+    }
+
+    function parseColorUncached(colorStr) {
+        if (!colorStr || colorStr === 'transparent') {
+            return { r: 0, g: 0, b: 0, a: 0 };
+        }
+
+        // Try to parse rgba/rgb format first (most common)
+        const rgbaMatch = colorStr.match(/rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([\d.]+))?\)/);
+        if (rgbaMatch) {
+            return {
+                r: parseInt(rgbaMatch[1]),
+                g: parseInt(rgbaMatch[2]),
+                b: parseInt(rgbaMatch[3]),
+                a: rgbaMatch[4] !== undefined ? parseFloat(rgbaMatch[4]) : 1
+            };
+        }
+
+        // Try 6-digit hex
+        const hexMatch6 = colorStr.match(/^#([0-9a-f]{6})$/i);
+        if (hexMatch6) {
+            const hex = hexMatch6[1];
+            return {
+                r: parseInt(hex.substr(0, 2), 16),
+                g: parseInt(hex.substr(2, 2), 16),
+                b: parseInt(hex.substr(4, 2), 16),
+                a: 1
+            };
+        }
+
+        // Try 3-digit hex
+        const hexMatch3 = colorStr.match(/^#([0-9a-f]{3})$/i);
+        if (hexMatch3) {
+            const hex = hexMatch3[1];
+            return {
+                r: parseInt(hex[0] + hex[0], 16),
+                g: parseInt(hex[1] + hex[1], 16),
+                b: parseInt(hex[2] + hex[2], 16),
+                a: 1
+            };
+        }
+
+        // For any other format (named colors, hsl, etc.), use a temporary canvas
+        // to let the browser convert it to rgba
+        try {
+            const canvas = document.createElement('canvas');
+            canvas.width = canvas.height = 1;
+            const ctx = canvas.getContext('2d');
+            ctx.fillStyle = colorStr;
+            ctx.fillRect(0, 0, 1, 1);
+            const imageData = ctx.getImageData(0, 0, 1, 1).data;
+            return {
+                r: imageData[0],
+                g: imageData[1],
+                b: imageData[2],
+                a: imageData[3] / 255
+            };
+        } catch (e) {
+            // If all else fails, return transparent black
+            console.warn('Could not parse color:', colorStr, e);
+            return { r: 0, g: 0, b: 0, a: 0 };
+        }
+    }
+
+    // Check if element is visually hidden (screen reader only)
+    function isVisuallyHidden(element) {
+        const style = window.getComputedStyle(element);
+
+        // Common screen-reader-only patterns
+        if (style.position === 'absolute' &&
+            (style.clip === 'rect(1px, 1px, 1px, 1px)' || style.clip === 'rect(0, 0, 0, 0)')) {
+            return true;
+        }
+
+        if (style.position === 'absolute' &&
+            style.width === '1px' && style.height === '1px' &&
+            style.overflow === 'hidden') {
+            return true;
+        }
+
+        if (style.clip === 'rect(0px, 0px, 0px, 0px)') {
+            return true;
+        }
+
+        return false;
+    }
+
+    // Check for gradient or image background
+    function hasComplexBackground(bgStr) {
+        if (!bgStr || bgStr === 'none') return { hasGradient: false, hasImage: false };
+
+        const lower = bgStr.toLowerCase();
+        return {
+            hasGradient: lower.includes('gradient'),
+            hasImage: lower.includes('url(')
+        };
+    }
+
+    // Check if element has CSS animations
+    // Returns { hasAnimation, animationElement, animationType, animationName }
+    // Note: Short transitions (<=0.5s) are ignored as they don't affect contrast readability
+    function getAnimationInfo(element) {
+        let currentElement = element;
+
+        while (currentElement) {
+            const style = window.getComputedStyle(currentElement);
+            const animationName = style.animationName || style.webkitAnimationName || '';
+            const transition = style.transition || style.webkitTransition || '';
+            const transitionDuration = style.transitionDuration || '0s';
+
+            // Check if animation-name is not 'none' (actual CSS animations are always a concern)
+            const hasAnim = animationName && animationName !== 'none';
+
+            // Parse transition duration - only flag if > 0.5s
+            // Short hover transitions don't affect contrast readability
+            let maxDuration = 0;
+            const durations = transitionDuration.split(',').map(d => d.trim());
+            for (const dur of durations) {
+                if (dur.endsWith('ms')) {
+                    maxDuration = Math.max(maxDuration, parseFloat(dur) / 1000);
+                } else if (dur.endsWith('s')) {
+                    maxDuration = Math.max(maxDuration, parseFloat(dur));
+                }
+            }
+
+            // Only flag transitions > 0.5s that affect color/background/opacity
+            const hasLongTransition = maxDuration > 0.5 && transition && (
+                transition.includes('color') ||
+                transition.includes('background') ||
+                transition.includes('opacity') ||
+                transition.includes('all')
+            );
+
+            if (hasAnim) {
+                return {
+                    hasAnimation: true,
+                    animationElementXpath: getXPath(currentElement),
+                    animationType: 'CSS animation',
+                    animationName: animationName
+                };
+            }
+            if (hasLongTransition) {
+                return {
+                    hasAnimation: true,
+                    animationElementXpath: getXPath(currentElement),
+                    animationType: 'CSS transition (>' + maxDuration.toFixed(1) + 's)',
+                    animationName: transition
+                };
+            }
+
+            currentElement = currentElement.parentElement;
+        }
+
+        return { hasAnimation: false, animationElementXpath: null, animationType: null, animationName: null };
+    }
+
+    // Collect the background colors behind an element by walking up the DOM,
+    // until they add up to an opaque background. They are composited (over
+    // white) and compared with the text color in Python.
+    // Returns: { backgroundLayers, stoppedAtZIndex, zIndexElementXpath, zIndexValue, zIndexPosition, hasGradient, hasImage }
+    function getEffectiveBackground(element) {
+        let currentElement = element;
+        const backgroundLayers = [];
+        let coverage = 0;
+        let stoppedAtZIndex = false;
+        let zIndexElement = null;
+        let zIndexValue = null;
+        let zIndexPosition = null;
+        let hasGradient = false;
+        let hasImage = false;
+
+        while (currentElement && coverage < 1) {
+            const style = window.getComputedStyle(currentElement);
+
+            // Check for gradient or image first
+            const bgImage = style.backgroundImage;
+            const fullBg = style.background;
+            const complex = hasComplexBackground(bgImage) || hasComplexBackground(fullBg);
+
+            if (complex.hasGradient) hasGradient = true;
+            if (complex.hasImage) hasImage = true;
+
+            // Keep this element's background color if it paints anything
+            const bgColor = parseColor(style.backgroundColor);
+            if (bgColor.a > 0) {
+                backgroundLayers.push(toRgba(style.backgroundColor));
+                coverage += bgColor.a * (1 - coverage);
+            }
+
+            // Check for z-index (creates stacking context)
+            const zIndex = style.zIndex;
+            const position = style.position;
+            if (zIndex !== 'auto' && position !== 'static') {
+                stoppedAtZIndex = true;
+                zIndexElement = currentElement;
+                zIndexValue = zIndex;
+                zIndexPosition = position;
+                break;
+            }
+
+            // If we have a fully opaque background, stop
+            if (coverage >= 1 && !hasGradient && !hasImage) {
+                break;
+            }
+
+            currentElement = currentElement.parentElement;
+        }
+
+        return {
+            backgroundLayers,
+            stoppedAtZIndex,
+            zIndexElementXpath: zIndexElement ? getXPath(zIndexElement) : null,
+            zIndexValue: zIndexValue,
+            zIndexPosition: zIndexPosition,
+            hasGradient,
+            hasImage
+        };
+    }
+
+    // Check if text overflows its container
+    // Returns { hasOverflow, containerXpath } or { hasOverflow: false }
+    function checkTextOverflow(element) {
+        const elementRect = element.getBoundingClientRect();
+        let parent = element.parentElement;
+
+        if (!parent) return { hasOverflow: false };
+
+        const parentRect = parent.getBoundingClientRect();
+
+        // Check if text extends beyond parent boundaries
+        const overflows =
+            elementRect.top < parentRect.top ||
+            elementRect.bottom > parentRect.bottom ||
+            elementRect.left < parentRect.left ||
+            elementRect.right > parentRect.right;
+
+        if (overflows) {
+            return {
+                hasOverflow: true,
+                containerXpath: getXPath(parent)
+            };
+        }
+        return { hasOverflow: false };
+    }
+
+    // Check if element or any ancestor is hidden
+    function isElementOrAncestorHidden(element) {
+        let current = element;
+        while (current && current !== document.body) {
+            const style = window.getComputedStyle(current);
+            if (style.display === 'none' || 
+                style.visibility === 'hidden' || 
+                parseFloat(style.opacity) === 0) {
+                return true;
+            }
+            current = current.parentElement;
+        }
+        return false;
+    }
+
+    // Get all text nodes
+    const textElements = [];
+    const walker = document.createTreeWalker(
+        document.body,
+        NodeFilter.SHOW_TEXT,
+        {
+            acceptNode: function(node) {
+                // Skip empty or whitespace-only text
+                if (!node.textContent || !node.textContent.trim()) {
+                    return NodeFilter.FILTER_REJECT;
+                }
+
+                const parent = node.parentElement;
+                if (!parent) return NodeFilter.FILTER_REJECT;
+
+                // Skip if element or any ancestor is hidden
+                if (isElementOrAncestorHidden(parent)) {
+                    return NodeFilter.FILTER_REJECT;
+                }
+
+                // Skip if visually hidden (screen reader only)
+                if (isVisuallyHidden(parent)) {
+                    return NodeFilter.FILTER_REJECT;
+                }
+
+                return NodeFilter.FILTER_ACCEPT;
+            }
+        }
+    );
+
+    // Function to check if a rule selector matches an element
+    function ruleSelectorMatchesElement(rule, element, classes, idSelector) {
+        if (!rule.selectorText) return false;
+
+        const selectorText = rule.selectorText;
+
+        // If element has an ID and rule targets that ID
+        if (idSelector && selectorText.includes(idSelector)) {
+            return true;
+        }
+        // If element has classes and rule targets those classes
+        if (classes.length > 0 && classes.every(cls => selectorText.includes(`.${cls}`))) {
+            return true;
+        }
+        // Generic tag selector (e.g., just "a:hover" or "a")
+        const tagName = element.tagName.toLowerCase();
+        if (selectorText.startsWith(tagName + ':') ||
+            selectorText.startsWith(tagName + '.') ||
+            selectorText === tagName) {
+            return true;
+        }
+
+        return false;
+    }
+
+    // Function to extract styles from a rule for pseudoclasses
+    function extractPseudoclassStylesFromRule(rule, element, classes, idSelector, pseudoclasses) {
+        const states = {};
+
+        if (!rule.selectorText) return states;
+
+        for (let pseudo of pseudoclasses) {
+            if (rule.selectorText.includes(pseudo)) {
+                if (ruleSelectorMatchesElement(rule, element, classes, idSelector)) {
+                    if (!states[pseudo]) {
+                        states[pseudo] = {};
+                    }
+
+                    // Extract color and background-color
+                    if (rule.style.color) {
+                        states[pseudo].color = rule.style.color;
+                    }
+                    if (rule.style.backgroundColor) {
+                        states[pseudo].backgroundColor = rule.style.backgroundColor;
+                    }
+                }
+            }
+        }
+
+        return states;
+    }
+
+    // Function to get pseudoclass styles from CSS rules, including media queries
+    function getPseudoclassStyles(element) {
+        const pseudoclassStates = {};
+
+        // Determine which pseudoclasses to check based on element type
+        // Links (<a> and role="link") should check :link and :visited in addition to common ones
+        // Other interactive elements (buttons, etc.) should NOT check :link or :visited
+        const isLink = element.tagName === 'A' ||
+                       element.getAttribute('role') === 'link';
+
+        const pseudoclasses = isLink
+            ? [':hover', ':focus', ':visited', ':active', ':link']
+            : [':hover', ':focus', ':active'];
+
+        // Build element's class selector (handle SVG elements where className is SVGAnimatedString)
+        const classNameStr = typeof element.className === 'string' ? element.className : (element.className?.baseVal || '');
+        const classes = classNameStr ? classNameStr.split(' ').filter(c => c.trim()) : [];
+        const idSelector = element.id ? `#${element.id}` : '';
+
+        // Also track styles from prefers-contrast media queries
+        const prefersContrastStates = {
+            'more': {},    // prefers-contrast: more
+            'less': {},    // prefers-contrast: less
+            'custom': {}   // prefers-contrast: custom
+        };
+
+        // Parse all stylesheets
+        try {
+            for (let sheet of document.styleSheets) {
+                try {
+                    for (let rule of sheet.cssRules || sheet.rules || []) {
+                        // Check for media rules (including prefers-contrast)
+                        if (rule instanceof CSSMediaRule) {
+                            const mediaText = rule.conditionText || rule.media.mediaText || '';
+
+                            // Check if this is a prefers-contrast media query
+                            let contrastLevel = null;
+                            if (mediaText.includes('prefers-contrast')) {
+                                if (mediaText.includes('more')) contrastLevel = 'more';
+                                else if (mediaText.includes('less')) contrastLevel = 'less';
+                                else if (mediaText.includes('custom')) contrastLevel = 'custom';
+                            }
+
+                            // Process rules within the media query
+                            for (let innerRule of rule.cssRules || []) {
+                                if (contrastLevel) {
+                                    // This is inside a prefers-contrast media query
+                                    // Extract both default and pseudoclass styles
+
+                                    // Check for pseudoclass rules
+                                    const pseudoStyles = extractPseudoclassStylesFromRule(
+                                        innerRule, element, classes, idSelector, pseudoclasses
+                                    );
+
+                                    for (let pseudo in pseudoStyles) {
+                                        const key = `${pseudo}@prefers-contrast:${contrastLevel}`;
+                                        if (!pseudoclassStates[key]) {
+                                            pseudoclassStates[key] = {};
+                                        }
+                                        Object.assign(pseudoclassStates[key], pseudoStyles[pseudo]);
+                                    }
+
+                                    // Also check for default state (no pseudoclass)
+                                    if (innerRule.selectorText && !pseudoclasses.some(p => innerRule.selectorText.includes(p))) {
+                                        if (ruleSelectorMatchesElement(innerRule, element, classes, idSelector)) {
+                                            const key = `default@prefers-contrast:${contrastLevel}`;
+                                            if (!pseudoclassStates[key]) {
+                                                pseudoclassStates[key] = {};
+                                            }
+                                            if (innerRule.style.color) {
+                                                pseudoclassStates[key].color = innerRule.style.color;
+                                            }
+                                            if (innerRule.style.backgroundColor) {
+                                                pseudoclassStates[key].backgroundColor = innerRule.style.backgroundColor;
+                                            }
+                                        }
+                                    }
+                                } else {
+                                    // Regular media query (not prefers-contrast), process pseudoclasses
+                                    const pseudoStyles = extractPseudoclassStylesFromRule(
+                                        innerRule, element, classes, idSelector, pseudoclasses
+                                    );
+                                    for (let pseudo in pseudoStyles) {
+                                        if (!pseudoclassStates[pseudo]) {
+                                            pseudoclassStates[pseudo] = {};
+                                        }
+                                        Object.assign(pseudoclassStates[pseudo], pseudoStyles[pseudo]);
+                                    }
+                                }
+                            }
+                        } else if (rule.selectorText) {
+                            // Regular rule (not in media query)
+                            const pseudoStyles = extractPseudoclassStylesFromRule(
+                                rule, element, classes, idSelector, pseudoclasses
+                            );
+                            for (let pseudo in pseudoStyles) {
+                                if (!pseudoclassStates[pseudo]) {
+                                    pseudoclassStates[pseudo] = {};
+                                }
+                                Object.assign(pseudoclassStates[pseudo], pseudoStyles[pseudo]);
+                            }
+                        }
+                    }
+                } catch (e) {
+                    // Skip inaccessible stylesheets (CORS)
+                }
+            }
+        } catch (e) {
+            // Error accessing stylesheets
+        }
+
+        return pseudoclassStates;
+    }
+
+    let node;
+    while (node = walker.nextNode()) {
+        const element = node.parentElement;
+        const style = window.getComputedStyle(element);
+
+        // Raw computed styles only: contrast ratios, large text and
+        // thresholds are computed in Python for the whole page at once
+        const fontSize = parseFloat(style.fontSize);
+        const fontWeight = parseInt(style.fontWeight) || 400;
+
+        // Get background
+        const bgInfo = getEffectiveBackground(element);
+
+        // Check for text overflow
+        const overflowInfo = checkTextOverflow(element);
+
+        // Check for animations
+        const animInfo = getAnimationInfo(element);
+
+        // Get pseudoclass styles and prefers-contrast media query styles
+        // Check for ALL elements (not just interactive) because media queries affect all text
+        const pseudoclassStyles = {};
+        const pseudoStyles = getPseudoclassStyles(element);
+        for (let pseudo in pseudoStyles) {
+            pseudoclassStyles[pseudo] = {
+                color: toRgba(pseudoStyles[pseudo].color),
+                backgroundColor: toRgba(pseudoStyles[pseudo].backgroundColor)
+            };
+        }
+
+        textElements.push({
+            text: node.textContent.trim().substring(0, 100),
+            xpath: getXPath(element),
+            html: element.outerHTML.substring(0, 200),
+            textColor: toRgba(style.color),
+            backgroundLayers: bgInfo.backgroundLayers,
+            fontSize: fontSize,
+            fontWeight: fontWeight,
+            stoppedAtZIndex: bgInfo.stoppedAtZIndex,
+            zIndexElementXpath: bgInfo.zIndexElementXpath,
+            zIndexValue: bgInfo.zIndexValue,
+            zIndexPosition: bgInfo.zIndexPosition,
+            hasGradient: bgInfo.hasGradient,
+            hasImage: bgInfo.hasImage,
+            hasOverflow: overflowInfo.hasOverflow,
+            overflowContainerXpath: overflowInfo.containerXpath || null,
+            hasAnimation: animInfo.hasAnimation,
+            animationElementXpath: animInfo.animationElementXpath,
+            animationType: animInfo.animationType,
+            animationName: animInfo.animationName,
+            tag: element.tagName.toLowerCase(),
+            pseudoclassStyles: pseudoclassStyles,
+            wcagLevel: wcagLevel  // Add WCAG level to each element
+        });
+    }
+
+    return textElements;
+}
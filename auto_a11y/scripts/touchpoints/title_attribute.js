@@ -0,0 +1,89 @@
+() => {
+    // Simple XPath generator
+    function getXPath(element) {
+        if (element.id) {
+            return `//*[@id="${element.id}"]`;
+        }
+        if (element === document.body) {
+            return '/html/body';
+        }
+        let ix = 0;
+        const siblings = element.parentNode ? element.parentNode.childNodes : [];
+        for (let i = 0; i < siblings.length; i++) {
+            const sibling = siblings[i];
+            if (sibling === element) {
+                return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+            }
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
+                ix++;
+            }
+        }
+    }
+
+    // Get all iframes (with or without title)
+    const allIframes = Array.from(document.querySelectorAll('iframe')).map(iframe => ({
+        tagName: iframe.tagName,
+        hasTitle: iframe.hasAttribute('title'),
+        titleValue: iframe.getAttribute('title'),
+        src: iframe.getAttribute('src') || '(no src)',
+        xpath: getXPath(iframe),
+        html: iframe.outerHTML.substring(0, 200)
+    }));
+
+    // Get all elements WITH title attribute
+    const elementsWithTitle = Array.from(document.querySelectorAll('[title]')).map(el => {
+        const titleValue = el.getAttribute('title');
+        const visibleText = (el.textContent || '').trim();
+
+        // Check if it's a form field
+        const isFormField = ['INPUT', 'SELECT', 'TEXTAREA'].includes(el.tagName);
+
+        // Check if element is in <head> section
+        const isInHead = el.closest('head') !== null;
+
+        // Check if element is focusable (interactive)
+        const isFocusable = el.tabIndex >= 0 ||
+                           ['A', 'BUTTON', 'INPUT', 'SELECT', 'TEXTAREA', 'IFRAME'].includes(el.tagName) ||
+                           el.hasAttribute('tabindex');
+
+        // Check if it's a non-interactive container element
+        const isNonInteractiveContainer = ['DIV', 'SPAN', 'P', 'SECTION', 'ARTICLE'].includes(el.tagName);
+
+        // Get associated label for form fields
+        let hasLabel = false;
+        if (isFormField && el.id) {
+            hasLabel = document.querySelector(`label[for="${el.id}"]`) !== null;
+        }
+        // Check if wrapped in label
+        if (isFormField && !hasLabel) {
+            let parent = el.parentElement;
+            while (parent && parent !== document.body) {
+                if (parent.tagName === 'LABEL') {
+                    hasLabel = true;
+                    break;
+                }
+                parent = parent.parentElement;
+            }
+        }
+
+        return {
+            tagName: el.tagName,
+            titleValue: titleValue,
+            visibleText: visibleText,
+            isFormField: isFormField,
+            isInHead: isInHead,
+            isFocusable: isFocusable,
+            isNonInteractiveContainer: isNonInteractiveContainer,
+            hasLabel: hasLabel,
+            hasAriaLabel: el.hasAttribute('aria-label'),
+            hasAriaLabelledby: el.hasAttribute('aria-labelledby'),
+            xpath: getXPath(el),
+            html: el.outerHTML.substring(0, 200)
+        };
+    });
+
+    return {
+        allIframes: allIframes,
+        elementsWithTitle: elementsWithTitle
+    };
+}
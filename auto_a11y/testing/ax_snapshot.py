@@ -0,0 +1,333 @@
+"""
+Accessibility tree snapshot
+
+Fetches the browser's accessibility tree once per page state over CDP
+(Accessibility.getFullAXTree), joins it to the DOM so every node carries the
+XPath the touchpoint engines report, and indexes it by role, by backend DOM
+node, by XPath and by landmark ancestry. Touchpoints look names and roles up
+here instead of re-implementing the accessible name computation, so their
+results match what assistive technology is given.
+
+The engines only query the top document's light DOM. The snapshot also
+walks open shadow roots and same-origin frames, once, giving their elements
+composite XPaths (/html[1]/body[1]/x-card[1]/#shadow-root/button[1],
+/html[1]/body[1]/iframe[1]/#document/html[1]/...), so rules can cover them
+from this one merged structure. A node budget caps the work on huge
+embedded apps; what was left out is reported in the snapshot coverage.
+"""
+
+import html
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+LANDMARK_ROLES = frozenset([
+    'banner', 'complementary', 'contentinfo', 'form', 'main', 'navigation', 'region', 'search'
+])
+
+# Identifies a page state: a new document (URL, navigation start) or a
+# re-rendered one (element count) invalidates the snapshot
+_STATE_SCRIPT = "() => [location.href, performance.timeOrigin, document.getElementsByTagName('*').length]"
+
+_ELEMENT_NODE = 1
+
+# Composite XPath steps into a shadow root and into a frame's document
+SHADOW_ROOT_STEP = '#shadow-root'
+FRAME_DOCUMENT_STEP = '#document'
+
+DEFAULT_NODE_BUDGET = 20000
+
+
+@dataclass
+class AXNode:
+    """A node of the accessibility tree"""
+    ax_id: str
+    role: str
+    name: str
+    ignored: bool
+    backend_node_id: Optional[int] = None
+    parent_id: Optional[str] = None
+    child_ids: List[str] = field(default_factory=list)
+    properties: Dict[str, Any] = field(default_factory=dict)
+    tag: Optional[str] = None
+    xpath: Optional[str] = None
+    attributes: Dict[str, str] = field(default_factory=dict)
+    landmark_id: Optional[str] = None
+
+    @property
+    def in_light_dom(self) -> bool:
+        """Whether the element is in the top document's light DOM, where the engines can query it"""
+        return bool(self.xpath) and '/#' not in self.xpath
+
+    def start_tag(self) -> str:
+        """The element's start tag, standing in for outerHTML in reports"""
+        attributes = ''.join(f' {name}="{html.escape(value)}"' for name, value in self.attributes.items())
+        return f'<{self.tag}{attributes}>'
+
+
+@dataclass
+class _DomElement:
+    tag: str
+    xpath: str
+    attributes: Dict[str, str]
+
+
+class AXSnapshot:
+    """Accessibility tree of one page state, indexed for lookups"""
+
+    def __init__(self, nodes: Iterable[AXNode], coverage: Optional[Dict[str, Any]] = None):
+        self.coverage: Dict[str, Any] = coverage or {}
+        self.nodes: Dict[str, AXNode] = {node.ax_id: node for node in nodes}
+        self.by_role: Dict[str, List[AXNode]] = {}
+        self.by_backend_node: Dict[int, AXNode] = {}
+        self.by_xpath: Dict[str, AXNode] = {}
+        self.by_landmark: Dict[str, List[AXNode]] = {}
+
+        for node in self.nodes.values():
+            if node.backend_node_id is not None:
+                self.by_backend_node[node.backend_node_id] = node
+            if node.xpath:
+                self.by_xpath[node.xpath] = node
+            if not node.ignored:
+                self.by_role.setdefault(node.role, []).append(node)
+        self._index_landmarks()
+
+    @classmethod
+    def from_cdp(cls, ax_nodes: List[Dict[str, Any]], dom_root: Dict[str, Any],
+                 frame_ids: Optional[Set[str]] = None,
+                 node_budget: int = DEFAULT_NODE_BUDGET) -> 'AXSnapshot':
+        """
+        Build a snapshot from CDP responses
+
+        Args:
+            ax_nodes: 'nodes' of Accessibility.getFullAXTree, for every frame
+            dom_root: 'root' of DOM.getDocument with depth -1 and pierce
+            frame_ids: Frames whose documents are walked (None = all present)
+            node_budget: Maximum number of elements and of AX nodes kept
+
+        Returns:
+            AXSnapshot
+        """
+        elements, coverage = _walk_dom(dom_root, frame_ids, node_budget)
+        coverage['ax_nodes'] = min(len(ax_nodes), node_budget)
+        if len(ax_nodes) > node_budget:
+            coverage['truncated'] = True
+            logger.warning(f"Accessibility tree snapshot truncated to {node_budget} of {len(ax_nodes)} nodes")
+
+        nodes = []
+        for raw in ax_nodes[:node_budget]:
+            backend_id = raw.get('backendDOMNodeId')
+            element = elements.get(backend_id)
+            nodes.append(AXNode(
+                ax_id=raw['nodeId'],
+                role=(raw.get('role') or {}).get('value', ''),
+                name=str((raw.get('name') or {}).get('value', '') or ''),
+                ignored=raw.get('ignored', False),
+                backend_node_id=backend_id,
+                parent_id=raw.get('parentId'),
+                child_ids=raw.get('childIds', []),
+                properties={prop['name']: (prop.get('value') or {}).get('value') for prop in raw.get('properties', [])},
+                tag=element.tag if element else None,
+                xpath=element.xpath if element else None,
+                attributes=element.attributes if element else {},
+            ))
+        return cls(nodes, coverage)
+
+    def _index_landmarks(self) -> None:
+        """Record the nearest landmark ancestor of every node, in document order"""
+        roots = [node for node in self.nodes.values() if node.parent_id not in self.nodes]
+        stack: List[Tuple[AXNode, Optional[str]]] = [(root, None) for root in reversed(roots)]
+        while stack:
+            node, landmark_id = stack.pop()
+            node.landmark_id = landmark_id
+            if landmark_id:
+                self.by_landmark.setdefault(landmark_id, []).append(node)
+            inner = node.ax_id if node.role in LANDMARK_ROLES and not node.ignored else landmark_id
+            stack.extend((self.nodes[child], inner) for child in reversed(node.child_ids) if child in self.nodes)
+
+    @property
+    def landmarks(self) -> List[AXNode]:
+        """Landmark nodes, grouped by role"""
+        return [node for role in sorted(LANDMARK_ROLES) for node in self.by_role.get(role, [])]
+
+    def landmark_of(self, node: AXNode) -> Optional[AXNode]:
+        """Nearest landmark containing a node"""
+        return self.nodes.get(node.landmark_id) if node.landmark_id else None
+
+    def names_by_xpath(self, tags: Iterable[str] = (), roles: Iterable[str] = ()) -> Dict[str, str]:
+        """
+        Accessible names keyed by XPath, for passing to touchpoint engines
+
+        Args:
+            tags: Include elements with these tag names
+            roles: Include nodes with these computed roles
+
+        Returns:
+            Dictionary mapping XPath to accessible name
+        """
+        tags, roles = set(tags), set(roles)
+        return {
+            node.xpath: node.name
+            for node in self.by_xpath.values()
+            if node.in_light_dom and not node.ignored and (node.tag in tags or node.role in roles)
+        }
+
+    def composite_nodes(self) -> List[AXNode]:
+        """Nodes inside open shadow roots and same-origin frames, which the engines cannot query"""
+        return [node for node in self.by_xpath.values() if not node.in_light_dom]
+
+    def describe_landmark(self, xpath: str) -> Optional[Dict[str, str]]:
+        """Role and name of the landmark containing the element at an XPath"""
+        node = self.by_xpath.get(xpath)
+        landmark = self.landmark_of(node) if node else None
+        if not landmark:
+            return None
+        return {'role': landmark.role, 'name': landmark.name, 'xpath': landmark.xpath}
+
+
+def _walk_dom(dom_root: Dict[str, Any], frame_ids: Optional[Set[str]],
+              node_budget: int) -> Tuple[Dict[int, _DomElement], Dict[str, Any]]:
+    """
+    Give every element an XPath, in the /tag[index] form the touchpoint
+    engines use, continuing into open shadow roots and allowed frames
+
+    Elements are visited in document order until the budget is spent.
+
+    Returns:
+        Tuple of (elements by backend node ID, coverage counts)
+    """
+    elements: Dict[int, _DomElement] = {}
+    coverage = {'node_budget': node_budget, 'elements': 0, 'shadow_roots': 0,
+                'frames': 0, 'frames_skipped': 0, 'truncated': False}
+    stack = [(dom_root, '')]
+    while stack:
+        node, path = stack.pop()
+        entries = []
+        seen: Dict[str, int] = {}
+        for child in node.get('children', []):
+            if child.get('nodeType') != _ELEMENT_NODE:
+                continue
+            if len(elements) >= node_budget:
+                coverage['truncated'] = True
+                stack.clear()
+                break
+            seen[child['nodeName']] = seen.get(child['nodeName'], 0) + 1
+            tag = (child.get('localName') or child['nodeName']).lower()
+            child_path = f"{path}/{tag}[{seen[child['nodeName']]}]"
+            raw_attributes = child.get('attributes', [])
+            elements[child['backendNodeId']] = _DomElement(
+                tag, child_path, dict(zip(raw_attributes[::2], raw_attributes[1::2]))
+            )
+            entries.append((child, child_path))
+
+            for shadow_root in child.get('shadowRoots', []):
+                if shadow_root.get('shadowRootType') == 'open':
+                    coverage['shadow_roots'] += 1
+                    entries.append((shadow_root, f'{child_path}/{SHADOW_ROOT_STEP}'))
+            if 'frameId' in child:
+                document = child.get('contentDocument')
+                if document and (frame_ids is None or child['frameId'] in frame_ids):
+                    coverage['frames'] += 1
+                    entries.append((document, f'{child_path}/{FRAME_DOCUMENT_STEP}'))
+                else:
+                    coverage['frames_skipped'] += 1
+        stack.extend(reversed(entries))
+
+    coverage['elements'] = len(elements)
+    if coverage['truncated']:
+        logger.warning(f"Accessibility tree snapshot stopped at the node budget of {node_budget} elements")
+    return elements, coverage
+
+
+def _same_origin_frames(frame_tree: Dict[str, Any]) -> List[str]:
+    """IDs of the main frame and the frames sharing its origin, main frame first"""
+    origin = frame_tree['frame'].get('securityOrigin')
+    frame_ids = []
+    stack = [frame_tree]
+    while stack:
+        tree = stack.pop()
+        frame_ids.append(tree['frame']['id'])
+        stack.extend(
+            child for child in reversed(tree.get('childFrames', []))
+            if child['frame'].get('securityOrigin') == origin
+        )
+    return frame_ids
+
+
+def _scope_ax_nodes(nodes: List[Dict[str, Any]], frame_id: str) -> List[Dict[str, Any]]:
+    """Prefix a frame's AX node IDs so they stay unique in the merged tree"""
+    def scoped(node_id):
+        return f'{frame_id}:{node_id}' if node_id is not None else None
+
+    return [
+        dict(node, nodeId=scoped(node['nodeId']), parentId=scoped(node.get('parentId')),
+             childIds=[scoped(child) for child in node.get('childIds', [])])
+        for node in nodes
+    ]
+
+
+def _node_budget() -> int:
+    """Maximum number of elements and AX nodes a snapshot covers"""
+    try:
+        from config import config
+        return max(1, config.SNAPSHOT_NODE_BUDGET)
+    except Exception:
+        return DEFAULT_NODE_BUDGET
+
+
+_page_snapshots: Dict[int, Tuple[Tuple, AXSnapshot]] = {}
+
+
+async def get_ax_snapshot(page) -> Optional[AXSnapshot]:
+    """
+    Get the accessibility tree snapshot of a page's current state
+
+    The snapshot is fetched over CDP the first time it is requested for a
+    page state and shared by every touchpoint after that.
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        AXSnapshot, or None when CDP is not available (non-Chromium)
+    """
+    try:
+        state = tuple(await page.evaluate(_STATE_SCRIPT))
+        cached = _page_snapshots.get(id(page))
+        if cached and cached[0] == state:
+            return cached[1]
+
+        budget = _node_budget()
+        session = await page.context.new_cdp_session(page)
+        try:
+            await session.send('Accessibility.enable')
+            document = await session.send('DOM.getDocument', {'depth': -1, 'pierce': True})
+            frame_tree = await session.send('Page.getFrameTree')
+            frame_ids = _same_origin_frames(frame_tree['frameTree'])
+
+            tree = await session.send('Accessibility.getFullAXTree')
+            ax_nodes = tree.get('nodes', [])
+            # Child frames are separate AX trees; stop fetching once the budget is spent
+            for frame_id in frame_ids[1:]:
+                if len(ax_nodes) >= budget:
+                    break
+                tree = await session.send('Accessibility.getFullAXTree', {'frameId': frame_id})
+                ax_nodes.extend(_scope_ax_nodes(tree.get('nodes', []), frame_id))
+        finally:
+            await session.detach()
+
+        snapshot = AXSnapshot.from_cdp(ax_nodes, document['root'], set(frame_ids), budget)
+        _page_snapshots[id(page)] = (state, snapshot)
+        logger.debug(f"Accessibility tree snapshot: {len(snapshot.nodes)} nodes, "
+                     f"{len(snapshot.landmarks)} landmarks, coverage {snapshot.coverage}")
+        return snapshot
+    except Exception as e:
+        logger.debug(f"Accessibility tree snapshot unavailable: {e}")
+        return None
+
+
+def clear_ax_snapshot(page) -> None:
+    """Remove the cached accessibility tree snapshot of a page"""
+    _page_snapshots.pop(id(page), None)
@@ -0,0 +1,444 @@
+"""
+Vectorized color math for contrast checks
+
+Touchpoint engines extract raw computed colors from the page (text color,
+the stack of background colors behind it, font size and weight). This module
+composites them, computes WCAG relative luminance and contrast ratios, and
+thresholds every element against the AA and AAA minimums in a few NumPy
+operations, instead of element by element on the page's main thread.
+
+Colors are float arrays of shape (..., 4) holding r, g, b in 0-255 and
+alpha in 0-1.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+TRANSPARENT = (0.0, 0.0, 0.0, 0.0)
+WHITE = (255.0, 255.0, 255.0, 1.0)
+
+# Minimum contrast ratios per WCAG level: (normal text, large text)
+WCAG_RATIOS = {
+    'AA': (4.5, 3.0),
+    'AAA': (7.0, 4.5),
+}
+
+# Large text is 18pt (24px) or 14pt (18.66px) bold
+LARGE_TEXT_PX = 24.0
+LARGE_BOLD_TEXT_PX = 18.66
+BOLD_WEIGHT = 700
+
+_RGB = re.compile(
+    r'^rgba?\(\s*([\d.]+)[\s,]+([\d.]+)[\s,]+([\d.]+)\s*(?:[,/]\s*([\d.]+)(%?)\s*)?\)$'
+)
+_HEX = re.compile(r'^#([0-9a-f]{3,8})$')
+# CSS Color 4 functions, space-separated with an optional / alpha
+_COLOR4 = re.compile(r'^(oklab|oklch|lab|lch|color)\(\s*([^/)]*?)\s*(?:/\s*([\d.]+%?|none)\s*)?\)$')
+# CSS named colors, which stylesheet rules keep as written
+_NAMED_COLORS = {
+    name: tuple(float(int(value[i:i + 2], 16)) for i in (0, 2, 4))
+    for name, value in (entry.split(':') for entry in '''
+    aliceblue:f0f8ff antiquewhite:faebd7 aqua:00ffff aquamarine:7fffd4 azure:f0ffff beige:f5f5dc
+    bisque:ffe4c4 black:000000 blanchedalmond:ffebcd blue:0000ff blueviolet:8a2be2 brown:a52a2a
+    burlywood:deb887 cadetblue:5f9ea0 chartreuse:7fff00 chocolate:d2691e coral:ff7f50
+    cornflowerblue:6495ed cornsilk:fff8dc crimson:dc143c cyan:00ffff darkblue:00008b
+    darkcyan:008b8b darkgoldenrod:b8860b darkgray:a9a9a9 darkgreen:006400 darkgrey:a9a9a9
+    darkkhaki:bdb76b darkmagenta:8b008b darkolivegreen:556b2f darkorange:ff8c00
+    darkorchid:9932cc darkred:8b0000 darksalmon:e9967a darkseagreen:8fbc8f darkslateblue:483d8b
+    darkslategray:2f4f4f darkslategrey:2f4f4f darkturquoise:00ced1 darkviolet:9400d3
+    deeppink:ff1493 deepskyblue:00bfff dimgray:696969 dimgrey:696969 dodgerblue:1e90ff
+    firebrick:b22222 floralwhite:fffaf0 forestgreen:228b22 fuchsia:ff00ff gainsboro:dcdcdc
+    ghostwhite:f8f8ff gold:ffd700 goldenrod:daa520 gray:808080 green:008000 greenyellow:adff2f
+    grey:808080 honeydew:f0fff0 hotpink:ff69b4 indianred:cd5c5c indigo:4b0082 ivory:fffff0
+    khaki:f0e68c lavender:e6e6fa lavenderblush:fff0f5 lawngreen:7cfc00 lemonchiffon:fffacd
+    lightblue:add8e6 lightcoral:f08080 lightcyan:e0ffff lightgoldenrodyellow:fafad2
+    lightgray:d3d3d3 lightgreen:90ee90 lightgrey:d3d3d3 lightpink:ffb6c1 lightsalmon:ffa07a
+    lightseagreen:20b2aa lightskyblue:87cefa lightslategray:778899 lightslategrey:778899
+    lightsteelblue:b0c4de lightyellow:ffffe0 lime:00ff00 limegreen:32cd32 linen:faf0e6
+    magenta:ff00ff maroon:800000 mediumaquamarine:66cdaa mediumblue:0000cd mediumorchid:ba55d3
+    mediumpurple:9370db mediumseagreen:3cb371 mediumslateblue:7b68ee mediumspringgreen:00fa9a
+    mediumturquoise:48d1cc mediumvioletred:c71585 midnightblue:191970 mintcream:f5fffa
+    mistyrose:ffe4e1 moccasin:ffe4b5 navajowhite:ffdead navy:000080 oldlace:fdf5e6 olive:808000
+    olivedrab:6b8e23 orange:ffa500 orangered:ff4500 orchid:da70d6 palegoldenrod:eee8aa
+    palegreen:98fb98 paleturquoise:afeeee palevioletred:db7093 papayawhip:ffefd5
+    peachpuff:ffdab9 peru:cd853f pink:ffc0cb plum:dda0dd powderblue:b0e0e6 purple:800080
+    rebeccapurple:663399 red:ff0000 rosybrown:bc8f8f royalblue:4169e1 saddlebrown:8b4513
+    salmon:fa8072 sandybrown:f4a460 seagreen:2e8b57 seashell:fff5ee sienna:a0522d silver:c0c0c0
+    skyblue:87ceeb slateblue:6a5acd slategray:708090 slategrey:708090 snow:fffafa
+    springgreen:00ff7f steelblue:4682b4 tan:d2b48c teal:008080 thistle:d8bfd8 tomato:ff6347
+    turquoise:40e0d0 violet:ee82ee wheat:f5deb3 white:ffffff whitesmoke:f5f5f5 yellow:ffff00
+    yellowgreen:9acd32
+    '''.split())
+}
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# Channel value that 100% stands for: (L, a or C, b or H) per function
+_PERCENT_REFERENCE = {
+    'oklab': (1.0, 0.4, 0.4),
+    'oklch': (1.0, 0.4, 1.0),
+    'lab': (100.0, 125.0, 125.0),
+    'lch': (100.0, 150.0, 1.0),
+}
+
+# Linear-light RGB -> XYZ (D65) for the color() spaces, and XYZ (D65) -> linear sRGB
+_P3_TO_XYZ = np.array([
+    [0.4865709486482162, 0.26566769316909306, 0.1982172852343625],
+    [0.2289745640697488, 0.6917385218365064, 0.079286914093745],
+    [0.0, 0.04511338185890264, 1.043944368900976],
+])
+_XYZ_TO_SRGB = np.array([
+    [3.2409699419045226, -1.537383177570094, -0.4986107602930034],
+    [-0.9692436362808796, 1.8759675015077202, 0.04155505740717559],
+    [0.05563007969699366, -0.20397695888897652, 1.0569715142428786],
+])
+# Bradford adaptation from the D50 white point of CIE Lab to D65
+_D50_TO_D65 = np.array([
+    [0.9554734527042182, -0.023098536874261423, 0.0632593086610217],
+    [-0.028369706963208136, 1.0099954580058226, 0.021041398966943008],
+    [0.012314001688319899, -0.020507696433477912, 1.3303659366080753],
+])
+_D50_WHITE = (0.3457 / 0.3585, 1.0, (1.0 - 0.3457 - 0.3585) / 0.3585)
+
+
+def _srgb_encode(linear: np.ndarray) -> np.ndarray:
+    """Gamma-encode linear-light sRGB, clipped to the sRGB gamut"""
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+
+
+def _srgb_decode(encoded: np.ndarray) -> np.ndarray:
+    """Linearize gamma-encoded sRGB (also the display-p3 transfer function)"""
+    sign = np.sign(encoded)
+    encoded = np.abs(encoded)
+    return sign * np.where(encoded <= 0.04045, encoded / 12.92, ((encoded + 0.055) / 1.055) ** 2.4)
+
+
+def _channel(token: str, reference: float) -> float:
+    """Parse a channel that may be a percentage of reference, or 'none'"""
+    if token == 'none':
+        return 0.0
+    if token.endswith('%'):
+        return float(token[:-1]) / 100.0 * reference
+    return float(token.removesuffix('deg'))
+
+
+def _parse_color4(function: str, arguments: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Convert a CSS Color 4 function to sRGB
+
+    Args:
+        function: oklab, oklch, lab, lch or color
+        arguments: Space-separated channels (with the color space first for color())
+
+    Returns:
+        (r, g, b) in 0-255, or None for unsupported color spaces
+    """
+    tokens = arguments.split()
+    if function == 'color':
+        space, channels = tokens[0], [_channel(token, 1.0) for token in tokens[1:4]]
+        if len(channels) != 3:
+            return None
+        if space == 'srgb':
+            encoded = np.array(channels)
+        elif space == 'srgb-linear':
+            encoded = _srgb_encode(np.array(channels))
+        elif space == 'display-p3':
+            encoded = _srgb_encode(_XYZ_TO_SRGB @ (_P3_TO_XYZ @ _srgb_decode(np.array(channels))))
+        else:
+            return None
+        return tuple(float(channel) for channel in np.clip(encoded, 0.0, 1.0) * 255.0)
+
+    if len(tokens) != 3:
+        return None
+    lightness, second, third = (_channel(token, reference) for token, reference in zip(tokens, _PERCENT_REFERENCE[function]))
+    if function in ('oklch', 'lch'):
+        hue = np.radians(third)
+        second, third = second * np.cos(hue), second * np.sin(hue)
+
+    if function in ('oklab', 'oklch'):
+        lms = np.array([
+            lightness + 0.3963377774 * second + 0.2158037573 * third,
+            lightness - 0.1055613458 * second - 0.0638541728 * third,
+            lightness - 0.0894841775 * second - 1.2914855480 * third,
+        ]) ** 3
+        linear = np.array([
+            [4.0767416621, -3.3077115913, 0.2309699292],
+            [-1.2684380046, 2.6097574011, -0.3413193965],
+            [-0.0041960863, -0.7034186147, 1.7076147010],
+        ]) @ lms
+    else:
+        # CIE Lab (D50) -> XYZ -> adapted to D65 -> linear sRGB
+        fy = (lightness + 16.0) / 116.0
+        f = np.array([fy + second / 500.0, fy, fy - third / 200.0])
+        epsilon, kappa = 216.0 / 24389.0, 24389.0 / 27.0
+        xyz = np.where(f ** 3 > epsilon, f ** 3, (116.0 * f - 16.0) / kappa)
+        xyz[1] = ((lightness + 16.0) / 116.0) ** 3 if lightness > kappa * epsilon else lightness / kappa
+        linear = _XYZ_TO_SRGB @ (_D50_TO_D65 @ (xyz * np.array(_D50_WHITE)))
+
+    return tuple(float(channel) for channel in _srgb_encode(linear) * 255.0)
+
+
+@lru_cache(maxsize=4096)
+def parse_color(value: Optional[str]) -> Tuple[float, float, float, float]:
+    """
+    Parse a computed CSS color
+
+    Browsers serialize most computed colors as rgb()/rgba(), but keep CSS
+    Color 4 colors in their own space (oklch(), lab(), color(display-p3
+    ...)); those are converted to sRGB and clipped to its gamut. Hex colors
+    and named colors (which stylesheet rules keep as written) are also
+    accepted. Anything else is treated as transparent.
+
+    Args:
+        value: CSS color string
+
+    Returns:
+        Tuple of (r, g, b, a)
+    """
+    if not value:
+        return TRANSPARENT
+    value = value.strip().lower()
+
+    match = _RGB.match(value)
+    if match:
+        r, g, b, alpha, percent = match.groups()
+        a = 1.0 if alpha is None else float(alpha) / (100.0 if percent else 1.0)
+        return float(r), float(g), float(b), a
+
+    match = _HEX.match(value)
+    if match and len(match.group(1)) in (3, 4, 6, 8):
+        digits = match.group(1)
+        if len(digits) in (3, 4):
+            digits = ''.join(digit * 2 for digit in digits)
+        channels = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+        a = channels[3] / 255.0 if len(channels) == 4 else 1.0
+        return float(channels[0]), float(channels[1]), float(channels[2]), a
+
+    if value in _NAMED_COLORS:
+        return _NAMED_COLORS[value] + (1.0,)
+
+    match = _COLOR4.match(value)
+    if match:
+        function, arguments, alpha = match.groups()
+        try:
+            rgb = _parse_color4(function, arguments)
+            a = 1.0 if alpha is None else _channel(alpha, 1.0)
+        except (ValueError, IndexError):
+            rgb = None
+        if rgb is not None:
+            return rgb[0], rgb[1], rgb[2], min(max(a, 0.0), 1.0)
+
+    return TRANSPARENT
+
+
+def to_rgba_array(values: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Parse a sequence of CSS colors into an (n, 4) array
+
+    Args:
+        values: CSS color strings (None for transparent)
+
+    Returns:
+        Array of shape (n, 4)
+    """
+    return np.array([parse_color(value) for value in values], dtype=float).reshape(-1, 4)
+
+
+def stack_layers(stacks: Sequence[Sequence[str]]) -> np.ndarray:
+    """
+    Parse background stacks of different depths into one padded array
+
+    Args:
+        stacks: Per element, background colors from the element outwards
+
+    Returns:
+        Array of shape (n, depth, 4), padded with transparent layers
+    """
+    depth = max((len(stack) for stack in stacks), default=0)
+    layers = np.zeros((len(stacks), max(depth, 1), 4))
+    for i, stack in enumerate(stacks):
+        if stack:
+            layers[i, :len(stack)] = to_rgba_array(stack)
+    return layers
+
+
+def composite_over(top: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+    """
+    Composite colors over others with the source-over operator
+
+    Args:
+        top: Colors of shape (..., 4)
+        bottom: Colors of shape (..., 4)
+
+    Returns:
+        Composited colors of shape (..., 4)
+    """
+    top_alpha = top[..., 3:4]
+    bottom_alpha = bottom[..., 3:4] * (1.0 - top_alpha)
+    alpha = top_alpha + bottom_alpha
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rgb = (top[..., :3] * top_alpha + bottom[..., :3] * bottom_alpha) / alpha
+    rgb = np.where(alpha > 0, rgb, 0.0)
+    return np.concatenate([rgb, alpha], axis=-1)
+
+
+def composite_stack(layers: np.ndarray, base: Optional[Tuple[float, ...]] = WHITE) -> np.ndarray:
+    """
+    Flatten background stacks into one color per element
+
+    Args:
+        layers: Array of shape (n, depth, 4), nearest layer first
+        base: Color behind every stack (the canvas), or None for none
+
+    Returns:
+        Array of shape (n, 4)
+    """
+    result = np.zeros((layers.shape[0], 4))
+    for depth in range(layers.shape[1]):
+        result = composite_over(result, layers[:, depth])
+    if base is not None:
+        result = composite_over(result, np.broadcast_to(np.array(base, dtype=float), result.shape))
+    return result
+
+
+def relative_luminance(colors: np.ndarray) -> np.ndarray:
+    """
+    WCAG relative luminance of colors (alpha is ignored)
+
+    Args:
+        colors: Array of shape (..., 3) or (..., 4)
+
+    Returns:
+        Array of shape (...)
+    """
+    channels = colors[..., :3] / 255.0
+    linear = np.where(channels <= 0.03928, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+    return linear @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(foreground: np.ndarray, background: np.ndarray) -> np.ndarray:
+    """
+    WCAG contrast ratio between opaque colors
+
+    Args:
+        foreground: Array of shape (..., 4)
+        background: Array of shape (..., 4)
+
+    Returns:
+        Array of shape (...), from 1 to 21
+    """
+    foreground_luminance = relative_luminance(foreground)
+    background_luminance = relative_luminance(background)
+    lighter = np.maximum(foreground_luminance, background_luminance)
+    darker = np.minimum(foreground_luminance, background_luminance)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def is_large_text(font_size: np.ndarray, font_weight: np.ndarray) -> np.ndarray:
+    """
+    WCAG large text: 18pt and up, or 14pt and up when bold
+
+    Args:
+        font_size: Computed font sizes in px
+        font_weight: Computed font weights
+
+    Returns:
+        Boolean array
+    """
+    font_size = np.asarray(font_size, dtype=float)
+    font_weight = np.asarray(font_weight, dtype=float)
+    return (font_size >= LARGE_TEXT_PX) | ((font_size >= LARGE_BOLD_TEXT_PX) & (font_weight >= BOLD_WEIGHT))
+
+
+def required_ratios(large: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Minimum contrast ratio per element for every WCAG level
+
+    Args:
+        large: Boolean array from is_large_text
+
+    Returns:
+        Dictionary mapping level to an array of ratios
+    """
+    return {
+        level: np.where(large, large_ratio, normal_ratio)
+        for level, (normal_ratio, large_ratio) in WCAG_RATIOS.items()
+    }
+
+
+def evaluate_contrast(foreground: np.ndarray, backgrounds: np.ndarray,
+                      font_size: np.ndarray, font_weight: np.ndarray,
+                      base: Optional[Tuple[float, ...]] = WHITE) -> Dict[str, object]:
+    """
+    Contrast of a batch of text elements against their background stacks
+
+    Semi-transparent text is composited over its background before the
+    ratio is computed, as it is rendered.
+
+    Args:
+        foreground: Text colors, shape (n, 4)
+        backgrounds: Background stacks, shape (n, depth, 4)
+        font_size: Computed font sizes in px, shape (n,)
+        font_weight: Computed font weights, shape (n,)
+        base: Color behind every stack, or None to leave stacks uncomposited
+
+    Returns:
+        Dictionary with 'background' and 'foreground' (composited colors),
+        'ratio', 'large', 'required' and 'passes' (both keyed by WCAG level)
+    """
+    background = composite_stack(backgrounds, base)
+    rendered = composite_over(foreground, background)
+    ratio = contrast_ratio(rendered, background)
+    large = is_large_text(font_size, font_weight)
+    required = required_ratios(large)
+    return {
+        'background': background,
+        'foreground': rendered,
+        'ratio': ratio,
+        'large': large,
+        'required': required,
+        'passes': {level: ratio >= minimum for level, minimum in required.items()},
+    }
+
+
+def indicator_contrast(pairs: Iterable[Tuple[Optional[str], Optional[str]]],
+                       base: Optional[Tuple[float, ...]] = WHITE) -> Dict[Tuple[Optional[str], Optional[str]], float]:
+    """
+    Contrast of a batch of focus indicators against what they are drawn on
+
+    Outlines, borders and box-shadows are composited over their
+    background, and the background over the canvas, before the ratio is
+    computed.
+
+    Args:
+        pairs: (indicator color, background color) CSS strings
+        base: Color behind every background, or None for none
+
+    Returns:
+        Dictionary mapping each distinct pair to its ratio
+    """
+    keys = list(dict.fromkeys(pairs))
+    if not keys:
+        return {}
+    indicators = to_rgba_array([indicator for indicator, _ in keys])
+    backgrounds = to_rgba_array([background for _, background in keys])
+    background = composite_stack(backgrounds[:, None, :], base)
+    ratio = contrast_ratio(composite_over(indicators, background), background)
+    return {key: float(value) for key, value in zip(keys, ratio)}
+
+
+def format_rgba(color: Sequence[float]) -> str:
+    """
+    Serialize a color the way the touchpoint engines report them
+
+    Args:
+        color: (r, g, b, a)
+
+    Returns:
+        String such as 'rgba(255, 255, 255, 1)'
+    """
+    r, g, b, a = color
+    return f'rgba({int(round(r))}, {int(round(g))}, {int(round(b))}, {float(a):g})'
@@ -16,6 +16,15 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Focus pseudo-classes that style the focused element itself
+_FOCUS_PSEUDO = re.compile(r':focus(?:-visible)?(?![\w-])', re.IGNORECASE)
+_PSEUDO_ELEMENT = re.compile(r'::?(?:before|after|marker)\b', re.IGNORECASE)
+_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+# Declarations that make a focused element look different (the properties
+# the focus management touchpoint compares)
+_INDICATOR_PREFIXES = ('outline', 'box-shadow', 'background', 'border')
+_NO_INDICATOR_VALUES = {'none', '0', '0px', 'hidden', 'transparent', 'initial', 'unset'}
+
 
 @dataclass
 class FocusRule:
@@ -151,17 +160,18 @@ class CSSFocusCapture:
             return
         
         focus_pattern = re.compile(
-            r'([^{}]+):focus(?:-visible|-within)?([^{]*)\s*\{([^}]+)\}',
+            r'([^{}]+):(focus(?:-visible|-within)?)([^{]*)\s*\{([^}]+)\}',
             re.IGNORECASE | re.MULTILINE
         )
         
         for match in focus_pattern.finditer(css_text):
             try:
                 base_selector = match.group(1).strip()
-                pseudo_suffix = match.group(2).strip() if match.group(2) else ""
-                properties_text = match.group(3).strip()
+                pseudo_class = match.group(2).lower()
+                pseudo_suffix = match.group(3).rstrip() if match.group(3) else ""
+                properties_text = match.group(4).strip()
                 
-                full_selector = f"{base_selector}:focus{pseudo_suffix}".strip()
+                full_selector = f"{base_selector}:{pseudo_class}{pseudo_suffix}".strip()
                 
                 properties = self._parse_properties(properties_text)
                 
@@ -255,6 +265,33 @@ class CSSFocusCapture:
         
         return False
     
+    def indicator_selectors(self) -> List[str]:
+        """
+        Selectors of elements that get a visible indicator from a captured rule
+
+        Each selector list of a :focus/:focus-visible rule that sets a visible
+        indicator is split into its parts, and the focus pseudo-classes (and
+        pseudo-elements) are stripped, so the browser can match elements
+        against them without focusing anything. Rules with :focus-within or
+        a negated :focus never resolve an element.
+
+        Returns:
+            Sorted list of unique selectors
+        """
+        selectors = set()
+        for rule in self.cache.focus_rules:
+            if not _sets_focus_indicator(rule.properties):
+                continue
+            for part in _COMMENT.sub('', rule.selector).split(','):
+                part = part.strip()
+                if not _FOCUS_PSEUDO.search(part) or ':not(' in part.lower():
+                    continue
+                base = _PSEUDO_ELEMENT.sub('', _FOCUS_PSEUDO.sub('', part)).strip()
+                if base.endswith(('>', '+', '~')):
+                    base += ' *'
+                selectors.add(base or '*')
+        return sorted(selectors)
+
     def has_focus_rules(self) -> bool:
         """Check if any focus rules were captured"""
         return len(self.cache.focus_rules) > 0
@@ -283,6 +320,18 @@ class CSSFocusCapture:
         }
 
 
+def _sets_focus_indicator(properties: Dict[str, str]) -> bool:
+    """Check whether focus rule declarations draw a visible indicator"""
+    for name, value in properties.items():
+        value = value.lower().replace('!important', '').strip()
+        if not name.startswith(_INDICATOR_PREFIXES) or name in ('outline-offset', 'border-radius'):
+            continue
+        if value in _NO_INDICATOR_VALUES:
+            continue
+        return True
+    return False
+
+
 _page_css_cache: Dict[int, CSSFocusCapture] = {}
 
 
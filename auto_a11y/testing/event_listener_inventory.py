@@ -0,0 +1,115 @@
+"""
+Event listener inventory
+
+Touchpoint engines running inside page.evaluate only see inline on*
+attributes; listeners added with addEventListener (which is how most
+frameworks bind events) are invisible to them. This module asks Chromium
+for every listener in the document with one DOMDebugger.getEventListeners
+call over CDP, caches the event types per backend DOM node ID for the
+current page state, and marks the elements that have mouse or keyboard
+listeners with an attribute the engines read (and remove) before they
+inspect the DOM.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Attribute the engines read listener event types from (space separated)
+LISTENER_ATTRIBUTE = 'data-auto-a11y-listeners'
+
+MOUSE_EVENTS = frozenset(['click', 'mousedown', 'mouseup', 'mouseover', 'mouseout', 'dblclick', 'contextmenu'])
+KEYBOARD_EVENTS = frozenset(['keydown', 'keyup', 'keypress'])
+TRACKED_EVENTS = MOUSE_EVENTS | KEYBOARD_EVENTS
+
+# Identifies a page state: a new document (URL, navigation start) or a
+# re-rendered one (element count) invalidates the cached listeners
+_STATE_SCRIPT = "() => [location.href, performance.timeOrigin, document.getElementsByTagName('*').length]"
+
+
+class EventListenerInventory:
+    """Listeners of one page, cached per backend node ID for the page state"""
+
+    def __init__(self):
+        self.state: Optional[Tuple] = None
+        self.listeners: Dict[int, Set[str]] = {}
+
+    async def mark(self, page) -> int:
+        """
+        Mark the elements that have mouse or keyboard listeners
+
+        Listeners are collected over CDP only when the page state changed
+        since the last call; otherwise the cached inventory is re-applied.
+
+        Args:
+            page: Playwright Page object (Chromium)
+
+        Returns:
+            Number of elements marked
+        """
+        state = tuple(await page.evaluate(_STATE_SCRIPT))
+        session = await page.context.new_cdp_session(page)
+        try:
+            if state != self.state:
+                self.listeners = await self._collect(session)
+                self.state = state
+                logger.debug(f"Event listener inventory: {len(self.listeners)} nodes with listeners")
+
+            if not self.listeners:
+                return 0
+
+            await session.send('DOM.getDocument', {'depth': 0})
+            backend_ids = list(self.listeners)
+            pushed = await session.send('DOM.pushNodesByBackendIdsToFrontend', {'backendNodeIds': backend_ids})
+            marks = [
+                (node_id, ' '.join(sorted(self.listeners[backend_id])))
+                for backend_id, node_id in zip(backend_ids, pushed['nodeIds'])
+                if node_id
+            ]
+            # Listeners on the document itself cannot carry an attribute
+            outcomes = await asyncio.gather(*(
+                session.send('DOM.setAttributeValue', {'nodeId': node_id, 'name': LISTENER_ATTRIBUTE, 'value': types})
+                for node_id, types in marks
+            ), return_exceptions=True)
+            return sum(1 for outcome in outcomes if not isinstance(outcome, Exception))
+        finally:
+            await session.detach()
+
+    @staticmethod
+    async def _collect(session) -> Dict[int, Set[str]]:
+        """Collect the tracked listeners of the whole document in one call"""
+        document = await session.send('Runtime.evaluate', {'expression': 'document', 'returnByValue': False})
+        object_id = document['result']['objectId']
+        try:
+            response = await session.send('DOMDebugger.getEventListeners', {
+                'objectId': object_id,
+                'depth': -1,
+                'pierce': False
+            })
+        finally:
+            await session.send('Runtime.releaseObject', {'objectId': object_id})
+
+        listeners: Dict[int, Set[str]] = {}
+        for listener in response.get('listeners', []):
+            backend_id = listener.get('backendNodeId')
+            if backend_id and listener.get('type') in TRACKED_EVENTS:
+                listeners.setdefault(backend_id, set()).add(listener['type'])
+        return listeners
+
+
+_page_inventories: Dict[int, EventListenerInventory] = {}
+
+
+def get_listener_inventory(page) -> EventListenerInventory:
+    """Get (or create) the listener inventory of a page"""
+    page_id = id(page)
+    if page_id not in _page_inventories:
+        _page_inventories[page_id] = EventListenerInventory()
+    return _page_inventories[page_id]
+
+
+def clear_listener_inventory(page) -> None:
+    """Remove the listener inventory of a page"""
+    _page_inventories.pop(id(page), None)
@@ -10,7 +10,8 @@ with Pyppeteer due to connection instability).
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 import uuid
 
@@ -23,6 +24,70 @@ from auto_a11y.testing.script_executor import ScriptExecutor
 
 logger = logging.getLogger(__name__)
 
+# Settle time after navigating or clearing browser state
+STATE_SETTLE_MS = 300
+
+
+@dataclass
+class StateTreeNode:
+    """
+    Node of a state-matrix prefix tree
+
+    The path from the root to a node is the ordered list of scripts executed
+    to reach that state. Combinations whose executed scripts end at a node are
+    tested there, so scripts shared by several combinations run only once.
+    """
+
+    script_id: Optional[str] = None
+    children: Dict[str, 'StateTreeNode'] = field(default_factory=dict)
+    combinations: List[Tuple[int, Any]] = field(default_factory=list)
+
+    def count_combinations(self) -> int:
+        """Number of combinations tested in this subtree"""
+        return len(self.combinations) + sum(c.count_combinations() for c in self.children.values())
+
+    def count_script_runs(self) -> int:
+        """Number of script executions needed to walk this subtree once"""
+        return sum(1 + c.count_script_runs() for c in self.children.values())
+
+    def iter_combinations(self) -> Iterator[Tuple[int, Any]]:
+        """(index, combination) pairs tested in this subtree, depth first"""
+        yield from self.combinations
+        for child in self.children.values():
+            yield from child.iter_combinations()
+
+
+def build_state_tree(
+    test_state_matrix,
+    combinations: List[Any],
+    scripts_by_id: Dict[str, PageSetupScript]
+) -> StateTreeNode:
+    """
+    Arrange state combinations as a prefix tree of executed scripts
+
+    Args:
+        test_state_matrix: TestStateMatrix providing script execution order
+        combinations: StateCombination objects in the order they should be reported
+        scripts_by_id: Dict mapping script_id to PageSetupScript instances
+
+    Returns:
+        Root node (the initial page state)
+    """
+    ordered_ids = [
+        s.script_id for s in sorted(test_state_matrix.scripts, key=lambda s: s.execution_order)
+    ]
+
+    root = StateTreeNode()
+    for index, combination in enumerate(combinations):
+        node = root
+        for script_id in ordered_ids:
+            if combination.script_states.get(script_id) == "after" and script_id in scripts_by_id:
+                if script_id not in node.children:
+                    node.children[script_id] = StateTreeNode(script_id=script_id)
+                node = node.children[script_id]
+        node.combinations.append((index, combination))
+    return root
+
 
 class MultiStateTestRunner:
     """Execute tests across multiple page states using browser context isolation"""
@@ -418,6 +483,284 @@ class MultiStateTestRunner:
         except Exception as e:
             logger.error(f"Error clearing browser state: {e}")
 
+    async def _run_matrix_script(
+        self,
+        page: Page,
+        script: PageSetupScript,
+        environment_vars: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Execute one setup script of a state matrix
+
+        Args:
+            page: Playwright Page object
+            script: Script to execute
+            environment_vars: Environment variables for scripts
+
+        Returns:
+            True if the script succeeded
+        """
+        logger.info(f"Executing script '{script.name}' to reach desired state")
+
+        # Clear browser state if configured
+        if script.clear_cookies_before or script.clear_local_storage_before:
+            try:
+                current_url = page.url
+                await self._clear_browser_state(page, script)
+                await page.goto(current_url, wait_until='domcontentloaded', timeout=30000)
+                await page.wait_for_timeout(STATE_SETTLE_MS)
+            except Exception as e:
+                logger.error(f"Error clearing browser state: {e}")
+                return False
+
+        script_result = await self.script_executor.execute_script(
+            page=page,
+            script=script,
+            environment_vars=environment_vars
+        )
+
+        if script_result['success']:
+            logger.info(f"Successfully executed script '{script.name}'")
+            return True
+
+        logger.warning(f"Script '{script.name}' failed: {script_result.get('error', 'Unknown error')}")
+        return False
+
+    async def _storage_state(self, page: Page) -> Optional[Dict[str, Any]]:
+        """Cookies and storage of the page's context, or None if unavailable"""
+        try:
+            return await page.context.storage_state()
+        except Exception as e:
+            logger.debug(f"Could not capture storage state: {e}")
+            return None
+
+    async def _checkpoint_state(self, page: Page) -> Dict[str, Any]:
+        """
+        Capture what is needed to return to the current state later
+
+        Args:
+            page: Playwright Page object
+
+        Returns:
+            Dictionary with the page URL and the context's storage state
+        """
+        return {'url': page.url, 'storage_state': await self._storage_state(page)}
+
+    async def _restore_checkpoint(
+        self,
+        page: Page,
+        checkpoint: Dict[str, Any],
+        path: List[Tuple[str, bool, bool]],
+        scripts_by_id: Dict[str, PageSetupScript],
+        environment_vars: Optional[Dict[str, str]],
+        initial_url: str,
+        browser_manager=None
+    ) -> Tuple[Page, Optional[BrowserContext]]:
+        """
+        Bring a page back to a checkpointed state before a diverging branch
+
+        With a browser manager, the checkpoint's cookies and storage are cloned
+        into a new context and the page is re-opened there. Scripts on the path
+        are replayed only if their effect did not survive in storage: a script
+        with a condition selector is replayed if the selector is present
+        again, and one without is replayed only if it did not change the
+        context's storage when it ran. Without a browser manager the original
+        page is reloaded and the whole path replayed.
+
+        Args:
+            page: Page the previous branch ran on
+            checkpoint: Result of _checkpoint_state at the branch point
+            path: (script_id, succeeded, changed_storage) entries from the root
+                to the branch point
+            scripts_by_id: Dict mapping script_id to PageSetupScript instances
+            environment_vars: Environment variables for scripts
+            initial_url: URL the matrix run started from
+            browser_manager: BrowserManager instance for creating contexts
+
+        Returns:
+            Tuple of (page, context) - context is None if the original page was reused
+        """
+        context = None
+        if browser_manager and checkpoint.get('storage_state') is not None:
+            context = await browser_manager.create_context(storage_state=checkpoint['storage_state'])
+            page = await context.new_page()
+            await page.goto(checkpoint['url'], wait_until='domcontentloaded', timeout=30000)
+        else:
+            await page.goto(initial_url, wait_until='domcontentloaded', timeout=30000)
+        await page.wait_for_timeout(STATE_SETTLE_MS)
+
+        for script_id, succeeded, changed_storage in path:
+            if not succeeded:
+                continue
+            script = scripts_by_id[script_id]
+            if context:
+                if script.condition_selector:
+                    restored = not await self.script_executor._check_condition(page, script.condition_selector)
+                else:
+                    restored = changed_storage
+                if restored:
+                    logger.debug(f"Script '{script.name}' effect restored from storage, not replaying")
+                    continue
+            await self._run_matrix_script(page, script, environment_vars)
+
+        return page, context
+
+    async def _walk_state_tree(
+        self,
+        node: StateTreeNode,
+        page: Page,
+        path: List[Tuple[str, bool, bool]],
+        run: Dict[str, Any]
+    ):
+        """
+        Test every combination in a subtree, depth first
+
+        The first child of a node continues on the live page; later children
+        start from a checkpoint taken before the first one ran.
+
+        Args:
+            node: Subtree root; page is already in its state
+            page: Playwright Page object
+            path: (script_id, succeeded, changed_storage) entries from the root to this node
+            run: Shared state of the matrix run
+        """
+        executed = [script_id for script_id, succeeded, _ in path if succeeded]
+        for index, combination in node.combinations:
+            run['results'][index] = await self._test_matrix_state(
+                page, index, combination, executed, run
+            )
+
+        children = list(node.children.values())
+        checkpoint = await self._checkpoint_state(page) if len(children) > 1 else None
+
+        for child_idx, child in enumerate(children):
+            child_page, child_context = page, None
+            if child_idx > 0:
+                logger.info(f"Branching to script '{child.script_id}', restoring state after {len(path)} script(s)")
+                try:
+                    child_page, child_context = await self._restore_checkpoint(
+                        page,
+                        checkpoint,
+                        path,
+                        run['scripts_by_id'],
+                        run['environment_vars'],
+                        run['initial_url'],
+                        run['browser_manager']
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to restore state for branch '{child.script_id}': {e}")
+                    # Report the branch's states as failed rather than leaving them out
+                    for index, combination in child.iter_combinations():
+                        run['results'][index] = self._state_error_result(
+                            index, combination, run, f"Could not restore the page state: {e}"
+                        )
+                    continue
+
+            try:
+                # Whether the script's effect is kept in storage decides if a
+                # restored branch must replay it (see _restore_checkpoint)
+                storage_before = await self._storage_state(child_page) if run['browser_manager'] else None
+                succeeded = await self._run_matrix_script(
+                    child_page, run['scripts_by_id'][child.script_id], run['environment_vars']
+                )
+                changed_storage = (
+                    succeeded and storage_before is not None
+                    and await self._storage_state(child_page) != storage_before
+                )
+                await self._walk_state_tree(
+                    child, child_page, path + [(child.script_id, succeeded, changed_storage)], run
+                )
+            finally:
+                if child_context:
+                    await run['browser_manager'].close_context(child_context)
+
+    async def _test_matrix_state(
+        self,
+        page: Page,
+        index: int,
+        combination,
+        scripts_executed: List[str],
+        run: Dict[str, Any]
+    ) -> TestResult:
+        """
+        Run accessibility tests for one state combination
+
+        Args:
+            page: Playwright Page object in the combination's state
+            index: Position of the combination in the matrix (its state sequence)
+            combination: StateCombination being tested
+            scripts_executed: IDs of scripts that ran successfully to reach the state
+            run: Shared state of the matrix run
+
+        Returns:
+            TestResult annotated with state metadata
+        """
+        page_id = run['page_id']
+        state_description = self._state_description(combination, run)
+
+        logger.info(f"Testing page in state: {state_description}")
+
+        page_state = PageTestState(
+            state_id=f"{page_id}_state_{index}",
+            description=state_description,
+            scripts_executed=list(scripts_executed),
+            elements_clicked=[],
+            elements_visible=[],
+            elements_hidden=[]
+        )
+
+        # Run accessibility tests
+        test_result = await run['test_function'](page, page_id)
+        logger.info(f"Tests complete for state {index}, violations={len(test_result.violations)}")
+
+        # Add state metadata
+        test_result.page_state = page_state.to_dict()
+        test_result.state_sequence = index
+        test_result.session_id = run['session_id']
+        test_result.metadata['state_description'] = state_description
+        test_result.metadata['state_combination'] = combination.to_dict()
+        return test_result
+
+    def _state_description(self, combination, run: Dict[str, Any]) -> str:
+        """Human-readable description of a state combination"""
+        state_description_parts = []
+        for script_def in run['test_state_matrix'].scripts:
+            state = combination.script_states.get(script_def.script_id, "before")
+            state_description_parts.append(f"{script_def.script_name} ({state})")
+
+        state_description = ", ".join(state_description_parts)
+        if combination.description:
+            state_description = f"{combination.description}: {state_description}"
+        return state_description
+
+    def _state_error_result(self, index: int, combination, run: Dict[str, Any], error: str) -> TestResult:
+        """
+        TestResult recording that a state combination could not be tested
+
+        Args:
+            index: Position of the combination in the matrix (its state sequence)
+            combination: StateCombination that was not reached
+            run: Shared state of the matrix run
+            error: Why the state could not be tested
+
+        Returns:
+            TestResult with the error and the combination's state metadata
+        """
+        test_result = TestResult(
+            page_id=run['page_id'],
+            test_date=datetime.now(),
+            duration_ms=0,
+            error=error,
+            violations=[],
+            warnings=[],
+            passes=[]
+        )
+        test_result.state_sequence = index
+        test_result.session_id = run['session_id']
+        test_result.metadata['state_description'] = self._state_description(combination, run)
+        test_result.metadata['state_combination'] = combination.to_dict()
+        return test_result
+
     async def test_page_with_matrix(
         self,
         page: Page,
@@ -426,13 +769,17 @@ class MultiStateTestRunner:
         scripts_by_id: Dict[str, PageSetupScript],
         test_function,
         session_id: str,
-        environment_vars: Optional[Dict[str, str]] = None
+        environment_vars: Optional[Dict[str, str]] = None,
+        browser_manager=None
     ) -> List[TestResult]:
         """
         Test page using a state matrix to define which combinations to test
 
         This method tests only the state combinations defined in the matrix,
         avoiding the combinatorial explosion of testing all 2^N permutations.
+        Combinations are walked as a prefix tree of executed scripts, so a
+        script shared by several combinations runs once and the page is only
+        restored where combinations diverge.
 
         Args:
             page: Playwright Page object
@@ -442,105 +789,40 @@ class MultiStateTestRunner:
             test_function: Async function that runs accessibility tests
             session_id: Script execution session ID
             environment_vars: Environment variables for scripts
+            browser_manager: Optional BrowserManager used to restore branch
+                checkpoints in cloned contexts instead of replaying from a reload
 
         Returns:
-            List of TestResult objects (one per state combination tested)
+            List of TestResult objects (one per state combination tested, in matrix order)
         """
-        from auto_a11y.models import TestStateMatrix, StateCombination
-
         logger.info(f"Starting matrix-based multi-state testing for page {page_id}")
-        results = []
-        state_sequence = 0
 
         # Get all enabled state combinations from the matrix
         combinations = test_state_matrix.get_enabled_combinations()
         logger.info(f"Testing {len(combinations)} state combinations (instead of {2**len(test_state_matrix.scripts)} possible permutations)")
 
-        # Save initial page URL for reloading
-        initial_url = page.url
-
-        # Test each combination
-        for combo_idx, combination in enumerate(combinations):
-            logger.info(f"Testing combination {combo_idx + 1}/{len(combinations)}: {combination.script_states}")
-
-            # Reload page to start fresh
-            if combo_idx > 0:
-                logger.info(f"Reloading page to initial state")
-                await page.goto(initial_url, wait_until='networkidle', timeout=30000)
-                await asyncio.sleep(0.3)
-
-            # Execute scripts to reach this state
-            scripts_executed = []
-            for script_def in sorted(test_state_matrix.scripts, key=lambda s: s.execution_order):
-                script_id = script_def.script_id
-                desired_state = combination.script_states.get(script_id)
-
-                if desired_state == "after" and script_id in scripts_by_id:
-                    script = scripts_by_id[script_id]
-                    logger.info(f"Executing script '{script.name}' to reach desired state")
-
-                    # Clear browser state if configured
-                    if script.clear_cookies_before or script.clear_local_storage_before:
-                        try:
-                            current_url = page.url
-                            await self._clear_browser_state(page, script)
-                            await page.goto(current_url, wait_until='networkidle', timeout=30000)
-                            await asyncio.sleep(0.5)
-                        except Exception as e:
-                            logger.error(f"Error clearing browser state: {e}")
-                            continue
-
-                    # Execute script
-                    script_result = await self.script_executor.execute_script(
-                        page=page,
-                        script=script,
-                        environment_vars=environment_vars
-                    )
-
-                    if script_result['success']:
-                        scripts_executed.append(script_id)
-                        logger.info(f"Successfully executed script '{script.name}'")
-                    else:
-                        logger.warning(f"Script '{script.name}' failed: {script_result.get('error', 'Unknown error')}")
-
-            # Create state description
-            state_description_parts = []
-            for script_def in test_state_matrix.scripts:
-                script_id = script_def.script_id
-                state = combination.script_states.get(script_id, "before")
-                state_label = f"{script_def.script_name} ({state})"
-                state_description_parts.append(state_label)
-
-            state_description = ", ".join(state_description_parts)
-            if combination.description:
-                state_description = f"{combination.description}: {state_description}"
-
-            logger.info(f"Testing page in state: {state_description}")
-
-            # Create PageTestState
-            from auto_a11y.models import PageTestState
-            page_state = PageTestState(
-                state_id=f"{page_id}_state_{state_sequence}",
-                description=state_description,
-                scripts_executed=scripts_executed,
-                elements_clicked=[],
-                elements_visible=[],
-                elements_hidden=[]
-            )
-
-            # Run accessibility tests
-            test_result = await test_function(page, page_id)
-            logger.info(f"Tests complete for state {state_sequence}, violations={len(test_result.violations)}")
-
-            # Add state metadata
-            test_result.page_state = page_state.to_dict()
-            test_result.state_sequence = state_sequence
-            test_result.session_id = session_id
-            test_result.metadata['state_description'] = state_description
-            test_result.metadata['state_combination'] = combination.to_dict()
-
-            results.append(test_result)
-            state_sequence += 1
+        tree = build_state_tree(test_state_matrix, combinations, scripts_by_id)
+        naive_runs = sum(
+            1 for combination in combinations
+            for script_id, state in combination.script_states.items()
+            if state == "after" and script_id in scripts_by_id
+        )
+        logger.info(f"State tree needs {tree.count_script_runs()} script runs (replaying each combination: {naive_runs})")
+
+        run = {
+            'page_id': page_id,
+            'test_state_matrix': test_state_matrix,
+            'scripts_by_id': scripts_by_id,
+            'test_function': test_function,
+            'session_id': session_id,
+            'environment_vars': environment_vars,
+            'browser_manager': browser_manager,
+            'initial_url': page.url,
+            'results': {}
+        }
+        await self._walk_state_tree(tree, page, [], run)
+
+        results = [run['results'][index] for index in sorted(run['results'])]
 
         # Link all results together
         result_ids = [result.id for result in results if result.id]
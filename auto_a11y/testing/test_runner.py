@@ -12,6 +12,7 @@ import time
 from auto_a11y.models import Page, PageStatus, TestResult
 from auto_a11y.core.database import Database
 from auto_a11y.core.browser_manager import BrowserManager
+from auto_a11y.core.template_sampling import restrict_touchpoints
 from auto_a11y.testing.script_injector import ScriptInjector
 from auto_a11y.testing.result_processor import ResultProcessor
 from auto_a11y.testing.script_executor import ScriptExecutor
@@ -34,7 +35,7 @@ class TestRunner:
             browser_config: Browser configuration
         """
         self.db = database
-        self.browser_manager = BrowserManager(browser_config)
+        self.browser_manager = BrowserManager(browser_config, install_touchpoints=True)
         self.script_injector = ScriptInjector()  # Will use test_config from project
         self.result_processor = ResultProcessor()
         self.script_executor = ScriptExecutor()  # For executing page setup scripts
@@ -52,7 +53,9 @@ class TestRunner:
         take_screenshot: bool = True,
         run_ai_analysis: bool = False,
         ai_api_key: Optional[str] = None,
-        website_user_id: Optional[str] = None
+        website_user_id: Optional[str] = None,
+        touchpoints: Optional[List[str]] = None,
+        result_metadata: Optional[Dict[str, Any]] = None
     ) -> TestResult:
         """
         Run accessibility tests on a single page
@@ -63,6 +66,9 @@ class TestRunner:
             run_ai_analysis: Whether to run AI analysis
             ai_api_key: API key for AI analysis
             website_user_id: Optional ID of user to authenticate as before testing
+            touchpoints: Optional subset of touchpoint IDs to run; the project's
+                other touchpoints are skipped
+            result_metadata: Optional entries added to the test result metadata
 
         Returns:
             Test result
@@ -147,7 +153,8 @@ class TestRunner:
                     browser_page,
                     page.url,
                     wait_until=wait_strategy,
-                    timeout=30000
+                    timeout=30000,
+                    capture_css=True
                 )
 
                 if not response:
@@ -256,6 +263,14 @@ class TestRunner:
                         logger.warning(f"Could not find website for page {page.website_id}")
                 except Exception as e:
                     logger.warning(f"Could not get project config: {e}, using defaults")
+
+                # Limit the run to a touchpoint subset (template sampling)
+                if touchpoints is not None:
+                    if not test_config:
+                        from auto_a11y.config.test_config import TestConfiguration
+                        test_config = TestConfiguration(database=self.db, debug_mode=True)
+                    restrict_touchpoints(test_config, touchpoints)
+                    logger.info(f"Running touchpoint subset: {', '.join(touchpoints)}")
                 
                 # Set test configuration for Python tests
                 if test_config:
@@ -471,6 +486,9 @@ class TestRunner:
                 for discovery in test_result.discovery:
                     discovery.metadata['authenticated_user'] = user_info
 
+                if result_metadata:
+                    test_result.metadata.update(result_metadata)
+
                 # Save test result to database
                 result_id = self.db.create_test_result(test_result)
                 test_result._id = result_id
@@ -528,7 +546,8 @@ class TestRunner:
         take_screenshot: bool = True,
         run_ai_analysis: bool = False,
         ai_api_key: Optional[str] = None,
-        website_user_id: Optional[str] = None
+        website_user_id: Optional[str] = None,
+        result_metadata: Optional[Dict[str, Any]] = None
     ) -> List[TestResult]:
         """
         Run accessibility tests on a single page across multiple states
@@ -543,13 +562,17 @@ class TestRunner:
             run_ai_analysis: Whether to run AI analysis
             ai_api_key: API key for AI analysis
             website_user_id: Optional ID of user to authenticate as
+            result_metadata: Optional entries added to each test result's metadata
 
         Returns:
             List of test results (one per state)
         """
         if not enable_multi_state:
             # Fall back to single-state testing
-            result = await self.test_page(page, take_screenshot, run_ai_analysis, ai_api_key, website_user_id)
+            result = await self.test_page(
+                page, take_screenshot, run_ai_analysis, ai_api_key, website_user_id,
+                result_metadata=result_metadata
+            )
             return [result]
 
         # Update page status
@@ -612,7 +635,8 @@ class TestRunner:
                 browser_page,
                 page.url,
                 wait_until=wait_strategy,
-                timeout=30000
+                timeout=30000,
+                capture_css=True
             )
 
             if not response:
@@ -839,18 +863,33 @@ class TestRunner:
 
                 return test_result
 
-            # Run multi-state testing with fresh pages for stability
-            results = await self.multi_state_runner.test_page_multi_state(
-                page=browser_page,
-                page_id=page.id,
-                scripts=multi_state_scripts,
-                test_function=run_single_test,
-                session_id=session_id,
-                browser_manager=self.browser_manager,
-                page_url=page.url,
-                authenticated_user=authenticated_user,
-                login_automation=self.login_automation
-            )
+            # A test matrix configured for the page decides which state
+            # combinations are tested; otherwise every script's before/after
+            # states are tested in sequence
+            test_state_matrix = self.db.get_test_state_matrix_by_page(page.id)
+            if test_state_matrix and test_state_matrix.get_enabled_combinations():
+                results = await self.multi_state_runner.test_page_with_matrix(
+                    page=browser_page,
+                    page_id=page.id,
+                    test_state_matrix=test_state_matrix,
+                    scripts_by_id={script.id: script for script in scripts_to_execute},
+                    test_function=run_single_test,
+                    session_id=session_id,
+                    browser_manager=self.browser_manager
+                )
+            else:
+                # Run multi-state testing with fresh pages for stability
+                results = await self.multi_state_runner.test_page_multi_state(
+                    page=browser_page,
+                    page_id=page.id,
+                    scripts=multi_state_scripts,
+                    test_function=run_single_test,
+                    session_id=session_id,
+                    browser_manager=self.browser_manager,
+                    page_url=page.url,
+                    authenticated_user=authenticated_user,
+                    login_automation=self.login_automation
+                )
 
             # Add test user information to all results (Guest or authenticated user)
             if authenticated_user:
@@ -872,6 +911,8 @@ class TestRunner:
             for result in results:
                 # Add to result metadata
                 result.metadata['authenticated_user'] = user_info
+                if result_metadata:
+                    result.metadata.update(result_metadata)
 
                 # Add to each violation's metadata
                 for violation in result.violations:
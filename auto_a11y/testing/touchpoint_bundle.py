@@ -0,0 +1,126 @@
+"""
+Touchpoint script bundle
+
+The JavaScript engines of the Python touchpoint tests live in
+auto_a11y/scripts/touchpoints/, one function expression per file. They are
+concatenated into a single versioned bundle that BrowserManager installs on
+every browser context with add_init_script, so each document receives and
+parses them once and touchpoint tests only send an engine name and its
+argument over CDP.
+
+Pages without the bundle (created outside BrowserManager, or from an older
+bundle version) fall back to evaluating the engine source directly.
+"""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directory holding one <engine name>.js file per touchpoint engine
+TOUCHPOINT_SCRIPT_DIR = Path(__file__).parent.parent / 'scripts' / 'touchpoints'
+
+# Returned by the runner when the page has no (or an outdated) bundle
+_MISSING = '__autoA11yMissing'
+
+_RUN_SCRIPT = f'''([name, version, arg]) => {{
+    const bundle = window.__autoA11y;
+    if (!bundle || bundle.version !== version) {{
+        return {{ {_MISSING}: true }};
+    }}
+    return bundle.run(name, arg);
+}}'''
+
+
+@lru_cache(maxsize=None)
+def load_touchpoint_scripts() -> Dict[str, str]:
+    """
+    Load the touchpoint engines
+
+    Returns:
+        Dictionary mapping engine names to their function source
+    """
+    scripts = {}
+    for path in sorted(TOUCHPOINT_SCRIPT_DIR.glob('*.js')):
+        scripts[path.stem] = path.read_text(encoding='utf-8').strip()
+    return scripts
+
+
+@lru_cache(maxsize=None)
+def build_bundle() -> Tuple[str, str]:
+    """
+    Build the bundle installed on browser contexts
+
+    Engines are only defined in top-level documents; touchpoint tests never
+    run inside frames, so frames skip the bundle.
+
+    Returns:
+        Tuple of (version, bundle source)
+    """
+    scripts = load_touchpoint_scripts()
+    version = hashlib.sha256(
+        json.dumps(scripts, sort_keys=True).encode('utf-8')
+    ).hexdigest()[:12]
+
+    engines = ',\n'.join(f'{json.dumps(name)}: ({source})' for name, source in scripts.items())
+    bundle = f'''(() => {{
+if (window !== window.top) return;
+if (window.__autoA11y && window.__autoA11y.version === {json.dumps(version)}) return;
+const engines = {{
+{engines}
+}};
+Object.defineProperty(window, '__autoA11y', {{
+    configurable: true,
+    value: Object.freeze({{
+        version: {json.dumps(version)},
+        names: Object.keys(engines),
+        run(name, arg) {{
+            const engine = engines[name];
+            if (!engine) throw new Error('Unknown touchpoint engine: ' + name);
+            return engine(arg);
+        }}
+    }})
+}});
+}})();
+'''
+    return version, bundle
+
+
+async def install_bundle(context) -> None:
+    """
+    Install the touchpoint bundle on a browser context
+
+    Args:
+        context: Playwright BrowserContext
+    """
+    version, bundle = build_bundle()
+    await context.add_init_script(bundle)
+    logger.debug(f"Installed touchpoint bundle {version} ({len(bundle)} bytes)")
+
+
+async def run_touchpoint_script(page, name: str, arg: Any = None) -> Any:
+    """
+    Run a touchpoint engine on a page
+
+    Args:
+        page: Playwright Page object
+        name: Engine name (file name in TOUCHPOINT_SCRIPT_DIR without .js)
+        arg: JSON-serializable argument passed to the engine
+
+    Returns:
+        The engine's result
+    """
+    scripts = load_touchpoint_scripts()
+    if name not in scripts:
+        raise ValueError(f"Unknown touchpoint engine: {name}")
+
+    version, _ = build_bundle()
+    result = await page.evaluate(_RUN_SCRIPT, [name, version, arg])
+    if isinstance(result, dict) and result.get(_MISSING):
+        logger.debug(f"Touchpoint bundle not installed, sending engine '{name}'")
+        result = await page.evaluate(scripts[name], arg)
+    return result
@@ -6,6 +6,10 @@ Tests for proper button focus indicators and keyboard accessibility.
 from typing import Dict, Any
 import logging
 
+from auto_a11y.testing.ax_snapshot import get_ax_snapshot
+from auto_a11y.testing.color_math import indicator_contrast, parse_color
+from auto_a11y.testing.touchpoint_bundle import run_touchpoint_script
+
 logger = logging.getLogger(__name__)
 
 TEST_DOCUMENTATION = {
@@ -36,327 +40,12 @@ async def test_buttons(page) -> Dict[str, Any]:
         Dictionary containing test results with errors and warnings
     """
     try:
+        # Button names come from the browser's accessibility tree when it is available
+        snapshot = await get_ax_snapshot(page)
+        ax_names = snapshot.names_by_xpath(('button',), ('button',)) if snapshot else None
+
         # Extract button focus data from the page
-        button_data = await page.evaluate('''
-            () => {
-                // Simple XPath generator
-                function getXPath(element) {
-                    if (element.id) {
-                        return `//*[@id="${element.id}"]`;
-                    }
-                    if (element === document.body) {
-                        return '/html/body';
-                    }
-                    let ix = 0;
-                    const siblings = element.parentNode ? element.parentNode.childNodes : [];
-                    for (let i = 0; i < siblings.length; i++) {
-                        const sibling = siblings[i];
-                        if (sibling === element) {
-                            return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                        }
-                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                            ix++;
-                        }
-                    }
-                }
-
-                // Helper to parse color values to RGBA
-                function parseColor(colorStr) {
-                    if (!colorStr || colorStr === 'transparent') {
-                        return { r: 0, g: 0, b: 0, a: 0 };
-                    }
-
-                    // Handle rgba format
-                    const rgbaMatch = colorStr.match(/rgba?\\((\\d+),\\s*(\\d+),\\s*(\\d+)(?:,\\s*([\\d.]+))?\\)/);
-                    if (rgbaMatch) {
-                        return {
-                            r: parseInt(rgbaMatch[1]),
-                            g: parseInt(rgbaMatch[2]),
-                            b: parseInt(rgbaMatch[3]),
-                            a: rgbaMatch[4] !== undefined ? parseFloat(rgbaMatch[4]) : 1
-                        };
-                    }
-
-                    // Handle hex format
-                    const hexMatch = colorStr.match(/^#([0-9a-f]{6})$/i);
-                    if (hexMatch) {
-                        const hex = hexMatch[1];
-                        return {
-                            r: parseInt(hex.substr(0, 2), 16),
-                            g: parseInt(hex.substr(2, 2), 16),
-                            b: parseInt(hex.substr(4, 2), 16),
-                            a: 1
-                        };
-                    }
-
-                    return { r: 0, g: 0, b: 0, a: 1 };
-                }
-
-                // Calculate relative luminance
-                function getLuminance(color) {
-                    const rsRGB = color.r / 255;
-                    const gsRGB = color.g / 255;
-                    const bsRGB = color.b / 255;
-
-                    const r = rsRGB <= 0.03928 ? rsRGB / 12.92 : Math.pow((rsRGB + 0.055) / 1.055, 2.4);
-                    const g = gsRGB <= 0.03928 ? gsRGB / 12.92 : Math.pow((gsRGB + 0.055) / 1.055, 2.4);
-                    const b = bsRGB <= 0.03928 ? bsRGB / 12.92 : Math.pow((bsRGB + 0.055) / 1.055, 2.4);
-
-                    return 0.2126 * r + 0.7152 * g + 0.0722 * b;
-                }
-
-                // Calculate contrast ratio
-                function getContrastRatio(color1, color2) {
-                    const lum1 = getLuminance(color1);
-                    const lum2 = getLuminance(color2);
-                    const lighter = Math.max(lum1, lum2);
-                    const darker = Math.min(lum1, lum2);
-                    return (lighter + 0.05) / (darker + 0.05);
-                }
-
-                // Reusable function to get effective background color by walking up the DOM tree
-                // Stops at z-index boundaries (stacking contexts) and returns result object
-                // Returns: { backgroundColor, stoppedAtZIndex, hasZIndex }
-                function getEffectiveBackgroundColor(element) {
-                    let currentElement = element;
-                    let backgroundColor = 'rgba(0, 0, 0, 0)';
-                    let stoppedAtZIndex = false;
-
-                    // Walk up the DOM tree until we find a non-transparent background
-                    while (currentElement && backgroundColor === 'rgba(0, 0, 0, 0)') {
-                        const style = window.getComputedStyle(currentElement);
-                        backgroundColor = style.backgroundColor;
-
-                        // Check if this element has z-index (creates stacking context)
-                        // z-index only matters if position is not static
-                        const zIndex = style.zIndex;
-                        const position = style.position;
-                        if (zIndex !== 'auto' && position !== 'static') {
-                            stoppedAtZIndex = true;
-                            break; // Stop here - element may float over other content
-                        }
-
-                        currentElement = currentElement.parentElement;
-                    }
-
-                    // Default to white if we couldn't find a background (reached root)
-                    if (backgroundColor === 'rgba(0, 0, 0, 0)') {
-                        backgroundColor = 'rgb(255, 255, 255)';
-                    }
-
-                    return {
-                        backgroundColor,
-                        stoppedAtZIndex
-                    };
-                }
-
-                // Get all buttons (button element and elements with role="button")
-                const allButtons = Array.from(document.querySelectorAll('button, [role="button"]')).filter(btn => {
-                    const style = window.getComputedStyle(btn);
-                    return style.display !== 'none' && style.visibility !== 'hidden';
-                });
-
-                return allButtons.map(button => {
-                    const normalStyle = window.getComputedStyle(button);
-
-                    // Get font size for em/rem calculations
-                    const fontSize = parseFloat(normalStyle.fontSize) || 16;
-                    const rootFontSize = parseFloat(window.getComputedStyle(document.documentElement).fontSize) || 16;
-
-                    // Get clip-path for non-rectangular button detection
-                    const clipPath = normalStyle.clipPath;
-
-                    // Check if button itself has z-index
-                    const buttonZIndex = normalStyle.zIndex;
-                    const buttonPosition = normalStyle.position;
-                    const buttonHasZIndex = (buttonZIndex !== 'auto' && buttonPosition !== 'static');
-
-                    // Get button's own background color (for the button itself)
-                    const buttonBgResult = getEffectiveBackgroundColor(button);
-                    const backgroundColor = buttonBgResult.backgroundColor;
-                    const buttonBgStoppedAtZIndex = buttonBgResult.stoppedAtZIndex;
-                    const backgroundImage = normalStyle.backgroundImage; // For gradient/image detection
-                    const fullBackground = normalStyle.background; // For gradient/image detection
-
-                    // Get parent's background information (for outline that sits outside the button)
-                    // This is what we should compare the outline against when outline-offset > 0
-                    const parentBgResult = button.parentElement
-                        ? getEffectiveBackgroundColor(button.parentElement)
-                        : buttonBgResult;
-                    const parentBackgroundColor = parentBgResult.backgroundColor;
-                    const parentBgStoppedAtZIndex = parentBgResult.stoppedAtZIndex;
-
-                    // Also get parent's background image/gradient info
-                    const parentBackgroundImage = button.parentElement
-                        ? window.getComputedStyle(button.parentElement).backgroundImage
-                        : 'none';
-                    const parentFullBackground = button.parentElement
-                        ? window.getComputedStyle(button.parentElement).background
-                        : 'none';
-
-                    // Calculate button and parent boundaries to check if outline extends beyond parent
-                    const buttonRect = button.getBoundingClientRect();
-                    const parentRect = button.parentElement ? button.parentElement.getBoundingClientRect() : null;
-
-                    // Store boundary information for later outline extent checking
-                    const buttonBounds = {
-                        top: buttonRect.top,
-                        right: buttonRect.right,
-                        bottom: buttonRect.bottom,
-                        left: buttonRect.left,
-                        width: buttonRect.width,
-                        height: buttonRect.height
-                    };
-
-                    const parentBounds = parentRect ? {
-                        top: parentRect.top,
-                        right: parentRect.right,
-                        bottom: parentRect.bottom,
-                        left: parentRect.left,
-                        width: parentRect.width,
-                        height: parentRect.height
-                    } : null;
-
-                    // Try to get focus styles by checking stylesheets
-                    let focusOutlineStyle = null;
-                    let focusOutlineWidth = null;
-                    let focusOutlineColor = null;
-                    let focusOutlineOffset = null;
-                    let focusBackgroundColor = null;
-                    let focusBorderColor = null;
-                    let focusBoxShadow = null;
-
-                    // Function to resolve CSS variables like var(--some-var)
-                    function resolveCSSVariable(value, element) {
-                        if (!value || typeof value !== 'string') return value;
-
-                        // Check if value contains var()
-                        const varMatch = value.match(/var\\((--[^,)]+)(?:,\\s*([^)]+))?\\)/);
-                        if (!varMatch) return value;
-
-                        const varName = varMatch[1];
-                        const fallback = varMatch[2];
-
-                        // Get computed style to resolve the variable - this doesn't manipulate the page
-                        const computedStyle = window.getComputedStyle(element);
-                        const resolvedValue = computedStyle.getPropertyValue(varName).trim();
-
-                        if (resolvedValue) {
-                            // Replace the var() with the resolved value
-                            return value.replace(varMatch[0], resolvedValue);
-                        }
-
-                        // If no resolved value, use fallback or return original
-                        return fallback || value;
-                    }
-
-                    // Check all stylesheets for :focus rules
-                    const sheets = Array.from(document.styleSheets);
-                    for (const sheet of sheets) {
-                        try {
-                            const rules = Array.from(sheet.cssRules || sheet.rules || []);
-                            for (const rule of rules) {
-                                if (rule.selectorText && (rule.selectorText.includes(':focus-visible') || rule.selectorText.includes(':focus'))) {
-                                    // Handle multiple selectors separated by commas
-                                    const selectors = rule.selectorText.split(',').map(s => s.trim());
-
-                                    for (const fullSelector of selectors) {
-                                        if (!fullSelector.includes(':focus')) continue;
-
-                                        // Remove :focus, :focus-visible, :focus-within and any other pseudo-classes after them
-                                        const selector = fullSelector.replace(/:focus(-visible|-within)?([:\\s\\[>+~,.]|$)/g, '$2');
-
-                                        try {
-                                            if (button.matches(selector)) {
-                                            if (rule.style.outlineStyle !== undefined && rule.style.outlineStyle !== '') {
-                                                focusOutlineStyle = resolveCSSVariable(rule.style.outlineStyle, button);
-                                            }
-                                            if (rule.style.outlineWidth !== undefined && rule.style.outlineWidth !== '') {
-                                                focusOutlineWidth = resolveCSSVariable(rule.style.outlineWidth, button);
-                                            }
-                                            if (rule.style.outlineColor !== undefined && rule.style.outlineColor !== '') {
-                                                focusOutlineColor = resolveCSSVariable(rule.style.outlineColor, button);
-                                            }
-                                            if (rule.style.outlineOffset !== undefined && rule.style.outlineOffset !== '') {
-                                                focusOutlineOffset = resolveCSSVariable(rule.style.outlineOffset, button);
-                                            }
-                                            if (rule.style.outline !== undefined && rule.style.outline !== '') {
-                                                const outlineValue = resolveCSSVariable(rule.style.outline, button);
-                                                if (outlineValue === 'none' || outlineValue === '0') {
-                                                    focusOutlineStyle = 'none';
-                                                    focusOutlineWidth = '0px';
-                                                } else {
-                                                    // Parse shorthand outline property: "width style color"
-                                                    // Handle colors that might contain spaces like rgb(255, 255, 255)
-                                                    // Match width (digits with unit)
-                                                    const widthMatch = outlineValue.match(/(\\d+(?:\\.\\d+)?(?:px|em|rem))/);
-                                                    if (widthMatch) focusOutlineWidth = widthMatch[0];
-
-                                                    // Match style (solid, dashed, etc)
-                                                    const styleMatch = outlineValue.match(/\\b(solid|dashed|dotted|double|groove|ridge|inset|outset)\\b/);
-                                                    if (styleMatch) focusOutlineStyle = styleMatch[0];
-
-                                                    // Match color (everything after style, or hex/rgb/rgba/hsl)
-                                                    const colorMatch = outlineValue.match(/(?:rgb|rgba|hsl|hsla)\\([^)]+\\)|#[0-9a-fA-F]{3,8}|\\b(?:white|black|red|blue|green|yellow|purple|orange|pink|brown|gray|grey)\\b/);
-                                                    if (colorMatch) focusOutlineColor = colorMatch[0];
-                                                }
-                                            }
-                                            if (rule.style.backgroundColor !== undefined && rule.style.backgroundColor !== '') {
-                                                focusBackgroundColor = resolveCSSVariable(rule.style.backgroundColor, button);
-                                            }
-                                            if (rule.style.borderColor !== undefined && rule.style.borderColor !== '') {
-                                                focusBorderColor = resolveCSSVariable(rule.style.borderColor, button);
-                                            }
-                                            if (rule.style.boxShadow !== undefined && rule.style.boxShadow !== '') {
-                                                focusBoxShadow = resolveCSSVariable(rule.style.boxShadow, button);
-                                            }
-                                            }
-                                        } catch (e) {
-                                            // Selector might not be valid or might not match
-                                        }
-                                    }
-                                }
-                            }
-                        } catch (e) {
-                            // Cross-origin stylesheet or other access issue
-                        }
-                    }
-
-                    return {
-                        tagName: button.tagName,
-                        text: button.textContent.trim().substring(0, 50),
-                        xpath: getXPath(button),
-                        html: button.outerHTML.substring(0, 200),
-                        className: button.className,
-                        fontSize: fontSize,
-                        rootFontSize: rootFontSize,
-                        clipPath: clipPath,
-                        normalOutlineStyle: normalStyle.outlineStyle,
-                        normalOutlineWidth: normalStyle.outlineWidth,
-                        normalOutlineColor: normalStyle.outlineColor,
-                        focusOutlineStyle: focusOutlineStyle,
-                        focusOutlineWidth: focusOutlineWidth,
-                        focusOutlineColor: focusOutlineColor,
-                        focusOutlineOffset: focusOutlineOffset,
-                        focusBackgroundColor: focusBackgroundColor,
-                        focusBorderColor: focusBorderColor,
-                        focusBoxShadow: focusBoxShadow,
-                        backgroundColor: backgroundColor,
-                        normalBackgroundColor: normalStyle.backgroundColor,
-                        buttonHasZIndex: buttonHasZIndex,
-                        buttonBgStoppedAtZIndex: buttonBgStoppedAtZIndex,
-                        parentBackgroundColor: parentBackgroundColor,
-                        parentBgStoppedAtZIndex: parentBgStoppedAtZIndex,
-                        parentBackgroundImage: parentBackgroundImage,
-                        parentFullBackground: parentFullBackground,
-                        backgroundImage: backgroundImage,
-                        fullBackground: fullBackground,
-                        buttonBounds: buttonBounds,
-                        parentBounds: parentBounds
-                    };
-                });
-            }
-        ''')
+        button_data = await run_touchpoint_script(page, 'buttons', ax_names)
 
         results = {
             'applicable': True,
@@ -378,52 +67,14 @@ async def test_buttons(page) -> Dict[str, Any]:
 
         results['elements_tested'] = len(button_data)
 
-        # Helper function to parse color values
-        def parse_color(color_str):
-            if not color_str or color_str == 'transparent':
-                return {'r': 0, 'g': 0, 'b': 0, 'a': 0}
-
-            # Handle rgba format
-            import re
-            rgba_match = re.match(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([\d.]+))?\)', color_str)
-            if rgba_match:
-                return {
-                    'r': int(rgba_match.group(1)),
-                    'g': int(rgba_match.group(2)),
-                    'b': int(rgba_match.group(3)),
-                    'a': float(rgba_match.group(4)) if rgba_match.group(4) else 1.0
-                }
-
-            # Handle hex format
-            hex_match = re.match(r'^#([0-9a-f]{6})$', color_str, re.IGNORECASE)
-            if hex_match:
-                hex_val = hex_match.group(1)
-                return {
-                    'r': int(hex_val[0:2], 16),
-                    'g': int(hex_val[2:4], 16),
-                    'b': int(hex_val[4:6], 16),
-                    'a': 1.0
-                }
-
-            return {'r': 0, 'g': 0, 'b': 0, 'a': 1.0}
-
-        def get_luminance(color):
-            r_srgb = color['r'] / 255.0
-            g_srgb = color['g'] / 255.0
-            b_srgb = color['b'] / 255.0
-
-            r = r_srgb / 12.92 if r_srgb <= 0.03928 else ((r_srgb + 0.055) / 1.055) ** 2.4
-            g = g_srgb / 12.92 if g_srgb <= 0.03928 else ((g_srgb + 0.055) / 1.055) ** 2.4
-            b = b_srgb / 12.92 if b_srgb <= 0.03928 else ((b_srgb + 0.055) / 1.055) ** 2.4
-
-            return 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-        def get_contrast_ratio(color1, color2):
-            lum1 = get_luminance(color1)
-            lum2 = get_luminance(color2)
-            lighter = max(lum1, lum2)
-            darker = min(lum1, lum2)
-            return (lighter + 0.05) / (darker + 0.05)
+        # Focus outline contrast for every button, against its own and its
+        # parent's background, in one batch
+        focus_contrast = indicator_contrast(
+            (button['focusOutlineColor'], background)
+            for button in button_data if button.get('focusOutlineColor')
+            for background in (button.get('parentBackgroundColor', button.get('backgroundColor')),
+                               button.get('backgroundColor'))
+        )
 
         # Helper function to parse px values (including em/rem)
         def parse_px(value_str, font_size=16, root_font_size=16):
@@ -721,34 +372,37 @@ async def test_buttons(page) -> Dict[str, Any]:
 
                     # Check contrast against solid background (if no gradient/image)
                     if 'check_solid_contrast' in locals() and check_solid_contrast:
-                        outline_color = parse_color(button['focusOutlineColor'])
+                        outline_color = button['focusOutlineColor']
+                        outline_alpha = parse_color(outline_color)[3]
 
                         # Determine which background to compare against:
                         # - If outline-offset > 0: outline sits OUTSIDE button, compare against parent background
                         # - If outline-offset <= 0: outline sits ON/INSIDE button, compare against button background
                         if outline_offset > 0:
-                            bg_color = parse_color(button.get('parentBackgroundColor', button['backgroundColor']))
+                            bg_color = button.get('parentBackgroundColor', button.get('backgroundColor'))
                         else:
-                            bg_color = parse_color(button['backgroundColor'])
+                            bg_color = button.get('backgroundColor')
 
                         # Check if outline color is fully transparent
-                        if outline_color['a'] == 0:
+                        if outline_alpha == 0:
                             error_code = 'ErrButtonNoVisibleFocus'
                             violation_reason = 'Button focus outline is transparent/invisible'
                         # Check if outline is semi-transparent (< 50% opacity) - Error, not warning
-                        elif outline_color['a'] < 0.5:
+                        elif outline_alpha < 0.5:
                             error_code = 'ErrButtonTransparentOutline'
-                            violation_reason = f'Button focus outline is semi-transparent (alpha={outline_color["a"]:.2f}) which cannot guarantee 3:1 contrast in all contexts (fails WCAG 1.4.11)'
+                            violation_reason = f'Button focus outline is semi-transparent (alpha={outline_alpha:.2f}) which cannot guarantee 3:1 contrast in all contexts (fails WCAG 1.4.11)'
                         else:
-                            # For semi-transparent colors, we should ideally blend with background
-                            # For now, just calculate contrast with the opaque version
-                            contrast = get_contrast_ratio(outline_color, bg_color)
+                            # The outline is composited over the background it sits on
+                            contrast = focus_contrast[(outline_color, bg_color)]
                             if contrast < 3.0:
                                 error_code = 'ErrButtonFocusContrastFail'
                                 violation_reason = f'Button focus outline has insufficient contrast ({contrast:.2f}:1, needs ≥3:1 per WCAG 1.4.11)'
 
             # Check for generic button text (independent check - can co-exist with other issues)
-            button_text = button.get('text', '').lower().strip()
+            button_name = button.get('accessibleName')
+            if button_name is None:
+                button_name = button.get('text', '')
+            button_text = button_name.lower().strip()
 
             # List of generic/vague terms that should be avoided
             # Excludes standard form actions (submit, reset, cancel, ok, yes, no, etc.)
@@ -777,7 +431,7 @@ async def test_buttons(page) -> Dict[str, Any]:
                     'element': tag,
                     'xpath': button['xpath'],
                     'html': button['html'],
-                    'description': f'Button uses generic text "{button.get("text", "")}" which provides no context about its purpose when read in isolation',
+                    'description': f'Button uses generic text "{button_name}" which provides no context about its purpose when read in isolation',
                     'text': button['text']
                 })
                 # Note: Don't increment elements_failed here as it will be counted below
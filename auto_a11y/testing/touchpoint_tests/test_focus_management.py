@@ -5,10 +5,20 @@ Evaluates if interactive elements have appropriate focus indicators that meet ac
 
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+import asyncio
 import logging
 
+from auto_a11y.testing.css_focus_capture import get_css_capture_for_page
+from auto_a11y.testing.touchpoint_bundle import run_touchpoint_script
+
 logger = logging.getLogger(__name__)
 
+# Computed styles that reveal a focus indicator when they change
+FOCUS_STYLE_PROPERTIES = ('outlineWidth', 'outlineStyle', 'outlineColor', 'backgroundColor', 'borderColor', 'boxShadow')
+
+# Marker set by the focus_management engine on elements it could not resolve
+PROBE_SELECTOR = '[data-auto-a11y-focus-probe]'
+
 TEST_DOCUMENTATION = {
     "testName": "Focus Management Analysis",
     "touchpoint": "focus_management",
@@ -47,6 +57,92 @@ TEST_DOCUMENTATION = {
     ]
 }
 
+def _focus_style_changed(baseline: Dict[str, str], focused: Optional[Dict[str, str]]) -> bool:
+    """Check whether an element looks different in its focused state"""
+    if not focused:
+        return False
+    return any(baseline.get(prop) != focused.get(prop) for prop in FOCUS_STYLE_PROPERTIES)
+
+
+def _indicator_selectors(page) -> Optional[List[str]]:
+    """Selectors given a focus indicator by rules captured while the page loaded"""
+    capture = get_css_capture_for_page(page)
+    if capture and capture.cache.is_complete:
+        return capture.indicator_selectors()
+    return None
+
+
+async def _forced_focus_snapshots(page) -> List[Optional[Dict[str, str]]]:
+    """
+    Read the focused styles of all probed elements in one pass
+
+    :focus and :focus-visible are forced on every probed element over CDP,
+    so nothing is focused, cloned or moved, and the page recalculates
+    styles once for the whole batch.
+    """
+    session = await page.context.new_cdp_session(page)
+    node_ids = []
+    try:
+        await session.send('DOM.enable')
+        await session.send('CSS.enable')
+        document = await session.send('DOM.getDocument', {'depth': 0})
+        found = await session.send('DOM.querySelectorAll', {
+            'nodeId': document['root']['nodeId'],
+            'selector': PROBE_SELECTOR
+        })
+        node_ids = found['nodeIds']
+        await asyncio.gather(*(
+            session.send('CSS.forcePseudoState', {'nodeId': node_id, 'forcedPseudoClasses': ['focus', 'focus-visible']})
+            for node_id in node_ids
+        ))
+        return await run_touchpoint_script(page, 'focus_style_probe', {'mode': 'read'})
+    finally:
+        try:
+            await asyncio.gather(*(
+                session.send('CSS.forcePseudoState', {'nodeId': node_id, 'forcedPseudoClasses': []})
+                for node_id in node_ids
+            ))
+        finally:
+            await session.detach()
+
+
+async def _confirm_pending_focus(page, results: Dict[str, Any], pending: List[Dict[str, Any]]) -> None:
+    """
+    Confirm the focus indicators the captured CSS could not resolve
+
+    Adds ErrNoFocusIndicator for every element whose styles do not change
+    in the focused state, and updates the focus indicator counts.
+    """
+    method = 'forced_pseudo_state'
+    try:
+        snapshots = await _forced_focus_snapshots(page)
+    except Exception as e:
+        logger.debug(f"Forcing :focus over CDP failed, focusing elements instead: {e}")
+        method = 'focus'
+        snapshots = await run_touchpoint_script(page, 'focus_style_probe', {'mode': 'focus'})
+    finally:
+        try:
+            await run_touchpoint_script(page, 'focus_style_probe', {'mode': 'cleanup'})
+        except Exception as e:
+            logger.debug(f"Could not remove focus probe markers: {e}")
+
+    for index, item in enumerate(pending):
+        focused = snapshots[index] if index < len(snapshots) else None
+        if _focus_style_changed(item['baseline'], focused):
+            results['elements_passed'] += 1
+        else:
+            results['errors'].append(item['error'])
+            results['elements_failed'] += 1
+
+    for check in results.get('checks', []):
+        if check.get('description') == 'Focus indicators':
+            check['passed'] = results['elements_passed']
+            check['failed'] = results['elements_failed']
+
+    results['focus_resolution']['confirmed'] = len(pending)
+    results['focus_resolution']['method'] = method
+
+
 async def test_focus_management(page) -> Dict[str, Any]:
     """
     Test focus management and interactive element styling
@@ -58,214 +154,19 @@ async def test_focus_management(page) -> Dict[str, Any]:
         Dictionary containing test results with errors and warnings
     """
     try:
-        # Execute JavaScript to analyze focus management
-        results = await page.evaluate('''
-            () => {
-                const results = {
-                    applicable: true,
-                    errors: [],
-                    warnings: [],
-                    passes: [],
-                    elements_tested: 0,
-                    elements_passed: 0,
-                    elements_failed: 0,
-                    test_name: 'focus_management',
-                    checks: []
-                };
-                
-                // Function to generate XPath for elements
-                function getFullXPath(element) {
-                    if (!element) return '';
-                    
-                    function getElementIdx(el) {
-                        let count = 1;
-                        for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
-                            if (sib.nodeType === 1 && sib.tagName === el.tagName) {
-                                count++;
-                            }
-                        }
-                        return count;
-                    }
-                    
-                    let path = '';
-                    while (element && element.nodeType === 1) {
-                        const idx = getElementIdx(element);
-                        const tagName = element.tagName.toLowerCase();
-                        path = `/${tagName}[${idx}]${path}`;
-                        element = element.parentNode;
-                    }
-                    return path;
-                }
-                
-                // Check if element has custom focus styles
-                function hasFocusStyles(element) {
-                    try {
-                        // Create a temporary clone to test focus styles
-                        const temp = element.cloneNode(true);
-                        temp.style.position = 'absolute';
-                        temp.style.left = '-9999px';
-                        temp.style.visibility = 'hidden';
-                        document.body.appendChild(temp);
-                        
-                        const normalStyle = window.getComputedStyle(temp);
-                        temp.focus();
-                        const focusStyle = window.getComputedStyle(temp);
-                        
-                        // Check if focus styles are different
-                        const hasDifferentOutline = focusStyle.outlineWidth !== normalStyle.outlineWidth ||
-                                                   focusStyle.outlineStyle !== normalStyle.outlineStyle ||
-                                                   focusStyle.outlineColor !== normalStyle.outlineColor;
-                        
-                        const hasDifferentBackground = focusStyle.backgroundColor !== normalStyle.backgroundColor;
-                        const hasDifferentBorder = focusStyle.borderColor !== normalStyle.borderColor;
-                        const hasDifferentBoxShadow = focusStyle.boxShadow !== normalStyle.boxShadow;
-                        
-                        document.body.removeChild(temp);
-                        
-                        return hasDifferentOutline || hasDifferentBackground || hasDifferentBorder || hasDifferentBoxShadow;
-                    } catch (e) {
-                        return false;
-                    }
-                }
-                
-                // Get all interactive elements
-                const interactiveElements = Array.from(document.querySelectorAll(
-                    'a, button, input, select, textarea, [role="button"], [role="link"], [tabindex="0"], [contenteditable="true"]'
-                )).filter(el => {
-                    const style = window.getComputedStyle(el);
-                    return style.display !== 'none' && style.visibility !== 'hidden' && !el.disabled;
-                });
-                
-                if (interactiveElements.length === 0) {
-                    results.applicable = false;
-                    results.not_applicable_reason = 'No interactive elements found on the page';
-                    return results;
-                }
-                
-                results.elements_tested = interactiveElements.length;
-                
-                // Test each interactive element
-                interactiveElements.forEach(element => {
-                    const tag = element.tagName.toLowerCase();
-                    const text = element.textContent.trim().substring(0, 50);
+        # Execute JavaScript to analyze focus management. Elements matched by
+        # captured :focus rules are resolved there; the rest are confirmed here.
+        selectors = _indicator_selectors(page)
+        results = await run_touchpoint_script(page, 'focus_management', selectors)
 
-                    // Check for focus indicators
-                    const hasFocus = hasFocusStyles(element);
-                    if (!hasFocus) {
-                        // Capture HTML, with fallback for edge cases
-                        let htmlSnippet = '';
-                        let htmlSource = 'unknown';
-                        try {
-                            if (element.outerHTML) {
-                                htmlSnippet = element.outerHTML.substring(0, 200);
-                                htmlSource = 'outerHTML';
-                            } else {
-                                htmlSnippet = `<${tag}${element.id ? ' id="' + element.id + '"' : ''}${element.className ? ' class="' + element.className + '"' : ''}>${text}</${tag}>`;
-                                htmlSource = 'fallback-empty';
-                            }
-                        } catch (e) {
-                            htmlSnippet = `<${tag}${element.id ? ' id="' + element.id + '"' : ''}${element.className ? ' class="' + element.className + '"' : ''}>${text}</${tag}>`;
-                            htmlSource = 'fallback-error';
-                        }
-
-                        results.errors.push({
-                            err: 'ErrNoFocusIndicator',
-                            type: 'err',
-                            cat: 'focus_management',
-                            element: tag,
-                            xpath: getFullXPath(element),
-                            html: htmlSnippet,
-                            htmlSource: htmlSource,
-                            description: 'Interactive element has no visible focus indicator',
-                            text: text
-                        });
-                        results.elements_failed++;
-                    } else {
-                        results.elements_passed++;
-                    }
-                    
-                    // Check hover styles
-                    const style = window.getComputedStyle(element);
-                    if (['a', 'button'].includes(tag) && style.cursor !== 'pointer') {
-                        results.warnings.push({
-                            err: 'WarnNoCursorPointer',
-                            type: 'warn',
-                            cat: 'focus_management',
-                            element: tag,
-                            xpath: getFullXPath(element),
-                            html: element.outerHTML.substring(0, 200),
-                            description: 'Interactive element does not have pointer cursor on hover',
-                            text: text
-                        });
-                    }
-                });
-                
-                // Check in-page link targets
-                const anchorLinks = Array.from(document.querySelectorAll('a[href^="#"]:not([href="#"])'));
-                const processedTargets = new Set();
-
-                anchorLinks.forEach(link => {
-                    const targetId = link.getAttribute('href').substring(1);
-                    const target = document.getElementById(targetId);
-
-                    if (target && !processedTargets.has(targetId)) {
-                        const tabindex = target.getAttribute('tabindex');
-                        const isInteractive = ['a', 'button', 'input', 'select', 'textarea'].includes(target.tagName.toLowerCase());
-
-                        if (!isInteractive && tabindex !== '-1') {
-                            // Find all anchor links pointing to this target
-                            const linksToTarget = anchorLinks.filter(l =>
-                                l.getAttribute('href').substring(1) === targetId
-                            ).map((l, idx) => ({
-                                index: idx + 1,
-                                html: l.outerHTML.substring(0, 200),
-                                xpath: getFullXPath(l),
-                                text: l.textContent.trim()
-                            }));
-
-                            results.errors.push({
-                                err: 'ErrAnchorTargetTabindex',
-                                type: 'err',
-                                cat: 'links',
-                                element: target.tagName.toLowerCase(),
-                                xpath: getFullXPath(target),
-                                html: target.outerHTML.substring(0, 200),
-                                description: 'In-page link target needs tabindex="-1" for keyboard accessibility - non-interactive element must be programmatically focusable',
-                                metadata: {
-                                    targetId: targetId,
-                                    currentTabindex: tabindex || 'not set',
-                                    anchorLinks: linksToTarget,
-                                    anchorLinksCount: linksToTarget.length
-                                }
-                            });
-
-                            processedTargets.add(targetId);
-                        }
-                    }
-                });
-                
-                // Add check information for reporting
-                results.checks.push({
-                    description: 'Focus indicators',
-                    wcag: ['2.4.7'],
-                    total: interactiveElements.length,
-                    passed: results.elements_passed,
-                    failed: results.elements_failed
-                });
-                
-                if (anchorLinks.length > 0) {
-                    results.checks.push({
-                        description: 'In-page link targets',
-                        wcag: ['2.4.3'],
-                        total: anchorLinks.length,
-                        passed: anchorLinks.length,
-                        failed: 0
-                    });
-                }
-                
-                return results;
-            }
-        ''')
+        pending = results.pop('pendingFocus', [])
+        results['focus_resolution'] = {
+            'captured_selectors': len(selectors) if selectors is not None else None,
+            'resolved_from_css': results.get('elements_passed', 0),
+            'confirmed': 0
+        }
+        if pending:
+            await _confirm_pending_focus(page, results, pending)
 
         # Log focus errors for debugging
         if 'errors' in results:
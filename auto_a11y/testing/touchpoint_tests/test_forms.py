@@ -7,8 +7,15 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 import logging
 
+from auto_a11y.testing.ax_snapshot import get_ax_snapshot
+from auto_a11y.testing.color_math import indicator_contrast, parse_color
+from auto_a11y.testing.touchpoint_bundle import run_touchpoint_script
+
 logger = logging.getLogger(__name__)
 
+# Elements whose accessible names the forms engine checks
+FORM_NAMED_TAGS = ('form', 'input', 'select', 'textarea')
+
 TEST_DOCUMENTATION = {
     "testName": "Form Accessibility Analysis",
     "touchpoint": "forms",
@@ -58,1004 +65,16 @@ async def test_forms(page) -> Dict[str, Any]:
         Dictionary containing test results with errors and warnings
     """
     try:
-        # Execute JavaScript to analyze forms
-        results = await page.evaluate('''
-            () => {
-                const results = {
-                    applicable: true,
-                    errors: [],
-                    warnings: [],
-                    discovery: [],
-                    passes: [],
-                    elements_tested: 0,
-                    elements_passed: 0,
-                    elements_failed: 0,
-                    test_name: 'forms',
-                    checks: []
-                };
-
-                // Detect page language for component tagging
-                // Default to 'en' if no lang attribute is found
-                const htmlElement = document.documentElement;
-                const pageLang = (htmlElement.getAttribute('lang') || 'en').substring(0, 2).toLowerCase();
-
-                // Function to generate XPath for elements
-                function getFullXPath(element) {
-                    if (!element) return '';
-                    
-                    function getElementIdx(el) {
-                        let count = 1;
-                        for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
-                            if (sib.nodeType === 1 && sib.tagName === el.tagName) {
-                                count++;
-                            }
-                        }
-                        return count;
-                    }
-                    
-                    let path = '';
-                    while (element && element.nodeType === 1) {
-                        const idx = getElementIdx(element);
-                        const tagName = element.tagName.toLowerCase();
-                        path = `/${tagName}[${idx}]${path}`;
-                        element = element.parentNode;
-                    }
-                    return path;
-                }
-                
-                // ERROR: Check for empty forms with no child nodes (must run before inputs check)
-                const allForms = Array.from(document.querySelectorAll('form'));
-                allForms.forEach(form => {
-                    // Check if form has no child nodes at all
-                    if (form.childNodes.length === 0) {
-                        results.errors.push({
-                            err: 'ErrFormEmptyHasNoChildNodes',
-                            type: 'err',
-                            cat: 'forms',
-                            element: 'FORM',
-                            xpath: getFullXPath(form),
-                            html: form.outerHTML.substring(0, 200),
-                            description: 'Form element is completely empty with no child nodes'
-                        });
-                        results.elements_failed++;
-                    }
-                });
-
-                // ERROR: Check for forms with content but no interactive elements
-                allForms.forEach(form => {
-                    // Skip if form is completely empty (already flagged above)
-                    if (form.childNodes.length === 0) {
-                        return;
-                    }
-
-                    // Find all interactive elements within the form that are not disabled or hidden
-                    const interactiveElements = Array.from(form.querySelectorAll(
-                        'input:not([type="hidden"]), button, select, textarea'
-                    )).filter(el => {
-                        // Exclude disabled elements
-                        if (el.disabled) return false;
-
-                        // Exclude hidden elements
-                        if (el.hidden || el.hasAttribute('hidden')) return false;
-
-                        // Check computed style for visibility
-                        const style = window.getComputedStyle(el);
-                        if (style.display === 'none' || style.visibility === 'hidden') return false;
-
-                        return true;
-                    });
-
-                    // If form has content but no interactive elements, flag it
-                    if (interactiveElements.length === 0) {
-                        results.errors.push({
-                            err: 'ErrFormEmptyHasNoInteractiveElements',
-                            type: 'err',
-                            cat: 'forms',
-                            element: 'FORM',
-                            xpath: getFullXPath(form),
-                            html: form.outerHTML.substring(0, 200),
-                            description: 'Form has content but no interactive elements (inputs, buttons, selects, textareas)',
-                            formId: form.id || '',
-                            formName: form.name || ''
-                        });
-                        results.elements_failed++;
-                    }
-                });
-
-                // Get all form inputs
-                const inputs = Array.from(document.querySelectorAll('input:not([type="hidden"]), select, textarea'));
-                const radioButtons = Array.from(document.querySelectorAll('input[type="radio"]'));
-                const checkboxes = Array.from(document.querySelectorAll('input[type="checkbox"]'));
-
-                if (inputs.length === 0) {
-                    results.applicable = false;
-                    results.not_applicable_reason = 'No form inputs found on the page';
-                    return results;
-                }
-                
-                results.elements_tested = inputs.length;
-
-                // ERROR: Check for labels containing multiple form fields
-                // A label should only contain one form control to avoid ambiguity
-                const labelsToCheck = Array.from(document.querySelectorAll('label'));
-                labelsToCheck.forEach(label => {
-                    // Find all form controls within this label
-                    const fieldsInLabel = Array.from(label.querySelectorAll('input:not([type="hidden"]), select, textarea'));
-
-                    // If label contains more than one field, it's an error
-                    if (fieldsInLabel.length > 1) {
-                        results.errors.push({
-                            err: 'ErrLabelContainsMultipleFields',
-                            type: 'err',
-                            cat: 'forms',
-                            element: 'LABEL',
-                            xpath: getFullXPath(label),
-                            html: label.outerHTML.substring(0, 200),
-                            description: `Label contains ${fieldsInLabel.length} form fields. Each field should have its own label for clarity.`,
-                            fieldCount: fieldsInLabel.length,
-                            labelText: label.textContent.trim().substring(0, 100)
-                        });
-                        results.elements_failed++;
-                    }
-                });
-
-                // Check each input for labels
-                inputs.forEach(input => {
-                    const inputType = input.type || 'text';
-                    const inputName = input.name || '';
-                    const inputId = input.id || '';
-                    
-                    // Skip submit/reset/button inputs as they don't need labels
-                    if (['submit', 'reset', 'button'].includes(inputType)) {
-                        results.elements_passed++;
-                        return;
-                    }
-                    
-                    // Check for associated label
-                    let hasLabel = false;
-                    let labelText = '';
-                    let hasVisibleLabel = false;
-
-                    // Method 1: Check for label with for attribute
-                    if (inputId) {
-                        const label = document.querySelector(`label[for="${inputId}"]`);
-                        if (label) {
-                            hasLabel = true;
-                            hasVisibleLabel = true;
-                            labelText = label.textContent.trim();
-                        }
-                    }
-
-                    // Method 2: Check if input is inside a label
-                    if (!hasLabel) {
-                        const parentLabel = input.closest('label');
-                        if (parentLabel) {
-                            hasLabel = true;
-                            hasVisibleLabel = true;
-                            labelText = parentLabel.textContent.trim();
-                        }
-                    }
+        # Field and form names come from the browser's accessibility tree when it is available
+        snapshot = await get_ax_snapshot(page)
+        ax_names = snapshot.names_by_xpath(FORM_NAMED_TAGS) if snapshot else None
 
-                    // Method 3: Check for aria-label or aria-labelledby
-                    const ariaLabel = input.getAttribute('aria-label');
-                    const ariaLabelledby = input.getAttribute('aria-labelledby');
-
-                    if (ariaLabel !== null) {
-                        // Check if aria-label is empty
-                        const ariaLabelTrimmed = ariaLabel.trim();
-                        if (ariaLabelTrimmed === '') {
-                            // Empty aria-label - raise specific error
-                            results.errors.push({
-                                err: 'ErrEmptyAriaLabelOnField',
-                                type: 'err',
-                                cat: 'forms',
-                                element: input.tagName,
-                                xpath: getFullXPath(input),
-                                html: input.outerHTML.substring(0, 200),
-                                description: 'Form field has empty aria-label attribute',
-                                inputType: inputType
-                            });
-                            results.elements_failed++;
-                            return; // Skip further processing for this field
-                        }
-                        hasLabel = true;
-                        labelText = ariaLabelTrimmed;
-                    } else if (ariaLabelledby !== null) {
-                        // Check if aria-labelledby is empty
-                        const ariaLabelledbyTrimmed = ariaLabelledby.trim();
-                        if (ariaLabelledbyTrimmed === '') {
-                            // Empty aria-labelledby - raise specific error
-                            results.errors.push({
-                                err: 'ErrEmptyAriaLabelledByOnField',
-                                type: 'err',
-                                cat: 'forms',
-                                element: input.tagName,
-                                xpath: getFullXPath(input),
-                                html: input.outerHTML.substring(0, 200),
-                                description: 'Form field has empty aria-labelledby attribute',
-                                inputType: inputType
-                            });
-                            results.elements_failed++;
-                            return; // Skip further processing for this field
-                        }
-
-                        // aria-labelledby can reference multiple IDs (space-separated)
-                        const refIds = ariaLabelledbyTrimmed.split(/\s+/);
-                        let labelTexts = [];
-
-                        refIds.forEach(refId => {
-                            const labelElement = document.getElementById(refId);
-                            if (labelElement) {
-                                hasLabel = true;
-                                labelTexts.push(labelElement.textContent.trim());
-
-                                // Error if the referenced element is not a <label> element
-                                if (labelElement.tagName !== 'LABEL') {
-                                    results.errors.push({
-                                        err: 'ErrFielLabelledBySomethingNotALabel',
-                                        type: 'err',
-                                        cat: 'forms',
-                                        element: input.tagName,
-                                        xpath: getFullXPath(input),
-                                        html: input.outerHTML.substring(0, 200),
-                                        description: `Form field uses aria-labelledby to reference ${labelElement.tagName} (id="${refId}") instead of LABEL element`,
-                                        inputType: inputType,
-                                        referencedTag: labelElement.tagName,
-                                        referencedId: refId
-                                    });
-                                    results.elements_failed++;
-                                }
-                            } else {
-                                // Error: referenced element does not exist
-                                results.errors.push({
-                                    err: 'ErrFieldAriaRefDoesNotExist',
-                                    type: 'err',
-                                    cat: 'forms',
-                                    element: input.tagName,
-                                    xpath: getFullXPath(input),
-                                    html: input.outerHTML.substring(0, 200),
-                                    description: `Form field has aria-labelledby referencing non-existent ID: "${refId}"`,
-                                    inputType: inputType,
-                                    missingId: refId
-                                });
-                                results.elements_failed++;
-                            }
-                        });
-
-                        if (labelTexts.length > 0) {
-                            labelText = labelTexts.join(' ');
-                        }
-                    }
-                    
-                    // Check for placeholder misuse
-                    const placeholder = input.getAttribute('placeholder');
-                    const hasPlaceholder = placeholder && placeholder.trim().length > 0;
-                    
-                    if (!hasLabel) {
-                        // Check if only using placeholder
-                        if (hasPlaceholder) {
-                            results.errors.push({
-                                err: 'ErrPlaceholderAsLabel',
-                                type: 'err',
-                                cat: 'forms',
-                                element: input.tagName,
-                                xpath: getFullXPath(input),
-                                html: input.outerHTML.substring(0, 200),
-                                description: `Form input relies on placeholder text instead of proper label`,
-                                inputType: inputType,
-                                placeholder: placeholder
-                            });
-                            results.elements_failed++;
-                        } else {
-                            // ERROR: Form field has no accessible label
-                            // Field lacks all labeling methods:
-                            // - No <label> with matching for attribute
-                            // - Not wrapped in a <label> (implicit association)
-                            // - No aria-label attribute
-                            // - No aria-labelledby attribute
-                            // - No placeholder text (would trigger ErrPlaceholderAsLabel instead)
-                            results.errors.push({
-                                err: 'ErrNoLabel',
-                                type: 'err',
-                                cat: 'forms',
-                                element: input.tagName,
-                                xpath: getFullXPath(input),
-                                html: input.outerHTML.substring(0, 200),
-                                description: 'Form field has no accessible label. Field lacks proper label, aria-label, aria-labelledby, or placeholder. Screen readers will not provide context about what information to enter. Violates WCAG 1.3.1, 3.3.2, and 4.1.2.',
-                                inputType: inputType,
-                                inputName: inputName,
-                                inputId: inputId
-                            });
-                            results.elements_failed++;
-                        }
-                    } else if (!labelText || labelText.trim() === '') {
-                        results.errors.push({
-                            err: 'ErrEmptyLabel',
-                            type: 'err',
-                            cat: 'forms',
-                            element: input.tagName,
-                            xpath: getFullXPath(input),
-                            html: input.outerHTML.substring(0, 200),
-                            description: 'Form label exists but is empty',
-                            inputType: inputType
-                        });
-                        results.elements_failed++;
-                    } else {
-                        results.elements_passed++;
-
-                        // ERROR: Check if using aria-label without visible label
-                        if (ariaLabel && !hasVisibleLabel) {
-                            results.errors.push({
-                                err: 'ErrFieldLabelledUsingAriaLabel',
-                                type: 'err',
-                                cat: 'forms',
-                                element: input.tagName,
-                                xpath: getFullXPath(input),
-                                html: input.outerHTML.substring(0, 200),
-                                description: `Field uses aria-label="${ariaLabel}" without visible label`,
-                                ariaLabel: ariaLabel,
-                                inputType: inputType
-                            });
-                            results.elements_failed++;
-                        }
-
-                        // ERROR: Check for mismatch between visible label and accessible name
-                        // WCAG 2.5.3 - Label in Name requires that the visible label text be included
-                        // in the accessible name for speech input users
-                        if (hasVisibleLabel) {
-                            // Get visible label text
-                            let visibleLabelText = '';
-                            if (inputId) {
-                                const label = document.querySelector(`label[for="${inputId}"]`);
-                                if (label) {
-                                    visibleLabelText = label.textContent.trim();
-                                }
-                            }
-                            if (!visibleLabelText) {
-                                const parentLabel = input.closest('label');
-                                if (parentLabel) {
-                                    visibleLabelText = parentLabel.textContent.trim();
-                                }
-                            }
-
-                            // Only check for mismatch if we have aria-label or aria-labelledby
-                            // (which would override or supplement the visible label)
-                            if (visibleLabelText && (ariaLabel || ariaLabelledby)) {
-                                // Get the accessible name
-                                let accessibleName = '';
-
-                                if (ariaLabel) {
-                                    accessibleName = ariaLabel.trim();
-                                } else if (ariaLabelledby) {
-                                    const refIds = ariaLabelledby.trim().split(/\s+/);
-                                    let labelTexts = [];
-                                    refIds.forEach(refId => {
-                                        const labelElement = document.getElementById(refId);
-                                        if (labelElement) {
-                                            labelTexts.push(labelElement.textContent.trim());
-                                        }
-                                    });
-                                    accessibleName = labelTexts.join(' ');
-                                }
-
-                                // Check if visible label text is included in accessible name
-                                // Case-insensitive comparison for better matching
-                                const visibleLabelLower = visibleLabelText.toLowerCase();
-                                const accessibleNameLower = accessibleName.toLowerCase();
-
-                                // The visible label text should be present in the accessible name
-                                if (!accessibleNameLower.includes(visibleLabelLower)) {
-                                    results.errors.push({
-                                        err: 'ErrLabelMismatchOfAccessibleNameAndLabelText',
-                                        type: 'err',
-                                        cat: 'forms',
-                                        element: input.tagName,
-                                        xpath: getFullXPath(input),
-                                        html: input.outerHTML.substring(0, 200),
-                                        description: `Visible label "${visibleLabelText}" is not included in accessible name "${accessibleName}". Voice control users saying "click ${visibleLabelText}" will fail. WCAG 2.5.3 requires visible label text to be included in accessible name.`,
-                                        visibleLabel: visibleLabelText,
-                                        accessibleName: accessibleName,
-                                        inputType: inputType
-                                    });
-                                    results.elements_failed++;
-                                }
-                            }
-                        }
-
-                        // Check for required field indication
-                        if (input.hasAttribute('required') || input.getAttribute('aria-required') === 'true') {
-                            // Check if the label indicates it's required
-                            if (!labelText.includes('*') && !labelText.toLowerCase().includes('required')) {
-                                results.warnings.push({
-                                    err: 'WarnMissingRequiredIndication',
-                                    type: 'warn',
-                                    cat: 'forms',
-                                    element: input.tagName,
-                                    xpath: getFullXPath(input),
-                                    html: input.outerHTML.substring(0, 200),
-                                    description: 'Required field not clearly indicated in label',
-                                    label: labelText
-                                });
-                            }
-                        }
-                    }
-                });
-                
-                // Check for fieldset/legend for radio and checkbox groups
-                const radioGroups = {};
-                const checkboxGroups = {};
-                
-                // Group radio buttons by name
-                radioButtons.forEach(radio => {
-                    const name = radio.name;
-                    if (name) {
-                        if (!radioGroups[name]) {
-                            radioGroups[name] = [];
-                        }
-                        radioGroups[name].push(radio);
-                    }
-                });
-                
-                // Check each radio group for fieldset
-                Object.entries(radioGroups).forEach(([name, radios]) => {
-                    if (radios.length > 1) {
-                        const firstRadio = radios[0];
-                        const fieldset = firstRadio.closest('fieldset');
-                        
-                        if (!fieldset) {
-                            results.warnings.push({
-                                err: 'WarnNoFieldset',
-                                type: 'warn',
-                                cat: 'forms',
-                                element: 'RADIO_GROUP',
-                                xpath: getFullXPath(firstRadio),
-                                html: firstRadio.outerHTML.substring(0, 200),
-                                description: `Radio button group "${name}" should be wrapped in a fieldset with legend`,
-                                groupName: name,
-                                groupSize: radios.length
-                            });
-                        } else {
-                            const legend = fieldset.querySelector('legend');
-                            if (!legend || !legend.textContent.trim()) {
-                                results.warnings.push({
-                                    err: 'WarnNoLegend',
-                                    type: 'warn',
-                                    cat: 'forms',
-                                    element: 'FIELDSET',
-                                    xpath: getFullXPath(fieldset),
-                                    html: fieldset.outerHTML.substring(0, 200),
-                                    description: 'Fieldset is missing a legend element',
-                                    groupName: name
-                                });
-                            }
-                        }
-                    }
-                });
-                
-                // Add check information for reporting
-                results.checks.push({
-                    description: 'Form input labeling',
-                    wcag: ['1.3.1', '3.3.2', '4.1.2'],
-                    total: inputs.length,
-                    passed: results.elements_passed,
-                    failed: results.elements_failed
-                });
-                
-                if (Object.keys(radioGroups).length > 0) {
-                    const groupsWithFieldset = Object.values(radioGroups).filter(radios => 
-                        radios.length > 1 && radios[0].closest('fieldset')
-                    ).length;
-                    const totalGroups = Object.values(radioGroups).filter(radios => radios.length > 1).length;
-                    
-                    results.checks.push({
-                        description: 'Radio button grouping',
-                        wcag: ['1.3.1'],
-                        total: totalGroups,
-                        passed: groupsWithFieldset,
-                        failed: totalGroups - groupsWithFieldset
-                    });
-                }
-
-                // ERROR: Check for orphan labels without proper associations
-                // A label is orphaned if:
-                // 1. It has no 'for' attribute at all
-                // 2. It has an empty 'for' attribute (for="" or for="   ")
-                // 3. It doesn't wrap a form control (implicit association)
-                const allLabelsToCheck = Array.from(document.querySelectorAll('label'));
-                allLabelsToCheck.forEach(label => {
-                    const forAttr = label.getAttribute('for');
-
-                    // Check if label has no for attribute or empty/whitespace for attribute
-                    const hasNoFor = forAttr === null;
-                    const hasEmptyFor = forAttr !== null && forAttr.trim() === '';
-
-                    if (hasNoFor || hasEmptyFor) {
-                        // Check if label wraps a form control (implicit association)
-                        const wrappedControl = label.querySelector('input, select, textarea, button');
-
-                        // If no wrapped control, it's an orphan label
-                        if (!wrappedControl) {
-                            results.errors.push({
-                                err: 'ErrOrphanLabelWithNoId',
-                                type: 'err',
-                                cat: 'forms',
-                                element: 'LABEL',
-                                xpath: getFullXPath(label),
-                                html: label.outerHTML.substring(0, 200),
-                                description: hasEmptyFor
-                                    ? 'Label has empty for attribute and does not wrap a form control. Label cannot be programmatically associated with any field.'
-                                    : 'Label has no for attribute and does not wrap a form control. Label is orphaned and cannot be programmatically associated with any field.',
-                                labelText: label.textContent.trim(),
-                                hasEmptyFor: hasEmptyFor
-                            });
-                            results.elements_failed++;
-                        }
-                    }
-                });
-
-                // ERROR: Check for labels with for attribute referencing non-existent fields
-                const allLabels = Array.from(document.querySelectorAll('label[for]'));
-                allLabels.forEach(label => {
-                    const forId = label.getAttribute('for');
-                    if (forId) {
-                        const referencedField = document.getElementById(forId);
-                        if (!referencedField) {
-                            results.errors.push({
-                                err: 'ErrFieldReferenceDoesNotExist',
-                                type: 'err',
-                                cat: 'forms',
-                                element: 'LABEL',
-                                xpath: getFullXPath(label),
-                                html: label.outerHTML.substring(0, 200),
-                                description: `Label for attribute references non-existent field ID: "${forId}"`,
-                                forId: forId,
-                                labelText: label.textContent.trim()
-                            });
-                            results.elements_failed++;
-                        }
-                    }
-                });
-
-                // WARNING: Check for form landmarks with "form" in their accessible name
-                // Screen readers already announce "form" as the role, so including "form"
-                // in the label creates redundant announcements like "Login form form"
-                // Best practice: use "Login" not "Login form"
-                const allFormsForLabelCheck = Array.from(document.querySelectorAll('form'));
-                allFormsForLabelCheck.forEach(form => {
-                    const ariaLabel = form.getAttribute('aria-label');
-                    const ariaLabelledby = form.getAttribute('aria-labelledby');
-
-                    let accessibleName = '';
-                    let accessibleNameOriginal = '';
-
-                    // Get accessible name from aria-label
-                    if (ariaLabel) {
-                        accessibleNameOriginal = ariaLabel.trim();
-                        accessibleName = accessibleNameOriginal.toLowerCase();
-                    }
-                    // Get accessible name from aria-labelledby
-                    else if (ariaLabelledby) {
-                        const refIds = ariaLabelledby.trim().split(/\\s+/);
-                        let labelTexts = [];
-                        refIds.forEach(refId => {
-                            const labelElement = document.getElementById(refId);
-                            if (labelElement) {
-                                labelTexts.push(labelElement.textContent.trim());
-                            }
-                        });
-                        accessibleNameOriginal = labelTexts.join(' ');
-                        accessibleName = accessibleNameOriginal.toLowerCase();
-                    }
-
-                    // Check if accessible name contains the word "form"
-                    // Use word boundary regex to match "form" as a whole word
-                    if (accessibleName && /\\bform\\b/.test(accessibleName)) {
-                        results.warnings.push({
-                            err: 'WarnFormLandmarkAccessibleNameUsesForm',
-                            type: 'warn',
-                            cat: 'forms',
-                            element: 'FORM',
-                            xpath: getFullXPath(form),
-                            html: form.outerHTML.substring(0, 200),
-                            description: `Form landmark has "${accessibleNameOriginal}" as accessible name which includes redundant word "form". Screen readers already announce "form" role. Use descriptive label without "form" (e.g., "Login" instead of "Login form").`,
-                            accessibleName: accessibleNameOriginal,
-                            ariaLabel: ariaLabel || null,
-                            ariaLabelledby: ariaLabelledby || null
-                        });
-                        results.elements_warned++;
-                    }
-                });
-
-                // DISCOVERY: Report all forms on the page for manual review
-                // (Empty forms check moved to before early return at top of script)
-                const allFormsDiscovery = Array.from(document.querySelectorAll('form'));
-                allFormsDiscovery.forEach(form => {
-                    // Generate a content-based signature for the form
-                    // This allows identifying the same form across different pages/xpaths
-                    const formSignatureData = [];
-
-                    // Include form attributes
-                    const action = form.getAttribute('action') || '';
-                    const method = (form.getAttribute('method') || 'get').toLowerCase();
-                    formSignatureData.push(`action:${action}`);
-                    formSignatureData.push(`method:${method}`);
-
-                    // Include form field structure (type and name of each input)
-                    const formFields = Array.from(form.querySelectorAll('input, select, textarea, button'))
-                        .map(field => {
-                            const type = field.type || field.tagName.toLowerCase();
-                            const name = field.name || field.id || '';
-                            return `${type}:${name}`;
-                        })
-                        .sort(); // Sort for consistency
-
-                    formSignatureData.push(...formFields);
-
-                    // Create signature string and generate simple hash (CRC-like)
-                    const signatureString = formSignatureData.join('|');
-
-                    // Simple hash function (similar to CRC concept)
-                    let hash = 0;
-                    for (let i = 0; i < signatureString.length; i++) {
-                        const char = signatureString.charCodeAt(i);
-                        hash = ((hash << 5) - hash) + char;
-                        hash = hash & hash; // Convert to 32bit integer
-                    }
-                    const formSignature = Math.abs(hash).toString(16).padStart(8, '0');
-
-                    // Check if form has search role or is contained within search landmark
-                    const formRole = form.getAttribute('role');
-                    const isSearchRole = formRole === 'search';
-                    const searchContainer = form.closest('[role="search"]');
-                    const isWithinSearch = searchContainer !== null && searchContainer !== form;
-                    const isSearchForm = isSearchRole || isWithinSearch;
-
-                    // Count form fields by type
-                    const fieldCounts = {};
-                    Array.from(form.querySelectorAll('input, select, textarea')).forEach(field => {
-                        const type = field.type || field.tagName.toLowerCase();
-                        fieldCounts[type] = (fieldCounts[type] || 0) + 1;
-                    });
-
-                    const fieldSummary = Object.entries(fieldCounts)
-                        .map(([type, count]) => `${count} ${type}`)
-                        .join(', ');
-
-                    // Build description with search context
-                    let description = `Form detected (signature: ${formSignature})`;
-                    if (isSearchRole) {
-                        description += ` with role="search"`;
-                    } else if (isWithinSearch) {
-                        description += ` contained within search landmark`;
-                    }
-                    description += ` with ${fieldSummary || 'no fields'} - requires manual accessibility review`;
-
-                    results.warnings.push({
-                        err: 'DiscoFormOnPage',
-                        type: 'disco',
-                        cat: 'forms',
-                        element: 'form',
-                        xpath: getFullXPath(form),
-                        html: form.outerHTML.substring(0, 200),
-                        description: description,
-                        formSignature: formSignature,
-                        formAction: action,
-                        formMethod: method,
-                        fieldCount: Object.values(fieldCounts).reduce((a, b) => a + b, 0),
-                        fieldTypes: fieldCounts,
-                        isSearchForm: isSearchForm,
-                        searchContext: isSearchRole ? 'has role="search"' : (isWithinSearch ? 'within search landmark' : 'not a search form'),
-                        pageLang: pageLang
-                    });
-                });
-
-                // DISCOVERY: Check for forms without visible submit buttons
-                const allFormsSubmitCheck = Array.from(document.querySelectorAll('form'));
-                allFormsSubmitCheck.forEach(form => {
-                    // Check for submit buttons: <button> (defaults to type=submit), <button type="submit">, <input type="submit">, <input type="image">
-                    const submitButtons = form.querySelectorAll('button:not([type]), button[type="submit"], input[type="submit"], input[type="image"]');
-
-                    // Filter for visible submit buttons
-                    const visibleSubmitButtons = Array.from(submitButtons).filter(button => {
-                        const style = window.getComputedStyle(button);
-                        return style.display !== 'none' &&
-                               style.visibility !== 'hidden' &&
-                               style.opacity !== '0' &&
-                               button.offsetWidth > 0 &&
-                               button.offsetHeight > 0;
-                    });
-
-                    // If no visible submit button, report as discovery issue
-                    if (visibleSubmitButtons.length === 0) {
-                        results.warnings.push({
-                            err: 'DiscoNoSubmitButton',
-                            type: 'disco',
-                            cat: 'forms',
-                            element: 'FORM',
-                            xpath: getFullXPath(form),
-                            html: form.outerHTML.substring(0, 200),
-                            description: 'Form has no visible submit button. Users may not understand how to submit the form. Verify that form submission mechanism is clear (e.g., Enter key works, or auto-submit is clearly communicated).'
-                        });
-                    }
-                });
-
-                return results;
-            }
-        ''')
+        # Execute JavaScript to analyze forms
+        results = await run_touchpoint_script(page, 'forms', ax_names)
 
         # TEST INPUT FIELD FOCUS INDICATORS
         # Extract focus styles from stylesheets for text input fields
-        input_styles = await page.evaluate('''
-            () => {
-                const inputs = [];
-                const fields = document.querySelectorAll('input[type="text"], input[type="email"], input[type="password"], input[type="search"], input[type="tel"], input[type="url"], input[type="number"], textarea, input:not([type])');
-
-                function getFullXPath(element) {
-                    if (!element) return '';
-                    function getElementIdx(el) {
-                        let count = 1;
-                        for (let sib = el.previousSibling; sib; sib = sib.previousSibling) {
-                            if (sib.nodeType === 1 && sib.tagName === el.tagName) count++;
-                        }
-                        return count;
-                    }
-                    let path = '';
-                    while (element && element.nodeType === 1) {
-                        const idx = getElementIdx(element);
-                        const tagName = element.tagName.toLowerCase();
-                        path = `/${tagName}[${idx}]${path}`;
-                        element = element.parentNode;
-                    }
-                    return path;
-                }
-
-                function getComputedStyleValue(element, property) {
-                    try {
-                        return window.getComputedStyle(element).getPropertyValue(property);
-                    } catch (e) {
-                        return '';
-                    }
-                }
-
-                function getEffectiveBackgroundColor(element) {
-                    let currentElement = element;
-                    let backgroundColor = 'rgba(0, 0, 0, 0)';
-                    let stoppedAtZIndex = false;
-
-                    while (currentElement) {
-                        const style = window.getComputedStyle(currentElement);
-                        const currentBg = style.backgroundColor;
-
-                        // Check if this element has z-index
-                        const zIndex = style.zIndex;
-                        const position = style.position;
-                        const hasZIndex = (zIndex !== 'auto' && position !== 'static');
-
-                        // If we found a solid background, use it
-                        if (currentBg !== 'rgba(0, 0, 0, 0)') {
-                            backgroundColor = currentBg;
-                            // Only mark as stopped at z-index if this element with solid bg also has z-index
-                            if (hasZIndex) {
-                                // Check if background is transparent or semi-transparent
-                                const rgba = currentBg.match(/rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([\d.]+))?\)/);
-                                if (rgba) {
-                                    const alpha = rgba[4] !== undefined ? parseFloat(rgba[4]) : 1.0;
-                                    if (alpha < 1.0) {
-                                        stoppedAtZIndex = true;
-                                    }
-                                }
-                            }
-                            break;
-                        }
-
-                        // If we hit z-index without finding background, that's a problem
-                        if (hasZIndex) {
-                            stoppedAtZIndex = true;
-                            break;
-                        }
-
-                        currentElement = currentElement.parentElement;
-                    }
-
-                    // Default to white if no background found
-                    if (backgroundColor === 'rgba(0, 0, 0, 0)') {
-                        backgroundColor = 'rgb(255, 255, 255)';
-                    }
-
-                    return {
-                        backgroundColor: backgroundColor,
-                        stoppedAtZIndex: stoppedAtZIndex
-                    };
-                }
-
-                fields.forEach((field, index) => {
-                    const normalStyle = window.getComputedStyle(field);
-
-                    // Extract focus styles from stylesheets (don't actually focus!)
-                    let focusOutlineStyle = null;
-                    let focusOutlineWidth = null;
-                    let focusOutlineColor = null;
-                    let focusOutlineOffset = null;
-                    let focusBorderWidth = null;
-                    let focusBorderTopWidth = null;
-                    let focusBorderRightWidth = null;
-                    let focusBorderBottomWidth = null;
-                    let focusBorderLeftWidth = null;
-                    let focusBorderColor = null;
-                    let focusBorderTopColor = null;
-                    let focusBoxShadow = null;
-
-                    // Check all stylesheets for :focus rules
-                    const sheets = Array.from(document.styleSheets);
-                    for (const sheet of sheets) {
-                        try {
-                            const rules = Array.from(sheet.cssRules || sheet.rules || []);
-                            for (const rule of rules) {
-                                if (rule.selectorText && rule.selectorText.includes(':focus')) {
-                                    const selector = rule.selectorText.replace(':focus', '');
-                                    try {
-                                        if (field.matches(selector)) {
-                                            if (rule.style.outlineStyle !== undefined && rule.style.outlineStyle !== '') {
-                                                focusOutlineStyle = rule.style.outlineStyle;
-                                            }
-                                            if (rule.style.outlineWidth !== undefined && rule.style.outlineWidth !== '') {
-                                                focusOutlineWidth = rule.style.outlineWidth;
-                                            }
-                                            if (rule.style.outlineColor !== undefined && rule.style.outlineColor !== '') {
-                                                focusOutlineColor = rule.style.outlineColor;
-                                            }
-                                            if (rule.style.outlineOffset !== undefined && rule.style.outlineOffset !== '') {
-                                                focusOutlineOffset = rule.style.outlineOffset;
-                                            }
-                                            if (rule.style.outline !== undefined && rule.style.outline !== '') {
-                                                const outlineValue = rule.style.outline;
-                                                if (outlineValue === 'none' || outlineValue === '0') {
-                                                    focusOutlineStyle = 'none';
-                                                    focusOutlineWidth = '0px';
-                                                } else {
-                                                    // Parse outline shorthand: "2px solid #0066cc" or "3px solid rgba(0, 102, 204, 0.3)"
-                                                    // Note: Browser may return it in different orders like "rgba(...) solid 3px"
-                                                    const parts = outlineValue.split(' ');
-
-                                                    // Try to find width, style, and color from any position
-                                                    for (let part of parts) {
-                                                        if (part.includes('px') || part.includes('em') || part.includes('rem')) {
-                                                            focusOutlineWidth = part;
-                                                        } else if (['solid', 'dotted', 'dashed', 'double'].includes(part)) {
-                                                            focusOutlineStyle = part;
-                                                        }
-                                                    }
-
-                                                    // Everything that's not width or style is probably color (may have commas/spaces)
-                                                    // Get the full color by filtering out width and style
-                                                    const colorParts = parts.filter(p =>
-                                                        !p.match(/^\d+(\.\d+)?(px|em|rem)$/) &&
-                                                        !['solid', 'dotted', 'dashed', 'double'].includes(p)
-                                                    );
-                                                    if (colorParts.length > 0) {
-                                                        focusOutlineColor = colorParts.join(' ');
-                                                    }
-                                                }
-                                            }
-                                            if (rule.style.borderWidth !== undefined && rule.style.borderWidth !== '') {
-                                                focusBorderWidth = rule.style.borderWidth;
-                                            }
-                                            if (rule.style.borderTopWidth !== undefined && rule.style.borderTopWidth !== '') {
-                                                focusBorderTopWidth = rule.style.borderTopWidth;
-                                            }
-                                            if (rule.style.borderRightWidth !== undefined && rule.style.borderRightWidth !== '') {
-                                                focusBorderRightWidth = rule.style.borderRightWidth;
-                                            }
-                                            if (rule.style.borderBottomWidth !== undefined && rule.style.borderBottomWidth !== '') {
-                                                focusBorderBottomWidth = rule.style.borderBottomWidth;
-                                            }
-                                            if (rule.style.borderLeftWidth !== undefined && rule.style.borderLeftWidth !== '') {
-                                                focusBorderLeftWidth = rule.style.borderLeftWidth;
-                                            }
-                                            if (rule.style.borderColor !== undefined && rule.style.borderColor !== '') {
-                                                focusBorderColor = rule.style.borderColor;
-                                            }
-                                            if (rule.style.borderTopColor !== undefined && rule.style.borderTopColor !== '') {
-                                                focusBorderTopColor = rule.style.borderTopColor;
-                                            }
-                                            if (rule.style.boxShadow !== undefined && rule.style.boxShadow !== '') {
-                                                focusBoxShadow = rule.style.boxShadow;
-                                            }
-                                            if (rule.style.border !== undefined && rule.style.border !== '') {
-                                                const borderValue = rule.style.border;
-                                                const parts = borderValue.split(' ');
-                                                if (parts.length >= 1) focusBorderWidth = parts[0];
-                                                if (parts.length >= 3) focusBorderColor = parts[2];
-                                            }
-                                        }
-                                    } catch (e) {
-                                        // Selector might not be valid
-                                    }
-                                }
-                            }
-                        } catch (e) {
-                            // Cross-origin stylesheet
-                        }
-                    }
-
-                    // Get parent information for outline contrast checking
-                    const parentElement = field.parentElement;
-                    const parentBgInfo = parentElement ? getEffectiveBackgroundColor(parentElement) : {backgroundColor: 'rgb(255, 255, 255)', stoppedAtZIndex: false};
-                    const parentStyle = parentElement ? window.getComputedStyle(parentElement) : null;
-
-                    // Get bounds for outline extent checking
-                    const fieldBounds = field.getBoundingClientRect();
-                    const parentBounds = parentElement ? parentElement.getBoundingClientRect() : null;
-
-                    // Check if input has z-index
-                    const inputHasZIndex = (normalStyle.zIndex !== 'auto' && normalStyle.position !== 'static');
-
-                    inputs.push({
-                        index,
-                        tag: field.tagName.toLowerCase(),
-                        type: field.type || 'text',
-                        id: field.id || '',
-                        className: field.className || '',
-                        name: field.name || '',
-                        xpath: getFullXPath(field),
-                        html: field.outerHTML.substring(0, 200),
-                        normalOutlineStyle: normalStyle.outlineStyle,
-                        normalOutlineWidth: normalStyle.outlineWidth,
-                        normalOutlineColor: normalStyle.outlineColor,
-                        normalBorderWidth: normalStyle.borderWidth,
-                        normalBorderTopWidth: normalStyle.borderTopWidth,
-                        normalBorderRightWidth: normalStyle.borderRightWidth,
-                        normalBorderBottomWidth: normalStyle.borderBottomWidth,
-                        normalBorderLeftWidth: normalStyle.borderLeftWidth,
-                        normalBorderColor: normalStyle.borderColor,
-                        normalBorderTopColor: normalStyle.borderTopColor,
-                        normalBoxShadow: normalStyle.boxShadow,
-                        backgroundColor: normalStyle.backgroundColor,
-                        backgroundImage: normalStyle.backgroundImage,
-                        fullBackground: normalStyle.background,
-                        fontSize: normalStyle.fontSize,
-                        focusOutlineStyle,
-                        focusOutlineWidth,
-                        focusOutlineColor,
-                        focusOutlineOffset,
-                        focusBorderWidth,
-                        focusBorderTopWidth,
-                        focusBorderRightWidth,
-                        focusBorderBottomWidth,
-                        focusBorderLeftWidth,
-                        focusBorderColor,
-                        focusBorderTopColor,
-                        focusBoxShadow,
-                        // Parent information for outline contrast checking
-                        parentBackgroundColor: parentBgInfo.backgroundColor,
-                        parentBgStoppedAtZIndex: parentBgInfo.stoppedAtZIndex,
-                        parentBackgroundImage: parentStyle ? parentStyle.backgroundImage : 'none',
-                        parentFullBackground: parentStyle ? parentStyle.background : 'none',
-                        // Bounds for outline extent checking
-                        inputBounds: {
-                            top: fieldBounds.top,
-                            right: fieldBounds.right,
-                            bottom: fieldBounds.bottom,
-                            left: fieldBounds.left,
-                            width: fieldBounds.width,
-                            height: fieldBounds.height
-                        },
-                        parentBounds: parentBounds ? {
-                            top: parentBounds.top,
-                            right: parentBounds.right,
-                            bottom: parentBounds.bottom,
-                            left: parentBounds.left,
-                            width: parentBounds.width,
-                            height: parentBounds.height
-                        } : null,
-                        // Z-index detection
-                        inputHasZIndex: inputHasZIndex
-                    });
-                });
-
-                return inputs;
-            }
-        ''')
+        input_styles = await run_touchpoint_script(page, 'forms_input_styles')
 
         # Process input focus indicators (Python logic)
         if input_styles:
@@ -1069,24 +88,32 @@ async def test_forms(page) -> Dict[str, Any]:
                     return float(value.replace('px', ''))
                 except: return 0
 
-            def parse_color(color_str):
-                if not color_str: return {'r': 0, 'g': 0, 'b': 0, 'a': 1}
-                rgba_match = re.match(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([\d.]+))?\)', color_str)
-                if rgba_match:
-                    return {'r': int(rgba_match.group(1)), 'g': int(rgba_match.group(2)),
-                            'b': int(rgba_match.group(3)),
-                            'a': float(rgba_match.group(4)) if rgba_match.group(4) else 1.0}
-                return {'r': 0, 'g': 0, 'b': 0, 'a': 1}
-
-            def get_contrast_ratio(color1, color2):
-                def luminance(c):
-                    def adjust(val):
-                        val = val / 255.0
-                        return val / 12.92 if val <= 0.03928 else ((val + 0.055) / 1.055) ** 2.4
-                    return 0.2126 * adjust(c['r']) + 0.7152 * adjust(c['g']) + 0.0722 * adjust(c['b'])
-                l1 = luminance(color1)
-                l2 = luminance(color2)
-                return (max(l1, l2) + 0.05) / (min(l1, l2) + 0.05)
+            def border_colors(field):
+                """Normal and focus border colors (no focus color means no change)"""
+                normal = field.get('normalBorderColor') or field.get('normalBorderTopColor')
+                focus = field.get('focusBorderColor') or field.get('focusBorderTopColor') or normal
+                return normal, focus
+
+            def shadow_color(box_shadow):
+                """Color of a computed box-shadow, or None"""
+                match = re.search(r'rgba?\([^)]*\)', box_shadow or '')
+                return match.group(0) if match else None
+
+            def indicator_pairs(field):
+                """Every (indicator, background) pair the contrast checks may need"""
+                normal_border, focus_border = border_colors(field)
+                yield focus_border, field.get('backgroundColor')
+                yield focus_border, normal_border
+                if field.get('focusOutlineColor'):
+                    yield field['focusOutlineColor'], field.get('parentBackgroundColor', field.get('backgroundColor'))
+                    yield field['focusOutlineColor'], field.get('backgroundColor')
+                if shadow_color(field.get('focusBoxShadow')):
+                    yield shadow_color(field.get('focusBoxShadow')), field.get('backgroundColor')
+
+            # Focus indicator contrast for every field in one batch
+            focus_contrast = indicator_contrast(
+                pair for field in input_styles for pair in indicator_pairs(field)
+            )
 
             def has_gradient_background(bg_string):
                 if not bg_string or bg_string == 'none':
@@ -1117,10 +144,8 @@ async def test_forms(page) -> Dict[str, Any]:
                 if border_thickness_change < 1.0:
                     return issues
 
-                # Parse colors
-                focus_border_color = parse_color(field.get('focusBorderColor'))
-                normal_border_color = parse_color(field.get('normalBorderColor'))
-                input_bg_color = parse_color(field.get('backgroundColor'))
+                normal_border_color, focus_border_color = border_colors(field)
+                focus_border_alpha = parse_color(focus_border_color)[3]
 
                 # Check for gradient/image background
                 if has_gradient_background(field.get('fullBackground', 'none')) or has_gradient_background(field.get('backgroundImage', 'none')):
@@ -1132,15 +157,15 @@ async def test_forms(page) -> Dict[str, Any]:
                     return issues
 
                 # Check transparency
-                if focus_border_color['a'] < 0.5:
-                    issues.append(('WarnInputTransparentFocus', f'Input focus border is semi-transparent (alpha={focus_border_color["a"]:.2f})'))
+                if focus_border_alpha < 0.5:
+                    issues.append(('WarnInputTransparentFocus', f'Input focus border is semi-transparent (alpha={focus_border_alpha:.2f})'))
                     return issues
 
                 # Calculate contrast against input background
-                contrast_vs_bg = get_contrast_ratio(focus_border_color, input_bg_color)
+                contrast_vs_bg = focus_contrast[(focus_border_color, field.get('backgroundColor'))]
 
                 # Calculate contrast against old border
-                contrast_vs_old_border = get_contrast_ratio(focus_border_color, normal_border_color)
+                contrast_vs_old_border = focus_contrast[(focus_border_color, normal_border_color)]
 
                 # Report worst case
                 min_contrast = min(contrast_vs_bg, contrast_vs_old_border)
@@ -1234,16 +259,16 @@ async def test_forms(page) -> Dict[str, Any]:
 
                 # Calculate contrast against solid background
                 if check_solid_contrast:
-                    outline_color = parse_color(field.get('focusOutlineColor'))
-                    bg_color = parse_color(compare_bg)
+                    outline_color = field.get('focusOutlineColor')
+                    outline_alpha = parse_color(outline_color)[3]
 
                     # Check transparency
-                    if outline_color['a'] < 0.5:
-                        issues.append(('WarnInputTransparentFocus', f'Input focus outline is semi-transparent (alpha={outline_color["a"]:.2f})'))
+                    if outline_alpha < 0.5:
+                        issues.append(('WarnInputTransparentFocus', f'Input focus outline is semi-transparent (alpha={outline_alpha:.2f})'))
                         return issues
 
                     # Calculate contrast
-                    contrast = get_contrast_ratio(outline_color, bg_color)
+                    contrast = focus_contrast[(outline_color, compare_bg)]
 
                     if contrast < 3.0:
                         bg_type = "parent background" if outline_offset > 0 else "input background"
@@ -1286,11 +311,7 @@ async def test_forms(page) -> Dict[str, Any]:
                     focus_border_left - normal_border_left
                 )
 
-                normal_border_color = field['normalBorderColor'] or field['normalBorderTopColor']
-                focus_border_color = field['focusBorderColor'] or field['focusBorderTopColor']
-                # If focus border color is None, it means no change (use normal color)
-                if focus_border_color is None:
-                    focus_border_color = normal_border_color
+                normal_border_color, focus_border_color = border_colors(field)
                 border_color_changed = normal_border_color != focus_border_color
 
                 normal_box_shadow = field['normalBoxShadow']
@@ -1361,20 +382,15 @@ async def test_forms(page) -> Dict[str, Any]:
 
                 # Check box-shadow contrast (existing logic - keep as-is for box-shadow-only cases)
                 elif box_shadow_changed and focus_box_shadow and not has_gradient:
-                    bg_color = parse_color(field['backgroundColor'])
                     # Check box-shadow contrast AND transparency
-                    # Try to match rgba first, then rgb
-                    shadow_color_match = re.search(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([0-9.]+))?\)', focus_box_shadow)
-                    if shadow_color_match:
-                        shadow_color = {'r': int(shadow_color_match.group(1)),
-                                      'g': int(shadow_color_match.group(2)),
-                                      'b': int(shadow_color_match.group(3)),
-                                      'a': float(shadow_color_match.group(4)) if shadow_color_match.group(4) else 1.0}
+                    focus_shadow_color = shadow_color(focus_box_shadow)
+                    if focus_shadow_color:
+                        shadow_alpha = parse_color(focus_shadow_color)[3]
                         # Check transparency
-                        if shadow_color['a'] < 0.5:
-                            issues_found.append(('WarnInputTransparentFocus', None, {'alpha': shadow_color['a']}))
+                        if shadow_alpha < 0.5:
+                            issues_found.append(('WarnInputTransparentFocus', None, {'alpha': shadow_alpha}))
                         # Check contrast
-                        contrast = get_contrast_ratio(shadow_color, bg_color)
+                        contrast = focus_contrast[(focus_shadow_color, field.get('backgroundColor'))]
                         if contrast < 3.0:
                             issues_found.append(('ErrInputFocusContrastFail', f'Input focus box-shadow has insufficient contrast ({contrast:.2f}:1)'))
 
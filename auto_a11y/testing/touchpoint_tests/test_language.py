@@ -7,6 +7,8 @@ from typing import Dict, Any, List, Set
 import logging
 import re
 
+from auto_a11y.testing.touchpoint_bundle import run_touchpoint_script
+
 logger = logging.getLogger(__name__)
 
 # ISO 639-1 two-letter language codes (most widely supported)
@@ -158,81 +160,7 @@ async def test_language(page) -> Dict[str, Any]:
     """
     try:
         # Get HTML element lang/xml:lang attributes, elements with lang, and elements with hreflang
-        lang_data = await page.evaluate('''
-            () => {
-                const htmlElement = document.querySelector('html');
-                const htmlLang = htmlElement ? htmlElement.getAttribute('lang') : null;
-                const htmlHasLang = htmlElement ? htmlElement.hasAttribute('lang') : false;
-                const htmlXmlLang = htmlElement ? htmlElement.getAttribute('xml:lang') : null;
-                const htmlHasXmlLang = htmlElement ? htmlElement.hasAttribute('xml:lang') : false;
-
-                // Get all elements with lang attribute (excluding html element)
-                const elementsWithLang = Array.from(document.querySelectorAll('[lang]'))
-                    .filter(el => el !== htmlElement)
-                    .map(el => ({
-                        tagName: el.tagName,
-                        lang: el.getAttribute('lang'),
-                        xmlLang: el.getAttribute('xml:lang'),
-                        hasXmlLang: el.hasAttribute('xml:lang'),
-                        xpath: getXPath(el),
-                        html: el.outerHTML.substring(0, 200)
-                    }));
-
-                // Get all elements with hreflang attribute
-                const elementsWithHreflang = Array.from(document.querySelectorAll('[hreflang]'))
-                    .map(el => ({
-                        tagName: el.tagName,
-                        hreflang: el.getAttribute('hreflang'),
-                        xpath: getXPath(el),
-                        html: el.outerHTML.substring(0, 200),
-                        isLink: el.tagName === 'A' || el.tagName === 'LINK' || el.tagName === 'AREA'
-                    }));
-
-                // Simple XPath generator
-                function getXPath(element) {
-                    if (!element || element.nodeType !== 1) {
-                        return '';
-                    }
-                    if (element.id) {
-                        return `//*[@id="${element.id}"]`;
-                    }
-                    if (element === document.documentElement) {
-                        return '/html';
-                    }
-                    if (element === document.body) {
-                        return '/html/body';
-                    }
-                    if (!element.parentNode) {
-                        return '';
-                    }
-                    let ix = 0;
-                    const siblings = element.parentNode.childNodes;
-                    for (let i = 0; i < siblings.length; i++) {
-                        const sibling = siblings[i];
-                        if (sibling === element) {
-                            const parentPath = getXPath(element.parentNode);
-                            if (!parentPath) {
-                                return '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                            }
-                            return parentPath + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                        }
-                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                            ix++;
-                        }
-                    }
-                    return '';
-                }
-
-                return {
-                    htmlHasLang: htmlHasLang,
-                    htmlLang: htmlLang,
-                    htmlHasXmlLang: htmlHasXmlLang,
-                    htmlXmlLang: htmlXmlLang,
-                    elementsWithLang: elementsWithLang,
-                    elementsWithHreflang: elementsWithHreflang
-                };
-            }
-        ''')
+        lang_data = await run_touchpoint_script(page, 'language')
 
         results = {
             'applicable': True,
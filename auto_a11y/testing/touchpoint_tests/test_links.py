@@ -20,6 +20,10 @@ import logging
 import re
 from typing import Dict, Any, Optional
 
+from auto_a11y.testing.ax_snapshot import get_ax_snapshot
+from auto_a11y.testing.color_math import indicator_contrast, parse_color
+from auto_a11y.testing.touchpoint_bundle import run_touchpoint_script
+
 logger = logging.getLogger(__name__)
 
 TEST_DOCUMENTATION = {
@@ -40,55 +44,6 @@ TEST_DOCUMENTATION = {
 }
 
 
-def parse_color(color_str: str) -> Dict[str, float]:
-    """Parse CSS color string to RGBA dict"""
-    if not color_str or color_str == 'transparent':
-        return {'r': 0, 'g': 0, 'b': 0, 'a': 0}
-
-    rgba_match = re.match(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*([\d.]+))?\)', color_str)
-    if rgba_match:
-        return {
-            'r': int(rgba_match.group(1)),
-            'g': int(rgba_match.group(2)),
-            'b': int(rgba_match.group(3)),
-            'a': float(rgba_match.group(4)) if rgba_match.group(4) else 1.0
-        }
-
-    hex_match = re.match(r'^#([0-9a-f]{6})$', color_str, re.IGNORECASE)
-    if hex_match:
-        hex_val = hex_match.group(1)
-        return {
-            'r': int(hex_val[0:2], 16),
-            'g': int(hex_val[2:4], 16),
-            'b': int(hex_val[4:6], 16),
-            'a': 1.0
-        }
-
-    return {'r': 0, 'g': 0, 'b': 0, 'a': 1.0}
-
-
-def get_luminance(color: Dict[str, float]) -> float:
-    """Calculate relative luminance"""
-    r_srgb = color['r'] / 255.0
-    g_srgb = color['g'] / 255.0
-    b_srgb = color['b'] / 255.0
-
-    r = r_srgb / 12.92 if r_srgb <= 0.03928 else ((r_srgb + 0.055) / 1.055) ** 2.4
-    g = g_srgb / 12.92 if g_srgb <= 0.03928 else ((g_srgb + 0.055) / 1.055) ** 2.4
-    b = b_srgb / 12.92 if b_srgb <= 0.03928 else ((b_srgb + 0.055) / 1.055) ** 2.4
-
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-
-def get_contrast_ratio(color1: Dict[str, float], color2: Dict[str, float]) -> float:
-    """Calculate contrast ratio between two colors"""
-    lum1 = get_luminance(color1)
-    lum2 = get_luminance(color2)
-    lighter = max(lum1, lum2)
-    darker = min(lum1, lum2)
-    return (lighter + 0.05) / (darker + 0.05)
-
-
 def parse_px(value_str: str, font_size: float = 16, root_font_size: float = 16) -> float:
     """Parse CSS pixel values, return float or 0"""
     if not value_str:
@@ -240,168 +195,13 @@ async def test_links(page) -> Dict[str, Any]:
         logger.error(f"Browser connection lost before test_links: {conn_err}")
         return results
 
+    # Link names come from the browser's accessibility tree when it is available
+    snapshot = await get_ax_snapshot(page)
+    ax_names = snapshot.names_by_xpath(('a',), ('link',)) if snapshot else None
+
     try:
         link_data = await asyncio.wait_for(
-            page.evaluate('''
-        (cssRules) => {
-            function getXPath(element) {
-                if (element.id !== '') {
-                    return '//' + element.tagName.toLowerCase() + '[@id="' + element.id + '"]';
-                }
-                if (element === document.body) {
-                    return '//' + element.tagName.toLowerCase();
-                }
-
-                let ix = 0;
-                const siblings = element.parentNode ? element.parentNode.childNodes : [];
-                for (let i = 0; i < siblings.length; i++) {
-                    const sibling = siblings[i];
-                    if (sibling === element) {
-                        const parentPath = element.parentNode ? getXPath(element.parentNode) : '';
-                        return parentPath + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                    }
-                    if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                        ix++;
-                    }
-                }
-                return '';
-            }
-
-            const allLinks = Array.from(document.querySelectorAll('a[href]'));
-
-            const visibleLinks = allLinks.filter(link => {
-                const style = window.getComputedStyle(link);
-                return style.display !== 'none' && style.visibility !== 'hidden';
-            });
-
-            return visibleLinks.map(link => {
-                const normalStyle = window.getComputedStyle(link);
-
-                const fontSize = parseFloat(normalStyle.fontSize) || 16;
-                const rootFontSize = parseFloat(window.getComputedStyle(document.documentElement).fontSize) || 16;
-
-                const hasImage = link.querySelector('img') !== null;
-                const hasOnlyImage = hasImage && link.textContent.trim() === '';
-
-                let bgElement = link.parentElement;
-                let backgroundColor = normalStyle.backgroundColor;
-                let backgroundImage = normalStyle.backgroundImage;
-
-                while (bgElement && backgroundColor === 'rgba(0, 0, 0, 0)') {
-                    backgroundColor = window.getComputedStyle(bgElement).backgroundColor;
-                    bgElement = bgElement.parentElement;
-                }
-
-                if (backgroundColor === 'rgba(0, 0, 0, 0)') {
-                    backgroundColor = 'rgb(255, 255, 255)';
-                }
-
-                const fullBackground = normalStyle.background;
-
-                // Focus styles will be populated from pre-captured CSS (in Python)
-                // Only do minimal stylesheet check if no pre-captured rules available
-                let focusOutlineStyle = null;
-                let focusOutlineWidth = null;
-                let focusOutlineColor = null;
-                let focusOutlineOffset = null;
-                let focusTextDecoration = null;
-                let focusTextDecorationLine = null;
-                let focusColor = null;
-                let focusBackgroundColor = null;
-                let focusBorderColor = null;
-                let focusBorderWidth = null;
-                let focusBoxShadow = null;
-
-                // If no pre-captured CSS rules, do a quick check (limited)
-                if (!cssRules || !cssRules.rules) {
-                    const sheets = Array.from(document.styleSheets).slice(0, 5);
-                    let rulesChecked = 0;
-                    sheetLoop:
-                    for (const sheet of sheets) {
-                        if (rulesChecked >= 100) break;
-                        try {
-                            const rules = Array.from(sheet.cssRules || sheet.rules || []).slice(0, 50);
-                            for (const rule of rules) {
-                                rulesChecked++;
-                                if (rulesChecked >= 100) break sheetLoop;
-                                if (rule.selectorText && rule.selectorText.includes(':focus')) {
-                                    const selector = rule.selectorText.replace(/:focus(-visible|-within)?/g, '');
-                                    try {
-                                        if (link.matches(selector)) {
-                                            if (rule.style.outlineStyle) focusOutlineStyle = rule.style.outlineStyle;
-                                            if (rule.style.outlineWidth) focusOutlineWidth = rule.style.outlineWidth;
-                                            if (rule.style.outlineColor) focusOutlineColor = rule.style.outlineColor;
-                                            if (rule.style.outlineOffset) focusOutlineOffset = rule.style.outlineOffset;
-                                            if (rule.style.outline === 'none' || rule.style.outline === '0') {
-                                                focusOutlineStyle = 'none';
-                                                focusOutlineWidth = '0px';
-                                            }
-                                            if (rule.style.textDecoration) focusTextDecoration = rule.style.textDecoration;
-                                            if (rule.style.textDecorationLine) focusTextDecorationLine = rule.style.textDecorationLine;
-                                            if (rule.style.color) focusColor = rule.style.color;
-                                            if (rule.style.backgroundColor) focusBackgroundColor = rule.style.backgroundColor;
-                                            if (rule.style.borderColor) focusBorderColor = rule.style.borderColor;
-                                            if (rule.style.borderWidth) focusBorderWidth = rule.style.borderWidth;
-                                            if (rule.style.boxShadow) focusBoxShadow = rule.style.boxShadow;
-                                        }
-                                    } catch (e) {}
-                                }
-                            }
-                        } catch (e) {}
-                    }
-                }
-
-                return {
-                    tagName: link.tagName,
-                    text: link.textContent.trim().substring(0, 50),
-                    xpath: getXPath(link),
-                    html: link.outerHTML.substring(0, 200),
-                    hasImage: hasImage,
-                    hasOnlyImage: hasOnlyImage,
-                    fontSize: fontSize,
-                    rootFontSize: rootFontSize,
-                    normalTextDecoration: normalStyle.textDecoration,
-                    normalTextDecorationLine: normalStyle.textDecorationLine,
-                    normalColor: normalStyle.color,
-                    normalOutlineStyle: normalStyle.outlineStyle,
-                    normalOutlineWidth: normalStyle.outlineWidth,
-                    normalOutlineColor: normalStyle.outlineColor,
-                    focusOutlineStyle: focusOutlineStyle,
-                    focusOutlineWidth: focusOutlineWidth,
-                    focusOutlineColor: focusOutlineColor,
-                    focusOutlineOffset: focusOutlineOffset,
-                    focusTextDecoration: focusTextDecoration,
-                    focusTextDecorationLine: focusTextDecorationLine,
-                    focusColor: focusColor,
-                    focusBackgroundColor: focusBackgroundColor,
-                    focusBorderColor: focusBorderColor,
-                    focusBorderWidth: focusBorderWidth,
-                    focusBoxShadow: focusBoxShadow,
-                    backgroundColor: backgroundColor,
-                    normalBackgroundColor: normalStyle.backgroundColor,
-                    backgroundImage: backgroundImage,
-                    fullBackground: fullBackground,
-                    target: link.getAttribute('target') || '',
-                    ariaLabel: link.getAttribute('aria-label') || '',
-                    title: link.getAttribute('title') || '',
-                    padding: normalStyle.padding,
-                    border: normalStyle.border,
-                    borderRadius: normalStyle.borderRadius,
-                    borderStyle: normalStyle.borderStyle,
-                    display: normalStyle.display,
-                    cursor: normalStyle.cursor,
-                    hasOnKeyDown: !!link.onkeydown || link.hasAttribute('onkeydown'),
-                    hasOnKeyPress: !!link.onkeypress || link.hasAttribute('onkeypress'),
-                    hasOnKeyUp: !!link.onkeyup || link.hasAttribute('onkeyup'),
-                    onKeyDownAttr: link.getAttribute('onkeydown') || '',
-                    onKeyPressAttr: link.getAttribute('onkeypress') || '',
-                    onKeyUpAttr: link.getAttribute('onkeyup') || '',
-                    elementId: link.id || '',
-                    className: link.className || ''
-                };
-            });
-        }
-    ''', css_focus_rules),
+            run_touchpoint_script(page, 'links', {'cssRules': css_focus_rules, 'axNames': ax_names}),
             timeout=15.0
         )
     except asyncio.TimeoutError:
@@ -419,23 +219,15 @@ async def test_links(page) -> Dict[str, Any]:
 
     results['elements_tested'] = len(link_data)
 
+    # Focus outline contrast for every link in one batch
+    focus_contrast = indicator_contrast(
+        (link['focusOutlineColor'], link.get('backgroundColor'))
+        for link in link_data if link.get('focusOutlineColor')
+    )
+
     try:
         page_scripts = await asyncio.wait_for(
-            page.evaluate('''
-                () => {
-                    const scripts = [];
-                    const scriptElements = document.querySelectorAll('script');
-                    const maxScripts = 30;
-                    let count = 0;
-                    scriptElements.forEach(script => {
-                        if (count < maxScripts && script.textContent && script.textContent.length < 30000) {
-                            scripts.push(script.textContent);
-                            count++;
-                        }
-                    });
-                    return scripts.join('\\n');
-                }
-            '''),
+            run_touchpoint_script(page, 'links_page_scripts'),
             timeout=5.0
         )
     except (asyncio.TimeoutError, Exception) as e:
@@ -514,10 +306,11 @@ async def test_links(page) -> Dict[str, Any]:
 
         target = link.get('target', '').lower()
         if target == '_blank':
-            link_text = link.get('text', '').lower()
-            aria_label = link.get('ariaLabel', '').lower()
-            title = link.get('title', '').lower()
-            combined_text = f"{link_text} {aria_label} {title}"
+            accessible_name = link.get('accessibleName')
+            if accessible_name is None:
+                accessible_name = f"{link.get('text', '')} {link.get('ariaLabel', '')}"
+            title = link.get('title', '')
+            combined_text = f"{accessible_name} {title}".lower()
 
             new_window_indicators = [
                 'new window', 'new tab',
@@ -597,14 +390,14 @@ async def test_links(page) -> Dict[str, Any]:
                 violation_reason = f'Link focus outline is too thin ({outline_width:.2f}px, needs ≥2px) and has no underline'
 
             elif not has_gradient:
-                outline_color = parse_color(link.get('focusOutlineColor'))
-                bg_color = parse_color(link.get('backgroundColor'))
+                outline_color = link.get('focusOutlineColor')
+                outline_alpha = parse_color(outline_color)[3]
 
-                if outline_color['a'] < 0.5:
+                if outline_alpha < 0.5:
                     error_code = 'WarnLinkTransparentOutline'
-                    violation_reason = f'Link focus outline is semi-transparent (alpha={outline_color["a"]:.2f}) which may not provide sufficient visibility'
+                    violation_reason = f'Link focus outline is semi-transparent (alpha={outline_alpha:.2f}) which may not provide sufficient visibility'
                 else:
-                    contrast = get_contrast_ratio(outline_color, bg_color)
+                    contrast = focus_contrast[(outline_color, link.get('backgroundColor'))]
                     if contrast < 3.0:
                         error_code = 'ErrLinkFocusContrastFail'
                         violation_reason = f'Link focus outline has insufficient contrast ({contrast:.2f}:1, needs ≥3:1 per WCAG 1.4.11)'
@@ -660,8 +453,7 @@ async def test_links(page) -> Dict[str, Any]:
 
         has_solid_background = False
         if background_color and background_color not in ['transparent', 'rgba(0, 0, 0, 0)', 'inherit', 'initial']:
-            bg_parsed = parse_color(background_color)
-            if bg_parsed['a'] > 0.5:
+            if parse_color(background_color)[3] > 0.5:
                 has_solid_background = True
                 button_indicators.append('solid background color')
 
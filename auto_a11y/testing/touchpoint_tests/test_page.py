@@ -6,6 +6,8 @@ Tests page-level accessibility including page titles, responsive breakpoints, et
 from typing import Dict, Any
 import logging
 
+from auto_a11y.testing.touchpoint_bundle import run_touchpoint_script
+
 logger = logging.getLogger(__name__)
 
 TEST_DOCUMENTATION = {
@@ -66,18 +68,7 @@ async def test_page(page) -> Dict[str, Any]:
             pass
 
         # Execute JavaScript to get page title info
-        title_data = await page.evaluate('''
-            () => {
-                const titleElement = document.querySelector('title');
-                const allTitles = document.querySelectorAll('head > title');
-                
-                return {
-                    hasTitleElement: !!titleElement,
-                    titleText: titleElement ? titleElement.textContent.trim() : '',
-                    titleCount: allTitles.length
-                };
-            }
-        ''')
+        title_data = await run_touchpoint_script(page, 'page_title')
 
         results['elements_tested'] += 1
 
@@ -179,35 +170,7 @@ async def test_page(page) -> Dict[str, Any]:
         })
 
         # Discovery: Responsive breakpoints
-        breakpoint_data = await page.evaluate('''
-            () => {
-                const breakpoints = new Set();
-
-                for (const sheet of document.styleSheets) {
-                    try {
-                        if (sheet.cssRules) {
-                            for (const rule of sheet.cssRules) {
-                                if (rule instanceof CSSMediaRule) {
-                                    const media = rule.media.mediaText;
-                                    const widthMatches = media.match(/(?:min-width|max-width):\\s*(\\d+)px/g);
-
-                                    if (widthMatches) {
-                                        widthMatches.forEach(match => {
-                                            const value = parseInt(match.match(/(\\d+)px/)[1]);
-                                            breakpoints.add(value);
-                                        });
-                                    }
-                                }
-                            }
-                        }
-                    } catch (e) {
-                        // Skip stylesheets we can't access (CORS)
-                    }
-                }
-
-                return Array.from(breakpoints).sort((a, b) => a - b);
-            }
-        ''')
+        breakpoint_data = await run_touchpoint_script(page, 'page_breakpoints')
 
         if breakpoint_data and len(breakpoint_data) > 0:
             results['discovery'].append({
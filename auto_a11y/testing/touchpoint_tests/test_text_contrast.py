@@ -3,11 +3,24 @@ Text contrast touchpoint test module
 Tests for WCAG text contrast requirements at AA and AAA levels for normal and large text.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+import asyncio
+import json
 import logging
+import time
+
+import numpy as np
+
+from auto_a11y.testing.color_math import (
+    composite_stack, evaluate_contrast, format_rgba, parse_color, stack_layers, to_rgba_array
+)
+from auto_a11y.testing.touchpoint_bundle import install_bundle, run_touchpoint_script
 
 logger = logging.getLogger(__name__)
 
+# Viewport height used at every breakpoint
+VIEWPORT_HEIGHT = 800
+
 TEST_DOCUMENTATION = {
     "testName": "Text Contrast",
     "touchpoint": "colors_contrast",
@@ -46,12 +59,154 @@ TEST_DOCUMENTATION = {
     ]
 }
 
+def _apply_color_math(text_data: list) -> list:
+    """
+    Compute contrast for the raw styles extracted by the text_contrast engine
+
+    Adds contrastRatio, backgroundColor, isLargeText,
+    canCalculateInsideContrast and pseudoclassStates to every element, with
+    all elements and pseudoclass states of a breakpoint evaluated in one batch.
+
+    Args:
+        text_data: Elements returned by the text_contrast engine
+
+    Returns:
+        The same elements
+    """
+    if not text_data:
+        return text_data
+
+    text_colors = [elem.get('textColor') for elem in text_data]
+    stacks = [elem.get('backgroundLayers') or [] for elem in text_data]
+    font_sizes = np.array([elem.get('fontSize') or 0 for elem in text_data], dtype=float)
+    font_weights = np.array([elem.get('fontWeight') or 400 for elem in text_data], dtype=float)
+    # Gradients and images cannot be composited; their colors are reported as found
+    computable = [not (elem.get('hasGradient') or elem.get('hasImage')) for elem in text_data]
+
+    layers = stack_layers(stacks)
+    measured = evaluate_contrast(to_rgba_array(text_colors), layers, font_sizes, font_weights)
+    uncomposited = composite_stack(layers, base=None)
+
+    for i, elem in enumerate(text_data):
+        elem['textColor'] = format_rgba(parse_color(text_colors[i]))
+        elem['isLargeText'] = bool(measured['large'][i])
+        elem['canCalculateInsideContrast'] = computable[i]
+        elem['backgroundColor'] = format_rgba(measured['background'][i] if computable[i] else uncomposited[i])
+        elem['contrastRatio'] = float(measured['ratio'][i]) if computable[i] else None
+        elem['pseudoclassStates'] = {}
+
+    # Pseudoclass and prefers-contrast states override the text color and
+    # paint their background over the element's own
+    states = [
+        (i, pseudo, style)
+        for i, elem in enumerate(text_data) if computable[i]
+        for pseudo, style in (elem.get('pseudoclassStyles') or {}).items()
+    ]
+    if states:
+        state_colors = [style.get('color') or text_colors[i] for i, _, style in states]
+        state_stacks = [
+            ([style['backgroundColor']] if style.get('backgroundColor') else []) + stacks[i]
+            for i, _, style in states
+        ]
+        rows = [i for i, _, _ in states]
+        measured = evaluate_contrast(
+            to_rgba_array(state_colors), stack_layers(state_stacks), font_sizes[rows], font_weights[rows]
+        )
+        for n, (i, pseudo, _) in enumerate(states):
+            text_data[i]['pseudoclassStates'][pseudo] = {
+                'color': format_rgba(parse_color(state_colors[n])),
+                'backgroundColor': format_rgba(measured['background'][n]),
+                'contrastRatio': float(measured['ratio'][n])
+            }
+
+    return text_data
+
+
+def _parallel_viewports() -> int:
+    """Number of cloned contexts used to test breakpoint classes (0 = test sequentially)"""
+    try:
+        from config import config
+        return max(0, config.CONTRAST_PARALLEL_VIEWPORTS)
+    except Exception:
+        return 0
+
+
+async def _breakpoint_classes(page, breakpoints: List[int]) -> List[Dict[str, Any]]:
+    """
+    Group breakpoints that apply the same contrast-relevant rules to text
+
+    Args:
+        page: Playwright Page object
+        breakpoints: Widths declared in the page's media queries
+
+    Returns:
+        List of {'width': representative width, 'widths': widths in the class}
+    """
+    if len(breakpoints) < 2:
+        return [{'width': width, 'widths': [width]} for width in breakpoints]
+    try:
+        grouped = await run_touchpoint_script(page, 'contrast_breakpoint_classes', breakpoints)
+        return grouped['classes']
+    except Exception as e:
+        logger.warning(f"Could not group breakpoints, testing all of them: {e}")
+        return [{'width': width, 'widths': [width]} for width in breakpoints]
+
+
+async def _collect_sequentially(page, widths: List[int]) -> Dict[int, list]:
+    """Resize the page to each width in turn and run the contrast engine"""
+    collected = {}
+    for width in widths:
+        try:
+            await page.set_viewport_size({'width': width, 'height': VIEWPORT_HEIGHT})
+        except Exception as viewport_err:
+            logger.error(f"set_viewport_size failed for {width}px: {viewport_err}")
+            break
+
+        # Wait a moment for any dynamic content to adjust
+        await asyncio.sleep(0.1)
+
+        collected[width] = await run_touchpoint_script(page, 'text_contrast', width)
+    return collected
+
+
+async def _collect_in_cloned_contexts(page, widths: List[int], workers: int) -> Dict[int, list]:
+    """
+    Run the contrast engine at each width in its own browser context
+
+    Clones share the page's cookies and storage but reload its URL, so state
+    created by earlier interaction with the page is not carried over.
+    """
+    browser = page.context.browser
+    storage_state = await page.context.storage_state()
+    wcag_level = await page.evaluate("() => window.WCAG_LEVEL || 'AA'")
+    semaphore = asyncio.Semaphore(workers)
+
+    async def collect(width):
+        async with semaphore:
+            context = await browser.new_context(
+                viewport={'width': width, 'height': VIEWPORT_HEIGHT},
+                storage_state=storage_state
+            )
+            try:
+                await install_bundle(context)
+                await context.add_init_script(f'window.WCAG_LEVEL = {json.dumps(wcag_level)};')
+                clone = await context.new_page()
+                await clone.goto(page.url, wait_until='load')
+                return await run_touchpoint_script(clone, 'text_contrast', width)
+            finally:
+                await context.close()
+
+    text_data = await asyncio.gather(*(collect(width) for width in widths))
+    return dict(zip(widths, text_data))
+
+
 async def test_text_contrast(page) -> Dict[str, Any]:
     """
     Test text color contrast against background colors
 
     Tests both AA and AAA levels for normal and large text.
-    Tests at all responsive breakpoints defined in CSS.
+    Tests at the responsive breakpoints defined in CSS, one per group of
+    breakpoints that apply the same contrast-relevant rules to text.
     Handles edge cases like transparent backgrounds, gradients, images,
     z-index floating elements, text overflow, pseudoclasses, and media queries.
 
@@ -63,42 +218,10 @@ async def test_text_contrast(page) -> Dict[str, Any]:
     """
     try:
         # First, discover all breakpoints from CSS media queries
-        breakpoint_data = await page.evaluate(r'''
-            () => {
-                const breakpoints = new Set();
-
-                // Parse all stylesheets for media queries
-                for (const sheet of document.styleSheets) {
-                    try {
-                        if (sheet.cssRules) {
-                            for (const rule of sheet.cssRules) {
-                                if (rule instanceof CSSMediaRule) {
-                                    // Extract width values from media query
-                                    const media = rule.media.mediaText;
-                                    const widthMatches = media.match(/(?:min-width|max-width):\s*(\d+)px/g);
-                                    if (widthMatches) {
-                                        widthMatches.forEach(match => {
-                                            const value = parseInt(match.match(/(\d+)px/)[1]);
-                                            breakpoints.add(value);
-                                        });
-                                    }
-                                }
-                            }
-                        }
-                    } catch (e) {
-                        // Skip stylesheets we can't access (CORS)
-                    }
-                }
-
-                // If no breakpoints found in CSS, test at current viewport only
-                if (breakpoints.size === 0) {
-                    return [window.innerWidth];
-                }
-
-                // Return only the breakpoints declared in the page's CSS
-                return Array.from(breakpoints).sort((a, b) => a - b);
-            }
-        ''')
+        breakpoint_data = await run_touchpoint_script(page, 'media_query_breakpoints')
+        classes = await _breakpoint_classes(page, breakpoint_data)
+        tested = [group['width'] for group in classes]
+        pruned = sorted(set(breakpoint_data) - set(tested))
 
         # Aggregate results across all breakpoints
         results = {
@@ -111,634 +234,37 @@ async def test_text_contrast(page) -> Dict[str, Any]:
             'elements_failed': 0,
             'test_name': 'text_contrast',
             'checks': [],
-            'breakpoints_tested': breakpoint_data
+            'breakpoints_found': breakpoint_data,
+            'breakpoints_tested': tested,
+            'breakpoints_pruned': pruned,
+            'breakpoint_classes': classes
         }
 
-        # Test at each breakpoint
-        import asyncio
-        for breakpoint in breakpoint_data:
-            # Set viewport to this breakpoint
+        started = time.perf_counter()
+        workers = _parallel_viewports()
+        collected = None
+        if workers and len(tested) > 1 and page.context.browser:
             try:
-                await page.set_viewport_size({'width': breakpoint, 'height': 800})
-            except Exception as viewport_err:
-                logger.error(f"set_viewport_size failed for {breakpoint}px: {viewport_err}")
-                break
-
-            # Wait a moment for any dynamic content to adjust
-            await asyncio.sleep(0.1)
-
-            # Extract text elements and their contrast data at this breakpoint
-            text_data = await page.evaluate('''
-                (breakpointWidth) => {
-                // Get WCAG level from project config (set by test runner)
-                const wcagLevel = window.WCAG_LEVEL || 'AA';
-
-                // XPath generator
-                function getXPath(element) {
-                    if (element.id) {
-                        return `//*[@id="${element.id}"]`;
-                    }
-                    if (element === document.body) {
-                        return '/html/body';
-                    }
-                    let ix = 0;
-                    const siblings = element.parentNode ? element.parentNode.childNodes : [];
-                    for (let i = 0; i < siblings.length; i++) {
-                        const sibling = siblings[i];
-                        if (sibling === element) {
-                            return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                        }
-                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                            ix++;
-                        }
-                    }
-                }
+                collected = await _collect_in_cloned_contexts(page, tested, workers)
+                results['breakpoint_mode'] = 'parallel'
+            except Exception as e:
+                logger.warning(f"Parallel breakpoint contexts failed, testing sequentially: {e}")
+        if collected is None:
+            collected = await _collect_sequentially(page, tested)
+            results['breakpoint_mode'] = 'sequential'
+
+        elapsed = time.perf_counter() - started
+        results['breakpoint_seconds'] = round(elapsed, 3)
+        # Each pruned breakpoint would have cost about as much as a tested one
+        per_breakpoint = elapsed / len(collected) if collected else 0
+        results['breakpoint_seconds_saved'] = round(per_breakpoint * len(pruned), 3)
+        if pruned:
+            logger.debug(f"Text contrast: tested {len(tested)} of {len(breakpoint_data)} breakpoints "
+                         f"({results['breakpoint_mode']}), saved ~{results['breakpoint_seconds_saved']}s")
 
-                // Parse color to RGBA
-                function parseColor(colorStr) {
-                    if (!colorStr || colorStr === 'transparent') {
-                        return { r: 0, g: 0, b: 0, a: 0 };
-                    }
-
-                    // Try to parse rgba/rgb format first (most common)
-                    const rgbaMatch = colorStr.match(/rgba?\\((\\d+),\\s*(\\d+),\\s*(\\d+)(?:,\\s*([\\d.]+))?\\)/);
-                    if (rgbaMatch) {
-                        return {
-                            r: parseInt(rgbaMatch[1]),
-                            g: parseInt(rgbaMatch[2]),
-                            b: parseInt(rgbaMatch[3]),
-                            a: rgbaMatch[4] !== undefined ? parseFloat(rgbaMatch[4]) : 1
-                        };
-                    }
-
-                    // Try 6-digit hex
-                    const hexMatch6 = colorStr.match(/^#([0-9a-f]{6})$/i);
-                    if (hexMatch6) {
-                        const hex = hexMatch6[1];
-                        return {
-                            r: parseInt(hex.substr(0, 2), 16),
-                            g: parseInt(hex.substr(2, 2), 16),
-                            b: parseInt(hex.substr(4, 2), 16),
-                            a: 1
-                        };
-                    }
-
-                    // Try 3-digit hex
-                    const hexMatch3 = colorStr.match(/^#([0-9a-f]{3})$/i);
-                    if (hexMatch3) {
-                        const hex = hexMatch3[1];
-                        return {
-                            r: parseInt(hex[0] + hex[0], 16),
-                            g: parseInt(hex[1] + hex[1], 16),
-                            b: parseInt(hex[2] + hex[2], 16),
-                            a: 1
-                        };
-                    }
-
-                    // For any other format (named colors, hsl, etc.), use a temporary canvas
-                    // to let the browser convert it to rgba
-                    try {
-                        const canvas = document.createElement('canvas');
-                        canvas.width = canvas.height = 1;
-                        const ctx = canvas.getContext('2d');
-                        ctx.fillStyle = colorStr;
-                        ctx.fillRect(0, 0, 1, 1);
-                        const imageData = ctx.getImageData(0, 0, 1, 1).data;
-                        return {
-                            r: imageData[0],
-                            g: imageData[1],
-                            b: imageData[2],
-                            a: imageData[3] / 255
-                        };
-                    } catch (e) {
-                        // If all else fails, return transparent black
-                        console.warn('Could not parse color:', colorStr, e);
-                        return { r: 0, g: 0, b: 0, a: 0 };
-                    }
-                }
-
-                // Calculate relative luminance
-                function getLuminance(color) {
-                    const rsRGB = color.r / 255;
-                    const gsRGB = color.g / 255;
-                    const bsRGB = color.b / 255;
-
-                    const r = rsRGB <= 0.03928 ? rsRGB / 12.92 : Math.pow((rsRGB + 0.055) / 1.055, 2.4);
-                    const g = gsRGB <= 0.03928 ? gsRGB / 12.92 : Math.pow((gsRGB + 0.055) / 1.055, 2.4);
-                    const b = bsRGB <= 0.03928 ? bsRGB / 12.92 : Math.pow((bsRGB + 0.055) / 1.055, 2.4);
-
-                    return 0.2126 * r + 0.7152 * g + 0.0722 * b;
-                }
-
-                // Calculate contrast ratio
-                function getContrastRatio(color1, color2) {
-                    const lum1 = getLuminance(color1);
-                    const lum2 = getLuminance(color2);
-                    const lighter = Math.max(lum1, lum2);
-                    const darker = Math.min(lum1, lum2);
-                    return (lighter + 0.05) / (darker + 0.05);
-                }
-
-                // Check if element is visually hidden (screen reader only)
-                function isVisuallyHidden(element) {
-                    const style = window.getComputedStyle(element);
-
-                    // Common screen-reader-only patterns
-                    if (style.position === 'absolute' &&
-                        (style.clip === 'rect(1px, 1px, 1px, 1px)' || style.clip === 'rect(0, 0, 0, 0)')) {
-                        return true;
-                    }
-
-                    if (style.position === 'absolute' &&
-                        style.width === '1px' && style.height === '1px' &&
-                        style.overflow === 'hidden') {
-                        return true;
-                    }
-
-                    if (style.clip === 'rect(0px, 0px, 0px, 0px)') {
-                        return true;
-                    }
-
-                    return false;
-                }
-
-                // Check for gradient or image background
-                function hasComplexBackground(bgStr) {
-                    if (!bgStr || bgStr === 'none') return { hasGradient: false, hasImage: false };
-
-                    const lower = bgStr.toLowerCase();
-                    return {
-                        hasGradient: lower.includes('gradient'),
-                        hasImage: lower.includes('url(')
-                    };
-                }
-
-                // Check if element has CSS animations
-                // Returns { hasAnimation, animationElement, animationType, animationName }
-                // Note: Short transitions (<=0.5s) are ignored as they don't affect contrast readability
-                function getAnimationInfo(element) {
-                    let currentElement = element;
-                    
-                    while (currentElement) {
-                        const style = window.getComputedStyle(currentElement);
-                        const animationName = style.animationName || style.webkitAnimationName || '';
-                        const transition = style.transition || style.webkitTransition || '';
-                        const transitionDuration = style.transitionDuration || '0s';
-
-                        // Check if animation-name is not 'none' (actual CSS animations are always a concern)
-                        const hasAnim = animationName && animationName !== 'none';
-                        
-                        // Parse transition duration - only flag if > 0.5s
-                        // Short hover transitions don't affect contrast readability
-                        let maxDuration = 0;
-                        const durations = transitionDuration.split(',').map(d => d.trim());
-                        for (const dur of durations) {
-                            if (dur.endsWith('ms')) {
-                                maxDuration = Math.max(maxDuration, parseFloat(dur) / 1000);
-                            } else if (dur.endsWith('s')) {
-                                maxDuration = Math.max(maxDuration, parseFloat(dur));
-                            }
-                        }
-                        
-                        // Only flag transitions > 0.5s that affect color/background/opacity
-                        const hasLongTransition = maxDuration > 0.5 && transition && (
-                            transition.includes('color') ||
-                            transition.includes('background') ||
-                            transition.includes('opacity') ||
-                            transition.includes('all')
-                        );
-
-                        if (hasAnim) {
-                            return {
-                                hasAnimation: true,
-                                animationElementXpath: getXPath(currentElement),
-                                animationType: 'CSS animation',
-                                animationName: animationName
-                            };
-                        }
-                        if (hasLongTransition) {
-                            return {
-                                hasAnimation: true,
-                                animationElementXpath: getXPath(currentElement),
-                                animationType: 'CSS transition (>' + maxDuration.toFixed(1) + 's)',
-                                animationName: transition
-                            };
-                        }
-                        
-                        currentElement = currentElement.parentElement;
-                    }
-                    
-                    return { hasAnimation: false, animationElementXpath: null, animationType: null, animationName: null };
-                }
-
-                // Composite two colors (overlay on top of base)
-                function compositeColors(overlay, base) {
-                    const a = overlay.a + base.a * (1 - overlay.a);
-                    if (a === 0) return { r: 0, g: 0, b: 0, a: 0 };
-                    return {
-                        r: Math.round((overlay.r * overlay.a + base.r * base.a * (1 - overlay.a)) / a),
-                        g: Math.round((overlay.g * overlay.a + base.g * base.a * (1 - overlay.a)) / a),
-                        b: Math.round((overlay.b * overlay.a + base.b * base.a * (1 - overlay.a)) / a),
-                        a: a
-                    };
-                }
-
-                // Get effective background color by walking up the DOM
-                // Handles semi-transparent backgrounds by compositing with backgrounds behind
-                // Returns: { backgroundColor, stoppedAtZIndex, zIndexElementXpath, zIndexValue, zIndexPosition, hasGradient, hasImage }
-                function getEffectiveBackground(element) {
-                    let currentElement = element;
-                    let compositedBg = { r: 0, g: 0, b: 0, a: 0 };
-                    let stoppedAtZIndex = false;
-                    let zIndexElement = null;
-                    let zIndexValue = null;
-                    let zIndexPosition = null;
-                    let hasGradient = false;
-                    let hasImage = false;
-
-                    while (currentElement && compositedBg.a < 1) {
-                        const style = window.getComputedStyle(currentElement);
-
-                        // Check for gradient or image first
-                        const bgImage = style.backgroundImage;
-                        const fullBg = style.background;
-                        const complex = hasComplexBackground(bgImage) || hasComplexBackground(fullBg);
-
-                        if (complex.hasGradient) hasGradient = true;
-                        if (complex.hasImage) hasImage = true;
-
-                        // Parse this element's background color
-                        const bgColor = parseColor(style.backgroundColor);
-
-                        // Composite this background with what we've accumulated
-                        if (bgColor.a > 0) {
-                            compositedBg = compositeColors(compositedBg, bgColor);
-                        }
-
-                        // Check for z-index (creates stacking context)
-                        const zIndex = style.zIndex;
-                        const position = style.position;
-                        if (zIndex !== 'auto' && position !== 'static') {
-                            stoppedAtZIndex = true;
-                            zIndexElement = currentElement;
-                            zIndexValue = zIndex;
-                            zIndexPosition = position;
-                            break;
-                        }
-
-                        // If we have a fully opaque background, stop
-                        if (compositedBg.a >= 1 && !hasGradient && !hasImage) {
-                            break;
-                        }
-
-                        currentElement = currentElement.parentElement;
-                    }
-
-                    // Default to white if we reached the root without finding a fully opaque background
-                    if (compositedBg.a < 1 && !hasGradient && !hasImage) {
-                        compositedBg = compositeColors(compositedBg, { r: 255, g: 255, b: 255, a: 1 });
-                    }
-
-                    const backgroundColor = `rgba(${compositedBg.r}, ${compositedBg.g}, ${compositedBg.b}, ${compositedBg.a})`;
-
-                    return {
-                        backgroundColor,
-                        stoppedAtZIndex,
-                        zIndexElementXpath: zIndexElement ? getXPath(zIndexElement) : null,
-                        zIndexValue: zIndexValue,
-                        zIndexPosition: zIndexPosition,
-                        hasGradient,
-                        hasImage
-                    };
-                }
-
-                // Check if text overflows its container
-                // Returns { hasOverflow, containerXpath } or { hasOverflow: false }
-                function checkTextOverflow(element) {
-                    const elementRect = element.getBoundingClientRect();
-                    let parent = element.parentElement;
-
-                    if (!parent) return { hasOverflow: false };
-
-                    const parentRect = parent.getBoundingClientRect();
-
-                    // Check if text extends beyond parent boundaries
-                    const overflows =
-                        elementRect.top < parentRect.top ||
-                        elementRect.bottom > parentRect.bottom ||
-                        elementRect.left < parentRect.left ||
-                        elementRect.right > parentRect.right;
-
-                    if (overflows) {
-                        return {
-                            hasOverflow: true,
-                            containerXpath: getXPath(parent)
-                        };
-                    }
-                    return { hasOverflow: false };
-                }
-
-                // Check if element or any ancestor is hidden
-                function isElementOrAncestorHidden(element) {
-                    let current = element;
-                    while (current && current !== document.body) {
-                        const style = window.getComputedStyle(current);
-                        if (style.display === 'none' || 
-                            style.visibility === 'hidden' || 
-                            parseFloat(style.opacity) === 0) {
-                            return true;
-                        }
-                        current = current.parentElement;
-                    }
-                    return false;
-                }
-
-                // Get all text nodes
-                const textElements = [];
-                const walker = document.createTreeWalker(
-                    document.body,
-                    NodeFilter.SHOW_TEXT,
-                    {
-                        acceptNode: function(node) {
-                            // Skip empty or whitespace-only text
-                            if (!node.textContent || !node.textContent.trim()) {
-                                return NodeFilter.FILTER_REJECT;
-                            }
-
-                            const parent = node.parentElement;
-                            if (!parent) return NodeFilter.FILTER_REJECT;
-
-                            // Skip if element or any ancestor is hidden
-                            if (isElementOrAncestorHidden(parent)) {
-                                return NodeFilter.FILTER_REJECT;
-                            }
-
-                            // Skip if visually hidden (screen reader only)
-                            if (isVisuallyHidden(parent)) {
-                                return NodeFilter.FILTER_REJECT;
-                            }
-
-                            return NodeFilter.FILTER_ACCEPT;
-                        }
-                    }
-                );
-
-                // Function to check if a rule selector matches an element
-                function ruleSelectorMatchesElement(rule, element, classes, idSelector) {
-                    if (!rule.selectorText) return false;
-
-                    const selectorText = rule.selectorText;
-
-                    // If element has an ID and rule targets that ID
-                    if (idSelector && selectorText.includes(idSelector)) {
-                        return true;
-                    }
-                    // If element has classes and rule targets those classes
-                    if (classes.length > 0 && classes.every(cls => selectorText.includes(`.${cls}`))) {
-                        return true;
-                    }
-                    // Generic tag selector (e.g., just "a:hover" or "a")
-                    const tagName = element.tagName.toLowerCase();
-                    if (selectorText.startsWith(tagName + ':') ||
-                        selectorText.startsWith(tagName + '.') ||
-                        selectorText === tagName) {
-                        return true;
-                    }
-
-                    return false;
-                }
-
-                // Function to extract styles from a rule for pseudoclasses
-                function extractPseudoclassStylesFromRule(rule, element, classes, idSelector, pseudoclasses) {
-                    const states = {};
-
-                    if (!rule.selectorText) return states;
-
-                    for (let pseudo of pseudoclasses) {
-                        if (rule.selectorText.includes(pseudo)) {
-                            if (ruleSelectorMatchesElement(rule, element, classes, idSelector)) {
-                                if (!states[pseudo]) {
-                                    states[pseudo] = {};
-                                }
-
-                                // Extract color and background-color
-                                if (rule.style.color) {
-                                    states[pseudo].color = rule.style.color;
-                                }
-                                if (rule.style.backgroundColor) {
-                                    states[pseudo].backgroundColor = rule.style.backgroundColor;
-                                }
-                            }
-                        }
-                    }
-
-                    return states;
-                }
-
-                // Function to get pseudoclass styles from CSS rules, including media queries
-                function getPseudoclassStyles(element) {
-                    const pseudoclassStates = {};
-
-                    // Determine which pseudoclasses to check based on element type
-                    // Links (<a> and role="link") should check :link and :visited in addition to common ones
-                    // Other interactive elements (buttons, etc.) should NOT check :link or :visited
-                    const isLink = element.tagName === 'A' ||
-                                   element.getAttribute('role') === 'link';
-
-                    const pseudoclasses = isLink
-                        ? [':hover', ':focus', ':visited', ':active', ':link']
-                        : [':hover', ':focus', ':active'];
-
-                    // Build element's class selector (handle SVG elements where className is SVGAnimatedString)
-                    const classNameStr = typeof element.className === 'string' ? element.className : (element.className?.baseVal || '');
-                    const classes = classNameStr ? classNameStr.split(' ').filter(c => c.trim()) : [];
-                    const idSelector = element.id ? `#${element.id}` : '';
-
-                    // Also track styles from prefers-contrast media queries
-                    const prefersContrastStates = {
-                        'more': {},    // prefers-contrast: more
-                        'less': {},    // prefers-contrast: less
-                        'custom': {}   // prefers-contrast: custom
-                    };
-
-                    // Parse all stylesheets
-                    try {
-                        for (let sheet of document.styleSheets) {
-                            try {
-                                for (let rule of sheet.cssRules || sheet.rules || []) {
-                                    // Check for media rules (including prefers-contrast)
-                                    if (rule instanceof CSSMediaRule) {
-                                        const mediaText = rule.conditionText || rule.media.mediaText || '';
-
-                                        // Check if this is a prefers-contrast media query
-                                        let contrastLevel = null;
-                                        if (mediaText.includes('prefers-contrast')) {
-                                            if (mediaText.includes('more')) contrastLevel = 'more';
-                                            else if (mediaText.includes('less')) contrastLevel = 'less';
-                                            else if (mediaText.includes('custom')) contrastLevel = 'custom';
-                                        }
-
-                                        // Process rules within the media query
-                                        for (let innerRule of rule.cssRules || []) {
-                                            if (contrastLevel) {
-                                                // This is inside a prefers-contrast media query
-                                                // Extract both default and pseudoclass styles
-
-                                                // Check for pseudoclass rules
-                                                const pseudoStyles = extractPseudoclassStylesFromRule(
-                                                    innerRule, element, classes, idSelector, pseudoclasses
-                                                );
-
-                                                for (let pseudo in pseudoStyles) {
-                                                    const key = `${pseudo}@prefers-contrast:${contrastLevel}`;
-                                                    if (!pseudoclassStates[key]) {
-                                                        pseudoclassStates[key] = {};
-                                                    }
-                                                    Object.assign(pseudoclassStates[key], pseudoStyles[pseudo]);
-                                                }
-
-                                                // Also check for default state (no pseudoclass)
-                                                if (innerRule.selectorText && !pseudoclasses.some(p => innerRule.selectorText.includes(p))) {
-                                                    if (ruleSelectorMatchesElement(innerRule, element, classes, idSelector)) {
-                                                        const key = `default@prefers-contrast:${contrastLevel}`;
-                                                        if (!pseudoclassStates[key]) {
-                                                            pseudoclassStates[key] = {};
-                                                        }
-                                                        if (innerRule.style.color) {
-                                                            pseudoclassStates[key].color = innerRule.style.color;
-                                                        }
-                                                        if (innerRule.style.backgroundColor) {
-                                                            pseudoclassStates[key].backgroundColor = innerRule.style.backgroundColor;
-                                                        }
-                                                    }
-                                                }
-                                            } else {
-                                                // Regular media query (not prefers-contrast), process pseudoclasses
-                                                const pseudoStyles = extractPseudoclassStylesFromRule(
-                                                    innerRule, element, classes, idSelector, pseudoclasses
-                                                );
-                                                for (let pseudo in pseudoStyles) {
-                                                    if (!pseudoclassStates[pseudo]) {
-                                                        pseudoclassStates[pseudo] = {};
-                                                    }
-                                                    Object.assign(pseudoclassStates[pseudo], pseudoStyles[pseudo]);
-                                                }
-                                            }
-                                        }
-                                    } else if (rule.selectorText) {
-                                        // Regular rule (not in media query)
-                                        const pseudoStyles = extractPseudoclassStylesFromRule(
-                                            rule, element, classes, idSelector, pseudoclasses
-                                        );
-                                        for (let pseudo in pseudoStyles) {
-                                            if (!pseudoclassStates[pseudo]) {
-                                                pseudoclassStates[pseudo] = {};
-                                            }
-                                            Object.assign(pseudoclassStates[pseudo], pseudoStyles[pseudo]);
-                                        }
-                                    }
-                                }
-                            } catch (e) {
-                                // Skip inaccessible stylesheets (CORS)
-                            }
-                        }
-                    } catch (e) {
-                        // Error accessing stylesheets
-                    }
-
-                    return pseudoclassStates;
-                }
-
-                let node;
-                while (node = walker.nextNode()) {
-                    const element = node.parentElement;
-                    const style = window.getComputedStyle(element);
-
-                    // Get text color
-                    const textColor = parseColor(style.color);
-
-                    // Get font size and weight to determine if it's "large text"
-                    const fontSize = parseFloat(style.fontSize);
-                    const fontWeight = parseInt(style.fontWeight) || 400;
-                    const isBold = fontWeight >= 700;
-
-                    // Large text = 18pt+ (24px+) OR 14pt+ bold (18.66px+)
-                    const isLargeText = fontSize >= 24 || (fontSize >= 18.66 && isBold);
-
-                    // Get background
-                    const bgInfo = getEffectiveBackground(element);
-                    const bgColor = parseColor(bgInfo.backgroundColor);
-
-                    // Check for text overflow
-                    const overflowInfo = checkTextOverflow(element);
-
-                    // Check for animations
-                    const animInfo = getAnimationInfo(element);
-
-                    // Calculate contrast ratio for default state
-                    // We CAN calculate if text is inside container, even if it also overflows
-                    // We CANNOT calculate if background is gradient/image/transparent
-                    let contrastRatio = null;
-                    let canCalculateInsideContrast = bgColor.a > 0 && !bgInfo.hasGradient && !bgInfo.hasImage;
-
-                    if (canCalculateInsideContrast) {
-                        contrastRatio = getContrastRatio(textColor, bgColor);
-                    }
-
-                    // Get pseudoclass styles and prefers-contrast media query styles
-                    // Check for ALL elements (not just interactive) because media queries affect all text
-                    const pseudoclassStates = {};
-                    const pseudoStyles = getPseudoclassStyles(element);
-
-                    // Calculate contrast for each pseudoclass/media query state
-                    for (let pseudo in pseudoStyles) {
-                        const pseudoColor = pseudoStyles[pseudo].color ?
-                            parseColor(pseudoStyles[pseudo].color) : textColor;
-                        const pseudoBg = pseudoStyles[pseudo].backgroundColor ?
-                            parseColor(pseudoStyles[pseudo].backgroundColor) : bgColor;
-
-                        if (pseudoBg.a > 0 && !bgInfo.hasGradient && !bgInfo.hasImage) {
-                            const pseudoContrast = getContrastRatio(pseudoColor, pseudoBg);
-                            pseudoclassStates[pseudo] = {
-                                color: `rgba(${pseudoColor.r}, ${pseudoColor.g}, ${pseudoColor.b}, ${pseudoColor.a})`,
-                                backgroundColor: `rgba(${pseudoBg.r}, ${pseudoBg.g}, ${pseudoBg.b}, ${pseudoBg.a})`,
-                                contrastRatio: pseudoContrast
-                            };
-                        }
-                    }
-
-                    textElements.push({
-                        text: node.textContent.trim().substring(0, 100),
-                        xpath: getXPath(element),
-                        html: element.outerHTML.substring(0, 200),
-                        textColor: `rgba(${textColor.r}, ${textColor.g}, ${textColor.b}, ${textColor.a})`,
-                        backgroundColor: bgInfo.backgroundColor,
-                        contrastRatio: contrastRatio,
-                        fontSize: fontSize,
-                        fontWeight: fontWeight,
-                        isLargeText: isLargeText,
-                        stoppedAtZIndex: bgInfo.stoppedAtZIndex,
-                        zIndexElementXpath: bgInfo.zIndexElementXpath,
-                        zIndexValue: bgInfo.zIndexValue,
-                        zIndexPosition: bgInfo.zIndexPosition,
-                        hasGradient: bgInfo.hasGradient,
-                        hasImage: bgInfo.hasImage,
-                        hasOverflow: overflowInfo.hasOverflow,
-                        overflowContainerXpath: overflowInfo.containerXpath || null,
-                        hasAnimation: animInfo.hasAnimation,
-                        animationElementXpath: animInfo.animationElementXpath,
-                        animationType: animInfo.animationType,
-                        animationName: animInfo.animationName,
-                        canCalculateInsideContrast: canCalculateInsideContrast,
-                        tag: element.tagName.toLowerCase(),
-                        pseudoclassStates: pseudoclassStates,
-                        wcagLevel: wcagLevel  // Add WCAG level to each element
-                    });
-                }
-
-                return textElements;
-            }
-            ''', breakpoint)
+        # Test at each breakpoint
+        for breakpoint, text_data in collected.items():
+            text_data = _apply_color_math(text_data)
 
             # Process results from this breakpoint
             for text_elem in text_data:
@@ -111,6 +111,10 @@ def create_app(config):
     except Exception:
         pass  # Don't block startup
 
+    # Share Drupal taxonomy and WCAG chapter lookups between workers and jobs
+    from auto_a11y.drupal.taxonomy import configure_shared_term_cache
+    configure_shared_term_cache(app.db.drupal_term_cache)
+
     # Run group permissions migration (idempotent)
     from auto_a11y.core.migrate_groups import run_migration
     try:
@@ -398,7 +398,7 @@ def upload_to_drupal(project_id):
             # Initialize exporters
             taxonomies = DiscoveredPageTaxonomies(client)
             page_exporter = DiscoveredPageExporter(client, taxonomies)
-            wcag_cache = WCAGChapterCache(client, taxonomies.cache)
+            wcag_cache = WCAGChapterCache(client)
             issue_exporter = IssueExporter(client, taxonomies.cache, wcag_cache)
 
             # Step 5: Upload Discovered Pages to Drupal
@@ -5,12 +5,15 @@ Flask routes for Drupal synchronization
 import logging
 from flask import Blueprint, render_template, request, jsonify, Response, stream_with_context, current_app
 from bson import ObjectId
+from pymongo import UpdateOne
 import json
+import time
 from datetime import datetime
 
-from auto_a11y.models import Project, DiscoveredPage, Recording, Issue, DrupalSyncStatus
+from auto_a11y.models import Project, DiscoveredPage, Recording, RecordingIssue, Issue, DrupalSyncStatus
 from auto_a11y.drupal import (
     DrupalJSONAPIClient,
+    DrupalExportEngine,
     DiscoveredPageExporter,
     DiscoveredPageImporter,
     DiscoveredPageTaxonomies,
@@ -20,6 +23,7 @@ from auto_a11y.drupal import (
     IssueExporter
 )
 from auto_a11y.drupal.config import get_drupal_config
+from auto_a11y.drupal.delta_sync import bulk_upsert, high_water_mark
 from auto_a11y.reporting.deduplication_service import AutomatedTestDeduplicationService
 from auto_a11y.reporting.report_generator import ReportGenerator
 
@@ -126,6 +130,53 @@ def _get_drupal_client():
         return None
 
 
+def _get_export_engine(client):
+    """Get a concurrent export engine for the configured Drupal site"""
+    return DrupalExportEngine.from_client(client, concurrency=get_drupal_config().export_concurrency)
+
+
+def _record_export_result(collection, record_id, result, uuid_field='drupal_uuid', nid_field=None):
+    """Store the outcome of an export (and the exported content hash) on its source document"""
+    if result.get('success'):
+        update = {
+            uuid_field: result['uuid'],
+            'drupal_content_hash': result['content_hash'],
+            'drupal_sync_status': DrupalSyncStatus.SYNCED.value,
+            'drupal_last_synced': datetime.now(),
+            'drupal_error_message': None
+        }
+        # Skipped (unchanged) nodes come back without a nid
+        if nid_field and result.get('nid') is not None:
+            update[nid_field] = result['nid']
+    else:
+        update = {
+            'drupal_sync_status': DrupalSyncStatus.SYNC_FAILED.value,
+            'drupal_error_message': result.get('error')
+        }
+    collection.update_one({'_id': ObjectId(record_id)}, {'$set': update})
+
+
+def _export_message(job, result, current, total):
+    """Progress line for an exported item"""
+    if result.get('success'):
+        return json.dumps({
+            'type': 'success',
+            'current': current,
+            'total': total,
+            'item': job.label,
+            'action': result['action'],
+            'uuid': result['uuid'],
+            'nid': result.get('nid')
+        }) + '\n'
+    return json.dumps({
+        'type': 'error',
+        'current': current,
+        'total': total,
+        'item': job.label,
+        'error': result.get('error')
+    }) + '\n'
+
+
 def _lookup_audit_uuid(client, project):
     """Look up Drupal audit UUID by project's drupal_audit_name or name"""
     try:
@@ -294,9 +345,10 @@ def upload_to_drupal(project_id):
             taxonomies = DiscoveredPageTaxonomies(client)
             wcag_cache = WCAGChapterCache(client)
 
-            # Preload issue taxonomies for issue exporter
-            taxonomies.cache.get_terms('issue_type')
-            taxonomies.cache.get_terms('issue_category')
+            # Preload page and issue taxonomies (shared with other workers)
+            taxonomies.cache.warm([
+                taxonomies.INTERESTED_BECAUSE, taxonomies.PAGE_ELEMENTS, 'issue_type', 'issue_category'
+            ])
 
             # Preload WCAG chapters for issue exporter
             wcag_cache.get_chapters()
@@ -310,13 +362,16 @@ def upload_to_drupal(project_id):
             success_count = 0
             failure_count = 0
 
+            engine = _get_export_engine(client)
+            force = options.get('force_resync', False)
+
             # Export discovered pages
+            page_jobs = []
             for page_id in discovered_page_ids:
-                current_item += 1
-
                 try:
                     page_doc = db.discovered_pages.find_one({'_id': ObjectId(page_id)})
                     if not page_doc:
+                        current_item += 1
                         yield json.dumps({
                             'type': 'error',
                             'current': current_item,
@@ -328,63 +383,10 @@ def upload_to_drupal(project_id):
                         continue
 
                     page = DiscoveredPage.from_dict(page_doc)
-
-                    yield json.dumps({
-                        'type': 'progress',
-                        'current': current_item,
-                        'total': total_items,
-                        'item': page.title,
-                        'status': 'exporting'
-                    }) + '\n'
-
-                    # Export page
-                    result = page_exporter.export_from_discovered_page_model(page, audit_uuid)
-
-                    if result.get('success'):
-                        # Update database with Drupal UUID
-                        db.discovered_pages.update_one(
-                            {'_id': ObjectId(page_id)},
-                            {
-                                '$set': {
-                                    'drupal_uuid': result['uuid'],
-                                    'drupal_sync_status': 'synced',
-                                    'drupal_last_synced': datetime.now(),
-                                    'drupal_error_message': None
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': current_item,
-                            'total': total_items,
-                            'item': page.title,
-                            'uuid': result['uuid'],
-                            'nid': result.get('nid')
-                        }) + '\n'
-                        success_count += 1
-                    else:
-                        # Update database with error
-                        db.discovered_pages.update_one(
-                            {'_id': ObjectId(page_id)},
-                            {
-                                '$set': {
-                                    'drupal_sync_status': 'sync_failed',
-                                    'drupal_error_message': result.get('error')
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'error',
-                            'current': current_item,
-                            'total': total_items,
-                            'item': page.title,
-                            'error': result.get('error')
-                        }) + '\n'
-                        failure_count += 1
+                    page_jobs.append(page_exporter.prepare_from_discovered_page_model(page, audit_uuid, context=page_id))
 
                 except Exception as e:
+                    current_item += 1
                     logger.error(f"Error exporting page {page_id}: {e}")
                     yield json.dumps({
                         'type': 'error',
@@ -395,13 +397,23 @@ def upload_to_drupal(project_id):
                     }) + '\n'
                     failure_count += 1
 
-            # Export recordings
-            for recording_id in recording_ids:
+            for job, result in engine.export(page_jobs, force=force):
                 current_item += 1
+                _record_export_result(db.discovered_pages, job.context, result)
+                yield _export_message(job, result, current_item, total_items)
+                if result.get('success'):
+                    success_count += 1
+                else:
+                    failure_count += 1
 
+            # Export recordings
+            include_french = options.get('include_french', False)
+            recording_jobs = []
+            for recording_id in recording_ids:
                 try:
                     recording_doc = db.recordings.find_one({'_id': ObjectId(recording_id)})
                     if not recording_doc:
+                        current_item += 1
                         yield json.dumps({
                             'type': 'error',
                             'current': current_item,
@@ -414,14 +426,6 @@ def upload_to_drupal(project_id):
 
                     recording = Recording.from_dict(recording_doc)
 
-                    yield json.dumps({
-                        'type': 'progress',
-                        'current': current_item,
-                        'total': total_items,
-                        'item': recording.title,
-                        'status': 'exporting'
-                    }) + '\n'
-
                     # Fetch discovered page UUIDs if recording has discovered pages
                     discovered_page_uuids = []
                     if recording.discovered_page_ids:
@@ -436,119 +440,13 @@ def upload_to_drupal(project_id):
                                 logger.error(f"Error fetching discovered page {page_id}: {e}")
 
                     # Export recording with optional French content
-                    include_french = options.get('include_french', False)
-                    result = recording_exporter.export_from_recording_model(recording, audit_uuid, discovered_page_uuids, include_french=include_french)
-
-                    if result.get('success'):
-                        # Update database with Drupal UUID
-                        video_uuid = result['uuid']
-                        db.recordings.update_one(
-                            {'_id': ObjectId(recording_id)},
-                            {
-                                '$set': {
-                                    'drupal_video_uuid': video_uuid,
-                                    'drupal_video_nid': result.get('nid'),
-                                    'drupal_sync_status': 'synced',
-                                    'drupal_last_synced': datetime.now(),
-                                    'drupal_error_message': None
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': current_item,
-                            'total': total_items,
-                            'item': recording.title,
-                            'uuid': video_uuid,
-                            'nid': result.get('nid')
-                        }) + '\n'
-                        success_count += 1
-
-                        # Export associated RecordingIssues for this recording (create new or update existing)
-                        recording_issues = list(db.recording_issues.find({'recording_id': recording.recording_id}))
-                        if recording_issues:
-                            yield json.dumps({
-                                'type': 'info',
-                                'message': f'Syncing {len(recording_issues)} issues from recording "{recording.title}"'
-                            }) + '\n'
-
-                            for issue_doc in recording_issues:
-                                try:
-                                    from auto_a11y.models import RecordingIssue
-                                    rec_issue = RecordingIssue.from_dict(issue_doc)
-
-                                    # Pass existing UUID if available for update, otherwise create new
-                                    issue_result = issue_exporter.export_from_recording_issue(
-                                        rec_issue,
-                                        audit_uuid,
-                                        video_uuid
-                                    )
-
-                                    if issue_result.get('success'):
-                                        # Update RecordingIssue with Drupal UUID and sync status
-                                        db.recording_issues.update_one(
-                                            {'_id': issue_doc['_id']},
-                                            {
-                                                '$set': {
-                                                    'drupal_uuid': issue_result['uuid'],
-                                                    'drupal_nid': issue_result.get('nid'),
-                                                    'drupal_sync_status': 'synced',
-                                                    'drupal_last_synced': datetime.now(),
-                                                    'drupal_error_message': None
-                                                }
-                                            }
-                                        )
-
-                                        action = "Updated" if rec_issue.drupal_uuid else "Created"
-                                        yield json.dumps({
-                                            'type': 'info',
-                                            'message': f'  ✓ {action} issue: {rec_issue.title}'
-                                        }) + '\n'
-                                    else:
-                                        # Update RecordingIssue with error status
-                                        db.recording_issues.update_one(
-                                            {'_id': issue_doc['_id']},
-                                            {
-                                                '$set': {
-                                                    'drupal_sync_status': 'sync_failed',
-                                                    'drupal_error_message': issue_result.get('error')
-                                                }
-                                            }
-                                        )
-
-                                        yield json.dumps({
-                                            'type': 'warning',
-                                            'message': f'  ✗ Failed to sync issue "{rec_issue.title}": {issue_result.get("error")}'
-                                        }) + '\n'
-                                except Exception as issue_err:
-                                    logger.error(f"Error syncing recording issue: {issue_err}")
-                                    yield json.dumps({
-                                        'type': 'warning',
-                                        'message': f'  ✗ Error syncing issue: {str(issue_err)}'
-                                    }) + '\n'
-                    else:
-                        # Update database with error
-                        db.recordings.update_one(
-                            {'_id': ObjectId(recording_id)},
-                            {
-                                '$set': {
-                                    'drupal_sync_status': 'sync_failed',
-                                    'drupal_error_message': result.get('error')
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'error',
-                            'current': current_item,
-                            'total': total_items,
-                            'item': recording.title,
-                            'error': result.get('error')
-                        }) + '\n'
-                        failure_count += 1
+                    recording_jobs.append(recording_exporter.prepare_from_recording_model(
+                        recording, audit_uuid, discovered_page_uuids,
+                        include_french=include_french, context=(recording_id, recording)
+                    ))
 
                 except Exception as e:
+                    current_item += 1
                     logger.error(f"Error exporting recording {recording_id}: {e}")
                     yield json.dumps({
                         'type': 'error',
@@ -559,13 +457,59 @@ def upload_to_drupal(project_id):
                     }) + '\n'
                     failure_count += 1
 
-            # Export issues
-            for issue_id in issue_ids:
+            recording_issue_jobs = []
+            for job, result in engine.export(recording_jobs, force=force):
                 current_item += 1
+                recording_id, recording = job.context
+                _record_export_result(db.recordings, recording_id, result,
+                                      uuid_field='drupal_video_uuid', nid_field='drupal_video_nid')
+                yield _export_message(job, result, current_item, total_items)
+                if not result.get('success'):
+                    failure_count += 1
+                    continue
+                success_count += 1
+
+                # Queue associated RecordingIssues for this recording (create new or update existing)
+                recording_issues = list(db.recording_issues.find({'recording_id': recording.recording_id}))
+                if recording_issues:
+                    yield json.dumps({
+                        'type': 'info',
+                        'message': f'Syncing {len(recording_issues)} issues from recording "{recording.title}"'
+                    }) + '\n'
 
+                for issue_doc in recording_issues:
+                    try:
+                        rec_issue = RecordingIssue.from_dict(issue_doc)
+                        recording_issue_jobs.append(issue_exporter.prepare_from_recording_issue(
+                            rec_issue, audit_uuid, result['uuid'], context=issue_doc['_id']
+                        ))
+                    except Exception as issue_err:
+                        logger.error(f"Error syncing recording issue: {issue_err}")
+                        yield json.dumps({
+                            'type': 'warning',
+                            'message': f'  ✗ Error syncing issue: {str(issue_err)}'
+                        }) + '\n'
+
+            for job, issue_result in engine.export(recording_issue_jobs, force=force):
+                _record_export_result(db.recording_issues, job.context, issue_result, nid_field='drupal_nid')
+                if issue_result.get('success'):
+                    yield json.dumps({
+                        'type': 'info',
+                        'message': f'  ✓ {issue_result["action"].capitalize()} issue: {job.label}'
+                    }) + '\n'
+                else:
+                    yield json.dumps({
+                        'type': 'warning',
+                        'message': f'  ✗ Failed to sync issue "{job.label}": {issue_result.get("error")}'
+                    }) + '\n'
+
+            # Export issues
+            issue_jobs = []
+            for issue_id in issue_ids:
                 try:
                     issue_doc = db.issues.find_one({'_id': ObjectId(issue_id)})
                     if not issue_doc:
+                        current_item += 1
                         yield json.dumps({
                             'type': 'error',
                             'current': current_item,
@@ -577,64 +521,10 @@ def upload_to_drupal(project_id):
                         continue
 
                     issue = Issue.from_dict(issue_doc)
-
-                    yield json.dumps({
-                        'type': 'progress',
-                        'current': current_item,
-                        'total': total_items,
-                        'item': issue.title,
-                        'status': 'exporting'
-                    }) + '\n'
-
-                    # Export issue
-                    result = issue_exporter.export_from_issue_model(issue, audit_uuid)
-
-                    if result.get('success'):
-                        # Update database with Drupal UUID
-                        db.issues.update_one(
-                            {'_id': ObjectId(issue_id)},
-                            {
-                                '$set': {
-                                    'drupal_uuid': result['uuid'],
-                                    'drupal_nid': result.get('nid'),
-                                    'drupal_sync_status': 'synced',
-                                    'drupal_last_synced': datetime.now(),
-                                    'drupal_error_message': None
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': current_item,
-                            'total': total_items,
-                            'item': issue.title,
-                            'uuid': result['uuid'],
-                            'nid': result.get('nid')
-                        }) + '\n'
-                        success_count += 1
-                    else:
-                        # Update database with error
-                        db.issues.update_one(
-                            {'_id': ObjectId(issue_id)},
-                            {
-                                '$set': {
-                                    'drupal_sync_status': 'sync_failed',
-                                    'drupal_error_message': result.get('error')
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'error',
-                            'current': current_item,
-                            'total': total_items,
-                            'item': issue.title,
-                            'error': result.get('error')
-                        }) + '\n'
-                        failure_count += 1
+                    issue_jobs.append(issue_exporter.prepare_from_issue_model(issue, audit_uuid, context=issue_id))
 
                 except Exception as e:
+                    current_item += 1
                     logger.error(f"Error exporting issue {issue_id}: {e}")
                     yield json.dumps({
                         'type': 'error',
@@ -645,6 +535,15 @@ def upload_to_drupal(project_id):
                     }) + '\n'
                     failure_count += 1
 
+            for job, result in engine.export(issue_jobs, force=force):
+                current_item += 1
+                _record_export_result(db.issues, job.context, result, nid_field='drupal_nid')
+                yield _export_message(job, result, current_item, total_items)
+                if result.get('success'):
+                    success_count += 1
+                else:
+                    failure_count += 1
+
             # Process automated test results if filters provided
             if automated_test_filters:
                 yield json.dumps({
@@ -782,6 +681,7 @@ def upload_to_drupal(project_id):
                     pages_synced = 0
                     pages_failed = 0
 
+                    auto_page_jobs = []
                     for page_id in all_page_ids:
                         try:
                             page_doc = db.discovered_pages.find_one({'_id': ObjectId(page_id)})
@@ -790,39 +690,18 @@ def upload_to_drupal(project_id):
                                 continue
 
                             disc_page = DiscoveredPage.from_dict(page_doc)
-
-                            # Export page
-                            result = page_exporter.export_from_discovered_page_model(disc_page, audit_uuid)
-
-                            if result.get('success'):
-                                # Update database with Drupal UUID
-                                db.discovered_pages.update_one(
-                                    {'_id': ObjectId(page_id)},
-                                    {
-                                        '$set': {
-                                            'drupal_uuid': result['uuid'],
-                                            'drupal_sync_status': DrupalSyncStatus.SYNCED.value,
-                                            'drupal_last_synced': datetime.now(),
-                                            'drupal_error_message': None
-                                        }
-                                    }
-                                )
-                                pages_synced += 1
-                            else:
-                                db.discovered_pages.update_one(
-                                    {'_id': ObjectId(page_id)},
-                                    {
-                                        '$set': {
-                                            'drupal_sync_status': DrupalSyncStatus.SYNC_FAILED.value,
-                                            'drupal_error_message': result.get('error', 'Unknown error')
-                                        }
-                                    }
-                                )
-                                pages_failed += 1
+                            auto_page_jobs.append(page_exporter.prepare_from_discovered_page_model(disc_page, audit_uuid, context=page_id))
                         except Exception as e:
                             logger.error(f"Error syncing discovered page {page_id}: {e}")
                             pages_failed += 1
 
+                    for job, result in engine.export(auto_page_jobs, force=force):
+                        _record_export_result(db.discovered_pages, job.context, result)
+                        if result.get('success'):
+                            pages_synced += 1
+                        else:
+                            pages_failed += 1
+
                     yield json.dumps({
                         'type': 'info',
                         'message': f'Discovered Pages synced: {pages_synced}, failed: {pages_failed}'
@@ -836,7 +715,9 @@ def upload_to_drupal(project_id):
 
                     issues_created = 0
                     issues_updated = 0
+                    issues_unchanged = 0
                     issues_failed = 0
+                    auto_issue_jobs = []
 
                     # Deduplicate violations before upload
                     def deduplicate_violations_for_upload(report_data):
@@ -985,8 +866,8 @@ def upload_to_drupal(project_id):
                                     description += f"<li>{html_module.escape(page)}</li>\n"
                                 description += "</ul>"
 
-                            # Upload issue to Drupal
-                            result = issue_exporter.export_issue(
+                            # Queue issue for upload to Drupal
+                            auto_issue_jobs.append(issue_exporter.prepare_issue(
                                 title=violation.description[:255],
                                 description=description,
                                 audit_uuid=audit_uuid,
@@ -997,45 +878,54 @@ def upload_to_drupal(project_id):
                                 xpath=violation.xpath or violation.metadata.get('xpath'),
                                 url=page_url,
                                 existing_uuid=existing_uuid,
-                                discovered_page_uuid=discovered_page_uuid
-                            )
+                                discovered_page_uuid=discovered_page_uuid,
+                                key=f'automated:{project_id}:{violation.unique_id}',
+                                previous_hash=existing_issue.get('drupal_content_hash') if existing_issue else None,
+                                context=violation
+                            ))
 
-                            if result.get('success'):
-                                # Store/update issue reference in database using unique_id
-                                db.drupal_issues.update_one(
-                                    {'unique_id': violation.unique_id, 'project_id': project_id},
-                                    {
-                                        '$set': {
-                                            'drupal_uuid': result['uuid'],
-                                            'drupal_id': result.get('id'),
-                                            'updated_at': datetime.now(),
-                                            'discovered_page_id': violation.discovered_page_id
-                                        },
-                                        '$setOnInsert': {
-                                            'unique_id': violation.unique_id,
-                                            'violation_id': violation.id,  # Keep for reference
-                                            'project_id': project_id,
-                                            'created_at': datetime.now()
-                                        }
+                        except Exception as e:
+                            issues_failed += 1
+                            logger.error(f"Error uploading issue: {e}")
+
+                    for job, result in engine.export(auto_issue_jobs, force=force):
+                        violation = job.context
+                        if result.get('success'):
+                            # Store/update issue reference in database using unique_id
+                            db.drupal_issues.update_one(
+                                {'unique_id': violation.unique_id, 'project_id': project_id},
+                                {
+                                    '$set': {
+                                        'drupal_uuid': result['uuid'],
+                                        'drupal_id': result.get('id'),
+                                        'drupal_content_hash': result['content_hash'],
+                                        'updated_at': datetime.now(),
+                                        'discovered_page_id': violation.discovered_page_id
                                     },
-                                    upsert=True
-                                )
+                                    '$setOnInsert': {
+                                        'unique_id': violation.unique_id,
+                                        'violation_id': violation.id,  # Keep for reference
+                                        'project_id': project_id,
+                                        'created_at': datetime.now()
+                                    }
+                                },
+                                upsert=True
+                            )
 
-                                if existing_uuid:
-                                    issues_updated += 1
-                                else:
-                                    issues_created += 1
+                            if result['action'] == 'created':
+                                issues_created += 1
+                            elif result['action'] == 'updated':
+                                issues_updated += 1
                             else:
-                                issues_failed += 1
-                                logger.error(f"Failed to upload issue: {result.get('error')}")
-
-                        except Exception as e:
+                                issues_unchanged += 1
+                        else:
                             issues_failed += 1
-                            logger.error(f"Error uploading issue: {e}")
+                            logger.error(f"Failed to upload issue: {result.get('error')}")
 
                     yield json.dumps({
                         'type': 'info',
-                        'message': f'Issues created: {issues_created}, updated: {issues_updated}, failed: {issues_failed}'
+                        'message': f'Issues created: {issues_created}, updated: {issues_updated}, '
+                                   f'unchanged: {issues_unchanged}, failed: {issues_failed}'
                     }) + '\n'
 
                 except Exception as e:
@@ -1129,16 +1019,83 @@ def list_recordings(project_id):
         return jsonify({'error': str(e)}), 500
 
 
+def _full_sync_requested() -> bool:
+    """Whether an import request asks to fetch every node instead of a delta"""
+    data = request.get_json(silent=True) or {}
+    return request.args.get('full') in ('1', 'true') or bool(data.get('full_sync'))
+
+
+def _import_sync_mark(db, collection, project_id, resource, audit_uuid, full_sync):
+    """
+    High-water mark to import from, or None for a full import.
+
+    A full import is also done when none of the project's records came from
+    Drupal yet, so a deleted local collection is filled again.
+    """
+    if full_sync:
+        return None
+    mark = db.get_drupal_sync_mark(project_id, resource, audit_uuid)
+    if mark is None or not collection.find_one({'project_id': project_id, 'drupal_uuid': {'$ne': None}}, {'_id': 1}):
+        return None
+    return mark
+
+
+def _upsert_drupal_documents(collection, documents, drupal_fields):
+    """
+    Upsert imported documents keyed by their Drupal UUID.
+
+    Fields in drupal_fields are overwritten on existing documents; the rest
+    are only written when the document is created, so local edits survive.
+
+    Returns:
+        (UUIDs that already existed, error message by document index)
+    """
+    uuids = [document['drupal_uuid'] for document in documents]
+    existing = {
+        doc['drupal_uuid'] for doc in collection.find({'drupal_uuid': {'$in': uuids}}, {'drupal_uuid': 1})
+    }
+
+    operations = []
+    for document in documents:
+        document.pop('_id', None)
+        update = {'$set': {field: document[field] for field in drupal_fields if field in document}}
+        insert_only = {field: value for field, value in document.items() if field not in update['$set']}
+        if insert_only:
+            update['$setOnInsert'] = insert_only
+        operations.append(UpdateOne({'drupal_uuid': document['drupal_uuid']}, update, upsert=True))
+
+    return existing, bulk_upsert(collection, operations)
+
+
+# Fields Drupal owns on imported discovered pages and issues
+IMPORTED_PAGE_FIELDS = [
+    'title', 'url', 'interested_because', 'page_elements', 'private_notes', 'public_notes',
+    'include_in_report', 'audited', 'manual_audit', 'document_links',
+    'drupal_uuid', 'drupal_sync_status', 'drupal_last_synced', 'drupal_error_message', 'updated_at'
+]
+IMPORTED_ISSUE_FIELDS = [
+    'title', 'description', 'impact', 'issue_type', 'location_on_page', 'wcag_criteria', 'xpath', 'url',
+    'video_timecode', 'project_id', 'updated_at', 'drupal_issue_id', 'drupal_uuid', 'drupal_nid',
+    'drupal_sync_status', 'drupal_last_synced', 'drupal_error_message'
+]
+
+
 @drupal_sync_bp.route('/projects/<project_id>/sync/import-pages', methods=['POST'])
 def import_discovered_pages(project_id):
     """
     Import discovered pages from Drupal for a project.
 
+    Only pages changed since the last import are fetched, unless the request
+    asks for a full import with ?full=1 or {"full_sync": true}.
+
     Streams progress updates as JSON lines.
     """
+    full_sync = _full_sync_requested()
+
     def generate():
         try:
             db = current_app.db
+            started_at = time.time()
 
             # Get project
             project_doc = db.projects.find_one({'_id': ObjectId(project_id)})
@@ -1176,85 +1133,61 @@ def import_discovered_pages(project_id):
             taxonomies = DiscoveredPageTaxonomies(client)
             importer = DiscoveredPageImporter(client, taxonomies)
 
-            yield json.dumps({'type': 'info', 'message': 'Fetching discovered pages from Drupal...'}) + '\n'
+            mark = _import_sync_mark(db, db.discovered_pages, project_id, 'discovered_pages', audit_uuid, full_sync)
+            if mark is None:
+                yield json.dumps({'type': 'info', 'message': 'Fetching all discovered pages from Drupal...'}) + '\n'
+            else:
+                since = datetime.fromtimestamp(mark).strftime('%Y-%m-%d %H:%M')
+                yield json.dumps({'type': 'info', 'message': f'Fetching discovered pages changed since {since}...'}) + '\n'
 
             # Fetch discovered pages from Drupal
-            drupal_pages = importer.fetch_discovered_pages_for_audit(audit_uuid)
+            drupal_pages = importer.fetch_discovered_pages_for_audit(audit_uuid, changed_since=mark)
 
             logger.info(f"[IMPORT DEBUG] Fetched {len(drupal_pages)} pages from Drupal for audit {audit_uuid}")
-            for idx, page in enumerate(drupal_pages, 1):
-                logger.info(f"[IMPORT DEBUG] Page {idx}: Title='{page['title']}', UUID={page['uuid']}, URL={page['url']}")
+            yield json.dumps({'type': 'info', 'message': f'Found {len(drupal_pages)} changed discovered pages in Drupal'}) + '\n'
 
-            yield json.dumps({'type': 'info', 'message': f'Found {len(drupal_pages)} discovered pages in Drupal'}) + '\n'
+            documents = []
+            for drupal_page in drupal_pages:
+                page_data = importer.import_to_discovered_page_model(drupal_page, project_id)
+                documents.append(DiscoveredPage(**page_data).to_dict())
+
+            existing, errors = _upsert_drupal_documents(db.discovered_pages, documents, IMPORTED_PAGE_FIELDS)
 
-            # Import each page
             imported_count = 0
             updated_count = 0
             skipped_count = 0
 
             for i, drupal_page in enumerate(drupal_pages, 1):
-                try:
-                    # Check if page already exists with this Drupal UUID
-                    existing_page = db.discovered_pages.find_one({
-                        'drupal_uuid': drupal_page['uuid']
-                    })
-
-                    if existing_page:
-                        # Update existing page
-                        page_model = DiscoveredPage.from_dict(existing_page)
-
-                        # Update fields
-                        page_model.title = drupal_page['title']
-                        page_model.url = drupal_page['url']
-                        page_model.interested_because = drupal_page['interested_because']
-                        page_model.page_elements = drupal_page['page_elements']
-                        page_model.private_notes = drupal_page['private_notes']
-                        page_model.public_notes = drupal_page['public_notes']
-                        page_model.include_in_report = drupal_page['include_in_report']
-                        page_model.audited = drupal_page['audited']
-                        page_model.manual_audit = drupal_page['manual_audit']
-                        page_model.document_links = drupal_page['document_links']
-                        page_model.drupal_sync_status = DrupalSyncStatus.SYNCED
-                        page_model.drupal_last_synced = datetime.now()
-                        page_model.drupal_error_message = None
-
-                        db.discovered_pages.update_one(
-                            {'_id': existing_page['_id']},
-                            {'$set': page_model.to_dict()}
-                        )
-
-                        updated_count += 1
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': i,
-                            'total': len(drupal_pages),
-                            'item': f'Updated: {drupal_page["title"]}'
-                        }) + '\n'
-                    else:
-                        # Create new page
-                        page_data = importer.import_to_discovered_page_model(drupal_page, project_id)
-                        page_model = DiscoveredPage(**page_data)
-
-                        db.discovered_pages.insert_one(page_model.to_dict())
-
-                        imported_count += 1
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': i,
-                            'total': len(drupal_pages),
-                            'item': f'Imported: {drupal_page["title"]}'
-                        }) + '\n'
-
-                except Exception as e:
-                    logger.error(f"Error importing page {drupal_page.get('title')}: {e}")
+                if i - 1 in errors:
+                    logger.error(f"Error importing page {drupal_page.get('title')}: {errors[i - 1]}")
                     skipped_count += 1
                     yield json.dumps({
                         'type': 'error',
                         'current': i,
                         'total': len(drupal_pages),
                         'item': drupal_page.get('title', 'Unknown'),
-                        'error': str(e)
+                        'error': errors[i - 1]
                     }) + '\n'
+                    continue
+
+                if drupal_page['uuid'] in existing:
+                    updated_count += 1
+                    action = 'Updated'
+                else:
+                    imported_count += 1
+                    action = 'Imported'
+                yield json.dumps({
+                    'type': 'success',
+                    'current': i,
+                    'total': len(drupal_pages),
+                    'item': f'{action}: {drupal_page["title"]}'
+                }) + '\n'
+
+            # Pages that failed are fetched again next time
+            if not errors:
+                db.set_drupal_sync_mark(
+                    project_id, 'discovered_pages', audit_uuid, high_water_mark(drupal_pages, mark, started_at)
+                )
 
             # Send completion
             yield json.dumps({
@@ -1262,7 +1195,8 @@ def import_discovered_pages(project_id):
                 'imported': imported_count,
                 'updated': updated_count,
                 'skipped': skipped_count,
-                'total': len(drupal_pages)
+                'total': len(drupal_pages),
+                'full_sync': mark is None
             }) + '\n'
 
         except Exception as e:
@@ -1315,11 +1249,17 @@ def import_issues(project_id):
     """
     Import issues from Drupal for a project.
 
+    Only issues changed since the last import are fetched, unless the
+    request asks for a full import with ?full=1 or {"full_sync": true}.
+
     Streams progress updates as JSON lines.
     """
+    full_sync = _full_sync_requested()
+
     def generate():
         try:
             db = current_app.db
+            started_at = time.time()
 
             # Get project
             project_doc = db.projects.find_one({'_id': ObjectId(project_id)})
@@ -1349,78 +1289,59 @@ def import_issues(project_id):
             # Initialize importer
             importer = IssueImporter(client)
 
-            yield json.dumps({'type': 'info', 'message': 'Fetching issues from Drupal...'}) + '\n'
+            mark = _import_sync_mark(db, db.issues, project_id, 'issues', audit_uuid, full_sync)
+            if mark is None:
+                yield json.dumps({'type': 'info', 'message': 'Fetching all issues from Drupal...'}) + '\n'
+            else:
+                since = datetime.fromtimestamp(mark).strftime('%Y-%m-%d %H:%M')
+                yield json.dumps({'type': 'info', 'message': f'Fetching issues changed since {since}...'}) + '\n'
 
             # Fetch issues from Drupal
-            drupal_issues = importer.fetch_issues_for_audit(audit_uuid)
+            drupal_issues = importer.fetch_issues_for_audit(audit_uuid, changed_since=mark)
 
             logger.info(f"[IMPORT DEBUG] Fetched {len(drupal_issues)} issues from Drupal for audit {audit_uuid}")
-            for idx, issue in enumerate(drupal_issues, 1):
-                logger.info(f"[IMPORT DEBUG] Issue {idx}: Title='{issue['title']}', UUID={issue['uuid']}, Impact={issue['impact']}")
+            yield json.dumps({'type': 'info', 'message': f'Found {len(drupal_issues)} changed issues in Drupal'}) + '\n'
 
-            yield json.dumps({'type': 'info', 'message': f'Found {len(drupal_issues)} issues in Drupal'}) + '\n'
+            documents = [importer.to_database_dict(drupal_issue, project_id) for drupal_issue in drupal_issues]
+            existing, errors = _upsert_drupal_documents(db.issues, documents, IMPORTED_ISSUE_FIELDS)
 
-            # Import each issue
             imported_count = 0
             updated_count = 0
             skipped_count = 0
 
             for i, drupal_issue in enumerate(drupal_issues, 1):
-                try:
-                    yield json.dumps({
-                        'type': 'progress',
-                        'current': i,
-                        'total': len(drupal_issues),
-                        'item': drupal_issue['title'],
-                        'status': 'importing'
-                    }) + '\n'
-
-                    # Check if issue already exists by UUID
-                    existing_issue = db.issues.find_one({'drupal_uuid': drupal_issue['uuid']})
-
-                    if existing_issue:
-                        # Update existing issue
-                        issue_dict = importer.to_database_dict(drupal_issue, project_id)
-                        issue_dict['_id'] = existing_issue['_id']
-
-                        db.issues.update_one(
-                            {'_id': existing_issue['_id']},
-                            {'$set': issue_dict}
-                        )
-
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': i,
-                            'total': len(drupal_issues),
-                            'item': drupal_issue['title'],
-                            'action': 'updated'
-                        }) + '\n'
-                        updated_count += 1
-
-                    else:
-                        # Create new issue
-                        issue_dict = importer.to_database_dict(drupal_issue, project_id)
-                        db.issues.insert_one(issue_dict)
-
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': i,
-                            'total': len(drupal_issues),
-                            'item': drupal_issue['title'],
-                            'action': 'imported'
-                        }) + '\n'
-                        imported_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error importing issue {drupal_issue.get('title')}: {e}")
+                if i - 1 in errors:
+                    logger.error(f"Error importing issue {drupal_issue.get('title')}: {errors[i - 1]}")
                     skipped_count += 1
                     yield json.dumps({
                         'type': 'error',
                         'current': i,
                         'total': len(drupal_issues),
                         'item': drupal_issue.get('title', 'Unknown'),
-                        'error': str(e)
+                        'error': errors[i - 1]
                     }) + '\n'
+                    continue
+
+                if drupal_issue['uuid'] in existing:
+                    updated_count += 1
+                    action = 'updated'
+                else:
+                    imported_count += 1
+                    action = 'imported'
+                yield json.dumps({
+                    'type': 'success',
+                    'current': i,
+                    'total': len(drupal_issues),
+                    'item': drupal_issue['title'],
+                    'action': action
+                }) + '\n'
+
+            # Issues that failed are fetched again next time
+            if not errors:
+                db.set_drupal_sync_mark(
+                    project_id, 'issues', audit_uuid,
+                    high_water_mark(drupal_issues, mark, started_at, field='changed_timestamp')
+                )
 
             # Send completion
             yield json.dumps({
@@ -1428,7 +1349,8 @@ def import_issues(project_id):
                 'imported': imported_count,
                 'updated': updated_count,
                 'skipped': skipped_count,
-                'total': len(drupal_issues)
+                'total': len(drupal_issues),
+                'full_sync': mark is None
             }) + '\n'
 
         except Exception as e:
@@ -1600,12 +1522,12 @@ def upload_automated_results_to_drupal(project_id):
             success_count = 0
             failure_count = 0
 
+            page_jobs = []
             for page_id in all_page_ids:
-                current_item += 1
-
                 try:
                     page_doc = db.discovered_pages.find_one({'_id': ObjectId(page_id)})
                     if not page_doc:
+                        current_item += 1
                         yield json.dumps({
                             'type': 'error',
                             'current': current_item,
@@ -1617,63 +1539,10 @@ def upload_automated_results_to_drupal(project_id):
                         continue
 
                     page = DiscoveredPage.from_dict(page_doc)
-
-                    yield json.dumps({
-                        'type': 'progress',
-                        'current': current_item,
-                        'total': total_discovered_pages,
-                        'item': page.title,
-                        'status': 'exporting'
-                    }) + '\n'
-
-                    # Export page
-                    result = page_exporter.export_from_discovered_page_model(page, audit_uuid)
-
-                    if result.get('success'):
-                        # Update database with Drupal UUID
-                        db.discovered_pages.update_one(
-                            {'_id': ObjectId(page_id)},
-                            {
-                                '$set': {
-                                    'drupal_uuid': result['uuid'],
-                                    'drupal_sync_status': 'synced',
-                                    'drupal_last_synced': datetime.now(),
-                                    'drupal_error_message': None
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'success',
-                            'current': current_item,
-                            'total': total_discovered_pages,
-                            'item': page.title,
-                            'uuid': result['uuid'],
-                            'nid': result.get('nid')
-                        }) + '\n'
-                        success_count += 1
-                    else:
-                        # Update database with error
-                        db.discovered_pages.update_one(
-                            {'_id': ObjectId(page_id)},
-                            {
-                                '$set': {
-                                    'drupal_sync_status': 'sync_failed',
-                                    'drupal_error_message': result.get('error')
-                                }
-                            }
-                        )
-
-                        yield json.dumps({
-                            'type': 'error',
-                            'current': current_item,
-                            'total': total_discovered_pages,
-                            'item': page.title,
-                            'error': result.get('error')
-                        }) + '\n'
-                        failure_count += 1
+                    page_jobs.append(page_exporter.prepare_from_discovered_page_model(page, audit_uuid, context=page_id))
 
                 except Exception as e:
+                    current_item += 1
                     logger.error(f"Error exporting page {page_id}: {e}")
                     yield json.dumps({
                         'type': 'error',
@@ -1684,6 +1553,15 @@ def upload_automated_results_to_drupal(project_id):
                     }) + '\n'
                     failure_count += 1
 
+            for job, result in _get_export_engine(client).export(page_jobs):
+                current_item += 1
+                _record_export_result(db.discovered_pages, job.context, result)
+                yield _export_message(job, result, current_item, total_discovered_pages)
+                if result.get('success'):
+                    success_count += 1
+                else:
+                    failure_count += 1
+
             # Send completion
             yield json.dumps({
                 'type': 'complete',
@@ -4,6 +4,7 @@ Page management routes
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
 from flask_babel import gettext as _, lazy_gettext, force_locale
+from auto_a11y.core.template_sampling import TemplateExtrapolation
 from auto_a11y.models import PageStatus
 from auto_a11y.reporting.issue_catalog import IssueCatalog
 from auto_a11y.reporting.wcag_mapper import enrich_wcag_criteria
@@ -211,6 +212,14 @@ def view_page(page_id):
             'total_tests': total_tests
         }
 
+    # Findings of the template representatives, for pages tested with the light touchpoint subset
+    template_sampling = None
+    if test_result:
+        template_sampling = TemplateExtrapolation(current_app.db).findings_for(page.website_id, test_result)
+        if template_sampling:
+            for kind in ('violations', 'warnings'):
+                template_sampling[kind] = [IssueCatalog.enrich_issue(issue) for issue in template_sampling[kind]]
+
     # Get test history
     test_history = current_app.db.get_test_results(page_id=page_id, limit=10)
 
@@ -278,6 +287,7 @@ def view_page(page_id):
                          selected_state_index=selected_state_index,  # NEW: Currently selected state
                          score_data=score_data,
                          compliance_score=compliance_score,
+                         template_sampling=template_sampling,
                          test_history=test_history,
                          website_users=website_users,
                          touchpoint_names=touchpoint_names)
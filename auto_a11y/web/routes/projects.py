@@ -8,6 +8,9 @@ from flask_login import login_required
 from flask import g
 from auto_a11y.models import Project, ProjectStatus, ProjectType
 from auto_a11y.models.app_user import UserRole
+from auto_a11y.core.template_sampling import (
+    DEFAULT_LIGHT_TOUCHPOINTS, DEFAULT_REPRESENTATIVES, light_touchpoint_choices, parse_light_touchpoints
+)
 from auto_a11y.web.routes.auth import auditor_required, project_role_required, get_effective_role
 from flask_login import current_user
 import logging
@@ -310,6 +313,17 @@ def create_project():
         # Get headless browser setting
         headless_browser = request.form.get('headless_browser', 'default')
 
+        # Get template sampling setting
+        try:
+            sampling_representatives = max(1, int(request.form.get('template_sampling_representatives', DEFAULT_REPRESENTATIVES)))
+        except (ValueError, TypeError):
+            sampling_representatives = DEFAULT_REPRESENTATIVES
+        template_sampling = {
+            'enabled': request.form.get('template_sampling') == 'true',
+            'representatives': sampling_representatives,
+            'light_touchpoints': parse_light_touchpoints(request.form.getlist('template_sampling_light_touchpoints'))
+        }
+
         # Create project with WCAG level, touchpoints, AI config, and stealth mode
         project = Project(
             name=name,
@@ -327,7 +341,8 @@ def create_project():
                 'touchpoints': touchpoints_config,
                 'enable_ai_testing': enable_ai_testing,
                 'ai_tests': ai_tests,
-                'stealth_mode': stealth_mode
+                'stealth_mode': stealth_mode,
+                'template_sampling': template_sampling
             }
         )
         
@@ -477,7 +492,9 @@ def create_project():
                          debug_mode=debug_mode,
                          tests_by_touchpoint=dict(tests_by_touchpoint),
                          touchpoint_names=touchpoint_names,
-                         production_ready_statuses=production_ready_statuses)
+                         production_ready_statuses=production_ready_statuses,
+                         light_touchpoint_choices=light_touchpoint_choices(),
+                         default_light_touchpoints=DEFAULT_LIGHT_TOUCHPOINTS)
 
 
 @projects_bp.route('/<project_id>')
@@ -668,6 +685,18 @@ def edit_project(project_id):
         stealth_mode = request.form.get('stealth_mode') == 'true'
         project.config['stealth_mode'] = stealth_mode
 
+        # Update template sampling
+        template_sampling = dict(project.config.get('template_sampling') or {})
+        template_sampling['enabled'] = request.form.get('template_sampling') == 'true'
+        try:
+            template_sampling['representatives'] = max(1, int(request.form.get('template_sampling_representatives', DEFAULT_REPRESENTATIVES)))
+        except (ValueError, TypeError):
+            template_sampling['representatives'] = DEFAULT_REPRESENTATIVES
+        template_sampling['light_touchpoints'] = parse_light_touchpoints(
+            request.form.getlist('template_sampling_light_touchpoints')
+        )
+        project.config['template_sampling'] = template_sampling
+
         # Update font accessibility configuration
         use_default_fonts = request.form.get('use_default_fonts') == 'on'
         additional_fonts_raw = request.form.get('additional_inaccessible_fonts', '').strip()
@@ -692,7 +721,9 @@ def edit_project(project_id):
     return render_template('projects/edit.html',
                          project=project,
                          touchpoint_names=touchpoint_names,
-                         touchpoint_test_mapping=TOUCHPOINT_TEST_MAPPING)
+                         touchpoint_test_mapping=TOUCHPOINT_TEST_MAPPING,
+                         light_touchpoint_choices=light_touchpoint_choices(),
+                         default_light_touchpoints=DEFAULT_LIGHT_TOUCHPOINTS)
 
 
 @projects_bp.route('/<project_id>/delete', methods=['POST'])
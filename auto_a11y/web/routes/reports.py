@@ -2,12 +2,15 @@
 Report generation routes
 """
 
-from flask import Blueprint, render_template, request, jsonify, send_file, current_app, url_for, flash, redirect, session, g
+from flask import Blueprint, render_template, request, jsonify, send_file, current_app, url_for, flash, redirect, session, g, Response, stream_with_context
 from flask_babel import get_locale, gettext as _
+from flask_login import current_user
 from auto_a11y.models import PageStatus
 from auto_a11y.reporting import ReportGenerator, PageStructureReport
-from auto_a11y.reporting.discovery_report import DiscoveryReportGenerator
-from auto_a11y.reporting.static_html_generator import StaticHTMLReportGenerator
+from auto_a11y.reporting.report_jobs import build_report_spec, submit_report
+from auto_a11y.reporting.item_export import EXPORT_FORMATS, build_item_filter, stream_items
+from auto_a11y.core.job_manager import JobManager, JobStatus, JobType
+from auto_a11y.web.routes.auth import get_effective_role
 from datetime import datetime
 import logging
 import json
@@ -17,6 +20,78 @@ logger = logging.getLogger(__name__)
 reports_bp = Blueprint('reports', __name__)
 
 
+def _use_work_queue() -> bool:
+    """Whether background jobs go to the durable work queue instead of the in-process task runner"""
+    return getattr(current_app.app_config, 'JOB_EXECUTION_MODE', 'inline') == 'queue'
+
+
+def _wants_json() -> bool:
+    """Whether the request was made by dashboard JavaScript rather than a plain form post"""
+    return request.is_json or request.accept_mimetypes.best == 'application/json'
+
+
+def _submit_report(spec, force=False):
+    """
+    Serve a report from the artifact cache or start a background job for it
+
+    Returns:
+        JSON-serializable response describing the cached file or the job
+    """
+    submission = submit_report(
+        current_app.db,
+        current_app.app_config.__dict__,
+        spec,
+        use_queue=_use_work_queue(),
+        user_id=session.get('user_id'),
+        session_id=session.get('session_id'),
+        force=force
+    )
+
+    if submission['cached']:
+        return {
+            'success': True,
+            'cached': True,
+            'status': JobStatus.COMPLETED.value,
+            'message': _('Report is up to date with the latest test results'),
+            'download_url': url_for('reports.download_report', filename=submission['filename'])
+        }
+
+    return {
+        'success': True,
+        'cached': False,
+        'job_id': submission['job_id'],
+        'report_id': submission['job_id'],
+        'status': JobStatus.PENDING.value,
+        'message': _('Report generation started'),
+        'status_url': url_for('reports.report_status', report_id=submission['job_id'])
+    }
+
+
+def _report_redirect(response):
+    """Flash the outcome of a report submission and return to the dashboard"""
+    if response['cached']:
+        flash(_('Report is up to date with the latest test results. Download it from the list below.'), 'success')
+    else:
+        flash(_('Report generation started. It will appear in the list below when complete.'), 'info')
+    return redirect(url_for('reports.reports_dashboard'))
+
+
+def _can_view_report_job(job) -> bool:
+    """
+    Whether the current user may see a report job
+
+    Project and website reports follow the project's permissions; reports
+    across all projects are only visible to superadmins.
+    """
+    if getattr(current_user, 'is_superadmin', False):
+        return True
+    if not (job.get('project_id') or job.get('website_id')):
+        return False
+    return get_effective_role(
+        current_user, project_id=job.get('project_id'), website_id=job.get('website_id')
+    ) is not None
+
+
 @reports_bp.route('/dashboard')
 def reports_dashboard():
     """Reports dashboard"""
@@ -109,56 +184,16 @@ def generate_report():
         scope = 'website'
         scope_id = website_id
     
+    if report_type == 'excel':
+        report_type = 'xlsx'
+    elif report_type not in ('xlsx', 'pdf', 'json'):
+        report_type = 'html'
+
     try:
-        # Initialize report generator with current language
-        from auto_a11y.reporting import ReportGenerator
         current_language = str(get_locale()) if get_locale() else 'en'
-        generator = ReportGenerator(current_app.db, current_app.app_config.__dict__, language=current_language)
-        
-        # Generate report based on scope and type
-        if report_type == 'excel' or report_type == 'xlsx':
-            if scope == 'all':
-                # Generate report for all projects
-                report_path = generator.generate_all_projects_report(format='xlsx')
-            elif scope == 'project':
-                report_path = generator.generate_project_report(project_id=scope_id, format='xlsx')
-            else:
-                report_path = generator.generate_website_report(website_id=scope_id, format='xlsx')
-        elif report_type == 'pdf':
-            # Generate PDF report
-            if scope == 'all':
-                report_path = generator.generate_all_projects_report(format='pdf')
-            elif scope == 'project':
-                report_path = generator.generate_project_report(project_id=scope_id, format='pdf')
-            else:
-                report_path = generator.generate_website_report(website_id=scope_id, format='pdf')
-        elif report_type == 'json':
-            # Generate JSON report
-            if scope == 'all':
-                report_path = generator.generate_all_projects_report(format='json')
-            elif scope == 'project':
-                report_path = generator.generate_project_report(project_id=scope_id, format='json')
-            else:
-                report_path = generator.generate_website_report(website_id=scope_id, format='json')
-        else:
-            # HTML report
-            if scope == 'all':
-                report_path = generator.generate_all_projects_report(format='html')
-            elif scope == 'project':
-                report_path = generator.generate_project_report(project_id=scope_id, format='html')
-            else:
-                report_path = generator.generate_website_report(website_id=scope_id, format='html')
-        
-        # Store report metadata (in production, this would be saved to database)
-        report_id = f'report_{scope}_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-        
-        return jsonify({
-            'success': True,
-            'report_id': report_id,
-            'message': f'Report generated successfully',
-            'download_url': url_for('reports.download_report', filename=Path(report_path).name)
-        })
-        
+        spec = build_report_spec('accessibility', scope, scope_id, format=report_type, language=current_language)
+        return jsonify(_submit_report(spec, force=bool(data.get('force'))))
+
     except Exception as e:
         logger.error(f"Failed to generate report: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
@@ -167,13 +202,31 @@ def generate_report():
 @reports_bp.route('/report/<report_id>/status')
 def report_status(report_id):
     """Check report generation status"""
-    # In production, check actual job status
-    return jsonify({
+    job_manager = JobManager(current_app.db)
+    job = job_manager.collection.find_one(
+        {'job_id': report_id, 'job_type': JobType.REPORT_GENERATION.value},
+        {'project_id': 1, 'website_id': 1, 'result': 1}
+    )
+    snapshot = job_manager.get_job_snapshot(report_id) if job and _can_view_report_job(job) else None
+    if not snapshot:
+        return jsonify({'error': _('Report job not found')}), 404
+
+    progress = snapshot.get('progress') or {}
+    response = {
         'report_id': report_id,
-        'status': 'generating',
-        'progress': 75,
-        'message': 'Generating report...'
-    })
+        'status': snapshot['status'],
+        'progress': round(progress.get('percentage', 0)),
+        'message': progress.get('message', ''),
+        'error': snapshot.get('error')
+    }
+
+    if snapshot['status'] == JobStatus.COMPLETED.value:
+        job = job_manager.get_job(report_id) or {}
+        filename = (job.get('result') or {}).get('filename')
+        if filename:
+            response['download_url'] = url_for('reports.download_report', filename=filename)
+
+    return jsonify(response)
 
 
 @reports_bp.route('/download/<filename>')
@@ -220,8 +273,7 @@ def project_summary(project_id):
     
     # Aggregate data from all test results
     for website in websites:
-        pages = current_app.db.get_pages(website.id)
-        for page in pages:
+        for page in current_app.db.iter_page_refs(website.id, status=PageStatus.TESTED):
             if page.status == PageStatus.TESTED:
                 result = current_app.db.get_latest_test_result(page.id)
                 if result:
@@ -243,22 +295,99 @@ def project_summary(project_id):
 
 @reports_bp.route('/export-csv', methods=['POST'])
 def export_csv():
-    """Export data as CSV"""
-    data = request.get_json()
-    
+    """Export test result items as CSV through the streaming item export"""
+    data = request.get_json() or {}
+
     export_type = data.get('type')  # violations, pages, summary
-    filters = data.get('filters', {})
-    
-    # Generate CSV based on type
-    # This would be implemented with actual CSV generation
-    
+    filters = dict(data.get('filters', {}))
+    if export_type == 'violations':
+        filters.setdefault('item_type', 'violation')
+
+    params = {key: value for key, value in filters.items()
+              if key in ('website_id', 'project_id', 'touchpoint', 'impact', 'item_type', 'wcag')}
+    if not params.get('website_id') and not params.get('project_id'):
+        return jsonify({'success': False, 'error': 'website_id or project_id is required'}), 400
+
     return jsonify({
         'success': True,
-        'message': 'CSV export started',
-        'download_url': '/reports/download/export.csv'
+        'message': 'CSV export ready',
+        'download_url': url_for('reports.export_items', format='csv', **params)
     })
 
 
+def _list_arg(name):
+    """Read a filter given as repeated parameters and/or comma-separated values"""
+    values = []
+    for value in request.args.getlist(name):
+        values.extend(part.strip() for part in value.split(',') if part.strip())
+    return values
+
+
+@reports_bp.route('/export/items')
+def export_items():
+    """
+    Stream the latest test result items of a website or project
+
+    Query parameters:
+        website_id or project_id: Scope of the export
+        format: ndjson (default) or csv
+        touchpoint, impact, item_type, wcag: Filters; repeat the parameter or
+            separate values with commas
+        gzip: 1 to download a .gz file, 0 to disable compression; by default
+            the response is gzipped when the client accepts it
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f'Unsupported format: {export_format}'}), 400
+
+    db = current_app.db
+    website_id = request.args.get('website_id')
+    project_id = request.args.get('project_id')
+    if website_id:
+        website = db.get_website(website_id)
+        if not website:
+            return jsonify({'error': 'Website not found'}), 404
+        websites = [website]
+        export_name = f'website_{website_id}'
+    elif project_id:
+        if not db.get_project(project_id):
+            return jsonify({'error': 'Project not found'}), 404
+        websites = db.get_websites(project_id)
+        export_name = f'project_{project_id}'
+    else:
+        return jsonify({'error': 'website_id or project_id is required'}), 400
+
+    try:
+        item_filter = build_item_filter(
+            touchpoints=_list_arg('touchpoint'),
+            impacts=_list_arg('impact'),
+            item_types=_list_arg('item_type'),
+            wcag_criteria=_list_arg('wcag')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    gzip_param = request.args.get('gzip')
+    gzip_file = gzip_param == '1'
+    gzip_transport = gzip_param is None and 'gzip' in request.accept_encodings
+    chunks = stream_items(db, websites, item_filter, export_format, gzip=gzip_file or gzip_transport)
+
+    filename = f"findings_{export_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+    headers = {}
+    if gzip_file:
+        filename += '.gz'
+        mimetype = 'application/gzip'
+    else:
+        mimetype = EXPORT_FORMATS[export_format]
+        if gzip_transport:
+            headers['Content-Encoding'] = 'gzip'
+            headers['Vary'] = 'Accept-Encoding'
+    headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+    logger.info(f"Streaming {export_format} export of {export_name} with filter {item_filter}")
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+
 @reports_bp.route('/generate/page/<page_id>', methods=['POST'])
 def generate_page_report(page_id):
     """Generate report for a single page"""
@@ -465,22 +594,8 @@ def generate_discovery_website_report(website_id):
         # Get current language from session
         language = session.get('language', 'en')
 
-        # Initialize discovery report generator
-        generator = DiscoveryReportGenerator(
-            current_app.db,
-            current_app.app_config.__dict__,
-            language=language
-        )
-
-        # Generate report (saves to reports directory)
-        report_path = generator.generate_website_discovery_report(
-            website_id=website_id,
-            format=format
-        )
-
-        # Flash success message and redirect to dashboard
-        flash(f'Discovery report generated successfully!', 'success')
-        return redirect(url_for('reports.reports_dashboard'))
+        spec = build_report_spec('discovery', 'website', website_id, format=format, language=language)
+        return _report_redirect(_submit_report(spec))
 
     except Exception as e:
         logger.error(f"Failed to generate discovery report: {e}", exc_info=True)
@@ -497,22 +612,8 @@ def generate_discovery_project_report(project_id):
         # Get current language from session
         language = session.get('language', 'en')
 
-        # Initialize discovery report generator
-        generator = DiscoveryReportGenerator(
-            current_app.db,
-            current_app.app_config.__dict__,
-            language=language
-        )
-
-        # Generate report (saves to reports directory)
-        report_path = generator.generate_project_discovery_report(
-            project_id=project_id,
-            format=format
-        )
-
-        # Flash success message and redirect to dashboard
-        flash(f'Discovery report generated successfully!', 'success')
-        return redirect(url_for('reports.reports_dashboard'))
+        spec = build_report_spec('discovery', 'project', project_id, format=format, language=language)
+        return _report_redirect(_submit_report(spec))
 
     except Exception as e:
         logger.error(f"Failed to generate discovery report: {e}", exc_info=True)
@@ -530,102 +631,38 @@ def generate_static_html_report():
     wcag_level = request.form.get('wcag_level', 'AA')
 
     try:
-        # Collect all page IDs based on scope
-        page_ids = []
-        project_name = "Accessibility Report"
-        website_url = None
-        touchpoints_tested = None
-
         if project_id:
-            # Get all pages from all websites in project
-            project = current_app.db.get_project(project_id)
-            if not project:
+            if not current_app.db.get_project(project_id):
                 return jsonify({'error': 'Project not found'}), 404
-
-            project_name = project.name
-            websites = current_app.db.get_websites(project_id)
-
-            for website in websites:
-                pages = current_app.db.get_pages(website.id)
-                # Only include tested pages
-                page_ids.extend([str(p.id) for p in pages if p.status == PageStatus.TESTED])
-
-                # Get website URL from first website
-                if not website_url and website.url:
-                    website_url = website.url
-
+            scope, scope_id = 'project', project_id
         elif website_id:
-            # Get all pages from website
-            website = current_app.db.get_website(website_id)
-            if not website:
+            if not current_app.db.get_website(website_id):
                 return jsonify({'error': 'Website not found'}), 404
-
-            # Get project name if available
-            if website.project_id:
-                project = current_app.db.get_project(website.project_id)
-                if project:
-                    project_name = f"{project.name} - {website.name}"
-                else:
-                    project_name = website.name
-            else:
-                project_name = website.name
-
-            website_url = website.url
-            pages = current_app.db.get_pages(website_id)
-            # Only include tested pages
-            page_ids = [str(p.id) for p in pages if p.status == PageStatus.TESTED]
+            scope, scope_id = 'website', website_id
         else:
-            # Get all pages from all projects
-            projects = current_app.db.get_projects()
-            project_name = "All Projects Accessibility Report"
-
-            for project in projects:
-                websites = current_app.db.get_websites(project.id)
-                for website in websites:
-                    pages = current_app.db.get_pages(website.id)
-                    page_ids.extend([str(p.id) for p in pages if p.status == PageStatus.TESTED])
-
-        if not page_ids:
-            return jsonify({'error': 'No tested pages found to generate report'}), 400
-
-        # Get touchpoints from first page's test result
-        if page_ids:
-            first_result = current_app.db.get_latest_test_result(page_ids[0])
-            if first_result and first_result.violations:
-                touchpoints_set = set()
-                for violation in first_result.violations:
-                    if violation.touchpoint:
-                        touchpoints_set.add(violation.touchpoint)
-                touchpoints_tested = sorted(list(touchpoints_set))
+            scope, scope_id = 'all', None
 
         # Get current language from session
         language = session.get('language', 'en')
 
-        # Initialize static HTML generator
-        generator = StaticHTMLReportGenerator(
-            current_app.db,
-            output_dir=current_app.app_config.REPORTS_DIR,
-            language=language
-        )
-
-        # Generate report
-        zip_path = generator.generate_report(
-            page_ids=page_ids,
-            project_name=project_name,
-            website_url=website_url,
-            wcag_level=wcag_level,
-            touchpoints_tested=touchpoints_tested,
-            include_screenshots=include_screenshots,
-            include_discovery=include_discovery,
-            ai_tests_enabled=True
+        spec = build_report_spec(
+            'static_html', scope, scope_id, format='zip', language=language,
+            options={
+                'wcag_level': wcag_level,
+                'include_screenshots': include_screenshots,
+                'include_discovery': include_discovery
+            }
         )
+        response = _submit_report(spec)
 
-        # Flash success message and redirect to dashboard
-        flash(f'Static HTML report generated successfully! Download it from the list below.', 'success')
-        return redirect(url_for('reports.reports_dashboard'))
+        if _wants_json():
+            return jsonify(response)
+        return _report_redirect(response)
 
     except Exception as e:
         logger.error(f"Failed to generate static HTML report: {e}", exc_info=True)
+        if _wants_json():
+            return jsonify({'success': False, 'error': str(e)}), 500
         flash(f'Failed to generate report: {str(e)}', 'error')
         return redirect(url_for('reports.reports_dashboard'))
 
@@ -640,26 +677,25 @@ def generate_deduplicated_report():
         # Get current language from session
         language = session.get('language', 'en')
 
-        # Initialize static HTML generator
-        generator = StaticHTMLReportGenerator(
-            current_app.db,
-            output_dir=current_app.app_config.REPORTS_DIR,
-            language=language
-        )
+        # A website narrows the report; otherwise cover every website in the project
+        if website_id:
+            scope, scope_id = 'website', website_id
+        elif project_id:
+            scope, scope_id = 'project', project_id
+        else:
+            scope, scope_id = 'all', None
 
-        # Generate deduplicated report (returns ZIP path)
-        # If website_id is provided, pass it along; otherwise generate for all websites in project
-        zip_path = generator.generate_project_deduplicated_report(
-            project_id=project_id,
-            website_id=website_id if website_id else None
-        )
+        spec = build_report_spec('deduplicated', scope, scope_id, format='zip', language=language)
+        response = _submit_report(spec)
 
-        # Flash success message and redirect to dashboard
-        flash(f'Deduplicated report generated successfully!', 'success')
-        return redirect(url_for('reports.reports_dashboard'))
+        if _wants_json():
+            return jsonify(response)
+        return _report_redirect(response)
 
     except Exception as e:
         logger.error(f"Failed to generate deduplicated report: {e}", exc_info=True)
+        if _wants_json():
+            return jsonify({'success': False, 'error': str(e)}), 500
         flash(f'Failed to generate report: {str(e)}', 'error')
         return redirect(url_for('reports.reports_dashboard'))
 
@@ -2,19 +2,26 @@
 Testing and analysis routes
 """
 
-from flask import Blueprint, render_template, request, jsonify, current_app, url_for
+from flask import Blueprint, render_template, request, jsonify, current_app, url_for, Response
 from flask_login import login_required, current_user
 from auto_a11y.models import PageStatus
 from auto_a11y.models.app_user import UserRole
 from auto_a11y.web.routes.auth import project_role_required, get_effective_role
 from auto_a11y.core.job_manager import JobType, JobStatus
 import asyncio
+import hashlib
+import json
 import logging
+import math
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 testing_bp = Blueprint('testing', __name__)
 
+# Bounds of the reconnect delay (seconds) a job event client may ask for
+JOB_EVENTS_MIN_INTERVAL = 0.25
+JOB_EVENTS_MAX_INTERVAL = 30.0
+
 
 def calculate_aggregate_stats(db):
     """Calculate aggregate statistics across all projects"""
@@ -1285,6 +1292,44 @@ def job_status(job_id):
     })
 
 
+@testing_bp.route('/job/<job_id>/events')
+def job_events(job_id):
+    """
+    Send job status and progress to the browser as server-sent events
+
+    Each request answers at once with the current snapshot and closes. The
+    browser's EventSource reconnects after the advertised retry delay, so no
+    web worker is held for the length of a job. The snapshot fingerprint is
+    the event ID: a reconnect whose Last-Event-ID matches it gets no data.
+    """
+    from auto_a11y.core.job_manager import JobManager
+
+    # JobManager is the process-wide singleton: jobs running in this process
+    # are answered from its progress aggregator, others with one projected read
+    job_manager = JobManager(current_app.db)
+    interval = request.args.get('interval', 1.0, type=float)
+    if not math.isfinite(interval):
+        interval = 1.0
+    interval = min(max(interval, JOB_EVENTS_MIN_INTERVAL), JOB_EVENTS_MAX_INTERVAL)
+    retry = f"retry: {int(interval * 1000)}\n"
+
+    snapshot = job_manager.get_job_snapshot(job_id)
+    if not snapshot:
+        body = f"{retry}event: missing\ndata: {json.dumps({'job_id': job_id})}\n\n"
+    else:
+        payload = json.dumps(snapshot, default=str)
+        event_id = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+        if request.headers.get('Last-Event-ID') == event_id:
+            body = f"{retry}\n"
+        else:
+            body = f"{retry}id: {event_id}\ndata: {payload}\n\n"
+
+    response = Response(body, mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @testing_bp.route('/job/<job_id>/cancel', methods=['POST'])
 def cancel_job(job_id):
     """Cancel testing job"""
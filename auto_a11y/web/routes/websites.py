@@ -12,6 +12,34 @@ logger = logging.getLogger(__name__)
 websites_bp = Blueprint('websites', __name__)
 
 
+def _use_work_queue() -> bool:
+    """Whether jobs should be handed to standalone workers instead of run in-process"""
+    return getattr(current_app.app_config, 'JOB_EXECUTION_MODE', 'inline') == 'queue'
+
+
+def _enqueue_website_job(website_manager, job_id, job_type, website, payload, user_id, session_id):
+    """
+    Enqueue a discovery or testing job for a standalone worker
+
+    Returns:
+        The job ID
+    """
+    from auto_a11y.core.work_queue import WorkQueue, PRIORITY_HIGH
+
+    WorkQueue(website_manager.job_manager).enqueue(
+        job_id=job_id,
+        job_type=job_type,
+        payload=payload,
+        priority=PRIORITY_HIGH,
+        max_attempts=getattr(current_app.app_config, 'JOB_MAX_ATTEMPTS', 3),
+        website_id=website.id,
+        project_id=website.project_id,
+        user_id=user_id,
+        session_id=session_id
+    )
+    return job_id
+
+
 @websites_bp.route('/api/list')
 def api_list_websites():
     """API endpoint to list all websites"""
@@ -97,6 +125,7 @@ def view_website(website_id):
     # Get paginated pages for display - show ALL pages, not just latest discovery
     skip = (page_num - 1) * per_page
     pages = current_app.db.get_pages(website_id, limit=per_page, skip=skip, latest_only=False)
+    sampling_roles = current_app.db.get_template_sampling_roles(pages)
 
     # Calculate pagination info
     total_pages_pagination = (total_page_count + per_page - 1) // per_page  # Ceiling division
@@ -114,6 +143,7 @@ def view_website(website_id):
                          website=website,
                          project=project,
                          pages=pages,
+                         sampling_roles=sampling_roles,
                          stats=stats,
                          website_users=project_users,
                          pagination={
@@ -323,11 +353,24 @@ def discover_pages(website_id):
                 except:
                     pass
 
-        submitted_id = task_runner.submit_task(
-            func=discovery_wrapper,
-            args=(),
-            task_id=task_id
-        )
+        if _use_work_queue():
+            from auto_a11y.core.job_manager import JobType
+            submitted_id = _enqueue_website_job(
+                website_manager, task_id, JobType.DISCOVERY, website,
+                payload={
+                    'website_id': website_id,
+                    'max_pages': max_pages,
+                    'website_user_ids': website_user_ids
+                },
+                user_id=session_user_id,
+                session_id=session_id_value
+            )
+        else:
+            submitted_id = task_runner.submit_task(
+                func=discovery_wrapper,
+                args=(),
+                task_id=task_id
+            )
 
         logger.info(f"Discovery task submitted successfully with ID: {submitted_id}")
 
@@ -576,10 +619,12 @@ def test_all_pages(website_id):
     # Keep the old variable name for compatibility with existing code paths
     website_user_ids = user_ids
 
-    pages = current_app.db.get_pages(website_id)
     # Allow testing of all pages, not just untested ones
     # Users may want to re-test pages to check for improvements
-    testable_pages = [p for p in pages if p.status != PageStatus.TESTING]  # Exclude currently testing pages
+    testable_pages = [
+        p for p in current_app.db.iter_page_refs(website_id)
+        if p.status != PageStatus.TESTING  # Exclude currently testing pages
+    ]
 
     if not testable_pages:
         return jsonify({
@@ -694,11 +739,45 @@ def test_all_pages(website_id):
                     pass
 
         # Submit single testing task for all users
-        submitted_id = task_runner.submit_task(
-            func=testing_wrapper,
-            args=(),
-            task_id=job_id
-        )
+        shard_size = getattr(current_app.app_config, 'TEST_SHARD_SIZE', 0)
+        if _use_work_queue() and shard_size and len(testable_pages) > shard_size:
+            # Large site: split into shards that any free worker can pick up
+            from auto_a11y.core.job_sharding import enqueue_sharded_test
+            from auto_a11y.core.work_queue import WorkQueue, PRIORITY_HIGH
+            enqueue_sharded_test(
+                WorkQueue(website_manager.job_manager),
+                parent_job_id=job_id,
+                website_id=website_id,
+                project_id=website.project_id,
+                page_ids=[p.id for p in testable_pages],
+                shard_size=shard_size,
+                website_user_ids=website_user_ids,
+                user_id=session_user_id,
+                session_id=session_id_value,
+                priority=PRIORITY_HIGH,
+                max_attempts=getattr(current_app.app_config, 'JOB_MAX_ATTEMPTS', 3)
+            )
+            submitted_id = job_id
+        elif _use_work_queue():
+            from auto_a11y.core.job_manager import JobType
+            submitted_id = _enqueue_website_job(
+                website_manager, job_id, JobType.TESTING, website,
+                payload={
+                    'website_id': website_id,
+                    'page_ids': [p.id for p in testable_pages],
+                    'website_user_ids': website_user_ids,
+                    'take_screenshot': True,
+                    'run_ai_analysis': None
+                },
+                user_id=session_user_id,
+                session_id=session_id_value
+            )
+        else:
+            submitted_id = task_runner.submit_task(
+                func=testing_wrapper,
+                args=(),
+                task_id=job_id
+            )
 
         job_ids = [submitted_id]
         logger.info(f"Testing job submitted successfully with ID: {submitted_id} for {len(website_user_ids)} user(s)")
@@ -863,7 +942,7 @@ def test_status(website_id):
     
     # Otherwise, get page-level status (for backward compatibility)
     logger.warning(f"DEBUG test_status: using page-level status (no job_id)")
-    pages = current_app.db.get_pages(website_id)
+    pages = list(current_app.db.iter_page_refs(website_id))
     
     # Count pages by status
     total_pages = len(pages)
@@ -65,7 +65,28 @@ class Config:
     # Testing
     PARALLEL_TESTS: int = int(os.getenv('PARALLEL_TESTS', 5))
     TEST_TIMEOUT: int = int(os.getenv('TEST_TIMEOUT', 60000))
+    # Browser contexts used to test text contrast breakpoints in parallel (0 = resize the page sequentially)
+    CONTRAST_PARALLEL_VIEWPORTS: int = int(os.getenv('CONTRAST_PARALLEL_VIEWPORTS', 0))
+    # Elements (across shadow roots and same-origin frames) the accessibility tree snapshot covers per page
+    SNAPSHOT_NODE_BUDGET: int = int(os.getenv('SNAPSHOT_NODE_BUDGET', 20000))
     RUN_AI_ANALYSIS: bool = os.getenv('RUN_AI_ANALYSIS', 'True').lower() == 'true'
+
+    # Job execution
+    # JOB_EXECUTION_MODE: "inline" = run discovery/testing inside the web process (default),
+    #                     "queue" = enqueue for standalone workers started with `python run.py worker`
+    JOB_EXECUTION_MODE: str = os.getenv('JOB_EXECUTION_MODE', 'inline')
+    WORKER_CONCURRENCY: int = int(os.getenv('WORKER_CONCURRENCY', 1))
+    WORKER_LEASE_SECONDS: int = int(os.getenv('WORKER_LEASE_SECONDS', 120))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv('JOB_MAX_ATTEMPTS', 3))
+    # Queued website tests with more pages than this are split into shards (0 = never)
+    TEST_SHARD_SIZE: int = int(os.getenv('TEST_SHARD_SIZE', 100))
+    
+    # Reports
+    # Project Excel reports covering at least this many pages are streamed with
+    # write-only worksheets to keep memory flat (0 = always stream)
+    EXCEL_STREAMING_MIN_PAGES: int = int(os.getenv('EXCEL_STREAMING_MIN_PAGES', 500))
+    # Worker processes that render static HTML and PDF reports (0 = one per CPU up to 4, 1 = render serially)
+    REPORT_RENDER_WORKERS: int = int(os.getenv('REPORT_RENDER_WORKERS', 0))
     
     # Developer mode - show error codes in reports (useful for debugging)
     SHOW_ERROR_CODES: bool = os.getenv('SHOW_ERROR_CODES', 'False').lower() == 'true'
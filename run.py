@@ -110,16 +110,78 @@ def download_browser():
         return False
 
 
+def run_index_audit():
+    """Explain the app's main queries and report unindexed ones"""
+    from auto_a11y.core.index_audit import audit_indexes
+    from auto_a11y.core.index_migrations import get_index_version
+
+    logger = logging.getLogger(__name__)
+
+    db = Database(config.MONGODB_URI, config.DATABASE_NAME)
+    logger.info(f"Index migration version: {get_index_version(db)}")
+
+    problems = 0
+    for result in audit_indexes(db):
+        if result.get('error'):
+            status = 'ERROR'
+        elif result['collection_scan']:
+            status = 'COLLSCAN'
+        elif result['in_memory_sort']:
+            status = 'SORT'
+        else:
+            status = 'ok'
+        if status != 'ok':
+            problems += 1
+        indexes = ', '.join(result['indexes']) or '-'
+        logger.info(f"{status:8} {result['collection']:20} {result['description']} [{indexes}]")
+
+    if problems:
+        logger.warning(f"{problems} queries are not fully served by an index")
+        sys.exit(1)
+    logger.info("All audited queries use indexes")
+
+
+def run_worker(args):
+    """Run a standalone job worker until interrupted"""
+    from auto_a11y.core.queue_worker import QueueWorker
+
+    logger = logging.getLogger(__name__)
+
+    db = Database(config.MONGODB_URI, config.DATABASE_NAME)
+    if not db.test_connection():
+        logger.error("Failed to connect to database")
+        sys.exit(1)
+
+    task_types = [t.strip() for t in args.queues.split(',') if t.strip()] if args.queues else None
+    worker = QueueWorker(
+        db,
+        config,
+        concurrency=args.concurrency or config.WORKER_CONCURRENCY,
+        task_types=task_types,
+        worker_id=args.worker_id,
+        lease_seconds=config.WORKER_LEASE_SECONDS
+    )
+
+    logger.info(f"Worker {worker.worker_id} connected to {config.MONGODB_URI}/{config.DATABASE_NAME}")
+    worker.run()
+
+
 def main():
     """Main application entry point"""
     parser = argparse.ArgumentParser(description='Auto A11y Python - Accessibility Testing Tool')
+    parser.add_argument('command', nargs='?', default='serve', choices=['serve', 'worker'],
+                        help='serve (default) runs the web app, worker processes queued jobs')
     parser.add_argument('--host', default=None, help='Host to bind to')
     parser.add_argument('--port', type=int, default=None, help='Port to bind to')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--setup', action='store_true', help='Run initial setup')
     parser.add_argument('--test-db', action='store_true', help='Test database connection')
+    parser.add_argument('--audit-indexes', action='store_true', help='Report queries that scan collections or sort in memory')
     parser.add_argument('--download-browser', action='store_true', help='Download Chromium browser')
     parser.add_argument('--skip-browser', action='store_true', help='Skip browser download during setup')
+    parser.add_argument('--concurrency', type=int, default=None, help='Jobs a worker runs at once')
+    parser.add_argument('--queues', default=None, help='Comma-separated task types a worker accepts (e.g. testing,discovery)')
+    parser.add_argument('--worker-id', default=None, help='Worker identifier (defaults to host:pid)')
     
     args = parser.parse_args()
     
@@ -153,6 +215,11 @@ def main():
             sys.exit(1)
         return
     
+    # Audit query plans if requested
+    if args.audit_indexes:
+        run_index_audit()
+        return
+    
     # Download browser if requested
     if args.download_browser:
         if download_browser():
@@ -183,6 +250,11 @@ def main():
         logger.info("="*60)
         return
     
+    # Run a queue worker instead of the web app
+    if args.command == 'worker':
+        run_worker(args)
+        return
+    
     # Print configuration
     logger.info(f"Debug mode: {config.DEBUG}")
     logger.info(f"MongoDB: {config.MONGODB_URI}/{config.DATABASE_NAME}")
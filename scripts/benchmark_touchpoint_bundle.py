@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the touchpoint script bundle
+
+Compares what one tested page costs when every touchpoint sends its engine
+with page.evaluate (the previous behaviour) against the bundle installed on
+the browser context:
+
+- CDP payload: bytes sent with Runtime.evaluate/callFunctionOn per page, and
+  the bundle itself, which is sent once per page as an init script
+- Compile time: V8 compile time of the JavaScript the page receives, measured
+  with Node.js (eager compilation, with a unique suffix per page so the
+  compilation cache cannot be reused between pages)
+
+Usage:
+    python scripts/benchmark_touchpoint_bundle.py [--breakpoints 4] [--pages 20]
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from auto_a11y.testing.touchpoint_bundle import _RUN_SCRIPT, build_bundle, load_touchpoint_scripts  # noqa: E402
+
+# Engines evaluated once per breakpoint rather than once per page
+PER_BREAKPOINT = {'text_contrast', 'floating_dialogs'}
+
+NODE_BENCHMARK = r'''
+const v8 = require('v8');
+v8.setFlagsFromString('--no-lazy');
+const vm = require('vm');
+const fs = require('fs');
+const { calls, bundle, runScript, pages } = JSON.parse(fs.readFileSync(process.argv[2], 'utf8'));
+
+function time(fn) {
+    const start = process.hrtime.bigint();
+    fn();
+    return Number(process.hrtime.bigint() - start) / 1e6;
+}
+
+let before = 0;
+let after = 0;
+for (let page = 0; page < pages; page++) {
+    before += time(() => {
+        for (const source of calls) new vm.Script(`(${source})\n//${page}`);
+    });
+    after += time(() => {
+        new vm.Script(`${bundle}\n//${page}`);
+        for (let i = 0; i < calls.length; i++) new vm.Script(`(${runScript})\n//${page}`);
+    });
+}
+console.log(JSON.stringify({ before: before / pages, after: after / pages }));
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--breakpoints', type=int, default=4, help='Responsive breakpoints tested per page')
+    parser.add_argument('--pages', type=int, default=20, help='Pages to average compile time over')
+    args = parser.parse_args()
+
+    scripts = load_touchpoint_scripts()
+    version, bundle = build_bundle()
+
+    calls = []
+    for name, source in scripts.items():
+        calls.extend([source] * (args.breakpoints if name in PER_BREAKPOINT else 1))
+
+    evaluate_before = sum(len(source.encode('utf-8')) for source in calls)
+    # Engine name, bundle version and a small argument per call
+    evaluate_after = len(calls) * (len(_RUN_SCRIPT.encode('utf-8')) + len(json.dumps(['text_contrast', version, 1024])))
+    bundle_bytes = len(bundle.encode('utf-8'))
+
+    print(f"Touchpoint engines: {len(scripts)}, evaluate calls per page: {len(calls)} "
+          f"({args.breakpoints} breakpoints)")
+    print(f"Bundle {version}: {bundle_bytes / 1024:.1f} KiB")
+    print()
+    print(f"{'':28}{'before':>12}{'bundle':>12}")
+    print(f"{'evaluate payload per page':28}{evaluate_before / 1024:>10.1f}KB{evaluate_after / 1024:>10.1f}KB")
+    print(f"{'total CDP payload per page':28}{evaluate_before / 1024:>10.1f}KB"
+          f"{(evaluate_after + bundle_bytes) / 1024:>10.1f}KB")
+
+    node = shutil.which('node')
+    if not node:
+        print("\nNode.js not found - skipping compile time")
+        return
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump({'calls': calls, 'bundle': bundle, 'runScript': _RUN_SCRIPT, 'pages': args.pages}, f)
+        data_path = f.name
+    with tempfile.NamedTemporaryFile('w', suffix='.js', delete=False) as f:
+        f.write(NODE_BENCHMARK)
+        script_path = f.name
+
+    try:
+        output = subprocess.run([node, script_path, data_path], capture_output=True, text=True, check=True).stdout
+    finally:
+        Path(data_path).unlink()
+        Path(script_path).unlink()
+
+    timings = json.loads(output)
+    print(f"{'compile time per page':28}{timings['before']:>10.1f}ms{timings['after']:>10.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""Test doubles shared by the test modules."""
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+
+class FakeCDPSession:
+    """
+    Chromium DevTools session answering from a table
+
+    responses maps a CDP method to its result, or to a callable taking the
+    call's params. Methods not in the table answer {}. Every call is
+    recorded in calls as (method, params).
+    """
+
+    def __init__(self, responses=None):
+        self.responses = dict(responses or {})
+        self.calls = []
+        self.detached = False
+
+    async def send(self, method, params=None):
+        self.calls.append((method, params))
+        response = self.responses.get(method, {})
+        return response(params or {}) if callable(response) else response
+
+    async def detach(self):
+        self.detached = True
+
+    def methods(self, name):
+        """Params of every call to one CDP method"""
+        return [params for method, params in self.calls if method == name]
+
+
+class FakeBrowserContext:
+    """Browser context handing out one CDP session, or failing like a non-Chromium browser"""
+
+    def __init__(self, session=None):
+        self.session = session
+
+    async def new_cdp_session(self, page):
+        if self.session is None:
+            raise RuntimeError('CDP is only available in Chromium')
+        return self.session
+
+
+class FakeCDPPage:
+    """Page in a FakeBrowserContext; test modules subclass it to answer evaluate"""
+
+    def __init__(self, session=None):
+        self.context = FakeBrowserContext(session)
+
+
+class FakeCursor(list):
+    """Query results supporting the cursor chaining used by the code under test"""
+
+    def sort(self, field, direction=1):
+        return FakeCursor(sorted(self, key=lambda doc: doc.get(field), reverse=direction < 0))
+
+    def limit(self, count):
+        return FakeCursor(self[:count])
+
+
+class FakeCollection:
+    """
+    In-memory stand-in for the MongoDB collection methods used by the code under test
+
+    Documents are kept in docs, keyed by the key field. Queries match on
+    equality, $ne, $in, $gt, $lte and $or. update_one calls are also
+    recorded in updates and bulk_write operation lists in batches.
+    """
+
+    def __init__(self, docs=(), key='_id'):
+        self.key = key
+        self.docs = {doc[key]: dict(doc) for doc in docs}
+        self.updates = []
+        self.batches = []
+        self.ordered = None
+
+    @classmethod
+    def _matches(cls, doc, query):
+        for field, expected in query.items():
+            if field == '$or':
+                if not any(cls._matches(doc, branch) for branch in expected):
+                    return False
+                continue
+            value = doc.get(field)
+            if isinstance(expected, dict) and '$ne' in expected:
+                if value == expected['$ne']:
+                    return False
+            elif isinstance(expected, dict) and '$in' in expected:
+                if value not in expected['$in']:
+                    return False
+            elif isinstance(expected, dict) and '$gt' in expected:
+                if value is None or not value > expected['$gt']:
+                    return False
+            elif isinstance(expected, dict) and '$lte' in expected:
+                if value is None or not value <= expected['$lte']:
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    def _first(self, query):
+        return next((doc for doc in self.docs.values() if self._matches(doc, query)), None)
+
+    def find(self, query=None, projection=None):
+        return FakeCursor(dict(doc) for doc in self.docs.values() if self._matches(doc, query or {}))
+
+    def find_one(self, query, projection=None, sort=None):
+        if sort:
+            [(field, direction)] = sort
+            docs = self.find(query).sort(field, direction)
+            return docs[0] if docs else None
+        doc = self._first(query)
+        return dict(doc) if doc else None
+
+    def find_one_and_update(self, query, update):
+        doc = self._first(query)
+        if not doc:
+            return None
+        before = dict(doc)
+        doc.update(update['$set'])
+        return before
+
+    def insert_one(self, doc):
+        doc = dict(doc)
+        doc.setdefault(self.key, ObjectId())
+        self.docs[doc[self.key]] = doc
+        return SimpleNamespace(inserted_id=doc[self.key])
+
+    def insert_many(self, docs, ordered=True):
+        return SimpleNamespace(inserted_ids=[self.insert_one(doc).inserted_id for doc in docs])
+
+    def replace_one(self, query, doc, upsert=False):
+        self.docs[query[self.key]] = dict(doc)
+
+    def update_one(self, query, update):
+        self.updates.append((query, update))
+        doc = self._first(query)
+        if doc:
+            doc.update(update.get('$set', {}))
+        return SimpleNamespace(matched_count=int(bool(doc)), modified_count=int(bool(doc)))
+
+    def delete_many(self, query):
+        if query:
+            self.docs.pop(query[self.key], None)
+        else:
+            self.docs.clear()
+
+    def bulk_write(self, operations, ordered=True):
+        self.batches.append(operations)
+        self.ordered = ordered
+        return SimpleNamespace(upserted_count=len(operations), matched_count=0)
@@ -0,0 +1,255 @@
+"""Tests for the accessibility tree snapshot and its use by the accessible names touchpoint."""
+import asyncio
+
+from conftest import FakeCDPPage, FakeCDPSession
+
+from auto_a11y.testing.ax_snapshot import AXSnapshot, clear_ax_snapshot, get_ax_snapshot
+from auto_a11y.testing.touchpoint_tests.test_accessible_names import test_accessible_names as run_accessible_names
+from auto_a11y.testing.touchpoint_tests.test_buttons import test_buttons as run_buttons
+from auto_a11y.testing.touchpoint_tests.test_forms import test_forms as run_forms
+from auto_a11y.testing.touchpoint_tests.test_links import test_links as run_links
+
+
+def element(backend_id, name, children=(), **extra):
+    return dict({'nodeType': 1, 'nodeName': name.upper(), 'localName': name,
+                 'backendNodeId': backend_id, 'children': list(children)}, **extra)
+
+
+# <html><body><nav><a/><a/></nav><main><button/></main><img/></body></html>
+DOM = {'nodeType': 9, 'nodeName': '#document', 'backendNodeId': 1, 'children': [
+    {'nodeType': 10, 'nodeName': 'html', 'backendNodeId': 2},
+    element(3, 'html', [element(4, 'body', [
+        element(5, 'nav', [element(6, 'a'), {'nodeType': 3, 'nodeName': '#text', 'backendNodeId': 7}, element(8, 'a')]),
+        element(9, 'main', [element(10, 'button')]),
+        element(11, 'img'),
+    ])]),
+]}
+
+
+def ax(node_id, role, name, backend_id, parent=None, children=(), ignored=False):
+    return {'nodeId': node_id, 'role': {'type': 'role', 'value': role}, 'name': {'type': 'computedString', 'value': name},
+            'ignored': ignored, 'backendDOMNodeId': backend_id, 'parentId': parent, 'childIds': list(children)}
+
+
+AX_NODES = [
+    ax('1', 'RootWebArea', 'Page', 1, children=['3']),
+    ax('3', 'generic', '', 3, parent='1', children=['4'], ignored=True),
+    ax('4', 'generic', '', 4, parent='3', children=['5', '9', '11'], ignored=True),
+    ax('5', 'navigation', 'Primary', 5, parent='4', children=['6', '8']),
+    ax('6', 'link', 'Home', 6, parent='5'),
+    ax('8', 'link', 'Read more', 8, parent='5'),
+    ax('9', 'main', '', 9, parent='4', children=['10']),
+    ax('10', 'button', '', 10, parent='9'),
+    ax('11', 'image', 'Logo', 11, parent='4'),
+]
+
+
+# <body><x-card>#shadow-root<button/></x-card><iframe>#document<html><body><a href/></body></html></iframe>
+#       <iframe (cross-origin)/></body>
+COMPOSITE_DOM = {'nodeType': 9, 'nodeName': '#document', 'backendNodeId': 1, 'children': [
+    element(2, 'html', [element(3, 'body', [
+        element(4, 'x-card', shadowRoots=[
+            {'nodeType': 11, 'nodeName': '#document-fragment', 'backendNodeId': 5, 'shadowRootType': 'open',
+             'children': [element(6, 'button', attributes=['class', 'close'])]},
+        ]),
+        element(7, 'iframe', frameId='child', contentDocument={
+            'nodeType': 9, 'nodeName': '#document', 'backendNodeId': 8, 'children': [
+                element(9, 'html', [element(10, 'body', [element(11, 'a', attributes=['href', '/help'])])]),
+            ]}),
+        element(12, 'iframe', frameId='ads'),
+    ])]),
+]}
+
+COMPOSITE_AX_NODES = {
+    None: [
+        ax('1', 'RootWebArea', 'Page', 1, children=['6', '7']),
+        ax('6', 'button', '', 6, parent='1'),
+        ax('7', 'Iframe', 'Help', 7, parent='1'),
+    ],
+    'child': [
+        ax('1', 'RootWebArea', 'Help', 8, children=['2']),
+        ax('2', 'link', 'Contact us', 11, parent='1'),
+    ],
+}
+
+FRAME_TREE = {'frame': {'id': 'main', 'securityOrigin': 'https://example.com'}, 'childFrames': [
+    {'frame': {'id': 'child', 'securityOrigin': 'https://example.com'}},
+    {'frame': {'id': 'ads', 'securityOrigin': 'https://ads.example.net'}},
+]}
+
+
+def make_session(dom=DOM, ax_nodes=None, frame_tree=None):
+    """Chromium's answers for a document and the accessibility trees of its frames"""
+    ax_nodes = ax_nodes or {None: AX_NODES}
+    frame_tree = frame_tree or {'frame': {'id': 'main', 'securityOrigin': 'https://example.com'}}
+    return FakeCDPSession({
+        'DOM.getDocument': {'root': dom},
+        'Page.getFrameTree': {'frameTree': frame_tree},
+        'Accessibility.getFullAXTree': lambda params: {'nodes': ax_nodes[params.get('frameId')]},
+    })
+
+
+class FakePage(FakeCDPPage):
+    def __init__(self, session):
+        super().__init__(session)
+        self.ax_names = None
+
+    async def evaluate(self, script, arg=None):
+        if arg is None:
+            return ['https://example.com/', 1.0, 7]
+        name, _, engine_arg = arg
+        assert name == 'accessible_names'
+        self.ax_names = engine_arg
+        if '/html[1]/body[1]/main[1]/button[1]' not in engine_arg:
+            return {'errors': [], 'warnings': [], 'elements_tested': 0, 'elements_passed': 0, 'elements_failed': 0,
+                    'checks': [{'description': 'Elements with required accessible names',
+                                'total': 0, 'passed': 0, 'failed': 0}]}
+        return {
+            'errors': [{'err': 'ErrMissingAccessibleName', 'xpath': '/html[1]/body[1]/main[1]/button[1]'}],
+            'warnings': [{'err': 'WarnGenericAccessibleName', 'xpath': '/html[1]/body[1]/nav[1]/a[2]'}],
+        }
+
+
+class FakeEnginePage(FakeCDPPage):
+    """Answers each touchpoint engine with canned data and records what it was passed"""
+
+    def __init__(self, session, engine_results):
+        super().__init__(session)
+        self.engine_results = engine_results
+        self.engine_args = {}
+
+    async def evaluate(self, script, arg=None):
+        if arg is None:
+            return ['https://example.com/', 1.0, 7]
+        name, _, engine_arg = arg
+        self.engine_args[name] = engine_arg
+        return self.engine_results.get(name, '')
+
+
+def test_snapshot_indexes_by_role_xpath_and_landmark():
+    snapshot = AXSnapshot.from_cdp(AX_NODES, DOM)
+
+    assert [node.name for node in snapshot.by_role['link']] == ['Home', 'Read more']
+    assert snapshot.by_backend_node[10].xpath == '/html[1]/body[1]/main[1]/button[1]'
+    # The text node between the links does not shift their indexes
+    assert snapshot.by_xpath['/html[1]/body[1]/nav[1]/a[2]'].name == 'Read more'
+    assert [node.role for node in snapshot.landmarks] == ['main', 'navigation']
+    assert [node.name for node in snapshot.by_landmark['5']] == ['Home', 'Read more']
+    assert snapshot.landmark_of(snapshot.by_backend_node[11]) is None
+    assert 'generic' not in snapshot.by_role
+
+
+def test_accessible_names_use_browser_computed_names():
+    session = make_session()
+    page = FakePage(session)
+
+    try:
+        results = asyncio.run(run_accessible_names(page))
+        asyncio.run(get_ax_snapshot(page))
+    finally:
+        clear_ax_snapshot(page)
+
+    assert page.ax_names == {
+        '/html[1]/body[1]/nav[1]/a[1]': 'Home',
+        '/html[1]/body[1]/nav[1]/a[2]': 'Read more',
+        '/html[1]/body[1]/main[1]/button[1]': '',
+        '/html[1]/body[1]/img[1]': 'Logo',
+    }
+    assert results['name_source'] == 'accessibility_tree'
+    assert results['errors'][0]['landmark'] == {'role': 'main', 'name': '', 'xpath': '/html[1]/body[1]/main[1]'}
+    assert results['warnings'][0]['landmark']['name'] == 'Primary'
+    # The unchanged page state reuses the snapshot
+    assert len(session.methods('Accessibility.getFullAXTree')) == 1
+
+
+def test_shadow_roots_and_same_origin_frames_are_merged():
+    session = make_session(COMPOSITE_DOM, COMPOSITE_AX_NODES, FRAME_TREE)
+    page = FakePage(session)
+
+    try:
+        results = asyncio.run(run_accessible_names(page))
+        snapshot = asyncio.run(get_ax_snapshot(page))
+    finally:
+        clear_ax_snapshot(page)
+
+    shadow_button = '/html[1]/body[1]/x-card[1]/#shadow-root/button[1]'
+    frame_link = '/html[1]/body[1]/iframe[1]/#document/html[1]/body[1]/a[1]'
+    assert snapshot.by_xpath[frame_link].name == 'Contact us'
+    assert snapshot.coverage == {'node_budget': 20000, 'elements': 9, 'shadow_roots': 1, 'frames': 1,
+                                 'frames_skipped': 1, 'truncated': False, 'ax_nodes': 5}
+    # Only the light DOM is sent to the engine; the rest is checked from the snapshot
+    assert page.ax_names == {'/html[1]/body[1]/iframe[1]': 'Help'}
+    assert [(error['xpath'], error['html']) for error in results['errors']] == [
+        (shadow_button, '<button class="close">')
+    ]
+    assert results['checks'][0] == {'description': 'Elements with required accessible names',
+                                    'total': 2, 'passed': 1, 'failed': 1}
+    assert results['snapshot_coverage']['frames'] == 1
+
+
+def test_node_budget_truncates_in_document_order():
+    snapshot = AXSnapshot.from_cdp(COMPOSITE_AX_NODES[None], COMPOSITE_DOM, node_budget=4)
+
+    assert snapshot.coverage['truncated'] and snapshot.coverage['elements'] == 4
+    # The shadow root's button is past the budget and gets no XPath
+    assert set(snapshot.by_xpath) == {'/html[1]/body[1]/iframe[1]'}
+    assert snapshot.by_backend_node[6].xpath is None
+
+
+def test_composite_nodes_are_selected_like_the_engine():
+    # <body><x-tabs>#shadow-root<h2/><div role="button"/></x-tabs></body>
+    dom = {'nodeType': 9, 'nodeName': '#document', 'backendNodeId': 1, 'children': [
+        element(2, 'html', [element(3, 'body', [
+            element(4, 'x-tabs', shadowRoots=[
+                {'nodeType': 11, 'nodeName': '#document-fragment', 'backendNodeId': 5, 'shadowRootType': 'open',
+                 'children': [element(6, 'h2'), element(7, 'div', attributes=['role', 'button'])]},
+            ]),
+        ])]),
+    ]}
+    ax_nodes = {None: [
+        ax('1', 'RootWebArea', 'Page', 1, children=['6', '7']),
+        ax('6', 'heading', '', 6, parent='1'),
+        ax('7', 'button', '', 7, parent='1'),
+    ]}
+    page = FakePage(make_session(dom, ax_nodes))
+
+    try:
+        results = asyncio.run(run_accessible_names(page))
+    finally:
+        clear_ax_snapshot(page)
+
+    # The engine only requires names for author-specified roles, so the
+    # heading element's computed role does not make it checked here either
+    assert [error['xpath'] for error in results['errors']] == ['/html[1]/body[1]/x-tabs[1]/#shadow-root/div[1]']
+    assert results['checks'][0]['total'] == 1
+
+
+def test_button_link_and_form_checks_use_browser_computed_names():
+    button = {'tagName': 'BUTTON', 'text': 'Read the pricing guide', 'accessibleName': 'More',
+              'xpath': '/html[1]/body[1]/main[1]/button[1]', 'html': '<button>',
+              'focusOutlineStyle': None, 'focusOutlineWidth': None, 'focusOutlineColor': None,
+              'focusBoxShadow': None, 'focusBackgroundColor': None, 'focusBorderColor': None,
+              'normalBackgroundColor': 'rgb(255, 255, 255)'}
+    link = {'tagName': 'A', 'text': 'Read more', 'accessibleName': 'Read more (opens in a new tab)',
+            'xpath': '/html[1]/body[1]/nav[1]/a[2]', 'html': '<a>', 'target': '_blank'}
+    page = FakeEnginePage(make_session(), {'buttons': [button], 'links': [link],
+                                           'forms': {'errors': [], 'warnings': [], 'passes': []}})
+
+    try:
+        button_results = asyncio.run(run_buttons(page))
+        link_results = asyncio.run(run_links(page))
+        asyncio.run(run_forms(page))
+    finally:
+        clear_ax_snapshot(page)
+
+    assert page.engine_args['buttons'] == {'/html[1]/body[1]/main[1]/button[1]': ''}
+    assert page.engine_args['links']['axNames'] == {
+        '/html[1]/body[1]/nav[1]/a[1]': 'Home',
+        '/html[1]/body[1]/nav[1]/a[2]': 'Read more',
+    }
+    # The page has no fields or forms, but the engine is given the (empty) names
+    assert page.engine_args['forms'] == {}
+    # The generic name screen readers announce is flagged, not the visible text
+    assert [w['err'] for w in button_results['warnings']] == ['WarnButtonGenericText', 'WarnButtonDefaultFocus']
+    # The new window warning is part of the computed name
+    assert 'ErrLinkOpensNewWindowNoWarning' not in [e['err'] for e in link_results['errors']]
@@ -0,0 +1,93 @@
+"""Tests for the vectorized contrast color math."""
+import numpy as np
+import pytest
+
+from auto_a11y.testing.color_math import (
+    composite_stack, contrast_ratio, evaluate_contrast, format_rgba, indicator_contrast, parse_color, stack_layers,
+    to_rgba_array
+)
+
+
+def test_parses_computed_and_hex_colors():
+    assert parse_color('rgb(255, 0, 10)') == (255.0, 0.0, 10.0, 1.0)
+    assert parse_color('rgba(0, 0, 0, 0.5)') == (0.0, 0.0, 0.0, 0.5)
+    assert parse_color('rgb(0 128 255 / 50%)') == (0.0, 128.0, 255.0, 0.5)
+    assert parse_color('#fff') == (255.0, 255.0, 255.0, 1.0)
+    assert parse_color('transparent') == (0.0, 0.0, 0.0, 0.0)
+    # Stylesheet rules keep named colors as written
+    assert parse_color('White') == (255.0, 255.0, 255.0, 1.0)
+    assert parse_color('rebeccapurple') == (102.0, 51.0, 153.0, 1.0)
+    assert parse_color(None) == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_parses_css_color_4_computed_colors():
+    assert parse_color('oklch(1 0 0)') == pytest.approx((255.0, 255.0, 255.0, 1.0))
+    assert parse_color('oklab(62.8% 0.2249 0.1258)') == pytest.approx((255.0, 0.0, 0.0, 1.0), abs=1)
+    assert parse_color('lab(50 0 0)') == pytest.approx((119.0, 119.0, 119.0, 1.0), abs=1)
+    assert parse_color('lch(54.29 106.84 40.85)') == pytest.approx((255.0, 0.0, 0.0, 1.0), abs=1)
+    assert parse_color('color(srgb 1 0 0 / 0.5)') == (255.0, 0.0, 0.0, 0.5)
+    assert parse_color('color(display-p3 0 0 0)') == (0.0, 0.0, 0.0, 1.0)
+    assert parse_color('oklch(0.5 0.1 none / 50%)')[3] == 0.5
+    # Spaces without a conversion are still transparent
+    assert parse_color('color(rec2020 1 0 0)') == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_near_black_oklch_text_has_high_contrast_on_white():
+    ratio = contrast_ratio(to_rgba_array(['oklch(0.2 0.05 260)']), to_rgba_array(['#fff']))[0]
+    assert ratio > 15
+
+
+def test_contrast_ratios_match_wcag_reference_values():
+    colors = to_rgba_array(['#000', '#767676', '#777777'])
+    white = to_rgba_array(['#fff'] * 3)
+    ratios = contrast_ratio(colors, white)
+    assert ratios[0] == pytest.approx(21.0)
+    assert ratios[1] == pytest.approx(4.54, abs=0.01)
+    assert ratios[2] < 4.5
+
+
+def test_background_stacks_composite_over_white():
+    layers = stack_layers([
+        ['rgba(0, 0, 0, 0.5)'],
+        ['rgba(255, 0, 0, 0.5)', 'rgb(0, 0, 255)'],
+        [],
+    ])
+    assert layers.shape == (3, 2, 4)
+    backgrounds = composite_stack(layers)
+    assert np.allclose(backgrounds[0], [127.5, 127.5, 127.5, 1])
+    assert np.allclose(backgrounds[1], [127.5, 0, 127.5, 1])
+    assert np.allclose(backgrounds[2], [255, 255, 255, 1])
+    assert format_rgba(composite_stack(layers, base=None)[0]) == 'rgba(0, 0, 0, 0.5)'
+
+
+def test_evaluates_batches_against_all_levels():
+    result = evaluate_contrast(
+        to_rgba_array(['rgb(118, 118, 118)', 'rgb(118, 118, 118)', 'rgba(0, 0, 0, 0.4)']),
+        stack_layers([['#fff'], ['#fff'], []]),
+        np.array([16, 19, 16]),
+        np.array([400, 700, 400]),
+    )
+    assert result['large'].tolist() == [False, True, False]
+    assert result['passes']['AA'].tolist() == [True, True, False]
+    assert result['passes']['AAA'].tolist() == [False, True, False]
+    # Semi-transparent text is measured as rendered over its background
+    assert np.allclose(result['foreground'][2], [153, 153, 153, 1])
+
+
+def test_indicator_contrast_batches_distinct_pairs():
+    ratios = indicator_contrast([
+        ('rgb(0, 0, 0)', 'rgb(255, 255, 255)'),
+        ('rgb(0, 0, 0)', 'rgb(255, 255, 255)'),
+        ('rgba(0, 0, 0, 0.5)', 'rgb(255, 255, 255)'),
+        ('rgb(0, 0, 0)', 'transparent'),
+        ('#767676', None),
+    ])
+    assert len(ratios) == 4
+    assert ratios[('rgb(0, 0, 0)', 'rgb(255, 255, 255)')] == pytest.approx(21)
+    # A semi-transparent outline is measured as rendered over its background
+    assert ratios[('rgba(0, 0, 0, 0.5)', 'rgb(255, 255, 255)')] == pytest.approx(
+        float(contrast_ratio(to_rgba_array(['rgb(128, 128, 128)']), to_rgba_array(['#fff']))[0]), abs=0.05)
+    # A transparent background shows the canvas
+    assert ratios[('rgb(0, 0, 0)', 'transparent')] == pytest.approx(21)
+    assert ratios[('#767676', None)] == pytest.approx(4.54, abs=0.01)
+    assert indicator_contrast([]) == {}
@@ -0,0 +1,49 @@
+"""Tests for matching issue XPaths to common components."""
+from auto_a11y.reporting.component_index import ComponentIndex
+
+
+def make_components():
+    return {
+        "nav|Guest": {
+            "type": "Navigation",
+            "user_context": "Guest",
+            "xpaths_by_page": {"/a": "/html/body/nav", "/b": "/html/body/div/nav"},
+        },
+        "nav|Alice": {
+            "type": "Navigation",
+            "user_context": "Alice",
+            "xpaths_by_page": {"/a": "/html/body/nav/"},
+        },
+        "form|Guest": {
+            "type": "Form",
+            "user_context": "Guest",
+            "xpaths_by_page": {"/a": "/html/body/nav/form", "/b": ""},
+        },
+    }
+
+
+class TestComponentIndex:
+    def test_descendant_and_exact_match(self):
+        index = ComponentIndex(make_components())
+        assert index.find("/a", "/html/body/nav") == "nav|Guest"
+        assert index.find("/a", "/html/body/nav/ul/li[2]/a") == "nav|Guest"
+
+    def test_step_boundary_is_respected(self):
+        index = ComponentIndex(make_components())
+        assert not index.contains("/a", "/html/body/nav2/a")
+        assert not index.contains("/b", "/html/body/nav/a")
+
+    def test_all_matches_in_component_order(self):
+        index = ComponentIndex(make_components())
+        assert index.find_all("/a", "/html/body/nav/form/input") == ["nav|Guest", "nav|Alice", "form|Guest"]
+
+    def test_user_context_filter(self):
+        index = ComponentIndex(make_components())
+        assert index.find("/a", "/html/body/nav/a", user_context="Alice") == "nav|Alice"
+        assert index.find("/b", "/html/body/div/nav/a", user_context="Alice") is None
+
+    def test_missing_page_or_xpath(self):
+        index = ComponentIndex(make_components())
+        assert index.find("/c", "/html/body/nav") is None
+        assert index.find("/a", "") is None
+        assert index.find("/a", None) is None
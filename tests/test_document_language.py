@@ -0,0 +1,61 @@
+"""Tests for the document language detection service."""
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from conftest import FakeCollection
+
+from auto_a11y.core import document_language
+from auto_a11y.core.document_language import DocumentLanguageService, detect_pdf_language
+
+# Catalog up front, then a large tail that a ranged request never reads
+PDF = b'%PDF-1.7\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R /Lang (fr-CA) >>\nendobj\n' + b'0' * 600_000
+
+
+async def detect_twice(etags):
+    """Detect the same document with two services sharing one cache, with the given ETag each time"""
+    requests = []
+    served_etag = {}
+
+    async def handler(request):
+        requests.append((request.method, request.headers.get('Range')))
+        headers = {'ETag': served_etag['value'], 'Accept-Ranges': 'bytes'}
+        if request.method == 'HEAD':
+            return web.Response(headers=dict(headers, **{'Content-Length': str(len(PDF))}))
+        start, end = request.headers['Range'].removeprefix('bytes=').split('-')
+        body = PDF[int(start):int(end) + 1]
+        headers['Content-Range'] = f'bytes {start}-{int(start) + len(body) - 1}/{len(PDF)}'
+        return web.Response(status=206, body=body, headers=headers)
+
+    app = web.Application()
+    app.router.add_route('*', '/report.pdf', handler)
+    cache = FakeCollection()
+    results = []
+    async with TestServer(app) as server:
+        for etag in etags:
+            served_etag['value'] = etag
+            service = DocumentLanguageService(cache)
+            try:
+                results.append(await service.detect(str(server.make_url('/report.pdf')), 'Annual report', '.pdf'))
+            finally:
+                await service.close()
+    return results, requests
+
+
+def test_pdf_language_is_read_from_the_document_head():
+    results, requests = asyncio.run(detect_twice(['"v1"']))
+
+    assert results == [{'language': 'fr', 'confidence': 0.9}]
+    assert requests == [('HEAD', None), ('GET', f'bytes=0-{document_language.HEAD_BYTES - 1}')]
+
+
+def test_cached_detection_is_reused_until_the_etag_changes():
+    results, requests = asyncio.run(detect_twice(['"v1"', '"v1"', '"v2"']))
+
+    assert [result['language'] for result in results] == ['fr', 'fr', 'fr']
+    assert [method for method, _ in requests] == ['HEAD', 'GET', 'HEAD', 'HEAD', 'GET']
+
+
+def test_pdf_head_without_catalog_language_falls_back_to_parsing():
+    assert detect_pdf_language(b'%PDF-1.4\n1 0 obj\n<< /Type /Catalog >>') is None
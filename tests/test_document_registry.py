@@ -0,0 +1,63 @@
+"""Tests for crawl-scoped document reference deduplication and bulk upserts."""
+from conftest import FakeCollection
+
+from auto_a11y.core.database import Database
+from auto_a11y.core.document_registry import DocumentRegistry
+from auto_a11y.models import DocumentReference
+
+FOOTER_PDF = 'https://example.com/files/privacy.pdf'
+
+
+def make_database():
+    database = Database.__new__(Database)
+    database.document_references = FakeCollection()
+    return database
+
+
+def reference(url, page, link_text, language=None):
+    return DocumentReference(
+        website_id='site', document_url=url, referring_page_url=page, mime_type='application/pdf',
+        is_internal=True, link_text=link_text, file_extension='.pdf', language=language,
+        language_confidence=0.9 if language else None
+    )
+
+
+def test_references_are_merged_per_document_and_written_once():
+    database = make_database()
+    registry = DocumentRegistry(database)
+
+    for index in range(200):
+        registry.add(reference(FOOTER_PDF, f'https://example.com/page-{index}', 'Privacy policy', 'en'))
+    registry.add(reference(FOOTER_PDF, 'https://example.com/page-0', 'Privacy (PDF)'))
+    registry.add(reference('https://example.com/files/report.pdf', 'https://example.com/page-3', 'Report'))
+
+    assert database.document_references.batches == []
+    assert registry.flush() == 2
+    assert registry.documents_found('site') == 2
+
+    [batch] = database.document_references.batches
+    assert database.document_references.ordered is False
+    footer = batch[0]
+    assert footer._filter == {'website_id': 'site', 'document_url': FOOTER_PDF}
+    assert footer._upsert
+    update = footer._doc
+    assert update['$inc'] == {'seen_count': 201}
+    assert len(update['$addToSet']['referring_pages']['$each']) == 200
+    assert update['$addToSet']['link_texts']['$each'] == ['Privacy policy', 'Privacy (PDF)']
+    assert update['$set']['language'] == 'en'
+    assert update['$setOnInsert']['referring_page_url'] == 'https://example.com/page-0'
+    # Nothing is left to write
+    assert registry.flush() == 0
+
+
+def test_registry_flushes_when_threshold_is_reached():
+    database = make_database()
+    registry = DocumentRegistry(database, flush_threshold=2)
+
+    for index in range(5):
+        registry.add(reference(f'https://example.com/doc-{index}.pdf', 'https://example.com/', None))
+
+    assert [len(batch) for batch in database.document_references.batches] == [2, 2]
+    assert len(registry.pending) == 1
+    assert registry.flush() == 1
+    assert registry.documents_found('site') == 5
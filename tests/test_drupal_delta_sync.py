@@ -0,0 +1,97 @@
+"""Tests for Drupal delta imports."""
+from auto_a11y.drupal import delta_sync
+from auto_a11y.drupal.delta_sync import CLOCK_MARGIN_SECONDS, high_water_mark, to_timestamp
+from auto_a11y.drupal.discovered_page_importer import DiscoveredPageImporter
+from auto_a11y.drupal.issue_importer import IssueImporter
+
+
+class FakeClient:
+    """Serves a fixed list of nodes with JSON:API offset paging"""
+
+    def __init__(self, nodes, included=None):
+        self.nodes = nodes
+        self.included = included or []
+        self.calls = []
+
+    def get(self, endpoint, params=None):
+        self.calls.append((endpoint, params))
+        offset, limit = params['page[offset]'], params['page[limit]']
+        return {'data': self.nodes[offset:offset + limit], 'included': self.included}
+
+
+class NoTaxonomyLookups:
+    INTERESTED_BECAUSE = 'interested_in_because'
+    PAGE_ELEMENTS = 'page_elements'
+
+    def lookup_interested_because_names(self, uuids):
+        raise AssertionError('Included term names should be used')
+
+    lookup_page_elements_names = lookup_interested_because_names
+
+
+def test_to_timestamp_accepts_rfc3339_and_integers():
+    assert to_timestamp('2026-03-01T09:00:00+00:00') == 1772355600
+    assert to_timestamp('2026-03-01T09:00:00Z') == 1772355600
+    assert to_timestamp(1772355600) == 1772355600
+    assert to_timestamp('1772355600') == 1772355600
+    assert to_timestamp(None) is None
+
+
+def test_high_water_mark_stays_behind_import_start():
+    started_at = 1_000_000
+    records = [{'changed': 900_000}, {'changed': started_at}]
+    # Nodes edited during the import are fetched again next time
+    assert high_water_mark(records, None, started_at) == started_at - CLOCK_MARGIN_SECONDS
+    assert high_water_mark([{'changed': 900_000}], None, started_at) == 900_000
+    # Never moves backwards, and an empty delta keeps the previous mark
+    assert high_water_mark([{'changed': 800_000}], 850_000, started_at) == 850_000
+    assert high_water_mark([], 850_000, started_at) == 850_000
+
+
+def test_issue_delta_fetch_pages_with_filters_and_fieldsets(monkeypatch):
+    monkeypatch.setattr(delta_sync, 'PAGE_LIMIT', 2)
+    wcag = {'type': 'node--wcag_chapter', 'id': 'w1', 'attributes': {'title': '1.4.3 Contrast (Minimum)'}}
+    nodes = [
+        {'id': f'i{n}', 'attributes': {'title': f'Issue {n}', 'changed': '2026-03-01T09:00:00+00:00'},
+         'relationships': {'field_wcag_chapter': {'data': [{'id': 'w1'}]}}}
+        for n in range(3)
+    ]
+    client = FakeClient(nodes, [wcag])
+
+    issues = IssueImporter(client).fetch_issues_for_audit('audit', changed_since=1772000000)
+
+    assert [issue['uuid'] for issue in issues] == ['i0', 'i1', 'i2']
+    assert issues[0]['wcag_criteria'] == ['1.4.3']
+    assert [params['page[offset]'] for _, params in client.calls] == [0, 2]
+    params = client.calls[0][1]
+    assert params['filter[changed-since][condition][operator]'] == '>='
+    assert params['filter[changed-since][condition][value]'] == 1772000000
+    assert params['sort'] == 'created'
+    assert 'field_impact' in params['fields[node--issue]'].split(',')
+
+    model = IssueImporter(client).convert_to_issue_model(issues[0], 'project')
+    assert model.updated_at.year == 2026
+
+
+def test_discovered_pages_name_terms_from_included():
+    included = [
+        {'type': 'taxonomy_term--page_elements', 'id': 't1', 'attributes': {'name': 'Forms'}},
+        {'type': 'taxonomy_term--interested_in_because', 'id': 't2', 'attributes': {'name': 'Key task'}},
+    ]
+    page = {
+        'id': 'p1',
+        'attributes': {'title': 'Contact', 'field_page_url': {'uri': 'https://example.com/contact'}},
+        'relationships': {
+            'field_relevant_page_elements': {'data': [{'id': 't1'}]},
+            'field_interested_because': {'data': [{'id': 't2'}]},
+        },
+    }
+    client = FakeClient([page], included)
+
+    [converted] = DiscoveredPageImporter(client, NoTaxonomyLookups()).fetch_discovered_pages_for_audit('audit')
+
+    assert converted['page_elements'] == ['Forms']
+    assert converted['interested_because'] == ['Key task']
+    params = client.calls[0][1]
+    assert 'filter[changed-since][condition][path]' not in params
+    assert params['fields[taxonomy_term--page_elements]'] == 'name'
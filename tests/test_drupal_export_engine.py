@@ -0,0 +1,144 @@
+"""Tests for the concurrent Drupal export engine against a local JSON:API stand-in."""
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from auto_a11y.drupal.export_engine import DrupalExportEngine, ExportJob
+from auto_a11y.drupal.issue_exporter import IssueExporter
+from auto_a11y.models import Issue
+
+
+class JSONAPIStandIn(BaseHTTPRequestHandler):
+    """Stores nodes in memory; can be told to fail the next requests"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=None, headers=None):
+        data = json.dumps(body or {}).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/vnd.api+json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with server.lock:
+            server.requests.append((method, self.path))
+            if server.failures:
+                status, headers = server.failures.pop(0)
+                return self._reply(status, {'errors': [{'title': 'busy'}]}, headers)
+
+            if method == 'POST':
+                node_id = str(uuid.uuid4())
+                server.nid += 1
+                server.nodes[node_id] = server.nid
+            else:
+                node_id = self.path.rsplit('/', 1)[-1]
+                if node_id not in server.nodes:
+                    return self._reply(404, {'errors': [{'title': 'Not Found'}]})
+                assert payload['data']['id'] == node_id
+            body = {'data': {'id': node_id, 'attributes': {'drupal_internal__nid': server.nodes[node_id]}}}
+        self._reply(201 if method == 'POST' else 200, body)
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+
+@pytest.fixture
+def drupal():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JSONAPIStandIn)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.failures = []
+    server.nodes = {}
+    server.nid = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_engine(server):
+    host, port = server.server_address
+    return DrupalExportEngine(f'http://{host}:{port}', 'user', 'pass', concurrency=4, backoff_base=0.01)
+
+
+def issue_job(title, existing_uuid=None, previous_hash=None):
+    payload = {'data': {'type': 'node--issue', 'attributes': {'title': title}}}
+    return ExportJob('node/issue', payload, key=f'issue:{title}', label=title,
+                     existing_uuid=existing_uuid, previous_hash=previous_hash)
+
+
+def test_resync_skips_unchanged_and_patches_changed(drupal):
+    engine = make_engine(drupal)
+    first = {job.label: result for job, result in engine.export(issue_job(f'Issue {i}') for i in range(10))}
+    assert {result['action'] for result in first.values()} == {'created'}
+    assert len(drupal.nodes) == 10
+
+    drupal.requests.clear()
+    jobs = [issue_job(f'Issue {i}', first[f'Issue {i}']['uuid'], first[f'Issue {i}']['content_hash']) for i in range(10)]
+    jobs[3] = issue_job('Issue 3 (edited)', first['Issue 3']['uuid'], first['Issue 3']['content_hash'])
+    second = [result for _, result in engine.export(jobs)]
+
+    assert sorted(result['action'] for result in second).count('unchanged') == 9
+    assert [request[0] for request in drupal.requests] == ['PATCH']
+    assert len(drupal.nodes) == 10
+
+
+def test_retries_rate_limits_and_server_errors(drupal):
+    drupal.failures = [(429, {'Retry-After': '0'}), (429, {})]
+    [(_, result)] = list(make_engine(drupal).export([issue_job('Retried')]))
+    assert result['success'] and result['action'] == 'created'
+    assert len(drupal.requests) == 3 and len(drupal.nodes) == 1
+
+    # Updates are idempotent, so server errors are retried too
+    drupal.requests.clear()
+    drupal.failures = [(503, {}), (502, {})]
+    [(_, result)] = list(make_engine(drupal).export([issue_job('Edited', result['uuid'], 'old')]))
+    assert result['success'] and result['action'] == 'updated'
+    assert [request[0] for request in drupal.requests] == ['PATCH'] * 3
+
+
+def test_create_is_not_retried_after_a_server_error(drupal):
+    # Drupal may have created the node before failing, so a retry could duplicate it
+    drupal.failures = [(503, {})]
+    [(_, result)] = list(make_engine(drupal).export([issue_job('Ambiguous')]))
+    assert not result['success'] and 'HTTP 503' in result['error']
+    assert len(drupal.requests) == 1
+
+
+def test_deleted_node_is_recreated_and_errors_are_reported(drupal):
+    results = dict(
+        (job.label, result) for job, result in
+        make_engine(drupal).export([issue_job('Gone', existing_uuid=str(uuid.uuid4()), previous_hash='old')])
+    )
+    assert results['Gone']['action'] == 'created'
+
+    drupal.failures = [(422, {})]
+    [(_, result)] = list(make_engine(drupal).export([issue_job('Invalid')]))
+    assert not result['success'] and 'Validation failed' in result['error']
+
+
+def test_issue_batch_export_keeps_input_order(drupal):
+    host, port = drupal.server_address
+    client = SimpleNamespace(base_url=f'http://{host}:{port}', username='user', password='pass')
+    issues = [Issue(title=f'Issue {i}', description=f'<p>{i}</p>') for i in range(5)]
+
+    summary = IssueExporter(client).batch_export(issues, audit_uuid=str(uuid.uuid4()), engine=make_engine(drupal))
+    assert summary['success_count'] == 5 and summary['failure_count'] == 0
+    nids = [result['nid'] for result in summary['results']]
+    assert sorted(nids) == list(range(1, 6))
@@ -0,0 +1,69 @@
+"""Tests for the shared Drupal taxonomy cache."""
+from conftest import FakeCollection
+
+from auto_a11y.drupal.taxonomy import SharedTermCache, TaxonomyCache, WCAGChapterCache
+
+
+class FakeDrupal:
+    """Serves one vocabulary and the WCAG chapters, counting full fetches and probes"""
+    base_url = 'https://drupal.example'
+
+    def __init__(self):
+        self.terms = [{'id': 'u1', 'attributes': {'name': 'Forms'}}]
+        self.chapters = [{'id': 'c1', 'attributes': {'field_chapter_number': '1.4.3', 'title': 'Contrast'}}]
+        self.changed = '2026-03-01T09:00:00+00:00'
+        self.fetches = 0
+        self.probes = 0
+
+    def get(self, endpoint, params=None):
+        data = self.chapters if endpoint == 'node/wcag_chapter' else self.terms
+        if params.get('sort') == '-changed':
+            self.probes += 1
+            return {'data': [{'attributes': {'changed': self.changed}}]}
+        self.fetches += 1
+        return {'data': data[params['page[offset]']:params['page[offset]'] + params['page[limit]']]}
+
+
+def test_vocabulary_is_fetched_once_across_instances_and_workers():
+    drupal = FakeDrupal()
+    collection = FakeCollection()
+    worker_a = SharedTermCache(collection)
+    worker_b = SharedTermCache(collection)
+
+    assert TaxonomyCache(drupal, shared_cache=worker_a).get_uuid_by_name('page_elements', 'forms') == 'u1'
+    assert TaxonomyCache(drupal, shared_cache=worker_a).get_name_by_uuid('page_elements', 'u1') == 'Forms'
+    assert TaxonomyCache(drupal, shared_cache=worker_b).get_terms('page_elements')[0]['name'] == 'Forms'
+    assert WCAGChapterCache(drupal, shared_cache=worker_b).get_uuid_by_number('1.4.3') == 'c1'
+
+    # One fetch per collection; the second worker read them from MongoDB
+    assert drupal.fetches == 2
+
+
+def test_revalidation_refetches_only_when_drupal_changed():
+    drupal = FakeDrupal()
+    shared = SharedTermCache(FakeCollection(), local_ttl_seconds=0, revalidate_seconds=0)
+    cache = TaxonomyCache(drupal, shared_cache=shared)
+
+    cache.get_terms('page_elements')
+    cache.get_terms('page_elements')
+    assert drupal.fetches == 1 and drupal.probes == 2
+
+    drupal.terms.append({'id': 'u2', 'attributes': {'name': 'Header'}})
+    drupal.changed = '2026-03-02T09:00:00+00:00'
+    assert [term['name'] for term in cache.get_terms('page_elements')] == ['Forms', 'Header']
+    assert drupal.fetches == 2
+
+
+def test_missing_term_revalidates_once():
+    drupal = FakeDrupal()
+    cache = TaxonomyCache(drupal, shared_cache=SharedTermCache(FakeCollection()))
+    cache.get_terms('page_elements')
+
+    drupal.terms.append({'id': 'u2', 'attributes': {'name': 'Header'}})
+    drupal.changed = '2026-03-02T09:00:00+00:00'
+    assert cache.get_uuid_by_name('page_elements', 'Header') == 'u2'
+
+    # Further misses do not go back to Drupal
+    probes = drupal.probes
+    assert cache.get_uuid_by_name('page_elements', 'Footer') is None
+    assert drupal.probes == probes
@@ -0,0 +1,72 @@
+"""Tests for the CDP event listener inventory."""
+import asyncio
+
+from conftest import FakeCDPPage, FakeCDPSession
+
+from auto_a11y.testing.event_listener_inventory import LISTENER_ATTRIBUTE, EventListenerInventory
+
+DOCUMENT_NODE = 1
+
+
+def set_attribute(params):
+    if params['nodeId'] == 10:
+        raise RuntimeError('Not an element')
+    return {}
+
+
+def make_session():
+    """Chromium's answers for a page with a clickable div and a document-level keydown listener"""
+    return FakeCDPSession({
+        'Runtime.evaluate': {'result': {'objectId': 'doc'}},
+        'DOMDebugger.getEventListeners': {'listeners': [
+            {'type': 'click', 'backendNodeId': 5},
+            {'type': 'keydown', 'backendNodeId': 5},
+            {'type': 'scroll', 'backendNodeId': 6},
+            {'type': 'keydown', 'backendNodeId': DOCUMENT_NODE},
+            {'type': 'click'},
+        ]},
+        'DOM.pushNodesByBackendIdsToFrontend': lambda params: {
+            'nodeIds': [{5: 50, DOCUMENT_NODE: 10}[backend_id] for backend_id in params['backendNodeIds']]
+        },
+        'DOM.setAttributeValue': set_attribute,
+    })
+
+
+class FakePage(FakeCDPPage):
+    def __init__(self):
+        super().__init__(make_session())
+        self.state = ['https://example.com/', 1000.0, 120]
+
+    async def evaluate(self, script):
+        return self.state
+
+    def methods(self, name):
+        return self.context.session.methods(name)
+
+
+def test_marks_elements_with_mouse_or_keyboard_listeners():
+    page = FakePage()
+
+    assert asyncio.run(EventListenerInventory().mark(page)) == 1
+
+    [listeners_call] = page.methods('DOMDebugger.getEventListeners')
+    assert listeners_call == {'objectId': 'doc', 'depth': -1, 'pierce': False}
+    assert page.methods('Runtime.releaseObject') == [{'objectId': 'doc'}]
+    marks = {params['nodeId']: params['value'] for params in page.methods('DOM.setAttributeValue')}
+    assert marks == {50: 'click keydown', 10: 'keydown'}
+    assert all(params['name'] == LISTENER_ATTRIBUTE for params in page.methods('DOM.setAttributeValue'))
+
+
+def test_listeners_are_cached_for_the_page_state():
+    page = FakePage()
+    inventory = EventListenerInventory()
+
+    asyncio.run(inventory.mark(page))
+    asyncio.run(inventory.mark(page))
+    assert len(page.methods('DOMDebugger.getEventListeners')) == 1
+    # Markers are re-applied from the cache
+    assert len(page.methods('DOM.pushNodesByBackendIdsToFrontend')) == 2
+
+    page.state = ['https://example.com/', 1000.0, 135]
+    asyncio.run(inventory.mark(page))
+    assert len(page.methods('DOMDebugger.getEventListeners')) == 2
@@ -0,0 +1,74 @@
+"""Tests for the streamed project Excel export."""
+from types import SimpleNamespace
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from auto_a11y.reporting.formatters import ExcelFormatter
+
+
+def make_result(nav_xpath, violations):
+    return SimpleNamespace(
+        violations=violations,
+        warnings=[{"id": "WarnSmallText", "impact": "moderate", "xpath": "/html/body/p"}],
+        info=[],
+        discovery=[{
+            "id": "DiscoNavFound",
+            "xpath": nav_xpath,
+            "metadata": {"navSignature": "nav-main", "navLabel": "Main"},
+        }],
+        ai_findings=[],
+        page_state=None,
+        violation_count=len(violations),
+        warning_count=1,
+    )
+
+
+PAGES = {
+    "w1": [
+        ("https://example.com/", make_result("/html/body/nav", [
+            {"id": "ErrNoAlt", "impact": "high", "xpath": "/html/body/nav/img"},
+            {"id": "ErrNoAlt", "impact": "high", "xpath": "/html/body/main/img"},
+        ])),
+        ("https://example.com/about", make_result("/html/body/div/nav", [
+            {"id": "ErrNoAlt", "impact": "high", "xpath": "/html/body/div/nav/img"},
+        ])),
+    ],
+}
+WEBSITES = [{"id": "w1", "name": "Example", "url": "https://example.com"}]
+
+
+def sheet_values(ws, skip_rows=0):
+    return [[cell.value for cell in row] for row in ws.iter_rows(min_row=1 + skip_rows)]
+
+
+def test_streamed_sheets_match_in_memory_report(tmp_path):
+    formatter = ExcelFormatter({})
+    streamed_path = tmp_path / "streamed.xlsx"
+    formatter.write_project_report_streaming(
+        {"name": "Demo"}, WEBSITES, lambda website: iter(PAGES[website["id"]]), streamed_path
+    )
+
+    data = {
+        "project": {"name": "Demo"},
+        "statistics": {},
+        "websites": [{
+            "website": WEBSITES[0],
+            "pages": [{"page": {"url": url}, "test_result": result} for url, result in PAGES["w1"]],
+        }],
+    }
+    in_memory_path = tmp_path / "in_memory.xlsx"
+    in_memory_path.write_bytes(formatter.format_project_report(data))
+
+    streamed = openpyxl.load_workbook(streamed_path)
+    in_memory = openpyxl.load_workbook(in_memory_path)
+    assert streamed.sheetnames == in_memory.sheetnames
+
+    for name in ("All Issues", "All Issues (Deduplicated)", "Common Components"):
+        assert sheet_values(streamed[name]) == sheet_values(in_memory[name])
+
+    deduped = sheet_values(streamed["All Issues (Deduplicated)"], skip_rows=1)
+    nav_rows = [row for row in deduped if row[2] == "ErrNoAlt" and row[11]]
+    # The nav image issue on both pages collapses into one component row
+    assert len(nav_rows) == 1 and nav_rows[0][13] == 2
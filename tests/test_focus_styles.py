@@ -0,0 +1,101 @@
+"""Tests for focus indicator resolution from captured CSS and forced pseudo-states."""
+import asyncio
+
+from conftest import FakeCDPPage, FakeCDPSession
+
+from auto_a11y.testing.css_focus_capture import CSSFocusCapture, clear_css_capture_for_page, set_css_capture_for_page
+from auto_a11y.testing.touchpoint_tests.test_focus_management import test_focus_management as run_focus_management
+
+CSS = """
+a:focus { outline: 2px solid #005fcc; }
+.btn:focus-visible, .btn:hover { box-shadow: 0 0 0 3px blue; }
+button:focus { outline: none; }
+nav:focus-within a { outline: 1px solid; }
+a:focus .icon { color: red; }
+.card a:focus::after { border-bottom: 2px solid; }
+/* reset */ input:focus { outline: 0 !important; }
+"""
+
+BASELINE = {'outlineWidth': '0px', 'outlineStyle': 'none', 'outlineColor': 'rgb(0, 0, 0)',
+            'backgroundColor': 'rgba(0, 0, 0, 0)', 'borderColor': 'rgb(0, 0, 0)', 'boxShadow': 'none'}
+
+
+def pending(xpath):
+    return {'baseline': BASELINE, 'error': {'err': 'ErrNoFocusIndicator', 'xpath': xpath}}
+
+
+def make_session():
+    """Chromium's answers for a page with two candidate elements"""
+    return FakeCDPSession({
+        'DOM.getDocument': {'root': {'nodeId': 1}},
+        'DOM.querySelectorAll': {'nodeIds': [10, 11]},
+    })
+
+
+class FakePage(FakeCDPPage):
+    def __init__(self, session):
+        super().__init__(session)
+        self.probe_modes = []
+        self.selectors = None
+
+    async def evaluate(self, script, arg=None):
+        name, _, engine_arg = arg
+        if name == 'focus_management':
+            self.selectors = engine_arg
+            return {
+                'errors': [], 'warnings': [], 'elements_tested': 3, 'elements_passed': 1, 'elements_failed': 0,
+                'checks': [{'description': 'Focus indicators', 'total': 3, 'passed': 1, 'failed': 0}],
+                'pendingFocus': [pending('/html/body/a[2]'), pending('/html/body/button[1]')],
+            }
+        assert name == 'focus_style_probe'
+        self.probe_modes.append(engine_arg['mode'])
+        if engine_arg['mode'] == 'cleanup':
+            return []
+        # The first element only shows the browser's focus ring
+        return [dict(BASELINE, outlineStyle='auto', outlineWidth='1px'), dict(BASELINE)]
+
+
+def test_indicator_selectors_from_captured_rules():
+    capture = CSSFocusCapture()
+    capture._parse_focus_rules(CSS, 'site.css')
+
+    assert capture.indicator_selectors() == ['.btn', '.card a', 'a']
+    assert capture.get_focus_styles_for_selector('button') == {'outline': 'none'}
+
+
+def test_ambiguous_elements_are_confirmed_with_forced_pseudo_state():
+    session = make_session()
+    page = FakePage(session)
+    capture = CSSFocusCapture()
+    capture._parse_focus_rules(CSS, 'site.css')
+    capture.cache.is_complete = True
+    set_css_capture_for_page(page, capture)
+
+    try:
+        results = asyncio.run(run_focus_management(page))
+    finally:
+        clear_css_capture_for_page(page)
+
+    assert page.selectors == ['.btn', '.card a', 'a']
+    assert [error['xpath'] for error in results['errors']] == ['/html/body/button[1]']
+    assert (results['elements_passed'], results['elements_failed']) == (2, 1)
+    assert results['checks'][0]['passed'] == 2 and results['checks'][0]['failed'] == 1
+    assert results['focus_resolution'] == {
+        'captured_selectors': 3, 'resolved_from_css': 1, 'confirmed': 2, 'method': 'forced_pseudo_state'
+    }
+    # Forced states are cleared again and the markers removed
+    forced = {params['nodeId']: params['forcedPseudoClasses'] for params in session.methods('CSS.forcePseudoState')}
+    assert forced == {10: [], 11: []} and session.detached
+    assert page.probe_modes == ['read', 'cleanup']
+    assert 'pendingFocus' not in results
+
+
+def test_focuses_elements_without_cdp():
+    page = FakePage(session=None)
+
+    results = asyncio.run(run_focus_management(page))
+
+    assert page.selectors is None
+    assert page.probe_modes == ['focus', 'cleanup']
+    assert results['focus_resolution']['method'] == 'focus'
+    assert len(results['errors']) == 1
@@ -0,0 +1,98 @@
+"""Tests for the streaming test result item export."""
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from conftest import FakeCollection
+
+from auto_a11y.core.database import Database
+from auto_a11y.models import ImpactLevel, Page, TestResult as PageTestResult, Violation
+from auto_a11y.reporting import item_export
+from auto_a11y.reporting.item_export import build_item_filter, stream_items
+
+
+class FakeDatabase:
+    def __init__(self, items_by_website):
+        self.items_by_website = items_by_website
+
+    def iter_latest_result_items(self, website_id, item_query=None, projection=None):
+        yield from self.items_by_website[website_id]
+
+
+def make_item(issue_id, wcag):
+    return {
+        "page_id": "p1",
+        "test_date": datetime(2026, 3, 1, 9, 0),
+        "item_type": "violation",
+        "issue_id": issue_id,
+        "impact": "high",
+        "touchpoint": "images",
+        "wcag_criteria": wcag,
+        "xpath": "/html/body/img",
+        "description": 'Image, "decorative"?',
+    }
+
+
+WEBSITES = [SimpleNamespace(id="w1", name="Example", url="https://example.com")]
+DB = FakeDatabase({"w1": [
+    ("https://example.com/", make_item("ErrNoAlt", ["1.1.1"])),
+    ("https://example.com/about", make_item("ErrLowContrast", ["1.4.3", "1.4.6"])),
+]})
+
+
+def test_ndjson_rows_carry_page_url():
+    lines = "".join(stream_items(DB, WEBSITES, {}, "ndjson")).splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["page_url"] for row in rows] == ["https://example.com/", "https://example.com/about"]
+    assert rows[0]["website"] == "Example" and rows[0]["test_date"] == "2026-03-01T09:00:00"
+
+
+def test_csv_survives_quoting_and_gzip(monkeypatch):
+    # Force several chunks to check the header is written once
+    monkeypatch.setattr(item_export, "CHUNK_SIZE", 10)
+    data = gzip.decompress(b"".join(stream_items(DB, WEBSITES, {}, "csv", gzip=True))).decode("utf-8")
+    rows = list(csv.DictReader(io.StringIO(data)))
+    assert len(rows) == 2
+    assert rows[1]["wcag_criteria"] == "1.4.3; 1.4.6"
+    assert rows[0]["description"] == 'Image, "decorative"?'
+
+
+def test_filter_defaults_and_wcag_prefix():
+    query = build_item_filter(wcag_criteria=["1.4.3"])
+    assert query["item_type"] == {"$in": ["violation", "warning", "info", "discovery"]}
+    pattern = query["wcag_criteria"]["$in"][0]
+    assert pattern.match("1.4.3 Contrast (Minimum) (Level AA)")
+    assert pattern.match("1.4.3")
+    assert not pattern.match("1.4.31")
+
+
+def test_rejects_unknown_item_type_and_format():
+    with pytest.raises(ValueError):
+        build_item_filter(item_types=["violations"])
+    with pytest.raises(ValueError):
+        stream_items(DB, WEBSITES, {}, "xlsx")
+
+
+def test_export_follows_the_retested_pages_latest_result():
+    database = Database.__new__(Database)
+    database.pages = FakeCollection()
+    database.test_results = FakeCollection()
+    database.test_result_items = FakeCollection()
+    page = Page(website_id="w1", url="https://example.com/")
+    page._id = database.pages.insert_one(page.to_dict()).inserted_id
+
+    for day, issue_id in [(1, "ErrNoAlt"), (2, "ErrLowContrast")]:
+        # The runner saves the page it loaded before the test
+        stale_page = database.get_page(page.id)
+        database.create_test_result(PageTestResult(
+            page_id=page.id, test_date=datetime(2026, 3, day),
+            violations=[Violation(id=issue_id, impact=ImpactLevel.HIGH, touchpoint="images", description="")]
+        ))
+        database.update_page(stale_page)
+
+    lines = "".join(stream_items(database, WEBSITES, build_item_filter(), "ndjson")).splitlines()
+    assert [json.loads(line)["issue_id"] for line in lines] == ["ErrLowContrast"]
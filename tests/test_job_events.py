@@ -0,0 +1,55 @@
+"""Tests for the job progress event endpoint."""
+from flask import Flask
+
+import auto_a11y.core.job_manager as job_manager_module
+from auto_a11y.web.routes.testing import testing_bp
+
+
+class FakeJobManager:
+    snapshots = {}
+
+    def __init__(self, database):
+        pass
+
+    def get_job_snapshot(self, job_id):
+        return self.snapshots.get(job_id)
+
+
+def make_client(monkeypatch):
+    monkeypatch.setattr(job_manager_module, 'JobManager', FakeJobManager)
+    app = Flask(__name__)
+    app.db = None
+    app.register_blueprint(testing_bp, url_prefix='/testing')
+    return app.test_client()
+
+
+def test_each_request_answers_once_and_skips_unchanged_snapshots(monkeypatch):
+    client = make_client(monkeypatch)
+    FakeJobManager.snapshots = {'job1': {'job_id': 'job1', 'status': 'running', 'progress': {'current': 3}}}
+
+    first = client.get('/testing/job/job1/events?interval=2').get_data(as_text=True)
+    assert first.startswith('retry: 2000\n') and '"current": 3' in first
+    event_id = next(line[4:] for line in first.splitlines() if line.startswith('id: '))
+
+    unchanged = client.get('/testing/job/job1/events', headers={'Last-Event-ID': event_id})
+    assert 'data:' not in unchanged.get_data(as_text=True)
+
+    FakeJobManager.snapshots['job1']['progress'] = {'current': 4}
+    changed = client.get('/testing/job/job1/events', headers={'Last-Event-ID': event_id})
+    assert '"current": 4' in changed.get_data(as_text=True)
+
+
+def test_unknown_job_is_reported(monkeypatch):
+    client = make_client(monkeypatch)
+    FakeJobManager.snapshots = {}
+    assert 'event: missing' in client.get('/testing/job/nope/events').get_data(as_text=True)
+
+
+def test_interval_is_parsed_leniently_and_clamped(monkeypatch):
+    client = make_client(monkeypatch)
+    FakeJobManager.snapshots = {'job1': {'job_id': 'job1', 'status': 'running'}}
+
+    for interval, retry in [('soon', 1000), ('nan', 1000), ('0', 250), ('3600', 30000)]:
+        response = client.get(f'/testing/job/job1/events?interval={interval}')
+        assert response.status_code == 200
+        assert response.get_data(as_text=True).startswith(f'retry: {retry}\n')
@@ -0,0 +1,110 @@
+"""Tests for rolling sharded testing jobs up into their parent."""
+from types import SimpleNamespace
+
+from conftest import FakeCollection
+
+from auto_a11y.core.job_manager import JobStatus
+from auto_a11y.core.job_sharding import enqueue_sharded_test, refresh_parent
+from auto_a11y.core.template_sampling import SamplingPlan
+
+
+class FakeJobManager:
+    def __init__(self, docs):
+        self.collection = FakeCollection(docs, key='job_id')
+        self.progress = []
+
+    def get_job(self, job_id):
+        return self.collection.docs.get(job_id)
+
+    def create_job(self, job_id, job_type, **fields):
+        self.collection.insert_one(dict(fields, job_id=job_id, job_type=job_type.value))
+        return self.get_job(job_id)
+
+    def update_job_progress(self, job_id, current, total, message, details):
+        self.progress.append((current, total))
+
+    def update_job_status(self, job_id, status, progress=None, error=None, **kwargs):
+        self.collection.docs[job_id]['status'] = status.value
+
+    def is_cancellation_requested(self, job_id):
+        return False
+
+
+def shard(index, status, pages_tested, **fields):
+    return dict({
+        'job_id': f'parent_shard_{index:04d}',
+        'parent_job_id': 'parent',
+        'status': status,
+        'progress': {'details': {'pages_tested': pages_tested}},
+    }, **fields)
+
+
+def make_job_manager(*children):
+    parent = {'job_id': 'parent', 'status': JobStatus.RUNNING.value, 'metadata': {'total_pages': 8}}
+    return FakeJobManager([parent, *children])
+
+
+def test_failed_attempt_still_held_by_its_worker_does_not_finish_the_parent():
+    job_manager = make_job_manager(
+        shard(0, JobStatus.COMPLETED.value, 4),
+        shard(1, JobStatus.FAILED.value, 1, lock_holder='worker-1'),
+    )
+    details = refresh_parent(job_manager, 'parent')
+
+    assert details['shards_completed'] == 1
+    assert job_manager.collection.docs['parent']['status'] == JobStatus.RUNNING.value
+
+    # Retries exhausted: the queue records the failure and releases the lease
+    job_manager.collection.docs['parent_shard_0001']['lock_holder'] = None
+    refresh_parent(job_manager, 'parent')
+    assert job_manager.collection.docs['parent']['status'] == JobStatus.FAILED.value
+
+
+def test_progress_of_finished_testers_is_carried_between_passes():
+    # The second tester's pass restarted the shard's own details from zero
+    job_manager = make_job_manager(
+        shard(0, JobStatus.RUNNING.value, 0, shard_progress={'pages_tested': 4}),
+        shard(1, JobStatus.RUNNING.value, 3),
+    )
+    refresh_parent(job_manager, 'parent')
+    assert job_manager.progress == [(7, 8)]
+
+
+class FakeDatabase:
+    def __init__(self, refs, project_config):
+        self.refs = {ref.id: ref for ref in refs}
+        self.project_config = project_config
+
+    def get_project(self, project_id):
+        return SimpleNamespace(config=self.project_config)
+
+    def get_page_refs(self, page_ids):
+        return [self.refs[page_id] for page_id in page_ids]
+
+
+class FakeWorkQueue:
+    def __init__(self, database):
+        self.job_manager = FakeJobManager([])
+        self.job_manager.db = database
+        self.payloads = []
+
+    def enqueue(self, payload, **kwargs):
+        self.payloads.append(payload)
+
+
+def test_template_sampling_is_planned_once_over_all_shards():
+    refs = [SimpleNamespace(id=f'article-{i}', url=f'https://example.com/article-{i}', template_signature='article')
+            for i in range(6)]
+    work_queue = FakeWorkQueue(FakeDatabase(refs, {'template_sampling': {'enabled': True, 'representatives': 2}}))
+    page_ids = [ref.id for ref in refs]
+
+    enqueue_sharded_test(work_queue, 'parent', 'site', 'project', page_ids, shard_size=3)
+
+    first, second = [SamplingPlan.from_dict(payload['template_sampling']) for payload in work_queue.payloads]
+    assert [page_id for page_id in page_ids[:3] if not first.is_light(page_id)] == ['article-0', 'article-1']
+    # Planned over its own chunk, the second shard would pick two more representatives
+    assert all(second.is_light(page_id) for page_id in page_ids[3:])
+    assert second.result_metadata('article-5')['representatives'] == [
+        'https://example.com/article-0', 'https://example.com/article-1'
+    ]
+    assert second.result_metadata('article-5')['cluster_size'] == 6
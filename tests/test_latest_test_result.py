@@ -0,0 +1,50 @@
+"""Tests for the page's latest test result pointer."""
+from datetime import datetime
+
+from conftest import FakeCollection
+
+from auto_a11y.core.database import Database
+from auto_a11y.models import Page, TestResult as PageTestResult
+
+
+def make_database():
+    database = Database.__new__(Database)
+    database.pages = FakeCollection()
+    database.test_results = FakeCollection()
+    database.test_result_items = FakeCollection()
+    return database
+
+
+def make_page(database):
+    page = Page(website_id='site', url='https://example.com/')
+    page._id = database.pages.insert_one(page.to_dict()).inserted_id
+    return page.id
+
+
+def run_test(database, page_id, test_date):
+    """Save a result the way the test runner does, then save the page it loaded before testing"""
+    page = database.get_page(page_id)
+    result_id = database.create_test_result(PageTestResult(page_id=page_id, test_date=test_date))
+    database.update_page(page)
+    return result_id
+
+
+def test_retest_moves_the_pointer_past_a_stale_page_save():
+    database = make_database()
+    page_id = make_page(database)
+
+    run_test(database, page_id, datetime(2026, 3, 1))
+    second = run_test(database, page_id, datetime(2026, 3, 2))
+
+    assert database.get_latest_test_result(page_id).id == second
+    assert database.get_page(page_id).latest_test_result_id == second
+
+
+def test_older_result_saved_late_does_not_move_the_pointer():
+    database = make_database()
+    page_id = make_page(database)
+
+    newest = run_test(database, page_id, datetime(2026, 3, 2))
+    run_test(database, page_id, datetime(2026, 3, 1))
+
+    assert database.get_latest_test_result(page_id).id == newest
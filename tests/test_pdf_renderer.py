@@ -0,0 +1,60 @@
+"""Tests for sectioned PDF rendering."""
+import io
+import sys
+
+import pytest
+
+from auto_a11y.reporting.pdf_renderer import PDFRenderError, PDFRenderer, merge_pdfs, split_report_html
+
+
+def make_report(page_count):
+    pages = "".join(
+        f'<div class="page-detail"><h4>Page {i}</h4><p>{"x" * 200}</p></div>' for i in range(page_count)
+    )
+    return (
+        '<!DOCTYPE html><html lang="fr"><head><style>.page-detail { color: red; }</style>'
+        '<script>var chart = 1;</script></head><body><div class="report-container">'
+        '<header class="report-header"><h1>Report</h1></header>'
+        f'<section class="page-analysis"><h2>Pages</h2>{pages}</section>'
+        '</div><script>init();</script></body></html>'
+    )
+
+
+def test_small_report_is_one_section():
+    sections = split_report_html(make_report(2))
+    assert len(sections) == 1
+    assert "<script" not in sections[0]
+
+
+def test_large_report_splits_along_pages():
+    sections = split_report_html(make_report(40), target_chars=1500)
+    assert len(sections) > 1
+    for section in sections:
+        # Every section keeps the styles and the wrappers around its content
+        assert '<html lang="fr">' in section and ".page-detail { color: red; }" in section
+        assert '<div class="report-container">' in section
+        assert "<script" not in section
+    combined = "".join(sections)
+    assert all(f"<h4>Page {i}</h4>" in combined for i in range(40))
+    assert combined.count("<h1>Report</h1>") == 1
+
+
+def test_merge_concatenates_pages():
+    pypdf = pytest.importorskip("pypdf")
+
+    def blank(pages):
+        writer = pypdf.PdfWriter()
+        for _ in range(pages):
+            writer.add_blank_page(width=200, height=200)
+        output = io.BytesIO()
+        writer.write(output)
+        return output.getvalue()
+
+    merged = merge_pdfs([blank(1), blank(2)])
+    assert len(pypdf.PdfReader(io.BytesIO(merged)).pages) == 3
+
+
+def test_missing_weasyprint_is_an_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "weasyprint", None)
+    with pytest.raises(PDFRenderError):
+        PDFRenderer().render(make_report(1))
@@ -0,0 +1,84 @@
+"""Tests for coalesced job progress writes and cached cancellation checks."""
+import time
+
+from conftest import FakeCollection
+
+from auto_a11y.core.progress_aggregator import ProgressAggregator
+
+
+class TestProgressCoalescing:
+    def test_first_update_written_immediately(self):
+        coll = FakeCollection()
+        agg = ProgressAggregator(coll, flush_interval_ms=10000)
+        agg.submit("job1", {"current": 1})
+        assert len(coll.updates) == 1
+        assert coll.updates[0][1]["$set"]["progress"] == {"current": 1}
+
+    def test_rapid_updates_are_coalesced(self):
+        coll = FakeCollection()
+        agg = ProgressAggregator(coll, flush_interval_ms=10000)
+        for i in range(1, 50):
+            agg.submit("job1", {"current": i})
+        assert len(coll.updates) == 1
+        agg.flush("job1")
+        assert len(coll.updates) == 2
+        assert coll.updates[-1][1]["$set"]["progress"] == {"current": 49}
+
+    def test_pending_update_flushed_by_timer(self):
+        coll = FakeCollection()
+        agg = ProgressAggregator(coll, flush_interval_ms=50)
+        agg.submit("job1", {"current": 1})
+        agg.submit("job1", {"current": 2})
+        time.sleep(0.2)
+        assert coll.updates[-1][1]["$set"]["progress"] == {"current": 2}
+
+    def test_writes_only_target_active_jobs(self):
+        coll = FakeCollection()
+        agg = ProgressAggregator(coll, flush_interval_ms=0)
+        agg.submit("job1", {"current": 1})
+        query = coll.updates[0][0]
+        assert "completed" not in query["status"]["$in"]
+
+    def test_discard_drops_pending(self):
+        coll = FakeCollection()
+        agg = ProgressAggregator(coll, flush_interval_ms=10000)
+        agg.submit("job1", {"current": 1})
+        agg.submit("job1", {"current": 2})
+        agg.discard("job1")
+        agg.flush("job1")
+        assert len(coll.updates) == 1
+
+    def test_snapshot_tracks_status_and_progress(self):
+        agg = ProgressAggregator(FakeCollection(), flush_interval_ms=10000)
+        agg.record_status("job1", "running", {"current": 0})
+        agg.submit("job1", {"current": 3})
+        snapshot = agg.get_snapshot("job1")
+        assert snapshot["status"] == "running"
+        assert snapshot["progress"] == {"current": 3}
+        agg.record_status("job1", "completed", {"current": 3})
+        assert agg.get_snapshot("job1") is None
+
+
+class TestCancellationCache:
+    def test_loader_called_once_within_ttl(self):
+        calls = []
+        agg = ProgressAggregator(FakeCollection(), cancellation_ttl_ms=10000)
+
+        def loader(job_id):
+            calls.append(job_id)
+            return False
+
+        for _ in range(10):
+            assert agg.is_cancellation_requested("job1", loader) is False
+        assert calls == ["job1"]
+
+    def test_positive_result_is_sticky(self):
+        agg = ProgressAggregator(FakeCollection(), cancellation_ttl_ms=0)
+        assert agg.is_cancellation_requested("job1", lambda _: True) is True
+        assert agg.is_cancellation_requested("job1", lambda _: False) is True
+
+    def test_local_request_visible_without_query(self):
+        agg = ProgressAggregator(FakeCollection(), cancellation_ttl_ms=10000)
+        agg.is_cancellation_requested("job1", lambda _: False)
+        agg.mark_cancellation_requested("job1")
+        assert agg.is_cancellation_requested("job1", lambda _: False) is True
@@ -0,0 +1,57 @@
+"""Tests for running claimed jobs in the queue worker."""
+import asyncio
+
+from auto_a11y.core import queue_worker
+from auto_a11y.core.queue_worker import QueueWorker
+
+
+class FakeQueue:
+    def __init__(self):
+        self.outcomes = []
+
+    def heartbeat(self, job_id, worker_id, lease_seconds):
+        # The reaper has handed the job to another worker
+        return False
+
+    def complete(self, job_id, worker_id):
+        self.outcomes.append('complete')
+
+    def fail(self, job_id, worker_id, error):
+        self.outcomes.append('fail')
+
+    def release(self, job_id, worker_id):
+        self.outcomes.append('release')
+
+
+class FakeJobManager:
+    def flush_job_progress(self, job_id=None):
+        pass
+
+
+def make_worker():
+    worker = QueueWorker.__new__(QueueWorker)
+    worker.worker_id = 'worker-1'
+    worker.lease_seconds = 1
+    worker.queue = FakeQueue()
+    worker.job_manager = FakeJobManager()
+    return worker
+
+
+def test_losing_the_lease_stops_the_handler(monkeypatch):
+    stopped = []
+
+    async def handler(worker, job):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            stopped.append(job['job_id'])
+            raise
+
+    monkeypatch.setitem(queue_worker.TASK_HANDLERS, 'slow', handler)
+    worker = make_worker()
+
+    asyncio.run(asyncio.wait_for(worker._execute({'job_id': 'job1', 'queue': {'task': 'slow'}}), 5))
+
+    assert stopped == ['job1']
+    # The new holder records the outcome
+    assert worker.queue.outcomes == []
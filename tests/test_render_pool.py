@@ -0,0 +1,76 @@
+"""Tests for incremental static report rendering."""
+import zipfile
+
+import jinja2
+
+from auto_a11y.reporting.render_pool import StreamingReportWriter
+
+
+def make_env():
+    return jinja2.Environment(loader=jinja2.DictLoader({
+        "page.html": "{{ title }} ({{ language }}) rendered {{ generation_date }}",
+    }))
+
+
+def export(tmp_path, name, pages, generation_date):
+    writer = StreamingReportWriter(
+        tmp_path / name, make_env(), "en",
+        shared_context={"language": "en"},
+        volatile_context={"generation_date": generation_date},
+        cache_dir=tmp_path / "cache",
+    )
+    with writer:
+        for arcname, title in pages.items():
+            writer.render(arcname, "page.html", {"title": title})
+    return writer, zipfile.ZipFile(tmp_path / name)
+
+
+def test_unchanged_files_are_reused(tmp_path):
+    pages = {"pages/a.html": "A", "pages/b.html": "B"}
+    first, _ = export(tmp_path, "first.zip", pages, "monday")
+    assert first.stats == {"rendered": 2, "reused": 0}
+
+    second, archive = export(tmp_path, "second.zip", {**pages, "pages/b.html": "B2"}, "tuesday")
+    assert second.stats == {"rendered": 1, "reused": 1}
+    # The reused file is the previous render, the changed one is fresh
+    assert archive.read("pages/a.html") == b"A (en) rendered monday"
+    assert archive.read("pages/b.html") == b"B2 (en) rendered tuesday"
+
+
+def test_removed_files_leave_the_cache(tmp_path):
+    export(tmp_path, "first.zip", {"pages/a.html": "A", "pages/b.html": "B"}, "monday")
+    export(tmp_path, "second.zip", {"pages/a.html": "A"}, "tuesday")
+    assert not (tmp_path / "cache" / "files" / "pages" / "b.html").exists()
+
+    third, _ = export(tmp_path, "third.zip", {"pages/a.html": "A", "pages/b.html": "B"}, "wednesday")
+    assert third.stats == {"rendered": 1, "reused": 1}
+
+
+def test_failed_export_discards_archive_and_cache(tmp_path):
+    writer = StreamingReportWriter(tmp_path / "broken.zip", make_env(), "en", cache_dir=tmp_path / "cache")
+    try:
+        with writer:
+            writer.render("pages/a.html", "page.html", {"title": "A"})
+            raise RuntimeError("collection failed")
+    except RuntimeError:
+        pass
+    assert not (tmp_path / "broken.zip").exists()
+
+    again, _ = export(tmp_path, "again.zip", {"pages/a.html": "A"}, "monday")
+    assert again.stats == {"rendered": 1, "reused": 0}
+
+
+def test_worker_renders_in_the_report_language():
+    from auto_a11y.reporting import render_pool
+
+    # Same path as a spawned render worker: no Flask application is active
+    render_pool._init_worker("fr", {})
+    render_pool._worker_env.loader = jinja2.ChoiceLoader([
+        jinja2.DictLoader({"stealth.html": "{{ _('Enable Stealth Mode (for Cloudflare-protected sites)') }}"}),
+        render_pool._worker_env.loader,
+    ])
+    html = render_pool._render_in_worker("stealth.html", {}).decode("utf-8")
+    assert html == "Activer le mode furtif (pour les sites protégés par Cloudflare)"
+
+    english = render_pool.render_template(render_pool._worker_env, "en", "stealth.html", {})
+    assert english == "Enable Stealth Mode (for Cloudflare-protected sites)"
@@ -0,0 +1,121 @@
+"""Tests for report job specifications, artifact cache keys and job rendering."""
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from conftest import FakeCollection
+from flask import Flask
+from flask_babel import Babel, gettext
+
+from auto_a11y.core.job_manager import JobType
+from auto_a11y.reporting import report_jobs
+from auto_a11y.web.routes import reports as report_routes
+from auto_a11y.reporting.report_jobs import build_report_spec, report_cache_key
+
+
+def make_version(**overrides):
+    version = {
+        "pages": 10,
+        "tested_pages": 8,
+        "last_tested": datetime(2026, 1, 5, 12, 0),
+        "last_discovered": datetime(2026, 1, 1, 9, 30),
+    }
+    version.update(overrides)
+    return version
+
+
+class TestReportCacheKey:
+    def test_identical_requests_share_a_key(self):
+        first = build_report_spec("static_html", "website", "w1", format="zip", options={"wcag_level": "AA", "include_screenshots": True})
+        second = build_report_spec("static_html", "website", "w1", format="zip", options={"include_screenshots": True, "wcag_level": "AA"})
+        assert report_cache_key(first, make_version()) == report_cache_key(second, make_version())
+
+    def test_new_test_results_change_the_key(self):
+        spec = build_report_spec("accessibility", "project", "p1", format="xlsx")
+        newer = make_version(last_tested=datetime(2026, 1, 6, 8, 0))
+        assert report_cache_key(spec, make_version()) != report_cache_key(spec, newer)
+
+    def test_language_and_options_change_the_key(self):
+        english = build_report_spec("accessibility", "website", "w1", format="pdf", language="en")
+        french = build_report_spec("accessibility", "website", "w1", format="pdf", language="fr")
+        level_aaa = build_report_spec("static_html", "website", "w1", format="zip", options={"wcag_level": "AAA"})
+        level_aa = build_report_spec("static_html", "website", "w1", format="zip", options={"wcag_level": "AA"})
+        assert report_cache_key(english, make_version()) != report_cache_key(french, make_version())
+        assert report_cache_key(level_aa, make_version()) != report_cache_key(level_aaa, make_version())
+
+
+class TestBuildReportSpec:
+    def test_all_scope_drops_scope_id(self):
+        assert build_report_spec("accessibility", "all", "ignored", format="json")["scope_id"] is None
+
+    def test_rejects_unsupported_scope(self):
+        with pytest.raises(ValueError):
+            build_report_spec("discovery", "all", format="html")
+
+
+class FakeJobManager:
+    def __init__(self, db):
+        self.statuses = []
+
+    def update_job_status(self, job_id, status, **kwargs):
+        self.statuses.append(status)
+
+    def update_job_progress(self, job_id, **kwargs):
+        pass
+
+
+def test_report_jobs_render_in_the_requested_language(tmp_path, monkeypatch):
+    def fake_generate(db, config, spec):
+        path = tmp_path / f"report_{spec['language']}.txt"
+        path.write_text(gettext("Enable Stealth Mode (for Cloudflare-protected sites)"), encoding="utf-8")
+        return path
+
+    monkeypatch.setattr(report_jobs, "JobManager", FakeJobManager)
+    monkeypatch.setattr(report_jobs, "generate_report_file", fake_generate)
+    monkeypatch.setattr(report_jobs, "store_artifact", lambda *args, **kwargs: None)
+
+    # Task runner threads have no Flask application or request context
+    spec = build_report_spec("accessibility", "project", "p1", format="html", language="fr")
+    thread = threading.Thread(target=report_jobs.run_report_job, args=(None, {}, "job", spec, "key", make_version()))
+    thread.start()
+    thread.join()
+
+    assert (tmp_path / "report_fr.txt").read_text(encoding="utf-8") == \
+        "Activer le mode furtif (pour les sites protégés par Cloudflare)"
+
+
+class FakeRouteJobManager:
+    jobs = []
+
+    def __init__(self, database):
+        self.collection = FakeCollection(self.jobs, key="job_id")
+
+    def get_job_snapshot(self, job_id):
+        job = self.collection.find_one({"job_id": job_id})
+        return {"job_id": job_id, "status": job["status"], "progress": {}, "error": None} if job else None
+
+    def get_job(self, job_id):
+        return self.collection.find_one({"job_id": job_id})
+
+
+def test_report_status_only_answers_visible_report_jobs(monkeypatch):
+    FakeRouteJobManager.jobs = [
+        {"job_id": "report_a", "job_type": JobType.REPORT_GENERATION.value, "status": "running", "project_id": "mine"},
+        {"job_id": "report_b", "job_type": JobType.REPORT_GENERATION.value, "status": "running", "project_id": "theirs"},
+        {"job_id": "report_all", "job_type": JobType.REPORT_GENERATION.value, "status": "running"},
+        {"job_id": "testing_1", "job_type": JobType.TESTING.value, "status": "running", "project_id": "mine"},
+    ]
+    monkeypatch.setattr(report_routes, "JobManager", FakeRouteJobManager)
+    monkeypatch.setattr(report_routes, "current_user", SimpleNamespace(is_superadmin=False))
+    monkeypatch.setattr(report_routes, "get_effective_role",
+                        lambda user, project_id=None, website_id=None: "client" if project_id == "mine" else None)
+    app = Flask(__name__)
+    app.db = None
+    Babel(app)
+    app.register_blueprint(report_routes.reports_bp, url_prefix="/reports")
+    client = app.test_client()
+
+    assert client.get("/reports/report/report_a/status").get_json()["status"] == "running"
+    for job_id in ("report_b", "report_all", "testing_1", "unknown"):
+        assert client.get(f"/reports/report/{job_id}/status").status_code == 404
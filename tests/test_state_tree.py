@@ -0,0 +1,135 @@
+"""Tests for walking test state matrices as a prefix tree of scripts."""
+import asyncio
+from types import SimpleNamespace
+
+from auto_a11y.models import ScriptStateDefinition, TestResult as PageTestResult, TestStateMatrix as StateMatrix
+from auto_a11y.testing.multi_state_test_runner import MultiStateTestRunner, build_state_tree
+
+
+def make_matrix(combinations):
+    return StateMatrix(
+        page_id='page',
+        website_id='site',
+        # Listed out of order: the tree follows execution_order
+        scripts=[
+            ScriptStateDefinition('dialog', 'Open dialog', execution_order=1),
+            ScriptStateDefinition('cookies', 'Accept cookies', execution_order=0),
+        ],
+        combinations=combinations,
+    )
+
+
+def script(script_id, condition_selector=None):
+    return SimpleNamespace(id=script_id, name=script_id, condition_selector=condition_selector)
+
+
+SCRIPTS = {'cookies': script('cookies'), 'dialog': script('dialog')}
+
+
+def test_combinations_share_their_script_prefixes():
+    matrix = make_matrix([
+        {'cookies': 'before', 'dialog': 'before'},
+        {'cookies': 'after', 'dialog': 'none'},
+        {'cookies': 'after', 'dialog': 'after'},
+        {'cookies': 'before', 'dialog': 'after'},
+    ])
+    tree = build_state_tree(matrix, matrix.get_enabled_combinations(), SCRIPTS)
+
+    assert [index for index, _ in tree.combinations] == [0]
+    assert list(tree.children) == ['cookies', 'dialog']
+    cookies = tree.children['cookies']
+    assert [index for index, _ in cookies.combinations] == [1]
+    assert [index for index, _ in cookies.children['dialog'].combinations] == [2]
+    assert [index for index, _ in tree.children['dialog'].combinations] == [3]
+
+    assert tree.count_combinations() == 4
+    # Replaying every combination from scratch would take 4 runs
+    assert tree.count_script_runs() == 3
+
+
+def test_scripts_missing_from_the_page_are_left_out():
+    matrix = make_matrix([{'cookies': 'after', 'dialog': 'after'}])
+    tree = build_state_tree(matrix, matrix.get_enabled_combinations(), {'dialog': SCRIPTS['dialog']})
+
+    assert list(tree.children) == ['dialog']
+    assert tree.count_script_runs() == 1
+
+
+class FakeBrowserManager:
+    async def create_context(self, storage_state=None):
+        return SimpleNamespace(new_page=self.new_page)
+
+    async def new_page(self):
+        async def noop(*args, **kwargs):
+            pass
+        return SimpleNamespace(goto=noop, wait_for_timeout=noop)
+
+
+def test_restored_branch_replays_only_effects_missing_from_storage():
+    banner_present = {'#banner': True, '#menu': False}
+
+    async def check_condition(page, selector):
+        return banner_present[selector]
+
+    runner = MultiStateTestRunner(SimpleNamespace(_check_condition=check_condition))
+    replayed = []
+
+    async def run_matrix_script(page, script, environment_vars):
+        replayed.append(script.id)
+        return True
+
+    runner._run_matrix_script = run_matrix_script
+    scripts = {
+        'login': script('login'),
+        'open_menu': script('open_menu'),
+        'dismiss_banner': script('dismiss_banner', '#banner'),
+        'close_menu': script('close_menu', '#menu'),
+    }
+    path = [
+        ('login', True, True),
+        ('open_menu', True, False),
+        ('dismiss_banner', True, True),
+        ('close_menu', True, False),
+    ]
+
+    asyncio.run(runner._restore_checkpoint(
+        None, {'url': 'https://example.com', 'storage_state': {}}, path, scripts, None,
+        'https://example.com', FakeBrowserManager()
+    ))
+    assert replayed == ['open_menu', 'dismiss_banner']
+
+
+def test_states_of_a_branch_that_cannot_be_restored_are_reported():
+    matrix = make_matrix([
+        {'cookies': 'before', 'dialog': 'before'},
+        {'cookies': 'after', 'dialog': 'none'},
+        {'cookies': 'after', 'dialog': 'after'},
+        {'cookies': 'before', 'dialog': 'after'},
+    ])
+    runner = MultiStateTestRunner(SimpleNamespace())
+
+    async def checkpoint_state(page):
+        return {'url': 'https://example.com', 'storage_state': {}}
+
+    async def restore_checkpoint(*args):
+        raise RuntimeError('navigation timed out')
+
+    async def run_matrix_script(page, script, environment_vars):
+        return True
+
+    async def test_function(page, page_id):
+        return PageTestResult(page_id=page_id)
+
+    runner._checkpoint_state = checkpoint_state
+    runner._restore_checkpoint = restore_checkpoint
+    runner._run_matrix_script = run_matrix_script
+    page = SimpleNamespace(url='https://example.com')
+
+    results = asyncio.run(runner.test_page_with_matrix(
+        page, 'page', matrix, SCRIPTS, test_function, 'session', {}
+    ))
+
+    assert [result.state_sequence for result in results] == [0, 1, 2, 3]
+    assert [result.error for result in results[:3]] == [None, None, None]
+    assert 'navigation timed out' in results[3].error
+    assert results[3].metadata['state_combination']['script_states'] == {'cookies': 'before', 'dialog': 'after'}
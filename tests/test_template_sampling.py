@@ -0,0 +1,136 @@
+"""Tests for template-aware sampling of large websites."""
+from types import SimpleNamespace
+
+import pytest
+
+from auto_a11y.config import test_config as configuration
+from auto_a11y.core.template_sampling import (
+    DEFAULT_LIGHT_TOUCHPOINTS, TemplateExtrapolation, get_sampling_settings, parse_light_touchpoints,
+    plan_template_sampling, restrict_touchpoints
+)
+
+
+def ref(page_id, signature):
+    return SimpleNamespace(id=page_id, url=f'https://example.com/{page_id}', template_signature=signature)
+
+
+def test_each_cluster_keeps_its_first_pages_as_representatives():
+    refs = [ref(f'article-{i}', 'article') for i in range(5)]
+    refs += [ref('home', 'home'), ref('contact', 'form'), ref('contact-2', 'form'), ref('legacy', None)]
+
+    plan = plan_template_sampling(refs, representatives=2, light_touchpoints=['headings'])
+
+    # Clusters no larger than the representative count are tested in full
+    assert list(plan.clusters) == ['article']
+    assert plan.light_page_count == 3
+    assert [page.id for page in refs if plan.is_light(page.id)] == ['article-2', 'article-3', 'article-4']
+    assert plan.result_metadata('contact') is None and plan.result_metadata('legacy') is None
+
+    assert plan.result_metadata('article-0')['role'] == 'representative'
+    assert plan.result_metadata('article-4') == {
+        'role': 'sampled',
+        'template_signature': 'article',
+        'cluster_size': 5,
+        'representatives': ['https://example.com/article-0', 'https://example.com/article-1'],
+        'light_touchpoints': ['headings'],
+    }
+
+
+def test_sampling_is_off_unless_enabled_for_the_project():
+    assert get_sampling_settings({}) is None
+    assert get_sampling_settings({'template_sampling': {'enabled': False}}) is None
+    settings = get_sampling_settings({'template_sampling': {'enabled': True, 'representatives': '3'}})
+    assert settings['representatives'] == 3 and 'headings' in settings['light_touchpoints']
+
+
+def test_light_subset_from_the_project_form_keeps_known_touchpoints():
+    assert parse_light_touchpoints(['headings', 'colors', 'headings', 'not-a-touchpoint']) == ['headings', 'colors']
+    assert parse_light_touchpoints([]) == DEFAULT_LIGHT_TOUCHPOINTS
+
+
+def test_touchpoint_subset_does_not_change_the_project_settings():
+    project_touchpoints = {'colors_contrast': {'enabled': True, 'tests': {}}}
+    test_config = configuration.TestConfiguration()
+    test_config.config['touchpoints'] = project_touchpoints
+
+    restrict_touchpoints(test_config, ['headings', 'images'])
+
+    assert test_config.is_touchpoint_enabled('headings')
+    assert not test_config.is_touchpoint_enabled('colors_contrast')
+    assert not test_config.is_touchpoint_enabled('focus_management')
+    assert project_touchpoints['colors_contrast']['enabled']
+
+
+def make_result(role, violations, ai_findings=()):
+    return SimpleNamespace(
+        violations=violations, warnings=[], info=[], discovery=[], ai_findings=list(ai_findings), page_state=None,
+        violation_count=len(violations), warning_count=0,
+        metadata={'template_sampling': {
+            'role': role, 'template_signature': 'article', 'cluster_size': 3,
+            'representatives': ['https://example.com/a', 'https://example.com/b'],
+            'light_touchpoints': ['images'],
+        }},
+    )
+
+
+class FakeResultsDB:
+    def __init__(self, results):
+        self.results = results
+        self.lookups = []
+
+    def get_page_by_url(self, website_id, url):
+        self.lookups.append(url)
+        return SimpleNamespace(id=url) if url in self.results else None
+
+    def get_latest_test_result(self, page_id):
+        return self.results[page_id]
+
+
+def representative_results():
+    contrast = {'id': 'ErrTextContrast', 'impact': 'high', 'touchpoint': 'colors', 'xpath': '/html/body/p'}
+    return {
+        'https://example.com/a': make_result('representative', [
+            {'id': 'ErrNoAlt', 'impact': 'high', 'touchpoint': 'images', 'xpath': '/html/body/img'}, contrast,
+        ], ai_findings=[{'type': 'reading_order', 'severity': 'moderate', 'description': 'Visual order differs'}]),
+        'https://example.com/b': make_result('representative', [dict(contrast)]),
+    }
+
+
+def test_sampled_pages_get_the_representatives_findings_labelled_as_extrapolated():
+    db = FakeResultsDB(representative_results())
+    extrapolation = TemplateExtrapolation(db)
+
+    details = extrapolation.findings_for('w1', make_result('sampled', []))
+
+    # Light touchpoints were tested on the page itself; the representatives' shared finding is listed once
+    assert [(v['id'], v['extrapolated_from']) for v in details['violations']] == [('ErrTextContrast', 'https://example.com/a')]
+    assert [f['type'] for f in details['ai_findings']] == ['reading_order']
+    assert details['role'] == 'sampled' and details['template_signature'] == 'article'
+
+    # Representative results are read once per report
+    extrapolation.findings_for('w1', make_result('sampled', []))
+    assert db.lookups == ['https://example.com/a', 'https://example.com/b']
+
+    representative = extrapolation.findings_for('w1', db.results['https://example.com/a'])
+    assert representative['role'] == 'representative' and representative['violations'] == []
+    assert extrapolation.findings_for('w1', SimpleNamespace(metadata={})) is None
+
+
+def test_page_reports_label_extrapolated_findings():
+    from auto_a11y.reporting.formatters import CSVFormatter, HTMLFormatter
+
+    details = TemplateExtrapolation(FakeResultsDB(representative_results())).findings_for('w1', make_result('sampled', []))
+    data = {
+        'page': {'url': 'https://example.com/c'}, 'website': {'name': 'Example'}, 'project': {'name': 'Demo'},
+        'test_result': {}, 'generated_at': 'now', 'violations': [], 'warnings': [], 'statistics': {},
+        'template_sampling': details,
+    }
+
+    rows = CSVFormatter({}).format_page_report(data).splitlines()
+    assert rows[0].endswith(',Basis')
+    assert rows[1].startswith('Violation,ErrTextContrast,') and rows[1].endswith(',Extrapolated from https://example.com/a')
+    assert rows[2].startswith('AI Finding,reading_order,')
+
+    html = HTMLFormatter({})._format_extrapolated_section(details)
+    assert 'Extrapolated Findings' in html and 'ErrTextContrast' in html and 'ErrNoAlt' not in html
+    assert 'Extrapolated from:</strong> <a href="https://example.com/a">' in html
@@ -0,0 +1,64 @@
+"""Tests for breakpoint pruning in the text contrast touchpoint."""
+import asyncio
+
+from auto_a11y.testing import touchpoint_bundle
+from auto_a11y.testing.touchpoint_tests.test_text_contrast import test_text_contrast as run_text_contrast
+
+
+class FakeContext:
+    browser = None
+
+
+class FakePage:
+    """Runs touchpoint engines through the bundle and records viewport changes"""
+    context = FakeContext()
+
+    def __init__(self, breakpoints, classes):
+        self.breakpoints = breakpoints
+        self.classes = classes
+        self.viewports = []
+
+    async def set_viewport_size(self, size):
+        self.viewports.append(size['width'])
+
+    async def evaluate(self, script, arg=None):
+        assert script == touchpoint_bundle._RUN_SCRIPT
+        name, _, engine_arg = arg
+        if name == 'media_query_breakpoints':
+            return self.breakpoints
+        if name == 'contrast_breakpoint_classes':
+            assert engine_arg == self.breakpoints
+            return {'classes': self.classes, 'relevantMediaQueries': 1}
+        return [{
+            'text': 'Hello', 'xpath': '/html/body/p[1]', 'html': '<p>Hello</p>', 'tag': 'p',
+            'textColor': 'rgb(150, 150, 150)', 'backgroundLayers': ['rgb(255, 255, 255)'],
+            'fontSize': 16, 'fontWeight': 400, 'wcagLevel': 'AA', 'hasGradient': False, 'hasImage': False,
+            'pseudoclassStyles': {':hover': {'color': 'rgb(0, 0, 0)', 'backgroundColor': None}},
+        }]
+
+
+def test_only_one_width_per_breakpoint_class_is_tested():
+    page = FakePage(
+        [640, 768, 1024, 1280],
+        [{'width': 640, 'widths': [640]}, {'width': 768, 'widths': [768, 1024, 1280]}]
+    )
+
+    results = asyncio.run(run_text_contrast(page))
+
+    assert page.viewports == [640, 768]
+    assert results['breakpoints_tested'] == [640, 768]
+    assert results['breakpoints_pruned'] == [1024, 1280]
+    assert results['breakpoint_mode'] == 'sequential'
+    assert results['breakpoint_seconds_saved'] >= 0
+    # The failing paragraph is reported once
+    assert [error['err'] for error in results['errors']] == ['ErrTextContrastAA']
+
+
+def test_single_breakpoint_skips_grouping():
+    page = FakePage([1024], [])
+
+    results = asyncio.run(run_text_contrast(page))
+
+    assert page.viewports == [1024]
+    assert results['breakpoints_pruned'] == []
+    assert results['breakpoint_seconds_saved'] == 0
@@ -0,0 +1,87 @@
+"""Tests for the touchpoint script bundle."""
+import ast
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from auto_a11y.core.browser_manager import BrowserManager
+from auto_a11y.testing import touchpoint_bundle
+from auto_a11y.testing.touchpoint_bundle import build_bundle, load_touchpoint_scripts, run_touchpoint_script
+
+TOUCHPOINT_DIR = Path(touchpoint_bundle.__file__).parent / 'touchpoint_tests'
+
+
+class FakePage:
+    def __init__(self, bundle_installed):
+        self.bundle_installed = bundle_installed
+        self.calls = []
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append((script, arg))
+        if script == touchpoint_bundle._RUN_SCRIPT:
+            return {'ran': arg[0]} if self.bundle_installed else {'__autoA11yMissing': True}
+        return {'evaluated': arg}
+
+
+def test_every_engine_used_by_touchpoints_is_bundled():
+    names = set()
+    for path in TOUCHPOINT_DIR.glob('test_*.py'):
+        source = path.read_text()
+        if 'run_touchpoint_script' not in source:
+            continue
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'run_touchpoint_script':
+                names.add(node.args[1].value)
+
+    scripts = load_touchpoint_scripts()
+    assert names and names <= set(scripts)
+    version, bundle = build_bundle()
+    assert all(f'"{name}": (' in bundle for name in names)
+    assert version in bundle
+
+
+def test_runs_bundled_engine_by_name():
+    page = FakePage(bundle_installed=True)
+    assert asyncio.run(run_touchpoint_script(page, 'text_contrast', 768)) == {'ran': 'text_contrast'}
+    [(script, arg)] = page.calls
+    assert arg == ['text_contrast', build_bundle()[0], 768]
+    assert len(script) < 500
+
+
+def test_falls_back_to_engine_source_without_bundle():
+    page = FakePage(bundle_installed=False)
+    assert asyncio.run(run_touchpoint_script(page, 'links', ['a:focus'])) == {'evaluated': ['a:focus']}
+    assert page.calls[-1][0] == load_touchpoint_scripts()['links']
+
+    with pytest.raises(ValueError):
+        asyncio.run(run_touchpoint_script(page, 'no_such_engine'))
+
+
+class FakeContext:
+    def __init__(self):
+        self.init_scripts = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+
+class FakeBrowser:
+    async def new_context(self, **options):
+        return FakeContext()
+
+
+def test_bundle_is_only_installed_on_testing_contexts():
+    crawler = BrowserManager({})
+    crawler._browser = FakeBrowser()
+    assert asyncio.run(crawler.create_context()).init_scripts == []
+
+    tester = BrowserManager({}, install_touchpoints=True)
+    tester._browser = FakeBrowser()
+    assert asyncio.run(tester.create_context()).init_scripts == [build_bundle()[1]]